@@ -7,7 +7,6 @@ from __future__ import annotations
 import logging
 import os
 import subprocess
-import sys
 import threading
 import time
 import uuid
@@ -16,6 +15,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from app.api import startup_profile as _startup
+
 # Load .env first so OPENAI_API_KEY, Slack webhooks (Phase 7.2), etc. are available (for uvicorn and run_api)
 def _load_env() -> None:
     try:
@@ -31,21 +32,28 @@ def _load_env() -> None:
     load_dotenv()
 
 
-_load_env()
-
-from fastapi import FastAPI, Header, HTTPException, Query, Request
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, Response
-
-from app.api.market_status import read_market_status
-from app.api.views_loader import (
-    build_daily_overview_from_artifact,
-    get_alerts_for_api,
-    get_decision_history_for_api,
-    get_positions_for_api,
-    load_decision_artifact,
-)
-from app.market.market_hours import get_eval_interval_seconds, get_market_phase, is_market_open
+with _startup.timed_import("dotenv"):
+    _load_env()
+
+# Phase 10: keep module-level imports light (routes only). Evaluator, snapshot, signals,
+# pandas etc. are imported inside handlers on first use or pre-warmed after readiness.
+with _startup.timed_import("fastapi"):
+    from fastapi import FastAPI, Header, HTTPException, Query, Request
+    from fastapi.middleware.cors import CORSMiddleware
+    from fastapi.responses import JSONResponse, Response
+
+with _startup.timed_import("app.api.market_status"):
+    from app.api.market_status import read_market_status
+with _startup.timed_import("app.api.views_loader"):
+    from app.api.views_loader import (
+        build_daily_overview_from_artifact,
+        get_alerts_for_api,
+        get_decision_history_for_api,
+        get_positions_for_api,
+        load_decision_artifact,
+    )
+with _startup.timed_import("app.market.market_hours"):
+    from app.market.market_hours import get_eval_interval_seconds, get_market_phase, is_market_open
 
 logger = logging.getLogger(__name__)
 
@@ -111,6 +119,10 @@ _eod_chain_stop_event: Optional[threading.Event] = None
 _eod_chain_thread: Optional[threading.Thread] = None
 _last_eod_chain_run_date: Optional[str] = None  # YYYY-MM-DD to avoid double-run same day
 
+# Lifecycle trigger poller: quotes for armed positions every TRIGGER_POLL_SECONDS while OPEN
+_trigger_poll_stop_event: Optional[threading.Event] = None
+_trigger_poll_thread: Optional[threading.Thread] = None
+
 
 def _get_next_nightly_time() -> datetime:
     """Get the next scheduled nightly evaluation time."""
@@ -334,6 +346,53 @@ def stop_eod_chain_scheduler() -> None:
     _eod_chain_thread = None
 
 
+def _trigger_poll_loop(stop_event: threading.Event, poll_seconds: int) -> None:
+    """Poll quotes for the armed lifecycle triggers while the market is OPEN; alerts route through alert_engine."""
+    from app.core.lifecycle.trigger_index import poll_armed_triggers
+
+    logger.info("[TRIGGERS] Poller started (every %ds)", poll_seconds)
+    while not stop_event.wait(poll_seconds):
+        if get_market_phase() != "OPEN":
+            continue
+        try:
+            poll_armed_triggers()
+        except Exception as e:
+            logger.exception("[TRIGGERS] Poll failed: %s", e)
+    logger.info("[TRIGGERS] Poller stopped")
+
+
+def start_trigger_poller() -> None:
+    """Start the lifecycle trigger poller (TRIGGER_POLL_ENABLED)."""
+    global _trigger_poll_stop_event, _trigger_poll_thread
+    from app.core.lifecycle.trigger_index import TRIGGER_POLL_ENABLED, TRIGGER_POLL_SECONDS
+
+    if not TRIGGER_POLL_ENABLED:
+        logger.info("[TRIGGERS] Poller disabled via TRIGGER_POLL_ENABLED=false")
+        return
+    if _trigger_poll_thread is not None and _trigger_poll_thread.is_alive():
+        logger.warning("[TRIGGERS] Poller already running")
+        return
+    _trigger_poll_stop_event = threading.Event()
+    _trigger_poll_thread = threading.Thread(
+        target=_trigger_poll_loop,
+        args=(_trigger_poll_stop_event, TRIGGER_POLL_SECONDS),
+        daemon=True,
+        name="TriggerPoller",
+    )
+    _trigger_poll_thread.start()
+
+
+def stop_trigger_poller() -> None:
+    """Stop the lifecycle trigger poller."""
+    global _trigger_poll_stop_event, _trigger_poll_thread
+    if _trigger_poll_stop_event is not None:
+        _trigger_poll_stop_event.set()
+    if _trigger_poll_thread is not None and _trigger_poll_thread.is_alive():
+        _trigger_poll_thread.join(timeout=5.0)
+    _trigger_poll_stop_event = None
+    _trigger_poll_thread = None
+
+
 def start_nightly_scheduler() -> None:
     """Start the nightly evaluation scheduler."""
     global _nightly_stop_event, _nightly_thread
@@ -648,11 +707,81 @@ def _run_scheduled_evaluation() -> bool:
     return False
 
 
+def _run_tiered_scheduler_tick() -> bool:
+    """
+    One TieredScheduler tick — evaluate the symbols that are due and merge them into the store.
+    Returns True if a batch was dispatched. Updates the same scheduler status fields as the interval scheduler.
+    """
+    import time as _time
+    global _last_scheduled_eval_at, _last_scheduled_eval_result, _last_scheduled_skip_reason
+    global _last_scheduled_duration_ms, _last_scheduled_run_error, _scheduler_run_count_today, _scheduler_run_count_date
+
+    t0 = _time.perf_counter()
+    try:
+        from app.core.universe.tiered_scheduler import get_tiered_scheduler
+        result = get_tiered_scheduler().tick()
+    except Exception as e:
+        _last_scheduled_eval_result = "FAILED"
+        _last_scheduled_skip_reason = "error"
+        _last_scheduled_run_error = str(e)
+        _last_scheduled_duration_ms = round((_time.perf_counter() - t0) * 1000, 1)
+        logger.exception("[SCHEDULER] Tiered tick failed: %s", e)
+        return False
+    _last_scheduled_duration_ms = round((_time.perf_counter() - t0) * 1000, 1)
+    if not result.get("dispatched"):
+        _last_scheduled_eval_result = "SKIPPED"
+        _last_scheduled_skip_reason = result.get("skip_reason")
+        return False
+    _last_scheduled_skip_reason = None
+    _last_scheduled_run_error = result.get("error")
+    if _last_scheduled_run_error:
+        _last_scheduled_eval_result = "FAILED"
+        return False
+    _last_scheduled_eval_at = datetime.now(timezone.utc).isoformat()
+    _last_scheduled_eval_result = "OK"
+    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    if _scheduler_run_count_date != today:
+        _scheduler_run_count_date = today
+        _scheduler_run_count_today = 0
+    _scheduler_run_count_today += 1
+    logger.info("[SCHEDULER] tiered batch symbols=%s duration_ms=%.0f", ",".join(result.get("symbols") or []), _last_scheduled_duration_ms)
+    return True
+
+
+def _tiered_scheduler_loop(stop_event: threading.Event, interval_minutes: int, tick_seconds: int) -> None:
+    """Tick the TieredScheduler every tick_seconds; watchdog still checks every interval_minutes."""
+    logger.info("[SCHEDULER] Started tiered scheduler (tick %ds)", tick_seconds)
+    print(f"[SCHEDULER] Started tiered scheduler (tick {tick_seconds}s)")
+    last_watchdog = time.monotonic()
+    while not stop_event.wait(tick_seconds):
+        if time.monotonic() - last_watchdog >= interval_minutes * 60:
+            last_watchdog = time.monotonic()
+            try:
+                from app.core.system.watchdog import run_watchdog_checks
+                run_watchdog_checks(
+                    _last_scheduled_eval_at,
+                    interval_minutes,
+                    orats_rolling_avg_ms=None,
+                    has_signals_in_24h=True,
+                    app_start_time_utc=get_app_start_time_utc(),
+                )
+            except Exception as e:
+                logger.debug("[SCHEDULER] Watchdog check skipped: %s", e)
+        _run_tiered_scheduler_tick()
+    logger.info("[SCHEDULER] Stopped")
+    print("[SCHEDULER] Stopped")
+
+
 def _scheduler_loop(stop_event: threading.Event, interval_minutes: int) -> None:
     """
     Background scheduler loop.
     Runs every interval_minutes and triggers evaluation if market is open.
+    With TIERED_SCHEDULER_ENABLED, runs the continuous tiered scheduler instead.
     """
+    from app.core.universe.tiered_scheduler import TIERED_SCHEDULER_ENABLED, TICK_SECONDS
+    if TIERED_SCHEDULER_ENABLED:
+        _tiered_scheduler_loop(stop_event, interval_minutes, TICK_SECONDS)
+        return
     interval_seconds = interval_minutes * 60
     logger.info("[SCHEDULER] Started with interval %d minutes (%d seconds)", interval_minutes, interval_seconds)
     print(f"[SCHEDULER] Started with interval {interval_minutes} minutes")
@@ -730,7 +859,8 @@ def run_scheduler_once() -> Dict[str, Any]:
     Does NOT overwrite decision when market closed — returns started=False.
     Phase 10.2.
     """
-    started = _run_scheduled_evaluation()
+    from app.core.universe.tiered_scheduler import TIERED_SCHEDULER_ENABLED
+    started = _run_tiered_scheduler_tick() if TIERED_SCHEDULER_ENABLED else _run_scheduled_evaluation()
     return {
         "started": started,
         "last_run_at": _last_scheduled_eval_at,
@@ -753,8 +883,15 @@ def get_scheduler_status() -> Dict[str, Any]:
         last_run_ok = True
     elif _last_scheduled_eval_result == "FAILED":
         last_run_ok = False
+    from app.core.universe.tiered_scheduler import TIERED_SCHEDULER_ENABLED
+    tiered = None
+    if TIERED_SCHEDULER_ENABLED:
+        from app.core.universe.tiered_scheduler import get_tiered_scheduler
+        tiered = get_tiered_scheduler().status()
+        next_run_at = tiered.get("next_due_at")
     return {
         "running": _scheduler_thread is not None and _scheduler_thread.is_alive(),
+        "mode": "tiered" if TIERED_SCHEDULER_ENABLED else "interval",
         "interval_minutes": UNIVERSE_EVAL_MINUTES,
         "last_scheduled_eval_at": _last_scheduled_eval_at,
         "last_run_at": _last_scheduled_eval_at,
@@ -766,6 +903,7 @@ def get_scheduler_status() -> Dict[str, Any]:
         "last_run_error": _last_scheduled_run_error,
         "run_count_today": _scheduler_run_count_today,
         "market_open": is_market_open(),
+        "tiered": tiered,
     }
 
 def _collect_api_routes(app: FastAPI) -> list:
@@ -781,11 +919,28 @@ def _collect_api_routes(app: FastAPI) -> list:
     return out
 
 
-@asynccontextmanager
-async def _lifespan(app: FastAPI):
-    """Startup: ORATS token (hardcoded), boot probe, route count, scheduler. No token validation."""
-    global _APP_START_TIME_UTC
-    _APP_START_TIME_UTC = time.time()
+# Phase 10: background subsystems start this long after the app is ready (0 = immediately, still off the
+# startup path). Pre-warm imports heavy evaluation modules in the same thread so first use is fast.
+STARTUP_DEFER_SECONDS = max(0.0, float(os.getenv("STARTUP_DEFER_SECONDS", "2.0")))
+STARTUP_PREWARM = os.getenv("STARTUP_PREWARM", "true").lower() in ("true", "1", "yes")
+STARTUP_BACKGROUND_ENABLED = os.getenv("STARTUP_BACKGROUND_ENABLED", "true").lower() in ("true", "1", "yes")
+_PREWARM_MODULES = (
+    "app.core.eval.evaluation_store_v2",
+    "app.core.eval.staged_evaluator",
+    "app.core.eval.universe_evaluator",
+    "app.core.data.symbol_snapshot_service",
+    "app.signals",
+    "pandas",
+)
+_DEFERRED_STEPS = (
+    "orats_probe", "alert_config", "decision_store", "equity_day_cache", "eval_scheduler", "nightly_scheduler",
+    "eod_chain_scheduler", "trigger_poller",
+)
+_deferred_stop_event: Optional[threading.Event] = None
+_deferred_thread: Optional[threading.Thread] = None
+
+
+def _startup_orats_probe() -> None:
     logger.info("[CONFIG] ORATS API token loaded (hardcoded, private mode)")
     print("[CONFIG] ORATS API token loaded (hardcoded, private mode)")
     base_url = "https://api.orats.io/datav2"
@@ -796,15 +951,14 @@ async def _lifespan(app: FastAPI):
         probe_status = "OK"
     except Exception as e:
         logger.warning("ORATS boot probe failed: %s", e)
-    api_routes = _collect_api_routes(app)
-    count = len(api_routes)
-    logger.info("[ROUTES] registered=%s", count)
-    print(f"[ROUTES] registered={count}")
     print("===== ORATS BOOT CHECK =====")
     print("Token present: True")
     print("Base URL:", base_url)
     print("Probe status:", probe_status)
     print("===========================")
+
+
+def _startup_alert_config() -> None:
     # Slack (Phase 7.2): any of CRITICAL/SIGNALS/HEALTH/DAILY webhooks = configured
     try:
         from app.core.alerts.slack_dispatcher import get_slack_config_status, is_slack_configured
@@ -830,6 +984,8 @@ async def _lifespan(app: FastAPI):
         print("Set OPENAI_API_KEY in chakraops/.env and restart to enable read-aloud on Strategy page.")
     print("=================================")
 
+
+def _startup_decision_store() -> None:
     # Canonical store path (ONE pipeline / ONE store)
     try:
         from app.core.eval.evaluation_store_v2 import get_decision_store_path
@@ -846,6 +1002,14 @@ async def _lifespan(app: FastAPI):
     except Exception:
         pass
 
+
+def _startup_equity_day_cache() -> None:
+    # Load today's persisted quotes / IV ranks before the first scheduled evaluation
+    from app.core.orats.equity_day_store import warm_equity_day_store
+    warm_equity_day_store()
+
+
+def _startup_eval_scheduler() -> None:
     # Start background scheduler for universe evaluation
     print("===== SCHEDULER STARTUP =====")
     print(f"Interval: {UNIVERSE_EVAL_MINUTES} minutes")
@@ -854,8 +1018,9 @@ async def _lifespan(app: FastAPI):
     start_evaluation_scheduler()
     print("Scheduler: STARTED")
     print("=============================")
-    
-    # Start nightly scheduler
+
+
+def _startup_nightly_scheduler() -> None:
     print("===== NIGHTLY SCHEDULER STARTUP =====")
     print(f"Enabled: {NIGHTLY_EVAL_ENABLED}")
     print(f"Time: {NIGHTLY_EVAL_TIME} {NIGHTLY_EVAL_TZ}")
@@ -865,16 +1030,121 @@ async def _lifespan(app: FastAPI):
     print(f"Next scheduled: {nightly_status.get('next_scheduled_at', 'N/A')}")
     print("=====================================")
 
+
+def _startup_eod_chain_scheduler() -> None:
     # EOD chain snapshot: 16:05 ET on trading days
     print("===== EOD CHAIN SCHEDULER STARTUP =====")
     print(f"Enabled: {EOD_CHAIN_ENABLED}")
     print(f"Time: {EOD_CHAIN_TIME} {EOD_CHAIN_TZ}")
     start_eod_chain_scheduler()
     print("=======================================")
-    
+
+
+def _startup_trigger_poller() -> None:
+    # Quote-driven lifecycle triggers (stop / target crossings between evaluation runs)
+    start_trigger_poller()
+
+
+def _prewarm_imports(stop_event: threading.Event) -> None:
+    """Import heavy modules off the request path so the first evaluate/snapshot call does not pay for them."""
+    import importlib
+    import sys
+
+    for name in _PREWARM_MODULES:
+        if stop_event.is_set():
+            return
+        if name in sys.modules:
+            continue
+        try:
+            with _startup.timed_import(name, phase="deferred"):
+                importlib.import_module(name)
+        except Exception as e:
+            logger.warning("[STARTUP] pre-warm import %s failed: %s", name, e)
+
+
+def _run_deferred_startup(stop_event: threading.Event, delay_s: float) -> None:
+    """Phase 10: start background subsystems after the app is serving. Each step is timed and isolated."""
+    if stop_event.wait(delay_s):
+        return
+    steps = {
+        "orats_probe": _startup_orats_probe,
+        "alert_config": _startup_alert_config,
+        "decision_store": _startup_decision_store,
+        "equity_day_cache": _startup_equity_day_cache,
+        "eval_scheduler": _startup_eval_scheduler,
+        "nightly_scheduler": _startup_nightly_scheduler,
+        "eod_chain_scheduler": _startup_eod_chain_scheduler,
+        "trigger_poller": _startup_trigger_poller,
+    }
+    for name in _DEFERRED_STEPS:
+        if stop_event.is_set():
+            _startup.mark_skipped(name, "shutdown")
+            continue
+        try:
+            with _startup.timed_init(name, phase="deferred"):
+                steps[name]()
+        except Exception as e:
+            logger.exception("[STARTUP] %s failed: %s", name, e)
+    if STARTUP_PREWARM:
+        with _startup.timed_init("prewarm_imports", phase="deferred"):
+            _prewarm_imports(stop_event)
+    logger.info("[STARTUP] deferred start-up complete")
+
+
+def start_deferred_startup(delay_s: Optional[float] = None) -> None:
+    """Start the deferred start-up thread (no-op if already running)."""
+    global _deferred_stop_event, _deferred_thread
+    if _deferred_thread is not None and _deferred_thread.is_alive():
+        return
+    for name in _DEFERRED_STEPS:
+        _startup.mark_pending(name)
+    if STARTUP_PREWARM:
+        _startup.mark_pending("prewarm_imports")
+    _deferred_stop_event = threading.Event()
+    _deferred_thread = threading.Thread(
+        target=_run_deferred_startup,
+        args=(_deferred_stop_event, STARTUP_DEFER_SECONDS if delay_s is None else delay_s),
+        daemon=True,
+        name="DeferredStartup",
+    )
+    _deferred_thread.start()
+
+
+def stop_deferred_startup(timeout: float = 5.0) -> None:
+    """Cancel pending deferred steps and wait for the one in progress."""
+    global _deferred_stop_event, _deferred_thread
+    if _deferred_stop_event is not None:
+        _deferred_stop_event.set()
+    if _deferred_thread is not None and _deferred_thread.is_alive():
+        _deferred_thread.join(timeout=timeout)
+        if _deferred_thread.is_alive():
+            logger.warning("[STARTUP] Deferred start-up did not stop within timeout")
+    _deferred_stop_event = None
+    _deferred_thread = None
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    """Startup: register routes and become ready; ORATS probe, store checks and schedulers start
+    in the background after STARTUP_DEFER_SECONDS (Phase 10). No token validation."""
+    global _APP_START_TIME_UTC
+    _APP_START_TIME_UTC = time.time()
+    with _startup.timed_init("routes"):
+        count = len(_collect_api_routes(app))
+    logger.info("[ROUTES] registered=%s", count)
+    print(f"[ROUTES] registered={count}")
+    if STARTUP_BACKGROUND_ENABLED:
+        start_deferred_startup()
+    else:
+        for name in _DEFERRED_STEPS:
+            _startup.mark_skipped(name, "STARTUP_BACKGROUND_ENABLED=false")
+    ready_ms = _startup.mark_ready()
+    print(f"[STARTUP] ready in {ready_ms:.0f} ms (background start-up in {STARTUP_DEFER_SECONDS:g}s)")
+
     yield
-    
-    # Shutdown: stop the schedulers
+
+    # Shutdown: cancel deferred start-up, then stop the schedulers
+    stop_deferred_startup()
     print("===== SCHEDULER SHUTDOWN =====")
     stop_evaluation_scheduler()
     print("Scheduler: STOPPED")
@@ -882,6 +1152,8 @@ async def _lifespan(app: FastAPI):
     print("Nightly: STOPPED")
     stop_eod_chain_scheduler()
     print("EOD chain: STOPPED")
+    stop_trigger_poller()
+    print("Trigger poller: STOPPED")
     print("===============================")
 
 
@@ -913,7 +1185,8 @@ async def api_key_middleware(request: Request, call_next):
 _UI_CORS_ORIGINS = (os.getenv("UI_CORS_ORIGINS") or "http://localhost:5173").strip().split(",")
 _CORS_ORIGINS = [o.strip() for o in _UI_CORS_ORIGINS if o.strip()] or ["http://localhost:5173"]
 
-from app.api.ui_routes import router as ui_router
+with _startup.timed_import("app.api.ui_routes"):
+    from app.api.ui_routes import router as ui_router
 app.include_router(ui_router)
 
 app.add_middleware(
@@ -995,13 +1268,17 @@ def api_market_status() -> Dict[str, Any]:
 
 @app.get("/api/ops/status")
 def api_ops_status() -> Dict[str, Any]:
-    """Phase 12: last_run_at, next_run_at, cadence_minutes, symbols_evaluated, trades_found, blockers_summary, market_phase."""
+    """Phase 12: last_run_at, next_run_at, cadence_minutes, symbols_evaluated, trades_found, blockers_summary, market_phase.
+    Also config (registry generation, per-file load timings) and caches (bounded in-memory cache stats)."""
     status = read_market_status()
     phase = get_market_phase()
     last_evaluated_at = status.get("last_evaluated_at")
     cadence_sec = get_eval_interval_seconds()
     cadence_minutes = cadence_sec // 60
     next_run_at = None
+    from app.core.config.registry import registry_status
+    from app.core.data.bounded_cache import bounded_cache_stats
+    from app.core.orats.equity_day_store import equity_day_store_stats
     if last_evaluated_at:
         try:
             last_ts = datetime.fromisoformat(last_evaluated_at.replace("Z", "+00:00")).timestamp()
@@ -1017,6 +1294,8 @@ def api_ops_status() -> Dict[str, Any]:
         "trades_found": status.get("trades_found", 0) if isinstance(status.get("trades_found"), int) else 0,
         "blockers_summary": status.get("blockers_summary") if isinstance(status.get("blockers_summary"), dict) else {},
         "market_phase": phase,
+        "config": registry_status(),
+        "caches": {**bounded_cache_stats(), "equity_day": equity_day_store_stats()},
     }
 
 
@@ -1557,6 +1836,46 @@ def api_ops_reset_local_state() -> Dict[str, Any]:
     }
 
 
+@app.get("/api/ops/portfolio-read-model")
+def api_ops_portfolio_read_model(
+    check: bool = Query(default=False, description="Rebuild from the raw stores and diff against memory"),
+    repair: bool = Query(default=False, description="With check: replace the model when it disagrees"),
+) -> Dict[str, Any]:
+    """Portfolio read model stats; ?check=true runs the consistency checker."""
+    from app.core.portfolio.read_model import get_portfolio_read_model
+    model = get_portfolio_read_model()
+    out: Dict[str, Any] = {"stats": model.stats()}
+    if check:
+        out["consistency"] = model.check_consistency(repair=repair)
+    return out
+
+
+@app.get("/api/ops/run-profile/{run_id}")
+def api_ops_run_profile(
+    run_id: str,
+    top: int = Query(default=10, ge=1, le=100, description="Entries in top_self_time"),
+    spans: bool = Query(default=False, description="Include the raw span list"),
+) -> Dict[str, Any]:
+    """Timing profile of a traced run (critical path, self time, ORATS wait vs network)."""
+    from app.core.observability.tracing import load_run_trace, summarize_trace
+    data = load_run_trace(run_id)
+    if data is None:
+        raise HTTPException(status_code=404, detail=f"No trace for run {run_id}")
+    out = summarize_trace(data, top_n=top)
+    if spans:
+        out["spans"] = data.get("spans") or []
+    return out
+
+
+@app.get("/api/ops/startup-profile")
+def api_ops_startup_profile() -> Dict[str, Any]:
+    """Phase 10: Readiness time, per-import timings and per-subsystem (deferred) init state."""
+    out = _startup.get_startup_profile()
+    out["defer_seconds"] = STARTUP_DEFER_SECONDS
+    out["routes"] = len(_collect_api_routes(app))
+    return out
+
+
 @app.get("/api/view/daily-overview")
 def api_view_daily_overview() -> Dict[str, Any]:
     """Daily overview from decision_latest.json. Includes fetched_at (ISO) for UI timestamps."""
@@ -1677,65 +1996,48 @@ def _infer_liquidity_tier(notes: str) -> Optional[str]:
 @app.post("/api/ops/evaluate")
 def api_ops_evaluate(
     request: Request,
+    symbol: Optional[str] = Query(default=None, description="Single-symbol recompute: priority lane, no cooldown"),
     x_trigger_token: Optional[str] = Header(None, alias="X-Trigger-Token"),
 ) -> Dict[str, Any]:
-    """Phase 10: Trigger DRY_RUN evaluation. Cooldown 5 min. Optional X-Trigger-Token from env EVALUATE_TRIGGER_TOKEN."""
+    """
+    Phase 10: Trigger DRY_RUN evaluation. Cooldown 5 min. Optional X-Trigger-Token from env EVALUATE_TRIGGER_TOKEN.
+    Jobs run on the warm eval worker (app.core.eval.eval_worker); ?symbol= queues a single-symbol
+    recompute ahead of universe runs.
+    """
     global _last_eval_ts, _eval_jobs
     token = os.getenv("EVALUATE_TRIGGER_TOKEN")
     if token and x_trigger_token != token:
         raise HTTPException(status_code=403, detail="Invalid or missing trigger token")
-    now = time.time()
-    with _jobs_lock:
-        remaining = EVAL_COOLDOWN_SEC - (now - _last_eval_ts)
-        if remaining > 0:
-            return {
-                "job_id": None,
-                "accepted": False,
-                "cooldown_seconds_remaining": int(remaining),
-            }
-        job_id = str(uuid.uuid4())
-        _eval_jobs[job_id] = {"state": "queued", "started_at": None, "finished_at": None, "error": None}
-        _last_eval_ts = now
+    from app.core.eval.eval_worker import submit_eval_job
 
-    def run_eval():
-        global _eval_jobs
+    sym = (symbol or "").strip().upper()
+    if sym:
+        job = submit_eval_job("symbol", symbols=[sym])
+    else:
+        now = time.time()
         with _jobs_lock:
-            _eval_jobs[job_id]["state"] = "running"
-            _eval_jobs[job_id]["started_at"] = time.time()
+            remaining = EVAL_COOLDOWN_SEC - (now - _last_eval_ts)
+            if remaining > 0:
+                return {
+                    "job_id": None,
+                    "accepted": False,
+                    "cooldown_seconds_remaining": int(remaining),
+                }
+            _last_eval_ts = now
         try:
-            out_dir = _output_dir()
-            result = subprocess.run(
-                [sys.executable, "-m", "scripts.run_and_save", "--output-dir", out_dir],
-                cwd=str(_repo_root()),
-                capture_output=True,
-                text=True,
-                timeout=120,
-            )
-            with _jobs_lock:
-                _eval_jobs[job_id]["state"] = "done" if result.returncode == 0 else "failed"
-                _eval_jobs[job_id]["finished_at"] = time.time()
-                if result.returncode != 0:
-                    _eval_jobs[job_id]["error"] = result.stderr[:500] if result.stderr else "Non-zero exit"
-        except subprocess.TimeoutExpired:
-            with _jobs_lock:
-                _eval_jobs[job_id]["state"] = "failed"
-                _eval_jobs[job_id]["finished_at"] = time.time()
-                _eval_jobs[job_id]["error"] = "Timeout (120s)"
-        except Exception as e:
+            job = submit_eval_job("universe")
+        except Exception:
             with _jobs_lock:
-                _eval_jobs[job_id]["state"] = "failed"
-                _eval_jobs[job_id]["finished_at"] = time.time()
-                _eval_jobs[job_id]["error"] = str(e)[:500]
-
-    threading.Thread(target=run_eval, daemon=True).start()
-    return {"job_id": job_id, "accepted": True}
+                _last_eval_ts = 0
+            raise
+    with _jobs_lock:
+        _eval_jobs[job["job_id"]] = {
+            "state": job["state"], "kind": job["kind"], "started_at": None, "finished_at": None, "error": None,
+        }
+    return {"job_id": job["job_id"], "accepted": True, "kind": job["kind"], "priority": job["priority"]}
 
 
-@app.get("/api/ops/evaluate/{job_id}")
-def api_ops_evaluate_status(job_id: str) -> Dict[str, Any]:
-    """Phase 10/12: Job status (queued|running|done|failed|not_found). Always 200; unknown job_id returns state=not_found."""
-    with _jobs_lock:
-        job = _eval_jobs.get(job_id)
+def _eval_job_response(job: Optional[Dict[str, Any]]) -> Dict[str, Any]:
     if not job:
         return {
             "state": "not_found",
@@ -1743,14 +2045,53 @@ def api_ops_evaluate_status(job_id: str) -> Dict[str, Any]:
             "finished_at": None,
             "error": None,
         }
+    with _jobs_lock:
+        if job["job_id"] in _eval_jobs:
+            _eval_jobs[job["job_id"]].update(
+                state=job["state"], started_at=job.get("started_at"),
+                finished_at=job.get("finished_at"), error=job.get("error"),
+            )
     return {
         "state": job["state"],
         "started_at": job.get("started_at"),
         "finished_at": job.get("finished_at"),
         "error": job.get("error"),
+        "kind": job.get("kind"),
+        "priority": job.get("priority"),
+        "progress": job.get("progress"),
+        "queue_position": job.get("queue_position"),
+        "result": job.get("result"),
     }
 
 
+@app.get("/api/ops/evaluate/{job_id}")
+def api_ops_evaluate_status(job_id: str) -> Dict[str, Any]:
+    """
+    Phase 10/12: Job status (queued|running|done|failed|cancelled|not_found) with progress
+    {stage, done, total}. Always 200; unknown job_id returns state=not_found.
+    """
+    from app.core.eval.eval_worker import get_eval_job
+    try:
+        job = get_eval_job(job_id)
+    except Exception as e:
+        logger.warning("[EVAL_WORKER] status lookup failed for %s: %s", job_id, e)
+        job = None
+    return _eval_job_response(job)
+
+
+@app.post("/api/ops/evaluate/{job_id}/cancel")
+def api_ops_evaluate_cancel(
+    job_id: str,
+    x_trigger_token: Optional[str] = Header(None, alias="X-Trigger-Token"),
+) -> Dict[str, Any]:
+    """Phase 10: Cancel a queued job immediately, or a running one at its next progress checkpoint."""
+    token = os.getenv("EVALUATE_TRIGGER_TOKEN")
+    if token and x_trigger_token != token:
+        raise HTTPException(status_code=403, detail="Invalid or missing trigger token")
+    from app.core.eval.eval_worker import cancel_eval_job
+    return _eval_job_response(cancel_eval_job(job_id))
+
+
 def _symbol_diagnostics_greeks_summary(iv_rank: Any, strategy_mode: Optional[str] = None) -> Dict[str, Any]:
     """Build greeks_summary dict; mode-aware (no 'for CSP' when strategy is CC)."""
     from app.core.config.wheel_strategy_config import get_dte_range, get_target_delta_range
@@ -2430,55 +2771,58 @@ def api_ops_evaluate_now() -> Dict[str, Any]:
         release_run_lock()
         raise HTTPException(status_code=500, detail=f"Failed to persist run state: {e}")
 
-    try:
-        logger.info("[EVAL] Staged evaluation started run_id=%s", run_id)
-        result = run_universe_evaluation_staged(list(UNIVERSE_SYMBOLS), use_staged=True)
-        run = create_run_from_evaluation(
-            run_id=run_id,
-            started_at=started_at,
-            evaluation_result=result,
-            market_phase=market_phase,
-        )
-        save_run(run)
-        if run.status == "COMPLETED" and run.completed_at:
-            update_latest_pointer(run_id, run.completed_at)
-        try:
-            from app.core.eval.run_artifacts import write_run_artifacts, update_latest_and_recent, purge_old_runs
-            run_dir = write_run_artifacts(run)
-            update_latest_and_recent(run, run_dir)
-            purge_old_runs()
-        except Exception as art_err:
-            logger.warning("[EVAL] Run artifacts write/purge failed (non-fatal): %s", art_err)
-        logger.info("[EVAL] Run %s completed and persisted status=%s", run_id, run.status)
-        try:
-            from app.core.alerts.alert_engine import process_run_completed
-            process_run_completed(run)
-        except Exception as alert_err:
-            logger.warning("[EVAL] Alert processing failed (non-fatal): %s", alert_err)
-        release_run_lock()
-        return {
-            "started": True,
-            "reason": "Evaluation completed",
-            "run_id": run_id,
-            "status": run.status,
-            "engine": getattr(run, "engine", "staged"),
-        }
-    except Exception as e:
-        logger.exception("Staged evaluation failed - aborting (no legacy fallback): %s", e)
-        release_run_lock()
-        save_failed_run(run_id, str(e), e, started_at)
+    from app.core.observability.tracing import trace_run
+
+    with trace_run(run_id, source="evaluate_now", symbols=len(UNIVERSE_SYMBOLS)):
         try:
-            from app.core.alerts.alert_engine import process_run_completed
-            from app.core.eval.evaluation_store import load_run
-            failed_run = load_run(run_id)
-            if failed_run:
-                process_run_completed(failed_run)
-        except Exception as alert_err:
-            logger.warning("[EVAL] Alert processing for failed run (non-fatal): %s", alert_err)
-        raise HTTPException(
-            status_code=500,
-            detail=f"Staged evaluation failed: {e}",
-        )
+            logger.info("[EVAL] Staged evaluation started run_id=%s", run_id)
+            result = run_universe_evaluation_staged(list(UNIVERSE_SYMBOLS), use_staged=True)
+            run = create_run_from_evaluation(
+                run_id=run_id,
+                started_at=started_at,
+                evaluation_result=result,
+                market_phase=market_phase,
+            )
+            save_run(run)
+            if run.status == "COMPLETED" and run.completed_at:
+                update_latest_pointer(run_id, run.completed_at)
+            try:
+                from app.core.eval.run_artifacts import write_run_artifacts, update_latest_and_recent, purge_old_runs
+                run_dir = write_run_artifacts(run)
+                update_latest_and_recent(run, run_dir)
+                purge_old_runs()
+            except Exception as art_err:
+                logger.warning("[EVAL] Run artifacts write/purge failed (non-fatal): %s", art_err)
+            logger.info("[EVAL] Run %s completed and persisted status=%s", run_id, run.status)
+            try:
+                from app.core.alerts.alert_engine import process_run_completed
+                process_run_completed(run)
+            except Exception as alert_err:
+                logger.warning("[EVAL] Alert processing failed (non-fatal): %s", alert_err)
+            release_run_lock()
+            return {
+                "started": True,
+                "reason": "Evaluation completed",
+                "run_id": run_id,
+                "status": run.status,
+                "engine": getattr(run, "engine", "staged"),
+            }
+        except Exception as e:
+            logger.exception("Staged evaluation failed - aborting (no legacy fallback): %s", e)
+            release_run_lock()
+            save_failed_run(run_id, str(e), e, started_at)
+            try:
+                from app.core.alerts.alert_engine import process_run_completed
+                from app.core.eval.evaluation_store import load_run
+                failed_run = load_run(run_id)
+                if failed_run:
+                    process_run_completed(failed_run)
+            except Exception as alert_err:
+                logger.warning("[EVAL] Alert processing for failed run (non-fatal): %s", alert_err)
+            raise HTTPException(
+                status_code=500,
+                detail=f"Staged evaluation failed: {e}",
+            )
 
 
 @app.get("/api/view/universe-evaluation")
@@ -2949,12 +3293,12 @@ def api_eval_runs(limit: int = Query(default=10, ge=1, le=100)) -> list:
 def api_eval_export_latest_run() -> Response:
     """Phase UI-2: Download latest run JSON."""
     try:
-        from app.core.eval.run_artifacts import get_latest_run_dir
+        from app.core.eval.run_artifacts import get_latest_run_dir, read_run_artifact
         run_dir = get_latest_run_dir()
         if run_dir:
-            path = run_dir / "evaluation.json"
-            if path.exists():
-                return Response(content=path.read_text(encoding="utf-8"), media_type="application/json")
+            content = read_run_artifact(run_dir, "evaluation.json")
+            if content is not None:
+                return Response(content=content, media_type="application/json")
         from app.core.eval.evaluation_store import load_latest_pointer, load_run
         pointer = load_latest_pointer()
         if pointer:
@@ -3362,11 +3706,12 @@ def api_portfolio_summary() -> Dict[str, Any]:
     """Phase 3: Portfolio summary — total_equity, capital_in_use, available_capital, risk_flags."""
     try:
         from app.core.accounts.store import list_accounts
-        from app.core.positions.store import list_positions
+        from app.core.portfolio.read_model import get_portfolio_read_model
         from app.core.portfolio.service import compute_portfolio_summary
 
         accounts = list_accounts()
-        positions = list_positions()
+        # Only open positions matter here; served from the portfolio read model
+        positions = get_portfolio_read_model().open_positions(exclude_test=False)
         summary = compute_portfolio_summary(accounts, positions)
         return {
             "total_equity": round(summary.total_equity, 2),
@@ -3401,11 +3746,12 @@ def api_portfolio_exposure(
     """Phase 3: Exposure by symbol or sector."""
     try:
         from app.core.accounts.store import list_accounts
-        from app.core.positions.store import list_positions
+        from app.core.portfolio.read_model import get_portfolio_read_model
         from app.core.portfolio.service import compute_exposure
 
         accounts = list_accounts()
-        positions = list_positions()
+        # Only open positions matter here; served from the portfolio read model
+        positions = get_portfolio_read_model().open_positions(exclude_test=False)
         group = "sector" if group_by == "sector" else "symbol"
         items = compute_exposure(accounts, positions, group_by=group)
         return {"items": items, "group_by": group}
@@ -3415,15 +3761,33 @@ def api_portfolio_exposure(
 
 
 @app.get("/api/portfolio/risk-profile")
-def api_portfolio_risk_profile() -> Dict[str, Any]:
-    """Phase 3: Risk profile settings."""
+def api_portfolio_risk_profile(
+    simulate: bool = Query(default=False, description="Phase 8.3d: Include Monte Carlo assignment risk"),
+    paths: int = Query(default=20_000, ge=1_000, le=500_000),
+    seed: int = Query(default=42),
+    jump_intensity: float = Query(default=0.0, ge=0.0, le=50.0, description="Expected jumps per year"),
+) -> Dict[str, Any]:
+    """Phase 3: Risk profile settings. Phase 8.3d: ?simulate=true adds monte_carlo (read-only)."""
     try:
         from app.core.portfolio.store import load_risk_profile
         p = load_risk_profile()
-        return p.to_dict()
+        out = p.to_dict()
     except Exception as e:
         logger.exception("Error fetching risk profile: %s", e)
         return {"error": str(e)}
+    if not simulate:
+        return out
+    try:
+        from app.core.portfolio.monte_carlo_risk import MonteCarloRiskConfig, simulate_assignment_risk_mc
+
+        open_positions, portfolio_equity = _load_open_positions_and_equity()
+        cfg = MonteCarloRiskConfig(n_paths=paths, seed=seed, jump_intensity=jump_intensity)
+        result = simulate_assignment_risk_mc({"portfolio_equity_usd": portfolio_equity}, open_positions, config=cfg)
+        out["monte_carlo"] = result.to_dict()
+    except Exception as e:
+        logger.exception("Error running Monte Carlo risk simulation: %s", e)
+        out["monte_carlo"] = {"error": str(e)}
+    return out
 
 
 @app.put("/api/portfolio/risk-profile")
@@ -3446,22 +3810,24 @@ async def api_portfolio_risk_profile_put(request: Request) -> Dict[str, Any]:
 # Uses build_portfolio_snapshot() and simulate_assignment_stress_dynamic().
 
 
+def _load_open_positions_and_equity() -> tuple:
+    """Phase 8.4: Open positions from the ledger file and portfolio equity (env or default)."""
+    from app.core.portfolio.portfolio_snapshot import load_open_positions, get_portfolio_equity_usd
+    from app.core.scoring.config import ACCOUNT_EQUITY_DEFAULT
+
+    repo = Path(__file__).resolve().parent.parent.parent
+    ledger_path = repo / "artifacts" / "positions" / "open_positions.json"
+    return load_open_positions(ledger_path), get_portfolio_equity_usd() or ACCOUNT_EQUITY_DEFAULT
+
+
 @app.get("/api/portfolio/dashboard")
 def api_portfolio_dashboard() -> Dict[str, Any]:
     """Phase 8.4: Portfolio dashboard — snapshot + stress simulation. Read-only."""
     try:
-        from app.core.portfolio.portfolio_snapshot import (
-            build_portfolio_snapshot,
-            load_open_positions,
-            get_portfolio_equity_usd,
-        )
+        from app.core.portfolio.portfolio_snapshot import build_portfolio_snapshot
         from app.core.portfolio.assignment_stress_simulator import simulate_assignment_stress_dynamic
-        from app.core.scoring.config import ACCOUNT_EQUITY_DEFAULT
 
-        repo = Path(__file__).resolve().parent.parent.parent
-        ledger_path = repo / "artifacts" / "positions" / "open_positions.json"
-        open_positions = load_open_positions(ledger_path)
-        portfolio_equity = get_portfolio_equity_usd() or ACCOUNT_EQUITY_DEFAULT
+        open_positions, portfolio_equity = _load_open_positions_and_equity()
         snapshot = build_portfolio_snapshot(open_positions, portfolio_equity)
         snap_with_equity = dict(snapshot)
         snap_with_equity["portfolio_equity_usd"] = portfolio_equity
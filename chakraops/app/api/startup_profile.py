@@ -0,0 +1,129 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""Phase 10: API startup profile — import and init timings per subsystem.
+
+server.py wraps its module-level imports in timed_import() and each lifespan /
+deferred start-up step in timed_init(); mark_ready() is called when the app can
+serve requests. Served by GET /api/ops/startup-profile. Timings are ms relative
+to the moment this module was first imported (the first thing server.py does).
+
+Kept dependency-free on purpose: it is imported before anything else.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Readiness goal for a warm disk; reported, not enforced
+READY_TARGET_MS = 1000.0
+
+_T0 = time.perf_counter()
+_lock = threading.Lock()
+_imports: List[Dict[str, Any]] = []
+_subsystems: Dict[str, Dict[str, Any]] = {}
+_ready_ms: Optional[float] = None
+
+
+def _now_ms() -> float:
+    return (time.perf_counter() - _T0) * 1000.0
+
+
+@contextmanager
+def timed_import(name: str, phase: str = "module") -> Iterator[None]:
+    """Record how long the enclosed import block took. phase: module (blocks readiness) | deferred."""
+    start = _now_ms()
+    try:
+        yield
+    finally:
+        with _lock:
+            _imports.append({"name": name, "phase": phase, "start_ms": round(start, 1), "ms": round(_now_ms() - start, 1)})
+
+
+def mark_pending(name: str, phase: str = "deferred") -> None:
+    """Register a subsystem that will start later (shows as pending until timed_init runs)."""
+    with _lock:
+        _subsystems.setdefault(name, {"phase": phase, "status": "pending"})
+
+
+@contextmanager
+def timed_init(name: str, phase: str = "lifespan") -> Iterator[None]:
+    """Time one start-up step; failures are recorded and re-raised."""
+    start = _now_ms()
+    with _lock:
+        _subsystems[name] = {"phase": phase, "status": "running", "start_ms": round(start, 1)}
+    status, error = "ok", None
+    try:
+        yield
+    except BaseException as e:
+        status, error = "failed", f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        with _lock:
+            entry = _subsystems[name]
+            entry.update(status=status, duration_ms=round(_now_ms() - start, 1))
+            if error:
+                entry["error"] = error
+
+
+def mark_skipped(name: str, reason: str) -> None:
+    with _lock:
+        entry = _subsystems.setdefault(name, {"phase": "deferred"})
+        entry.update(status="skipped", reason=reason)
+
+
+def mark_ready() -> float:
+    """Record the moment the app starts serving; returns ms since start."""
+    global _ready_ms
+    with _lock:
+        if _ready_ms is None:
+            _ready_ms = round(_now_ms(), 1)
+        ready = _ready_ms
+    logger.info("[STARTUP] ready in %.0f ms", ready)
+    return ready
+
+
+def get_startup_profile() -> Dict[str, Any]:
+    """Snapshot: readiness, per-import timings (slowest first) and per-subsystem init state."""
+    with _lock:
+        imports = [dict(i) for i in _imports]
+        subsystems = {k: dict(v) for k, v in _subsystems.items()}
+        ready = _ready_ms
+    blocking = [i for i in imports if i["phase"] == "module"]
+    deferred = [s for s in subsystems.values() if s.get("phase") == "deferred"]
+    return {
+        "ready": ready is not None,
+        "ready_ms": ready,
+        "ready_target_ms": READY_TARGET_MS,
+        "within_target": ready is not None and ready <= READY_TARGET_MS,
+        "uptime_ms": round(_now_ms(), 1),
+        "import_blocking_ms": round(sum(i["ms"] for i in blocking), 1),
+        "imports": sorted(imports, key=lambda i: -i["ms"]),
+        "subsystems": subsystems,
+        "deferred_complete": all(s.get("status") in ("ok", "failed", "skipped") for s in deferred),
+    }
+
+
+def reset_startup_profile() -> None:
+    """Clear recorded subsystems and readiness (tests; imports stay — they happen once)."""
+    global _ready_ms
+    with _lock:
+        _subsystems.clear()
+        _ready_ms = None
+
+
+__all__ = [
+    "READY_TARGET_MS",
+    "get_startup_profile",
+    "mark_pending",
+    "mark_ready",
+    "mark_skipped",
+    "reset_startup_profile",
+    "timed_import",
+    "timed_init",
+]
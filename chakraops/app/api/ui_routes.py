@@ -5,9 +5,10 @@
 from __future__ import annotations
 
 import os
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
 from fastapi import APIRouter, Header, HTTPException, Path, Query, Request
 
@@ -278,79 +279,121 @@ def ui_decision_file(
     return {**data, "evaluation_timestamp_utc": eval_ts, "decision_store_mtime_utc": store_mtime}
 
 
+def _build_universe_rows(artifact: Any) -> List[Dict[str, Any]]:
+    """One UI row per artifact symbol (request-time display fields included)."""
+    symbols_out: List[Dict[str, Any]] = []
+    sel_by_sym: Dict[str, Any] = {}
+    for c in getattr(artifact, "selected_candidates", []) or []:
+        sym_k = (getattr(c, "symbol", "") or "").strip().upper()
+        if sym_k:
+            sel_by_sym[sym_k] = c
+    if not (artifact and artifact.symbols):
+        return symbols_out
+    diag_by_sym = getattr(artifact, "diagnostics_by_symbol", None) or {}
+    for s in artifact.symbols:
+        sym_key = (s.symbol or "").strip().upper()
+        diag = diag_by_sym.get(sym_key)
+        sel_el = (diag.symbol_eligibility or {}) if diag else {}
+        score_caps = getattr(s, "score_caps", None)
+        raw_score = getattr(s, "raw_score", None)
+        row: Dict[str, Any] = {
+            "symbol": s.symbol,
+            "verdict": s.verdict,
+            "final_verdict": s.final_verdict,
+            "score": s.score,
+            "raw_score": raw_score,
+            "final_score": getattr(s, "final_score", None) or s.score,
+            "pre_cap_score": getattr(s, "pre_cap_score", None) or raw_score,
+            "score_caps": score_caps,
+            "band": s.band,
+            "primary_reason": _primary_reason_display(s),
+            "stage_status": s.stage_status,
+            "provider_status": s.provider_status or "n/a",
+            "data_freshness": s.data_freshness,
+            "strategy": s.strategy,
+            "price": s.price,
+            "expiration": s.expiration,
+            "score_breakdown": getattr(s, "score_breakdown", None),
+            "band_reason": getattr(s, "band_reason", None),
+            "max_loss": getattr(s, "max_loss", None),
+            "underlying_price": getattr(s, "underlying_price", None),
+            "capital_required": getattr(s, "capital_required", None),
+            "expected_credit": getattr(s, "expected_credit", None),
+            "premium_yield_pct": getattr(s, "premium_yield_pct", None),
+            "market_cap": getattr(s, "market_cap", None),
+            "rank_score": getattr(s, "rank_score", None),
+        }
+        row["required_data_missing"] = sel_el.get("required_data_missing") or []
+        row["required_data_stale"] = sel_el.get("required_data_stale") or []
+        row["optional_missing"] = sel_el.get("optional_missing") or []
+        sample = (getattr(diag, "sample_rejected_due_to_delta", None) or (diag.get("sample_rejected_due_to_delta") if isinstance(diag, dict) else None) or []) if diag else []
+        row["reasons_explained"] = _compute_reasons_explained(
+            getattr(s, "primary_reason", None) or "",
+            sel_el,
+            sample,
+        )
+        sel_cand = sel_by_sym.get(sym_key)
+        if sel_cand and (s.verdict or "").upper() == "ELIGIBLE":
+            row["selected_contract_key"] = getattr(sel_cand, "contract_key", None)
+            row["option_symbol"] = getattr(sel_cand, "option_symbol", None)
+            row["strike"] = getattr(sel_cand, "strike", None)
+        symbols_out.append(row)
+    return symbols_out
+
+
+# Universe view model, rebuilt only when the store's artifact changes: (generation, artifact, view)
+_universe_view: Optional[Tuple[int, Any, Any]] = None
+_universe_view_lock = threading.Lock()
+
+
+def _get_universe_view(store: Any) -> Tuple[Any, Any]:
+    """Return (artifact, UniverseView) for the store's current generation."""
+    global _universe_view
+    from app.api.universe_view import UniverseView
+    generation, artifact = store.get_latest_versioned()
+    with _universe_view_lock:
+        cached = _universe_view
+        if cached is None or cached[0] != generation or cached[1] is not artifact:
+            cached = (generation, artifact, UniverseView(_build_universe_rows(artifact), generation=generation))
+            _universe_view = cached
+    return artifact, cached[2]
+
+
 @router.get("/universe")
 def ui_universe(
+    verdict: Optional[str] = Query(None, description="Comma list, e.g. ELIGIBLE,HOLD"),
+    band: Optional[str] = Query(None, description="Comma list, e.g. A,B"),
+    strategy: Optional[str] = Query(None, description="Comma list, e.g. CSP,CC"),
+    q: Optional[str] = Query(None, description="Symbol substring"),
+    min_score: Optional[float] = Query(None, description="Minimum score"),
+    sort: Optional[str] = Query(None, description="symbol|score|final_score|rank_score|band|verdict|price|premium_yield_pct|market_cap; prefix - for descending"),
+    offset: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=0, le=1000, description="Page size (default: all rows)"),
+    fields: Optional[str] = Query(None, description="Comma list of row fields to return (symbol always included)"),
     x_ui_key: str | None = Header(None, alias="x-ui-key"),
 ) -> Dict[str, Any]:
     """
     UI-friendly universe: ONE source of truth from DecisionArtifactV2.
     Returns symbols array from artifact (no NOT_EVALUATED placeholders if eval has run).
+    Rows come from a view model built once per artifact generation; filter/sort/offset/limit/fields
+    are applied server-side (no parameters = full universe in artifact order, as before).
     """
     _require_ui_key(x_ui_key)
     now_iso = datetime.now(timezone.utc).isoformat()
     try:
         from app.core.eval.evaluation_store_v2 import get_evaluation_store_v2
         store = get_evaluation_store_v2()
-        store.reload_from_disk()
-        artifact = store.get_latest()
+        store.reload_if_changed()
+        artifact, view = _get_universe_view(store)
         meta = artifact.metadata or {} if artifact else {}
         ts = meta.get("pipeline_timestamp") or now_iso
-        symbols_out: List[Dict[str, Any]] = []
-        sel_by_sym: Dict[str, Any] = {}
-        for c in getattr(artifact, "selected_candidates", []) or []:
-            sym_k = (getattr(c, "symbol", "") or "").strip().upper()
-            if sym_k:
-                sel_by_sym[sym_k] = c
-        if artifact and artifact.symbols:
-            diag_by_sym = getattr(artifact, "diagnostics_by_symbol", None) or {}
-            for s in artifact.symbols:
-                sym_key = (s.symbol or "").strip().upper()
-                diag = diag_by_sym.get(sym_key)
-                sel_el = (diag.symbol_eligibility or {}) if diag else {}
-                score_caps = getattr(s, "score_caps", None)
-                raw_score = getattr(s, "raw_score", None)
-                row: Dict[str, Any] = {
-                    "symbol": s.symbol,
-                    "verdict": s.verdict,
-                    "final_verdict": s.final_verdict,
-                    "score": s.score,
-                    "raw_score": raw_score,
-                    "final_score": getattr(s, "final_score", None) or s.score,
-                    "pre_cap_score": getattr(s, "pre_cap_score", None) or raw_score,
-                    "score_caps": score_caps,
-                    "band": s.band,
-                    "primary_reason": _primary_reason_display(s),
-                    "stage_status": s.stage_status,
-                    "provider_status": s.provider_status or "n/a",
-                    "data_freshness": s.data_freshness,
-                    "strategy": s.strategy,
-                    "price": s.price,
-                    "expiration": s.expiration,
-                    "score_breakdown": getattr(s, "score_breakdown", None),
-                    "band_reason": getattr(s, "band_reason", None),
-                    "max_loss": getattr(s, "max_loss", None),
-                    "underlying_price": getattr(s, "underlying_price", None),
-                    "capital_required": getattr(s, "capital_required", None),
-                    "expected_credit": getattr(s, "expected_credit", None),
-                    "premium_yield_pct": getattr(s, "premium_yield_pct", None),
-                    "market_cap": getattr(s, "market_cap", None),
-                    "rank_score": getattr(s, "rank_score", None),
-                }
-                row["required_data_missing"] = sel_el.get("required_data_missing") or []
-                row["required_data_stale"] = sel_el.get("required_data_stale") or []
-                row["optional_missing"] = sel_el.get("optional_missing") or []
-                sample = (getattr(diag, "sample_rejected_due_to_delta", None) or (diag.get("sample_rejected_due_to_delta") if isinstance(diag, dict) else None) or []) if diag else []
-                row["reasons_explained"] = _compute_reasons_explained(
-                    getattr(s, "primary_reason", None) or "",
-                    sel_el,
-                    sample,
-                )
-                sel_cand = sel_by_sym.get(sym_key)
-                if sel_cand and (s.verdict or "").upper() == "ELIGIBLE":
-                    row["selected_contract_key"] = getattr(sel_cand, "contract_key", None)
-                    row["option_symbol"] = getattr(sel_cand, "option_symbol", None)
-                    row["strike"] = getattr(sel_cand, "strike", None)
-                symbols_out.append(row)
+        try:
+            page = view.query(
+                verdict=verdict, band=band, strategy=strategy, q=q, min_score=min_score,
+                sort=sort, offset=offset, limit=limit, fields=fields,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         store_mtime = _get_decision_store_mtime_utc()
         eval_ts = ts if ts else store_mtime
         out_d: Dict[str, Any] = {
@@ -359,12 +402,18 @@ def ui_universe(
             "as_of": ts,
             "evaluation_timestamp_utc": eval_ts,
             "decision_store_mtime_utc": store_mtime,
-            "symbols": symbols_out,
+            "symbols": page["symbols"],
+            "total": page["total"],
+            "filtered": page["filtered"],
+            "offset": page["offset"],
+            "limit": page["limit"],
             "artifact_version": "v2",
         }
         if meta.get("run_id"):
             out_d["run_id"] = meta["run_id"]
         return out_d
+    except HTTPException:
+        raise
     except Exception as e:
         try:
             store_mtime = _get_decision_store_mtime_utc()
@@ -1493,64 +1542,9 @@ def ui_portfolio_metrics(
     """
     _require_ui_key(x_ui_key)
     try:
-        from app.core.positions.service import list_positions
-        from app.core.positions.lifecycle import enrich_position_for_portfolio
-        positions = list_positions(status=None, symbol=None, exclude_test=exclude_test)
-        if account_id:
-            positions = [p for p in positions if (p.account_id or "").strip() == account_id.strip()]
-        capital_deployed = 0.0
-        open_count = 0
-        closed = [p for p in positions if (p.status or "").upper() in ("CLOSED", "ABORTED")]
-        realized_total = 0.0
-        wins = 0
-        pnls: List[float] = []
-        credits: List[float] = []
-        dtes: List[int] = []
-        for p in positions:
-            s = (p.status or "").upper()
-            if s in ("OPEN", "PARTIAL_EXIT"):
-                open_count += 1
-                c = getattr(p, "collateral", None)
-                if c is not None:
-                    capital_deployed += float(c)
-                elif p.strike and p.contracts:
-                    capital_deployed += float(p.strike) * 100 * int(p.contracts)
-        for p in closed:
-            rp = getattr(p, "realized_pnl", None)
-            if rp is not None:
-                rv = float(rp)
-                realized_total += rv
-                pnls.append(rv)
-                if rv > 0:
-                    wins += 1
-            oc = p.open_credit or p.credit_expected
-            if oc is not None:
-                credits.append(float(oc))
-            # DTE at entry: days from opened_at to expiration (for closed, use expiration - open date)
-            dte_at_entry: int | None = None
-            if p.expiration and p.opened_at:
-                try:
-                    from datetime import datetime
-                    exp = datetime.strptime(str(p.expiration).strip()[:10], "%Y-%m-%d").date()
-                    opened = datetime.fromisoformat(str(p.opened_at).replace("Z", "+00:00")).date()
-                    dte_at_entry = (exp - opened).days
-                except (ValueError, TypeError):
-                    pass
-            if dte_at_entry is not None:
-                dtes.append(dte_at_entry)
-        win_rate = (wins / len(closed)) if closed else None
-        avg_pnl = (sum(pnls) / len(pnls)) if pnls else None
-        avg_credit = (sum(credits) / len(credits)) if credits else None
-        avg_dte_at_entry = (sum(dtes) / len(dtes)) if dtes else None
-        return {
-            "open_positions_count": open_count,
-            "capital_deployed": round(capital_deployed, 2),
-            "realized_pnl_total": round(realized_total, 2),
-            "win_rate": round(win_rate, 4) if win_rate is not None else None,
-            "avg_pnl": round(avg_pnl, 2) if avg_pnl is not None else None,
-            "avg_credit": round(avg_credit, 2) if avg_credit is not None else None,
-            "avg_dte_at_entry": round(avg_dte_at_entry, 1) if avg_dte_at_entry is not None else None,
-        }
+        # Aggregates are maintained on position writes; no positions.json reload here
+        from app.core.portfolio.read_model import get_portfolio_read_model
+        return get_portfolio_read_model().metrics(account_id=account_id, exclude_test=exclude_test)
     except Exception as e:
         import logging
         logging.getLogger(__name__).exception("Error loading portfolio metrics: %s", e)
@@ -1578,7 +1572,7 @@ def ui_portfolio_risk(
     _require_ui_key(x_ui_key)
     try:
         from app.core.accounts.store import get_account, get_default_account
-        from app.core.positions.service import list_positions
+        from app.core.portfolio.read_model import get_portfolio_read_model
         from app.core.portfolio.risk import evaluate_portfolio_risk
         account = None
         if account_id:
@@ -1587,10 +1581,7 @@ def ui_portfolio_risk(
             account = get_default_account()
         if account is None:
             return {"status": "FAIL", "metrics": {}, "breaches": [], "error": "No account found"}
-        positions = list_positions(status=None, symbol=None, exclude_test=exclude_test)
-        if account_id:
-            positions = [p for p in positions if (p.account_id or "").strip() == account_id.strip()]
-        open_pos = [p for p in positions if (p.status or "").upper() in ("OPEN", "PARTIAL_EXIT")]
+        open_pos = get_portfolio_read_model().open_positions(account_id=account_id, exclude_test=exclude_test)
         result = evaluate_portfolio_risk(account, open_pos)
         result["account_id"] = account.account_id
         return result
@@ -1613,9 +1604,8 @@ def ui_wheel_overview(
     _require_ui_key(x_ui_key)
     try:
         from app.core.accounts.store import get_account, get_default_account
-        from app.core.positions.service import list_positions
+        from app.core.portfolio.read_model import get_portfolio_read_model
         from app.core.portfolio.risk import evaluate_portfolio_risk
-        from app.core.wheel.state_store import load_state
         from app.core.wheel.next_action import compute_next_action
 
         account = get_account(account_id.strip()) if account_id else None
@@ -1624,19 +1614,15 @@ def ui_wheel_overview(
         if account is None:
             return {"symbols": {}, "risk_status": "FAIL", "error": "No account found"}
 
-        positions = list_positions(status=None, symbol=None, exclude_test=exclude_test)
-        if account_id:
-            positions = [p for p in positions if (p.account_id or "").strip() == account_id.strip()]
-        open_pos = [p for p in positions if (p.status or "").upper() in ("OPEN", "PARTIAL_EXIT")]
+        read_model = get_portfolio_read_model()
+        open_pos = read_model.open_positions(account_id=account_id, exclude_test=exclude_test)
         portfolio_risk = evaluate_portfolio_risk(account, open_pos)
         risk_status = (portfolio_risk.get("status") or "PASS").upper()
 
-        wheel_state_data = load_state()
-        symbols_map = wheel_state_data.get("symbols") or {}
+        symbols_map = read_model.wheel_symbols()
         last_wheel_actions: Dict[str, Dict[str, Any]] = {}
         try:
-            from app.core.wheel.actions_store import get_last_wheel_action_per_symbol
-            last_wheel_actions = get_last_wheel_action_per_symbol()
+            last_wheel_actions = read_model.last_wheel_actions()
         except Exception:
             pass
 
@@ -1645,7 +1631,7 @@ def ui_wheel_overview(
         try:
             from app.core.eval.evaluation_store_v2 import get_evaluation_store_v2
             store = get_evaluation_store_v2()
-            store.reload_from_disk()
+            store.reload_if_changed()
             artifact = store.get_latest()
             if artifact and artifact.metadata:
                 run_id = artifact.metadata.get("run_id")
@@ -2722,17 +2708,13 @@ def ui_symbol_diagnostics(
         from app.core.eval.evaluation_store_v2 import get_decision_by_run
         artifact = get_decision_by_run(sym_upper, run_id.strip())
         if artifact is not None:
-            summary = None
-            for s in artifact.symbols:
-                if (getattr(s, "symbol", "") or "").strip().upper() == sym_upper:
-                    summary = s
-                    break
+            summary = artifact.get_symbol_summary(sym_upper)
             if summary is not None:
                 candidates = getattr(artifact, "candidates_by_symbol", {}) or {}
                 gates = getattr(artifact, "gates_by_symbol", {}) or {}
                 earnings_by = getattr(artifact, "earnings_by_symbol", {}) or {}
                 diag_by = getattr(artifact, "diagnostics_by_symbol", {}) or {}
-                sel_c = next((c for c in (getattr(artifact, "selected_candidates", []) or []) if (getattr(c, "symbol", "") or "").strip().upper() == sym_upper), None)
+                sel_c = artifact.get_selected_candidate(sym_upper)
                 _sel_key = getattr(sel_c, "contract_key", None) if sel_c else None
                 _opt_sym = getattr(sel_c, "option_symbol", None) if sel_c else None
                 pipeline_ts = (artifact.metadata or {}).get("pipeline_timestamp") if artifact else None
@@ -2759,7 +2741,7 @@ def ui_symbol_diagnostics(
     if row is not None:
         summary, candidates, gates, earnings, diagnostics_details = row
         artifact = store.get_latest()
-        sel_c = next((c for c in (getattr(artifact, "selected_candidates", []) or []) if (getattr(c, "symbol", "") or "").strip().upper() == sym_upper), None) if artifact else None
+        sel_c = artifact.get_selected_candidate(sym_upper) if artifact else None
         _sel_key = getattr(sel_c, "contract_key", None) if sel_c else None
         _opt_sym = getattr(sel_c, "option_symbol", None) if sel_c else None
         pipeline_ts = (artifact.metadata or {}).get("pipeline_timestamp") if artifact else None
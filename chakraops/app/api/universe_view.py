@@ -0,0 +1,165 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""
+Universe view model for /api/ui/universe: built once per artifact generation.
+
+Rows are stored column-wise (one list per field) with a precomputed sort order per
+sortable key, so a request only filters index lists, walks one order and materializes
+the visible page with the requested fields.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Ordinal sort keys: best first
+_BAND_ORDER = {"A": 0, "B": 1, "C": 2, "D": 3}
+_VERDICT_ORDER = {"ELIGIBLE": 0, "HOLD": 1, "BLOCKED": 2, "NOT_EVALUATED": 3}
+
+SORT_KEYS = ("symbol", "score", "final_score", "rank_score", "band", "verdict", "price", "premium_yield_pct", "market_cap")
+MAX_PAGE_LIMIT = 1000
+
+
+def _ordinal(table: Dict[str, int], value: Any) -> Optional[int]:
+    if value is None:
+        return None
+    return table.get(str(value).strip().upper(), len(table))
+
+
+def _numeric(value: Any) -> Optional[float]:
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _split_csv(value: Optional[str]) -> List[str]:
+    return [v.strip() for v in (value or "").split(",") if v.strip()]
+
+
+class UniverseView:
+    """Columnar universe rows plus precomputed ascending/descending orders per sort key."""
+
+    def __init__(self, rows: Sequence[Dict[str, Any]], generation: int = 0) -> None:
+        self.generation = generation
+        self.size = len(rows)
+        fields: List[str] = []
+        for row in rows:
+            for k in row:
+                if k not in fields:
+                    fields.append(k)
+        self.fields: Tuple[str, ...] = tuple(fields)
+        self.columns: Dict[str, List[Any]] = {f: [row.get(f) for row in rows] for f in fields}
+        self._verdict = [str(v or "").strip().upper() for v in self.columns.get("verdict", [None] * self.size)]
+        self._band = [str(v or "").strip().upper() for v in self.columns.get("band", [None] * self.size)]
+        self._strategy = [str(v or "").strip().upper() for v in self.columns.get("strategy", [None] * self.size)]
+        self._symbol = [str(v or "").strip().upper() for v in self.columns.get("symbol", [None] * self.size)]
+        self._score = [_numeric(v) for v in self.columns.get("score", [None] * self.size)]
+        self._orders: Dict[str, Tuple[List[int], List[int]]] = {}
+        for key in SORT_KEYS:
+            col = self.columns.get(key, [None] * self.size)
+            if key == "band":
+                values = [_ordinal(_BAND_ORDER, v) for v in col]
+            elif key == "verdict":
+                values = [_ordinal(_VERDICT_ORDER, v) for v in col]
+            elif key == "symbol":
+                values = [s or None for s in self._symbol]
+            else:
+                values = [_numeric(v) for v in col]
+            present = [i for i in range(self.size) if values[i] is not None]
+            missing = [i for i in range(self.size) if values[i] is None]
+            # (ascending, descending); None values last in both, ties keep artifact order
+            self._orders[key] = (
+                sorted(present, key=values.__getitem__) + missing,
+                sorted(present, key=values.__getitem__, reverse=True) + missing,
+            )
+
+    # ------------------------------------------------------------------
+
+    def _ordered(self, sort: Optional[str]) -> Iterable[int]:
+        if not sort:
+            return range(self.size)
+        desc = sort.startswith("-")
+        key = sort.lstrip("-+")
+        if key not in self._orders:
+            raise ValueError(f"Unsupported sort key: {key} (allowed: {', '.join(SORT_KEYS)})")
+        asc, desc_order = self._orders[key]
+        return desc_order if desc else asc
+
+    def _matches(
+        self,
+        i: int,
+        verdicts: Optional[set],
+        bands: Optional[set],
+        strategies: Optional[set],
+        q: str,
+        min_score: Optional[float],
+    ) -> bool:
+        if verdicts is not None and self._verdict[i] not in verdicts:
+            return False
+        if bands is not None and self._band[i] not in bands:
+            return False
+        if strategies is not None and self._strategy[i] not in strategies:
+            return False
+        if q and q not in self._symbol[i]:
+            return False
+        if min_score is not None:
+            score = self._score[i]
+            if score is None or score < min_score:
+                return False
+        return True
+
+    def query(
+        self,
+        verdict: Optional[str] = None,
+        band: Optional[str] = None,
+        strategy: Optional[str] = None,
+        q: Optional[str] = None,
+        min_score: Optional[float] = None,
+        sort: Optional[str] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        fields: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Filter (comma lists for verdict/band/strategy, symbol substring q, min_score), sort
+        ("key" or "-key"), page (offset/limit) and project (comma list of fields; symbol always kept).
+        Returns {"symbols": [...], "total", "filtered", "offset", "limit"}.
+        """
+        verdicts = {v.upper() for v in _split_csv(verdict)} or None
+        bands = {v.upper() for v in _split_csv(band)} or None
+        strategies = {v.upper() for v in _split_csv(strategy)} or None
+        needle = (q or "").strip().upper()
+        offset = max(0, int(offset or 0))
+        if limit is not None:
+            limit = max(0, min(int(limit), MAX_PAGE_LIMIT))
+        projection: Sequence[str] = self.fields
+        if fields:
+            wanted = _split_csv(fields)
+            projection = ["symbol"] + [f for f in wanted if f != "symbol" and f in self.columns]
+
+        filtering = any(x is not None for x in (verdicts, bands, strategies, min_score)) or bool(needle)
+        page: List[int] = []
+        filtered = 0
+        end = None if limit is None else offset + limit
+        for i in self._ordered(sort):
+            if filtering and not self._matches(i, verdicts, bands, strategies, needle, min_score):
+                continue
+            if filtered >= offset and (end is None or filtered < end):
+                page.append(i)
+            filtered += 1
+
+        cols = [(f, self.columns.get(f)) for f in projection]
+        rows = [{f: (col[i] if col is not None else None) for f, col in cols} for i in page]
+        return {
+            "symbols": rows,
+            "total": self.size,
+            "filtered": filtered,
+            "offset": offset,
+            "limit": limit,
+        }
+
+
+__all__ = ["MAX_PAGE_LIMIT", "SORT_KEYS", "UniverseView"]
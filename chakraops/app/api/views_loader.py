@@ -11,15 +11,17 @@ import json
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-try:
-    from app.core.eval.evaluation_store_v2 import get_decision_store_path
-except ImportError:
-    def get_decision_store_path() -> Path:
-        return Path("out") / "decision_latest.json"
-
 
 def _decision_latest_path() -> Path:
-    """Canonical decision store path — ONE source of truth."""
+    """Canonical decision store path — ONE source of truth.
+
+    Imported lazily: evaluation_store_v2 pulls in scoring/eligibility/signals, which
+    would otherwise load with the API server before it can serve anything.
+    """
+    try:
+        from app.core.eval.evaluation_store_v2 import get_decision_store_path
+    except ImportError:
+        return Path("out") / "decision_latest.json"
     return get_decision_store_path()
 
 
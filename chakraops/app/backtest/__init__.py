@@ -9,6 +9,14 @@ from app.backtest.engine import (
     SnapshotCSVDataSource,
     Trade,
 )
+from app.backtest.panel import SnapshotPanel, load_snapshot_panel
+from app.backtest.sweep import (
+    PanelBacktestParams,
+    SweepReport,
+    build_param_grid,
+    run_panel_backtest,
+    run_parameter_sweep,
+)
 
 __all__ = [
     "BacktestConfig",
@@ -16,4 +24,11 @@ __all__ = [
     "BacktestReport",
     "SnapshotCSVDataSource",
     "Trade",
+    "SnapshotPanel",
+    "load_snapshot_panel",
+    "PanelBacktestParams",
+    "SweepReport",
+    "build_param_grid",
+    "run_panel_backtest",
+    "run_parameter_sweep",
 ]
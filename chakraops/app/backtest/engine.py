@@ -7,6 +7,7 @@ from __future__ import annotations
 import csv
 import json
 import logging
+import math
 import uuid
 from dataclasses import asdict, dataclass, field
 from datetime import date, timedelta
@@ -196,6 +197,83 @@ def _stock_eligible(
     return True
 
 
+# ---------- Report metrics (shared by BacktestEngine and the panel backtest) ----------
+
+CLOSED_OUTCOMES = ("expired_otm", "assigned", "btc", "called_away")
+
+
+def build_backtest_report(
+    run_id: str,
+    closed: List[Trade],
+    config_summary: Optional[Dict[str, Any]] = None,
+) -> BacktestReport:
+    """Aggregate closed trades: P&L, win rate, ROC mean/std, max drawdown, by symbol/regime."""
+    pnls = [t.pnl for t in closed if t.pnl is not None]
+    total_pnl = sum(pnls)
+    wins = sum(1 for p in pnls if p > 0)
+    losses = sum(1 for p in pnls if p <= 0)
+    total_trades = len(closed)
+    win_rate = (wins / total_trades) if total_trades else 0.0
+    rocs = [t.roc for t in closed if t.roc is not None]
+    roc_mean = (sum(rocs) / len(rocs)) if rocs else None
+    roc_std = None
+    if len(rocs) > 1:
+        mean = sum(rocs) / len(rocs)
+        var = sum((x - mean) ** 2 for x in rocs) / (len(rocs) - 1)
+        roc_std = math.sqrt(var)
+
+    # Max drawdown (cumulative PnL)
+    cum = 0.0
+    peak = 0.0
+    max_dd = 0.0
+    for t in sorted(closed, key=lambda x: x.exit_date):
+        cum += (t.pnl or 0)
+        peak = max(peak, cum)
+        max_dd = min(max_dd, cum - peak)
+
+    by_symbol: Dict[str, Dict[str, Any]] = {}
+    for t in closed:
+        s = t.symbol
+        if s not in by_symbol:
+            by_symbol[s] = {"pnl": 0.0, "trades": 0, "wins": 0}
+        by_symbol[s]["pnl"] += (t.pnl or 0)
+        by_symbol[s]["trades"] += 1
+        if (t.pnl or 0) > 0:
+            by_symbol[s]["wins"] += 1
+    by_regime: Dict[str, Dict[str, Any]] = {}
+    for t in closed:
+        r = t.regime or "UNKNOWN"
+        if r not in by_regime:
+            by_regime[r] = {"pnl": 0.0, "trades": 0}
+        by_regime[r]["pnl"] += (t.pnl or 0)
+        by_regime[r]["trades"] += 1
+
+    return BacktestReport(
+        run_id=run_id,
+        total_pnl=total_pnl,
+        win_rate=win_rate,
+        total_trades=total_trades,
+        wins=wins,
+        losses=losses,
+        roc_mean=roc_mean,
+        roc_std=roc_std,
+        max_drawdown=abs(max_dd),
+        by_symbol=by_symbol,
+        by_regime=by_regime,
+        trades=closed,
+        config_summary=dict(config_summary or {}),
+    )
+
+
+def default_backtest_output_dir() -> Path:
+    """app/data/backtests under the repo (run folders are created beneath it)."""
+    try:
+        from app.core.config.paths import BASE_DIR
+        return BASE_DIR / "app" / "data" / "backtests"
+    except Exception:
+        return Path(__file__).resolve().parents[1] / "data" / "backtests"
+
+
 # ---------- BacktestEngine ----------
 
 
@@ -406,62 +484,10 @@ class BacktestEngine:
                 days_held=(last_date - pos.entry_date).days,
             ))
 
-        # Metrics
-        closed = [t for t in trades if t.outcome in ("expired_otm", "assigned", "btc")]
-        pnls = [t.pnl for t in closed if t.pnl is not None]
-        total_pnl = sum(pnls)
-        wins = sum(1 for p in pnls if p > 0)
-        losses = sum(1 for p in pnls if p <= 0)
-        total_trades = len(closed)
-        win_rate = (wins / total_trades) if total_trades else 0.0
-        rocs = [t.roc for t in closed if t.roc is not None]
-        roc_mean = (sum(rocs) / len(rocs)) if rocs else None
-        roc_std = None
-        if len(rocs) > 1:
-            import math
-            mean = sum(rocs) / len(rocs)
-            var = sum((x - mean) ** 2 for x in rocs) / (len(rocs) - 1)
-            roc_std = math.sqrt(var)
-
-        # Max drawdown (cumulative PnL)
-        cum = 0.0
-        peak = 0.0
-        max_dd = 0.0
-        for t in sorted(closed, key=lambda x: x.exit_date):
-            cum += (t.pnl or 0)
-            peak = max(peak, cum)
-            max_dd = min(max_dd, cum - peak)
-
-        by_symbol: Dict[str, Dict[str, Any]] = {}
-        for t in closed:
-            s = t.symbol
-            if s not in by_symbol:
-                by_symbol[s] = {"pnl": 0.0, "trades": 0, "wins": 0}
-            by_symbol[s]["pnl"] += (t.pnl or 0)
-            by_symbol[s]["trades"] += 1
-            if (t.pnl or 0) > 0:
-                by_symbol[s]["wins"] += 1
-        by_regime: Dict[str, Dict[str, Any]] = {}
-        for t in closed:
-            r = t.regime or "UNKNOWN"
-            if r not in by_regime:
-                by_regime[r] = {"pnl": 0.0, "trades": 0}
-            by_regime[r]["pnl"] += (t.pnl or 0)
-            by_regime[r]["trades"] += 1
-
-        report = BacktestReport(
-            run_id=run_id,
-            total_pnl=total_pnl,
-            win_rate=win_rate,
-            total_trades=total_trades,
-            wins=wins,
-            losses=losses,
-            roc_mean=roc_mean,
-            roc_std=roc_std,
-            max_drawdown=abs(max_dd),
-            by_symbol=by_symbol,
-            by_regime=by_regime,
-            trades=closed,
+        closed = [t for t in trades if t.outcome in CLOSED_OUTCOMES]
+        report = build_backtest_report(
+            run_id,
+            closed,
             config_summary={
                 "fill_model": fill_model,
                 "exit_model": cfg.exit_model,
@@ -471,12 +497,7 @@ class BacktestEngine:
         )
 
         # Write outputs: app/data/backtests/<run_id>/
-        try:
-            from app.core.config.paths import BASE_DIR
-            _default_base = BASE_DIR / "app" / "data" / "backtests"
-        except Exception:
-            _default_base = Path(__file__).resolve().parents[1] / "data" / "backtests"
-        _base = Path(cfg.output_dir) if cfg.output_dir else _default_base
+        _base = Path(cfg.output_dir) if cfg.output_dir else default_backtest_output_dir()
         out_dir = _base / run_id
         out_dir.mkdir(parents=True, exist_ok=True)
         self._write_report(report, out_dir)
@@ -484,59 +505,70 @@ class BacktestEngine:
         return report
 
     def _write_report(self, report: BacktestReport, out_dir: Path) -> None:
-        d = {
-            "run_id": report.run_id,
-            "total_pnl": report.total_pnl,
-            "win_rate": report.win_rate,
-            "total_trades": report.total_trades,
-            "wins": report.wins,
-            "losses": report.losses,
-            "roc_mean": report.roc_mean,
-            "roc_std": report.roc_std,
-            "max_drawdown": report.max_drawdown,
-            "by_symbol": report.by_symbol,
-            "by_regime": report.by_regime,
-            "config_summary": report.config_summary,
-        }
-        with open(out_dir / "backtest_report.json", "w", encoding="utf-8") as f:
-            json.dump(d, f, indent=2)
+        write_backtest_report(report, out_dir)
 
     def _write_trades_csv(self, trades: List[Trade], out_dir: Path) -> None:
-        path = out_dir / "backtest_trades.csv"
-        if not trades:
-            with open(path, "w", newline="", encoding="utf-8") as f:
-                f.write("strategy,symbol,entry_date,exit_date,entry_premium,strike,expiry,contracts,outcome,roc,pnl,regime,days_held\n")
-            return
+        write_trades_csv(trades, out_dir)
+
+
+def write_backtest_report(report: BacktestReport, out_dir: Path) -> None:
+    """backtest_report.json (metrics only; trades go to the CSV)."""
+    d = {
+        "run_id": report.run_id,
+        "total_pnl": report.total_pnl,
+        "win_rate": report.win_rate,
+        "total_trades": report.total_trades,
+        "wins": report.wins,
+        "losses": report.losses,
+        "roc_mean": report.roc_mean,
+        "roc_std": report.roc_std,
+        "max_drawdown": report.max_drawdown,
+        "by_symbol": report.by_symbol,
+        "by_regime": report.by_regime,
+        "config_summary": report.config_summary,
+    }
+    with open(out_dir / "backtest_report.json", "w", encoding="utf-8") as f:
+        json.dump(d, f, indent=2)
+
+
+def write_trades_csv(trades: List[Trade], out_dir: Path) -> None:
+    """backtest_trades.csv, one row per closed trade."""
+    path = out_dir / "backtest_trades.csv"
+    if not trades:
         with open(path, "w", newline="", encoding="utf-8") as f:
-            w = csv.DictWriter(f, fieldnames=[
-                "strategy", "symbol", "entry_date", "exit_date", "entry_premium",
-                "exit_premium_or_assignment", "strike", "expiry", "contracts",
-                "outcome", "roc", "pnl", "regime", "days_held",
-                "underlying_at_entry", "underlying_at_exit",
-            ])
-            w.writeheader()
-            for t in trades:
-                w.writerow({
-                    "strategy": t.strategy,
-                    "symbol": t.symbol,
-                    "entry_date": t.entry_date.isoformat(),
-                    "exit_date": t.exit_date.isoformat(),
-                    "entry_premium": t.entry_premium,
-                    "exit_premium_or_assignment": t.exit_premium_or_assignment,
-                    "strike": t.strike,
-                    "expiry": t.expiry.isoformat(),
-                    "contracts": t.contracts,
-                    "outcome": t.outcome,
-                    "roc": t.roc,
-                    "pnl": t.pnl,
-                    "regime": t.regime,
-                    "days_held": t.days_held,
-                    "underlying_at_entry": t.underlying_at_entry,
-                    "underlying_at_exit": t.underlying_at_exit,
-                })
+            f.write("strategy,symbol,entry_date,exit_date,entry_premium,strike,expiry,contracts,outcome,roc,pnl,regime,days_held\n")
+        return
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        w = csv.DictWriter(f, fieldnames=[
+            "strategy", "symbol", "entry_date", "exit_date", "entry_premium",
+            "exit_premium_or_assignment", "strike", "expiry", "contracts",
+            "outcome", "roc", "pnl", "regime", "days_held",
+            "underlying_at_entry", "underlying_at_exit",
+        ])
+        w.writeheader()
+        for t in trades:
+            w.writerow({
+                "strategy": t.strategy,
+                "symbol": t.symbol,
+                "entry_date": t.entry_date.isoformat(),
+                "exit_date": t.exit_date.isoformat(),
+                "entry_premium": t.entry_premium,
+                "exit_premium_or_assignment": t.exit_premium_or_assignment,
+                "strike": t.strike,
+                "expiry": t.expiry.isoformat(),
+                "contracts": t.contracts,
+                "outcome": t.outcome,
+                "roc": t.roc,
+                "pnl": t.pnl,
+                "regime": t.regime,
+                "days_held": t.days_held,
+                "underlying_at_entry": t.underlying_at_entry,
+                "underlying_at_exit": t.underlying_at_exit,
+            })
 
 
 __all__ = [
+    "CLOSED_OUTCOMES",
     "BacktestConfig",
     "BacktestEngine",
     "BacktestReport",
@@ -544,4 +576,8 @@ __all__ = [
     "SnapshotCSVDataSource",
     "SyntheticOptionsChainProvider",
     "Trade",
+    "build_backtest_report",
+    "default_backtest_output_dir",
+    "write_backtest_report",
+    "write_trades_csv",
 ]
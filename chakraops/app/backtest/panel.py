@@ -0,0 +1,158 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""Phase 5 backtest: columnar (date x symbol) snapshot panel, loaded once and optionally cached on disk."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+PANEL_CACHE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class SnapshotPanel:
+    """Dense snapshot panel. price/volume/iv_rank are (dates x symbols); NaN where a symbol is absent."""
+
+    dates: List[date]
+    symbols: List[str]
+    regimes: List[str]
+    price: np.ndarray
+    volume: np.ndarray
+    iv_rank: np.ndarray
+
+    @property
+    def shape(self) -> tuple:
+        return self.price.shape
+
+    @property
+    def present(self) -> np.ndarray:
+        return ~np.isnan(self.price)
+
+    def slice_dates(self, start_date: Optional[date] = None, end_date: Optional[date] = None) -> "SnapshotPanel":
+        """Sub-panel for start_date <= d <= end_date (inclusive, same semantics as BacktestConfig)."""
+        if start_date is None and end_date is None:
+            return self
+        keep = [
+            i for i, d in enumerate(self.dates)
+            if (start_date is None or d >= start_date) and (end_date is None or d <= end_date)
+        ]
+        return SnapshotPanel(
+            dates=[self.dates[i] for i in keep],
+            symbols=list(self.symbols),
+            regimes=[self.regimes[i] for i in keep],
+            price=self.price[keep],
+            volume=self.volume[keep],
+            iv_rank=self.iv_rank[keep],
+        )
+
+
+def build_snapshot_panel(
+    dates: List[date],
+    snapshots: List[Dict[str, Dict[str, Any]]],
+    regimes: List[str],
+) -> SnapshotPanel:
+    """Pack per-date {symbol: {price, volume, iv_rank}} dicts into a panel (symbols sorted)."""
+    symbols = sorted({s for snap in snapshots for s in snap})
+    col = {s: j for j, s in enumerate(symbols)}
+    shape = (len(dates), len(symbols))
+    price = np.full(shape, np.nan)
+    volume = np.full(shape, np.nan)
+    iv_rank = np.full(shape, np.nan)
+    for i, snap in enumerate(snapshots):
+        for sym, row in snap.items():
+            j = col[sym]
+            price[i, j] = float(row.get("price") or 0)
+            volume[i, j] = float(row.get("volume") or 0)
+            iv_rank[i, j] = float(row.get("iv_rank") or 0)
+    return SnapshotPanel(
+        dates=list(dates),
+        symbols=symbols,
+        regimes=list(regimes),
+        price=price,
+        volume=volume,
+        iv_rank=iv_rank,
+    )
+
+
+def _csv_fingerprint(base_path: Path) -> str:
+    """Hash of (name, size, mtime) for every snapshot CSV; any edit invalidates the cache."""
+    h = hashlib.sha1(("v%d" % PANEL_CACHE_VERSION).encode())
+    for p in sorted(base_path.glob("*.csv")):
+        st = p.stat()
+        h.update(("%s:%d:%d;" % (p.name, st.st_size, st.st_mtime_ns)).encode())
+    return h.hexdigest()[:16]
+
+
+def _save_panel(panel: SnapshotPanel, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.stem + ".tmp.npz")
+    np.savez(
+        tmp,
+        dates=np.array([d.toordinal() for d in panel.dates], dtype=np.int64),
+        symbols=np.array(panel.symbols, dtype=str),
+        regimes=np.array(panel.regimes, dtype=str),
+        price=panel.price,
+        volume=panel.volume,
+        iv_rank=panel.iv_rank,
+    )
+    tmp.replace(path)
+
+
+def _load_panel(path: Path) -> SnapshotPanel:
+    with np.load(path, allow_pickle=False) as data:
+        return SnapshotPanel(
+            dates=[date.fromordinal(int(x)) for x in data["dates"]],
+            symbols=[str(s) for s in data["symbols"]],
+            regimes=[str(r) for r in data["regimes"]],
+            price=data["price"],
+            volume=data["volume"],
+            iv_rank=data["iv_rank"],
+        )
+
+
+def load_snapshot_panel(data_source: Any, cache_dir: Optional[Path] = None) -> SnapshotPanel:
+    """
+    Read every snapshot date once from a BacktestDataSource into a SnapshotPanel.
+
+    With cache_dir and a CSV-folder source (has base_path), the panel is stored as
+    snapshot_panel_<fingerprint>.npz and reused until any CSV changes.
+    """
+    cache_path: Optional[Path] = None
+    base_path = getattr(data_source, "base_path", None)
+    if cache_dir is not None and base_path is not None:
+        cache_path = Path(cache_dir) / ("snapshot_panel_%s.npz" % _csv_fingerprint(Path(base_path)))
+        if cache_path.exists():
+            try:
+                panel = _load_panel(cache_path)
+                logger.info("[BACKTEST] Panel cache hit %s (%d dates x %d symbols)", cache_path.name, *panel.shape)
+                return panel
+            except Exception as e:
+                logger.warning("[BACKTEST] Panel cache unreadable (%s); rebuilding: %s", cache_path, e)
+
+    dates = data_source.list_dates()
+    snapshots = [data_source.get_snapshot(d) for d in dates]
+    regimes = [data_source.get_regime(d) for d in dates]
+    panel = build_snapshot_panel(dates, snapshots, regimes)
+    logger.info("[BACKTEST] Loaded panel %d dates x %d symbols", *panel.shape)
+    if cache_path is not None:
+        try:
+            _save_panel(panel, cache_path)
+        except OSError as e:
+            logger.warning("[BACKTEST] Could not write panel cache %s: %s", cache_path, e)
+    return panel
+
+
+__all__ = [
+    "SnapshotPanel",
+    "build_snapshot_panel",
+    "load_snapshot_panel",
+]
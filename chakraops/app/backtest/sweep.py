@@ -0,0 +1,513 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""
+Phase 5 backtest: vectorized panel engine and parallel parameter sweeps.
+
+Same rules as BacktestEngine.run (RISK_ON dates only, _stock_eligible gates, the
+synthetic one-put chain through the CSP contract gates, hold to expiry, close at
+the end of range) but evaluated per date across all symbols at once on a
+SnapshotPanel. Optional CC leg (strategies includes "CC"): assigned puts become
+shares and covered calls are sold on them until called away (wheel).
+
+Assignment is labelled by moneyness at exit (exit price <= put strike); P&L per
+trade matches BacktestEngine (premium kept; CC adds strike - cost basis when
+called away). Sweeps fan configs out over a process pool; the panel is shipped
+once per worker.
+"""
+
+from __future__ import annotations
+
+import csv
+import itertools
+import json
+import logging
+import os
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field, replace
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.backtest.engine import (
+    BacktestReport,
+    Trade,
+    build_backtest_report,
+    default_backtest_output_dir,
+    write_backtest_report,
+    write_trades_csv,
+)
+from app.backtest.panel import SnapshotPanel
+from app.core.config.options_rules import (
+    CC_DELTA_MAX,
+    CC_DELTA_MIN,
+    CC_MAX_DTE,
+    CC_MIN_DTE,
+    CSP_DELTA_MAX,
+    CSP_DELTA_MIN,
+    CSP_MAX_DTE,
+    CSP_MIN_DTE,
+    MAX_SPREAD_PCT,
+    MIN_ROC,
+)
+from app.core.config.trade_rules import MAX_PRICE, MIN_PRICE
+
+logger = logging.getLogger(__name__)
+
+# Outcome codes in trade arrays
+_OTM, _ASSIGNED, _CALLED = 0, 1, 2
+_OUTCOME_NAMES = ("expired_otm", "assigned", "called_away")
+_CSP, _CC = 0, 1
+
+# Metric columns written to the combined sweep CSV (after the param columns)
+SWEEP_METRICS = (
+    "total_pnl", "total_trades", "wins", "losses", "win_rate", "roc_mean", "roc_std",
+    "max_drawdown", "assigned", "called_away", "avg_days_held", "elapsed_ms",
+)
+
+
+@dataclass(frozen=True)
+class PanelBacktestParams:
+    """One backtest configuration. Defaults reproduce BacktestEngine with the options layer."""
+
+    name: Optional[str] = None
+    strategies: Tuple[str, ...] = ("CSP",)
+    contracts: int = 1
+    # Stock gates (_stock_eligible)
+    min_price: float = MIN_PRICE
+    max_price: float = MAX_PRICE
+    min_volume: float = 1_000_000
+    min_iv_rank: float = 20.0
+    # Synthetic contract (SyntheticOptionsChainProvider)
+    dte_days: int = 35
+    contract_delta: float = 0.25
+    strike_pct: float = 0.98
+    premium_pct: float = 0.005
+    # CSP contract gates (select_csp_contract)
+    options_gate: bool = True
+    min_dte: int = CSP_MIN_DTE
+    max_dte: int = CSP_MAX_DTE
+    delta_min: float = CSP_DELTA_MIN
+    delta_max: float = CSP_DELTA_MAX
+    max_spread_pct: float = MAX_SPREAD_PCT
+    min_roc: float = MIN_ROC
+    # CC leg (wheel)
+    cc_strike_pct: float = 1.02
+    cc_min_dte: int = CC_MIN_DTE
+    cc_max_dte: int = CC_MAX_DTE
+    cc_delta_min: float = CC_DELTA_MIN
+    cc_delta_max: float = CC_DELTA_MAX
+
+    def label(self) -> str:
+        if self.name:
+            return self.name
+        return "dte%d_d%.2f-%.2f_p%g-%g" % (self.dte_days, self.delta_min, self.delta_max, self.min_price, self.max_price)
+
+
+def build_param_grid(base: Optional[PanelBacktestParams] = None, **axes: Sequence[Any]) -> List[PanelBacktestParams]:
+    """Cartesian product of field values over a base config, e.g. build_param_grid(dte_days=[28, 35])."""
+    base = base or PanelBacktestParams()
+    names = list(axes)
+    unknown = [n for n in names if n not in PanelBacktestParams.__dataclass_fields__]
+    if unknown:
+        raise ValueError("unknown backtest params: %s" % ", ".join(unknown))
+    return [replace(base, **dict(zip(names, combo))) for combo in itertools.product(*(axes[n] for n in names))]
+
+
+@dataclass
+class _TradeArrays:
+    symbol: np.ndarray
+    strategy: np.ndarray
+    entry_i: np.ndarray
+    exit_i: np.ndarray
+    strike: np.ndarray
+    premium: np.ndarray
+    roc: np.ndarray
+    outcome: np.ndarray
+    pnl: np.ndarray
+    px_entry: np.ndarray
+    px_exit: np.ndarray
+
+
+def _round2(x: np.ndarray) -> np.ndarray:
+    """round(x, 2) with Python semantics. np.round rounds the scaled value half-to-even, which
+    disagrees with round() on near-ties such as 0.505, so those few cells go through round()."""
+    scaled = np.asarray(x, dtype=np.float64) * 100.0
+    out = np.rint(scaled) / 100.0
+    ties = np.flatnonzero(np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6)
+    if ties.size:
+        flat_in, flat_out = np.ravel(x), out.reshape(-1)
+        for t in ties:
+            flat_out[t] = round(float(flat_in[t]), 2)
+    return out
+
+
+# Strike/premium surfaces depend only on (panel, strike_pct, premium_pct, options_gate); sweeps
+# usually vary gates, so recent surfaces are memoized per process.
+# Entries hold the price array itself so its id() cannot be recycled while memoized.
+_QUOTE_MEMO: Dict[Tuple[int, float, float, bool], Tuple[np.ndarray, Tuple[np.ndarray, ...]]] = {}
+_QUOTE_MEMO_MAX = 4
+
+
+def _csp_quotes(panel: SnapshotPanel, p: PanelBacktestParams) -> Tuple[np.ndarray, ...]:
+    key = (id(panel.price), p.strike_pct, p.premium_pct, p.options_gate)
+    hit = _QUOTE_MEMO.get(key)
+    if hit is not None and hit[0] is panel.price:
+        return hit[1]
+    price = np.nan_to_num(panel.price, nan=0.0)
+    if p.options_gate:
+        strike = _round2(price * p.strike_pct)
+        strike = np.where(strike < 1, _round2(price), strike)
+        quoted = np.maximum(0.01, _round2(strike * p.premium_pct))
+        bid, ask = quoted - 0.02, quoted + 0.02
+        mid = (bid + ask) / 2.0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            spread_pct = np.where(mid != 0, (ask - bid) / mid * 100.0, 999.0)
+            roc = np.where(strike > 0, mid / strike, 0.0)
+        out = (strike, mid, spread_pct, roc)
+    else:
+        strike = _round2(price * p.strike_pct)
+        out = (strike, np.maximum(0.01, strike * p.premium_pct))
+    if len(_QUOTE_MEMO) >= _QUOTE_MEMO_MAX:
+        _QUOTE_MEMO.pop(next(iter(_QUOTE_MEMO)))
+    _QUOTE_MEMO[key] = (panel.price, out)
+    return out
+
+
+def _csp_contract(panel: SnapshotPanel, p: PanelBacktestParams) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(eligible, strike, premium) per (date, symbol) for the synthetic put, as the row-wise path computes it."""
+    quotes = _csp_quotes(panel, p)
+    if not p.options_gate:
+        strike, mid = quotes
+        return np.ones(strike.shape, dtype=bool), strike, mid
+    strike, mid, spread_pct, roc = quotes
+    gate_scalar = (
+        p.min_dte <= p.dte_days <= p.max_dte
+        and -p.delta_max <= -p.contract_delta <= -p.delta_min
+    )
+    if not gate_scalar:
+        return np.zeros(strike.shape, dtype=bool), strike, mid
+    ok = (mid > 0) & (spread_pct <= p.max_spread_pct) & (strike > 0) & (roc >= p.min_roc)
+    return ok, strike, mid
+
+
+def _cc_contract(panel: SnapshotPanel, p: PanelBacktestParams) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(eligible, strike, premium) for the synthetic covered call; ROC is premium / underlying price."""
+    price = np.nan_to_num(panel.price, nan=0.0)
+    strike = _round2(price * p.cc_strike_pct)
+    quoted = np.maximum(0.01, _round2(strike * p.premium_pct))
+    bid, ask = quoted - 0.02, quoted + 0.02
+    mid = (bid + ask) / 2.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        spread_pct = np.where(mid != 0, (ask - bid) / mid * 100.0, 999.0)
+        roc = np.where(price > 0, mid / price, 0.0)
+    gate_scalar = (
+        p.cc_min_dte <= p.dte_days <= p.cc_max_dte
+        and p.cc_delta_min <= p.contract_delta <= p.cc_delta_max
+    )
+    ok = (price > 0) & (mid > 0) & (spread_pct <= p.max_spread_pct) & (roc >= p.min_roc) & gate_scalar
+    return ok, strike, mid
+
+
+def _simulate(panel: SnapshotPanel, p: PanelBacktestParams) -> _TradeArrays:
+    n_dates, n_sym = panel.shape
+    strategies = {s.upper() for s in (p.strategies or ("CSP",))}
+    do_csp = "CSP" in strategies
+    do_cc = "CC" in strategies and do_csp
+    mult = max(1, int(p.contracts)) * 100.0
+
+    price = panel.price
+    px0 = np.nan_to_num(price, nan=0.0)
+    with np.errstate(invalid="ignore"):
+        stock_ok = (
+            panel.present
+            & (px0 > 0)
+            & (px0 >= p.min_price)
+            & (px0 <= p.max_price)
+            & (np.nan_to_num(panel.volume) >= p.min_volume)
+            & (np.nan_to_num(panel.iv_rank) >= p.min_iv_rank)
+        )
+    csp_ok, csp_strike, csp_mid = _csp_contract(panel, p)
+    csp_ok = csp_ok & stock_ok
+    if do_cc:
+        cc_ok, cc_strike, cc_mid = _cc_contract(panel, p)
+        cc_ok = cc_ok & panel.present
+
+    # Only RISK_ON dates are processed; a position exits on the first processed date >= expiry
+    active = np.array([i for i, r in enumerate(panel.regimes) if r == "RISK_ON"], dtype=np.int64)
+    ordinals = np.array([d.toordinal() for d in panel.dates], dtype=np.int64)
+    exit_k = np.searchsorted(ordinals[active], ordinals[active] + p.dte_days, side="left")
+
+    is_open = np.zeros(n_sym, dtype=bool)
+    kind = np.zeros(n_sym, dtype=np.int8)
+    o_strike = np.zeros(n_sym)
+    o_prem = np.zeros(n_sym)
+    o_roc = np.zeros(n_sym)
+    o_entry = np.zeros(n_sym, dtype=np.int64)
+    o_exit_k = np.zeros(n_sym, dtype=np.int64)
+    o_px = np.zeros(n_sym)
+    shares = np.zeros(n_sym, dtype=bool)
+    basis = np.zeros(n_sym)
+    chunks: List[Tuple[np.ndarray, ...]] = []
+
+    def _close(idx: np.ndarray, i: int) -> None:
+        px = px0[i, idx]
+        is_cc = kind[idx] == _CC
+        strike = o_strike[idx]
+        assigned = ~is_cc & (px > 0) & (px <= strike)
+        called = is_cc & (px > 0) & (px >= strike)
+        pnl = o_prem[idx] * mult + np.where(called, (strike - basis[idx]) * mult, 0.0)
+        outcome = np.where(assigned, _ASSIGNED, np.where(called, _CALLED, _OTM)).astype(np.int8)
+        chunks.append((
+            idx, kind[idx].copy(), o_entry[idx].copy(), np.full(idx.size, i, dtype=np.int64),
+            strike.copy(), o_prem[idx].copy(), o_roc[idx].copy(), outcome, pnl, o_px[idx].copy(), px,
+        ))
+        is_open[idx] = False
+        if do_cc:
+            shares[idx[assigned]] = True
+            basis[idx[assigned]] = strike[assigned]
+            shares[idx[called]] = False
+
+    for k, i in enumerate(active):
+        closing = np.flatnonzero(is_open & (o_exit_k <= k))
+        if closing.size:
+            _close(closing, int(i))
+        if do_csp:
+            new = np.flatnonzero(~is_open & ~shares & csp_ok[i])
+            if new.size:
+                is_open[new] = True
+                kind[new] = _CSP
+                o_strike[new] = csp_strike[i, new]
+                o_prem[new] = csp_mid[i, new]
+                o_roc[new] = csp_mid[i, new] / csp_strike[i, new]
+                o_entry[new] = i
+                o_exit_k[new] = exit_k[k]
+                o_px[new] = px0[i, new]
+        if do_cc:
+            new = np.flatnonzero(~is_open & shares & cc_ok[i])
+            if new.size:
+                is_open[new] = True
+                kind[new] = _CC
+                o_strike[new] = cc_strike[i, new]
+                o_prem[new] = cc_mid[i, new]
+                o_roc[new] = cc_mid[i, new] / px0[i, new]
+                o_entry[new] = i
+                o_exit_k[new] = exit_k[k]
+                o_px[new] = px0[i, new]
+
+    if n_dates and is_open.any():
+        _close(np.flatnonzero(is_open), n_dates - 1)
+
+    if not chunks:
+        empty_i = np.zeros(0, dtype=np.int64)
+        empty_f = np.zeros(0)
+        return _TradeArrays(empty_i, empty_i.astype(np.int8), empty_i, empty_i, empty_f, empty_f, empty_f,
+                            empty_i.astype(np.int8), empty_f, empty_f, empty_f)
+    cols = [np.concatenate(c) for c in zip(*chunks)]
+    return _TradeArrays(*cols)
+
+
+def _array_metrics(tr: _TradeArrays) -> Dict[str, Any]:
+    """Same metrics as build_backtest_report, computed on trade arrays (exit-date order)."""
+    n = int(tr.pnl.size)
+    wins = int(np.sum(tr.pnl > 0))
+    cum = np.cumsum(tr.pnl)
+    peak = np.maximum.accumulate(np.concatenate(([0.0], cum)))[1:]
+    max_dd = float(np.max(peak - cum)) if n else 0.0
+    return {
+        "total_pnl": float(tr.pnl.sum()),
+        "total_trades": n,
+        "wins": wins,
+        "losses": n - wins,
+        "win_rate": (wins / n) if n else 0.0,
+        "roc_mean": float(tr.roc.mean()) if n else None,
+        "roc_std": float(np.std(tr.roc, ddof=1)) if n > 1 else None,
+        "max_drawdown": max(0.0, max_dd),
+        "assigned": int(np.sum(tr.outcome == _ASSIGNED)),
+        "called_away": int(np.sum(tr.outcome == _CALLED)),
+        "avg_days_held": None,
+    }
+
+
+def run_panel_backtest(
+    panel: SnapshotPanel,
+    params: Optional[PanelBacktestParams] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    output_dir: Optional[Path] = None,
+) -> BacktestReport:
+    """Single vectorized run with full trade list; writes report + trades CSV like BacktestEngine when output_dir is set."""
+    p = params or PanelBacktestParams()
+    run_id = str(uuid.uuid4())[:8]
+    panel = panel.slice_dates(start_date, end_date)
+    config_summary: Dict[str, Any] = {"mode": "panel", "params": asdict(p)}
+    if not panel.dates:
+        config_summary["reason"] = "no_dates_in_range"
+        return build_backtest_report(run_id, [], config_summary)
+    tr = _simulate(panel, p)
+    trades: List[Trade] = []
+    for j in range(tr.pnl.size):
+        entry_d = panel.dates[int(tr.entry_i[j])]
+        exit_d = panel.dates[int(tr.exit_i[j])]
+        trades.append(Trade(
+            strategy="CC" if tr.strategy[j] == _CC else "CSP",
+            symbol=panel.symbols[int(tr.symbol[j])],
+            entry_date=entry_d,
+            exit_date=exit_d,
+            entry_premium=float(tr.premium[j]),
+            exit_premium_or_assignment=0.0,
+            strike=float(tr.strike[j]),
+            expiry=date.fromordinal(entry_d.toordinal() + p.dte_days),
+            contracts=max(1, int(p.contracts)),
+            outcome=_OUTCOME_NAMES[int(tr.outcome[j])],
+            regime=panel.regimes[int(tr.exit_i[j])],
+            roc=float(tr.roc[j]),
+            pnl=float(tr.pnl[j]),
+            underlying_at_entry=float(tr.px_entry[j]),
+            underlying_at_exit=float(tr.px_exit[j]),
+            days_held=(exit_d - entry_d).days,
+        ))
+    report = build_backtest_report(run_id, trades, config_summary)
+    if output_dir is not None:
+        out_dir = Path(output_dir) / run_id
+        out_dir.mkdir(parents=True, exist_ok=True)
+        write_backtest_report(report, out_dir)
+        write_trades_csv(report.trades, out_dir)
+    return report
+
+
+# ---------- Parallel sweeps ----------
+
+_WORKER_PANEL: Optional[SnapshotPanel] = None
+
+
+def _init_worker(panel: SnapshotPanel) -> None:
+    global _WORKER_PANEL
+    _WORKER_PANEL = panel
+
+
+def _run_one(params: PanelBacktestParams, panel: Optional[SnapshotPanel] = None) -> Dict[str, Any]:
+    panel = panel if panel is not None else _WORKER_PANEL
+    if panel is None:
+        raise RuntimeError("sweep worker not initialized: no panel passed and _init_worker was not run")
+    started = time.perf_counter()
+    tr = _simulate(panel, params)
+    metrics = _array_metrics(tr)
+    if tr.pnl.size:
+        ordinals = np.array([d.toordinal() for d in panel.dates], dtype=np.int64)
+        metrics["avg_days_held"] = float(np.mean(ordinals[tr.exit_i] - ordinals[tr.entry_i]))
+    metrics["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 2)
+    return {"label": params.label(), "params": asdict(params), **metrics}
+
+
+@dataclass
+class SweepReport:
+    """Combined sweep output: one metrics row per config, in input order."""
+
+    run_id: str
+    results: List[Dict[str, Any]]
+    panel_shape: Tuple[int, int]
+    workers: int
+    elapsed_ms: float
+    output_dir: Optional[Path] = None
+    warnings: List[str] = field(default_factory=list)
+
+    def best(self, metric: str = "total_pnl") -> Optional[Dict[str, Any]]:
+        rows = [r for r in self.results if r.get(metric) is not None]
+        return max(rows, key=lambda r: r[metric]) if rows else None
+
+
+def run_parameter_sweep(
+    panel: SnapshotPanel,
+    configs: Iterable[PanelBacktestParams],
+    max_workers: Optional[int] = None,
+    output_dir: Optional[Path] = None,
+    write_report: bool = True,
+) -> SweepReport:
+    """
+    Evaluate every config on the same panel, in parallel across processes.
+
+    max_workers None = min(cpu, configs); <= 1 runs inline. Results keep input order.
+    Writes sweep_report.json and sweep_results.csv under <output_dir>/sweep_<run_id>/.
+    """
+    configs = list(configs)
+    run_id = str(uuid.uuid4())[:8]
+    started = time.perf_counter()
+    warnings: List[str] = []
+    workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+    workers = max(1, min(int(workers), len(configs) or 1))
+
+    results: Optional[List[Dict[str, Any]]] = None
+    if workers > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(panel,)) as pool:
+                results = list(pool.map(_run_one, configs))
+        except (OSError, RuntimeError) as e:
+            logger.warning("[BACKTEST] Process pool unavailable (%s); running sweep inline", e)
+            warnings.append("process pool unavailable; ran inline")
+            workers = 1
+    if results is None:
+        results = [_run_one(c, panel) for c in configs]
+
+    elapsed_ms = round((time.perf_counter() - started) * 1000, 2)
+    logger.info("[BACKTEST] Sweep %s: %d configs on %dx%d panel, %d workers, %.0f ms",
+                run_id, len(configs), panel.shape[0], panel.shape[1], workers, elapsed_ms)
+    report = SweepReport(
+        run_id=run_id,
+        results=results,
+        panel_shape=tuple(panel.shape),
+        workers=workers,
+        elapsed_ms=elapsed_ms,
+        warnings=warnings,
+    )
+    if write_report:
+        base = Path(output_dir) if output_dir else default_backtest_output_dir()
+        report.output_dir = base / ("sweep_%s" % run_id)
+        _write_sweep(report, panel)
+    return report
+
+
+def _write_sweep(report: SweepReport, panel: SnapshotPanel) -> None:
+    out_dir = report.output_dir
+    if out_dir is None:
+        raise ValueError("sweep report %s has no output_dir" % report.run_id)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    best = report.best()
+    with open(out_dir / "sweep_report.json", "w", encoding="utf-8") as f:
+        json.dump({
+            "run_id": report.run_id,
+            "panel": {
+                "dates": report.panel_shape[0],
+                "symbols": report.panel_shape[1],
+                "start_date": panel.dates[0].isoformat() if panel.dates else None,
+                "end_date": panel.dates[-1].isoformat() if panel.dates else None,
+            },
+            "workers": report.workers,
+            "elapsed_ms": report.elapsed_ms,
+            "best_by_total_pnl": best["label"] if best else None,
+            "results": report.results,
+            "warnings": report.warnings,
+        }, f, indent=2, default=str)
+    param_cols = list(PanelBacktestParams.__dataclass_fields__)
+    with open(out_dir / "sweep_results.csv", "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(["label", *param_cols, *SWEEP_METRICS])
+        for r in report.results:
+            prm = r["params"]
+            w.writerow([
+                r["label"],
+                *(";".join(prm[c]) if isinstance(prm[c], (list, tuple)) else prm[c] for c in param_cols),
+                *(r.get(m) for m in SWEEP_METRICS),
+            ])
+
+
+__all__ = [
+    "PanelBacktestParams",
+    "SweepReport",
+    "build_param_grid",
+    "run_panel_backtest",
+    "run_parameter_sweep",
+]
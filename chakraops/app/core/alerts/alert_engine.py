@@ -16,6 +16,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from app.core.alerts.models import Alert, AlertType, Severity
+from app.core.config.registry import get_config, register_config
 
 logger = logging.getLogger(__name__)
 
@@ -43,41 +44,53 @@ def _alerts_log_path() -> Path:
     return _ensure_alerts_dir() / "alerts_log.jsonl"
 
 
+def _default_alerts_config() -> Dict[str, Any]:
+    return {
+        "enabled_alert_types": ["DATA_HEALTH", "REGIME_CHANGE", "SIGNAL", "SYSTEM"],
+        "cooldown_hours": 6,
+        "lifecycle_cooldown_hours": 4,
+        "portfolio_alert_cooldown_hours": 12,
+        "slack": {},
+    }
+
+
+def _normalize_alerts_config(data: Any) -> Dict[str, Any]:
+    data = data or {}
+    enabled = data.get("enabled_alert_types")
+    if not isinstance(enabled, list):
+        enabled = ["DATA_HEALTH", "REGIME_CHANGE", "SIGNAL", "SYSTEM"]
+    slack = data.get("slack") or {}
+    if not isinstance(slack.get("channels"), dict):
+        slack = {**slack, "channels": {}}
+    return {
+        "enabled_alert_types": [str(x) for x in enabled],
+        "cooldown_hours": int(data.get("cooldown_hours", 6)),
+        "lifecycle_cooldown_hours": int(data.get("lifecycle_cooldown_hours", 4)),
+        "portfolio_alert_cooldown_hours": int(data.get("portfolio_alert_cooldown_hours", 12)),
+        "slack": slack,
+    }
+
+
+def _alerts_config_fallback(exc: Exception) -> Dict[str, Any]:
+    return {
+        "enabled_alert_types": ["DATA_HEALTH", "REGIME_CHANGE", "SIGNAL", "SYSTEM"],
+        "cooldown_hours": 6,
+        "lifecycle_cooldown_hours": 4,
+        "slack": {},
+    }
+
+
+register_config(
+    "alerts",
+    validate=_normalize_alerts_config,
+    missing=_default_alerts_config,
+    fallback=_alerts_config_fallback,
+)
+
+
 def _load_alerts_config() -> Dict[str, Any]:
-    path = _repo_root() / "config" / "alerts.yaml"
-    if not path.exists():
-        return {
-            "enabled_alert_types": ["DATA_HEALTH", "REGIME_CHANGE", "SIGNAL", "SYSTEM"],
-            "cooldown_hours": 6,
-            "lifecycle_cooldown_hours": 4,
-            "portfolio_alert_cooldown_hours": 12,
-            "slack": {},
-        }
-    try:
-        import yaml
-        with open(path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
-        enabled = data.get("enabled_alert_types")
-        if not isinstance(enabled, list):
-            enabled = ["DATA_HEALTH", "REGIME_CHANGE", "SIGNAL", "SYSTEM"]
-        slack = data.get("slack") or {}
-        if not isinstance(slack.get("channels"), dict):
-            slack = {**slack, "channels": {}}
-        return {
-            "enabled_alert_types": [str(x) for x in enabled],
-            "cooldown_hours": int(data.get("cooldown_hours", 6)),
-            "lifecycle_cooldown_hours": int(data.get("lifecycle_cooldown_hours", 4)),
-            "portfolio_alert_cooldown_hours": int(data.get("portfolio_alert_cooldown_hours", 12)),
-            "slack": slack,
-        }
-    except Exception as e:
-        logger.warning("[ALERTS] Failed to load config %s: %s", path, e)
-        return {
-            "enabled_alert_types": ["DATA_HEALTH", "REGIME_CHANGE", "SIGNAL", "SYSTEM"],
-            "cooldown_hours": 6,
-            "lifecycle_cooldown_hours": 4,
-            "slack": {},
-        }
+    """config/alerts.yaml via the config registry (parsed once per file version). Returns a private copy."""
+    return get_config("alerts", _repo_root() / "config" / "alerts.yaml").mutable()
 
 
 def get_previous_completed_run(current_run_id: str):  # -> Optional[EvaluationRunFull]
@@ -123,33 +136,22 @@ def _lifecycle_fingerprint(position_id: str, action_type: str) -> str:
 
 def _build_symbol_explain_from_run(run: Any, symbol: str) -> Dict[str, Any]:
     """Build minimal symbol_explain dict from evaluation run for lifecycle."""
+    from app.core.eval.symbol_index import symbol_row
     sym_upper = (symbol or "").strip().upper()
-    for s in (getattr(run, "symbols", None) or []):
-        if isinstance(s, dict) and (s.get("symbol") or "").strip().upper() == sym_upper:
-            return {
-                "symbol": sym_upper,
-                "verdict": s.get("verdict", "UNKNOWN"),
-                "primary_reason": s.get("primary_reason", ""),
-            }
+    s = symbol_row(run, sym_upper)
+    if isinstance(s, dict):
+        return {
+            "symbol": sym_upper,
+            "verdict": s.get("verdict", "UNKNOWN"),
+            "primary_reason": s.get("primary_reason", ""),
+        }
     return {"symbol": sym_upper, "verdict": "UNKNOWN", "primary_reason": ""}
 
 
-def build_lifecycle_alerts_for_run(run: Any, config: Dict[str, Any]) -> List[Alert]:
-    """Phase 2C: Build lifecycle alerts from OPEN/PARTIAL_EXIT positions."""
-    from app.core.positions.store import list_positions
-    from app.core.symbols.targets import get_targets
-    from app.core.lifecycle.engine import evaluate_position_lifecycle
+def _lifecycle_event_alert(ev: Any, eval_run_id: str, now: str) -> Optional[Alert]:
+    """Phase 2C: Alert for one LifecycleEvent (None for actions that do not alert)."""
     from app.core.lifecycle.models import LifecycleAction
 
-    alerts: List[Alert] = []
-    now = datetime.now(timezone.utc).isoformat()
-    run_id = getattr(run, "run_id", "")
-
-    positions = list_positions(status=None)
-    open_positions = [p for p in positions if (p.status or "").strip() in ("OPEN", "PARTIAL_EXIT")]
-    if not open_positions:
-        return alerts
-
     action_to_alert_type = {
         LifecycleAction.SCALE_OUT: AlertType.POSITION_SCALE_OUT,
         LifecycleAction.EXIT: AlertType.POSITION_EXIT,
@@ -162,41 +164,61 @@ def build_lifecycle_alerts_for_run(run: Any, config: Dict[str, Any]) -> List[Ale
         LifecycleAction.ABORT: Severity.CRITICAL,
         LifecycleAction.HOLD: Severity.WARN,
     }
+    at = action_to_alert_type.get(ev.action)
+    if at is None:
+        return None
     # STOP_LOSS override
+    severity = action_to_severity.get(ev.action, Severity.WARN)
+    if ev.reason and ev.reason.value == "STOP_LOSS":
+        severity = Severity.CRITICAL
+    fp = _lifecycle_fingerprint(ev.position_id, ev.action.value)
+    meta = dict(ev.meta or {})
+    meta["lifecycle_format"] = "directive"
+    meta["position_id"] = ev.position_id
+    meta["lifecycle_state"] = ev.lifecycle_state.value
+    meta["eval_run_id"] = eval_run_id
+    if ev.action.value == "EXIT" and ev.reason and ev.reason.value == "STOP_LOSS":
+        meta["reason_detail"] = "Price breached stop"
+    elif ev.action.value == "EXIT":
+        meta["reason_detail"] = "Target 2 hit"
+    return Alert(
+        alert_type=at,
+        severity=severity,
+        reason_code=ev.reason.value if ev.reason else ev.action.value,
+        summary=ev.directive,
+        action_hint=ev.directive,
+        fingerprint=fp,
+        created_at=now,
+        stage=None,
+        symbol=ev.symbol,
+        meta=meta,
+    )
+
+
+def build_lifecycle_alerts_for_run(run: Any, config: Dict[str, Any]) -> List[Alert]:
+    """Phase 2C: Build lifecycle alerts from OPEN/PARTIAL_EXIT positions."""
+    from app.core.positions.store import list_positions
+    from app.core.symbols.targets import get_targets
+    from app.core.lifecycle.engine import evaluate_position_lifecycle
+
+    alerts: List[Alert] = []
+    now = datetime.now(timezone.utc).isoformat()
+    run_id = getattr(run, "run_id", "")
+
+    positions = list_positions(status=None)
+    open_positions = [p for p in positions if (p.status or "").strip() in ("OPEN", "PARTIAL_EXIT")]
+    if not open_positions:
+        return alerts
+
     for pos in open_positions:
         sym = (pos.symbol or "").strip().upper()
         symbol_explain = _build_symbol_explain_from_run(run, sym)
         symbol_targets = get_targets(sym)
         events = evaluate_position_lifecycle(pos, symbol_explain, symbol_targets, run, eval_run_id=run_id)
         for ev in events:
-            at = action_to_alert_type.get(ev.action)
-            if at is None:
-                continue
-            severity = action_to_severity.get(ev.action, Severity.WARN)
-            if ev.reason and ev.reason.value == "STOP_LOSS":
-                severity = Severity.CRITICAL
-            fp = _lifecycle_fingerprint(pos.position_id, ev.action.value)
-            meta = dict(ev.meta or {})
-            meta["lifecycle_format"] = "directive"
-            meta["position_id"] = pos.position_id
-            meta["lifecycle_state"] = ev.lifecycle_state.value
-            meta["eval_run_id"] = run_id
-            if ev.action.value == "EXIT" and ev.reason and ev.reason.value == "STOP_LOSS":
-                meta["reason_detail"] = "Price breached stop"
-            elif ev.action.value == "EXIT":
-                meta["reason_detail"] = "Target 2 hit"
-            alerts.append(Alert(
-                alert_type=at,
-                severity=severity,
-                reason_code=ev.reason.value if ev.reason else ev.action.value,
-                summary=ev.directive,
-                action_hint=ev.directive,
-                fingerprint=fp,
-                created_at=now,
-                stage=None,
-                symbol=sym,
-                meta=meta,
-            ))
+            alert = _lifecycle_event_alert(ev, run_id, now)
+            if alert is not None:
+                alerts.append(alert)
     return alerts
 
 
@@ -388,54 +410,25 @@ def _append_lifecycle_log_if_lifecycle(alert: Alert, sent: bool) -> None:
         logger.warning("[ALERTS] Failed to append lifecycle log: %s", e)
 
 
-def process_run_completed(run: Any) -> None:
+_LIFECYCLE_ALERT_TYPES = {"POSITION_ENTRY", "POSITION_SCALE_OUT", "POSITION_EXIT", "POSITION_ABORT", "POSITION_HOLD"}
+_PORTFOLIO_ALERT_TYPES = {"PORTFOLIO_RISK_WARN", "PORTFOLIO_RISK_BLOCK"}
+
+
+def _dispatch_alerts(
+    candidates: List[Alert],
+    config: Dict[str, Any],
+    notifier: Any,
+    recent_fps: set,
+    recent_lifecycle_fps: set,
+    recent_portfolio_fps: set,
+) -> Dict[str, int]:
     """
-    Called after a run is saved and (if COMPLETED) latest pointer updated.
-    Builds alerts (evaluation + lifecycle), dedupes by fingerprint cooldown,
-    sends via Slack (if configured), persists to out/alerts/ and out/lifecycle/.
-    No alerts during RUNNING; no per-symbol spam.
+    Enabled check, fingerprint cooldown, Slack send and out/alerts + out/lifecycle persistence
+    for each candidate. Returns sent count per Slack channel.
     """
-    if getattr(run, "status", None) == "RUNNING":
-        return
-    config = _load_alerts_config()
     enabled = set(config.get("enabled_alert_types") or [])
-    cooldown_hours = max(0, config.get("cooldown_hours", 6))
-    cooldown_seconds = cooldown_hours * 3600
-    lifecycle_cooldown_hours = max(0, config.get("lifecycle_cooldown_hours", 4))
-    lifecycle_cooldown_seconds = lifecycle_cooldown_hours * 3600
-    portfolio_cooldown_hours = max(0, config.get("portfolio_alert_cooldown_hours", 12))
-    portfolio_cooldown_seconds = portfolio_cooldown_hours * 3600
-
-    previous_run = get_previous_completed_run(run.run_id) if getattr(run, "run_id", None) else None
-    candidates = build_alerts_for_run(run, previous_run, config)
-    recent_fps = _get_recent_sent_fingerprints(cooldown_seconds)
-    recent_lifecycle_fps = _get_recent_sent_fingerprints(lifecycle_cooldown_seconds)
-    recent_portfolio_fps = _get_recent_sent_fingerprints(portfolio_cooldown_seconds)
-
-    # Phase 2C: Lifecycle alerts for OPEN/PARTIAL_EXIT positions
-    lifecycle_alerts = build_lifecycle_alerts_for_run(run, config)
-    candidates = candidates + lifecycle_alerts
-
-    # Phase 3: Portfolio risk alerts
-    try:
-        from app.core.portfolio.service import compute_portfolio_summary
-        from app.core.accounts.store import list_accounts
-        from app.core.positions.store import list_positions
-        from app.core.alerts.portfolio_alerts import build_portfolio_alerts_for_run
-
-        accounts = list_accounts()
-        positions = list_positions()
-        summary = compute_portfolio_summary(accounts, positions)
-        portfolio_alerts = build_portfolio_alerts_for_run(summary, summary.risk_flags, config)
-        candidates = candidates + portfolio_alerts
-    except Exception as e:
-        logger.debug("[ALERTS] Portfolio alerts skipped: %s", e)
-
-    from app.core.alerts.slack_notifier import SlackNotifier
-    notifier = SlackNotifier(config)
-
-    lifecycle_types = {"POSITION_ENTRY", "POSITION_SCALE_OUT", "POSITION_EXIT", "POSITION_ABORT", "POSITION_HOLD"}
-    portfolio_types = {"PORTFOLIO_RISK_WARN", "PORTFOLIO_RISK_BLOCK"}
+    lifecycle_types = _LIFECYCLE_ALERT_TYPES
+    portfolio_types = _PORTFOLIO_ALERT_TYPES
 
     sent_by_channel: Dict[str, int] = {}
 
@@ -497,6 +490,59 @@ def process_run_completed(run: Any) -> None:
             "sent_at": datetime.now(timezone.utc).isoformat() if sent else None,
             "suppressed_reason": None if sent else "slack_not_configured",
         })
+    return sent_by_channel
+
+
+def process_run_completed(run: Any) -> None:
+    """
+    Called after a run is saved and (if COMPLETED) latest pointer updated.
+    Builds alerts (evaluation + lifecycle), dedupes by fingerprint cooldown,
+    sends via Slack (if configured), persists to out/alerts/ and out/lifecycle/.
+    No alerts during RUNNING; no per-symbol spam.
+    """
+    if getattr(run, "status", None) == "RUNNING":
+        return
+    config = _load_alerts_config()
+    cooldown_hours = max(0, config.get("cooldown_hours", 6))
+    cooldown_seconds = cooldown_hours * 3600
+    lifecycle_cooldown_hours = max(0, config.get("lifecycle_cooldown_hours", 4))
+    lifecycle_cooldown_seconds = lifecycle_cooldown_hours * 3600
+    portfolio_cooldown_hours = max(0, config.get("portfolio_alert_cooldown_hours", 12))
+    portfolio_cooldown_seconds = portfolio_cooldown_hours * 3600
+
+    previous_run = get_previous_completed_run(run.run_id) if getattr(run, "run_id", None) else None
+    candidates = build_alerts_for_run(run, previous_run, config)
+    recent_fps = _get_recent_sent_fingerprints(cooldown_seconds)
+    recent_lifecycle_fps = _get_recent_sent_fingerprints(lifecycle_cooldown_seconds)
+    recent_portfolio_fps = _get_recent_sent_fingerprints(portfolio_cooldown_seconds)
+
+    # Phase 2C: Lifecycle alerts for OPEN/PARTIAL_EXIT positions
+    lifecycle_alerts = build_lifecycle_alerts_for_run(run, config)
+    candidates = candidates + lifecycle_alerts
+
+    # Phase 3: Portfolio risk alerts
+    try:
+        from app.core.portfolio.service import compute_portfolio_summary
+        from app.core.accounts.store import list_accounts
+        from app.core.positions.store import list_positions
+        from app.core.alerts.portfolio_alerts import build_portfolio_alerts_for_run
+
+        accounts = list_accounts()
+        positions = list_positions()
+        summary = compute_portfolio_summary(accounts, positions)
+        portfolio_alerts = build_portfolio_alerts_for_run(summary, summary.risk_flags, config)
+        candidates = candidates + portfolio_alerts
+    except Exception as e:
+        logger.debug("[ALERTS] Portfolio alerts skipped: %s", e)
+
+    from app.core.alerts.slack_notifier import SlackNotifier
+    notifier = SlackNotifier(config)
+    sent_by_channel = _dispatch_alerts(
+        candidates, config, notifier,
+        recent_fps=recent_fps,
+        recent_lifecycle_fps=recent_lifecycle_fps,
+        recent_portfolio_fps=recent_portfolio_fps,
+    )
 
     # R21.5.2: One EVAL_SUMMARY to daily channel after every completed run (throttle for scheduler)
     try:
@@ -518,6 +564,31 @@ def process_run_completed(run: Any) -> None:
         logger.warning("[ALERTS] Eval summary send failed (non-fatal): %s", e)
 
 
+def process_lifecycle_trigger_events(events: List[Any], config: Optional[Dict[str, Any]] = None) -> Dict[str, int]:
+    """
+    Route quote-driven lifecycle events (app.core.lifecycle.trigger_index) through the
+    same lifecycle alert path as evaluation runs: enabled types, lifecycle cooldown (shared
+    fingerprints, so a trigger and the next run do not both alert), Slack, out/alerts, out/lifecycle.
+    Returns sent count per Slack channel.
+    """
+    if not events:
+        return {}
+    config = config if config is not None else _load_alerts_config()
+    now = datetime.now(timezone.utc).isoformat()
+    candidates = [a for a in (_lifecycle_event_alert(ev, ev.eval_run_id or "", now) for ev in events) if a is not None]
+    if not candidates:
+        return {}
+    lifecycle_cooldown_seconds = max(0, config.get("lifecycle_cooldown_hours", 4)) * 3600
+
+    from app.core.alerts.slack_notifier import SlackNotifier
+    return _dispatch_alerts(
+        candidates, config, SlackNotifier(config),
+        recent_fps=set(),
+        recent_lifecycle_fps=_get_recent_sent_fingerprints(lifecycle_cooldown_seconds),
+        recent_portfolio_fps=set(),
+    )
+
+
 def list_recent_alert_records(limit: int = 100) -> List[Dict[str, Any]]:
     """Return most recent alert log records (for API/UI). Newest first."""
     path = _alerts_log_path()
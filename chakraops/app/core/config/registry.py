@@ -0,0 +1,298 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""
+Config registry — hot-reloadable, immutable snapshots of YAML/JSON config files.
+
+Owners register a config *kind* once (parser + validator + fallback) and read it with
+get_config(name, path). The file is parsed and validated once per file version; later
+reads cost one stat() and return the same ConfigSnapshot:
+
+    ConfigSnapshot(name, path, generation, data, exists, error, loaded_at, load_ms)
+
+``data`` is a read-only view (dicts -> MappingProxyType, lists -> tuples); use
+``snapshot.mutable()`` for a private deep copy. ``generation`` increases only when the
+parsed content changes, so consumers can cheaply detect a reload.
+
+Invalidation is stat polling: (mtime_ns, size, inode) is compared on every read, and
+refresh_all() re-checks every loaded file (for a scheduler tick). Like git's racy-clean
+check, a file whose mtime was within _RACY_NS of the load is re-parsed on the next read,
+so same-size rewrites inside one filesystem timestamp tick are never missed. In-process
+writers call invalidate() after saving.
+
+pinned_configs() pins the first snapshot of each config read in the current context, so
+one evaluation run sees consistent config even if a file changes mid-run.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import copy
+import json
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Timestamps within this window of the load time may share a coarse mtime with a later write
+_RACY_NS = 50_000_000
+
+_FileSig = Optional[Tuple[int, int, int]]
+_Key = Tuple[str, str]
+
+
+def freeze(value: Any) -> Any:
+    """Read-only deep view: dict -> MappingProxyType, list/tuple -> tuple."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Mutable deep copy of a frozen view: mappings -> dict, tuples -> list."""
+    if isinstance(value, Mapping):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(v) for v in value]
+    return copy.deepcopy(value)
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """One parsed, validated version of a config file."""
+
+    name: str
+    path: str
+    generation: int
+    data: Any
+    exists: bool
+    error: Optional[str] = None
+    loaded_at: str = ""
+    load_ms: float = 0.0
+
+    def mutable(self) -> Any:
+        return thaw(self.data)
+
+
+@dataclass
+class _Kind:
+    name: str
+    parse: Optional[Callable[[Path], Any]]
+    validate: Optional[Callable[[Any], Any]]
+    missing: Callable[[], Any]
+    fallback: Optional[Callable[[Exception], Any]]
+
+
+@dataclass
+class _Entry:
+    snapshot: ConfigSnapshot
+    sig: _FileSig
+    racy: bool
+    stats: Dict[str, Any] = field(default_factory=lambda: {"loads": 0, "hits": 0, "reloads": 0, "errors": 0})
+
+
+_lock = threading.RLock()
+_kinds: Dict[str, _Kind] = {}
+_entries: Dict[_Key, _Entry] = {}
+_generation = 0
+_PINNED: ContextVar[Optional[Dict[_Key, ConfigSnapshot]]] = ContextVar("chakraops_pinned_configs", default=None)
+
+
+def _file_sig(path: Path) -> Tuple[_FileSig, Optional[int]]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None, None
+    return (st.st_mtime_ns, st.st_size, st.st_ino), st.st_mtime_ns
+
+
+def parse_file(path: Path) -> Any:
+    """Default parser: YAML for .yaml/.yml, JSON otherwise."""
+    with open(path, "r", encoding="utf-8") as f:
+        if path.suffix.lower() in (".yaml", ".yml"):
+            import yaml
+            return yaml.safe_load(f)
+        return json.load(f)
+
+
+def register_config(
+    name: str,
+    *,
+    parse: Optional[Callable[[Path], Any]] = None,
+    validate: Optional[Callable[[Any], Any]] = None,
+    missing: Callable[[], Any] = dict,
+    fallback: Optional[Callable[[Exception], Any]] = None,
+) -> None:
+    """
+    Register (or re-register) a config kind.
+
+    parse:    Path -> raw data (default parse_file)
+    validate: raw -> normalized data; raise ValueError when invalid
+    missing:  data used when the file does not exist
+    fallback: exception -> data used when parse/validate fails; without it the snapshot
+              carries data=None and .error, and the owner decides (e.g. raise)
+    """
+    with _lock:
+        _kinds[name] = _Kind(name, parse, validate, missing, fallback)
+        for key in [k for k in _entries if k[0] == name]:
+            del _entries[key]
+
+
+def _load(kind: _Kind, path: Path, prev: Optional[_Entry]) -> _Entry:
+    global _generation
+    t0 = time.perf_counter()
+    sig, mtime_ns = _file_sig(path)
+    error: Optional[str] = None
+    if sig is None:
+        data = kind.missing()
+    else:
+        try:
+            raw = (kind.parse or parse_file)(path)
+            data = kind.validate(raw) if kind.validate is not None else raw
+        except Exception as e:
+            error = str(e) or type(e).__name__
+            data = kind.fallback(e) if kind.fallback is not None else None
+    frozen = freeze(data)
+    load_ms = (time.perf_counter() - t0) * 1000
+    stats = prev.stats if prev is not None else {"loads": 0, "hits": 0, "reloads": 0, "errors": 0}
+    stats["loads"] += 1
+    if error is not None:
+        stats["errors"] += 1
+        logger.warning("[CONFIG] %s: failed to load %s: %s", kind.name, path, error)
+    unchanged = (
+        prev is not None and prev.snapshot.data == frozen
+        and prev.snapshot.error == error and prev.snapshot.exists == (sig is not None)
+    )
+    if unchanged:
+        generation = prev.snapshot.generation
+    else:
+        _generation += 1
+        generation = _generation
+        if prev is not None:
+            stats["reloads"] += 1
+            logger.info("[CONFIG] %s reloaded from %s (generation %d)", kind.name, path, generation)
+    snapshot = ConfigSnapshot(
+        name=kind.name,
+        path=str(path),
+        generation=generation,
+        data=frozen,
+        exists=sig is not None,
+        error=error,
+        loaded_at=datetime.now(timezone.utc).isoformat(),
+        load_ms=round(load_ms, 3),
+    )
+    racy = mtime_ns is not None and time.time_ns() - mtime_ns < _RACY_NS
+    return _Entry(snapshot=snapshot, sig=sig, racy=racy, stats=stats)
+
+
+def get_config(name: str, path: Union[str, Path]) -> ConfigSnapshot:
+    """Current snapshot of config `name` at `path` (parsed on first use and after the file changes)."""
+    p = Path(path)
+    key = (name, str(p))
+    pinned = _PINNED.get()
+    if pinned is not None and key in pinned:
+        return pinned[key]
+    entry = _entries.get(key)
+    if entry is not None and not entry.racy and _file_sig(p)[0] == entry.sig:
+        entry.stats["hits"] += 1
+        snapshot = entry.snapshot
+    else:
+        with _lock:
+            kind = _kinds.get(name)
+            if kind is None:
+                raise KeyError(f"config {name!r} is not registered")
+            entry = _entries.get(key)
+            if entry is not None and not entry.racy and _file_sig(p)[0] == entry.sig:
+                entry.stats["hits"] += 1
+            else:
+                entry = _load(kind, p, entry)
+                _entries[key] = entry
+            snapshot = entry.snapshot
+    if pinned is not None:
+        pinned[key] = snapshot
+    return snapshot
+
+
+def invalidate(name: Optional[str] = None, path: Optional[Union[str, Path]] = None) -> None:
+    """Force the next read to re-stat and re-parse (all configs, one kind, or one file)."""
+    with _lock:
+        for key, entry in _entries.items():
+            if (name is None or key[0] == name) and (path is None or key[1] == str(Path(path))):
+                entry.racy = True
+
+
+def refresh_all() -> List[str]:
+    """Poll every loaded config file; reload the changed ones. Returns the names whose generation changed."""
+    changed: List[str] = []
+    with _lock:
+        for key, entry in list(_entries.items()):
+            p = Path(key[1])
+            if not entry.racy and _file_sig(p)[0] == entry.sig:
+                continue
+            kind = _kinds.get(key[0])
+            if kind is None:
+                continue
+            before = entry.snapshot.generation
+            _entries[key] = _load(kind, p, entry)
+            if _entries[key].snapshot.generation != before:
+                changed.append(key[0])
+    return changed
+
+
+@contextlib.contextmanager
+def pinned_configs() -> Iterator[Dict[_Key, ConfigSnapshot]]:
+    """Within the block, each config keeps the snapshot first read in this context (one run = one config)."""
+    outer = _PINNED.get()
+    token = _PINNED.set(dict(outer) if outer is not None else {})
+    try:
+        yield _PINNED.get()  # type: ignore[misc]
+    finally:
+        _PINNED.reset(token)
+
+
+def registry_status() -> Dict[str, Any]:
+    """Generation and load timings per loaded config file (for /api/ops/status)."""
+    with _lock:
+        configs = []
+        for (name, path), entry in sorted(_entries.items()):
+            snap = entry.snapshot
+            configs.append({
+                "name": name,
+                "path": path,
+                "generation": snap.generation,
+                "exists": snap.exists,
+                "error": snap.error,
+                "loaded_at": snap.loaded_at,
+                "load_ms": snap.load_ms,
+                **entry.stats,
+            })
+        return {"generation": _generation, "registered": sorted(_kinds), "configs": configs}
+
+
+def reset_registry() -> None:
+    """Drop all loaded snapshots (tests). Registered kinds are kept."""
+    with _lock:
+        _entries.clear()
+
+
+__all__ = [
+    "ConfigSnapshot",
+    "freeze",
+    "get_config",
+    "invalidate",
+    "parse_file",
+    "pinned_configs",
+    "refresh_all",
+    "register_config",
+    "registry_status",
+    "reset_registry",
+    "thaw",
+]
@@ -0,0 +1,274 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""
+Bounded in-memory cache shared by the process-wide ORATS caches.
+
+The symbol snapshot cache, the derived avg-volume cache and ChainCache used to be
+plain dicts that only ever grew in the long-lived API process. BoundedCache caps
+each of them three ways:
+
+  - max_entries   LRU eviction once the entry count is reached
+  - ttl_seconds   entries expire (default per cache; set() may override per entry)
+  - max_bytes     approximate byte budget (approx_size of the value), LRU eviction
+
+Keys are spread over lock-striped segments (hash(key) % stripes), each with its
+own lock and LRU order, so stage-1 workers filling different symbols rarely
+contend. Limits are divided evenly across segments, so LRU order is per segment.
+
+Every named cache registers itself; bounded_cache_stats() returns hits / misses /
+evictions / expirations / entries / bytes per cache and is merged into
+cache_store.cache_stats() and /api/ops/status.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Returned by get() when no default is given and the key is absent or expired,
+# so callers can cache None as a real value.
+MISSING: Any = object()
+
+_SIZE_DEPTH = 4
+_SIZE_SAMPLE = 32
+
+
+def approx_size(obj: Any, _depth: int = 0) -> int:
+    """
+    Rough deep size in bytes: sys.getsizeof over dicts, sequences and dataclass/object
+    attributes up to a fixed depth. Long sequences are sampled and extrapolated.
+    """
+    size = sys.getsizeof(obj)
+    if _depth >= _SIZE_DEPTH or isinstance(obj, (str, bytes, bytearray, int, float, bool)) or obj is None:
+        return size
+    if isinstance(obj, dict):
+        items = list(obj.items())
+        sample = items[:_SIZE_SAMPLE]
+        if sample:
+            part = sum(approx_size(k, _depth + 1) + approx_size(v, _depth + 1) for k, v in sample)
+            size += part * len(items) // len(sample)
+        return size
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        seq = obj if isinstance(obj, (list, tuple)) else list(obj)
+        sample = seq[:_SIZE_SAMPLE]
+        if sample:
+            part = sum(approx_size(v, _depth + 1) for v in sample)
+            size += part * len(seq) // len(sample)
+        return size
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return size + sum(approx_size(getattr(obj, f.name, None), _depth + 1) for f in dataclasses.fields(obj))
+    attrs = getattr(obj, "__dict__", None)
+    if isinstance(attrs, dict):
+        size += approx_size(attrs, _depth + 1)
+    return size
+
+
+class _Segment:
+    __slots__ = ("lock", "entries", "bytes")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        # key -> (value, expires_at monotonic or None, size)
+        self.entries: "OrderedDict[Hashable, Tuple[Any, Optional[float], int]]" = OrderedDict()
+        self.bytes = 0
+
+
+class BoundedCache:
+    """Thread-safe LRU + TTL + byte-budget cache with per-cache hit/miss/eviction counters."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        max_entries: int = 10_000,
+        ttl_seconds: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        stripes: int = 16,
+        sizeof: Callable[[Any], int] = approx_size,
+        register: bool = True,
+    ) -> None:
+        self.name = name
+        self.max_entries = max(1, int(max_entries))
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._stripes = max(1, min(int(stripes), self.max_entries))
+        self._segments = [_Segment() for _ in range(self._stripes)]
+        self._seg_entries = max(1, self.max_entries // self._stripes)
+        self._seg_bytes = max(1, max_bytes // self._stripes) if max_bytes else None
+        self._sizeof = sizeof
+        self._stats_lock = threading.Lock()
+        self.reset_stats()
+        if register:
+            _register(self)
+
+    # ------------------------------------------------------------------ internals
+
+    def _segment(self, key: Hashable) -> _Segment:
+        return self._segments[hash(key) % self._stripes]
+
+    def _count(self, field: str, n: int = 1) -> None:
+        with self._stats_lock:
+            self._stats[field] += n
+
+    def _drop(self, seg: _Segment, key: Hashable) -> None:
+        _, _, size = seg.entries.pop(key)
+        seg.bytes -= size
+
+    # ------------------------------------------------------------------ API
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:
+        """Cached value (moved to most recently used), else default. Counts a hit or a miss."""
+        seg = self._segment(key)
+        expired = False
+        with seg.lock:
+            entry = seg.entries.get(key)
+            if entry is not None:
+                value, expires_at, _ = entry
+                if expires_at is not None and time.monotonic() >= expires_at:
+                    self._drop(seg, key)
+                    expired = True
+                else:
+                    seg.entries.move_to_end(key)
+                    self._count("hits")
+                    return value
+        if expired:
+            self._count("expirations")
+        self._count("misses")
+        return default
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """Store value; evicts least recently used entries of its segment to stay within limits."""
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        size = self._sizeof(value) if self._seg_bytes is not None else 0
+        if self._seg_bytes is not None and size > self._seg_bytes:
+            logger.debug("[CACHE] %s: value of ~%d bytes exceeds segment budget; not cached", self.name, size)
+            self._count("rejected")
+            return
+        seg = self._segment(key)
+        evicted = 0
+        with seg.lock:
+            if key in seg.entries:
+                self._drop(seg, key)
+            seg.entries[key] = (value, expires_at, size)
+            seg.bytes += size
+            while len(seg.entries) > self._seg_entries or (self._seg_bytes is not None and seg.bytes > self._seg_bytes):
+                old_key = next(iter(seg.entries))
+                self._drop(seg, old_key)
+                evicted += 1
+        if evicted:
+            self._count("evictions", evicted)
+
+    def get_or_set(self, key: Hashable, fn: Callable[[], Any], ttl_seconds: Optional[float] = None) -> Any:
+        """get(key), or compute fn() and cache it. fn runs outside the lock (use singleflight to collapse)."""
+        value = self.get(key)
+        if value is MISSING:
+            value = fn()
+            self.set(key, value, ttl_seconds)
+        return value
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        seg = self._segment(key)
+        with seg.lock:
+            if key not in seg.entries:
+                return default
+            value = seg.entries[key][0]
+            self._drop(seg, key)
+            return value
+
+    def __contains__(self, key: Hashable) -> bool:
+        """True when key is cached and not expired (does not count as a hit or miss)."""
+        seg = self._segment(key)
+        with seg.lock:
+            entry = seg.entries.get(key)
+            return entry is not None and (entry[1] is None or time.monotonic() < entry[1])
+
+    def __len__(self) -> int:
+        return sum(len(seg.entries) for seg in self._segments)
+
+    def keys(self) -> List[Hashable]:
+        out: List[Hashable] = []
+        for seg in self._segments:
+            with seg.lock:
+                out.extend(seg.entries.keys())
+        return out
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self.keys())
+
+    def clear(self) -> None:
+        for seg in self._segments:
+            with seg.lock:
+                seg.entries.clear()
+                seg.bytes = 0
+
+    def cleanup_expired(self) -> int:
+        """Remove expired entries. Returns count removed."""
+        now = time.monotonic()
+        removed = 0
+        for seg in self._segments:
+            with seg.lock:
+                stale = [k for k, (_, exp, _) in seg.entries.items() if exp is not None and now >= exp]
+                for k in stale:
+                    self._drop(seg, k)
+                removed += len(stale)
+        if removed:
+            self._count("expirations", removed)
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            out: Dict[str, Any] = dict(self._stats)
+        total = out["hits"] + out["misses"]
+        out["hit_rate_pct"] = round(100.0 * out["hits"] / total, 1) if total else 0.0
+        out["entries"] = len(self)
+        out["bytes"] = sum(seg.bytes for seg in self._segments)
+        out["max_entries"] = self.max_entries
+        out["max_bytes"] = self.max_bytes
+        out["ttl_seconds"] = self.ttl_seconds
+        return out
+
+    def reset_stats(self) -> None:
+        with self._stats_lock:
+            self._stats: Dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0, "rejected": 0}
+
+
+# Named caches, reported by bounded_cache_stats(); weak so short-lived test caches drop out
+_REGISTRY: "weakref.WeakValueDictionary[str, BoundedCache]" = weakref.WeakValueDictionary()
+_REGISTRY_LOCK = threading.Lock()
+
+
+def _register(cache: BoundedCache) -> None:
+    with _REGISTRY_LOCK:
+        _REGISTRY[cache.name] = cache
+
+
+def bounded_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """name -> stats() for every registered BoundedCache."""
+    with _REGISTRY_LOCK:
+        caches = sorted(_REGISTRY.items())
+    return {name: cache.stats() for name, cache in caches}
+
+
+def reset_bounded_cache_stats() -> None:
+    with _REGISTRY_LOCK:
+        caches = list(_REGISTRY.values())
+    for cache in caches:
+        cache.reset_stats()
+
+
+__all__ = [
+    "MISSING",
+    "BoundedCache",
+    "approx_size",
+    "bounded_cache_stats",
+    "reset_bounded_cache_stats",
+]
@@ -25,6 +25,8 @@ from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, TypeVar
 
 from app.core.config.eval_config import CACHE_DIR, CACHE_ENABLED
+from app.core.data.bounded_cache import bounded_cache_stats, reset_bounded_cache_stats
+from app.core.data.singleflight import orats_singleflight, reset_singleflight_stats, singleflight_stats
 
 logger = logging.getLogger(__name__)
 
@@ -127,13 +129,16 @@ def cache_stats() -> Dict[str, Any]:
         "cache_misses": _cache_misses,
         "cache_hit_rate_pct": round(hit_rate, 1),
         "cache_enabled": CACHE_ENABLED,
+        **singleflight_stats(),
+        "memory_caches": bounded_cache_stats(),
     }
 
 
 def cache_stats_by_endpoint() -> Dict[str, Dict[str, Any]]:
-    """Phase 8.9: Per-endpoint hit/miss and hit rate."""
+    """Phase 8.9: Per-endpoint hit/miss and hit rate (plus singleflight-collapsed requests)."""
     out: Dict[str, Dict[str, Any]] = {}
-    all_endpoints = set(_cache_hits_by_endpoint) | set(_cache_misses_by_endpoint)
+    flights = singleflight_stats()["singleflight_by_endpoint"]
+    all_endpoints = set(_cache_hits_by_endpoint) | set(_cache_misses_by_endpoint) | set(flights)
     for ep in sorted(all_endpoints):
         hits = _cache_hits_by_endpoint.get(ep, 0)
         misses = _cache_misses_by_endpoint.get(ep, 0)
@@ -143,6 +148,7 @@ def cache_stats_by_endpoint() -> Dict[str, Dict[str, Any]]:
             "hits": hits,
             "misses": misses,
             "hit_rate_pct": round(hit_rate, 1),
+            "collapsed": flights.get(ep, {}).get("collapsed", 0),
         }
     return out
 
@@ -168,6 +174,8 @@ def reset_cache_stats() -> None:
     _cache_misses = 0
     _cache_hits_by_endpoint = defaultdict(int)
     _cache_misses_by_endpoint = defaultdict(int)
+    reset_singleflight_stats()
+    reset_bounded_cache_stats()
 
 
 def _normalized_params(params: Dict[str, Any]) -> str:
@@ -192,10 +200,11 @@ def fetch_with_cache(
     """
     from datetime import date
 
+    as_of = params.get("as_of") or date.today().isoformat()
+    flight_params = {**params, "symbol": symbol.upper()}
     if not CACHE_ENABLED:
-        return fetcher()
+        return orats_singleflight(endpoint_name, flight_params, fetcher, as_of=as_of)
 
-    as_of = params.get("as_of") or date.today().isoformat()
     param_str = _normalized_params(params)
     key = f"{endpoint_name}:{symbol.upper()}:{param_str}:{as_of}"
 
@@ -205,13 +214,14 @@ def fetch_with_cache(
         return cached.get("value")
 
     _record_miss(endpoint_name)
-    try:
+
+    def _fetch_and_store() -> Any:
+        # Do NOT cache errors: fetcher exceptions propagate before cache_set
         result = fetcher()
         cache_set(key, {"value": result, "cached_at": datetime.now(timezone.utc).isoformat()})
         return result
-    except Exception:
-        # Do NOT cache errors
-        raise
+
+    return orats_singleflight(endpoint_name, flight_params, _fetch_and_store, as_of=as_of)
 
 
 def fetch_batch_with_cache(
@@ -231,11 +241,12 @@ def fetch_batch_with_cache(
     """
     from datetime import date
 
-    if not CACHE_ENABLED:
-        return fetcher()
-
     sorted_syms = ",".join(sorted(s.upper() for s in symbols))
     as_of = params.get("as_of") or date.today().isoformat()
+    flight_params = {**params, "symbols": sorted_syms}
+    if not CACHE_ENABLED:
+        return orats_singleflight(endpoint_name, flight_params, fetcher, as_of=as_of)
+
     param_str = _normalized_params(params)
     key = f"{endpoint_name}:{sorted_syms}:{param_str}:{as_of}"
 
@@ -246,10 +257,11 @@ def fetch_batch_with_cache(
         return deserialize(raw) if deserialize and raw else raw
 
     _record_miss(endpoint_name)
-    try:
+
+    def _fetch_and_store() -> Dict[str, Any]:
         result = fetcher()
         to_store = serialize(result) if serialize else result
         cache_set(key, {"value": to_store, "cached_at": datetime.now(timezone.utc).isoformat()})
         return result
-    except Exception:
-        raise
+
+    return orats_singleflight(endpoint_name, flight_params, _fetch_and_store, as_of=as_of)
@@ -0,0 +1,330 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""
+Local daily-bar repository with incremental ORATS hist/dailies sync.
+
+Every consumer of daily history (eligibility candles, avg_stock_volume_20d, market
+regime SPY/QQQ, the volatility kill switch) reads from one per-symbol store:
+artifacts/candles_cache/<SYMBOL>.json, a list of {ts, open, high, low, close, volume}
+ascending by ts (the format OratsDailyProvider always wrote).
+
+Sync policy per symbol:
+- store written today -> served as-is (no request)
+- store has bars -> GET hist/dailies with tradeDate=<last ts>,<today> and splice the
+  window onto the stored bars (the last stored bar is re-fetched so a partial bar is
+  replaced)
+- no store -> one full-history backfill
+- request fails -> stale bars are served; an empty store yields []
+
+recent_bars() serves consumers that only need the last few bars (avg_stock_volume_20d)
+through the same sync, so a new symbol is backfilled once and that stored history also
+serves eligibility and regime in the same run.
+
+Bytes transferred and latency per request are counted in sync_stats() so the
+nightly run can log them.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+
+from app.core.orats.endpoints import BASE_DATAV2, url_hist_dailies
+
+logger = logging.getLogger(__name__)
+
+ORATS_DAILY_FIELDS = "tradeDate,openPx,hiPx,loPx,clsPx,stockVolume"
+DEFAULT_LOOKBACK = 400
+DEFAULT_TIMEOUT_SEC = 30.0
+
+Bar = Dict[str, Any]
+
+
+def _normalize_row(row: Dict[str, Any]) -> Bar:
+    """Convert ORATS row to {ts, open, high, low, close, volume}."""
+    ts = row.get("tradeDate")
+    if ts is None:
+        return {"ts": None, "open": None, "high": None, "low": None, "close": None, "volume": None}
+    if hasattr(ts, "isoformat"):
+        ts = ts.isoformat()[:10] if ts else None
+    else:
+        ts = str(ts)[:10] if ts else None
+    try:
+        open_ = float(row.get("openPx") or row.get("open") or 0)
+    except (TypeError, ValueError):
+        open_ = None
+    try:
+        high = float(row.get("hiPx") or row.get("high") or 0)
+    except (TypeError, ValueError):
+        high = None
+    try:
+        low = float(row.get("loPx") or row.get("low") or 0)
+    except (TypeError, ValueError):
+        low = None
+    try:
+        close = float(row.get("clsPx") or row.get("close") or 0)
+    except (TypeError, ValueError):
+        close = None
+    try:
+        vol = int(float(row.get("stockVolume") or row.get("stockVolu") or row.get("volume") or 0))
+    except (TypeError, ValueError):
+        vol = None
+    return {"ts": ts, "open": open_, "high": high, "low": low, "close": close, "volume": vol}
+
+
+def _trade_date_key(r: Dict[str, Any]) -> str:
+    t = r.get("tradeDate")
+    return "" if t is None else str(t)[:10]
+
+
+def default_cache_dir() -> Path:
+    repo_root = Path(__file__).resolve().parent.parent.parent.parent
+    return repo_root / "artifacts" / "candles_cache"
+
+
+# ---------------------------------------------------------------------------
+# Sync telemetry (process-wide, shared by every repository instance)
+# ---------------------------------------------------------------------------
+
+_STATS_LOCK = threading.Lock()
+_SYNC_STATS: Dict[str, Any] = {}
+
+
+def reset_sync_stats() -> None:
+    with _STATS_LOCK:
+        _SYNC_STATS.clear()
+        _SYNC_STATS.update({
+            "store_hits": 0,
+            "backfills": 0,
+            "incremental": 0,
+            "failures": 0,
+            "requests": 0,
+            "bytes": 0,
+            "latency_ms": 0.0,
+            "rows_added": 0,
+        })
+
+
+reset_sync_stats()
+
+
+def _bump(**deltas: Any) -> None:
+    with _STATS_LOCK:
+        for k, v in deltas.items():
+            _SYNC_STATS[k] = _SYNC_STATS.get(k, 0) + v
+
+
+def sync_stats() -> Dict[str, Any]:
+    """Counters since the last reset: requests, bytes, latency, backfills vs incremental syncs."""
+    with _STATS_LOCK:
+        s = dict(_SYNC_STATS)
+    s["latency_ms"] = round(s["latency_ms"], 1)
+    s["avg_latency_ms"] = round(s["latency_ms"] / s["requests"], 1) if s["requests"] else 0.0
+    return s
+
+
+# ---------------------------------------------------------------------------
+# Repository
+# ---------------------------------------------------------------------------
+
+# Per-store-file locks so concurrent callers do not race the read-merge-write
+_FILE_LOCKS: Dict[str, threading.Lock] = {}
+_FILE_LOCKS_GUARD = threading.Lock()
+
+
+def _file_lock(path: Path) -> threading.Lock:
+    key = str(path)
+    with _FILE_LOCKS_GUARD:
+        lock = _FILE_LOCKS.get(key)
+        if lock is None:
+            lock = _FILE_LOCKS[key] = threading.Lock()
+        return lock
+
+
+class DailyBarRepository:
+    """Per-symbol daily bar store synced incrementally from ORATS hist/dailies."""
+
+    def __init__(
+        self,
+        cache_dir: str | Path | None = None,
+        token: str | None = None,
+        timeout_sec: float = DEFAULT_TIMEOUT_SEC,
+    ) -> None:
+        self._cache_dir = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+        self._token = (token or "").strip() or None
+        self._timeout_sec = timeout_sec
+
+    # ------------------------------------------------------------------
+    # Store
+    # ------------------------------------------------------------------
+
+    def _path(self, symbol: str) -> Path:
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        return self._cache_dir / f"{symbol}.json"
+
+    def _load(self, path: Path) -> Tuple[List[Bar], bool]:
+        """Return (bars, written_today). Missing or unreadable store -> ([], False)."""
+        if not path.exists():
+            return [], False
+        try:
+            fresh = date.fromtimestamp(path.stat().st_mtime) == date.today()
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, list) and data:
+                return data, fresh
+        except Exception as e:
+            logger.debug("[DAILY_BARS] store load failed for %s: %s", path.name, e)
+        return [], False
+
+    def _save(self, path: Path, bars: List[Bar]) -> None:
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(bars, f, indent=0, default=str)
+        except Exception as e:
+            logger.warning("[DAILY_BARS] store save failed for %s: %s", path.name, e)
+
+    # ------------------------------------------------------------------
+    # ORATS
+    # ------------------------------------------------------------------
+
+    def _resolve_token(self, token: Optional[str]) -> Optional[str]:
+        t = (token or "").strip() or self._token
+        if t:
+            return t
+        try:
+            from app.core.config.orats_secrets import ORATS_API_TOKEN
+            return (ORATS_API_TOKEN or "").strip() or None
+        except ImportError:
+            return None
+
+    def _fetch(self, symbol: str, token: str, trade_dates: Optional[str]) -> Optional[List[Bar]]:
+        """GET hist/dailies (optionally a tradeDate window). Normalized ascending bars, or None on failure."""
+        params: Dict[str, str] = {"token": token, "ticker": symbol, "fields": ORATS_DAILY_FIELDS}
+        if trade_dates:
+            params["tradeDate"] = trade_dates
+
+        def _do_fetch() -> Optional[List[Bar]]:
+            t0 = time.perf_counter()
+            try:
+                resp = requests.get(url_hist_dailies(BASE_DATAV2), params=params, timeout=self._timeout_sec)
+            except requests.RequestException as e:
+                logger.error("[DAILY_BARS] symbol=%s request failed: %s", symbol, e)
+                _bump(failures=1)
+                return None
+            try:
+                nbytes = len(resp.content)
+            except TypeError:
+                nbytes = 0
+            _bump(requests=1, bytes=nbytes, latency_ms=(time.perf_counter() - t0) * 1000.0)
+            if resp.status_code != 200:
+                logger.error("[DAILY_BARS] symbol=%s HTTP %s %s", symbol, resp.status_code, (resp.text or "")[:300])
+                _bump(failures=1)
+                return None
+            try:
+                raw: Any = resp.json()
+            except Exception as e:
+                logger.error("[DAILY_BARS] symbol=%s invalid JSON: %s", symbol, e)
+                _bump(failures=1)
+                return None
+            rows: List[Dict[str, Any]] = []
+            if isinstance(raw, list):
+                rows = raw
+            elif isinstance(raw, dict) and isinstance(raw.get("data"), list):
+                rows = raw["data"]
+            return [_normalize_row(r) for r in sorted(rows, key=_trade_date_key)]
+
+        from app.core.data.singleflight import orats_singleflight
+        return orats_singleflight("hist_dailies", params, _do_fetch)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def sync(self, symbol: str, token: Optional[str] = None) -> List[Bar]:
+        """Bring the store for symbol up to date and return all stored bars (ascending)."""
+        sym = (symbol or "").strip().upper()
+        if not sym:
+            return []
+        path = self._path(sym)
+        with _file_lock(path):
+            bars, fresh = self._load(path)
+            if fresh:
+                _bump(store_hits=1)
+                return bars
+            tok = self._resolve_token(token)
+            if not tok:
+                logger.warning("[DAILY_BARS] symbol=%s no ORATS token; serving %d stored bars", sym, len(bars))
+                return bars
+
+            since = str(bars[-1].get("ts") or "")[:10] if bars else ""
+            today = date.today().isoformat()
+            if since and since <= today:
+                fetched = self._fetch(sym, tok, f"{since},{today}")
+                if fetched is None:
+                    return bars
+                _bump(incremental=1)
+                if fetched:
+                    kept = [b for b in bars if str(b.get("ts") or "") < fetched[0]["ts"]]
+                    _bump(rows_added=len(kept) + len(fetched) - len(bars))
+                    bars = kept + fetched
+            else:
+                fetched = self._fetch(sym, tok, None)
+                if not fetched:
+                    if fetched is not None:
+                        logger.info("[DAILY_BARS] symbol=%s empty response", sym)
+                    return bars
+                _bump(backfills=1, rows_added=len(fetched))
+                bars = fetched
+            # Saving also stamps the store as synced today (an empty window still counts)
+            self._save(path, bars)
+            return bars
+
+    def get_bars(self, symbol: str, lookback: int = DEFAULT_LOOKBACK, token: Optional[str] = None) -> List[Bar]:
+        """Last `lookback` bars for symbol (all bars if lookback <= 0), syncing first if needed."""
+        bars = self.sync(symbol, token=token)
+        return bars[-lookback:] if lookback > 0 else bars
+
+    def recent_bars(self, symbol: str, count: int, token: Optional[str] = None) -> List[Bar]:
+        """Last `count` bars via the shared sync (a missing store is backfilled and saved once for
+        every consumer, rather than fetched again as a separate window)."""
+        if count <= 0:
+            return []
+        return self.get_bars(symbol, count, token=token)
+
+    def bars_dataframe(self, symbol: str, lookback: int = DEFAULT_LOOKBACK) -> Any:
+        """daily_provider adapter for eod_snapshot: DataFrame with date, open, high, low, close, volume."""
+        import pandas as pd
+        bars = self.get_bars(symbol, lookback)
+        df = pd.DataFrame(bars, columns=["ts", "open", "high", "low", "close", "volume"])
+        return df.rename(columns={"ts": "date"})
+
+
+_REPOSITORY: Optional[DailyBarRepository] = None
+_REPOSITORY_LOCK = threading.Lock()
+
+
+def get_daily_bar_repository() -> DailyBarRepository:
+    """Process-wide repository on the default store."""
+    global _REPOSITORY
+    with _REPOSITORY_LOCK:
+        if _REPOSITORY is None:
+            _REPOSITORY = DailyBarRepository()
+        return _REPOSITORY
+
+
+__all__ = [
+    "DEFAULT_LOOKBACK",
+    "DailyBarRepository",
+    "ORATS_DAILY_FIELDS",
+    "default_cache_dir",
+    "get_daily_bar_repository",
+    "reset_sync_stats",
+    "sync_stats",
+]
@@ -16,6 +16,8 @@ from __future__ import annotations
 # Equity snapshots (Stage 1: strikes/options + ivrank)
 from app.core.orats.orats_equity_quote import (
     fetch_full_equity_snapshots,
+    start_equity_prefetch,
+    EquityPrefetch,
     reset_run_cache,
     OratsEquityQuoteError,
     FullEquitySnapshot,
@@ -23,6 +25,9 @@ from app.core.orats.orats_equity_quote import (
     get_run_cache,
 )
 
+# In-flight request dedup counters (also merged into cache_store.cache_stats())
+from app.core.data.singleflight import singleflight_stats, reset_singleflight_stats
+
 # Live endpoints (strikes, summaries, probe)
 from app.core.orats.orats_client import (
     get_orats_live_strikes,
@@ -62,11 +67,15 @@ def get_equity_snapshot_from_core(
 
 __all__ = [
     "fetch_full_equity_snapshots",
+    "start_equity_prefetch",
+    "EquityPrefetch",
     "reset_run_cache",
     "get_run_cache",
     "OratsEquityQuoteError",
     "FullEquitySnapshot",
     "EquityQuoteCache",
+    "singleflight_stats",
+    "reset_singleflight_stats",
     "get_orats_live_strikes",
     "get_orats_live_summaries",
     "probe_orats_live",
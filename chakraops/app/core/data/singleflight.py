@@ -0,0 +1,152 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""
+Singleflight deduplication for ORATS fetches.
+
+Stage-2, refresh_marks, symbol recompute, the EOD chain snapshot and the chain
+providers often ask for the same chain or quote at the same moment. do() lets the
+first caller for a key run the fetch while identical concurrent callers wait and
+share its parsed result (or its exception). Nothing is retained once the call
+completes; caching stays in cache_store / ChainCache.
+
+Keys are (endpoint, normalized params, as_of) — see singleflight_key(). Counters
+(leaders, collapsed, per endpoint) are reported through cache_store.cache_stats().
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import defaultdict
+from datetime import date
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def singleflight_key(endpoint: str, params: Optional[Dict[str, Any]] = None, as_of: Optional[str] = None) -> str:
+    """endpoint|k=v:k=v (sorted, token and None dropped)|as_of (default today)."""
+    params = params or {}
+    parts = sorted(f"{k}={v}" for k, v in params.items() if k not in ("token", "as_of") and v is not None)
+    as_of = as_of or params.get("as_of") or date.today().isoformat()
+    return f"{endpoint}|{':'.join(parts)}|{as_of}"
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Collapse concurrent calls with the same key into one execution."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self.reset_stats()
+
+    def do(self, key: str, fn: Callable[[], T], endpoint: str = "") -> T:
+        endpoint = endpoint or key.split("|", 1)[0]
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self._collapsed += 1
+                self._collapsed_by_endpoint[endpoint] += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self._leaders += 1
+                self._leaders_by_endpoint[endpoint] += 1
+                leader = True
+
+        if not leader:
+            logger.debug("[SINGLEFLIGHT] %s: joined in-flight call", key)
+            from app.core.observability.tracing import add_wait, set_attrs
+            t0 = time.perf_counter()
+            call.done.wait()
+            set_attrs(collapsed=True)
+            add_wait("singleflight", (time.perf_counter() - t0) * 1000)
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    def inflight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            by_ep = {
+                ep: {
+                    "leaders": self._leaders_by_endpoint.get(ep, 0),
+                    "collapsed": self._collapsed_by_endpoint.get(ep, 0),
+                }
+                for ep in sorted(set(self._leaders_by_endpoint) | set(self._collapsed_by_endpoint))
+            }
+            return {
+                "singleflight_leaders": self._leaders,
+                "singleflight_collapsed": self._collapsed,
+                "singleflight_inflight": len(self._calls),
+                "singleflight_by_endpoint": by_ep,
+            }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._leaders = 0
+            self._collapsed = 0
+            self._leaders_by_endpoint: Dict[str, int] = defaultdict(int)
+            self._collapsed_by_endpoint: Dict[str, int] = defaultdict(int)
+
+
+# Process-wide group shared by every ORATS fetch path
+_ORATS_FLIGHTS = SingleFlight()
+
+
+def orats_singleflight(
+    endpoint: str,
+    params: Optional[Dict[str, Any]],
+    fn: Callable[[], T],
+    as_of: Optional[str] = None,
+) -> T:
+    """Run fn once for concurrent callers with the same (endpoint, params, as_of). Traced as orats.<endpoint>."""
+    from app.core.observability.tracing import span
+    with span(f"orats.{endpoint.strip('/')}", "orats", endpoint=endpoint):
+        return _ORATS_FLIGHTS.do(singleflight_key(endpoint, params, as_of), fn, endpoint=endpoint)
+
+
+def singleflight_stats() -> Dict[str, Any]:
+    return _ORATS_FLIGHTS.stats()
+
+
+def reset_singleflight_stats() -> None:
+    _ORATS_FLIGHTS.reset_stats()
+
+
+__all__ = [
+    "SingleFlight",
+    "orats_singleflight",
+    "reset_singleflight_stats",
+    "singleflight_key",
+    "singleflight_stats",
+]
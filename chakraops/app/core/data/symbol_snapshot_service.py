@@ -15,19 +15,27 @@ Never uses /datav2/live/* for equity bid/ask/volume or iv_rank. Never emits "UNK
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.core.data.bounded_cache import MISSING, BoundedCache
 
 logger = logging.getLogger(__name__)
 
-# Per-run cache: (ticker, section, date_key) -> result to avoid spamming ORATS
-_snapshot_cache: Dict[str, Any] = {}
+# (ticker, section, date_key) -> result to avoid spamming ORATS. Bounded (LRU + TTL +
+# byte budget) and thread-safe; keys carry the date, so the TTL only has to outlive one day.
+_snapshot_cache = BoundedCache("symbol_snapshot", max_entries=20_000, ttl_seconds=36 * 3600, max_bytes=64 * 1024 * 1024)
 _CACHE_KEY_QUOTE = "quote"
 _CACHE_KEY_CORE = "core"
 _CACHE_KEY_DERIVED = "derived"
 
 
+# Concurrent core/derived fetches for cache misses in get_snapshots_batch
+SNAPSHOT_BATCH_MAX_WORKERS = 8
+
+
 def _cache_key(ticker: str, section: str, date_key: str) -> str:
     return f"{ticker.upper()}:{section}:{date_key}"
 
@@ -56,6 +64,8 @@ class SymbolSnapshot:
     derived_as_of: Optional[str] = None
     field_sources: Dict[str, str] = field(default_factory=dict)
     missing_reasons: Dict[str, str] = field(default_factory=dict)
+    # Per-field {origin, fetched_at, age_sec, ttl_sec} for the delayed quote / IV rank
+    field_freshness: Dict[str, Dict[str, Any]] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
         out: Dict[str, Any] = {
@@ -74,6 +84,7 @@ class SymbolSnapshot:
             "derived_as_of": self.derived_as_of,
             "field_sources": dict(self.field_sources),
             "missing_reasons": dict(self.missing_reasons),
+            "field_freshness": {k: dict(v) for k, v in self.field_freshness.items()},
         }
         return out
 
@@ -96,6 +107,18 @@ def _coerce_int(v: Any) -> Optional[int]:
         return None
 
 
+def _apply_delayed_sources(snapshot: SymbolSnapshot, delayed: Any) -> None:
+    """field_sources for delayed quote fields ("...:day_cache" when served from the day store) + freshness."""
+    upstream = getattr(delayed, "data_sources", None) or {}
+    freshness = getattr(delayed, "field_freshness", None) or {}
+    for f in ("price", "bid", "ask", "volume", "quote_date", "iv_rank"):
+        if getattr(snapshot, f) is not None:
+            cached = str(upstream.get(f, "")).endswith(":day_cache")
+            snapshot.field_sources[f] = "delayed_strikes_ivrank:day_cache" if cached else "delayed_strikes_ivrank"
+            if f in freshness:
+                snapshot.field_freshness[f] = dict(freshness[f])
+
+
 def get_snapshot(
     ticker: str,
     *,
@@ -138,9 +161,7 @@ def get_snapshot(
         snapshot.quote_date = getattr(delayed, "quote_date", None) or None
         snapshot.iv_rank = _coerce_float(getattr(delayed, "iv_rank", None))
         snapshot.quote_as_of = snapshot.quote_date or now_iso
-        for f in ("price", "bid", "ask", "volume", "quote_date", "iv_rank"):
-            if getattr(snapshot, f) is not None:
-                snapshot.field_sources[f] = "delayed_strikes_ivrank"
+        _apply_delayed_sources(snapshot, delayed)
         if snapshot.price is None:
             snapshot.missing_reasons["price"] = "Not provided by ORATS delayed quote"
         if snapshot.volume is None:
@@ -160,15 +181,14 @@ def get_snapshot(
 
     # --- Core Data (stkVolu, avgOptVolu20d) ---
     cache_key_core = _cache_key(sym, _CACHE_KEY_CORE, date_key)
-    if use_cache and cache_key_core in _snapshot_cache:
-        core_row = _snapshot_cache[cache_key_core]
-    else:
+    core_row = _snapshot_cache.get(cache_key_core) if use_cache else MISSING
+    if core_row is MISSING:
         core_row = None
         if token:
             try:
                 core_row = fetch_core_snapshot(sym, ["ticker", "stkVolu", "avgOptVolu20d"], token)
                 if use_cache:
-                    _snapshot_cache[cache_key_core] = core_row
+                    _snapshot_cache.set(cache_key_core, core_row)
             except Exception as e:
                 logger.warning("[SYMBOL_SNAPSHOT] %s core fetch failed: %s", sym, e)
                 core_row = None
@@ -197,8 +217,9 @@ def get_snapshot(
     # --- Optional derived: avg_stock_volume_20d from hist/dailies ---
     if derive_avg_stock_volume_20d and token:
         cache_key_derived = _cache_key(sym, _CACHE_KEY_DERIVED, date_key)
-        if use_cache and cache_key_derived in _snapshot_cache:
-            snapshot.avg_stock_volume_20d = _snapshot_cache[cache_key_derived]
+        cached_avg = _snapshot_cache.get(cache_key_derived) if use_cache else MISSING
+        if cached_avg is not MISSING:
+            snapshot.avg_stock_volume_20d = cached_avg
             snapshot.derived_as_of = now_iso
             if snapshot.avg_stock_volume_20d is not None:
                 snapshot.field_sources["avg_stock_volume_20d"] = "DERIVED_ORATS_HIST"
@@ -206,7 +227,7 @@ def get_snapshot(
             try:
                 avg = _derive_avg(sym, token, trade_date=snapshot.quote_date or None)
                 if use_cache:
-                    _snapshot_cache[cache_key_derived] = avg
+                    _snapshot_cache.set(cache_key_derived, avg)
                 if avg is not None:
                     snapshot.avg_stock_volume_20d = avg
                     snapshot.field_sources["avg_stock_volume_20d"] = "DERIVED_ORATS_HIST"
@@ -234,13 +255,33 @@ def get_snapshot(
     return snapshot
 
 
+def _fill_misses(tasks: List[Tuple[Any, Callable[[], Any]]], max_workers: int) -> Dict[Any, Any]:
+    """Run independent fetches (key, fn) on up to max_workers threads; returns key -> fn()."""
+    if not tasks:
+        return {}
+    workers = min(max(1, max_workers), len(tasks))
+    if workers <= 1:
+        return {key: fn() for key, fn in tasks}
+    from app.core.observability.tracing import bind_to_trace
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="symbol-snapshot") as executor:
+        futures = [(key, executor.submit(bind_to_trace(fn))) for key, fn in tasks]
+        return {key: fut.result() for key, fut in futures}
+
+
 def get_snapshots_batch(
     tickers: List[str],
     *,
     derive_avg_stock_volume_20d: bool = True,
     use_cache: bool = True,
+    max_workers: Optional[int] = None,
 ) -> Dict[str, SymbolSnapshot]:
-    """Build canonical snapshots for multiple tickers. Uses batched delayed fetch then core per ticker."""
+    """
+    Build canonical snapshots for multiple tickers. Uses batched delayed fetch, then core and derived per ticker.
+
+    Core/derived cache misses are fetched concurrently (up to max_workers, default
+    SNAPSHOT_BATCH_MAX_WORKERS; 1 = sequential). Fetches share the ORATS rate limiter and
+    singleflight, and results keep the input ticker order.
+    """
     from app.core.data.orats_client import fetch_full_equity_snapshots
     from app.core.orats.orats_core_client import fetch_core_snapshot, derive_avg_stock_volume_20d as _derive_avg
     from app.core.config.orats_secrets import ORATS_API_TOKEN
@@ -252,6 +293,7 @@ def get_snapshots_batch(
     now_iso = datetime.now(timezone.utc).isoformat()
     date_key = datetime.now(timezone.utc).strftime("%Y-%m-%d")
     token = (ORATS_API_TOKEN or "").strip()
+    workers = SNAPSHOT_BATCH_MAX_WORKERS if max_workers is None else max_workers
 
     # Batch delayed quote + iv_rank
     try:
@@ -273,9 +315,7 @@ def get_snapshots_batch(
             snapshot.quote_date = getattr(delayed, "quote_date", None) or None
             snapshot.iv_rank = _coerce_float(getattr(delayed, "iv_rank", None))
             snapshot.quote_as_of = snapshot.quote_date or now_iso
-            for f in ("price", "bid", "ask", "volume", "quote_date", "iv_rank"):
-                if getattr(snapshot, f) is not None:
-                    snapshot.field_sources[f] = "delayed_strikes_ivrank"
+            _apply_delayed_sources(snapshot, delayed)
             if snapshot.price is None:
                 snapshot.missing_reasons["price"] = "Not provided by ORATS delayed quote"
             if snapshot.volume is None:
@@ -288,57 +328,83 @@ def get_snapshots_batch(
             for f in ("price", "bid", "ask", "volume", "quote_date", "iv_rank"):
                 snapshot.missing_reasons[f] = "Delayed quote fetch failed or empty"
             snapshot.quote_as_of = now_iso
+        results[sym] = snapshot
 
-        # Core per ticker
-        cache_key_core = _cache_key(sym, _CACHE_KEY_CORE, date_key)
-        if use_cache and cache_key_core in _snapshot_cache:
-            core_row = _snapshot_cache[cache_key_core]
+    # Core + derived: serve cache hits, collect misses
+    core_rows: Dict[str, Any] = {}
+    derived: Dict[str, Tuple[Optional[float], Optional[Exception]]] = {}
+    tasks: List[Tuple[Any, Callable[[], Any]]] = []
+
+    def _core_task(sym: str) -> Any:
+        try:
+            row = fetch_core_snapshot(sym, ["ticker", "stkVolu", "avgOptVolu20d"], token)
+        except Exception as e:
+            logger.debug("[SYMBOL_SNAPSHOT] %s core fetch failed: %s", sym, e)
+            return None
+        if use_cache:
+            _snapshot_cache.set(_cache_key(sym, _CACHE_KEY_CORE, date_key), row)
+        return row
+
+    def _derived_task(sym: str, trade_date: Optional[str]) -> Tuple[Optional[float], Optional[Exception]]:
+        try:
+            avg = _derive_avg(sym, token, trade_date=trade_date)
+        except Exception as e:
+            return None, e
+        if use_cache:
+            _snapshot_cache.set(_cache_key(sym, _CACHE_KEY_DERIVED, date_key), avg)
+        return avg, None
+
+    for sym in syms:
+        hit = _snapshot_cache.get(_cache_key(sym, _CACHE_KEY_CORE, date_key)) if use_cache else MISSING
+        if hit is not MISSING:
+            core_rows[sym] = hit
+        elif token:
+            tasks.append((("core", sym), lambda s=sym: _core_task(s)))
+        if derive_avg_stock_volume_20d and token:
+            hit = _snapshot_cache.get(_cache_key(sym, _CACHE_KEY_DERIVED, date_key)) if use_cache else MISSING
+            if hit is not MISSING:
+                derived[sym] = (hit, None)
+            else:
+                trade_date = results[sym].quote_date or None
+                tasks.append((("derived", sym), lambda s=sym, d=trade_date: _derived_task(s, d)))
+
+    for (kind, sym), value in _fill_misses(tasks, workers).items():
+        if kind == "core":
+            core_rows[sym] = value
         else:
-            core_row = None
-            if token:
-                try:
-                    core_row = fetch_core_snapshot(sym, ["ticker", "stkVolu", "avgOptVolu20d"], token)
-                    if use_cache:
-                        _snapshot_cache[cache_key_core] = core_row
-                except Exception as e:
-                    logger.debug("[SYMBOL_SNAPSHOT] %s core fetch failed: %s", sym, e)
-            if core_row is not None:
-                snapshot.stock_volume_today = _coerce_int(core_row.get("stkVolu"))
-                snapshot.avg_option_volume_20d = _coerce_float(core_row.get("avgOptVolu20d"))
-                if snapshot.stock_volume_today is not None:
-                    snapshot.field_sources["stock_volume_today"] = "datav2/cores"
-                if snapshot.avg_option_volume_20d is not None:
-                    snapshot.field_sources["avg_option_volume_20d"] = "datav2/cores"
-            snapshot.core_as_of = now_iso
-            if snapshot.stock_volume_today is None:
-                snapshot.missing_reasons["stock_volume_today"] = "Not provided by ORATS Core Data"
-            if snapshot.avg_option_volume_20d is None:
-                snapshot.missing_reasons["avg_option_volume_20d"] = "Not provided by ORATS Core Data"
+            derived[sym] = value
+
+    for sym in syms:
+        snapshot = results[sym]
+        core_row = core_rows.get(sym)
+        if core_row is not None:
+            snapshot.stock_volume_today = _coerce_int(core_row.get("stkVolu"))
+            snapshot.avg_option_volume_20d = _coerce_float(core_row.get("avgOptVolu20d"))
+            if snapshot.stock_volume_today is not None:
+                snapshot.field_sources["stock_volume_today"] = "datav2/cores"
+            if snapshot.avg_option_volume_20d is not None:
+                snapshot.field_sources["avg_option_volume_20d"] = "datav2/cores"
+        snapshot.core_as_of = now_iso
+        if snapshot.stock_volume_today is None:
+            snapshot.missing_reasons["stock_volume_today"] = "Not provided by ORATS Core Data"
+        if snapshot.avg_option_volume_20d is None:
+            snapshot.missing_reasons["avg_option_volume_20d"] = "Not provided by ORATS Core Data"
 
         # Optional derived
-        if derive_avg_stock_volume_20d and token:
-            cache_key_derived = _cache_key(sym, _CACHE_KEY_DERIVED, date_key)
-            if use_cache and cache_key_derived in _snapshot_cache:
-                snapshot.avg_stock_volume_20d = _snapshot_cache[cache_key_derived]
-                if snapshot.avg_stock_volume_20d is not None:
-                    snapshot.field_sources["avg_stock_volume_20d"] = "DERIVED_ORATS_HIST"
+        if sym in derived:
+            avg, err = derived[sym]
+            if err is not None:
+                snapshot.missing_reasons["avg_stock_volume_20d"] = f"Derived calculation failed: {err}"
+            elif avg is not None:
+                snapshot.avg_stock_volume_20d = avg
+                snapshot.field_sources["avg_stock_volume_20d"] = "DERIVED_ORATS_HIST"
             else:
-                try:
-                    avg = _derive_avg(sym, token, trade_date=snapshot.quote_date or None)
-                    if use_cache:
-                        _snapshot_cache[cache_key_derived] = avg
-                    if avg is not None:
-                        snapshot.avg_stock_volume_20d = avg
-                        snapshot.field_sources["avg_stock_volume_20d"] = "DERIVED_ORATS_HIST"
-                    else:
-                        snapshot.missing_reasons["avg_stock_volume_20d"] = "Derived from hist/dailies failed or insufficient data"
-                except Exception as e:
-                    snapshot.missing_reasons["avg_stock_volume_20d"] = f"Derived calculation failed: {e}"
+                snapshot.missing_reasons["avg_stock_volume_20d"] = "Derived from hist/dailies failed or insufficient data"
             snapshot.derived_as_of = now_iso
 
         # Per-symbol snapshot summary (TASK D)
         endpoints_called = []
-        if delayed is not None:
+        if full_map.get(sym) is not None:
             endpoints_called.append("delayed_strikes_ivrank")
         if core_row is not None:
             endpoints_called.append("datav2/cores")
@@ -349,12 +415,10 @@ def get_snapshots_batch(
             "[SYMBOL_SNAPSHOT] %s endpoints=%s quote_as_of=%s core_as_of=%s derived_as_of=%s fields_present=%s",
             sym, endpoints_called, snapshot.quote_as_of, snapshot.core_as_of, snapshot.derived_as_of, fields_present,
         )
-        results[sym] = snapshot
 
     return results
 
 
 def clear_snapshot_cache() -> None:
     """Clear per-run cache (e.g. between tests or runs)."""
-    global _snapshot_cache
     _snapshot_cache.clear()
@@ -13,7 +13,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 
 class ConfidenceBand(str, Enum):
@@ -62,6 +62,7 @@ def compute_confidence_band(
     liquidity_ok: bool,
     score: int,
     position_open: bool = False,
+    band_limits: Optional[Tuple[int, int]] = None,
 ) -> CapitalHint:
     """
     Compute confidence band and suggested capital % from evaluation result.
@@ -71,10 +72,12 @@ def compute_confidence_band(
     - A: ELIGIBLE, score >= band_a_min (78), RISK_ON, data_completeness >= 0.75, liquidity_ok, no position_open, completeness >= 0.9.
     - B: ELIGIBLE with score >= band_b_min (60) but any gate not meeting A; or NEUTRAL/minor gaps/position open.
     - C: Not ELIGIBLE, or score < band_b_min, or data_completeness < 0.75; band_reason set.
+
+    band_limits: (band_a_min, band_b_min) from the run's ScoringProfile; read from config if None.
     """
     verdict_upper = (verdict or "").strip().upper()
     regime_upper = (regime or "").strip().upper()
-    band_a_min, band_b_min = _get_band_limits()
+    band_a_min, band_b_min = band_limits if band_limits is not None else _get_band_limits()
 
     def make_hint(band: ConfidenceBand, reason: str) -> CapitalHint:
         return CapitalHint(
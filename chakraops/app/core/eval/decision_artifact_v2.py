@@ -8,6 +8,9 @@ import re
 from dataclasses import asdict, dataclass, field
 from typing import Any, Dict, List, Literal, Optional
 
+from app.core.eval.symbol_index import SymbolIndex, cached_symbol_index
+from app.core.io.json_codec import shallow_asdict
+
 # Band mapping: centralized logic. NEVER null — D for lowest.
 try:
     from app.core.scoring.config import TIER_A_MIN, TIER_B_MIN, TIER_C_MIN
@@ -272,6 +275,22 @@ class DecisionArtifactV2:
     diagnostics_by_symbol: Dict[str, SymbolDiagnosticsDetails] = field(default_factory=dict)
     warnings: List[str] = field(default_factory=list)
 
+    @property
+    def symbol_index(self) -> SymbolIndex:
+        """Symbol -> SymbolEvalSummary, built once per artifact and shared by all readers."""
+        return cached_symbol_index(self, "symbols")
+
+    @property
+    def selected_by_symbol(self) -> SymbolIndex:
+        """Symbol -> first selected CandidateRow (same row the old next(...) scans picked)."""
+        return cached_symbol_index(self, "selected_candidates")
+
+    def get_symbol_summary(self, symbol: str) -> Optional[SymbolEvalSummary]:
+        return self.symbol_index.get(symbol)
+
+    def get_selected_candidate(self, symbol: str) -> Optional[CandidateRow]:
+        return self.selected_by_symbol.get(symbol)
+
     def to_dict(self) -> Dict[str, Any]:
         out: Dict[str, Any] = {
             "metadata": self.metadata,
@@ -298,8 +317,10 @@ class DecisionArtifactV2:
     def to_dict_persist(self) -> Dict[str, Any]:
         """R22.7: Persist code-only; no prose, no FAIL_*/WARN_* in values. Strict code regex only."""
 
+        # Shallow field dicts instead of asdict() deep copies; only top-level keys are
+        # changed here and nested dicts that are edited are copied first
         def symbol_persist(s: SymbolEvalSummary) -> Dict[str, Any]:
-            d = asdict(s)
+            d = shallow_asdict(s)
             d.pop("primary_reason", None)
             d.pop("band_reason", None)
             codes = d.get("primary_reason_codes")
@@ -316,7 +337,7 @@ class DecisionArtifactV2:
             return d
 
         def candidate_persist(c: CandidateRow) -> Dict[str, Any]:
-            d = asdict(c)
+            d = shallow_asdict(c)
             d.pop("why_this_trade", None)
             # R22.7: ensure contract identity for options — derive contract_key if missing
             if (d.get("strategy") or "").upper() in ("CSP", "CC") and not d.get("contract_key") and not d.get("option_symbol"):
@@ -330,12 +351,14 @@ class DecisionArtifactV2:
             return {"name": g.name, "status": g.status}
 
         def _diagnostics_persist(dd: SymbolDiagnosticsDetails) -> Dict[str, Any]:
-            out = dd.to_dict()
+            out = shallow_asdict(dd)
+            out.pop("reasons_explained", None)
             out.pop("explanation", None)
             # R22.7: no prose in score_caps.applied_caps[].reason — use reason_code only if present
             sc = out.get("score_breakdown") or {}
             applied = sc.get("applied_caps") or []
             if applied:
+                sc = dict(sc)
                 clean = []
                 for cap in applied:
                     c = dict(cap)
@@ -369,7 +392,7 @@ class DecisionArtifactV2:
                 for k, v in self.gates_by_symbol.items()
             },
             "earnings_by_symbol": {
-                k: v.to_dict() for k, v in self.earnings_by_symbol.items()
+                k: shallow_asdict(v) for k, v in self.earnings_by_symbol.items()
             },
             "diagnostics_by_symbol": {
                 k: _diagnostics_persist(v) for k, v in self.diagnostics_by_symbol.items()
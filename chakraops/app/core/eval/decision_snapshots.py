@@ -0,0 +1,80 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""
+Phase 10: Timestamped decision snapshots shared by scripts/run_and_save.py and the eval worker.
+
+- resolve_symbols(): explicit symbols, the whole universe, or its first `limit` symbols
+- write_timestamped_decision(): out/decision_<UTC time>Z.json next to decision_latest.json
+- enforce_retention(): delete timestamped copies older than max_days (decision_latest.json
+  and the sample files are kept)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SYMBOLS = ["SPY", "AAPL"]
+DECISION_RETENTION_DAYS = 7
+_KEEP = {"decision_latest.json", "sample_decision.json", "sample_decision_rich.json"}
+
+
+def resolve_symbols(symbols: Optional[Sequence[str]] = None, all_symbols: bool = False, limit: int = 5) -> List[str]:
+    """Explicit symbols (upper-cased), else the universe (all, or the first `limit`). Falls back to DEFAULT_SYMBOLS."""
+    if all_symbols:
+        try:
+            from app.api.data_health import get_universe_symbols
+            return list(get_universe_symbols())
+        except Exception as e:
+            raise RuntimeError(f"Failed to load universe: {e}") from e
+    if symbols:
+        out = [s.strip().upper() for s in symbols if s and s.strip()]
+    else:
+        try:
+            from app.api.data_health import get_universe_symbols
+            out = list(get_universe_symbols())[:limit]
+        except Exception:
+            out = (DEFAULT_SYMBOLS * 2)[:limit]
+    return out or DEFAULT_SYMBOLS.copy()
+
+
+def write_timestamped_decision(artifact_dict: Dict[str, Any], out_dir: Path) -> Path:
+    """Write artifact_dict to out_dir/decision_<YYYY-MM-DDTHHMMSS>Z.json. Returns the path."""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    ts = datetime.now(timezone.utc)
+    out_path = out_dir / f"decision_{ts.strftime('%Y-%m-%dT%H%M%S')}Z.json"
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump(artifact_dict, f, indent=2, default=str)
+    return out_path
+
+
+def enforce_retention(output_dir: Path, max_days: int = DECISION_RETENTION_DAYS) -> Tuple[int, List[str]]:
+    """Delete old timestamped decision files beyond retention. Keep decision_latest.json."""
+    files = [f for f in Path(output_dir).glob("decision_*.json") if f.name not in _KEEP]
+    if not files:
+        return 0, []
+    cutoff_ts = (datetime.now(timezone.utc) - timedelta(days=max_days)).timestamp()
+    deleted: List[str] = []
+    for f in files:
+        try:
+            if f.stat().st_mtime < cutoff_ts:
+                f.unlink()
+                deleted.append(f.name)
+        except OSError as e:
+            logger.warning("[DECISION] failed to delete %s: %s", f.name, e)
+    return len(deleted), deleted
+
+
+__all__ = [
+    "DECISION_RETENTION_DAYS",
+    "DEFAULT_SYMBOLS",
+    "enforce_retention",
+    "resolve_symbols",
+    "write_timestamped_decision",
+]
@@ -0,0 +1,630 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""
+Phase 10: Warm, long-lived evaluation worker for /api/ops/evaluate.
+
+Previously every trigger ran `python -m scripts.run_and_save` in a fresh subprocess:
+interpreter start, pandas/fastapi imports and cold EquityQuoteCache / ChainCache /
+snapshot caches each time, with a hard 120s timeout. EvalWorker instead keeps one
+process alive and runs jobs from a priority queue:
+
+- "symbol" jobs (single-symbol recompute, PRIORITY_SYMBOL) run on a fast lane so they
+  never wait behind a full universe run; "universe" jobs run on the general lane
+- progress (stage, done, total) is reported through run_control while the staged
+  evaluator runs; cancel() stops a queued job at once and a running one at the next
+  stage-1/stage-2 completion
+- jobs have a soft deadline (EVAL_JOB_TIMEOUT_SEC) instead of the hard subprocess kill
+
+The worker runs in its own process (scripts/eval_worker.py) listening on a local
+multiprocessing.connection socket, so job state and warm caches survive API reloads.
+The API side uses submit_eval_job() / get_eval_job() / cancel_eval_job(), which start
+the process on first use and fall back to an in-process worker if it cannot be reached.
+EVAL_WORKER_MODE=inline skips the process entirely.
+
+Requests and responses are JSON (never pickle). Connections authenticate with a per-install
+secret (EVAL_WORKER_AUTHKEY, else artifacts/state/eval_worker.key, created 0600 on first use).
+ping reports the worker's code_version(); a worker left running from an older deploy is told
+to shut down and a current one is started in its place.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import heapq
+import itertools
+import json
+import logging
+import os
+import secrets
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from multiprocessing.connection import Client, Listener
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.core.eval.run_control import EvaluationCancelled, RunControl, run_control_scope
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_SYMBOL = 0
+PRIORITY_UNIVERSE = 10
+JOB_KINDS = ("universe", "symbol")
+
+DEFAULT_JOB_TIMEOUT_SEC = float(os.getenv("EVAL_JOB_TIMEOUT_SEC", "900"))
+MAX_FINISHED_JOBS = 200
+DEFAULT_UNIVERSE_LIMIT = 5
+
+WORKER_HOST = "127.0.0.1"
+WORKER_PORT = int(os.getenv("EVAL_WORKER_PORT", "8767"))
+WORKER_START_TIMEOUT_SEC = 20.0
+WORKER_STOP_TIMEOUT_SEC = 10.0
+
+_TERMINAL_STATES = ("done", "failed", "cancelled")
+
+
+def _repo_root() -> Path:
+    return Path(__file__).resolve().parents[3]
+
+
+def _authkey_path() -> Path:
+    return _repo_root() / "artifacts" / "state" / "eval_worker.key"
+
+
+def worker_authkey() -> bytes:
+    """EVAL_WORKER_AUTHKEY, else the per-install secret file (created 0600 with a random key)."""
+    env = os.getenv("EVAL_WORKER_AUTHKEY", "").strip()
+    if env:
+        return env.encode()
+    path = _authkey_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        return path.read_bytes().strip()
+    with os.fdopen(fd, "wb") as f:
+        f.write(secrets.token_hex(32).encode())
+    return path.read_bytes().strip()
+
+
+_CODE_VERSION: Optional[str] = None
+
+
+def code_version() -> str:
+    """Fingerprint of the deployed code (path, size, mtime of app/ and scripts/ sources)."""
+    global _CODE_VERSION
+    if _CODE_VERSION is None:
+        root = _repo_root()
+        h = hashlib.sha256()
+        for sub in ("app", "scripts"):
+            for p in sorted((root / sub).rglob("*.py")):
+                try:
+                    st = p.stat()
+                except OSError:
+                    continue
+                h.update(f"{p.relative_to(root)}:{st.st_size}:{st.st_mtime_ns}\n".encode())
+        _CODE_VERSION = h.hexdigest()[:16]
+    return _CODE_VERSION
+
+
+@dataclass
+class EvalJob:
+    """One queued/running/finished evaluation. to_dict() is the /api/ops/evaluate/{job_id} payload."""
+
+    job_id: str
+    kind: str
+    priority: int
+    symbols: Optional[List[str]] = None
+    all_symbols: bool = False
+    limit: int = DEFAULT_UNIVERSE_LIMIT
+    timeout_sec: Optional[float] = None
+    state: str = "queued"
+    submitted_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    error: Optional[str] = None
+    progress: Dict[str, Any] = field(default_factory=lambda: {"stage": None, "done": 0, "total": 0})
+    result: Optional[Dict[str, Any]] = None
+    control: Optional[RunControl] = field(default=None, repr=False, compare=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "kind": self.kind,
+            "priority": self.priority,
+            "symbols": list(self.symbols) if self.symbols else None,
+            "state": self.state,
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "error": self.error,
+            "progress": dict(self.progress),
+            "result": self.result,
+        }
+
+
+Runner = Callable[[EvalJob], Dict[str, Any]]
+
+
+# ---------------------------------------------------------------------------
+# Default job runners
+# ---------------------------------------------------------------------------
+
+
+def _resolve_universe_symbols(job: EvalJob) -> List[str]:
+    """Same resolution as scripts/run_and_save.py: explicit symbols, --all, or the first `limit` of the universe."""
+    from app.core.eval.decision_snapshots import resolve_symbols
+    return resolve_symbols(job.symbols, all_symbols=job.all_symbols, limit=max(1, job.limit))
+
+
+def _write_timestamped_copy(artifact_dict: Dict[str, Any]) -> Path:
+    """decision_<ts>Z.json next to decision_latest.json, with run_and_save's retention."""
+    from app.core.eval.decision_snapshots import enforce_retention, write_timestamped_decision
+    from app.core.eval.evaluation_store_v2 import get_decision_store_path
+    out_dir = get_decision_store_path().parent
+    out_path = write_timestamped_decision(artifact_dict, out_dir)
+    enforce_retention(out_dir)
+    return out_path
+
+
+def run_universe_job(job: EvalJob) -> Dict[str, Any]:
+    from app.core.eval.evaluation_service_v2 import evaluate_universe
+    symbols = _resolve_universe_symbols(job)
+    if not symbols:
+        raise ValueError("No symbols to evaluate")
+    artifact = evaluate_universe(symbols, mode="LIVE")
+    out_path = _write_timestamped_copy(artifact.to_dict())
+    return {"symbols_evaluated": len(symbols), "path": str(out_path)}
+
+
+def run_symbol_job(job: EvalJob) -> Dict[str, Any]:
+    from app.core.eval.evaluation_service_v2 import evaluate_single_symbol_and_merge
+    symbol = (job.symbols or [""])[0]
+    if job.control is not None:
+        job.control.report("symbol", 0, 1)
+    merged = evaluate_single_symbol_and_merge(symbol=symbol)
+    if job.control is not None:
+        job.control.report("symbol", 1, 1)
+    meta = (merged.metadata or {}) if merged else {}
+    return {"symbol": symbol, "pipeline_timestamp": meta.get("pipeline_timestamp")}
+
+
+DEFAULT_RUNNERS: Dict[str, Runner] = {"universe": run_universe_job, "symbol": run_symbol_job}
+
+
+# ---------------------------------------------------------------------------
+# Worker
+# ---------------------------------------------------------------------------
+
+
+class EvalWorker:
+    """Priority job queue with a general lane and a fast lane for PRIORITY_SYMBOL jobs."""
+
+    def __init__(
+        self,
+        runners: Optional[Dict[str, Runner]] = None,
+        fast_lane: bool = True,
+        timeout_sec: Optional[float] = DEFAULT_JOB_TIMEOUT_SEC,
+    ) -> None:
+        self._runners = dict(runners or DEFAULT_RUNNERS)
+        self._fast_lane = fast_lane
+        self._timeout_sec = timeout_sec
+        self._cond = threading.Condition()
+        self._heap: List[Tuple[int, int, str]] = []
+        self._seq = itertools.count()
+        self._jobs: "OrderedDict[str, EvalJob]" = OrderedDict()
+        self._threads: List[threading.Thread] = []
+        self._stopped = False
+        self._started_at = time.time()
+        self._jobs_run = 0
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self) -> "EvalWorker":
+        with self._cond:
+            if self._threads:
+                return self
+            lanes = [("general", False)] + ([("fast", True)] if self._fast_lane else [])
+            for name, fast in lanes:
+                t = threading.Thread(target=self._lane_loop, args=(fast,), name=f"eval-worker-{name}", daemon=True)
+                self._threads.append(t)
+                t.start()
+        return self
+
+    def stop(self, timeout: float = 5.0) -> None:
+        with self._cond:
+            self._stopped = True
+            for job in self._jobs.values():
+                if job.control is not None:
+                    job.control.cancel()
+            self._cond.notify_all()
+        for t in self._threads:
+            t.join(timeout=timeout)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def submit(
+        self,
+        kind: str,
+        symbols: Optional[List[str]] = None,
+        priority: Optional[int] = None,
+        all_symbols: bool = False,
+        limit: int = DEFAULT_UNIVERSE_LIMIT,
+        timeout_sec: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        if kind not in self._runners:
+            raise ValueError(f"Unknown job kind: {kind}")
+        if kind == "symbol" and not symbols:
+            raise ValueError("symbol job requires a symbol")
+        if priority is None:
+            priority = PRIORITY_SYMBOL if kind == "symbol" else PRIORITY_UNIVERSE
+        job = EvalJob(
+            job_id=str(uuid.uuid4()),
+            kind=kind,
+            priority=int(priority),
+            symbols=[s.strip().upper() for s in symbols] if symbols else None,
+            all_symbols=bool(all_symbols),
+            limit=int(limit),
+            timeout_sec=timeout_sec if timeout_sec is not None else self._timeout_sec,
+        )
+        with self._cond:
+            self._jobs[job.job_id] = job
+            heapq.heappush(self._heap, (job.priority, next(self._seq), job.job_id))
+            self._trim_finished()
+            self._cond.notify_all()
+        logger.info("[EVAL_WORKER] queued %s job %s (priority=%d)", kind, job.job_id, job.priority)
+        return job.to_dict()
+
+    def status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._cond:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            out = job.to_dict()
+            entry = next((e for e in self._heap if e[2] == job_id), None)
+            if job.state == "queued" and entry is not None:
+                out["queue_position"] = sum(1 for e in self._heap if e < entry)
+            return out
+
+    def cancel(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._cond:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            if job.state == "queued":
+                self._heap = [e for e in self._heap if e[2] != job_id]
+                heapq.heapify(self._heap)
+                job.state = "cancelled"
+                job.finished_at = time.time()
+                job.error = "Cancelled"
+            elif job.state == "running" and job.control is not None:
+                job.control.cancel()
+            return job.to_dict()
+
+    def jobs(self) -> List[Dict[str, Any]]:
+        with self._cond:
+            return [j.to_dict() for j in self._jobs.values()]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            states = [j.state for j in self._jobs.values()]
+            return {
+                "pid": os.getpid(),
+                "started_at": self._started_at,
+                "uptime_sec": round(time.time() - self._started_at, 1),
+                "jobs_run": self._jobs_run,
+                "queued": states.count("queued"),
+                "running": states.count("running"),
+            }
+
+    # ------------------------------------------------------------------
+    # Lanes
+    # ------------------------------------------------------------------
+
+    def _trim_finished(self) -> None:
+        # Caller holds self._cond
+        finished = [jid for jid, j in self._jobs.items() if j.state in _TERMINAL_STATES]
+        for jid in finished[: max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self._jobs[jid]
+
+    def _take(self, fast: bool) -> Optional[EvalJob]:
+        # Caller holds self._cond. The fast lane only takes PRIORITY_SYMBOL work.
+        while self._heap:
+            priority, _, job_id = self._heap[0]
+            if fast and priority > PRIORITY_SYMBOL:
+                return None
+            heapq.heappop(self._heap)
+            job = self._jobs.get(job_id)
+            if job is not None and job.state == "queued":
+                return job
+        return None
+
+    def _lane_loop(self, fast: bool) -> None:
+        while True:
+            with self._cond:
+                job = self._take(fast)
+                while job is None:
+                    if self._stopped:
+                        return
+                    self._cond.wait()
+                    job = self._take(fast)
+                job.state = "running"
+                job.started_at = time.time()
+                job.control = RunControl(
+                    timeout_sec=job.timeout_sec,
+                    on_progress=lambda p, j=job: j.progress.update(p),
+                )
+            self._run(job)
+
+    def _run(self, job: EvalJob) -> None:
+        t0 = time.perf_counter()
+        state, error, result = "done", None, None
+        try:
+            with run_control_scope(job.control):
+                result = self._runners[job.kind](job)
+        except EvaluationCancelled as e:
+            state, error = ("failed", "Timeout") if str(e) == "Timeout" else ("cancelled", "Cancelled")
+        except Exception as e:
+            logger.exception("[EVAL_WORKER] %s job %s failed: %s", job.kind, job.job_id, e)
+            state, error = "failed", str(e)[:500]
+        with self._cond:
+            job.state, job.error, job.result = state, error, result
+            job.finished_at = time.time()
+            self._jobs_run += 1
+        logger.info(
+            "[EVAL_WORKER] %s job %s %s in %.1fs", job.kind, job.job_id, state, time.perf_counter() - t0
+        )
+
+
+# ---------------------------------------------------------------------------
+# Local socket server (worker process) and client (API process)
+# ---------------------------------------------------------------------------
+
+
+def _send_json(conn: Any, obj: Dict[str, Any]) -> None:
+    conn.send_bytes(json.dumps(obj, default=str).encode("utf-8"))
+
+
+def _recv_json(conn: Any) -> Dict[str, Any]:
+    obj = json.loads(conn.recv_bytes().decode("utf-8"))
+    if not isinstance(obj, dict):
+        raise ValueError("expected a JSON object")
+    return obj
+
+
+def _handle(worker: EvalWorker, req: Dict[str, Any]) -> Dict[str, Any]:
+    op = req.get("op")
+    if op == "ping":
+        return {"ok": True, "stats": worker.stats(), "version": code_version()}
+    if op == "submit":
+        return {"ok": True, "job": worker.submit(**req.get("args", {}))}
+    if op == "status":
+        return {"ok": True, "job": worker.status(req.get("job_id", ""))}
+    if op == "cancel":
+        return {"ok": True, "job": worker.cancel(req.get("job_id", ""))}
+    if op == "jobs":
+        return {"ok": True, "jobs": worker.jobs()}
+    return {"ok": False, "error": f"unknown op {op!r}"}
+
+
+def serve_eval_worker(
+    worker: Optional[EvalWorker] = None,
+    address: Tuple[str, int] = (WORKER_HOST, WORKER_PORT),
+    authkey: Optional[bytes] = None,
+    stop_event: Optional[threading.Event] = None,
+    on_listening: Optional[Callable[[Tuple[str, int]], None]] = None,
+) -> None:
+    """Serve requests for worker on address until stop_event is set or a shutdown request arrives."""
+    worker = (worker or EvalWorker()).start()
+    stop_event = stop_event or threading.Event()
+    authkey = authkey if authkey is not None else worker_authkey()
+    with Listener(address, authkey=authkey) as listener:
+        logger.info("[EVAL_WORKER] listening on %s:%d (pid=%d, version=%s)", *listener.address, os.getpid(), code_version())
+        if on_listening is not None:
+            on_listening(listener.address)
+
+        def _serve(conn) -> None:
+            with conn:
+                try:
+                    try:
+                        req = _recv_json(conn)
+                        if req.get("op") == "shutdown":
+                            logger.info("[EVAL_WORKER] shutdown requested (version=%s)", code_version())
+                            stop_event.set()
+                            resp = {"ok": True}
+                        else:
+                            resp = _handle(worker, req)
+                    except (EOFError, OSError):
+                        raise
+                    except Exception as e:
+                        resp = {"ok": False, "error": str(e)[:500]}
+                    _send_json(conn, resp)
+                except (EOFError, OSError):
+                    return
+                if stop_event.is_set():
+                    try:
+                        Client(listener.address, authkey=authkey).close()  # wake accept() so the loop exits
+                    except (EOFError, OSError):
+                        pass
+
+        while not stop_event.is_set():
+            try:
+                conn = listener.accept()
+            except Exception as e:
+                if not stop_event.is_set():
+                    logger.warning("[EVAL_WORKER] accept failed: %s", e)
+                continue
+            if stop_event.is_set():
+                conn.close()
+                break
+            threading.Thread(target=_serve, args=(conn,), daemon=True).start()
+    worker.stop()
+
+
+class EvalWorkerClient:
+    """Request/response client for a worker process; one short connection per call."""
+
+    def __init__(
+        self,
+        address: Tuple[str, int] = (WORKER_HOST, WORKER_PORT),
+        authkey: Optional[bytes] = None,
+    ) -> None:
+        self.address = address
+        self._authkey = authkey if authkey is not None else worker_authkey()
+
+    def request(self, op: str, **kwargs: Any) -> Dict[str, Any]:
+        with Client(self.address, authkey=self._authkey) as conn:
+            _send_json(conn, {"op": op, **kwargs})
+            resp = _recv_json(conn)
+        if not resp.get("ok"):
+            raise RuntimeError(resp.get("error") or "eval worker error")
+        return resp
+
+    def version(self) -> Optional[str]:
+        """The worker's code_version(), or None when it cannot be reached."""
+        try:
+            return self.request("ping").get("version")
+        except Exception:
+            return None
+
+    def ping(self) -> bool:
+        return self.version() is not None
+
+    def shutdown(self) -> bool:
+        try:
+            self.request("shutdown")
+            return True
+        except Exception:
+            return False
+
+    def submit(self, kind: str, **args: Any) -> Dict[str, Any]:
+        return self.request("submit", args={"kind": kind, **args})["job"]
+
+    def status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        return self.request("status", job_id=job_id)["job"]
+
+    def cancel(self, job_id: str) -> Optional[Dict[str, Any]]:
+        return self.request("cancel", job_id=job_id)["job"]
+
+
+def _spawn_worker_process() -> None:
+    """Start scripts/eval_worker.py detached from the API process so it outlives reloads."""
+    log_dir = _repo_root() / "logs"
+    log_dir.mkdir(parents=True, exist_ok=True)
+    with open(log_dir / "eval_worker.log", "ab") as log:
+        subprocess.Popen(
+            [sys.executable, "-m", "scripts.eval_worker", "--port", str(WORKER_PORT)],
+            cwd=str(_repo_root()),
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            stdin=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+
+
+# ---------------------------------------------------------------------------
+# API-side facade
+# ---------------------------------------------------------------------------
+
+_FACADE_LOCK = threading.Lock()
+_CLIENT: Optional[EvalWorkerClient] = None
+_INLINE_WORKER: Optional[EvalWorker] = None
+_RELOADED_JOBS: set = set()
+
+
+def _inline_worker() -> EvalWorker:
+    global _INLINE_WORKER
+    if _INLINE_WORKER is None:
+        _INLINE_WORKER = EvalWorker().start()
+    return _INLINE_WORKER
+
+
+def _backend() -> Any:
+    """Worker-process client when reachable (starting it if needed), else the in-process worker."""
+    global _CLIENT
+    with _FACADE_LOCK:
+        if os.getenv("EVAL_WORKER_MODE", "process").strip().lower() == "inline" or _INLINE_WORKER is not None:
+            return _inline_worker()
+        if _CLIENT is not None:
+            return _CLIENT
+        client = EvalWorkerClient()
+        running = client.version()
+        if running is not None and running != code_version():
+            # Left over from an older deploy (it runs detached): replace it with current code
+            logger.info("[EVAL_WORKER] worker version %s != %s; restarting it", running, code_version())
+            client.shutdown()
+            deadline = time.monotonic() + WORKER_STOP_TIMEOUT_SEC
+            while time.monotonic() < deadline and client.ping():
+                time.sleep(0.25)
+        if not client.ping():
+            try:
+                _spawn_worker_process()
+            except Exception as e:
+                logger.warning("[EVAL_WORKER] could not start worker process: %s", e)
+            deadline = time.monotonic() + WORKER_START_TIMEOUT_SEC
+            while time.monotonic() < deadline and not client.ping():
+                time.sleep(0.25)
+        if client.version() == code_version():
+            _CLIENT = client
+            return client
+        logger.warning("[EVAL_WORKER] worker process unreachable; running jobs in the API process")
+        return _inline_worker()
+
+
+def _call(method: str, *args: Any, **kwargs: Any) -> Any:
+    global _CLIENT
+    backend = _backend()
+    try:
+        return getattr(backend, method)(*args, **kwargs)
+    except (ConnectionError, EOFError, OSError):
+        # Worker went away (e.g. killed); reconnect or restart once
+        with _FACADE_LOCK:
+            _CLIENT = None
+        return getattr(_backend(), method)(*args, **kwargs)
+
+
+def submit_eval_job(kind: str = "universe", **args: Any) -> Dict[str, Any]:
+    return _call("submit", kind, **args)
+
+
+def get_eval_job(job_id: str) -> Optional[Dict[str, Any]]:
+    job = _call("status", job_id)
+    # The worker writes the decision store in its own process; refresh ours once per finished job
+    if job and job.get("state") == "done" and isinstance(_backend(), EvalWorkerClient):
+        with _FACADE_LOCK:
+            fresh = job_id not in _RELOADED_JOBS
+            _RELOADED_JOBS.add(job_id)
+        if fresh:
+            try:
+                from app.core.eval.evaluation_store_v2 import get_evaluation_store_v2
+                get_evaluation_store_v2().reload_from_disk()
+            except Exception as e:
+                logger.debug("[EVAL_WORKER] store reload after %s failed: %s", job_id, e)
+    return job
+
+
+def cancel_eval_job(job_id: str) -> Optional[Dict[str, Any]]:
+    return _call("cancel", job_id)
+
+
+__all__ = [
+    "EvalJob",
+    "EvalWorker",
+    "EvalWorkerClient",
+    "PRIORITY_SYMBOL",
+    "PRIORITY_UNIVERSE",
+    "cancel_eval_job",
+    "code_version",
+    "get_eval_job",
+    "serve_eval_worker",
+    "submit_eval_job",
+    "worker_authkey",
+]
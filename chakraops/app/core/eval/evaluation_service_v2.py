@@ -24,6 +24,7 @@ from app.core.eval.decision_artifact_v2 import (
     compute_rank_score,
 )
 from app.core.eval.evaluation_store_v2 import get_evaluation_store_v2
+from app.core.observability.tracing import span, start_span, trace_run
 
 logger = logging.getLogger(__name__)
 
@@ -37,7 +38,19 @@ def evaluate_universe(
     ONE evaluation engine for batch universe.
     Runs staged evaluation, produces DecisionArtifactV2, stores in EvaluationStoreV2.
     Returns the artifact. Also writes decision_latest.json (v2) to disk.
+    The run is traced (spans saved under artifacts/runs/traces/<run_id>.json).
     """
+    run_id_val = str(uuid.uuid4())
+    with trace_run(run_id_val, source="evaluate_universe", symbols=len(symbols)):
+        return _evaluate_universe(symbols, mode, output_dir, run_id_val)
+
+
+def _evaluate_universe(
+    symbols: List[str],
+    mode: str,
+    output_dir: Optional[str],
+    run_id_val: str,
+) -> DecisionArtifactV2:
     from app.core.eval.universe_evaluator import run_universe_evaluation_staged
     from app.market.market_hours import get_market_phase
 
@@ -52,6 +65,7 @@ def evaluate_universe(
     # Run staged evaluation (ONE engine)
     result = run_universe_evaluation_staged(symbols, use_staged=True)
     staged_symbols = getattr(result, "symbols", []) or []
+    build_span = start_span("build.decision_artifact_v2", "artifact", symbols=len(symbols))
 
     # Build result map by symbol
     by_symbol: Dict[str, Any] = {}
@@ -287,7 +301,6 @@ def evaluate_universe(
         # Phase 7.7: diagnostics_by_symbol
         diagnostics_by_symbol[sym_upper] = _build_diagnostics_details(sr, sym_upper, ts)
 
-    run_id_val = str(uuid.uuid4())
     metadata = {
         "artifact_version": "v2",
         "mode": mode,
@@ -312,10 +325,12 @@ def evaluate_universe(
         diagnostics_by_symbol=diagnostics_by_symbol,
         warnings=[],
     )
+    build_span.end()
 
     # Store (writes to disk)
     store = get_evaluation_store_v2()
-    store.set_latest(artifact)
+    with span("persist.decision_store_v2", "persistence"):
+        store.set_latest(artifact)
 
     logger.info("[EVAL_SVC_V2] evaluate_universe: %d symbols, %d stage2, %d eligible", len(symbols), stage2_count, eligible_count)
     return artifact
@@ -565,133 +580,152 @@ def _build_symbol_data_from_staged(
     return summary, cand_list, gates, earnings
 
 
+def _not_evaluated_symbol_data(sym_upper: str) -> tuple:
+    _empty: Dict[str, Any] = {}
+    summary = SymbolEvalSummary(
+        symbol=sym_upper,
+        verdict="NOT_EVALUATED",
+        final_verdict="NOT_EVALUATED",
+        score=None,
+        band="D",
+        primary_reason="Not evaluated",
+        stage_status="NOT_RUN",
+        stage1_status="NOT_RUN",
+        stage2_status="NOT_RUN",
+        provider_status=None,
+        data_freshness=None,
+        evaluated_at=None,
+        strategy=None,
+        price=None,
+        expiration=None,
+        has_candidates=False,
+        candidate_count=0,
+    )
+    diagnostics_details = SymbolDiagnosticsDetails(
+        technicals=_empty,
+        exit_plan={"t1": None, "t2": None, "t3": None, "stop": None},
+        risk_flags=_empty,
+        explanation=_empty,
+        stock=_empty,
+        symbol_eligibility=_empty,
+        liquidity=_empty,
+    )
+    return summary, [], [], EarningsInfo(None, None, "Not evaluated"), diagnostics_details
+
+
 def evaluate_single_symbol_and_merge(symbol: str, mode: str = "LIVE") -> DecisionArtifactV2:
     """
     Run staged evaluation for one symbol and merge into the current store artifact.
     Updates store, returns the merged artifact.
     """
+    sym_upper = symbol.strip().upper()
+    if not sym_upper:
+        raise ValueError("symbol required")
+    return evaluate_symbols_and_merge([sym_upper], mode=mode)
+
+
+def evaluate_symbols_and_merge(symbols: List[str], mode: str = "LIVE") -> DecisionArtifactV2:
+    """
+    Run one staged evaluation for a small batch of symbols and merge each result into the
+    current store artifact (other symbols keep their last evaluation). Used by single-symbol
+    recompute and by the tiered scheduler's continuous batches. Updates store, returns the merged artifact.
+    """
     from app.core.eval.universe_evaluator import run_universe_evaluation_staged
     from app.market.market_hours import get_market_phase
 
     ts = datetime.now(timezone.utc).isoformat()
     phase = get_market_phase() or "UNKNOWN"
-    sym_upper = symbol.strip().upper()
-    if not sym_upper:
+    batch: List[str] = []
+    for s in symbols:
+        sym_upper = (s or "").strip().upper()
+        if sym_upper and sym_upper not in batch:
+            batch.append(sym_upper)
+    if not batch:
         raise ValueError("symbol required")
 
-    result = run_universe_evaluation_staged([sym_upper], use_staged=True)
-    staged_symbols = getattr(result, "symbols", []) or []
-    sr = next((s for s in staged_symbols if (getattr(s, "symbol", "") or "").strip().upper() == sym_upper), None)
+    # publish=False: a partial batch must not replace the universe views' last full run
+    result = run_universe_evaluation_staged(batch, use_staged=True, publish=False)
+    staged_by_symbol: Dict[str, Any] = {}
+    for sr in getattr(result, "symbols", []) or []:
+        key = (getattr(sr, "symbol", "") or "").strip().upper()
+        if key in batch and key not in staged_by_symbol:
+            staged_by_symbol[key] = sr
 
     store = get_evaluation_store_v2()
     current = store.get_latest()
 
-    _empty: Dict[str, Any] = {}
-    if sr is None:
-        summary = SymbolEvalSummary(
-            symbol=sym_upper,
-            verdict="NOT_EVALUATED",
-            final_verdict="NOT_EVALUATED",
-            score=None,
-            band="D",
-            primary_reason="Not evaluated",
-            stage_status="NOT_RUN",
-            stage1_status="NOT_RUN",
-            stage2_status="NOT_RUN",
-            provider_status=None,
-            data_freshness=None,
-            evaluated_at=None,
-            strategy=None,
-            price=None,
-            expiration=None,
-            has_candidates=False,
-            candidate_count=0,
-        )
-        cand_list: List[CandidateRow] = []
-        gates: List[GateEvaluation] = []
-        earnings = EarningsInfo(None, None, "Not evaluated")
-        diagnostics_details = SymbolDiagnosticsDetails(
-            technicals=_empty,
-            exit_plan={"t1": None, "t2": None, "t3": None, "stop": None},
-            risk_flags=_empty,
-            explanation=_empty,
-            stock=_empty,
-            symbol_eligibility=_empty,
-            liquidity=_empty,
-        )
-    else:
-        summary, cand_list, gates, earnings = _build_symbol_data_from_staged(sr, sym_upper, ts)
-        diagnostics_details = _build_diagnostics_details(sr, sym_upper, ts)
+    symbols_list: List[SymbolEvalSummary] = list(current.symbols) if current is not None else []
+    positions = {s.symbol: i for i, s in enumerate(symbols_list)}
+    candidates_by_symbol = dict(current.candidates_by_symbol) if current is not None else {}
+    gates_by_symbol = dict(current.gates_by_symbol) if current is not None else {}
+    earnings_by_symbol = dict(current.earnings_by_symbol) if current is not None else {}
+    diagnostics_by_symbol = dict(current.diagnostics_by_symbol) if current is not None else {}
+    selected = [
+        c for c in (current.selected_candidates if current is not None else [])
+        if (c.symbol or "").strip().upper() not in batch
+    ]
+
+    for sym_upper in batch:
+        sr = staged_by_symbol.get(sym_upper)
+        if sr is None:
+            summary, cand_list, gates, earnings, diagnostics_details = _not_evaluated_symbol_data(sym_upper)
+        else:
+            summary, cand_list, gates, earnings = _build_symbol_data_from_staged(sr, sym_upper, ts)
+            diagnostics_details = _build_diagnostics_details(sr, sym_upper, ts)
 
-    if current is None:
-        run_id_val = str(uuid.uuid4())
-        metadata = {
-            "artifact_version": "v2",
-            "mode": mode,
-            "pipeline_timestamp": ts,
-            "evaluation_timestamp_utc": ts,
-            "run_id": run_id_val,
-            "market_phase": phase,
-            "universe_size": 1,
-            "evaluated_count_stage1": 1 if sr else 0,
-            "evaluated_count_stage2": 1 if (sr and getattr(sr, "stage_reached", None) and str(getattr(sr, "stage_reached", "")) == "STAGE2_CHAIN") else 0,
-            "eligible_count": 1 if (summary.verdict == "ELIGIBLE") else 0,
-            "warnings": [],
-        }
-        selected = []
-        if summary.verdict == "ELIGIBLE" and cand_list:
-            selected = [cand_list[0]] if cand_list else []
-        merged = DecisionArtifactV2(
-            metadata=metadata,
-            symbols=[summary],
-            selected_candidates=selected,
-            candidates_by_symbol={sym_upper: cand_list},
-            gates_by_symbol={sym_upper: gates},
-            earnings_by_symbol={sym_upper: earnings},
-            diagnostics_by_symbol={sym_upper: diagnostics_details},
-            warnings=[],
-        )
-    else:
-        symbols_list = list(current.symbols)
-        idx = next((i for i, s in enumerate(symbols_list) if (s.symbol or "").strip().upper() == sym_upper), None)
+        idx = current.symbol_index.position(sym_upper) if current is not None else positions.get(sym_upper)
         if idx is not None:
             symbols_list[idx] = summary
         else:
+            positions[sym_upper] = len(symbols_list)
             symbols_list.append(summary)
-
-        candidates_by_symbol = dict(current.candidates_by_symbol)
         candidates_by_symbol[sym_upper] = cand_list
-
-        gates_by_symbol = dict(current.gates_by_symbol)
         gates_by_symbol[sym_upper] = gates
-
-        earnings_by_symbol = dict(current.earnings_by_symbol)
         earnings_by_symbol[sym_upper] = earnings
-
-        diagnostics_by_symbol = dict(current.diagnostics_by_symbol)
         diagnostics_by_symbol[sym_upper] = diagnostics_details
-
-        selected = [c for c in current.selected_candidates if (c.symbol or "").strip().upper() != sym_upper]
         if summary.verdict == "ELIGIBLE" and cand_list:
             selected.append(cand_list[0])
 
-        meta = dict(current.metadata)
-        meta["pipeline_timestamp"] = ts
-        meta["evaluation_timestamp_utc"] = ts
-        meta["run_id"] = str(uuid.uuid4())
-        meta["eligible_count"] = len([s for s in symbols_list if s.verdict == "ELIGIBLE"])
-
-        merged = DecisionArtifactV2(
-            metadata=meta,
-            symbols=symbols_list,
-            selected_candidates=selected,
-            candidates_by_symbol=candidates_by_symbol,
-            gates_by_symbol=gates_by_symbol,
-            earnings_by_symbol=earnings_by_symbol,
-            diagnostics_by_symbol=diagnostics_by_symbol,
-            warnings=current.warnings,
-        )
+    if current is None:
+        staged = list(staged_by_symbol.values())
+        metadata = {
+            "artifact_version": "v2",
+            "mode": mode,
+            "pipeline_timestamp": ts,
+            "evaluation_timestamp_utc": ts,
+            "run_id": str(uuid.uuid4()),
+            "market_phase": phase,
+            "universe_size": len(batch),
+            "evaluated_count_stage1": len(staged),
+            "evaluated_count_stage2": sum(
+                1 for sr in staged if str(getattr(sr, "stage_reached", "") or "") == "STAGE2_CHAIN"
+            ),
+            "eligible_count": len([s for s in symbols_list if s.verdict == "ELIGIBLE"]),
+            "warnings": [],
+        }
+        warnings: List[str] = []
+    else:
+        metadata = dict(current.metadata)
+        metadata["pipeline_timestamp"] = ts
+        metadata["evaluation_timestamp_utc"] = ts
+        metadata["run_id"] = str(uuid.uuid4())
+        metadata["eligible_count"] = len([s for s in symbols_list if s.verdict == "ELIGIBLE"])
+        warnings = current.warnings
+
+    merged = DecisionArtifactV2(
+        metadata=metadata,
+        symbols=symbols_list,
+        selected_candidates=selected,
+        candidates_by_symbol=candidates_by_symbol,
+        gates_by_symbol=gates_by_symbol,
+        earnings_by_symbol=earnings_by_symbol,
+        diagnostics_by_symbol=diagnostics_by_symbol,
+        warnings=warnings,
+    )
 
     store.set_latest(merged)
-    logger.info("[EVAL_SVC_V2] evaluate_single_symbol_and_merge: %s merged", sym_upper)
+    if len(batch) == 1:
+        logger.info("[EVAL_SVC_V2] evaluate_single_symbol_and_merge: %s merged", batch[0])
+    else:
+        logger.info("[EVAL_SVC_V2] evaluate_symbols_and_merge: %d symbols merged (%s)", len(batch), ",".join(batch))
     return merged
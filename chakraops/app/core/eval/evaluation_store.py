@@ -23,6 +23,11 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from app.core.io import json_codec
+from app.core.io.json_codec import shallow_asdict
+from app.core.observability.tracing import traced
+from app.core.eval.symbol_index import SymbolIndex, cached_symbol_index
+
 logger = logging.getLogger(__name__)
 
 # Schema version for run payloads; increment on breaking changes.
@@ -141,6 +146,15 @@ class EvaluationRunFull:
     # Pipeline source: staged (single source of truth) vs legacy
     engine: str = "staged"  # "staged" | "legacy"
 
+    @property
+    def symbol_index(self) -> SymbolIndex:
+        """Symbol -> per-symbol result dict, built once and shared by all consumers of this run."""
+        return cached_symbol_index(self, "symbols")
+
+    def get_symbol_row(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Per-symbol result dict for symbol (case-insensitive), or None. O(1) after the first lookup."""
+        return self.symbol_index.get(symbol)
+
     def to_summary(self) -> EvaluationRunSummary:
         """Convert to summary (for listing)."""
         return EvaluationRunSummary(
@@ -320,15 +334,15 @@ def write_run_running(run_id: str, started_at: str) -> None:
         symbols=[],
         source="scheduled",
     )
-    data = asdict(run)
+    data = shallow_asdict(run)
     data["run_version"] = RUN_SCHEMA_VERSION
-    data["checksum"] = _compute_checksum(data)
+    data["checksum"] = _compute_checksum(data, as_stored=True)
     path = _run_path(run_id)
     _ensure_evaluations_dir()
     temp = path.with_suffix(".tmp")
     try:
-        with open(temp, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, default=str)
+        with open(temp, "wb") as f:
+            json_codec.dump(data, f)
             f.flush()
             os.fsync(f.fileno())
         os.replace(temp, path)
@@ -343,9 +357,15 @@ def write_run_running(run_id: str, started_at: str) -> None:
         raise
 
 
-def _compute_checksum(data: Dict[str, Any]) -> str:
-    """Compute SHA256 of canonical JSON (excluding checksum). Deterministic for same content."""
+def _compute_checksum(data: Dict[str, Any], as_stored: bool = False) -> str:
+    """
+    Compute SHA256 of canonical JSON (excluding checksum). Deterministic for same content.
+    as_stored=True (writers): hash the values as the loader will parse them back from the
+    codec's output (e.g. NaN -> null under orjson), so load_run's recomputation matches.
+    """
     copy = {k: v for k, v in data.items() if k != "checksum"}
+    if as_stored:
+        copy = json_codec.loads(json_codec.dumps(copy))
     canonical = json.dumps(copy, sort_keys=True, indent=2, default=str)
     return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
 
@@ -355,8 +375,8 @@ def _atomic_write(path: Path, data: Dict[str, Any], log_label: str) -> None:
     _ensure_evaluations_dir()
     temp = path.with_suffix(".tmp")
     try:
-        with open(temp, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, default=str)
+        with open(temp, "wb") as f:
+            json_codec.dump(data, f)
             f.flush()
             os.fsync(f.fileno())
         os.replace(temp, path)
@@ -415,15 +435,15 @@ def save_failed_run(
         errors=[reason] if reason else [],
     )
     with _STORE_LOCK:
-        data = asdict(run)
+        data = shallow_asdict(run)
         data["run_version"] = RUN_SCHEMA_VERSION
-        data["checksum"] = _compute_checksum(data)
+        data["checksum"] = _compute_checksum(data, as_stored=True)
         path = _run_path(run_id)
         _ensure_evaluations_dir()
         temp = path.with_suffix(".tmp")
         try:
-            with open(temp, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, default=str)
+            with open(temp, "wb") as f:
+                json_codec.dump(data, f)
                 f.flush()
                 os.fsync(f.fileno())
             os.replace(temp, path)
@@ -437,6 +457,7 @@ def save_failed_run(
             logger.exception("[STORE] save_failed_run persist failed: %s", e)
 
 
+@traced("persist.save_run", "persistence")
 def save_run(run: EvaluationRunFull) -> None:
     """
     Save an evaluation run atomically. Validates payload before write.
@@ -444,10 +465,10 @@ def save_run(run: EvaluationRunFull) -> None:
     Phase 4: Also writes data completeness report JSON alongside the run.
     """
     with _STORE_LOCK:
-        data = asdict(run)
+        data = shallow_asdict(run)
         _validate_run_payload(data)
         data["run_version"] = getattr(run, "run_version", RUN_SCHEMA_VERSION)
-        data["checksum"] = _compute_checksum(data)
+        data["checksum"] = _compute_checksum(data, as_stored=True)
         path = _run_path(run.run_id)
         _atomic_write(path, data, f"save_run({run.run_id})")
         cid = getattr(run, "correlation_id", None) or run.run_id
@@ -464,7 +485,7 @@ def update_latest_pointer(run_id: str, completed_at: str) -> None:
     """Update the latest pointer atomically (temp → fsync → rename)."""
     with _STORE_LOCK:
         pointer = LatestPointer(run_id=run_id, completed_at=completed_at)
-        data = asdict(pointer)
+        data = shallow_asdict(pointer)
         path = _latest_path()
         _atomic_write(path, data, "update_latest_pointer")
 
@@ -479,9 +500,9 @@ def load_run(run_id: str) -> Optional[EvaluationRunFull]:
         logger.debug("[STORE] read_source run_id=%s path_missing=%s", run_id, path)
         return None
     try:
-        with open(path, "r", encoding="utf-8") as f:
+        with open(path, "rb") as f:
             raw = f.read()
-        data = json.loads(raw)
+        data = json_codec.loads(raw)
     except json.JSONDecodeError as e:
         logger.exception("[STORE] persist_failure run_id=%s invalid_json", run_id)
         raise CorruptedRunError(run_id, path, f"invalid JSON: {e}") from e
@@ -516,8 +537,7 @@ def load_latest_pointer() -> Optional[LatestPointer]:
     if not path.exists():
         return None
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = json_codec.read_json(path)
         return LatestPointer(**data)
     except Exception as e:
         logger.exception("[STORE] Failed to load latest pointer: %s", e)
@@ -549,8 +569,7 @@ def list_runs(limit: int = 20) -> List[EvaluationRunSummary]:
     allowed = _run_field_names()
     for run_file in run_files:
         try:
-            with open(run_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = json_codec.read_json(run_file)
             _validate_run_payload(data)
             filtered = {k: data[k] for k in allowed if k in data}
             run = EvaluationRunFull(**filtered)
@@ -594,6 +613,7 @@ def delete_old_runs(keep_count: int = 50) -> int:
 # Conversion from UniverseEvaluationResult
 # ============================================================================
 
+@traced("build.run_artifact", "artifact")
 def create_run_from_evaluation(
     run_id: str,
     started_at: str,
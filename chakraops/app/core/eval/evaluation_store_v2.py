@@ -4,12 +4,13 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import os
 import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.io import json_codec
 
 # Phase 11.2: Keep last N decision history files per symbol (configurable; DECISION_ARCHIVE_MAX overrides)
 DECISION_HISTORY_KEEP = int(os.getenv("DECISION_ARCHIVE_MAX", os.getenv("DECISION_HISTORY_KEEP", "50")))
@@ -116,8 +117,7 @@ def get_decision_by_run(symbol: str, run_id: str) -> Optional[DecisionArtifactV2
     if not path.exists():
         return None
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = json_codec.read_json(path)
         meta = data.get("metadata") or data
         if meta.get("artifact_version") == "v2":
             return DecisionArtifactV2.from_dict(data)
@@ -132,22 +132,34 @@ class EvaluationStoreV2:
 
     def __init__(self) -> None:
         self._artifact: Optional[DecisionArtifactV2] = None
+        # Bumped whenever _artifact is replaced; read models key their caches on it
+        self._generation = 0
+        self._disk_sig: Optional[tuple] = None
         self._load_latest_from_disk()
 
+    @staticmethod
+    def _file_sig(path: Path) -> Optional[tuple]:
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        return (str(path), st.st_mtime_ns, st.st_size, st.st_ino)
+
     def _load_latest_from_disk(self) -> None:
         """Load active artifact (decision_latest or decision_frozen) from disk if present and v2-compatible."""
         path = _active_read_path()
+        self._disk_sig = self._file_sig(path)
         logger.debug("[EVAL_STORE_V2] Reading from %s", path)
         if not path.exists():
             logger.info("[EVAL_STORE_V2] No artifact at path (v2 not loaded)")
             return
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = json_codec.read_json(path)
             meta = data.get("metadata") or data
             version = meta.get("artifact_version")
             if version == "v2":
                 self._artifact = DecisionArtifactV2.from_dict(data)
+                self._generation += 1
                 logger.info("[EVAL_STORE_V2] Loaded v2 from %s", path)
             else:
                 logger.info("[EVAL_STORE_V2] Artifact at path not v2 (skipped). Run evaluation to generate v2.")
@@ -159,16 +171,38 @@ class EvaluationStoreV2:
         with _LOCK:
             self._load_latest_from_disk()
 
+    def reload_if_changed(self) -> bool:
+        """Reload only if the active artifact file changed since the last load. Returns True if reloaded."""
+        with _LOCK:
+            if self._disk_sig is not None and self._file_sig(_active_read_path()) == self._disk_sig:
+                return False
+            self._load_latest_from_disk()
+            return True
+
+    @property
+    def generation(self) -> int:
+        """Monotonic counter; changes whenever the in-memory artifact may have changed."""
+        with _LOCK:
+            return self._generation
+
     def get_latest(self) -> Optional[DecisionArtifactV2]:
         """Return latest artifact or None."""
         with _LOCK:
             return self._artifact
 
+    def get_latest_versioned(self) -> Tuple[int, Optional[DecisionArtifactV2]]:
+        """Return (generation, latest artifact) read atomically."""
+        with _LOCK:
+            return self._generation, self._artifact
+
     def set_latest(self, artifact: DecisionArtifactV2) -> None:
         """Store in memory and write to disk (atomic write)."""
         with _LOCK:
             self._artifact = artifact
+            self._generation += 1
             self._write_to_disk(artifact)
+            # Next reload_if_changed() re-reads, exactly as reload_from_disk() would
+            self._disk_sig = None
 
     def _write_to_disk(self, artifact: DecisionArtifactV2) -> None:
         """Atomic write: temp file then rename. Phase 11.2: Also write history + apply retention."""
@@ -177,8 +211,9 @@ class EvaluationStoreV2:
         tmp = path.with_suffix(".json.tmp")
         try:
             data = artifact.to_dict_persist()
-            with open(tmp, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, default=str)
+            # Streamed, one symbol row per line (no full-document string)
+            with open(tmp, "wb") as f:
+                json_codec.dump(data, f)
                 f.flush()
                 os.fsync(f.fileno())
             tmp.replace(path)  # replace handles existing file (Windows)
@@ -192,20 +227,21 @@ class EvaluationStoreV2:
                     pass
             return
         # Phase 11.2: Write history per symbol and apply retention
-        self._write_history(artifact)
+        self._write_history(artifact, data)
         for sym in getattr(artifact, "symbols", []) or []:
             s = (getattr(sym, "symbol", "") or "").strip().upper()
             if s:
                 self._apply_retention(s)
 
-    def _write_history(self, artifact: DecisionArtifactV2) -> None:
+    def _write_history(self, artifact: DecisionArtifactV2, data: Optional[Dict[str, Any]] = None) -> None:
         """Phase 11.2: Write full artifact to out/decisions/{symbol}/{run_id}.json for each symbol."""
         meta = getattr(artifact, "metadata", None) or {}
         run_id = meta.get("run_id")
         if not run_id:
             return
-        data = artifact.to_dict_persist()
         symbols = getattr(artifact, "symbols", []) or []
+        # Every history file holds the same artifact; encode it once, not once per symbol
+        payload = json_codec.dumps(data if data is not None else artifact.to_dict_persist())
         for sym in symbols:
             s = (getattr(sym, "symbol", "") or "").strip().upper()
             if not s:
@@ -213,8 +249,8 @@ class EvaluationStoreV2:
             try:
                 hist_path = _history_path(s, run_id)
                 hist_path.parent.mkdir(parents=True, exist_ok=True)
-                with open(hist_path, "w", encoding="utf-8") as f:
-                    json.dump(data, f, indent=2, default=str)
+                with open(hist_path, "wb") as f:
+                    f.write(payload)
                     f.flush()
                     os.fsync(f.fileno())
                 logger.debug("[EVAL_STORE_V2] Wrote history %s", hist_path)
@@ -253,11 +289,7 @@ class EvaluationStoreV2:
             if not self._artifact:
                 return None
             sym_upper = symbol.strip().upper()
-            summary: Optional[SymbolEvalSummary] = None
-            for s in self._artifact.symbols:
-                if (s.symbol or "").strip().upper() == sym_upper:
-                    summary = s
-                    break
+            summary = self._artifact.get_symbol_summary(sym_upper)
             if not summary:
                 return None
             candidates = self._artifact.candidates_by_symbol.get(sym_upper, [])
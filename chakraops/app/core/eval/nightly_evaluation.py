@@ -355,7 +355,9 @@ def run_nightly_evaluation(
         # Phase 8.8: Reset cache stats at run start
         try:
             from app.core.data.cache_store import reset_cache_stats
+            from app.core.data.daily_bars import reset_sync_stats
             reset_cache_stats()
+            reset_sync_stats()
         except Exception:
             pass
 
@@ -503,7 +505,16 @@ def run_nightly_evaluation(
         try:
             from app.core.data.cache_store import cache_stats
             cs = cache_stats()
-            logger.info("[NIGHTLY] Budget: %s | Cache: hit_rate=%.1f%%", budget.budget_status(), cs.get("cache_hit_rate_pct", 0))
+            logger.info(
+                "[NIGHTLY] Budget: %s | Cache: hit_rate=%.1f%% singleflight_collapsed=%d",
+                budget.budget_status(), cs.get("cache_hit_rate_pct", 0), cs.get("singleflight_collapsed", 0),
+            )
+            from app.core.data.daily_bars import sync_stats
+            ds = sync_stats()
+            logger.info(
+                "[NIGHTLY] Daily bars: requests=%d bytes=%d latency_ms=%.0f backfills=%d incremental=%d store_hits=%d",
+                ds["requests"], ds["bytes"], ds["latency_ms"], ds["backfills"], ds["incremental"], ds["store_hits"],
+            )
         except Exception:
             pass
         
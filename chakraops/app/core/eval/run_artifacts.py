@@ -5,13 +5,20 @@ Canonical run artifacts under artifacts/runs/.
 
 Layout:
   artifacts/runs/YYYY-MM-DD/run_YYYYMMDD_HHMMSSZ/
-    snapshot.json   - per-symbol snapshot subset (canonical for UI)
-    evaluation.json  - full evaluation run
+    archive_manifest.json - snapshot.json + evaluation.json in the shared archive
     summary.md       - human-readable summary
+    trace.json       - timing spans for the run (written when the run's trace closes)
+  artifacts/runs/traces/      - traces for runs without a run directory
   artifacts/runs/latest.json  - pointer to latest run
   artifacts/runs/recent.json  - list of last 3 runs (paths / run_id)
+  artifacts/archive/          - content-addressed, compressed chunk store (app.core.snapshots.archive)
 
-Purge: runs older than keep_days (default 10) are deleted.
+snapshot.json (per-symbol snapshot subset, canonical for UI) and evaluation.json (full
+evaluation run) are read with read_run_artifact(); run dirs written before the archive
+still hold them as plain files.
+
+Purge: runs older than keep_days (default 10) are deleted, with their archive manifests;
+chunks no longer referenced by any manifest are then garbage-collected.
 """
 
 from __future__ import annotations
@@ -19,12 +26,16 @@ from __future__ import annotations
 import json
 import logging
 import re
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from app.core.eval.evaluation_store import EvaluationRunFull
+from app.core.io import json_codec
+from app.core.io.json_codec import shallow_asdict
+from app.core.observability.tracing import traced
+from app.core.snapshots.archive import SnapshotArchive
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +53,14 @@ def _artifacts_runs_root() -> Path:
     return Path(__file__).resolve().parents[3] / "artifacts" / "runs"
 
 
+def _run_archive() -> SnapshotArchive:
+    """Shared archive next to the runs root (artifacts/archive)."""
+    return SnapshotArchive(_artifacts_runs_root().parent / "archive")
+
+
+ARCHIVE_MANIFEST_NAME = "archive_manifest.json"
+
+
 def _run_id_to_date_and_time(run_id: str) -> tuple[str, str]:
     """
     Parse run_id (eval_YYYYMMDD_HHMMSS_xxx) -> (YYYY-MM-DD, HHMMSS).
@@ -184,11 +203,11 @@ def _build_summary_md(run: EvaluationRunFull, run_dir_path: str) -> str:
     return "\n".join(lines)
 
 
+@traced("persist.run_artifacts", "persistence")
 def write_run_artifacts(run: EvaluationRunFull) -> Optional[Path]:
     """
     Write canonical artifacts for a completed run:
-      artifacts/runs/YYYY-MM-DD/run_YYYYMMDD_HHMMSSZ/snapshot.json
-      artifacts/runs/YYYY-MM-DD/run_YYYYMMDD_HHMMSSZ/evaluation.json
+      snapshot.json + evaluation.json -> shared archive (manifest: run dir archive_manifest.json)
       artifacts/runs/YYYY-MM-DD/run_YYYYMMDD_HHMMSSZ/summary.md
     Only writes when run.status == "COMPLETED" and run.completed_at is set.
     Returns the run directory path if written, None otherwise.
@@ -201,14 +220,16 @@ def write_run_artifacts(run: EvaluationRunFull) -> Optional[Path]:
         run_dir.mkdir(parents=True, exist_ok=True)
         run_dir_str = str(run_dir)
 
-        snapshot_data = _build_snapshot_payload(run)
-        with open(run_dir / "snapshot.json", "w", encoding="utf-8") as f:
-            json.dump(snapshot_data, f, indent=2, default=str)
-            f.flush()
-
-        evaluation_data = asdict(run)
-        with open(run_dir / "evaluation.json", "w", encoding="utf-8") as f:
-            json.dump(evaluation_data, f, indent=2, default=str)
+        archive = _run_archive()
+        files = [
+            archive.put_bytes("snapshot.json", b"".join(json_codec.iter_encode(_build_snapshot_payload(run)))),
+            archive.put_bytes("evaluation.json", b"".join(json_codec.iter_encode(shallow_asdict(run)))),
+        ]
+        manifest = archive.write_manifest(
+            "runs", run.run_id, files, meta={"run_id": run.run_id, "completed_at": run.completed_at, "run_dir": run_dir_str},
+        )
+        with open(run_dir / ARCHIVE_MANIFEST_NAME, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2, default=str)
             f.flush()
 
         summary_md = _build_summary_md(run, run_dir_str)
@@ -216,13 +237,36 @@ def write_run_artifacts(run: EvaluationRunFull) -> Optional[Path]:
 
         _write_eod_chain_artifacts(run, run_dir)
 
-        logger.info("[RUN_ARTIFACTS] Wrote run artifacts to %s", run_dir)
+        logger.info(
+            "[RUN_ARTIFACTS] Wrote run artifacts to %s (%d bytes, %d new archived bytes)",
+            run_dir, manifest["logical_bytes"], manifest["stored_bytes"],
+        )
         return run_dir
     except Exception as e:
         logger.warning("[RUN_ARTIFACTS] Failed to write artifacts for %s: %s", run.run_id, e)
         return None
 
 
+def read_run_artifact(run_dir: Path, name: str) -> Optional[bytes]:
+    """
+    Bytes of snapshot.json / evaluation.json for a run dir: the plain file when present
+    (runs written before the archive), else from the archive via archive_manifest.json.
+    Returns None when the run has no such artifact.
+    """
+    plain = run_dir / name
+    if plain.exists():
+        return plain.read_bytes()
+    manifest_path = run_dir / ARCHIVE_MANIFEST_NAME
+    if not manifest_path.exists():
+        return None
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    for entry in manifest.get("files") or []:
+        if entry.get("name") == name:
+            return _run_archive().read_bytes(entry)
+    return None
+
+
 # ---------------------------------------------------------------------------
 # Latest and recent manifests
 # ---------------------------------------------------------------------------
@@ -300,6 +344,14 @@ def _rmtree_safe(path: Path) -> None:
     path.rmdir()
 
 
+def _archived_run_id(run_folder: Path) -> Optional[str]:
+    try:
+        with open(run_folder / ARCHIVE_MANIFEST_NAME, "r", encoding="utf-8") as f:
+            return json.load(f).get("id")
+    except (OSError, ValueError):
+        return None
+
+
 def purge_old_runs(keep_days: int = PURGE_KEEP_DAYS) -> int:
     """
     Delete run directories older than keep_days.
@@ -311,6 +363,8 @@ def purge_old_runs(keep_days: int = PURGE_KEEP_DAYS) -> int:
         return 0
     cutoff = (datetime.now(timezone.utc) - timedelta(days=keep_days)).date()
     removed = 0
+    archive = _run_archive()
+    archived_removed = 0
     for date_dir in list(root.iterdir()):
         if not date_dir.is_dir():
             continue
@@ -324,8 +378,11 @@ def purge_old_runs(keep_days: int = PURGE_KEEP_DAYS) -> int:
         for run_folder in list(date_dir.iterdir()):
             if run_folder.is_dir() and run_folder.name.startswith("run_"):
                 try:
+                    archived_id = _archived_run_id(run_folder)
                     _rmtree_safe(run_folder)
                     removed += 1
+                    if archived_id and archive.delete_manifest("runs", archived_id):
+                        archived_removed += 1
                 except OSError as e:
                     logger.warning("[RUN_ARTIFACTS] Failed to remove %s: %s", run_folder, e)
         eod_chain_dir = date_dir / "eod_chain"
@@ -339,6 +396,8 @@ def purge_old_runs(keep_days: int = PURGE_KEEP_DAYS) -> int:
                 date_dir.rmdir()
         except OSError:
             pass
+    if archived_removed:
+        archive.gc()
     if removed > 0:
         logger.info("[RUN_ARTIFACTS] Purged %d run directories (including chain artifacts) older than %d days", removed, keep_days)
     return removed
@@ -371,12 +430,11 @@ def build_latest_response_from_artifacts() -> Optional[Dict[str, Any]]:
     run_dir = get_latest_run_dir()
     if not run_dir:
         return None
-    eval_path = run_dir / "evaluation.json"
-    if not eval_path.exists():
-        return None
     try:
-        with open(eval_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        raw = read_run_artifact(run_dir, "evaluation.json")
+        if raw is None:
+            return None
+        data = json_codec.loads(raw)
     except Exception as e:
         logger.warning("[RUN_ARTIFACTS] Failed to read evaluation.json: %s", e)
         return None
@@ -465,6 +523,7 @@ def build_universe_from_latest_artifact() -> Optional[Dict[str, Any]]:
 
 __all__ = [
     "write_run_artifacts",
+    "read_run_artifact",
     "write_latest_manifest",
     "update_recent_manifest",
     "update_latest_and_recent",
@@ -0,0 +1,95 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""
+Phase 10: Progress and cancellation hooks for a running evaluation.
+
+The eval worker wraps each job in run_control_scope(ctrl). The staged evaluator calls
+report_progress() / raise_if_cancelled() from its coordinating thread; both are no-ops
+when no RunControl is active (scheduler, nightly, CLI runs).
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional
+
+
+class EvaluationCancelled(RuntimeError):
+    """Raised inside an evaluation when its job was cancelled or ran past its deadline."""
+
+
+class RunControl:
+    """Cancel flag, optional deadline and latest progress for one evaluation."""
+
+    def __init__(
+        self,
+        timeout_sec: Optional[float] = None,
+        on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> None:
+        self._cancel = threading.Event()
+        self._deadline = time.monotonic() + timeout_sec if timeout_sec else None
+        self._on_progress = on_progress
+        self.progress: Dict[str, Any] = {"stage": None, "done": 0, "total": 0}
+
+    def cancel(self) -> None:
+        self._cancel.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    @property
+    def timed_out(self) -> bool:
+        return self._deadline is not None and time.monotonic() > self._deadline
+
+    def report(self, stage: str, done: int, total: int) -> None:
+        self.progress = {"stage": stage, "done": int(done), "total": int(total)}
+        if self._on_progress is not None:
+            self._on_progress(dict(self.progress))
+
+    def raise_if_cancelled(self) -> None:
+        if self.cancelled:
+            raise EvaluationCancelled("Cancelled")
+        if self.timed_out:
+            raise EvaluationCancelled("Timeout")
+
+
+_CURRENT: ContextVar[Optional[RunControl]] = ContextVar("eval_run_control", default=None)
+
+
+@contextmanager
+def run_control_scope(ctrl: RunControl) -> Iterator[RunControl]:
+    token = _CURRENT.set(ctrl)
+    try:
+        yield ctrl
+    finally:
+        _CURRENT.reset(token)
+
+
+def current_run_control() -> Optional[RunControl]:
+    return _CURRENT.get()
+
+
+def report_progress(stage: str, done: int, total: int) -> None:
+    ctrl = _CURRENT.get()
+    if ctrl is not None:
+        ctrl.report(stage, done, total)
+
+
+def raise_if_cancelled() -> None:
+    ctrl = _CURRENT.get()
+    if ctrl is not None:
+        ctrl.raise_if_cancelled()
+
+
+__all__ = [
+    "EvaluationCancelled",
+    "RunControl",
+    "current_run_control",
+    "raise_if_cancelled",
+    "report_progress",
+    "run_control_scope",
+]
@@ -9,6 +9,9 @@ Phase 3: Explainable scoring and capital-aware ranking.
   penalize when notional_pct exceeds thresholds (config-driven). No price-level penalties.
 - Rank reasons: top 3 positive reasons + top 1 penalty for UI.
 - Band assignment uses breakdown + gates; band_reason explains why (so Band C is not unexplained).
+- config/scoring.yaml is parsed once per file version (config registry); a run compiles an
+  immutable ScoringProfile (config + account equity) once and passes it to every scoring call.
+  Batch scoring across the universe lives in app.core.eval.scoring_batch.score_universe.
 """
 
 from __future__ import annotations
@@ -16,7 +19,10 @@ from __future__ import annotations
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from app.core.config.registry import get_config, invalidate, register_config
 
 
 # Defaults (conservative) when config is missing
@@ -38,19 +44,33 @@ def _repo_root() -> Path:
     return Path(__file__).resolve().parents[3]
 
 
-def _load_scoring_config() -> dict:
-    """Load config/scoring.yaml. Returns empty dict if not found."""
-    path = _repo_root() / "config" / "scoring.yaml"
-    if not path.exists():
-        return {}
-    try:
-        import yaml
-        with open(path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
-    except Exception as e:
-        import logging
-        logging.getLogger(__name__).warning("Failed to load scoring config: %s", e)
+def _scoring_config_path() -> Path:
+    return _repo_root() / "config" / "scoring.yaml"
+
+
+def _validate_scoring_config(raw: Any) -> dict:
+    if raw is None:
         return {}
+    if not isinstance(raw, dict):
+        raise ValueError("scoring.yaml must be a mapping")
+    return raw
+
+
+register_config("scoring", validate=_validate_scoring_config, fallback=lambda e: {})
+
+
+def _load_scoring_config() -> Mapping[str, Any]:
+    """Load config/scoring.yaml. Returns empty mapping if not found or invalid.
+
+    Served by the config registry — parsed once per file version (one stat() per
+    call afterwards). The returned mapping is a read-only snapshot.
+    """
+    return get_config("scoring", _scoring_config_path()).data
+
+
+def reset_scoring_config_cache() -> None:
+    """Force scoring.yaml to be re-read on next use (tests)."""
+    invalidate("scoring")
 
 
 def get_account_equity() -> Optional[float]:
@@ -130,6 +150,38 @@ def get_band_limits() -> Tuple[int, int]:
     return a, b
 
 
+@dataclass(frozen=True)
+class ScoringProfile:
+    """
+    Immutable scoring inputs for one run — weights, notional thresholds/penalties,
+    band limits and account equity, resolved once by compile_scoring_profile().
+    """
+    weights: Mapping[str, float]
+    notional_thresholds: Mapping[str, float]
+    notional_penalties: Mapping[str, int]
+    band_a_min: int
+    band_b_min: int
+    account_equity: Optional[float]
+
+    @property
+    def band_limits(self) -> Tuple[int, int]:
+        return self.band_a_min, self.band_b_min
+
+
+def compile_scoring_profile() -> ScoringProfile:
+    """Resolve config/scoring.yaml (cached per file version) and account equity into a ScoringProfile.
+    Call once per run; the accounts store is read here, not per symbol."""
+    band_a, band_b = get_band_limits()
+    return ScoringProfile(
+        weights=MappingProxyType(get_scoring_weights()),
+        notional_thresholds=MappingProxyType(get_notional_thresholds()),
+        notional_penalties=MappingProxyType(get_notional_penalties()),
+        band_a_min=band_a,
+        band_b_min=band_b,
+        account_equity=get_account_equity(),
+    )
+
+
 # ---------------------------------------------------------------------------
 # Component scores (0-100 each)
 # ---------------------------------------------------------------------------
@@ -189,6 +241,7 @@ def capital_efficiency_score(
     csp_notional: Optional[float],
     account_equity: Optional[float],
     price: Optional[float],
+    profile: Optional[ScoringProfile] = None,
 ) -> Tuple[int, List[str], Optional[str]]:
     """
     Compute 0-100 capital efficiency component and penalty reasons.
@@ -209,8 +262,8 @@ def capital_efficiency_score(
         return (100, penalties, top_penalty)
 
     notional_pct = csp_notional / account_equity
-    thresh = get_notional_thresholds()
-    pen = get_notional_penalties()
+    thresh = profile.notional_thresholds if profile is not None else get_notional_thresholds()
+    pen = profile.notional_penalties if profile is not None else get_notional_penalties()
 
     if notional_pct >= thresh["cap_above"]:
         score -= pen["cap"]
@@ -276,6 +329,7 @@ def compute_score_breakdown(
     selected_put_strike: Optional[float],
     # Optional override for final composite (e.g. after regime cap applied elsewhere)
     base_composite_override: Optional[int] = None,
+    profile: Optional[ScoringProfile] = None,
 ) -> Tuple[ScoreBreakdown, int]:
     """
     Compute full breakdown and final score (0-100).
@@ -283,16 +337,19 @@ def compute_score_breakdown(
     If base_composite_override is set, it is used as the composite after weighting;
     otherwise composite = weighted sum of components. Final score is then
     min(composite, regime_cap) where regime cap is applied in caller if needed.
+    Pass the run's ScoringProfile to avoid resolving config and account equity per symbol.
     Returns (ScoreBreakdown, final_score).
     """
-    account_equity = get_account_equity()
+    if profile is None:
+        profile = compile_scoring_profile()
+    account_equity = profile.account_equity
     csp_notional = (selected_put_strike * 100) if selected_put_strike is not None else None
     notional_pct = None
     if csp_notional is not None and account_equity is not None and account_equity > 0:
         notional_pct = csp_notional / account_equity
 
     ce_score, capital_penalties, top_penalty = capital_efficiency_score(
-        csp_notional, account_equity, price
+        csp_notional, account_equity, price, profile=profile
     )
 
     dq = data_quality_score(data_completeness)
@@ -300,7 +357,7 @@ def compute_score_breakdown(
     liq = options_liquidity_score(liquidity_ok, liquidity_grade)
     fit = strategy_fit_score(verdict, position_open)
 
-    weights = get_scoring_weights()
+    weights = profile.weights
     composite = int(round(
         dq * weights["data_quality"] +
         rg * weights["regime"] +
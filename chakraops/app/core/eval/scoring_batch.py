@@ -0,0 +1,256 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""
+Batch scoring across the universe.
+
+score_universe() computes the Phase 3 component scores, composite, regime caps, A-D band
+and rank_score for every symbol of a run as numpy arrays, from one compiled ScoringProfile.
+Results are identical to the per-symbol path:
+
+    compute_score_breakdown  -> data_quality / regime / options_liquidity / strategy_fit /
+                                capital_efficiency / composite, csp_notional, notional_pct
+    staged regime caps       -> raw_score, final_score, score_caps (RISK_OFF 50, NEUTRAL 65;
+                                Stage1-only rows keep their stage1_score as the raw score)
+    assign_band              -> band (A/B/C/D from final_score)
+    compute_rank_score       -> rank_score
+
+The arithmetic is done in the same order as the scalar code and numpy's rint rounds half
+to even like round(), so scores match bit for bit. Per-symbol text (capital penalty
+reasons) is only built on demand by UniverseScores.breakdown(i).
+
+Row keys (missing = None/False): data_completeness, regime, liquidity_ok, liquidity_grade,
+verdict, position_open, selected_put_strike, stage1_only, stage1_score, premium_yield_pct,
+capital_required, market_cap.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+from app.core.eval.decision_artifact_v2 import TIER_A_MIN, TIER_B_MIN, TIER_C_MIN
+from app.core.eval.scoring import ScoreBreakdown, ScoringProfile, compile_scoring_profile
+
+logger = logging.getLogger(__name__)
+
+_REGIME_SCORES = {"LOW_VOL": 40, "NEUTRAL": 65, "HIGH_VOL": 85, "RISK_ON": 100, "RISK_OFF": 50}
+_LIQUIDITY_GRADE_SCORES = {"A": 100, "B": 80, "C": 60}
+_REGIME_CAPS = {"RISK_OFF": 50, "NEUTRAL": 65}
+
+
+def _upper(value: Any) -> str:
+    return (value or "").strip().upper()
+
+
+def _fit_score(verdict: Any, position_open: bool) -> int:
+    v = _upper(verdict)
+    if v == "ELIGIBLE":
+        return 70 if position_open else 100
+    if v in ("BLOCKED", "UNKNOWN"):
+        return 20
+    return 50
+
+
+def _optional_array(values: List[Optional[float]]) -> np.ndarray:
+    return np.array([np.nan if v is None else float(v) for v in values], dtype=np.float64)
+
+
+@dataclass
+class UniverseScores:
+    """Column arrays for a scored universe (index i = i-th input row)."""
+
+    profile: ScoringProfile
+    market_regime: Optional[str]
+    data_quality: np.ndarray
+    regime: np.ndarray
+    options_liquidity: np.ndarray
+    strategy_fit: np.ndarray
+    capital_efficiency: np.ndarray
+    composite: np.ndarray
+    raw_score: np.ndarray
+    final_score: np.ndarray
+    csp_notional: np.ndarray  # NaN = no selected put
+    notional_pct: np.ndarray  # NaN = not computable (no put or no account equity)
+    band: np.ndarray
+    rank_score: np.ndarray
+    regime_cap: Optional[int] = None
+    errors: Dict[int, str] = field(default_factory=dict)  # rows that could not be scored
+
+    def __len__(self) -> int:
+        return len(self.final_score)
+
+    def breakdown(self, i: int) -> ScoreBreakdown:
+        """ScoreBreakdown for row i, equal to compute_score_breakdown() for the same inputs."""
+        csp = None if np.isnan(self.csp_notional[i]) else float(self.csp_notional[i])
+        pct = None if np.isnan(self.notional_pct[i]) else float(self.notional_pct[i])
+        penalties: List[str] = []
+        top_penalty: Optional[str] = None
+        if pct is not None and csp is not None and csp > 0:
+            thresh = self.profile.notional_thresholds
+            level = (
+                "cap" if pct >= thresh["cap_above"]
+                else "heavy" if pct >= thresh["heavy_penalty_above"]
+                else "warn" if pct >= thresh["warn_above"]
+                else None
+            )
+            if level is not None:
+                penalties.append(f"Notional {pct:.1%} of account ({level})")
+                top_penalty = f"CSP notional {pct:.1%} of account"
+        return ScoreBreakdown(
+            data_quality_score=int(self.data_quality[i]),
+            regime_score=int(self.regime[i]),
+            options_liquidity_score=int(self.options_liquidity[i]),
+            strategy_fit_score=int(self.strategy_fit[i]),
+            capital_efficiency_score=int(self.capital_efficiency[i]),
+            composite_score=int(self.composite[i]),
+            csp_notional=csp,
+            notional_pct=pct,
+            capital_penalties=penalties,
+            top_penalty=top_penalty,
+        )
+
+    def score_caps(self, i: int) -> Dict[str, Any]:
+        """score_caps dict for row i ({regime_cap, applied_caps}), as built by the staged evaluator."""
+        applied: List[Dict[str, Any]] = []
+        raw, final = int(self.raw_score[i]), int(self.final_score[i])
+        if self.regime_cap is not None and raw > self.regime_cap:
+            applied.append({
+                "type": "regime_cap",
+                "cap_value": self.regime_cap,
+                "before": raw,
+                "after": final,
+                "reason": f"Regime {self.market_regime} caps score to {self.regime_cap}",
+            })
+        return {"regime_cap": self.regime_cap, "applied_caps": applied}
+
+
+def score_universe(
+    rows: Sequence[Mapping[str, Any]],
+    profile: Optional[ScoringProfile] = None,
+    market_regime: Optional[str] = None,
+) -> UniverseScores:
+    """Score every row in one vectorized pass. Rows whose inputs are invalid are listed in .errors
+    (their array slots hold zeros / band D) — the per-symbol path would have raised for them."""
+    if profile is None:
+        profile = compile_scoring_profile()
+    n = len(rows)
+    errors: Dict[int, str] = {}
+
+    completeness = np.zeros(n, dtype=np.float64)
+    stage1_scores = np.zeros(n, dtype=np.int64)
+    strikes: List[Optional[float]] = [None] * n
+    yields: List[Optional[float]] = [None] * n
+    capital: List[float] = [0.0] * n
+    mcaps: List[float] = [0.0] * n
+    regime_col = np.full(n, 50, dtype=np.int64)
+    liq_col = np.full(n, 20, dtype=np.int64)
+    fit_col = np.full(n, 50, dtype=np.int64)
+    stage1_only = np.zeros(n, dtype=bool)
+    for i, row in enumerate(rows):
+        try:
+            completeness[i] = float(row.get("data_completeness"))
+            if not math.isfinite(completeness[i]):
+                raise ValueError(f"data_completeness {completeness[i]!r} is not finite")
+            regime_col[i] = _REGIME_SCORES.get(_upper(row.get("regime")), 50)
+            if row.get("liquidity_ok"):
+                liq_col[i] = _LIQUIDITY_GRADE_SCORES.get(_upper(row.get("liquidity_grade")), 40)
+            fit_col[i] = _fit_score(row.get("verdict"), bool(row.get("position_open")))
+            strike = row.get("selected_put_strike")
+            strikes[i] = float(strike) if strike is not None else None
+            if row.get("stage1_only"):
+                stage1_only[i] = True
+                s1 = row.get("stage1_score")
+                stage1_scores[i] = int(s1) if s1 is not None else 0
+            y = row.get("premium_yield_pct")
+            yields[i] = float(y) if y is not None else None
+            capital[i] = float(row.get("capital_required") or 0.0)
+            mcaps[i] = float(row.get("market_cap") or 0.0)
+        except Exception as e:
+            completeness[i] = 0.0
+            errors[i] = f"{type(e).__name__}: {e}"
+
+    # Component scores
+    data_quality = np.clip(np.rint(completeness * 100), 0, 100).astype(np.int64)
+
+    equity = profile.account_equity
+    csp = _optional_array(strikes) * 100
+    has_equity = equity is not None and equity > 0
+    notional_pct = csp / equity if has_equity else np.full(n, np.nan)
+    thresh, pen = profile.notional_thresholds, profile.notional_penalties
+    with np.errstate(invalid="ignore"):
+        penalized = has_equity & (csp > 0)
+        capital_eff = np.where(
+            penalized,
+            np.select(
+                [notional_pct >= thresh["cap_above"], notional_pct >= thresh["heavy_penalty_above"],
+                 notional_pct >= thresh["warn_above"]],
+                [100 - pen["cap"], 100 - pen["heavy"], 100 - pen["warn"]],
+                100,
+            ),
+            100,
+        )
+    capital_eff = np.clip(capital_eff, 0, 100).astype(np.int64)
+
+    w = profile.weights
+    weighted = (
+        data_quality * w["data_quality"]
+        + regime_col * w["regime"]
+        + liq_col * w["options_liquidity"]
+        + fit_col * w["strategy_fit"]
+        + capital_eff * w["capital_efficiency"]
+    )
+    composite = np.clip(np.rint(weighted), 0, 100).astype(np.int64)
+
+    # Regime caps (run-level market regime)
+    regime_cap = _REGIME_CAPS.get(market_regime or "")
+    raw = np.where(stage1_only, stage1_scores, composite)
+    final = np.minimum(raw, regime_cap) if regime_cap is not None else raw.copy()
+    final = np.where(stage1_only, final, np.clip(final, 0, 100))
+
+    # Band (A-D) and rank_score
+    band = np.select(
+        [final >= TIER_A_MIN, final >= TIER_B_MIN, final >= TIER_C_MIN], ["A", "B", "C"], "D",
+    ).astype(object)
+    band_val = np.select([band == "A", band == "B", band == "C"], [4, 3, 2], 1)
+    cap_arr = np.array(capital, dtype=np.float64)
+    rank_score = (
+        band_val * 100_000
+        + final.astype(np.float64) * 100
+        + np.nan_to_num(_optional_array(yields), nan=0.0) * 10
+        + -np.where(cap_arr != 0, cap_arr, 999_999) / 100
+        + np.array(mcaps, dtype=np.float64) / 1e9
+    )
+
+    if errors:
+        for i in errors:
+            data_quality[i] = regime_col[i] = liq_col[i] = fit_col[i] = capital_eff[i] = 0
+            composite[i] = raw[i] = final[i] = 0
+            band[i] = "D"
+            rank_score[i] = np.nan
+        logger.debug("[SCORING] %d of %d rows could not be scored", len(errors), n)
+
+    return UniverseScores(
+        profile=profile,
+        market_regime=market_regime,
+        data_quality=data_quality,
+        regime=regime_col,
+        options_liquidity=liq_col,
+        strategy_fit=fit_col,
+        capital_efficiency=capital_eff,
+        composite=composite,
+        raw_score=raw,
+        final_score=final,
+        csp_notional=csp,
+        notional_pct=notional_pct,
+        band=band,
+        rank_score=rank_score,
+        regime_cap=regime_cap,
+        errors=errors,
+    )
+
+
+__all__ = ["UniverseScores", "score_universe"]
@@ -37,15 +37,19 @@ from typing import Any, Dict, List, Optional, Tuple
 import os
 
 from app.core.models.data_quality import build_data_incomplete_reason
+from app.core.observability.tracing import bind_to_trace, start_span, traced
 
 # Phase 7.5: Debug instrumentation for batch eval (CHAKRAOPS_DEBUG_EVAL=1)
 _DEBUG_EVAL = os.getenv("CHAKRAOPS_DEBUG_EVAL", "").strip() in ("1", "true", "yes")
 from app.core.eval.strategy_rationale import StrategyRationale, build_rationale_from_staged
 from app.core.eval.confidence_band import compute_confidence_band, CapitalHint
 from app.core.eval.scoring import (
+    ScoringProfile,
     compute_score_breakdown,
     build_rank_reasons,
+    compile_scoring_profile,
 )
+from app.core.eval.scoring_batch import score_universe
 from app.core.options.chain_provider import (
     OptionType,
     OptionContract,
@@ -405,6 +409,7 @@ class FullEvaluationResult:
 # Stage 1: Stock Quality Evaluation
 # ============================================================================
 
+@traced("evaluate_stage1", "eval")
 def evaluate_stage1(symbol: str, canonical_snapshot: Optional[Any] = None) -> Stage1Result:
     """
     Stage 1: Evaluate stock quality and regime.
@@ -985,6 +990,7 @@ def _compute_missing_required_fields_diagnostics(
 # Stage 2: Chain Evaluation
 # ============================================================================
 
+@traced("evaluate_stage2", "eval")
 def evaluate_stage2(
     symbol: str,
     stage1: Stage1Result,
@@ -1599,6 +1605,7 @@ def evaluate_symbol_full(
     strategy_mode: str = "CSP",
     holdings: Optional[Dict[str, int]] = None,
     canonical_snapshot: Optional[Any] = None,
+    scoring_profile: Optional[ScoringProfile] = None,
 ) -> FullEvaluationResult:
     """
     Run full 2-stage evaluation for a symbol.
@@ -1610,6 +1617,7 @@ def evaluate_symbol_full(
         skip_stage2: If True, only run stage 1
         strategy_mode: Ignored when Phase 4 eligibility runs; used only as fallback if eligibility unavailable
         holdings: Symbol -> shares for CC (Phase 4). If None, treated as {} (CC ineligible).
+        scoring_profile: The run's compiled scoring profile; compiled per call if None.
     Returns:
         FullEvaluationResult with complete evaluation data and eligibility_trace
     """
@@ -1835,6 +1843,7 @@ def evaluate_symbol_full(
             position_open=result.position_open,
             price=result.price,
             selected_put_strike=put_strike,
+            profile=scoring_profile,
         )
         result.score = composite
         result.score_breakdown = breakdown.to_dict()
@@ -1910,6 +1919,7 @@ def _compute_confidence(result: FullEvaluationResult) -> float:
 # Batch Evaluation
 # ============================================================================
 
+@traced("evaluate_universe_staged", "eval")
 def evaluate_universe_staged(
     symbols: List[str],
     top_k: int = STAGE1_TOP_K,
@@ -1941,26 +1951,56 @@ def evaluate_universe_staged(
         logger.warning("[STAGED_EVAL] Holdings load failed (CC ineligible): %s", e)
         holdings = {}
 
-    # Phase 8D: Per-run ORATS cache — pre-fetch equity + ivrank for all symbols so stage1 uses cache
+    # Phase 8D: Per-run ORATS cache — pre-fetch equity + ivrank for all symbols so stage1 uses cache.
+    # Batches for both endpoints run concurrently in the background; stage1 starts on each
+    # symbol as soon as its quote and IV rank have landed.
+    prefetch = None
     try:
-        from app.core.data.orats_client import reset_run_cache, fetch_full_equity_snapshots
+        from app.core.data.orats_client import reset_run_cache, start_equity_prefetch
         reset_run_cache()
-        pre = fetch_full_equity_snapshots(symbols)
-        logger.info("[STAGED_EVAL] Pre-fetched equity snapshots for %d symbols (cache ready for stage1)", len(pre))
+        prefetch = start_equity_prefetch(symbols)
     except Exception as e:
         logger.warning("[STAGED_EVAL] Pre-fetch equity failed (stage1 will fetch per-symbol): %s", e)
     
+    # Phase 10: eval worker jobs report progress and honour cancellation (no-op otherwise)
+    from app.core.eval.run_control import current_run_control, raise_if_cancelled, report_progress
+    run_control = current_run_control()
+
     # Stage 1: Evaluate all symbols (cache hits for equity/ivrank)
     stage1_results: Dict[str, Stage1Result] = {}
-    
+    stage1_span = start_span("stage1", "eval", symbols=len(symbols))
+
+    def _stage1_task(symbol: str) -> Any:
+        return bind_to_trace(evaluate_stage1, "stage1.task", "eval", symbol=symbol)
+
     with ThreadPoolExecutor(max_workers=10) as executor:
-        future_to_symbol = {
-            executor.submit(evaluate_stage1, symbol): symbol
-            for symbol in symbols
-        }
+        future_to_symbol = {}
+        if prefetch is not None:
+            by_upper: Dict[str, List[str]] = {}
+            for symbol in symbols:
+                by_upper.setdefault(symbol.upper(), []).append(symbol)
+            for ready in prefetch.iter_ready():
+                for symbol in by_upper.get(ready, []):
+                    future_to_symbol[executor.submit(_stage1_task(symbol), symbol)] = symbol
+            try:
+                pre = prefetch.result()
+                logger.info(
+                    "[STAGED_EVAL] Pre-fetched equity snapshots for %d symbols in %.0f ms (streamed into stage1)",
+                    len(pre), prefetch.wall_ms or 0.0,
+                )
+            except Exception as e:
+                logger.warning("[STAGED_EVAL] Pre-fetch equity failed (stage1 will fetch per-symbol): %s", e)
+        submitted = set(future_to_symbol.values())
+        for symbol in symbols:
+            if symbol not in submitted:
+                future_to_symbol[executor.submit(_stage1_task(symbol), symbol)] = symbol
         
         for future in as_completed(future_to_symbol):
             symbol = future_to_symbol[future]
+            if run_control is not None and (run_control.cancelled or run_control.timed_out):
+                for pending in future_to_symbol:
+                    pending.cancel()
+                run_control.raise_if_cancelled()
             try:
                 stage1_results[symbol] = future.result()
             except Exception as e:
@@ -1971,7 +2011,9 @@ def evaluate_universe_staged(
                     stock_verdict_reason=f"Error: {e}",
                     error=str(e),
                 )
-    
+            report_progress("stage1", len(stage1_results), len(symbols))
+    stage1_span.end()
+
     # Select top K candidates for stage 2
     qualified = [
         (symbol, s1) for symbol, s1 in stage1_results.items()
@@ -2044,18 +2086,42 @@ def evaluate_universe_staged(
             result.symbol_eligibility, result.contract_data, result.contract_eligibility = se, cd, ce
             results[symbol] = result
 
+    # OCC lookups from concurrent stage-2 workers share batches; count per run
+    try:
+        from app.core.options.orats_chain_pipeline import get_opra_coalescer
+        get_opra_coalescer().reset_stats()
+    except Exception as e:
+        logger.debug("[STAGED_EVAL] OPRA coalescer stats reset skipped: %s", e)
+
+    # Scoring config + account equity resolved once for the run (not per symbol)
+    try:
+        scoring_profile: Optional[ScoringProfile] = compile_scoring_profile()
+    except Exception as e:
+        logger.warning("[STAGED_EVAL] Scoring profile compile failed (per-symbol fallback): %s", e)
+        scoring_profile = None
+
     # Stage 2: Evaluate top candidates with bounded concurrency (holdings passed for CC eligibility)
+    raise_if_cancelled()
+    report_progress("stage2", 0, len(top_candidates))
+    stage2_span = start_span("stage2", "eval", symbols=len(top_candidates))
     with ThreadPoolExecutor(max_workers=max_stage2_concurrent) as executor:
         future_to_symbol = {}
         for symbol, stage1 in top_candidates:
             future = executor.submit(
-                _run_full_evaluation_for_qualified,
-                symbol, stage1, provider, holdings
+                bind_to_trace(_run_full_evaluation_for_qualified, "stage2.task", "eval", symbol=symbol),
+                symbol, stage1, provider, holdings, scoring_profile
             )
             future_to_symbol[future] = symbol
         
+        stage2_done = 0
         for future in as_completed(future_to_symbol):
             symbol = future_to_symbol[future]
+            if run_control is not None and (run_control.cancelled or run_control.timed_out):
+                for pending in future_to_symbol:
+                    pending.cancel()
+                run_control.raise_if_cancelled()
+            stage2_done += 1
+            report_progress("stage2", stage2_done, len(top_candidates))
             try:
                 res = future.result()
                 results[symbol] = res
@@ -2075,8 +2141,21 @@ def evaluate_universe_staged(
                 se, cd, ce = build_eligibility_layers(stage1, None, now_iso, _market_open)
                 result.symbol_eligibility, result.contract_data, result.contract_eligibility = se, cd, ce
                 results[symbol] = result
+    stage2_span.end()
+
+    try:
+        cs = get_opra_coalescer().stats()
+        if cs["lookups"]:
+            logger.info(
+                "[OPRA_COALESCE] stage2 lookups=%d symbols=%d batches=%d calls_saved=%d fill_ratio=%.2f",
+                cs["lookups"], cs["symbols_requested"], cs["batches_dispatched"],
+                cs["calls_saved"], cs["fill_ratio"],
+            )
+    except Exception:
+        pass
 
     # Phase 7: Apply market regime gate (index-based). Cap scores and force HOLD when RISK_OFF.
+    gates_span = start_span("regime_position_gates", "eval")
     market_regime_value = "NEUTRAL"
     try:
         from app.core.market.market_regime import get_market_regime
@@ -2125,104 +2204,62 @@ def evaluate_universe_staged(
             if not result.position_reason:
                 result.position_reason = "POSITION_ALREADY_OPEN"
 
+    gates_span.end()
+
     # Phase 3: Explainable scoring and capital-aware composite (after regime + position gates).
     # Phase 7.5: For Stage1-only, preserve stage1_score (with regime cap) to avoid flattening
     # when compute_score_breakdown would yield identical composite for all (NEUTRAL + HOLD + no liquidity).
+    # One vectorized pass over the universe (app.core.eval.scoring_batch), identical
+    # to per-symbol compute_score_breakdown + the regime caps below it.
+    scoring_span = start_span("scoring", "scoring", symbols=len(results))
+    scored: List[FullEvaluationResult] = []
+    scoring_rows: List[Dict[str, Any]] = []
     for result in results.values():
-        put_strike = None
-        if result.stage2 and result.stage2.selected_contract:
-            put_strike = result.stage2.selected_contract.contract.strike
         try:
-            breakdown, composite = compute_score_breakdown(
-                data_completeness=result.data_completeness,
-                regime=result.regime,
-                liquidity_ok=result.liquidity_ok,
-                liquidity_grade=result.stage2.liquidity_grade if result.stage2 else None,
-                verdict=result.verdict,
-                position_open=result.position_open,
-                price=result.price,
-                selected_put_strike=put_strike,
-            )
-            raw_score_val: int
-            final_score_val: int
-            applied_caps: List[Dict[str, Any]] = []
-
-            if result.stage_reached == EvaluationStage.STAGE1_ONLY:
-                # Preserve stage1_score to maintain ranking; apply regime cap
-                raw = result.stage1.stage1_score if result.stage1 else result.score
-                raw_score_val = int(raw) if raw is not None else 0
-                if market_regime_value == "RISK_OFF":
-                    cap_val = 50
-                    final_score_val = min(raw_score_val, cap_val)
-                    if raw_score_val > cap_val:
-                        applied_caps.append({
-                            "type": "regime_cap",
-                            "cap_value": cap_val,
-                            "before": raw_score_val,
-                            "after": final_score_val,
-                            "reason": "Regime RISK_OFF caps score to 50",
-                        })
-                elif market_regime_value == "NEUTRAL":
-                    cap_val = 65
-                    final_score_val = min(raw_score_val, cap_val)
-                    if raw_score_val > cap_val:
-                        applied_caps.append({
-                            "type": "regime_cap",
-                            "cap_value": cap_val,
-                            "before": raw_score_val,
-                            "after": final_score_val,
-                            "reason": "Regime NEUTRAL caps score to 65",
-                        })
-                else:
-                    final_score_val = raw_score_val
-                result.score = final_score_val
-                result.raw_score = raw_score_val
-            else:
-                raw_score_val = max(0, min(100, composite))
-                if market_regime_value == "RISK_OFF":
-                    cap_val = 50
-                    final_score_val = min(raw_score_val, cap_val)
-                    if raw_score_val > cap_val:
-                        applied_caps.append({
-                            "type": "regime_cap",
-                            "cap_value": cap_val,
-                            "before": raw_score_val,
-                            "after": final_score_val,
-                            "reason": "Regime RISK_OFF caps score to 50",
-                        })
-                elif market_regime_value == "NEUTRAL":
-                    cap_val = 65
-                    final_score_val = min(raw_score_val, cap_val)
-                    if raw_score_val > cap_val:
-                        applied_caps.append({
-                            "type": "regime_cap",
-                            "cap_value": cap_val,
-                            "before": raw_score_val,
-                            "after": final_score_val,
-                            "reason": "Regime NEUTRAL caps score to 65",
-                        })
-                else:
-                    final_score_val = raw_score_val
-                result.score = max(0, min(100, final_score_val))
-                result.raw_score = raw_score_val
-            regime_cap_val = 50 if market_regime_value == "RISK_OFF" else (65 if market_regime_value == "NEUTRAL" else None)
-            result.score_caps = {
-                "regime_cap": regime_cap_val,
-                "applied_caps": applied_caps,
-            }
-            bd_dict = breakdown.to_dict()
-            bd_dict["raw_score"] = raw_score_val
-            bd_dict["final_score"] = result.score
-            bd_dict["score_caps"] = result.score_caps
-            result.score_breakdown = bd_dict
-            result.rank_reasons = build_rank_reasons(
-                breakdown, result.regime, result.data_completeness,
-                result.liquidity_ok, result.verdict,
-            )
-            result.csp_notional = breakdown.csp_notional
-            result.notional_pct = breakdown.notional_pct
+            put_strike = None
+            if result.stage2 and result.stage2.selected_contract:
+                put_strike = result.stage2.selected_contract.contract.strike
+            stage1_only = result.stage_reached == EvaluationStage.STAGE1_ONLY
+            scoring_rows.append({
+                "data_completeness": result.data_completeness,
+                "regime": result.regime,
+                "liquidity_ok": result.liquidity_ok,
+                "liquidity_grade": result.stage2.liquidity_grade if result.stage2 else None,
+                "verdict": result.verdict,
+                "position_open": result.position_open,
+                "selected_put_strike": put_strike,
+                "stage1_only": stage1_only,
+                "stage1_score": (result.stage1.stage1_score if result.stage1 else result.score) if stage1_only else None,
+            })
+            scored.append(result)
         except Exception as e:
             logger.debug("[STAGED_EVAL] Score breakdown for %s: %s", result.symbol, e)
+    if scoring_profile is None:
+        try:
+            scoring_profile = compile_scoring_profile()
+        except Exception as e:
+            logger.debug("[STAGED_EVAL] Score breakdown skipped: %s", e)
+            scored = []
+    universe_scores = score_universe(scoring_rows, profile=scoring_profile, market_regime=market_regime_value) if scored else None
+    for i, result in enumerate(scored):
+        if i in universe_scores.errors:
+            logger.debug("[STAGED_EVAL] Score breakdown for %s: %s", result.symbol, universe_scores.errors[i])
+            continue
+        breakdown = universe_scores.breakdown(i)
+        result.raw_score = int(universe_scores.raw_score[i])
+        result.score = int(universe_scores.final_score[i])
+        result.score_caps = universe_scores.score_caps(i)
+        bd_dict = breakdown.to_dict()
+        bd_dict["raw_score"] = result.raw_score
+        bd_dict["final_score"] = result.score
+        bd_dict["score_caps"] = result.score_caps
+        result.score_breakdown = bd_dict
+        result.rank_reasons = build_rank_reasons(
+            breakdown, result.regime, result.data_completeness,
+            result.liquidity_ok, result.verdict,
+        )
+        result.csp_notional = breakdown.csp_notional
+        result.notional_pct = breakdown.notional_pct
 
     # Phase 8: Build strategy rationale for each result (human-readable verdict explanation).
     # Phase 10: Compute confidence band and capital hint for each result.
@@ -2251,10 +2288,12 @@ def evaluate_universe_staged(
                 liquidity_ok=result.liquidity_ok,
                 score=result.score,
                 position_open=result.position_open,
+                band_limits=scoring_profile.band_limits if scoring_profile is not None else None,
             )
             result.band_reason = result.capital_hint.band_reason if result.capital_hint else None
         except Exception as e:
             logger.debug("[STAGED_EVAL] Confidence band for %s: %s", result.symbol, e)
+    scoring_span.end()
 
     # Score flattening check: warn if all scores identical (Phase 7.5: preserve stage1_score for Stage1-only)
     all_scores = [r.score for r in results.values() if r.score > 0]
@@ -2286,10 +2325,12 @@ def _run_full_evaluation_for_qualified(
     stage1: Stage1Result,
     provider: OratsChainProvider,
     holdings: Optional[Dict[str, int]] = None,
+    scoring_profile: Optional[ScoringProfile] = None,
 ) -> FullEvaluationResult:
     """Run full evaluation for a qualified symbol. holdings used for CC eligibility (Phase 21.1)."""
     result = evaluate_symbol_full(
-        symbol, chain_provider=provider, skip_stage2=False, holdings=holdings or {}
+        symbol, chain_provider=provider, skip_stage2=False, holdings=holdings or {},
+        scoring_profile=scoring_profile,
     )
     # Ensure stage1 is preserved
     result.stage1 = stage1
@@ -0,0 +1,100 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""Symbol-keyed index over evaluation rows.
+
+EvaluationRunFull.symbols (dicts) and DecisionArtifactV2.symbols / selected_candidates
+(dataclass rows) are lists; consumers used to find a symbol with a linear scan, so P
+positions x N symbols cost O(P*N) per run. SymbolIndex maps the normalized symbol to
+its row (first occurrence wins, matching the scans it replaces) and is built lazily
+once per owner, then shared by every consumer holding the same run/artifact.
+
+The index is a read-only view of the rows at build time. It is rebuilt automatically
+when the owner's list is replaced or changes length; in-place row swaps on a loaded
+run/artifact are not supported (the stores never do that — merges build a new artifact).
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterator, Mapping, Optional, Sequence
+
+
+def normalize_symbol(symbol: Any) -> str:
+    return (symbol or "").strip().upper() if isinstance(symbol, str) else ""
+
+
+def _row_symbol(row: Any) -> str:
+    if isinstance(row, dict):
+        return normalize_symbol(row.get("symbol"))
+    return normalize_symbol(getattr(row, "symbol", None))
+
+
+class SymbolIndex(Mapping[str, Any]):
+    """Immutable symbol -> row mapping (plus row position). Lookups normalize the key."""
+
+    __slots__ = ("_rows", "_positions")
+
+    def __init__(self, rows: Sequence[Any]) -> None:
+        by_symbol: Dict[str, Any] = {}
+        positions: Dict[str, int] = {}
+        for i, row in enumerate(rows or ()):
+            sym = _row_symbol(row)
+            if sym and sym not in by_symbol:
+                by_symbol[sym] = row
+                positions[sym] = i
+        self._rows = by_symbol
+        self._positions = positions
+
+    def __getitem__(self, symbol: str) -> Any:
+        return self._rows[normalize_symbol(symbol)]
+
+    def __contains__(self, symbol: object) -> bool:
+        return normalize_symbol(symbol) in self._rows
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def get(self, symbol: str, default: Any = None) -> Any:  # type: ignore[override]
+        return self._rows.get(normalize_symbol(symbol), default)
+
+    def position(self, symbol: str) -> Optional[int]:
+        """Index of the symbol's row in the source list, or None."""
+        return self._positions.get(normalize_symbol(symbol))
+
+    def __repr__(self) -> str:
+        return f"SymbolIndex({len(self._rows)} symbols)"
+
+
+_EMPTY = SymbolIndex(())
+
+
+def cached_symbol_index(owner: Any, rows_attr: str = "symbols") -> SymbolIndex:
+    """Index of owner.<rows_attr>, built on first use and cached on the owner (not a dataclass field,
+    so it never reaches asdict()/to_dict() or run checksums)."""
+    if owner is None:
+        return _EMPTY
+    rows = getattr(owner, rows_attr, None)
+    if not rows:
+        return _EMPTY
+    cache_attr = f"_symbol_index_{rows_attr}"
+    try:
+        cache = owner.__dict__
+    except AttributeError:
+        return SymbolIndex(rows)
+    cached = cache.get(cache_attr)
+    # Hold the source list itself: an id() could be reused by a new list once the old one is freed
+    if cached is not None and cached[0] is rows and cached[1] == len(rows):
+        return cached[2]
+    index = SymbolIndex(rows)
+    cache[cache_attr] = (rows, len(rows), index)
+    return index
+
+
+def symbol_row(owner: Any, symbol: str) -> Optional[Any]:
+    """Row for symbol in owner.symbols (run or artifact), via the shared cached index."""
+    return cached_symbol_index(owner).get(symbol)
+
+
+__all__ = ["SymbolIndex", "cached_symbol_index", "normalize_symbol", "symbol_row"]
@@ -7,7 +7,7 @@ from __future__ import annotations
 import logging
 import threading
 import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
@@ -214,6 +214,12 @@ def get_evaluation_state() -> Dict[str, Any]:
         }
 
 
+def is_evaluation_running() -> bool:
+    """True while a triggered full universe run holds the run lock in this process."""
+    with _EVAL_LOCK:
+        return _IS_RUNNING
+
+
 def trigger_evaluation(
     universe_symbols: List[str],
     market_phase: Optional[str] = None,
@@ -271,6 +277,11 @@ def trigger_evaluation(
         return {"started": False, "reason": str(e), "run_id": run_id}
 
     def _run():
+        from app.core.observability.tracing import trace_run
+        with trace_run(run_id, source="trigger", symbols=len(universe_symbols)):
+            _run_evaluation()
+
+    def _run_evaluation():
         global _IS_RUNNING, _CURRENT_RUN_ID
         try:
             result = run_universe_evaluation_staged(universe_symbols, use_staged=True)
@@ -803,7 +814,11 @@ def _generate_candidate_trades(symbol: str, strikes: List[Dict], stock_price: Op
     return candidates
 
 
-def run_universe_evaluation_staged(universe_symbols: List[str], use_staged: bool = True) -> UniverseEvaluationResult:
+def run_universe_evaluation_staged(
+    universe_symbols: List[str],
+    use_staged: bool = True,
+    publish: bool = True,
+) -> UniverseEvaluationResult:
     """
     Run 2-stage evaluation across universe symbols.
     
@@ -813,6 +828,10 @@ def run_universe_evaluation_staged(universe_symbols: List[str], use_staged: bool
     Args:
         universe_symbols: List of stock symbols
         use_staged: If True, use 2-stage pipeline; if False, fall back to legacy
+        publish: If True, the run replaces the global universe result (RUNNING, then the
+            final result, or FAILED on error). Partial evaluations merged into the v2 store
+            (symbol recompute, tiered scheduler batches) pass False so the universe views
+            keep showing the last full run.
     
     Returns:
         UniverseEvaluationResult with staged evaluation data
@@ -835,13 +854,18 @@ def run_universe_evaluation_staged(universe_symbols: List[str], use_staged: bool
         total=len(universe_symbols),
     )
     with _CACHE_LOCK:
-        _CACHE = result
+        previous = _CACHE
+        if publish:
+            _CACHE = result
     
     try:
+        from app.core.config.registry import pinned_configs
         from app.core.eval.staged_evaluator import evaluate_universe_staged, EvaluationStage, StagedEvaluationResult
         
         # Run staged evaluation; contract: StagedEvaluationResult (never assume flat list)
-        staged_out = evaluate_universe_staged(universe_symbols)
+        # Config snapshots read on this thread stay fixed for the whole run
+        with pinned_configs():
+            staged_out = evaluate_universe_staged(universe_symbols)
         if not isinstance(staged_out, StagedEvaluationResult):
             raise TypeError("evaluate_universe_staged must return StagedEvaluationResult")
         staged_results = staged_out.results
@@ -961,8 +985,9 @@ def run_universe_evaluation_staged(universe_symbols: List[str], use_staged: bool
         )
         
         # Update cache
-        with _CACHE_LOCK:
-            _CACHE = final_result
+        if publish:
+            with _CACHE_LOCK:
+                _CACHE = final_result
         
         logger.info("[STAGED_EVAL] Completed: %d evaluated, %d stage2, %d eligible, %.1fs",
                     evaluated, stage2_count, eligible, duration)
@@ -974,6 +999,18 @@ def run_universe_evaluation_staged(universe_symbols: List[str], use_staged: bool
         # No silent fallback: staged evaluation is the single source of truth.
         # Let exception propagate so caller can persist FAILED and return 500.
         logger.exception("[STAGED_EVAL] Staged evaluation failed - aborting (no legacy fallback): %s", e)
+        if publish:
+            # Never leave the published state at RUNNING; keep the last run's rows for the views
+            reason = f"2-stage evaluation failed: {e}"
+            with _CACHE_LOCK:
+                if previous is not None:
+                    _CACHE = replace(previous, evaluation_state="FAILED", evaluation_state_reason=reason)
+                else:
+                    _CACHE = UniverseEvaluationResult(
+                        evaluation_state="FAILED",
+                        evaluation_state_reason=reason,
+                        total=len(universe_symbols),
+                    )
         raise
 
 
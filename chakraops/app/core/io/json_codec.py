@@ -0,0 +1,237 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""
+JSON codec for persisted stores and artifacts.
+
+Backends: orjson when it is installed (optional), stdlib json otherwise. Set
+CHAKRAOPS_JSON_CODEC=stdlib to force the fallback. Both backends write the same document:
+
+  - compact separators, UTF-8 (non-ASCII is not \\u-escaped)
+  - dataclass instances are encoded field by field, without an asdict() deep copy
+  - Enum -> value; numpy scalars/arrays -> Python numbers/lists (orjson OPT_SERIALIZE_NUMPY,
+    .item()/.tolist() on stdlib); datetime and any other unknown object -> str(obj), as default=str did
+  - non-str dict keys -> str keys
+
+Numbers may differ in spelling between backends (1e-05 vs 0.00001) but parse to the same
+values. orjson writes NaN/Infinity as null; stdlib keeps the NaN literals. Values orjson
+cannot encode (ints wider than 64 bits) fall back to stdlib for that value only.
+
+dump()/write_json_atomic() stream: containers in the top two levels are written one member
+per line and each member is encoded on its own, so a large artifact (2,000 symbol rows) is
+never held as one string, and files stay line-oriented for diffs and the snapshot archive.
+
+loads()/load() accept bytes or str. Documents orjson rejects (NaN literals written by the
+stdlib encoder) are re-parsed with stdlib json, so older files stay readable.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import io
+import json
+import logging
+import os
+from enum import Enum
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, Iterator, Optional, Union
+
+try:
+    import orjson as _orjson
+except ImportError:  # optional; stdlib json is used without it
+    _orjson = None
+
+try:
+    import numpy as _np
+except ImportError:  # optional; only needed to recognise numpy values
+    _np = None
+
+logger = logging.getLogger(__name__)
+
+# Containers at depth < _STREAM_DEPTH are written member by member
+_STREAM_DEPTH = 2
+_WRITE_BUFFER = 1 << 16
+
+
+def shallow_asdict(obj: Any) -> Dict[str, Any]:
+    """Field name -> value for a dataclass instance, without asdict()'s recursive deep copy."""
+    return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+
+
+def _default(obj: Any) -> Any:
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return shallow_asdict(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    if _np is not None:
+        if isinstance(obj, _np.generic):
+            return obj.item()
+        if isinstance(obj, _np.ndarray):
+            return obj.tolist()
+    return str(obj)
+
+
+_stdlib_encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=_default)
+_stdlib_sorted_encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=_default, sort_keys=True)
+
+
+def _stdlib_dumps(obj: Any, sort_keys: bool = False) -> bytes:
+    return (_stdlib_sorted_encoder if sort_keys else _stdlib_encoder).encode(obj).encode("utf-8")
+
+
+def _stdlib_loads(data: Union[bytes, str]) -> Any:
+    return json.loads(data)
+
+
+if _orjson is not None:
+    _OPTS = _orjson.OPT_NON_STR_KEYS | _orjson.OPT_PASSTHROUGH_DATETIME | _orjson.OPT_SERIALIZE_NUMPY
+
+    def _orjson_dumps(obj: Any, sort_keys: bool = False) -> bytes:
+        try:
+            return _orjson.dumps(obj, default=_default, option=_OPTS | (_orjson.OPT_SORT_KEYS if sort_keys else 0))
+        except TypeError:
+            return _stdlib_dumps(obj, sort_keys)
+
+    def _orjson_loads(data: Union[bytes, str]) -> Any:
+        try:
+            return _orjson.loads(data)
+        except _orjson.JSONDecodeError:
+            return json.loads(data)
+
+
+_BACKENDS: Dict[str, Any] = {"stdlib": (_stdlib_dumps, _stdlib_loads)}
+if _orjson is not None:
+    _BACKENDS["orjson"] = (_orjson_dumps, _orjson_loads)
+
+_dumps: Callable[..., bytes]
+_loads: Callable[[Union[bytes, str]], Any]
+_backend_name = ""
+
+
+def use_backend(name: Optional[str] = None) -> str:
+    """Select the codec backend ("orjson" | "stdlib"; None = best available). Returns the name in use."""
+    global _dumps, _loads, _backend_name
+    if name is None:
+        name = "orjson" if "orjson" in _BACKENDS else "stdlib"
+    if name not in _BACKENDS:
+        raise ValueError(f"JSON backend {name!r} is not available (have: {', '.join(sorted(_BACKENDS))})")
+    _dumps, _loads = _BACKENDS[name]
+    _backend_name = name
+    return name
+
+
+def backend_name() -> str:
+    return _backend_name
+
+
+use_backend(os.getenv("CHAKRAOPS_JSON_CODEC") or None)
+
+
+def dumps(obj: Any, *, sort_keys: bool = False) -> bytes:
+    """Encode obj as compact UTF-8 JSON bytes in one piece."""
+    return _dumps(obj, sort_keys)
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    if isinstance(data, (bytearray, memoryview)):
+        data = bytes(data)
+    return _loads(data)
+
+
+def load(fp: IO[Any]) -> Any:
+    """Parse a JSON document from an open file (binary or text)."""
+    return loads(fp.read())
+
+
+def read_json(path: Union[str, Path]) -> Any:
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def _key(k: Any) -> str:
+    if isinstance(k, str):
+        return k
+    if isinstance(k, bool):
+        return "true" if k else "false"
+    if k is None:
+        return "null"
+    if isinstance(k, Enum):
+        return str(k.value)
+    return str(k)
+
+
+def iter_encode(obj: Any, *, sort_keys: bool = False, _depth: int = 0) -> Iterator[bytes]:
+    """Encode obj as a sequence of byte pieces (see module docstring for the layout)."""
+    if _depth >= _STREAM_DEPTH:
+        yield _dumps(obj, sort_keys)
+        return
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        obj = shallow_asdict(obj)
+    if isinstance(obj, dict) and obj:
+        items = sorted(obj.items(), key=lambda kv: _key(kv[0])) if sort_keys else obj.items()
+        sep = b"{\n"
+        for k, v in items:
+            yield sep + _dumps(_key(k)) + b":"
+            yield from iter_encode(v, sort_keys=sort_keys, _depth=_depth + 1)
+            sep = b",\n"
+        yield b"\n}"
+    elif isinstance(obj, (list, tuple)) and obj:
+        sep = b"[\n"
+        for v in obj:
+            yield sep
+            yield from iter_encode(v, sort_keys=sort_keys, _depth=_depth + 1)
+            sep = b",\n"
+        yield b"\n]"
+    else:
+        yield _dumps(obj, sort_keys)
+
+
+def dump(obj: Any, fp: IO[Any], *, sort_keys: bool = False) -> int:
+    """Stream obj into an open file (binary or text). Returns the number of bytes encoded."""
+    text = isinstance(fp, io.TextIOBase)
+    buf = bytearray()
+    total = 0
+    for piece in iter_encode(obj, sort_keys=sort_keys):
+        buf += piece
+        if len(buf) >= _WRITE_BUFFER:
+            fp.write(buf.decode("utf-8") if text else buf)
+            total += len(buf)
+            buf.clear()
+    if buf:
+        fp.write(buf.decode("utf-8") if text else buf)
+        total += len(buf)
+    return total
+
+
+def write_json_atomic(path: Union[str, Path], obj: Any, *, fsync: bool = True, sort_keys: bool = False) -> int:
+    """Stream obj to path via a temp file and rename (no partial file on failure). Returns bytes written."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    try:
+        with open(tmp, "wb") as f:
+            n = dump(obj, f, sort_keys=sort_keys)
+            f.flush()
+            if fsync:
+                os.fsync(f.fileno())
+        os.replace(tmp, path)
+        return n
+    except BaseException:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        raise
+
+
+__all__ = [
+    "backend_name",
+    "dump",
+    "dumps",
+    "iter_encode",
+    "load",
+    "loads",
+    "read_json",
+    "shallow_asdict",
+    "use_backend",
+    "write_json_atomic",
+]
@@ -4,12 +4,12 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import threading
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from app.core.io import json_codec
 from app.core.journal.models import Trade, Fill, FillAction, generate_trade_id, generate_fill_id
 
 logger = logging.getLogger(__name__)
@@ -123,8 +123,7 @@ def list_trades(limit: int = 100) -> List[Trade]:
     with _LOCK:
         for path in files:
             try:
-                with open(path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                data = json_codec.read_json(path)
                 t = Trade.from_dict(data)
                 compute_trade_derived(t)
                 trades.append(t)
@@ -141,8 +140,7 @@ def get_trade(trade_id: str) -> Optional[Trade]:
         return None
     with _LOCK:
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = json_codec.read_json(path)
             t = Trade.from_dict(data)
             compute_trade_derived(t)
             return t
@@ -160,8 +158,8 @@ def create_trade(payload: Dict[str, Any]) -> Trade:
     compute_trade_derived(t)
     path = _trade_path(trade_id)
     with _LOCK:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(t.to_dict(), f, indent=2, default=str)
+        with open(path, "wb") as f:
+            json_codec.dump(t.to_dict(), f)
     logger.info("[JOURNAL] Created trade %s", trade_id)
     return t
 
@@ -186,8 +184,8 @@ def update_trade(trade_id: str, payload: Dict[str, Any]) -> Optional[Trade]:
     compute_trade_derived(t)
     path = _trade_path(trade_id)
     with _LOCK:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(t.to_dict(), f, indent=2, default=str)
+        with open(path, "wb") as f:
+            json_codec.dump(t.to_dict(), f)
     logger.info("[JOURNAL] Updated trade %s", trade_id)
     return t
 
@@ -224,8 +222,8 @@ def add_fill(trade_id: str, payload: Dict[str, Any]) -> Optional[Trade]:
     compute_trade_derived(trade)
     path = _trade_path(trade_id)
     with _LOCK:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(trade.to_dict(), f, indent=2, default=str)
+        with open(path, "wb") as f:
+            json_codec.dump(trade.to_dict(), f)
     logger.info("[JOURNAL] Added fill %s to trade %s", fill_id, trade_id)
     return trade
 
@@ -240,8 +238,8 @@ def delete_fill(trade_id: str, fill_id: str) -> Optional[Trade]:
     compute_trade_derived(trade)
     path = _trade_path(trade_id)
     with _LOCK:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(trade.to_dict(), f, indent=2, default=str)
+        with open(path, "wb") as f:
+            json_codec.dump(trade.to_dict(), f)
     logger.info("[JOURNAL] Deleted fill %s from trade %s", fill_id, trade_id)
     return trade
 
@@ -262,8 +260,7 @@ def get_next_actions() -> Dict[str, Dict[str, Any]]:
         return {}
     with _LOCK:
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = json_codec.read_json(path)
             return data if isinstance(data, dict) else {}
         except Exception as e:
             logger.warning("[JOURNAL] Failed to load next_actions: %s", e)
@@ -275,6 +272,6 @@ def save_next_actions(next_actions: Dict[str, Dict[str, Any]]) -> None:
     path = _next_actions_path()
     _ensure_journal_dir()
     with _LOCK:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(next_actions, f, indent=2, default=str)
+        with open(path, "wb") as f:
+            json_codec.dump(next_actions, f)
     logger.info("[JOURNAL] Saved next_actions for %d trades", len(next_actions))
@@ -1,6 +1,6 @@
 # Copyright 2026 ChakraOps
 # SPDX-License-Identifier: MIT
-"""Phase 2C: Lifecycle-aware alerting — position lifecycle states and directive alerts. Phase 7.0: Exit planner."""
+"""Phase 2C: Lifecycle-aware alerting — position lifecycle states and directive alerts. Phase 7.0: Exit planner. Trigger index: quote-driven stop/target triggers."""
 
 from app.core.lifecycle.models import (
     LifecycleAction,
@@ -10,6 +10,7 @@ from app.core.lifecycle.models import (
 )
 from app.core.lifecycle.engine import evaluate_position_lifecycle
 from app.core.lifecycle.exit_planner import build_exit_plan
+from app.core.lifecycle.trigger_index import TriggerIndex
 
 __all__ = [
     "LifecycleAction",
@@ -18,4 +19,5 @@ __all__ = [
     "ExitReason",
     "evaluate_position_lifecycle",
     "build_exit_plan",
+    "TriggerIndex",
 ]
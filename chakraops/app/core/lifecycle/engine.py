@@ -14,6 +14,7 @@ from app.core.lifecycle.models import (
     ExitReason,
 )
 from app.core.positions.models import Position
+from app.core.eval.symbol_index import symbol_row
 
 logger = logging.getLogger(__name__)
 
@@ -27,47 +28,42 @@ def _safe_float(val: Any, default: Optional[float] = None) -> Optional[float]:
         return default
 
 
-def _get_symbol_price_from_eval(eval_snapshot: Any, symbol: str) -> Optional[float]:
-    """Extract spot price for symbol from evaluation run symbols list."""
+def _symbol_row_from_eval(eval_snapshot: Any, symbol: str) -> Optional[Dict[str, Any]]:
+    """Per-symbol dict from the run's shared symbol index (O(1) after the first lookup per run)."""
     if not eval_snapshot or not hasattr(eval_snapshot, "symbols"):
         return None
-    sym_upper = (symbol or "").strip().upper()
-    for s in (eval_snapshot.symbols or []):
-        if isinstance(s, dict) and (s.get("symbol") or "").strip().upper() == sym_upper:
-            return _safe_float(s.get("price"))
-    return None
+    row = symbol_row(eval_snapshot, symbol)
+    return row if isinstance(row, dict) else None
+
+
+def _get_symbol_price_from_eval(eval_snapshot: Any, symbol: str) -> Optional[float]:
+    """Extract spot price for symbol from evaluation run symbols list."""
+    s = _symbol_row_from_eval(eval_snapshot, symbol)
+    return _safe_float(s.get("price")) if s is not None else None
 
 
 def _get_symbol_verdict_from_eval(eval_snapshot: Any, symbol: str) -> Optional[str]:
     """Extract verdict for symbol from evaluation run."""
-    if not eval_snapshot or not hasattr(eval_snapshot, "symbols"):
-        return None
-    sym_upper = (symbol or "").strip().upper()
-    for s in (eval_snapshot.symbols or []):
-        if isinstance(s, dict) and (s.get("symbol") or "").strip().upper() == sym_upper:
-            return (s.get("verdict") or "").strip() or None
-    return None
+    s = _symbol_row_from_eval(eval_snapshot, symbol)
+    return ((s.get("verdict") or "").strip() or None) if s is not None else None
 
 
 def _is_data_unreliable(eval_snapshot: Any, symbol: str) -> bool:
     """True if symbol has data health failure (low completeness, missing price).
     BLOCKED is regime-related, not data — handled by _regime_allows_symbol."""
-    if not eval_snapshot or not hasattr(eval_snapshot, "symbols"):
+    s = _symbol_row_from_eval(eval_snapshot, symbol)
+    if s is None:
+        # Symbol not in eval run — data unreliable for lifecycle
+        return True
+    verdict = (s.get("verdict") or "").strip()
+    if verdict in ("DATA_INCOMPLETE", "DATA_INCOMPLETE_FATAL"):
+        return True
+    completeness = _safe_float(s.get("data_completeness"), 1.0)
+    if completeness is not None and completeness < 0.5:
         return True
-    sym_upper = (symbol or "").strip().upper()
-    for s in (eval_snapshot.symbols or []):
-        if isinstance(s, dict) and (s.get("symbol") or "").strip().upper() == sym_upper:
-            verdict = (s.get("verdict") or "").strip()
-            if verdict in ("DATA_INCOMPLETE", "DATA_INCOMPLETE_FATAL"):
-                return True
-            completeness = _safe_float(s.get("data_completeness"), 1.0)
-            if completeness is not None and completeness < 0.5:
-                return True
-            if s.get("price") is None and s.get("stockPrice") is None:
-                return True
-            return False
-    # Symbol not in eval run — data unreliable for lifecycle
-    return True
+    if s.get("price") is None and s.get("stockPrice") is None:
+        return True
+    return False
 
 
 def _regime_allows_symbol(regime: str, symbol_explain: Dict[str, Any]) -> bool:
@@ -160,11 +156,33 @@ def evaluate_position_lifecycle(
     if price is None:
         return events
 
+    events.extend(evaluate_price_levels(pos_id, sym, status, price, stop, target1, target2, eval_run_id=eval_run_id))
+    return events
+
+
+def evaluate_price_levels(
+    position_id: str,
+    symbol: str,
+    status: str,
+    price: float,
+    stop: Optional[float],
+    target1: Optional[float],
+    target2: Optional[float],
+    eval_run_id: str = "",
+) -> List[LifecycleEvent]:
+    """
+    Price-level rules of evaluate_position_lifecycle (at most one event), shared with the
+    quote-driven trigger index so both paths emit identical directives.
+
+    Priority: stop (price <= stop) > target2 (price >= target2) > target1 (price >= target1:
+    SCALE_OUT when OPEN; EXIT remaining when PARTIAL_EXIT and no target2 is set).
+    """
+    events: List[LifecycleEvent] = []
     # Stop hit → EXIT IMMEDIATELY (highest priority)
     if stop is not None and price <= stop:
         events.append(LifecycleEvent(
-            position_id=pos_id,
-            symbol=sym,
+            position_id=position_id,
+            symbol=symbol,
             lifecycle_state=LifecycleState.CLOSED,
             action=LifecycleAction.EXIT,
             reason=ExitReason.STOP_LOSS,
@@ -177,8 +195,8 @@ def evaluate_position_lifecycle(
     # Target2 hit → EXIT ALL REMAINING
     if target2 is not None and price >= target2:
         events.append(LifecycleEvent(
-            position_id=pos_id,
-            symbol=sym,
+            position_id=position_id,
+            symbol=symbol,
             lifecycle_state=LifecycleState.CLOSED,
             action=LifecycleAction.EXIT,
             reason=ExitReason.TARGET_2,
@@ -191,8 +209,8 @@ def evaluate_position_lifecycle(
     # Target1 hit → EXIT 1 CONTRACT (scale out)
     if target1 is not None and price >= target1 and status == "OPEN":
         events.append(LifecycleEvent(
-            position_id=pos_id,
-            symbol=sym,
+            position_id=position_id,
+            symbol=symbol,
             lifecycle_state=LifecycleState.PARTIAL_EXIT,
             action=LifecycleAction.SCALE_OUT,
             reason=ExitReason.TARGET_1,
@@ -209,8 +227,8 @@ def evaluate_position_lifecycle(
             pass
         else:
             events.append(LifecycleEvent(
-                position_id=pos_id,
-                symbol=sym,
+                position_id=position_id,
+                symbol=symbol,
                 lifecycle_state=LifecycleState.CLOSED,
                 action=LifecycleAction.EXIT,
                 reason=ExitReason.TARGET_2,
@@ -0,0 +1,405 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""Quote-driven lifecycle triggers — per-symbol sorted stop/target levels.
+
+Lifecycle directives (SCALE_OUT / EXIT / STOP_LOSS) used to be produced only when an
+evaluation run completed. TriggerIndex arms the stop and target levels of every
+OPEN / PARTIAL_EXIT position once, then evaluates fresh underlying quotes (ORATS
+delayed quotes or ThetaTerminal) independently of evaluation runs:
+
+    per symbol:  stops   max-heap  — fires while top level >= price
+                 uppers  min-heap  — fires while top level <= price (next target per position)
+
+A quote that crosses nothing costs two O(1) heap peeks; each crossed level costs one
+O(log n) pop (+ one push when a SCALE_OUT re-arms the position for its next target).
+Superseded entries are dropped lazily: each arming gets a fresh generation number.
+
+When a level is crossed the directive itself comes from
+engine.evaluate_price_levels, so quote-driven events are identical to the ones an
+evaluation run would emit at the same price. Fired levels disarm (EXIT closes the
+position in the index, SCALE_OUT moves it to PARTIAL_EXIT). Alert routing and cooldown
+live in alert_engine.process_lifecycle_trigger_events.
+
+The shared index (get_trigger_index) is armed from the position store on first use and
+kept current by the store hooks: positions.store calls notify_position_saved /
+notify_position_deleted and symbols.targets calls notify_targets_saved. The API server's
+trigger poller (TRIGGER_POLL_ENABLED, every TRIGGER_POLL_SECONDS while the market is OPEN)
+calls poll_armed_triggers().
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from app.core.eval.symbol_index import normalize_symbol
+from app.core.lifecycle.engine import _safe_float, evaluate_price_levels
+from app.core.lifecycle.models import LifecycleAction, LifecycleEvent
+
+logger = logging.getLogger(__name__)
+
+_ARMED_STATUSES = ("OPEN", "PARTIAL_EXIT")
+
+TRIGGER_POLL_ENABLED = os.getenv("TRIGGER_POLL_ENABLED", "true").lower() in ("true", "1", "yes")
+TRIGGER_POLL_SECONDS = max(5, int(os.getenv("TRIGGER_POLL_SECONDS", "60")))
+TRIGGER_QUOTE_SOURCE = os.getenv("TRIGGER_QUOTE_SOURCE", "orats").strip().lower()
+
+# (heap key, tie-break sequence, position_id, generation)
+_HeapEntry = Tuple[float, int, str, int]
+
+
+@dataclass
+class _ArmedPosition:
+    position_id: str
+    symbol: str
+    status: str
+    stop: Optional[float]
+    target1: Optional[float]
+    target2: Optional[float]
+    gen: int = 0
+
+    def upper_level(self) -> Optional[float]:
+        """Lowest target that can still produce an event for the current status."""
+        if self.status == "OPEN":
+            levels = [x for x in (self.target1, self.target2) if x is not None]
+        elif self.target2 is not None:
+            levels = [self.target2]
+        else:
+            # PARTIAL_EXIT without target2: target1 exits the remainder (engine rule)
+            levels = [self.target1] if self.target1 is not None else []
+        return min(levels) if levels else None
+
+
+class _SymbolLevels:
+    __slots__ = ("stops", "uppers")
+
+    def __init__(self) -> None:
+        self.stops: List[_HeapEntry] = []
+        self.uppers: List[_HeapEntry] = []
+
+
+class TriggerIndex:
+    """
+    Armed stop/target levels for open positions, keyed by symbol. Thread-safe.
+
+    on_quote(symbol, price) returns the LifecycleEvents crossed by that quote (at most one
+    per position) and updates the armed state so the same level does not fire twice.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._positions: Dict[str, _ArmedPosition] = {}
+        self._levels: Dict[str, _SymbolLevels] = {}
+        self._seq = itertools.count()
+        self._stats = {"quotes": 0, "events": 0, "pops": 0, "stale_pops": 0}
+
+    # -- arming ---------------------------------------------------------------
+
+    def build(
+        self,
+        positions: Iterable[Any],
+        targets_loader: Optional[Callable[[str], Dict[str, Any]]] = None,
+    ) -> int:
+        """Replace the index with the OPEN/PARTIAL_EXIT positions; targets loaded once per symbol.
+        Returns the number of armed positions."""
+        if targets_loader is None:
+            from app.core.symbols.targets import get_targets as targets_loader
+        targets_by_symbol: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            self._positions.clear()
+            self._levels.clear()
+            for pos in positions:
+                sym = normalize_symbol(getattr(pos, "symbol", None))
+                if not sym:
+                    continue
+                if sym not in targets_by_symbol:
+                    targets_by_symbol[sym] = targets_loader(sym) or {}
+                self._arm(pos, targets_by_symbol[sym])
+            return len(self._positions)
+
+    def upsert_position(self, position: Any, targets: Mapping[str, Any]) -> bool:
+        """(Re-)arm one position with its symbol targets. Returns False when nothing is armed."""
+        with self._lock:
+            return self._arm(position, targets)
+
+    def remove_position(self, position_id: str) -> bool:
+        with self._lock:
+            return self._positions.pop(position_id, None) is not None
+
+    def _arm(self, position: Any, targets: Mapping[str, Any]) -> bool:
+        pos_id = getattr(position, "position_id", None) or ""
+        sym = normalize_symbol(getattr(position, "symbol", None))
+        status = (getattr(position, "status", None) or "OPEN").strip()
+        self._positions.pop(pos_id, None)
+        if not pos_id or not sym or status not in _ARMED_STATUSES:
+            return False
+        armed = _ArmedPosition(
+            position_id=pos_id,
+            symbol=sym,
+            status=status,
+            stop=_safe_float(targets.get("stop")),
+            target1=_safe_float(targets.get("target1")),
+            target2=_safe_float(targets.get("target2")),
+            gen=next(self._seq),
+        )
+        if armed.stop is None and armed.upper_level() is None:
+            return False
+        self._positions[pos_id] = armed
+        self._push_levels(armed)
+        return True
+
+    def _push_levels(self, armed: _ArmedPosition) -> None:
+        levels = self._levels.get(armed.symbol)
+        if levels is None:
+            levels = self._levels[armed.symbol] = _SymbolLevels()
+        if armed.stop is not None:
+            heapq.heappush(levels.stops, (-armed.stop, next(self._seq), armed.position_id, armed.gen))
+        upper = armed.upper_level()
+        if upper is not None:
+            heapq.heappush(levels.uppers, (upper, next(self._seq), armed.position_id, armed.gen))
+
+    def _live(self, entry: _HeapEntry) -> Optional[_ArmedPosition]:
+        armed = self._positions.get(entry[2])
+        return armed if armed is not None and armed.gen == entry[3] else None
+
+    # -- quotes ---------------------------------------------------------------
+
+    def on_quote(
+        self,
+        symbol: str,
+        price: Any,
+        source: str = "",
+        as_of: Optional[str] = None,
+    ) -> List[LifecycleEvent]:
+        """Evaluate one underlying quote. O(1) when no level is crossed, O(log n) per crossed level."""
+        sym = normalize_symbol(symbol)
+        px = _safe_float(price)
+        events: List[LifecycleEvent] = []
+        if px is None or px <= 0:
+            return events
+        with self._lock:
+            self._stats["quotes"] += 1
+            levels = self._levels.get(sym)
+            if levels is None:
+                return events
+            crossed: Dict[str, _ArmedPosition] = {}
+            self._pop_crossed(levels.stops, lambda key: -key >= px, crossed)
+            self._pop_crossed(levels.uppers, lambda key: key <= px, crossed)
+            for armed in crossed.values():
+                fired = evaluate_price_levels(
+                    armed.position_id, armed.symbol, armed.status, px, armed.stop, armed.target1, armed.target2,
+                )
+                for ev in fired:
+                    ev.meta = dict(ev.meta or {}, trigger_source=source or "quote", quote_as_of=as_of)
+                self._advance(armed, fired)
+                events.extend(fired)
+            if not levels.stops and not levels.uppers:
+                del self._levels[sym]
+            self._stats["events"] += len(events)
+        if events:
+            logger.info(
+                "[TRIGGERS] %s @ %.4f (%s): %s", sym, px, source or "quote",
+                ", ".join(f"{e.position_id}:{e.action.value}" for e in events),
+            )
+        return events
+
+    def on_quotes(self, prices: Mapping[str, Any], source: str = "", as_of: Optional[str] = None) -> List[LifecycleEvent]:
+        """Evaluate a batch of symbol -> price quotes."""
+        events: List[LifecycleEvent] = []
+        for sym, price in prices.items():
+            events.extend(self.on_quote(sym, price, source=source, as_of=as_of))
+        return events
+
+    def _pop_crossed(
+        self,
+        heap: List[_HeapEntry],
+        is_crossed: Callable[[float], bool],
+        crossed: Dict[str, _ArmedPosition],
+    ) -> None:
+        while heap and is_crossed(heap[0][0]):
+            entry = heapq.heappop(heap)
+            armed = self._live(entry)
+            if armed is None:
+                self._stats["stale_pops"] += 1
+                continue
+            self._stats["pops"] += 1
+            crossed[armed.position_id] = armed
+
+    def _advance(self, armed: _ArmedPosition, fired: List[LifecycleEvent]) -> None:
+        """Disarm on EXIT; on SCALE_OUT (or a crossed level with no event) re-arm under a new generation."""
+        self._positions.pop(armed.position_id, None)
+        if any(ev.action == LifecycleAction.EXIT for ev in fired):
+            return
+        if any(ev.action == LifecycleAction.SCALE_OUT for ev in fired):
+            armed.status = "PARTIAL_EXIT"
+        armed.gen = next(self._seq)
+        self._positions[armed.position_id] = armed
+        self._push_levels(armed)
+
+    # -- introspection ----------------------------------------------------------
+
+    def symbols(self) -> List[str]:
+        """Symbols with at least one armed position (the quote subscription set)."""
+        with self._lock:
+            return sorted({a.symbol for a in self._positions.values()})
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._positions)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats, armed_positions=len(self._positions), symbols=len(self._levels))
+
+
+def orats_quote_prices(symbols: List[str]) -> Dict[str, float]:
+    """Underlying prices from ORATS delayed equity quotes (batched, run-cache aware)."""
+    from app.core.orats.orats_equity_quote import fetch_equity_quotes_batch
+
+    out: Dict[str, float] = {}
+    for sym, quote in fetch_equity_quotes_batch(symbols).items():
+        price = _safe_float(getattr(quote, "price", None))
+        if price is not None and price > 0 and not getattr(quote, "error", None):
+            out[normalize_symbol(sym)] = price
+    return out
+
+
+def theta_quote_prices(symbols: List[str], provider: Any = None) -> Dict[str, float]:
+    """Underlying last-trade prices from the ThetaTerminal HTTP provider."""
+    if provider is None:
+        from app.market.providers.thetaterminal_http import ThetaTerminalHttpProvider
+        provider = ThetaTerminalHttpProvider()
+    return {normalize_symbol(s): p for s, p in provider.fetch_underlying_prices(symbols).items()}
+
+
+_QUOTE_SOURCES: Dict[str, Callable[[List[str]], Dict[str, float]]] = {
+    "orats": orats_quote_prices,
+    "thetaterminal": theta_quote_prices,
+}
+
+
+def poll_triggers(
+    index: TriggerIndex,
+    source: str = "orats",
+    quote_fetcher: Optional[Callable[[List[str]], Dict[str, float]]] = None,
+    dispatch: bool = True,
+) -> List[LifecycleEvent]:
+    """
+    One polling pass: fetch quotes for the armed symbols, evaluate them, and (when dispatch)
+    route the events through the lifecycle alert path (cooldown, Slack, out/alerts, out/lifecycle).
+    """
+    symbols = index.symbols()
+    if not symbols:
+        return []
+    fetcher = quote_fetcher or _QUOTE_SOURCES.get(source)
+    if fetcher is None:
+        raise ValueError(f"unknown quote source {source!r}; expected one of {sorted(_QUOTE_SOURCES)}")
+    try:
+        prices = fetcher(symbols)
+    except Exception as e:
+        logger.warning("[TRIGGERS] Quote fetch from %s failed: %s", source, e)
+        return []
+    events = index.on_quotes(prices, source=source, as_of=datetime.now(timezone.utc).isoformat())
+    if events and dispatch:
+        from app.core.alerts.alert_engine import process_lifecycle_trigger_events
+        process_lifecycle_trigger_events(events)
+    return events
+
+
+def build_trigger_index_from_store() -> TriggerIndex:
+    """TriggerIndex armed from the position store and stored symbol targets."""
+    from app.core.positions.store import list_positions
+
+    index = TriggerIndex()
+    index.build(p for p in list_positions(status=None) if (p.status or "").strip() in _ARMED_STATUSES)
+    return index
+
+
+_INDEX: Optional[TriggerIndex] = None
+_INDEX_LOCK = threading.Lock()
+
+
+def get_trigger_index() -> TriggerIndex:
+    """Process-wide index, armed from the position store on first use. The store is read outside
+    _INDEX_LOCK: store hooks run under the store lock and may reset the index."""
+    global _INDEX
+    index = _INDEX
+    if index is not None:
+        return index
+    built = build_trigger_index_from_store()
+    with _INDEX_LOCK:
+        if _INDEX is None:
+            _INDEX = built
+            logger.info("[TRIGGERS] Armed %d positions on %d symbols", len(built), len(built.symbols()))
+        return _INDEX
+
+
+def reset_trigger_index() -> None:
+    """Drop the shared index; the next get_trigger_index() re-arms it from the store."""
+    global _INDEX
+    with _INDEX_LOCK:
+        _INDEX = None
+
+
+def notify_position_saved(position: Any) -> None:
+    """Store hook: re-arm (or disarm, once CLOSED) one position. No-op until the index is built.
+    Never raises into the writer."""
+    index = _INDEX
+    if index is None:
+        return
+    try:
+        from app.core.symbols.targets import get_targets
+        sym = normalize_symbol(getattr(position, "symbol", None))
+        index.upsert_position(position, get_targets(sym) if sym else {})
+    except Exception as e:
+        logger.warning("[TRIGGERS] Position hook failed, re-arming on next poll: %s", e)
+        reset_trigger_index()
+
+
+def notify_position_deleted(position_id: str) -> None:
+    index = _INDEX
+    if index is not None:
+        index.remove_position(position_id)
+
+
+def notify_targets_saved(symbol: str, targets: Mapping[str, Any]) -> None:
+    """Targets hook: re-arm the open positions of symbol with the new levels."""
+    index = _INDEX
+    if index is None:
+        return
+    try:
+        from app.core.positions.store import list_positions
+        for pos in list_positions(symbol=symbol):
+            index.upsert_position(pos, targets)
+    except Exception as e:
+        logger.warning("[TRIGGERS] Targets hook failed, re-arming on next poll: %s", e)
+        reset_trigger_index()
+
+
+def poll_armed_triggers(source: Optional[str] = None, dispatch: bool = True) -> List[LifecycleEvent]:
+    """One poll of the shared index (the API server's trigger poller calls this)."""
+    return poll_triggers(get_trigger_index(), source=source or TRIGGER_QUOTE_SOURCE, dispatch=dispatch)
+
+
+__all__ = [
+    "TRIGGER_POLL_ENABLED",
+    "TRIGGER_POLL_SECONDS",
+    "TRIGGER_QUOTE_SOURCE",
+    "TriggerIndex",
+    "build_trigger_index_from_store",
+    "get_trigger_index",
+    "notify_position_deleted",
+    "notify_position_saved",
+    "notify_targets_saved",
+    "orats_quote_prices",
+    "poll_armed_triggers",
+    "poll_triggers",
+    "reset_trigger_index",
+    "theta_quote_prices",
+]
@@ -134,12 +134,21 @@ def _compute_regime_from_inputs(inputs: Dict[str, IndexInputs]) -> MarketRegime:
 def _fetch_index_inputs(
     daily_provider: Optional[Any] = None,
 ) -> Dict[str, IndexInputs]:
-    """Fetch EOD snapshot for SPY and QQQ; return as IndexInputs per symbol."""
+    """
+    Fetch EOD snapshot for SPY and QQQ; return as IndexInputs per symbol.
+    Default source is the shared daily-bar store; yfinance only if it has no bars.
+    """
     from app.core.journal.eod_snapshot import get_eod_snapshot
+    provider = daily_provider
+    if provider is None:
+        from app.core.data.daily_bars import get_daily_bar_repository
+        provider = get_daily_bar_repository().bars_dataframe
     result: Dict[str, IndexInputs] = {}
     for sym in REGIME_INDEX_SYMBOLS:
         try:
-            snap = get_eod_snapshot(sym, daily_provider=daily_provider)
+            snap = get_eod_snapshot(sym, daily_provider=provider)
+            if snap.close is None and daily_provider is None:
+                snap = get_eod_snapshot(sym)
             result[sym] = IndexInputs(
                 close=snap.close,
                 ema20=snap.ema20,
@@ -24,6 +24,51 @@ try:
 except ImportError:
     pytz = None
 
+from app.db.migrations import Migration, ensure_schema
+
+
+def _migrate_snapshot_v1(cursor: sqlite3.Cursor) -> None:
+    """Baseline market snapshot schema (pre-versioning; idempotent)."""
+    # Create market_snapshots table (metadata)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS market_snapshots (
+            snapshot_id TEXT PRIMARY KEY,
+            snapshot_timestamp_et TEXT NOT NULL,
+            provider TEXT NOT NULL DEFAULT 'snapshot',
+            symbol_count INTEGER NOT NULL,
+            data_age_minutes REAL NOT NULL,
+            is_frozen INTEGER NOT NULL DEFAULT 1,
+            created_at TEXT NOT NULL
+        )
+    """)
+
+    # Create market_snapshot_data table (one row per symbol)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS market_snapshot_data (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            snapshot_id TEXT NOT NULL,
+            symbol TEXT NOT NULL,
+            data_json TEXT,
+            has_data INTEGER NOT NULL DEFAULT 0,
+            created_at TEXT NOT NULL,
+            FOREIGN KEY (snapshot_id) REFERENCES market_snapshots(snapshot_id),
+            UNIQUE(snapshot_id, symbol)
+        )
+    """)
+
+    # Create indexes
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_snapshot_timestamp ON market_snapshots(snapshot_timestamp_et DESC)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_snapshot_data_symbol ON market_snapshot_data(symbol)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_snapshot_data_snapshot ON market_snapshot_data(snapshot_id)")
+
+
+# Versioned schema steps for the snapshot tables (see app.db.migrations). Defined before the
+# persistence import: persistence.initialize_schema() reads them while this module is mid-import.
+SNAPSHOT_MIGRATIONS = (
+    Migration(1, "baseline", _migrate_snapshot_v1),
+)
+
+
 from app.core.persistence import get_enabled_symbols, get_db_path
 from app.core.market_data.factory import get_market_data_provider
 
@@ -111,48 +156,8 @@ def parse_snapshot_timestamp(value: Any) -> Optional[datetime]:
 
 
 def init_snapshot_schema() -> None:
-    """Initialize market snapshot table schema."""
-    db_path = get_db_path()
-    db_path.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(str(db_path))
-    cursor = conn.cursor()
-    
-    try:
-        # Create market_snapshots table (metadata)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS market_snapshots (
-                snapshot_id TEXT PRIMARY KEY,
-                snapshot_timestamp_et TEXT NOT NULL,
-                provider TEXT NOT NULL DEFAULT 'snapshot',
-                symbol_count INTEGER NOT NULL,
-                data_age_minutes REAL NOT NULL,
-                is_frozen INTEGER NOT NULL DEFAULT 1,
-                created_at TEXT NOT NULL
-            )
-        """)
-        
-        # Create market_snapshot_data table (one row per symbol)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS market_snapshot_data (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                snapshot_id TEXT NOT NULL,
-                symbol TEXT NOT NULL,
-                data_json TEXT,
-                has_data INTEGER NOT NULL DEFAULT 0,
-                created_at TEXT NOT NULL,
-                FOREIGN KEY (snapshot_id) REFERENCES market_snapshots(snapshot_id),
-                UNIQUE(snapshot_id, symbol)
-            )
-        """)
-        
-        # Create indexes
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_snapshot_timestamp ON market_snapshots(snapshot_timestamp_et DESC)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_snapshot_data_symbol ON market_snapshot_data(symbol)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_snapshot_data_snapshot ON market_snapshot_data(snapshot_id)")
-        
-        conn.commit()
-    finally:
-        conn.close()
+    """Ensure the market snapshot schema is migrated (runs once per process per DB file)."""
+    ensure_schema(get_db_path(), "market_snapshot", SNAPSHOT_MIGRATIONS)
 
 
 def _load_snapshot_from_csv(csv_path: Path) -> Dict[str, Optional[pd.DataFrame]]:
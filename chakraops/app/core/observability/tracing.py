@@ -0,0 +1,445 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""
+Lightweight tracing spans for an evaluation run.
+
+trace_run(run_id) activates a RunTrace for the calling context; span() / traced() /
+start_span() record named, timed spans into it as a tree (parent = the span active
+when the child opened). Worker threads do not inherit context variables, so code that
+fans out to a pool wraps the callable with bind_to_trace(), which also records how long
+the task sat in the pool queue. add_wait() attributes blocking time (rate limiter,
+singleflight follower) to the current span so the profile can split queue wait from
+network time.
+
+With no active trace (API requests, tests, EVAL_TRACING=0) every entry point is one
+ContextVar lookup returning a shared no-op, so instrumented hot paths pay nothing.
+
+The finished tree is saved as trace.json next to the run artifacts (or under
+artifacts/runs/traces/ for runs without a run directory) and summarized by
+summarize_trace() for /api/ops/run-profile/{run_id}.
+"""
+
+from __future__ import annotations
+
+import functools
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Keep this many trace files for runs that have no run directory
+TRACE_RETENTION = 30
+
+
+def tracing_enabled() -> bool:
+    return os.getenv("EVAL_TRACING", "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+class Span:
+    __slots__ = ("span_id", "parent_id", "name", "category", "start", "end", "thread", "attrs", "waits")
+
+    def __init__(self, span_id: int, parent_id: Optional[int], name: str, category: str, attrs: Dict[str, Any]) -> None:
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.name = name
+        self.category = category
+        self.start = time.perf_counter()
+        self.end: Optional[float] = None
+        self.thread = threading.current_thread().name
+        self.attrs = attrs
+        self.waits: Dict[str, float] = {}
+
+    def to_dict(self, t0: float, now: float) -> Dict[str, Any]:
+        end = self.end if self.end is not None else now
+        out: Dict[str, Any] = {
+            "id": self.span_id,
+            "parent": self.parent_id,
+            "name": self.name,
+            "cat": self.category,
+            "start_ms": round((self.start - t0) * 1000, 3),
+            "dur_ms": round((end - self.start) * 1000, 3),
+            "thread": self.thread,
+        }
+        if self.waits:
+            out["wait_ms"] = {k: round(v, 3) for k, v in self.waits.items()}
+        if self.attrs:
+            out["attrs"] = self.attrs
+        if self.end is None:
+            out["open"] = True
+        return out
+
+
+class RunTrace:
+    """All spans recorded for one run; safe to append from any thread."""
+
+    def __init__(self, run_id: str) -> None:
+        self.run_id = run_id
+        self.started_at = datetime.now(timezone.utc).isoformat()
+        self.t0 = time.perf_counter()
+        self.spans: List[Span] = []
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def open_span(self, name: str, category: str, parent_id: Optional[int], attrs: Dict[str, Any]) -> Span:
+        with self._lock:
+            sp = Span(next(self._ids), parent_id, name, category, attrs)
+            self.spans.append(sp)
+        return sp
+
+    def to_dict(self) -> Dict[str, Any]:
+        now = time.perf_counter()
+        with self._lock:
+            spans = [s.to_dict(self.t0, now) for s in self.spans]
+        return {
+            "run_id": self.run_id,
+            "started_at": self.started_at,
+            "duration_ms": round((now - self.t0) * 1000, 3),
+            "spans": spans,
+        }
+
+
+_TRACE: ContextVar[Optional[RunTrace]] = ContextVar("eval_run_trace", default=None)
+_SPAN: ContextVar[Optional[Span]] = ContextVar("eval_current_span", default=None)
+
+
+class _NoopSpan:
+    """Returned when no trace is active."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc: Any) -> bool:
+        return False
+
+    def end(self) -> None:
+        return None
+
+    def set(self, **attrs: Any) -> None:
+        return None
+
+
+_NOOP = _NoopSpan()
+
+
+class _SpanScope:
+    __slots__ = ("span", "_token")
+
+    def __init__(self, trace: RunTrace, name: str, category: str, attrs: Dict[str, Any]) -> None:
+        parent = _SPAN.get()
+        self.span = trace.open_span(name, category, parent.span_id if parent else None, attrs)
+        self._token = _SPAN.set(self.span)
+
+    def __enter__(self) -> Span:
+        return self.span
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> bool:
+        if exc_type is not None:
+            self.span.attrs["error"] = exc_type.__name__
+        self.end()
+        return False
+
+    def end(self) -> None:
+        if self.span.end is None:
+            self.span.end = time.perf_counter()
+            try:
+                _SPAN.reset(self._token)
+            except ValueError:
+                # Ended from another context; the owning context resets on its own exit
+                pass
+
+    def set(self, **attrs: Any) -> None:
+        self.span.attrs.update(attrs)
+
+
+def span(name: str, category: str = "internal", **attrs: Any) -> Any:
+    """Context manager recording `name` under the current span; no-op without an active trace."""
+    trace = _TRACE.get()
+    if trace is None:
+        return _NOOP
+    return _SpanScope(trace, name, category, attrs)
+
+
+def start_span(name: str, category: str = "internal", **attrs: Any) -> Any:
+    """span() for regions that are not a single block; call .end() when done."""
+    return span(name, category, **attrs)
+
+
+def traced(name: Optional[str] = None, category: str = "internal") -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Decorator form of span(); the span is named after the function unless `name` is given."""
+
+    def decorator(fn: Callable[..., T]) -> Callable[..., T]:
+        span_name = name or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            trace = _TRACE.get()
+            if trace is None:
+                return fn(*args, **kwargs)
+            with _SpanScope(trace, span_name, category, {}):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def add_wait(kind: str, ms: float) -> None:
+    """Attribute `ms` of blocking (not network/CPU) time of kind `kind` to the current span."""
+    if ms <= 0:
+        return
+    sp = _SPAN.get()
+    if sp is not None:
+        sp.waits[kind] = sp.waits.get(kind, 0.0) + ms
+
+
+def set_attrs(**attrs: Any) -> None:
+    sp = _SPAN.get()
+    if sp is not None:
+        sp.attrs.update(attrs)
+
+
+def bind_to_trace(fn: Callable[..., T], name: Optional[str] = None, category: str = "internal", **attrs: Any) -> Callable[..., T]:
+    """
+    Carry the active trace into a worker thread. With `name`, the call runs in its own span
+    whose wait_ms.pool is the time between binding (submit) and start. Returns fn unchanged
+    when no trace is active.
+    """
+    trace = _TRACE.get()
+    if trace is None:
+        return fn
+    parent = _SPAN.get()
+    submitted = time.perf_counter()
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        t_token = _TRACE.set(trace)
+        s_token = _SPAN.set(parent)
+        try:
+            if name is None:
+                return fn(*args, **kwargs)
+            with _SpanScope(trace, name, category, dict(attrs)) as sp:
+                sp.waits["pool"] = (sp.start - submitted) * 1000
+                return fn(*args, **kwargs)
+        finally:
+            _SPAN.reset(s_token)
+            _TRACE.reset(t_token)
+
+    return wrapper
+
+
+def current_trace() -> Optional[RunTrace]:
+    return _TRACE.get()
+
+
+@contextmanager
+def trace_run(run_id: str, save: bool = True, **attrs: Any) -> Iterator[Optional[RunTrace]]:
+    """
+    Activate a RunTrace with a root "run" span for the duration of the block and, with
+    save=True, write it on exit (also when the run raised). Nested calls reuse the outer
+    trace (yielding it) so one run never produces two trees.
+    """
+    outer = _TRACE.get()
+    if outer is not None or not tracing_enabled():
+        yield outer
+        return
+    trace = RunTrace(run_id)
+    t_token = _TRACE.set(trace)
+    s_token = _SPAN.set(None)
+    root = _SpanScope(trace, "run", "run", dict(attrs, run_id=run_id))
+    try:
+        yield trace
+    except BaseException as e:
+        root.span.attrs["error"] = type(e).__name__
+        raise
+    finally:
+        root.end()
+        _SPAN.reset(s_token)
+        _TRACE.reset(t_token)
+        if save:
+            save_run_trace(trace)
+
+
+# ---------------------------------------------------------------------------
+# Persistence
+# ---------------------------------------------------------------------------
+
+
+def _traces_dir() -> Path:
+    from app.core.eval.run_artifacts import _artifacts_runs_root
+    return _artifacts_runs_root() / "traces"
+
+
+def _trace_path(run_id: str) -> Path:
+    """trace.json in the run directory when run_id is a canonical eval_ id, else traces/<run_id>.json."""
+    try:
+        from app.core.eval.run_artifacts import _get_run_dir
+        return _get_run_dir(run_id) / "trace.json"
+    except ValueError:
+        safe = "".join(c for c in run_id if c.isalnum() or c in "-_")
+        if not safe:
+            raise ValueError("run_id required")
+        return _traces_dir() / f"{safe}.json"
+
+
+def save_run_trace(trace: RunTrace, run_dir: Optional[Path] = None) -> Optional[Path]:
+    """Write the trace tree; returns the path, or None on failure (never raises)."""
+    try:
+        path = (run_dir / "trace.json") if run_dir is not None else _trace_path(trace.run_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".json.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(trace.to_dict(), f, default=str)
+        os.replace(tmp, path)
+        if path.parent.name == "traces":
+            _purge_traces(path.parent)
+        logger.info("[TRACE] Saved %d spans for run %s to %s", len(trace.spans), trace.run_id, path)
+        return path
+    except Exception as e:
+        logger.warning("[TRACE] Failed to save trace for %s: %s", trace.run_id, e)
+        return None
+
+
+def _purge_traces(folder: Path) -> None:
+    files = sorted(folder.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
+    for old in files[TRACE_RETENTION:]:
+        try:
+            old.unlink()
+        except OSError:
+            pass
+
+
+def load_run_trace(run_id: str) -> Optional[Dict[str, Any]]:
+    try:
+        path = _trace_path(run_id)
+    except ValueError:
+        return None
+    if not path.exists():
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception as e:
+        logger.warning("[TRACE] Failed to read %s: %s", path, e)
+        return None
+
+
+# ---------------------------------------------------------------------------
+# Profile summary
+# ---------------------------------------------------------------------------
+
+
+def summarize_trace(data: Dict[str, Any], top_n: int = 10) -> Dict[str, Any]:
+    """
+    Flame-style summary of a saved trace:
+      critical_path   - from the root, repeatedly the child that finished last
+      by_name         - calls / total / self / max per span name
+      orats_endpoints - per endpoint: calls, total, network (total minus waits), waits by kind
+      waits           - queue wait by kind (pool, rate_limit, singleflight) vs network time
+    """
+    spans: List[Dict[str, Any]] = data.get("spans") or []
+    children: Dict[Optional[int], List[Dict[str, Any]]] = {}
+    for s in spans:
+        children.setdefault(s.get("parent"), []).append(s)
+
+    def _end(s: Dict[str, Any]) -> float:
+        return float(s["start_ms"]) + float(s["dur_ms"])
+
+    def _self_ms(s: Dict[str, Any]) -> float:
+        # Children may overlap (thread pools); clamp at 0
+        return max(0.0, float(s["dur_ms"]) - sum(float(c["dur_ms"]) for c in children.get(s["id"], [])))
+
+    critical: List[Dict[str, Any]] = []
+    roots = children.get(None, [])
+    node = max(roots, key=_end) if roots else None
+    while node is not None:
+        critical.append({
+            "name": node["name"],
+            "cat": node.get("cat"),
+            "start_ms": node["start_ms"],
+            "dur_ms": node["dur_ms"],
+            "self_ms": round(_self_ms(node), 3),
+            **({"attrs": node["attrs"]} if node.get("attrs") else {}),
+        })
+        kids = children.get(node["id"], [])
+        node = max(kids, key=_end) if kids else None
+
+    by_name: Dict[str, Dict[str, Any]] = {}
+    endpoints: Dict[str, Dict[str, Any]] = {}
+    waits: Dict[str, float] = {}
+    network_ms = 0.0
+    for s in spans:
+        agg = by_name.setdefault(s["name"], {"calls": 0, "total_ms": 0.0, "self_ms": 0.0, "max_ms": 0.0, "cat": s.get("cat")})
+        agg["calls"] += 1
+        agg["total_ms"] += float(s["dur_ms"])
+        agg["self_ms"] += _self_ms(s)
+        agg["max_ms"] = max(agg["max_ms"], float(s["dur_ms"]))
+        span_waits = s.get("wait_ms") or {}
+        for kind, ms in span_waits.items():
+            waits[kind] = waits.get(kind, 0.0) + float(ms)
+        if s.get("cat") == "orats":
+            ep_name = (s.get("attrs") or {}).get("endpoint") or s["name"]
+            ep = endpoints.setdefault(ep_name, {"calls": 0, "collapsed": 0, "total_ms": 0.0, "network_ms": 0.0, "wait_ms": {}})
+            ep["calls"] += 1
+            if (s.get("attrs") or {}).get("collapsed"):
+                ep["collapsed"] += 1
+            ep["total_ms"] += float(s["dur_ms"])
+            waited = sum(float(v) for k, v in span_waits.items() if k != "pool")
+            net = 0.0 if (s.get("attrs") or {}).get("collapsed") else max(0.0, float(s["dur_ms"]) - waited)
+            ep["network_ms"] += net
+            network_ms += net
+            for kind, ms in span_waits.items():
+                ep["wait_ms"][kind] = round(ep["wait_ms"].get(kind, 0.0) + float(ms), 3)
+
+    def _rounded(d: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        return {
+            k: {kk: (round(vv, 3) if isinstance(vv, float) else vv) for kk, vv in v.items()}
+            for k, v in d.items()
+        }
+
+    top = sorted(by_name.items(), key=lambda kv: kv[1]["self_ms"], reverse=True)[:top_n]
+    return {
+        "run_id": data.get("run_id"),
+        "started_at": data.get("started_at"),
+        "duration_ms": data.get("duration_ms"),
+        "span_count": len(spans),
+        "critical_path": critical,
+        "by_name": _rounded(dict(sorted(by_name.items(), key=lambda kv: kv[1]["total_ms"], reverse=True))),
+        "top_self_time": [{"name": k, "self_ms": round(v["self_ms"], 3)} for k, v in top],
+        "orats_endpoints": _rounded(dict(sorted(endpoints.items(), key=lambda kv: kv[1]["total_ms"], reverse=True))),
+        "waits": {
+            "queue_wait_ms": {k: round(v, 3) for k, v in sorted(waits.items())},
+            "queue_wait_total_ms": round(sum(waits.values()), 3),
+            "network_ms": round(network_ms, 3),
+        },
+    }
+
+
+__all__ = [
+    "RunTrace",
+    "Span",
+    "add_wait",
+    "bind_to_trace",
+    "current_trace",
+    "load_run_trace",
+    "save_run_trace",
+    "set_attrs",
+    "span",
+    "start_span",
+    "summarize_trace",
+    "trace_run",
+    "traced",
+    "tracing_enabled",
+]
@@ -0,0 +1,284 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""
+Cross-symbol coalescer for /datav2/strikes/options OCC lookups.
+
+Stage-2 workers each enrich a few dozen OCC symbols for one underlying. Batching per
+underlying leaves the last batch partially filled and runs each symbol's batches
+serially. OpraCoalescer accepts lookups from concurrent callers, packs pending OCC
+symbols into full batches across underlyings (waiting at most window_ms for a partial
+batch to fill), dispatches batches concurrently and routes rows back by normalized
+OCC key.
+
+The coalescer knows nothing about HTTP: fetch_batch(route, symbols) -> rows and
+key_fn(row) -> OCC key are supplied by the caller (orats_chain_pipeline). route keeps
+batches for different base URLs (delayed vs live) apart. fetch_batch raises on a failed
+call; lookup() then raises OpraLookupError for the callers whose symbols were in that
+batch (carrying the rows that did arrive), and gives up after lookup_timeout_sec.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WINDOW_MS = 5.0
+DEFAULT_MAX_INFLIGHT = 4
+DEFAULT_LOOKUP_TIMEOUT_SEC = 120.0
+
+Row = Dict[str, Any]
+FetchBatch = Callable[[str, List[str]], List[Row]]
+KeyFn = Callable[[Row], Optional[str]]
+
+
+class OpraLookupError(RuntimeError):
+    """Some of a caller's OCC symbols were in a failed batch or not answered in time.
+
+    rows holds the rows that did arrive; failed maps each unanswered OCC key to its error.
+    """
+
+    def __init__(self, message: str, rows: Dict[str, Row], failed: Dict[str, str]):
+        super().__init__(message)
+        self.rows = rows
+        self.failed = failed
+
+
+class _Lookup:
+    """One caller's pending OCC keys; done is set once every key has been answered."""
+
+    __slots__ = ("remaining", "rows", "failed", "done", "_lock")
+
+    def __init__(self, keys: List[str]):
+        self.remaining = set(keys)
+        self.rows: Dict[str, Row] = {}
+        self.failed: Dict[str, str] = {}
+        self.done = threading.Event()
+        self._lock = threading.Lock()
+        if not self.remaining:
+            self.done.set()
+
+    def resolve(self, key: str, row: Optional[Row], error: Optional[str] = None) -> None:
+        with self._lock:
+            if row is not None:
+                self.rows[key] = row
+            elif error is not None:
+                self.failed[key] = error
+            self.remaining.discard(key)
+            if not self.remaining:
+                self.done.set()
+
+    def snapshot(self) -> Tuple[Dict[str, Row], Dict[str, str], List[str]]:
+        with self._lock:
+            return dict(self.rows), dict(self.failed), sorted(self.remaining)
+
+
+def _ceil_div(n: int, d: int) -> int:
+    return -(-n // d)
+
+
+class OpraCoalescer:
+    """Process-wide batcher for OCC symbol lookups; see module docstring."""
+
+    def __init__(
+        self,
+        fetch_batch: FetchBatch,
+        key_fn: KeyFn,
+        batch_size: int = 10,
+        window_ms: float = DEFAULT_WINDOW_MS,
+        max_inflight: int = DEFAULT_MAX_INFLIGHT,
+        lookup_timeout_sec: float = DEFAULT_LOOKUP_TIMEOUT_SEC,
+    ):
+        self.batch_size = max(1, int(batch_size))
+        self.window_sec = max(0.0, window_ms) / 1000.0
+        self.lookup_timeout_sec = lookup_timeout_sec
+        self._fetch_batch = fetch_batch
+        self._key_fn = key_fn
+        self._cond = threading.Condition()
+        # route -> {occ_key: (request_symbol, [lookups])}, insertion-ordered
+        self._pending: Dict[str, Dict[str, Tuple[str, List[_Lookup]]]] = {}
+        self._first_at: Dict[str, float] = {}
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_inflight), thread_name_prefix="opra-coalesce")
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self._stats_lock = threading.Lock()
+        self.reset_stats()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def lookup(
+        self,
+        route: str,
+        symbols: List[str],
+        normalize: Callable[[str], str] = str,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Row]:
+        """
+        Queue symbols for route and block until every one has been answered.
+
+        Returns {occ_key: row}; symbols absent from a successful response are simply missing
+        (same as a per-caller fetch). Raises OpraLookupError when a batch holding any of the
+        symbols failed, or when they are not all answered within timeout (default
+        lookup_timeout_sec).
+        """
+        keyed: Dict[str, str] = {}
+        for sym in symbols:
+            key = normalize(sym)
+            if key and key not in keyed:
+                keyed[key] = sym
+        lk = _Lookup(list(keyed))
+        if not keyed:
+            return {}
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("OpraCoalescer is closed")
+            pend = self._pending.setdefault(route, {})
+            deduped = 0
+            for key, sym in keyed.items():
+                entry = pend.get(key)
+                if entry is not None:
+                    entry[1].append(lk)
+                    deduped += 1
+                else:
+                    pend[key] = (sym, [lk])
+            self._first_at.setdefault(route, time.monotonic())
+            self._ensure_dispatcher()
+            self._cond.notify_all()
+        with self._stats_lock:
+            self._stats["lookups"] += 1
+            self._stats["symbols_requested"] += len(keyed)
+            self._stats["symbols_deduped"] += deduped
+            self._stats["batches_without_coalescing"] += _ceil_div(len(keyed), self.batch_size)
+        wait_sec = self.lookup_timeout_sec if timeout is None else timeout
+        answered = lk.done.wait(wait_sec)
+        rows, failed, remaining = lk.snapshot()
+        if not answered:
+            with self._stats_lock:
+                self._stats["lookups_timed_out"] += 1
+            failed.update((key, "timed out") for key in remaining)
+            raise OpraLookupError(
+                f"{len(remaining)} of {len(keyed)} OCC symbols not answered within {wait_sec:g}s", rows, failed,
+            )
+        if failed:
+            with self._stats_lock:
+                self._stats["lookups_failed"] += 1
+            raise OpraLookupError(
+                f"{len(failed)} of {len(keyed)} OCC symbols in failed batches: {next(iter(failed.values()))}",
+                rows, failed,
+            )
+        return rows
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters since the last reset_stats(): calls saved vs per-caller batching and batch fill ratio."""
+        with self._stats_lock:
+            s = dict(self._stats)
+        dispatched = s["batches_dispatched"]
+        s["calls_saved"] = max(0, s["batches_without_coalescing"] - dispatched)
+        s["fill_ratio"] = round(s["symbols_dispatched"] / (dispatched * self.batch_size), 4) if dispatched else 0.0
+        s["batch_size"] = self.batch_size
+        s["window_ms"] = self.window_sec * 1000.0
+        return s
+
+    def reset_stats(self) -> None:
+        with self._stats_lock:
+            self._stats: Dict[str, int] = {
+                "lookups": 0,
+                "symbols_requested": 0,
+                "symbols_deduped": 0,
+                "symbols_dispatched": 0,
+                "batches_dispatched": 0,
+                "batches_full": 0,
+                "batches_failed": 0,
+                "batches_without_coalescing": 0,
+                "lookups_failed": 0,
+                "lookups_timed_out": 0,
+            }
+
+    def close(self) -> None:
+        """Stop the dispatcher after pending lookups drain; used by tests."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self._executor.shutdown(wait=True)
+
+    # ------------------------------------------------------------------
+    # Dispatcher
+    # ------------------------------------------------------------------
+
+    def _ensure_dispatcher(self) -> None:
+        # Caller holds self._cond
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._dispatch_loop, name="opra-coalesce-dispatch", daemon=True)
+            self._thread.start()
+
+    def _take_ready(self, now: float) -> Tuple[List[Tuple[str, list]], Optional[float]]:
+        """Pop full batches, plus partial ones whose window expired. Caller holds self._cond."""
+        ready: List[Tuple[str, list]] = []
+        next_deadline: Optional[float] = None
+        for route in list(self._pending):
+            pend = self._pending[route]
+            expired = self._closed or now >= self._first_at[route] + self.window_sec
+            while pend and (len(pend) >= self.batch_size or expired):
+                keys = list(pend)[: self.batch_size]
+                ready.append((route, [(k, *pend.pop(k)) for k in keys]))
+            if pend:
+                deadline = self._first_at[route] + self.window_sec
+                next_deadline = deadline if next_deadline is None else min(next_deadline, deadline)
+            else:
+                del self._pending[route]
+                del self._first_at[route]
+        return ready, next_deadline
+
+    def _dispatch_loop(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if not self._pending:
+                        if self._closed:
+                            return
+                        self._cond.wait()
+                        continue
+                    now = time.monotonic()
+                    ready, next_deadline = self._take_ready(now)
+                    if ready:
+                        break
+                    self._cond.wait(max(0.0, (next_deadline or now) - now))
+            for route, items in ready:
+                self._executor.submit(self._run_batch, route, items)
+
+    def _run_batch(self, route: str, items: List[Tuple[str, str, List[_Lookup]]]) -> None:
+        symbols = [sym for _, sym, _ in items]
+        error: Optional[str] = None
+        by_key: Dict[str, Row] = {}
+        try:
+            for row in self._fetch_batch(route, symbols) or []:
+                key = self._key_fn(row)
+                if key:
+                    by_key[key] = row
+        except Exception as e:
+            error = str(e) or type(e).__name__
+            by_key.clear()
+            logger.warning("[OPRA_COALESCE] batch of %d failed: %s", len(symbols), e)
+        finally:
+            with self._stats_lock:
+                self._stats["batches_dispatched"] += 1
+                self._stats["symbols_dispatched"] += len(symbols)
+                if len(symbols) >= self.batch_size:
+                    self._stats["batches_full"] += 1
+                if error is not None:
+                    self._stats["batches_failed"] += 1
+            for key, _, lookups in items:
+                row = by_key.get(key)
+                for lk in lookups:
+                    lk.resolve(key, row, error)
+
+
+__all__ = ["OpraCoalescer", "OpraLookupError"]
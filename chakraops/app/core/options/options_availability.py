@@ -8,9 +8,10 @@ Does NOT change existing provider logic — only adds visibility.
 
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass
 from datetime import date
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from app.data.options_chain_provider import OptionsChainProvider
 
@@ -50,36 +51,41 @@ class OptionsAvailabilityRecorder:
 
     def __init__(self) -> None:
         self._by_symbol: Dict[str, SymbolOptionsDiagnostic] = {}
+        # Signal engine may record from several symbol workers at once
+        self._lock = threading.Lock()
 
     def record_expirations(self, symbol: str, count: int) -> None:
         """Record expirations count for symbol (call after get_expirations)."""
-        sym = symbol.upper()
-        if sym not in self._by_symbol:
-            self._by_symbol[sym] = SymbolOptionsDiagnostic(symbol=sym)
-        self._by_symbol[sym].expirations_found = count
-        if count == 0:
-            self._by_symbol[sym].reason = REASON_NO_EXPIRATIONS
+        with self._lock:
+            sym = symbol.upper()
+            if sym not in self._by_symbol:
+                self._by_symbol[sym] = SymbolOptionsDiagnostic(symbol=sym)
+            self._by_symbol[sym].expirations_found = count
+            if count == 0:
+                self._by_symbol[sym].reason = REASON_NO_EXPIRATIONS
 
     def record_chain(self, symbol: str, right: str, count: int) -> None:
         """Record chain contract count for symbol/right (call after get_chain)."""
-        sym = symbol.upper()
-        if sym not in self._by_symbol:
-            self._by_symbol[sym] = SymbolOptionsDiagnostic(symbol=sym)
-        d = self._by_symbol[sym]
-        if right.upper() == "PUT":
-            d.put_contracts += count
-        else:
-            d.call_contracts += count
-        d.contracts_found = d.put_contracts + d.call_contracts
-        if d.contracts_found == 0 and d.expirations_found > 0:
-            d.reason = REASON_EMPTY_CHAIN
+        with self._lock:
+            sym = symbol.upper()
+            if sym not in self._by_symbol:
+                self._by_symbol[sym] = SymbolOptionsDiagnostic(symbol=sym)
+            d = self._by_symbol[sym]
+            if right.upper() == "PUT":
+                d.put_contracts += count
+            else:
+                d.call_contracts += count
+            d.contracts_found = d.put_contracts + d.call_contracts
+            if d.contracts_found == 0 and d.expirations_found > 0:
+                d.reason = REASON_EMPTY_CHAIN
 
     def record_reason(self, symbol: str, reason: str) -> None:
         """Override reason for symbol (e.g. NO_EXPIRY_IN_DTE_WINDOW, CHAIN_FETCH_ERROR)."""
-        sym = symbol.upper()
-        if sym not in self._by_symbol:
-            self._by_symbol[sym] = SymbolOptionsDiagnostic(symbol=sym)
-        self._by_symbol[sym].reason = reason
+        with self._lock:
+            sym = symbol.upper()
+            if sym not in self._by_symbol:
+                self._by_symbol[sym] = SymbolOptionsDiagnostic(symbol=sym)
+            self._by_symbol[sym].reason = reason
 
     def get_diagnostics(self) -> List[Dict[str, Any]]:
         """Return list of per-symbol diagnostic dicts (symbol, expirations_found, contracts_found, reason)."""
@@ -112,6 +118,10 @@ class DiagnosticsOptionsChainProvider(OptionsChainProvider):
         self._inner = inner
         self._recorder = recorder
 
+    @property
+    def max_concurrency(self) -> Optional[int]:
+        return getattr(self._inner, "max_concurrency", None)
+
     def get_expirations(self, symbol: str) -> List[date]:
         result = self._inner.get_expirations(symbol)
         count = len(result) if result is not None else 0
@@ -129,6 +139,12 @@ class DiagnosticsOptionsChainProvider(OptionsChainProvider):
         self._recorder.record_chain(symbol, right, count)
         return result or []
 
+    def get_expiry_chain(self, symbol: str, expiry: date) -> Dict[str, List[Dict[str, Any]]]:
+        result = self._inner.get_expiry_chain(symbol, expiry)
+        for right in ("PUT", "CALL"):
+            self._recorder.record_chain(symbol, right, len(result.get(right) or []))
+        return result
+
 
 __all__ = [
     "DiagnosticsOptionsChainProvider",
@@ -32,7 +32,7 @@ import time
 import threading
 from dataclasses import dataclass, field
 from datetime import date, datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import requests
 
@@ -137,6 +137,13 @@ RATE_LIMIT_CALLS_PER_SEC = 5.0
 # Batch size for OPRA symbols (ORATS recommends max 10)
 OPRA_BATCH_SIZE = 10
 
+# Coalesce OCC lookups across concurrent stage-2 workers into full batches
+# (ORATS_OPRA_COALESCE=0 restores per-call batching).
+OPRA_COALESCE_ENABLED = os.getenv("ORATS_OPRA_COALESCE", "1").strip().lower() not in ("0", "false", "no")
+OPRA_COALESCE_WINDOW_MS = float(os.getenv("ORATS_OPRA_COALESCE_WINDOW_MS", "5"))
+OPRA_COALESCE_MAX_INFLIGHT = 4
+OPRA_COALESCE_LOOKUP_TIMEOUT_SEC = float(os.getenv("ORATS_OPRA_COALESCE_LOOKUP_TIMEOUT_SEC", "120"))
+
 # Bounded strike selection. Stage-2 needs enough strikes for delta-range filtering
 # after enrichment; delta filter must NOT be applied at /strikes (chain discovery only).
 MAX_STRIKES_PER_EXPIRY = 20  # Strikes per expiration (was 5; 30 contracts too few for SPY)
@@ -394,6 +401,13 @@ def get_strikes_options_param_name() -> str:
 # Helper Functions
 # ============================================================================
 
+def _resolve_mode(chain_mode: Optional[str]) -> str:
+    """Data mode for chain_mode override ("DELAYED" | "LIVE"), else ORATS_DATA_MODE env."""
+    if chain_mode is not None:
+        return OratsDataMode.mode_from_chain_source(chain_mode)
+    return OratsDataMode.get_current_mode()
+
+
 def _get_orats_token() -> str:
     """Get ORATS API token from config."""
     from app.core.config.orats_secrets import ORATS_API_TOKEN
@@ -524,6 +538,38 @@ def fetch_base_chain(
     Returns:
         Tuple of (contracts, underlying_price, error, raw_rows_count)
     """
+    from app.core.data.singleflight import orats_singleflight
+    # Concurrent identical requests (stage-2, EOD snapshot, expirations) share one call
+    return orats_singleflight(
+        "base_chain",
+        {
+            "symbol": symbol.upper(), "dte_min": dte_min, "dte_max": dte_max,
+            "max_strikes": max_strikes_per_expiry, "max_expiries": max_expiries,
+            "put_m": target_moneyness_put, "call_m": target_moneyness_call,
+            "mode": _resolve_mode(chain_mode),
+            "delta_lo": delta_lo, "delta_hi": delta_hi, "strategy": strategy_mode,
+        },
+        lambda: _fetch_base_chain(
+            symbol, dte_min, dte_max, max_strikes_per_expiry, max_expiries,
+            target_moneyness_put, target_moneyness_call, chain_mode, delta_lo, delta_hi, strategy_mode,
+        ),
+    )
+
+
+def _fetch_base_chain(
+    symbol: str,
+    dte_min: int = 7,
+    dte_max: int = 60,
+    max_strikes_per_expiry: int = MAX_STRIKES_PER_EXPIRY,
+    max_expiries: int = MAX_EXPIRIES,
+    target_moneyness_put: float = 0.85,  # 15% below for puts
+    target_moneyness_call: float = 1.10,  # 10% above for calls
+    chain_mode: Optional[str] = None,
+    delta_lo: Optional[float] = None,
+    delta_hi: Optional[float] = None,
+    strategy_mode: str = "CSP",
+) -> Tuple[List[BaseContract], Optional[float], Optional[str], int]:
+    """fetch_base_chain without singleflight."""
     _RATE_LIMITER.acquire()
     if chain_mode is not None:
         mode = OratsDataMode.mode_from_chain_source(chain_mode)
@@ -760,11 +806,141 @@ def _build_opra_symbol_from_row(row: Dict[str, Any]) -> Optional[str]:
         return None
 
 
+def _row_occ_key(row: Dict[str, Any]) -> Optional[str]:
+    """Merge key for a /strikes/options row: normalized optionSymbol, else built from row fields."""
+    opra_raw = row.get("optionSymbol") or ""
+    opra = _normalize_occ_symbol(opra_raw) if opra_raw else None
+    if not opra or len(opra) < 16:
+        opra = _build_opra_symbol_from_row(row)
+    return opra or None
+
+
+def _enrichment_from_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    bid = row.get("bidPrice") or row.get("bid")
+    ask = row.get("askPrice") or row.get("ask")
+    oi = row.get("openInt") or row.get("openInterest") or row.get("open_interest") or row.get("oi")
+    return {
+        "bid": bid,
+        "ask": ask,
+        "volume": row.get("volume"),
+        "open_interest": oi,
+        "delta": row.get("delta"),
+        "gamma": row.get("gamma"),
+        "theta": row.get("theta"),
+        "vega": row.get("vega"),
+        "iv": row.get("iv") or row.get("smvVol"),
+        "optionType": row.get("optionType"),
+        "option_type": row.get("option_type"),
+        "putCall": row.get("putCall"),
+        "callPut": row.get("callPut"),
+        "put_call": row.get("put_call"),
+        "call_put": row.get("call_put"),
+    }
+
+
+def _fetch_strikes_options_rows(base_url: str, batch: List[str]) -> List[Dict[str, Any]]:
+    """One rate-limited /strikes/options call for up to OPRA_BATCH_SIZE OCC symbols.
+    Raises OratsChainError when the call fails (network, non-200, invalid JSON)."""
+    endpoint_used = f"{base_url.rstrip('/')}{ORATS_STRIKES_OPTIONS}"
+    
+    _RATE_LIMITER.acquire()
+    
+    url = f"{base_url}{ORATS_STRIKES_OPTIONS}"
+    params = {
+        "token": _get_orats_token(),
+        get_strikes_options_param_name(): ",".join(batch),
+    }
+    
+    logger.info(
+        "[ORATS_REQ] endpoint=%s batch_size=%d sample_request=%s",
+        endpoint_used, len(batch), batch[:3],
+    )
+    
+    t0 = time.perf_counter()
+    try:
+        r = requests.get(url, params=params, timeout=TIMEOUT_SEC)
+    except requests.RequestException as e:
+        latency_ms = int((time.perf_counter() - t0) * 1000)
+        logger.warning(
+            "[ORATS_RESP] status=ERROR latency_ms=%d error=%s",
+            latency_ms, e
+        )
+        raise OratsChainError(f"strikes/options request failed: {e}", endpoint=endpoint_used) from e
+    
+    latency_ms = int((time.perf_counter() - t0) * 1000)
+    
+    if r.status_code != 200:
+        logger.warning(
+            "[ORATS_RESP] status=%d latency_ms=%d rows=0",
+            r.status_code, latency_ms
+        )
+        raise OratsChainError(
+            f"strikes/options returned HTTP {r.status_code}",
+            http_status=r.status_code, response_snippet=getattr(r, "text", "") or "", endpoint=endpoint_used,
+        )
+    
+    try:
+        raw = r.json()
+    except ValueError:
+        logger.warning("[ORATS_RESP] status=%d latency_ms=%d error=invalid_json", r.status_code, latency_ms)
+        raise OratsChainError("strikes/options returned invalid JSON", http_status=r.status_code, endpoint=endpoint_used)
+    
+    if isinstance(raw, list):
+        rows = raw
+    elif isinstance(raw, dict) and "data" in raw:
+        rows = raw.get("data", [])
+    else:
+        rows = []
+    
+    _, non_null_bidask, non_null_oi, non_null_vol = _check_opra_fields_in_response(rows)
+    logger.info(
+        "[ORATS_RESP] endpoint=%s response_rows=%d non_null_bidask=%d non_null_oi=%d non_null_vol=%d latency_ms=%d sample_response_optionSymbols=%s",
+        endpoint_used, len(rows), non_null_bidask, non_null_oi, non_null_vol, latency_ms,
+        [(_normalize_occ_symbol(r.get("optionSymbol")) or _build_opra_symbol_from_row(r)) for r in rows[:3]],
+    )
+    return rows
+
+
+_OPRA_COALESCER = None
+_OPRA_COALESCER_LOCK = threading.Lock()
+
+
+def get_opra_coalescer():
+    """Process-wide OpraCoalescer for /strikes/options OCC lookups (created on first use)."""
+    global _OPRA_COALESCER
+    with _OPRA_COALESCER_LOCK:
+        if _OPRA_COALESCER is None:
+            from app.core.options.opra_coalescer import OpraCoalescer
+            _OPRA_COALESCER = OpraCoalescer(
+                fetch_batch=_fetch_strikes_options_rows,
+                key_fn=_row_occ_key,
+                batch_size=OPRA_BATCH_SIZE,
+                window_ms=OPRA_COALESCE_WINDOW_MS,
+                max_inflight=OPRA_COALESCE_MAX_INFLIGHT,
+                lookup_timeout_sec=OPRA_COALESCE_LOOKUP_TIMEOUT_SEC,
+            )
+        return _OPRA_COALESCER
+
+
+def _fetch_strikes_options_batches(
+    base_url: str, opra_symbols: List[str], batch_size: int, failed: List[str],
+) -> Iterator[List[Dict[str, Any]]]:
+    """Per-call batching: rows per batch; symbols of failed batches are appended to failed."""
+    for i in range(0, len(opra_symbols), batch_size):
+        batch = opra_symbols[i:i + batch_size]
+        try:
+            yield _fetch_strikes_options_rows(base_url, batch)
+        except OratsChainError:
+            failed.extend(batch)
+            yield []
+
+
 def fetch_enriched_contracts(
     opra_symbols: List[str],
     batch_size: int = OPRA_BATCH_SIZE,
     require_opra_fields: bool = True,
     chain_mode: Optional[str] = None,
+    coalesce: Optional[bool] = None,
 ) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Any]]:
     """
     STEP 3 (OPRA lookup): Fetch liquidity data for OCC option symbols from /datav2/strikes/options.
@@ -779,10 +955,12 @@ def fetch_enriched_contracts(
         batch_size: Max symbols per request (default 10)
         require_opra_fields: If True, raise error if mode doesn't support OPRA fields
         chain_mode: Override: "DELAYED" | "LIVE". When None, use ORATS_DATA_MODE env.
+        coalesce: Route through the process-wide OpraCoalescer so concurrent callers share
+            full batches (default OPRA_COALESCE_ENABLED; batch_size is then OPRA_BATCH_SIZE).
     
     Returns:
         Tuple of (enrichment_map, telemetry). enrichment_map: OCC symbol -> enrichment data.
-        telemetry: endpoint_used, requested_tickers_count, response_rows, non_null_bidask, non_null_oi, non_null_vol, sample_request_symbols, sample_response_optionSymbols.
+        telemetry: endpoint_used, requested_tickers_count, response_rows, non_null_bidask, non_null_oi, non_null_vol, sample_request_symbols, sample_response_optionSymbols, coalesced, failed_symbols (OCC symbols in failed or timed-out batches).
         
     Raises:
         OratsChainError: If any symbol is not a valid OCC option symbol
@@ -818,9 +996,22 @@ def fetch_enriched_contracts(
         )
         raise OratsOpraModeError(mode)
     
-    token = _get_orats_token()
-    param_name = get_strikes_options_param_name()
     endpoint_used = f"{base_url.rstrip('/')}{ORATS_STRIKES_OPTIONS}"
+    use_coalescer = OPRA_COALESCE_ENABLED if coalesce is None else coalesce
+    
+    failed_symbols: List[str] = []
+    if use_coalescer:
+        from app.core.options.opra_coalescer import OpraLookupError
+        try:
+            routed = get_opra_coalescer().lookup(base_url, opra_symbols, normalize=_normalize_occ_symbol)
+        except OpraLookupError as e:
+            logger.warning("[ORATS_OPTIONS] %s", e)
+            routed = e.rows
+            failed_symbols = list(e.failed)
+        row_batches: Iterable[List[Dict[str, Any]]] = [list(routed.values())]
+    else:
+        # Process in batches
+        row_batches = _fetch_strikes_options_batches(base_url, opra_symbols, batch_size, failed_symbols)
     
     enrichment_map: Dict[str, Dict[str, Any]] = {}
     total_rows = 0
@@ -829,66 +1020,8 @@ def fetch_enriched_contracts(
     total_with_vol = 0
     sample_response_option_symbols: List[str] = []
     
-    # Process in batches
-    for i in range(0, len(opra_symbols), batch_size):
-        batch = opra_symbols[i:i + batch_size]
-        
-        _RATE_LIMITER.acquire()
-        
-        tickers_param = ",".join(batch)
-        
-        url = f"{base_url}{ORATS_STRIKES_OPTIONS}"
-        params = {
-            "token": token,
-            param_name: tickers_param,
-        }
-        
-        logger.info(
-            "[ORATS_REQ] endpoint=%s requested_tickers=%d batch_size=%d sample_request=%s",
-            endpoint_used, len(opra_symbols), len(batch), batch[:3],
-        )
-        
-        t0 = time.perf_counter()
-        try:
-            r = requests.get(url, params=params, timeout=TIMEOUT_SEC)
-        except requests.RequestException as e:
-            latency_ms = int((time.perf_counter() - t0) * 1000)
-            logger.warning(
-                "[ORATS_RESP] status=ERROR latency_ms=%d error=%s",
-                latency_ms, e
-            )
-            continue
-        
-        latency_ms = int((time.perf_counter() - t0) * 1000)
-        
-        if r.status_code != 200:
-            logger.warning(
-                "[ORATS_RESP] status=%d latency_ms=%d rows=0",
-                r.status_code, latency_ms
-            )
-            continue
-        
-        try:
-            raw = r.json()
-        except ValueError:
-            logger.warning("[ORATS_RESP] status=%d latency_ms=%d error=invalid_json", r.status_code, latency_ms)
-            continue
-        
-        if isinstance(raw, list):
-            rows = raw
-        elif isinstance(raw, dict) and "data" in raw:
-            rows = raw.get("data", [])
-        else:
-            rows = []
-        
-        has_opra, non_null_bidask, non_null_oi, non_null_vol = _check_opra_fields_in_response(rows)
-        
-        logger.info(
-            "[ORATS_RESP] endpoint=%s response_rows=%d non_null_bidask=%d non_null_oi=%d non_null_vol=%d latency_ms=%d sample_response_optionSymbols=%s",
-            endpoint_used, len(rows), non_null_bidask, non_null_oi, non_null_vol, latency_ms,
-            [(_normalize_occ_symbol(r.get("optionSymbol")) or _build_opra_symbol_from_row(r)) for r in rows[:3]],
-        )
-        
+    for rows in row_batches:
+        _, non_null_bidask, non_null_oi, non_null_vol = _check_opra_fields_in_response(rows)
         total_rows += len(rows)
         total_with_bidask += non_null_bidask
         total_with_oi += non_null_oi
@@ -896,35 +1029,12 @@ def fetch_enriched_contracts(
         
         for row in rows:
             # Key by normalized OCC so merge matches BaseContract.opra_symbol (no space padding)
-            opra_raw = row.get("optionSymbol") or ""
-            opra = _normalize_occ_symbol(opra_raw) if opra_raw else None
-            if not opra or len(opra) < 16:
-                opra = _build_opra_symbol_from_row(row)
+            opra = _row_occ_key(row)
             if not opra:
                 continue
             if len(sample_response_option_symbols) < 5:
                 sample_response_option_symbols.append(opra)
-            
-            bid = row.get("bidPrice") or row.get("bid")
-            ask = row.get("askPrice") or row.get("ask")
-            oi = row.get("openInt") or row.get("openInterest") or row.get("open_interest") or row.get("oi")
-            enrichment_map[opra] = {
-                "bid": bid,
-                "ask": ask,
-                "volume": row.get("volume"),
-                "open_interest": oi,
-                "delta": row.get("delta"),
-                "gamma": row.get("gamma"),
-                "theta": row.get("theta"),
-                "vega": row.get("vega"),
-                "iv": row.get("iv") or row.get("smvVol"),
-                "optionType": row.get("optionType"),
-                "option_type": row.get("option_type"),
-                "putCall": row.get("putCall"),
-                "callPut": row.get("callPut"),
-                "put_call": row.get("put_call"),
-                "call_put": row.get("call_put"),
-            }
+            enrichment_map[opra] = _enrichment_from_row(row)
     
     telemetry = {
         "endpoint_used": endpoint_used,
@@ -935,6 +1045,8 @@ def fetch_enriched_contracts(
         "non_null_vol": total_with_vol,
         "sample_request_symbols": opra_symbols[:10],
         "sample_response_optionSymbols": sample_response_option_symbols[:5],
+        "coalesced": use_coalescer,
+        "failed_symbols": len(failed_symbols),
     }
     if total_with_bidask > 0:
         logger.info(
@@ -960,6 +1072,8 @@ def _empty_telemetry() -> Dict[str, Any]:
         "non_null_vol": 0,
         "sample_request_symbols": [],
         "sample_response_optionSymbols": [],
+        "coalesced": False,
+        "failed_symbols": 0,
     }
 
 
@@ -1099,6 +1213,36 @@ def fetch_option_chain(
     Raises:
         OratsOpraModeError: If mode is live_derived (doesn't support OPRA fields)
     """
+    from app.core.data.singleflight import orats_singleflight
+    # Stage-2, refresh_marks and provider.get_chain for the same symbol share one pipeline run
+    return orats_singleflight(
+        "option_chain",
+        {
+            "symbol": symbol.upper(), "dte_min": dte_min, "dte_max": dte_max, "enrich_all": enrich_all,
+            "max_strikes": max_strikes_per_expiry, "max_expiries": max_expiries,
+            "mode": _resolve_mode(chain_mode),
+            "delta_lo": delta_lo, "delta_hi": delta_hi, "strategy": strategy_mode,
+        },
+        lambda: _fetch_option_chain(
+            symbol, dte_min, dte_max, enrich_all, max_strikes_per_expiry, max_expiries,
+            chain_mode, delta_lo, delta_hi, strategy_mode,
+        ),
+    )
+
+
+def _fetch_option_chain(
+    symbol: str,
+    dte_min: int = 21,
+    dte_max: int = 45,
+    enrich_all: bool = True,
+    max_strikes_per_expiry: int = MAX_STRIKES_PER_EXPIRY,
+    max_expiries: int = MAX_EXPIRIES,
+    chain_mode: Optional[str] = None,
+    delta_lo: Optional[float] = None,
+    delta_hi: Optional[float] = None,
+    strategy_mode: str = "CSP",
+) -> OptionChainResult:
+    """fetch_option_chain without singleflight."""
     start_time = time.time()
     now_iso = datetime.now(timezone.utc).isoformat()
     if chain_mode is not None:
@@ -1456,6 +1600,7 @@ __all__ = [
     "fetch_base_chain",
     "build_opra_symbols",
     "fetch_enriched_contracts",
+    "get_opra_coalescer",
     "merge_chain_and_liquidity",
     "fetch_option_chain",
     "check_liquidity_gate",
@@ -19,7 +19,7 @@ from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date, datetime, timezone
 from functools import lru_cache
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional
 
 from app.core.models.data_quality import DataQuality, FieldValue, wrap_field_float, wrap_field_int
 from app.core.options.chain_provider import (
@@ -83,56 +83,56 @@ _ORATS_RATE_LIMITER = RateLimiter(calls_per_second=5.0)
 # ============================================================================
 
 class ChainCache:
-    """Thread-safe cache for options chains with TTL."""
+    """Thread-safe cache for options chains with TTL.
+
+    Backed by a BoundedCache (LRU + TTL + byte budget, lock-striped), so the
+    process-wide cache no longer grows without limit in the API process.
+    """
     
-    def __init__(self, ttl_seconds: int = 300):  # 5 minute default TTL
+    def __init__(
+        self,
+        ttl_seconds: int = 300,  # 5 minute default TTL
+        *,
+        max_entries: int = 2_000,
+        max_bytes: Optional[int] = 256 * 1024 * 1024,
+        name: Optional[str] = None,
+    ):
+        from app.core.data.bounded_cache import BoundedCache
         self.ttl_seconds = ttl_seconds
-        self._cache: Dict[str, Tuple[ChainProviderResult, float]] = {}
-        self._lock = threading.Lock()
+        self._cache = BoundedCache(
+            name or "options_chain",
+            max_entries=max_entries,
+            ttl_seconds=ttl_seconds,
+            max_bytes=max_bytes,
+            register=name is not None,
+        )
     
     def _make_key(self, symbol: str, expiration: date) -> str:
         return f"{symbol.upper()}_{expiration.isoformat()}"
     
     def get(self, symbol: str, expiration: date) -> Optional[ChainProviderResult]:
         """Get cached result if valid."""
-        key = self._make_key(symbol, expiration)
-        with self._lock:
-            if key in self._cache:
-                result, cached_at = self._cache[key]
-                if time.time() - cached_at < self.ttl_seconds:
-                    return result
-                # Expired
-                del self._cache[key]
-        return None
+        return self._cache.get(self._make_key(symbol, expiration), None)
     
     def set(self, symbol: str, expiration: date, result: ChainProviderResult) -> None:
         """Cache a result."""
-        key = self._make_key(symbol, expiration)
-        with self._lock:
-            self._cache[key] = (result, time.time())
+        self._cache.set(self._make_key(symbol, expiration), result)
     
     def clear(self) -> None:
         """Clear all cached entries."""
-        with self._lock:
-            self._cache.clear()
+        self._cache.clear()
     
     def cleanup_expired(self) -> int:
         """Remove expired entries. Returns count removed."""
-        now = time.time()
-        removed = 0
-        with self._lock:
-            expired_keys = [
-                k for k, (_, cached_at) in self._cache.items()
-                if now - cached_at >= self.ttl_seconds
-            ]
-            for k in expired_keys:
-                del self._cache[k]
-                removed += 1
-        return removed
+        return self._cache.cleanup_expired()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Hits, misses, evictions, expirations, entries and approximate bytes."""
+        return self._cache.stats()
 
 
 # Global cache
-_CHAIN_CACHE = ChainCache(ttl_seconds=300)
+_CHAIN_CACHE = ChainCache(ttl_seconds=300, name="options_chain")
 
 
 # ============================================================================
@@ -225,6 +225,43 @@ class OratsOptionsChainProvider:
         logger.debug("ORATS get_chain %s %s %s returned %d contracts", symbol, exp_str, right_upper, len(out))
         return out
 
+    def get_expiry_chain(self, symbol: str, expiry: date) -> Dict[str, List[Dict[str, Any]]]:
+        """Return {"PUT": [...], "CALL": [...]} from one strikes fetch for symbol/expiry (both rights cached)."""
+        symbol = (symbol or "").upper()
+        exp_str = expiry.strftime("%Y-%m-%d")
+        put_key = f"{symbol}:{exp_str}:P"
+        call_key = f"{symbol}:{exp_str}:C"
+
+        if put_key in self._chain_cache and call_key in self._chain_cache:
+            return {"PUT": self._chain_cache[put_key], "CALL": self._chain_cache[call_key]}
+
+        try:
+            rows = get_strikes_monthly(symbol, exp_str, timeout=self.timeout)
+        except OratsAuthError as e:
+            logger.warning("ORATS get_expiry_chain auth failed for %s %s: %s", symbol, exp_str, e)
+            rows = []
+        except ValueError as e:
+            logger.warning("ORATS get_expiry_chain failed for %s %s: %s", symbol, exp_str, e)
+            rows = []
+
+        puts: List[Dict[str, Any]] = []
+        calls: List[Dict[str, Any]] = []
+        for row in rows or []:
+            if not isinstance(row, dict):
+                continue
+            p = _row_to_contracts(row, symbol, exp_str, "P")
+            if p:
+                puts.append(p)
+            c = _row_to_contracts(row, symbol, exp_str, "C")
+            if c:
+                calls.append(c)
+        self._chain_cache[put_key] = puts
+        self._chain_cache[call_key] = calls
+        logger.debug(
+            "ORATS get_expiry_chain %s %s returned %d puts, %d calls", symbol, exp_str, len(puts), len(calls)
+        )
+        return {"PUT": puts, "CALL": calls}
+
     def get_full_chain(
         self,
         symbol: str,
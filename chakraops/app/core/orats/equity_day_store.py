@@ -0,0 +1,211 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""
+Day-scoped persistent layer under EquityQuoteCache.
+
+EquityQuoteCache is reset at the start of every evaluation, so IV rank (valid 6 hours per
+cache_policy) was refetched every 30-minute cycle and after every API restart. This store
+keeps per-symbol sections across runs and restarts:
+
+  - one JSON file per UTC day: CACHE_DIR/equity_day/<YYYY-MM-DD>.json
+  - sections are cache_policy endpoint names ("quotes", "iv_rank", "calendar", "earnings", ...)
+    and expire per get_ttl(section): quotes stay short (60s), iv_rank 6h, calendar/earnings 24h
+  - error entries are never stored; a new day starts empty and older day files are pruned
+
+Writes are debounced (flush at most every FLUSH_INTERVAL_SEC, and at the end of each
+fetch_full_equity_snapshots); warm() loads today's file, and runs in the deferred
+API start-up so the first evaluation after a restart starts warm.
+
+Disabled with the file cache (cache_store.CACHE_ENABLED=false).
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from app.core.io import json_codec
+
+logger = logging.getLogger(__name__)
+
+FLUSH_INTERVAL_SEC = 5.0
+KEEP_DAYS = 2
+_FORMAT_VERSION = 1
+
+
+def _utc_day() -> str:
+    return datetime.now(timezone.utc).date().isoformat()
+
+
+class EquityDayStore:
+    """Per-symbol, per-section values for one UTC day, persisted as one JSON file."""
+
+    def __init__(self, root: Path, *, flush_interval: float = FLUSH_INTERVAL_SEC) -> None:
+        self.root = Path(root)
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._day = ""
+        # symbol -> section -> {"stored_at": epoch seconds, "value": {...}}
+        self._symbols: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._dirty = False
+        self._last_flush = time.monotonic()
+        self._loaded = False
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    # ------------------------------------------------------------------ internals
+
+    def _path(self, day: str) -> Path:
+        return self.root / f"{day}.json"
+
+    def _count(self, section: str, field: str) -> None:
+        st = self._stats.setdefault(section, {"hits": 0, "misses": 0, "expired": 0, "stored": 0})
+        st[field] += 1
+
+    def _ensure_day_locked(self) -> None:
+        day = _utc_day()
+        if day == self._day and self._loaded:
+            return
+        if self._day and day != self._day:
+            logger.info("[EQUITY_DAY] day rolled %s -> %s; starting empty", self._day, day)
+        self._day = day
+        self._symbols = {}
+        self._dirty = False
+        self._loaded = True
+        path = self._path(day)
+        if path.exists():
+            try:
+                doc = json_codec.read_json(path)
+                if isinstance(doc, dict) and doc.get("day") == day and isinstance(doc.get("symbols"), dict):
+                    self._symbols = doc["symbols"]
+            except (OSError, ValueError) as e:
+                logger.warning("[EQUITY_DAY] could not read %s: %s", path, e)
+        self._prune_locked(day)
+
+    def _prune_locked(self, day: str) -> None:
+        """Delete day files older than KEEP_DAYS (today included)."""
+        if not self.root.is_dir():
+            return
+        cutoff = (date.fromisoformat(day) - timedelta(days=KEEP_DAYS - 1)).isoformat()
+        for p in self.root.glob("*.json"):
+            if p.stem < cutoff:
+                try:
+                    p.unlink()
+                except OSError:
+                    pass
+
+    # ------------------------------------------------------------------ API
+
+    def warm(self) -> int:
+        """Load today's file (if not loaded yet). Returns the number of symbols held."""
+        with self._lock:
+            self._ensure_day_locked()
+            return len(self._symbols)
+
+    def get(self, section: str, symbol: str) -> Optional[Tuple[Dict[str, Any], float]]:
+        """(value, stored_at epoch) when cached for today and younger than get_ttl(section)."""
+        from app.core.data.cache_policy import get_ttl
+
+        sym = symbol.upper()
+        with self._lock:
+            self._ensure_day_locked()
+            entry = self._symbols.get(sym, {}).get(section)
+            if entry is None:
+                self._count(section, "misses")
+                return None
+            stored_at = float(entry.get("stored_at") or 0.0)
+            if time.time() - stored_at >= get_ttl(section):
+                self._count(section, "expired")
+                self._count(section, "misses")
+                return None
+            self._count(section, "hits")
+            return dict(entry.get("value") or {}), stored_at
+
+    def put(self, section: str, symbol: str, value: Dict[str, Any], stored_at: Optional[float] = None) -> None:
+        with self._lock:
+            self._ensure_day_locked()
+            self._symbols.setdefault(symbol.upper(), {})[section] = {
+                "stored_at": time.time() if stored_at is None else stored_at,
+                "value": value,
+            }
+            self._dirty = True
+            self._count(section, "stored")
+            due = time.monotonic() - self._last_flush >= self.flush_interval
+        if due:
+            self.flush()
+
+    def flush(self) -> bool:
+        """Write today's entries if anything changed. Returns True when a file was written."""
+        with self._lock:
+            if not self._dirty:
+                return False
+            doc = {"version": _FORMAT_VERSION, "day": self._day, "symbols": self._symbols}
+            try:
+                json_codec.write_json_atomic(self._path(self._day), doc, fsync=False)
+            except OSError as e:
+                logger.warning("[EQUITY_DAY] flush failed: %s", e)
+                return False
+            self._dirty = False
+            self._last_flush = time.monotonic()
+            return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._symbols = {}
+            self._dirty = False
+            path = self._path(self._day or _utc_day())
+            if path.exists():
+                path.unlink()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "day": self._day,
+                "path": str(self._path(self._day)) if self._day else None,
+                "symbols": len(self._symbols),
+                "sections": {k: dict(v) for k, v in sorted(self._stats.items())},
+            }
+
+
+_STORE: Optional[EquityDayStore] = None
+_STORE_LOCK = threading.Lock()
+
+
+def get_equity_day_store() -> Optional[EquityDayStore]:
+    """Process-wide store under cache_store.CACHE_DIR, or None when the file cache is disabled."""
+    global _STORE
+    from app.core.data import cache_store
+
+    if not cache_store.CACHE_ENABLED:
+        return None
+    root = Path(cache_store.CACHE_DIR) / "equity_day"
+    with _STORE_LOCK:
+        if _STORE is None or _STORE.root != root:
+            _STORE = EquityDayStore(root)
+        return _STORE
+
+
+def warm_equity_day_store() -> int:
+    """Load today's entries ahead of the first evaluation (API deferred start-up)."""
+    store = get_equity_day_store()
+    if store is None:
+        return 0
+    n = store.warm()
+    logger.info("[EQUITY_DAY] warm start: %d symbols from %s", n, store.root)
+    return n
+
+
+def equity_day_store_stats() -> Dict[str, Any]:
+    store = get_equity_day_store()
+    return store.stats() if store is not None else {"enabled": False}
+
+
+__all__ = [
+    "EquityDayStore",
+    "equity_day_store_stats",
+    "get_equity_day_store",
+    "warm_equity_day_store",
+]
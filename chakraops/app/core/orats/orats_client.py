@@ -43,7 +43,18 @@ def _orats_get_live(endpoint_path: str, ticker: str, timeout_sec: float = TIMEOU
     GET ORATS live endpoint (e.g. /live/strikes or /live/summaries). Returns (parsed_json, status_code, latency_ms).
     Logs [ORATS_CALL] endpoint= ticker= status= latency_ms= rows= (rows from list or data list).
     Raises OratsUnavailableError on request failure or non-200. Token from orats_secrets only.
+    Concurrent calls for the same endpoint and ticker share one request (singleflight).
     """
+    from app.core.data.singleflight import orats_singleflight
+    return orats_singleflight(
+        endpoint_path,
+        {"ticker": ticker.upper()},
+        lambda: _orats_get_live_uncached(endpoint_path, ticker, timeout_sec),
+    )
+
+
+def _orats_get_live_uncached(endpoint_path: str, ticker: str, timeout_sec: float = TIMEOUT_SEC) -> tuple[Any, int, int]:
+    """_orats_get_live without singleflight."""
     from app.core.config.orats_secrets import ORATS_API_TOKEN
     url = f"{ORATS_BASE.rstrip('/')}{endpoint_path}"
     params: Dict[str, str] = {"token": ORATS_API_TOKEN, "ticker": ticker.upper()}
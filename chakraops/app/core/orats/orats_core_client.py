@@ -11,18 +11,34 @@ from __future__ import annotations
 
 import logging
 import os
+import threading
 import time
 from datetime import date
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import requests
 
 from app.core.orats.endpoints import BASE_DATAV2, PATH_CORES, PATH_HIST_DAILIES, url_cores, url_hist_dailies
 
+if TYPE_CHECKING:
+    from app.core.data.bounded_cache import BoundedCache
+
 logger = logging.getLogger(__name__)
 
-# Phase 8D: cache for derived avg_stock_volume_20d (ticker -> {date -> value})
-_hist_dailies_avg_cache: Dict[str, Dict[str, float]] = {}
+# Phase 8D: cache for derived avg_stock_volume_20d ("TICKER|date" -> value or None); a
+# BoundedCache created on first use (app.core.data imports this module)
+_hist_dailies_avg_cache: Optional["BoundedCache"] = None
+_AVG_CACHE_LOCK = threading.Lock()
+
+
+def _avg_cache() -> "BoundedCache":
+    global _hist_dailies_avg_cache
+    if _hist_dailies_avg_cache is None:
+        from app.core.data.bounded_cache import BoundedCache
+        with _AVG_CACHE_LOCK:
+            if _hist_dailies_avg_cache is None:
+                _hist_dailies_avg_cache = BoundedCache("hist_dailies_avg", max_entries=20_000, ttl_seconds=36 * 3600)
+    return _hist_dailies_avg_cache
 
 DEFAULT_TIMEOUT_SEC = 15.0
 
@@ -216,18 +232,24 @@ def fetch_hist_dailies(
     params: Dict[str, Any] = {"token": token.strip(), "ticker": ticker_upper}
     if fields:
         params["fields"] = ",".join(str(f).strip() for f in fields if str(f).strip())
-    try:
-        resp = requests.get(url, params=params, timeout=timeout_sec)
-        if resp.status_code != 200:
+
+    def _do_fetch() -> List[Dict[str, Any]]:
+        try:
+            resp = requests.get(url, params=params, timeout=timeout_sec)
+            if resp.status_code != 200:
+                return []
+            raw = resp.json()
+        except Exception:
             return []
-        raw = resp.json()
-    except Exception:
+        if isinstance(raw, list):
+            return raw
+        if isinstance(raw, dict) and "data" in raw and isinstance(raw.get("data"), list):
+            return raw["data"]
         return []
-    rows: List[Dict[str, Any]] = []
-    if isinstance(raw, list):
-        rows = raw
-    elif isinstance(raw, dict) and "data" in raw and isinstance(raw.get("data"), list):
-        rows = raw["data"]
+
+    # Concurrent requests for the same ticker share one download
+    from app.core.data.singleflight import orats_singleflight
+    rows = orats_singleflight("hist_dailies", params, _do_fetch)
     return rows[: days] if rows else []
 
 
@@ -238,36 +260,39 @@ def derive_avg_stock_volume_20d(
     timeout_sec: float = DEFAULT_TIMEOUT_SEC,
 ) -> Optional[float]:
     """
-    Compute 20-day average stock volume from /datav2/hist/dailies. Cached per ticker per day.
+    Compute 20-day average stock volume from the daily-bar store (/datav2/hist/dailies). Cached per ticker per day.
+    Symbols without a store get a ~20-session tradeDate window that is not persisted (no full backfill).
     Returns None if unavailable; does not block. Phase 8D.
     """
     from datetime import datetime, timezone
 
     ticker_upper = str(ticker).strip().upper()
     date_key = trade_date or datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    if ticker_upper not in _hist_dailies_avg_cache:
-        _hist_dailies_avg_cache[ticker_upper] = {}
-    if date_key in _hist_dailies_avg_cache[ticker_upper]:
-        return _hist_dailies_avg_cache[ticker_upper][date_key]
-
-    rows = fetch_hist_dailies(
-        ticker_upper,
-        token,
-        fields=["tradeDate", "stockVolume"],
-        days=20,
-        timeout_sec=timeout_sec,
-    )
+    from app.core.data.bounded_cache import MISSING
+
+    cache = _avg_cache()
+    cache_key = f"{ticker_upper}|{date_key}"
+    cached = cache.get(cache_key)
+    if cached is not MISSING:
+        return cached
+
+    if not token or not str(token).strip():
+        return None
+    # Last 20 bars by tradeDate from the incremental daily-bar store
+    # (hist/dailies is ascending, so slicing the raw response took the oldest rows)
+    from app.core.data.daily_bars import get_daily_bar_repository
+    rows = get_daily_bar_repository().recent_bars(ticker_upper, 20, token=str(token).strip())
     volumes: List[float] = []
     for row in rows:
-        v = row.get("stockVolume") or row.get("stockVolu")
+        v = row.get("volume")
         if v is not None:
             try:
                 volumes.append(float(v))
             except (TypeError, ValueError):
                 pass
     if len(volumes) < 1:
-        _hist_dailies_avg_cache[ticker_upper][date_key] = None
+        cache.set(cache_key, None)
         return None
     avg = sum(volumes) / len(volumes)
-    _hist_dailies_avg_cache[ticker_upper][date_key] = avg
+    cache.set(cache_key, avg)
     return avg
@@ -24,12 +24,14 @@ from __future__ import annotations
 import logging
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
 import requests
 
+from app.core.observability.tracing import add_wait, bind_to_trace, traced
 from app.core.orats.endpoints import BASE_DATAV2, PATH_STRIKES_OPTIONS, PATH_IVRANK
 
 logger = logging.getLogger(__name__)
@@ -46,6 +48,8 @@ BATCH_SIZE = 10  # ORATS multi-ticker limit
 
 # Rate limiting
 RATE_LIMIT_CALLS_PER_SEC = 5.0
+# Concurrent batch workers for fetch_full_equity_snapshots (both endpoints share _RATE_LIMITER)
+EQUITY_PREFETCH_MAX_WORKERS = 8
 
 
 # ============================================================================
@@ -53,21 +57,31 @@ RATE_LIMIT_CALLS_PER_SEC = 5.0
 # ============================================================================
 
 class _RateLimiter:
-    """Simple rate limiter for ORATS API calls."""
+    """
+    Shared rate budget for ORATS API calls (both /strikes/options and /ivrank).
+
+    Each caller reserves the next free slot under the lock and sleeps outside it, so
+    concurrent batch workers are spaced min_interval apart without serializing on the
+    lock; up to `burst` calls may start back-to-back after an idle period.
+    """
     
-    def __init__(self, calls_per_second: float = RATE_LIMIT_CALLS_PER_SEC):
+    def __init__(self, calls_per_second: float = RATE_LIMIT_CALLS_PER_SEC, burst: int = 1):
         self.min_interval = 1.0 / calls_per_second
-        self.last_call = 0.0
+        self.burst = max(1, int(burst))
+        self._next_slot = 0.0
         self._lock = threading.Lock()
     
     def acquire(self) -> None:
         """Wait if needed to respect rate limit."""
         with self._lock:
-            now = time.time()
-            elapsed = now - self.last_call
-            if elapsed < self.min_interval:
-                time.sleep(self.min_interval - elapsed)
-            self.last_call = time.time()
+            now = time.monotonic()
+            slot = max(self._next_slot, now)
+            self._next_slot = slot + self.min_interval
+            wait = slot - now - (self.burst - 1) * self.min_interval
+        # Within a burst wait is 0 up to float rounding of the summed intervals; don't sleep on that
+        if wait > 1e-9:
+            time.sleep(wait)
+            add_wait("rate_limit", wait * 1000)
 
 
 _RATE_LIMITER = _RateLimiter()
@@ -123,6 +137,9 @@ class EquityQuote:
     # Error info
     error: Optional[str] = None
     
+    # "live" (fetched this run) | "day_cache" (EquityDayStore, earlier run/process)
+    origin: str = "live"
+    
     @property
     def has_bid_ask(self) -> bool:
         """Check if bid/ask are present."""
@@ -151,6 +168,9 @@ class IVRankData:
     
     # Error info
     error: Optional[str] = None
+    
+    # "live" | "day_cache"
+    origin: str = "live"
 
 
 @dataclass
@@ -183,6 +203,10 @@ class FullEquitySnapshot:
     # Optional fields not available from ORATS (do not affect completeness)
     optional_not_available: Dict[str, str] = field(default_factory=dict)
     
+    # Per-field freshness {field: {origin, fetched_at, age_sec, ttl_sec}}; fields served
+    # from the day store are also marked "<endpoint>:day_cache" in data_sources
+    field_freshness: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    
     # Metadata
     fetched_at: Optional[str] = None
     errors: List[str] = field(default_factory=list)
@@ -198,34 +222,98 @@ class EquityQuoteCache:
     
     Each evaluation run should create a new cache instance to avoid
     stale data across runs. The cache prevents duplicate API calls
-    for the same tickers within a single run.
+    for the same tickers within a single run. Writers notify waiters so
+    consumers can start on a symbol as soon as both its quote and IV rank land.
+    
+    With a day_store, misses are looked up in the day-scoped persistent
+    layer first (per-section TTLs: quotes short, IV rank hours), and successful
+    fetches are written through to it, so IV rank survives run resets and restarts.
     """
     
-    def __init__(self):
+    def __init__(self, day_store: Optional[Any] = None):
         self._equity_quotes: Dict[str, EquityQuote] = {}
         self._iv_ranks: Dict[str, IVRankData] = {}
         self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
         self._fetched_batches: Set[str] = set()  # Track which batches have been fetched
+        self._day_store = day_store
+    
+    def _from_day_store(self, section: str, symbol: str, cls: Any, target: Dict[str, Any]) -> Any:
+        """Hydrate symbol from the day store into target (caller does not hold the lock)."""
+        if self._day_store is None:
+            return None
+        hit = self._day_store.get(section, symbol)
+        if hit is None:
+            return None
+        value, _ = hit
+        try:
+            obj = cls(**value)
+        except TypeError:
+            return None
+        obj.origin = "day_cache"
+        with self._lock:
+            obj = target.setdefault(symbol, obj)
+            self._changed.notify_all()
+        return obj
+    
+    def _to_day_store(self, section: str, symbol: str, obj: Any) -> None:
+        if self._day_store is not None and not obj.error and obj.origin == "live":
+            value = asdict(obj)
+            value.pop("origin", None)
+            self._day_store.put(section, symbol, value)
     
     def get_equity_quote(self, symbol: str) -> Optional[EquityQuote]:
         """Get cached equity quote if available."""
+        sym = symbol.upper()
         with self._lock:
-            return self._equity_quotes.get(symbol.upper())
+            quote = self._equity_quotes.get(sym)
+        if quote is None:
+            quote = self._from_day_store("quotes", sym, EquityQuote, self._equity_quotes)
+        return quote
     
     def set_equity_quote(self, symbol: str, quote: EquityQuote) -> None:
         """Cache equity quote."""
         with self._lock:
             self._equity_quotes[symbol.upper()] = quote
+            self._changed.notify_all()
+        self._to_day_store("quotes", symbol.upper(), quote)
     
     def get_iv_rank(self, symbol: str) -> Optional[IVRankData]:
         """Get cached IV rank if available."""
+        sym = symbol.upper()
         with self._lock:
-            return self._iv_ranks.get(symbol.upper())
+            iv = self._iv_ranks.get(sym)
+        if iv is None:
+            iv = self._from_day_store("iv_rank", sym, IVRankData, self._iv_ranks)
+        return iv
     
     def set_iv_rank(self, symbol: str, iv_rank: IVRankData) -> None:
         """Cache IV rank."""
         with self._lock:
             self._iv_ranks[symbol.upper()] = iv_rank
+            self._changed.notify_all()
+        self._to_day_store("iv_rank", symbol.upper(), iv_rank)
+    
+    def flush(self) -> None:
+        """Persist pending day-store writes (end of a fetch)."""
+        if self._day_store is not None:
+            self._day_store.flush()
+    
+    def is_ready(self, symbol: str) -> bool:
+        """True when both the equity quote and IV rank (or their error entries) are cached."""
+        sym = symbol.upper()
+        with self._lock:
+            return sym in self._equity_quotes and sym in self._iv_ranks
+    
+    def wait_for_update(self, timeout: float) -> None:
+        """Block until any quote/IV rank is stored (or notify_waiters), at most timeout seconds."""
+        with self._lock:
+            self._changed.wait(timeout)
+    
+    def notify_waiters(self) -> None:
+        """Wake wait_for_update callers (e.g. when a prefetch finishes)."""
+        with self._lock:
+            self._changed.notify_all()
     
     def mark_batch_fetched(self, batch_key: str) -> bool:
         """
@@ -242,18 +330,23 @@ class EquityQuoteCache:
 _current_run_cache: Optional[EquityQuoteCache] = None
 
 
+def _new_run_cache() -> EquityQuoteCache:
+    from app.core.orats.equity_day_store import get_equity_day_store
+    return EquityQuoteCache(day_store=get_equity_day_store())
+
+
 def get_run_cache() -> EquityQuoteCache:
     """Get or create cache for current evaluation run."""
     global _current_run_cache
     if _current_run_cache is None:
-        _current_run_cache = EquityQuoteCache()
+        _current_run_cache = _new_run_cache()
     return _current_run_cache
 
 
 def reset_run_cache() -> None:
-    """Reset cache at start of new evaluation run."""
+    """Reset cache at start of new evaluation run (the day-scoped layer underneath is kept)."""
     global _current_run_cache
-    _current_run_cache = EquityQuoteCache()
+    _current_run_cache = _new_run_cache()
 
 
 # ============================================================================
@@ -286,6 +379,77 @@ def _batch_tickers(tickers: List[str], batch_size: int = BATCH_SIZE) -> List[Lis
 # Equity Quote Fetcher
 # ============================================================================
 
+def _pending_quote_batches(
+    tickers: List[str],
+    cache: EquityQuoteCache,
+) -> Tuple[Dict[str, EquityQuote], List[List[str]]]:
+    """Split tickers into cached quotes and uncached batches (batch_size=BATCH_SIZE)."""
+    results: Dict[str, EquityQuote] = {}
+    tickers_to_fetch: List[str] = []
+    
+    # Check cache first
+    for ticker in tickers:
+        ticker_upper = ticker.upper()
+        cached = cache.get_equity_quote(ticker_upper)
+        if cached:
+            results[ticker_upper] = cached
+            logger.debug("[EQUITY_QUOTE] %s: cache hit", ticker_upper)
+        else:
+            tickers_to_fetch.append(ticker_upper)
+    
+    if not tickers_to_fetch:
+        logger.info("[ORATS_CACHE] equity_quotes: all %d tickers from cache (0 live calls)", len(tickers))
+        return results, []
+    
+    logger.info(
+        "[ORATS_CACHE] equity_quotes: %d live calls, %d cache hits, batch_size=%d",
+        len(tickers_to_fetch), len(results), BATCH_SIZE
+    )
+    return results, _batch_tickers(tickers_to_fetch, BATCH_SIZE)
+
+
+def _fetch_quote_batch_into_cache(
+    batch: List[str],
+    cache: EquityQuoteCache,
+    now_iso: str,
+) -> Dict[str, EquityQuote]:
+    """Fetch one /strikes/options batch and store each quote (or error entry) in cache as it lands."""
+    results: Dict[str, EquityQuote] = {}
+    batch_key = ",".join(sorted(batch))
+    if cache.mark_batch_fetched(batch_key):
+        logger.debug("[ORATS_CACHE] equity_quotes batch already fetched: %s", batch[:3])
+        return results
+    
+    try:
+        params_for_cache = {"as_of": datetime.now(timezone.utc).date().isoformat()}
+        try:
+            from app.core.data.cache_policy import get_ttl
+            from app.core.data.cache_store import fetch_batch_with_cache
+            batch_results = fetch_batch_with_cache(
+                "quotes", batch, params_for_cache, get_ttl("quotes"),
+                lambda b=batch: _fetch_equity_quotes_single_batch(b),
+                serialize=lambda d: {k: asdict(v) for k, v in d.items()},
+                deserialize=lambda d: {k: EquityQuote(**v) for k, v in d.items()},
+            )
+        except ImportError:
+            batch_results = _fetch_equity_quotes_single_batch(batch)
+        for symbol, quote in batch_results.items():
+            quote.fetched_at = now_iso
+            results[symbol] = quote
+            cache.set_equity_quote(symbol, quote)
+    except OratsEquityQuoteError as e:
+        logger.error("[EQUITY_QUOTE] Batch fetch failed: %s", e)
+        # Create error entries for all tickers in batch
+        for ticker in batch:
+            results[ticker] = EquityQuote(
+                symbol=ticker,
+                error=str(e),
+                fetched_at=now_iso,
+            )
+            cache.set_equity_quote(ticker, results[ticker])
+    return results
+
+
 def fetch_equity_quotes_batch(
     tickers: List[str],
     cache: Optional[EquityQuoteCache] = None,
@@ -309,69 +473,14 @@ def fetch_equity_quotes_batch(
         return {}
     
     cache = cache or get_run_cache()
-    results: Dict[str, EquityQuote] = {}
-    tickers_to_fetch: List[str] = []
-    
-    # Check cache first
-    for ticker in tickers:
-        ticker_upper = ticker.upper()
-        cached = cache.get_equity_quote(ticker_upper)
-        if cached:
-            results[ticker_upper] = cached
-            logger.debug("[EQUITY_QUOTE] %s: cache hit", ticker_upper)
-        else:
-            tickers_to_fetch.append(ticker_upper)
-    
-    if not tickers_to_fetch:
-        logger.info("[ORATS_CACHE] equity_quotes: all %d tickers from cache (0 live calls)", len(tickers))
-        return results
-    
-    logger.info(
-        "[ORATS_CACHE] equity_quotes: %d live calls, %d cache hits, batch_size=%d",
-        len(tickers_to_fetch), len(results), BATCH_SIZE
-    )
-    
-    # Batch and fetch
-    batches = _batch_tickers(tickers_to_fetch, BATCH_SIZE)
+    results, batches = _pending_quote_batches(tickers, cache)
     now_iso = datetime.now(timezone.utc).isoformat()
-    
     for batch in batches:
-        batch_key = ",".join(sorted(batch))
-        if cache.mark_batch_fetched(batch_key):
-            logger.debug("[ORATS_CACHE] equity_quotes batch already fetched: %s", batch[:3])
-            continue
-        
-        try:
-            params_for_cache = {"as_of": datetime.now(timezone.utc).date().isoformat()}
-            try:
-                from app.core.data.cache_policy import get_ttl
-                from app.core.data.cache_store import fetch_batch_with_cache
-                batch_results = fetch_batch_with_cache(
-                    "quotes", batch, params_for_cache, get_ttl("quotes"),
-                    lambda b=batch: _fetch_equity_quotes_single_batch(b),
-                    serialize=lambda d: {k: asdict(v) for k, v in d.items()},
-                    deserialize=lambda d: {k: EquityQuote(**v) for k, v in d.items()},
-                )
-            except ImportError:
-                batch_results = _fetch_equity_quotes_single_batch(batch)
-            for symbol, quote in batch_results.items():
-                quote.fetched_at = now_iso
-                results[symbol] = quote
-                cache.set_equity_quote(symbol, quote)
-        except OratsEquityQuoteError as e:
-            logger.error("[EQUITY_QUOTE] Batch fetch failed: %s", e)
-            # Create error entries for all tickers in batch
-            for ticker in batch:
-                results[ticker] = EquityQuote(
-                    symbol=ticker,
-                    error=str(e),
-                    fetched_at=now_iso,
-                )
-                cache.set_equity_quote(ticker, results[ticker])
-    
+        results.update(_fetch_quote_batch_into_cache(batch, cache, now_iso))
     return results
 
 
+@traced("orats.equity_quote_batch", "orats")
 def _fetch_equity_quotes_single_batch(tickers: List[str]) -> Dict[str, EquityQuote]:
     """
     Fetch equity quotes for a single batch (max 10 tickers).
@@ -632,6 +741,68 @@ def build_merge_report(
 # IV Rank Fetcher
 # ============================================================================
 
+def _pending_ivrank_batches(
+    tickers: List[str],
+    cache: EquityQuoteCache,
+) -> Tuple[Dict[str, IVRankData], List[List[str]]]:
+    """Split tickers into cached IV ranks and uncached batches (batch_size=BATCH_SIZE)."""
+    results: Dict[str, IVRankData] = {}
+    tickers_to_fetch: List[str] = []
+    
+    # Check cache first
+    for ticker in tickers:
+        ticker_upper = ticker.upper()
+        cached = cache.get_iv_rank(ticker_upper)
+        if cached:
+            results[ticker_upper] = cached
+        else:
+            tickers_to_fetch.append(ticker_upper)
+    
+    if not tickers_to_fetch:
+        logger.info("[ORATS_CACHE] ivrank: all %d tickers from cache (0 live calls)", len(tickers))
+        return results, []
+    
+    logger.info("[ORATS_CACHE] ivrank: %d live calls, %d cache hits, batch_size=%d", len(tickers_to_fetch), len(results), BATCH_SIZE)
+    return results, _batch_tickers(tickers_to_fetch, BATCH_SIZE)
+
+
+def _fetch_ivrank_batch_into_cache(
+    batch: List[str],
+    cache: EquityQuoteCache,
+    now_iso: str,
+) -> Dict[str, IVRankData]:
+    """Fetch one /ivrank batch and store each row (or error entry) in cache as it lands."""
+    results: Dict[str, IVRankData] = {}
+    try:
+        params_for_cache = {"as_of": datetime.now(timezone.utc).date().isoformat()}
+        try:
+            from app.core.data.cache_policy import get_ttl
+            from app.core.data.cache_store import fetch_batch_with_cache
+            batch_results = fetch_batch_with_cache(
+                "iv_rank", batch, params_for_cache, get_ttl("iv_rank"),
+                lambda b=batch: _fetch_iv_ranks_single_batch(b),
+                serialize=lambda d: {k: asdict(v) for k, v in d.items()},
+                deserialize=lambda d: {k: IVRankData(**v) for k, v in d.items()},
+            )
+        except ImportError:
+            batch_results = _fetch_iv_ranks_single_batch(batch)
+        for symbol, iv_data in batch_results.items():
+            iv_data.fetched_at = now_iso
+            results[symbol] = iv_data
+            cache.set_iv_rank(symbol, iv_data)
+    except OratsEquityQuoteError as e:
+        logger.error("[IVRANK] Batch fetch failed: %s", e)
+        # Create error entries
+        for ticker in batch:
+            results[ticker] = IVRankData(
+                symbol=ticker,
+                error=str(e),
+                fetched_at=now_iso,
+            )
+            cache.set_iv_rank(ticker, results[ticker])
+    return results
+
+
 def fetch_iv_ranks_batch(
     tickers: List[str],
     cache: Optional[EquityQuoteCache] = None,
@@ -654,60 +825,14 @@ def fetch_iv_ranks_batch(
         return {}
     
     cache = cache or get_run_cache()
-    results: Dict[str, IVRankData] = {}
-    tickers_to_fetch: List[str] = []
-    
-    # Check cache first
-    for ticker in tickers:
-        ticker_upper = ticker.upper()
-        cached = cache.get_iv_rank(ticker_upper)
-        if cached:
-            results[ticker_upper] = cached
-        else:
-            tickers_to_fetch.append(ticker_upper)
-    
-    if not tickers_to_fetch:
-        logger.info("[ORATS_CACHE] ivrank: all %d tickers from cache (0 live calls)", len(tickers))
-        return results
-    
-    logger.info("[ORATS_CACHE] ivrank: %d live calls, %d cache hits, batch_size=%d", len(tickers_to_fetch), len(results), BATCH_SIZE)
-    
-    # Batch and fetch
-    batches = _batch_tickers(tickers_to_fetch, BATCH_SIZE)
+    results, batches = _pending_ivrank_batches(tickers, cache)
     now_iso = datetime.now(timezone.utc).isoformat()
-    
     for batch in batches:
-        try:
-            params_for_cache = {"as_of": datetime.now(timezone.utc).date().isoformat()}
-            try:
-                from app.core.data.cache_policy import get_ttl
-                from app.core.data.cache_store import fetch_batch_with_cache
-                batch_results = fetch_batch_with_cache(
-                    "iv_rank", batch, params_for_cache, get_ttl("iv_rank"),
-                    lambda b=batch: _fetch_iv_ranks_single_batch(b),
-                    serialize=lambda d: {k: asdict(v) for k, v in d.items()},
-                    deserialize=lambda d: {k: IVRankData(**v) for k, v in d.items()},
-                )
-            except ImportError:
-                batch_results = _fetch_iv_ranks_single_batch(batch)
-            for symbol, iv_data in batch_results.items():
-                iv_data.fetched_at = now_iso
-                results[symbol] = iv_data
-                cache.set_iv_rank(symbol, iv_data)
-        except OratsEquityQuoteError as e:
-            logger.error("[IVRANK] Batch fetch failed: %s", e)
-            # Create error entries
-            for ticker in batch:
-                results[ticker] = IVRankData(
-                    symbol=ticker,
-                    error=str(e),
-                    fetched_at=now_iso,
-                )
-                cache.set_iv_rank(ticker, results[ticker])
-    
+        results.update(_fetch_ivrank_batch_into_cache(batch, cache, now_iso))
     return results
 
 
+@traced("orats.ivrank_batch", "orats")
 def _fetch_iv_ranks_single_batch(tickers: List[str]) -> Dict[str, IVRankData]:
     """
     Fetch IV rank for a single batch (max 10 tickers).
@@ -850,9 +975,142 @@ def _fetch_iv_ranks_single_batch(tickers: List[str]) -> Dict[str, IVRankData]:
 # Combined Snapshot Fetcher
 # ============================================================================
 
+def _source_label(endpoint: str, item: Any) -> str:
+    """data_sources value: endpoint, suffixed ":day_cache" when served from the day store."""
+    return f"{endpoint}:day_cache" if getattr(item, "origin", "live") == "day_cache" else endpoint
+
+
+def _freshness(item: Any, section: str, now_iso: str) -> Dict[str, Any]:
+    """Per-field freshness metadata for one quote / IV rank entry."""
+    from app.core.data.cache_policy import get_ttl
+
+    fetched_at = getattr(item, "fetched_at", None) or now_iso
+    age_sec: Optional[int] = None
+    try:
+        then = datetime.fromisoformat(str(fetched_at).replace("Z", "+00:00"))
+        now = datetime.fromisoformat(now_iso.replace("Z", "+00:00"))
+        age_sec = max(0, int((now - then).total_seconds()))
+    except (TypeError, ValueError):
+        pass
+    return {
+        "origin": getattr(item, "origin", "live"),
+        "fetched_at": fetched_at,
+        "age_sec": age_sec,
+        "ttl_sec": get_ttl(section),
+    }
+
+
+def _merge_full_snapshot(
+    ticker_upper: str,
+    eq: Optional[EquityQuote],
+    iv: Optional[IVRankData],
+    now_iso: str,
+) -> FullEquitySnapshot:
+    """Combine one ticker's equity quote and IV rank into a FullEquitySnapshot."""
+    snapshot = FullEquitySnapshot(
+        symbol=ticker_upper,
+        fetched_at=now_iso,
+    )
+    
+    # Populate from equity quote
+    if eq and not eq.error:
+        snapshot.price = eq.price
+        snapshot.bid = eq.bid
+        snapshot.ask = eq.ask
+        snapshot.volume = eq.volume
+        snapshot.quote_date = eq.quote_date
+        snapshot.raw_fields_present.extend(eq.raw_fields_present)
+        
+        # Track data sources
+        source = _source_label("strikes/options", eq)
+        if eq.price is not None:
+            snapshot.data_sources["price"] = source
+        if eq.bid is not None:
+            snapshot.data_sources["bid"] = source
+        if eq.ask is not None:
+            snapshot.data_sources["ask"] = source
+        if eq.volume is not None:
+            snapshot.data_sources["volume"] = source
+        if eq.quote_date:
+            snapshot.data_sources["quote_date"] = source
+        freshness = _freshness(eq, "quotes", now_iso)
+        for f in ("price", "bid", "ask", "volume", "quote_date"):
+            if f in snapshot.data_sources:
+                snapshot.field_freshness[f] = dict(freshness)
+    elif eq and eq.error:
+        snapshot.errors.append(f"equity_quote: {eq.error}")
+    
+    # Populate from IV rank
+    if iv and not iv.error:
+        snapshot.iv_rank = iv.iv_rank
+        snapshot.raw_fields_present.extend(iv.raw_fields_present)
+        
+        if iv.iv_rank is not None:
+            snapshot.data_sources["iv_rank"] = _source_label("ivrank", iv)
+            snapshot.field_freshness["iv_rank"] = _freshness(iv, "iv_rank", now_iso)
+    elif iv and iv.error:
+        snapshot.errors.append(f"iv_rank: {iv.error}")
+    
+    # Compute missing fields
+    if snapshot.price is None:
+        snapshot.missing_fields.append("price")
+        snapshot.missing_reasons["price"] = eq.error if eq and eq.error else "Not in ORATS response"
+    if snapshot.bid is None:
+        snapshot.missing_fields.append("bid")
+        snapshot.missing_reasons["bid"] = eq.error if eq and eq.error else "Not in ORATS response"
+    if snapshot.ask is None:
+        snapshot.missing_fields.append("ask")
+        snapshot.missing_reasons["ask"] = eq.error if eq and eq.error else "Not in ORATS response"
+    if snapshot.volume is None:
+        snapshot.missing_fields.append("volume")
+        snapshot.missing_reasons["volume"] = eq.error if eq and eq.error else "Not in ORATS response"
+    if snapshot.iv_rank is None:
+        snapshot.missing_fields.append("iv_rank")
+        snapshot.missing_reasons["iv_rank"] = iv.error if iv and iv.error else "Not in ORATS response"
+    
+    logger.debug(
+        "[EQUITY_SNAPSHOT] %s: price=%s bid=%s ask=%s volume=%s iv_rank=%s missing=%s",
+        ticker_upper, snapshot.price, snapshot.bid, snapshot.ask,
+        snapshot.volume, snapshot.iv_rank, snapshot.missing_fields
+    )
+    return snapshot
+
+
+def _fetch_pending_batches(
+    tickers: List[str],
+    cache: EquityQuoteCache,
+    max_workers: int,
+) -> None:
+    """
+    Fetch every uncached quote and IV rank batch for tickers into cache.
+    
+    Quote and IV rank batches are interleaved so symbols become complete early, and
+    dispatched to up to max_workers threads; all calls share _RATE_LIMITER.
+    """
+    now_iso = datetime.now(timezone.utc).isoformat()
+    _, quote_batches = _pending_quote_batches(tickers, cache)
+    _, ivrank_batches = _pending_ivrank_batches(tickers, cache)
+    tasks: List[Callable[[], Any]] = []
+    for i in range(max(len(quote_batches), len(ivrank_batches))):
+        if i < len(quote_batches):
+            tasks.append(lambda b=quote_batches[i]: _fetch_quote_batch_into_cache(b, cache, now_iso))
+        if i < len(ivrank_batches):
+            tasks.append(lambda b=ivrank_batches[i]: _fetch_ivrank_batch_into_cache(b, cache, now_iso))
+    
+    workers = min(max(1, max_workers), len(tasks))
+    if workers <= 1:
+        for task in tasks:
+            task()
+        return
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="orats-equity") as executor:
+        # list() propagates unexpected exceptions; OratsEquityQuoteError is handled per batch
+        list(executor.map(lambda task: task(), [bind_to_trace(t) for t in tasks]))
+
+
 def fetch_full_equity_snapshots(
     tickers: List[str],
     cache: Optional[EquityQuoteCache] = None,
+    max_workers: Optional[int] = None,
 ) -> Dict[str, FullEquitySnapshot]:
     """
     Fetch complete equity snapshots (quote + IV rank) for multiple tickers.
@@ -861,9 +1119,13 @@ def fetch_full_equity_snapshots(
     - Equity quote from /strikes/options (price, bid, ask, volume, quote_date)
     - IV rank from /ivrank (iv_rank)
     
+    Batches for both endpoints are dispatched concurrently under the shared rate
+    limiter; each batch is written to the cache as soon as it lands.
+    
     Args:
         tickers: List of underlying tickers
         cache: Optional cache instance
+        max_workers: Concurrent batch fetches (default EQUITY_PREFETCH_MAX_WORKERS; 1 = sequential)
     
     Returns:
         Dict mapping symbol -> FullEquitySnapshot
@@ -872,92 +1134,92 @@ def fetch_full_equity_snapshots(
         return {}
     
     cache = cache or get_run_cache()
-    now_iso = datetime.now(timezone.utc).isoformat()
-    
-    # Fetch both in parallel-ish (sequential batches, but both endpoints)
     logger.info("[EQUITY_SNAPSHOT] Fetching full snapshots for %d tickers", len(tickers))
+    try:
+        _fetch_pending_batches(
+            tickers, cache, EQUITY_PREFETCH_MAX_WORKERS if max_workers is None else max_workers
+        )
+    finally:
+        cache.flush()
     
-    # Fetch equity quotes
-    equity_quotes = fetch_equity_quotes_batch(tickers, cache)
-    
-    # Fetch IV ranks
-    iv_ranks = fetch_iv_ranks_batch(tickers, cache)
-    
-    # Combine into full snapshots
+    now_iso = datetime.now(timezone.utc).isoformat()
     results: Dict[str, FullEquitySnapshot] = {}
-    
     for ticker in tickers:
         ticker_upper = ticker.upper()
-        
-        eq = equity_quotes.get(ticker_upper)
-        iv = iv_ranks.get(ticker_upper)
-        
-        snapshot = FullEquitySnapshot(
-            symbol=ticker_upper,
-            fetched_at=now_iso,
+        results[ticker_upper] = _merge_full_snapshot(
+            ticker_upper, cache.get_equity_quote(ticker_upper), cache.get_iv_rank(ticker_upper), now_iso
         )
-        
-        # Populate from equity quote
-        if eq and not eq.error:
-            snapshot.price = eq.price
-            snapshot.bid = eq.bid
-            snapshot.ask = eq.ask
-            snapshot.volume = eq.volume
-            snapshot.quote_date = eq.quote_date
-            snapshot.raw_fields_present.extend(eq.raw_fields_present)
-            
-            # Track data sources
-            if eq.price is not None:
-                snapshot.data_sources["price"] = "strikes/options"
-            if eq.bid is not None:
-                snapshot.data_sources["bid"] = "strikes/options"
-            if eq.ask is not None:
-                snapshot.data_sources["ask"] = "strikes/options"
-            if eq.volume is not None:
-                snapshot.data_sources["volume"] = "strikes/options"
-            if eq.quote_date:
-                snapshot.data_sources["quote_date"] = "strikes/options"
-        elif eq and eq.error:
-            snapshot.errors.append(f"equity_quote: {eq.error}")
-        
-        # Populate from IV rank
-        if iv and not iv.error:
-            snapshot.iv_rank = iv.iv_rank
-            snapshot.raw_fields_present.extend(iv.raw_fields_present)
-            
-            if iv.iv_rank is not None:
-                snapshot.data_sources["iv_rank"] = "ivrank"
-        elif iv and iv.error:
-            snapshot.errors.append(f"iv_rank: {iv.error}")
-        
-        # Compute missing fields
-        if snapshot.price is None:
-            snapshot.missing_fields.append("price")
-            snapshot.missing_reasons["price"] = eq.error if eq and eq.error else "Not in ORATS response"
-        if snapshot.bid is None:
-            snapshot.missing_fields.append("bid")
-            snapshot.missing_reasons["bid"] = eq.error if eq and eq.error else "Not in ORATS response"
-        if snapshot.ask is None:
-            snapshot.missing_fields.append("ask")
-            snapshot.missing_reasons["ask"] = eq.error if eq and eq.error else "Not in ORATS response"
-        if snapshot.volume is None:
-            snapshot.missing_fields.append("volume")
-            snapshot.missing_reasons["volume"] = eq.error if eq and eq.error else "Not in ORATS response"
-        if snapshot.iv_rank is None:
-            snapshot.missing_fields.append("iv_rank")
-            snapshot.missing_reasons["iv_rank"] = iv.error if iv and iv.error else "Not in ORATS response"
-        
-        results[ticker_upper] = snapshot
-        
-        logger.debug(
-            "[EQUITY_SNAPSHOT] %s: price=%s bid=%s ask=%s volume=%s iv_rank=%s missing=%s",
-            ticker_upper, snapshot.price, snapshot.bid, snapshot.ask,
-            snapshot.volume, snapshot.iv_rank, snapshot.missing_fields
-        )
-    
     return results
 
 
+class EquityPrefetch:
+    """
+    Background fetch_full_equity_snapshots for a universe.
+    
+    iter_ready() yields each ticker once, as soon as both its quote and IV rank are in
+    the cache, so Stage 1 can start on early symbols while later batches are in flight.
+    Tickers ORATS never returned are yielded after the fetch completes.
+    """
+    
+    def __init__(self, tickers: List[str], cache: EquityQuoteCache, max_workers: Optional[int] = None):
+        self.tickers = list(dict.fromkeys(t.upper() for t in tickers))
+        self.cache = cache
+        self.max_workers = max_workers
+        self.wall_ms: Optional[float] = None
+        self._result: Dict[str, FullEquitySnapshot] = {}
+        self._error: Optional[BaseException] = None
+        self._done = threading.Event()
+        self._t0 = time.perf_counter()
+        target = bind_to_trace(self._run, "equity_prefetch", "orats", tickers=len(self.tickers))
+        self._thread = threading.Thread(target=target, name="orats-equity-prefetch", daemon=True)
+        self._thread.start()
+    
+    def _run(self) -> None:
+        try:
+            self._result = fetch_full_equity_snapshots(self.tickers, self.cache, self.max_workers)
+        except BaseException as e:  # surfaced from result()
+            self._error = e
+        finally:
+            self.wall_ms = (time.perf_counter() - self._t0) * 1000
+            self._done.set()
+            self.cache.notify_waiters()
+    
+    def done(self) -> bool:
+        return self._done.is_set()
+    
+    def iter_ready(self, poll_sec: float = 0.5) -> Iterator[str]:
+        """Yield tickers in readiness order (input order among those ready together)."""
+        pending = list(self.tickers)
+        while pending:
+            finished = self._done.is_set()
+            still: List[str] = []
+            for sym in pending:
+                if finished or self.cache.is_ready(sym):
+                    yield sym
+                else:
+                    still.append(sym)
+            pending = still
+            if pending:
+                self.cache.wait_for_update(poll_sec)
+    
+    def result(self, timeout: Optional[float] = None) -> Dict[str, FullEquitySnapshot]:
+        """Block until the prefetch finishes; returns the merged snapshots."""
+        if not self._done.wait(timeout):
+            raise TimeoutError("equity prefetch still running")
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+
+def start_equity_prefetch(
+    tickers: List[str],
+    cache: Optional[EquityQuoteCache] = None,
+    max_workers: Optional[int] = None,
+) -> EquityPrefetch:
+    """Start fetch_full_equity_snapshots in the background; see EquityPrefetch."""
+    return EquityPrefetch(tickers, cache or get_run_cache(), max_workers)
+
+
 # ============================================================================
 # Exports
 # ============================================================================
@@ -977,6 +1239,8 @@ __all__ = [
     "fetch_equity_quotes_batch",
     "fetch_iv_ranks_batch",
     "fetch_full_equity_snapshots",
+    "EquityPrefetch",
+    "start_equity_prefetch",
     # Merge report
     "build_merge_report",
     # Parser (for tests)
@@ -39,6 +39,7 @@ from typing import Any, Dict, List, Literal, Optional, Tuple
 
 import requests
 
+from app.core.observability.tracing import add_wait, traced
 from app.core.orats.endpoints import BASE_DATAV2, PATH_STRIKES, PATH_STRIKES_OPTIONS
 
 logger = logging.getLogger(__name__)
@@ -212,12 +213,14 @@ class _RateLimiter:
     
     def acquire(self) -> None:
         """Wait if needed to respect rate limit."""
+        t0 = time.perf_counter()
         with self._lock:
             now = time.time()
             elapsed = now - self.last_call
             if elapsed < self.min_interval:
                 time.sleep(self.min_interval - elapsed)
             self.last_call = time.time()
+        add_wait("rate_limit", (time.perf_counter() - t0) * 1000)
 
 
 _RATE_LIMITER = _RateLimiter()
@@ -487,6 +490,7 @@ class OratsDelayedClient:
         
         return all_rows
     
+    @traced("orats.strikes_options_batch", "orats")
     def _fetch_strikes_options_batch(self, tickers: List[str]) -> List[Dict[str, Any]]:
         """Fetch a single batch of strikes/options."""
         _RATE_LIMITER.acquire()
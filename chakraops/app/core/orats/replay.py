@@ -0,0 +1,622 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""
+Record/replay harness for ORATS responses.
+
+record_orats(bundle) captures every successful ORATS response for /cores, /strikes,
+/strikes/options, /ivrank and /hist/dailies into a FixtureBundle. Bundles store rows
+(indexed by ticker, OCC symbol, expiry/strike or trade date), not raw request/response
+pairs: batch composition changes with concurrency and coalescing, rows do not.
+
+OratsStubServer serves a bundle over local HTTP with configurable latency, jitter and
+injected error rate; route_orats_to(url) points every ORATS call at it. Both hook
+requests' HTTPAdapter.send, so no caller needs a base-URL override.
+
+On replay, dates are shifted so the bundle's as_of lands on the latest weekday (quotes
+stay fresh, DTEs unchanged) and tickers missing from the bundle are cloned from a
+recorded ticker, so a small recording drives a universe of any size.
+
+synthetic_bundle() builds a deterministic bundle when no recording is available (CI,
+benchmarks in this repo).
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import math
+import random
+import re
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlparse
+
+from app.core.orats.endpoints import (
+    BASE_DATAV2,
+    PATH_CORES,
+    PATH_HIST_DAILIES,
+    PATH_IVRANK,
+    PATH_STRIKES,
+    PATH_STRIKES_OPTIONS,
+)
+
+logger = logging.getLogger(__name__)
+
+BUNDLE_VERSION = 1
+
+_ORATS_ORIGIN = "{0.scheme}://{0.netloc}".format(urlparse(BASE_DATAV2))
+
+# Longest suffix first: /strikes/options must not match /strikes
+RECORDED_PATHS = (PATH_STRIKES_OPTIONS, PATH_HIST_DAILIES, PATH_STRIKES, PATH_CORES, PATH_IVRANK)
+
+# Bundle tables: cores/ivrank/quotes keyed by ticker; strikes/dailies by ticker then row id;
+# options keyed by OCC symbol (strikes/options with option symbols)
+_TABLES = ("cores", "ivrank", "quotes", "strikes", "dailies", "options")
+
+_DATE_FIELDS = ("quoteDate", "tradeDate", "expirDate", "updatedAt", "snapShotDate")
+_OCC_RE = re.compile(r"^([A-Z]+)\s*(\d{6})([PC])(\d{8})$")
+
+
+def match_endpoint(path: str) -> Optional[str]:
+    """Return the recorded endpoint path (e.g. /strikes/options) that `path` ends with, else None."""
+    p = path.rstrip("/")
+    for ep in RECORDED_PATHS:
+        if p.endswith(ep):
+            return ep
+    return None
+
+
+def _split_symbols(params: Dict[str, Any]) -> List[str]:
+    raw = params.get("ticker") or params.get("tickers") or ""
+    return [s.strip().upper() for s in str(raw).split(",") if s.strip()]
+
+
+def _rows_of(payload: Any) -> List[Dict[str, Any]]:
+    if isinstance(payload, list):
+        rows = payload
+    elif isinstance(payload, dict) and isinstance(payload.get("data"), list):
+        rows = payload["data"]
+    else:
+        rows = []
+    return [r for r in rows if isinstance(r, dict)]
+
+
+def _strike_row_id(row: Dict[str, Any]) -> str:
+    side = row.get("optionType") or row.get("putCall") or row.get("callPut") or ""
+    return f"{row.get('expirDate')}|{row.get('strike')}|{side}"
+
+
+def _shift_date_str(value: Any, days: int) -> Any:
+    if not days or not isinstance(value, str) or len(value) < 10:
+        return value
+    try:
+        d = date.fromisoformat(value[:10])
+    except ValueError:
+        return value
+    return (d + timedelta(days=days)).isoformat() + value[10:]
+
+
+def _shift_occ(occ: str, days: int, root: Optional[str] = None) -> str:
+    m = _OCC_RE.match(occ.replace(" ", ""))
+    if not m:
+        return occ
+    old_root, yymmdd, side, strike = m.groups()
+    exp = datetime.strptime(yymmdd, "%y%m%d").date() + timedelta(days=days)
+    return f"{root or old_root}{exp.strftime('%y%m%d')}{side}{strike}"
+
+
+def latest_weekday(today: Optional[date] = None) -> date:
+    d = today or date.today()
+    while d.weekday() >= 5:
+        d -= timedelta(days=1)
+    return d
+
+
+class FixtureBundle:
+    """Recorded ORATS rows plus the date they were recorded (as_of)."""
+
+    def __init__(self, as_of: Optional[str] = None) -> None:
+        self.as_of = as_of or latest_weekday().isoformat()
+        self.tables: Dict[str, Dict[str, Any]] = {t: {} for t in _TABLES}
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def add_response(self, path: str, params: Dict[str, Any], payload: Any) -> int:
+        """Index the rows of one ORATS response; returns how many rows were stored."""
+        endpoint = match_endpoint(path)
+        if endpoint is None:
+            return 0
+        rows = _rows_of(payload)
+        requested = _split_symbols(params)
+        stored = 0
+        with self._lock:
+            for row in rows:
+                ticker = str(row.get("ticker") or (requested[0] if len(requested) == 1 else "")).strip().upper()
+                if endpoint == PATH_STRIKES_OPTIONS and row.get("optionSymbol"):
+                    self.tables["options"][str(row["optionSymbol"]).replace(" ", "")] = row
+                elif not ticker:
+                    continue
+                elif endpoint == PATH_STRIKES_OPTIONS:
+                    self.tables["quotes"][ticker] = row
+                elif endpoint == PATH_CORES:
+                    self.tables["cores"][ticker] = row
+                elif endpoint == PATH_IVRANK:
+                    self.tables["ivrank"][ticker] = row
+                elif endpoint == PATH_STRIKES:
+                    self.tables["strikes"].setdefault(ticker, {})[_strike_row_id(row)] = row
+                elif endpoint == PATH_HIST_DAILIES:
+                    self.tables["dailies"].setdefault(ticker, {})[str(row.get("tradeDate"))[:10]] = row
+                stored += 1
+        return stored
+
+    def tickers(self) -> List[str]:
+        names = set(self.tables["quotes"]) | set(self.tables["cores"]) | set(self.tables["strikes"])
+        return sorted(names)
+
+    def row_count(self) -> int:
+        n = 0
+        for name, table in self.tables.items():
+            n += sum(len(v) for v in table.values()) if name in ("strikes", "dailies") else len(table)
+        return n
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            tables = {
+                name: ({k: list(v.values()) for k, v in table.items()} if name in ("strikes", "dailies") else dict(table))
+                for name, table in self.tables.items()
+            }
+        return {"version": BUNDLE_VERSION, "as_of": self.as_of, "tables": tables}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FixtureBundle":
+        if int(data.get("version") or 0) != BUNDLE_VERSION:
+            raise ValueError(f"Unsupported fixture bundle version: {data.get('version')}")
+        bundle = cls(as_of=data.get("as_of"))
+        tables = data.get("tables") or {}
+        for name in _TABLES:
+            src = tables.get(name) or {}
+            if name == "strikes":
+                bundle.tables[name] = {k: {_strike_row_id(r): r for r in rows} for k, rows in src.items()}
+            elif name == "dailies":
+                bundle.tables[name] = {k: {str(r.get("tradeDate"))[:10]: r for r in rows} for k, rows in src.items()}
+            else:
+                bundle.tables[name] = dict(src)
+        return bundle
+
+    def save(self, path: Union[str, Path]) -> Path:
+        """Write the bundle as JSON (gzip when the name ends in .gz)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        raw = json.dumps(self.to_dict(), separators=(",", ":"), default=str).encode("utf-8")
+        if path.suffix == ".gz":
+            raw = gzip.compress(raw)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_bytes(raw)
+        tmp.replace(path)
+        return path
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "FixtureBundle":
+        raw = Path(path).read_bytes()
+        if raw[:2] == b"\x1f\x8b":
+            raw = gzip.decompress(raw)
+        return cls.from_dict(json.loads(raw.decode("utf-8")))
+
+    # ------------------------------------------------------------------
+    # Replay
+    # ------------------------------------------------------------------
+
+    def shift_days(self, reference: Optional[date] = None) -> int:
+        """Days to add to recorded dates so as_of becomes the latest weekday."""
+        return (latest_weekday(reference) - date.fromisoformat(self.as_of[:10])).days
+
+    def _template(self, table: str, ticker: str, clone: bool) -> Optional[str]:
+        keys = self.tables[table]
+        if ticker in keys:
+            return ticker
+        if not clone or not keys:
+            return None
+        names = sorted(keys)
+        return names[zlib.crc32(ticker.encode("utf-8")) % len(names)]
+
+    def _option_template(self, ticker: str, clone: bool) -> Optional[str]:
+        roots = self._option_roots()
+        if ticker in roots:
+            return ticker
+        if not clone or not roots:
+            return None
+        # Prefer the ticker's strikes template so chain and OCC lookups agree
+        strikes_tpl = self._template("strikes", ticker, clone)
+        if strikes_tpl in roots:
+            return strikes_tpl
+        return roots[zlib.crc32(ticker.encode("utf-8")) % len(roots)]
+
+    def _option_roots(self) -> List[str]:
+        roots = set()
+        for occ in self.tables["options"]:
+            m = _OCC_RE.match(occ)
+            if m:
+                roots.add(m.group(1))
+        return sorted(roots)
+
+    @staticmethod
+    def _rewrite(row: Dict[str, Any], ticker: str, days: int) -> Dict[str, Any]:
+        out = dict(row)
+        if "ticker" in out:
+            out["ticker"] = ticker
+        for f in _DATE_FIELDS:
+            if f in out:
+                out[f] = _shift_date_str(out[f], days)
+        if out.get("optionSymbol"):
+            out["optionSymbol"] = _shift_occ(str(out["optionSymbol"]), days, root=ticker)
+        return out
+
+    def respond(
+        self,
+        path: str,
+        params: Dict[str, Any],
+        clone: bool = True,
+        reference: Optional[date] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """ORATS-shaped payload {"data": [...]} for a request, or None for an unknown path."""
+        endpoint = match_endpoint(path)
+        if endpoint is None:
+            return None
+        days = self.shift_days(reference)
+        rows: List[Dict[str, Any]] = []
+        for sym in _split_symbols(params):
+            if endpoint == PATH_STRIKES_OPTIONS and _OCC_RE.match(sym):
+                root = _OCC_RE.match(sym).group(1)
+                tpl = self._option_template(root, clone)
+                if tpl is None:
+                    continue
+                row = self.tables["options"].get(_shift_occ(sym, -days, root=tpl))
+                if row is not None:
+                    rows.append(self._rewrite(row, root, days))
+                continue
+            table = {
+                PATH_STRIKES_OPTIONS: "quotes",
+                PATH_CORES: "cores",
+                PATH_IVRANK: "ivrank",
+                PATH_STRIKES: "strikes",
+                PATH_HIST_DAILIES: "dailies",
+            }[endpoint]
+            tpl = self._template(table, sym, clone)
+            if tpl is None:
+                continue
+            entry = self.tables[table][tpl]
+            if table in ("strikes", "dailies"):
+                rows.extend(self._rewrite(r, sym, days) for r in entry.values())
+            else:
+                rows.append(self._rewrite(entry, sym, days))
+        if endpoint == PATH_STRIKES and params.get("dte"):
+            rows = _filter_dte(rows, str(params["dte"]))
+        if endpoint == PATH_HIST_DAILIES:
+            rows = _filter_trade_dates(rows, str(params.get("tradeDate") or ""))
+            rows.sort(key=lambda r: str(r.get("tradeDate")))
+        return {"data": rows}
+
+
+def _filter_dte(rows: List[Dict[str, Any]], dte: str) -> List[Dict[str, Any]]:
+    try:
+        lo, hi = (int(x) for x in dte.split(",", 1))
+    except ValueError:
+        return rows
+    return [r for r in rows if r.get("dte") is None or lo <= int(r["dte"]) <= hi]
+
+
+def _filter_trade_dates(rows: List[Dict[str, Any]], window: str) -> List[Dict[str, Any]]:
+    if not window:
+        return rows
+    parts = window.split(",", 1)
+    lo = parts[0][:10]
+    hi = parts[1][:10] if len(parts) > 1 else lo
+    return [r for r in rows if lo <= str(r.get("tradeDate"))[:10] <= hi]
+
+
+# ---------------------------------------------------------------------------
+# requests hooks
+# ---------------------------------------------------------------------------
+
+
+@contextmanager
+def _hook_send(hook: Callable[..., Any]) -> Iterator[None]:
+    """Install hook(original_send, adapter, request, **kwargs) as HTTPAdapter.send; nests LIFO."""
+    from requests.adapters import HTTPAdapter
+
+    original = HTTPAdapter.send
+
+    def send(self: Any, request: Any, **kwargs: Any) -> Any:
+        return hook(original, self, request, **kwargs)
+
+    HTTPAdapter.send = send
+    try:
+        yield
+    finally:
+        HTTPAdapter.send = original
+
+
+def _query_params(url: str) -> Dict[str, str]:
+    return {k: v[-1] for k, v in parse_qs(urlparse(url).query).items()}
+
+
+@contextmanager
+def record_orats(bundle: FixtureBundle) -> Iterator[FixtureBundle]:
+    """
+    Capture successful ORATS responses made inside the block into `bundle` (token never stored).
+    Entered inside route_orats_to() it still sees the original ORATS URL.
+    """
+
+    def hook(original: Callable[..., Any], adapter: Any, request: Any, **kwargs: Any) -> Any:
+        url = request.url or ""
+        resp = original(adapter, request, **kwargs)
+        if url.startswith(_ORATS_ORIGIN) and resp.status_code == 200:
+            try:
+                bundle.add_response(urlparse(url).path, _query_params(url), json.loads(resp.content))
+            except Exception as e:
+                logger.warning("[ORATS_REPLAY] Could not record %s: %s", urlparse(url).path, e)
+        return resp
+
+    with _hook_send(hook):
+        yield bundle
+
+
+@contextmanager
+def route_orats_to(base_url: str) -> Iterator[None]:
+    """Send every ORATS request made inside the block to base_url (e.g. an OratsStubServer)."""
+    target = base_url.rstrip("/")
+
+    def hook(original: Callable[..., Any], adapter: Any, request: Any, **kwargs: Any) -> Any:
+        url = request.url or ""
+        if url.startswith(_ORATS_ORIGIN):
+            request.url = target + url[len(_ORATS_ORIGIN):]
+        return original(adapter, request, **kwargs)
+
+    with _hook_send(hook):
+        yield
+
+
+# ---------------------------------------------------------------------------
+# Stub server
+# ---------------------------------------------------------------------------
+
+
+class OratsStubServer:
+    """
+    Local HTTP server answering ORATS paths from a FixtureBundle.
+
+    latency_ms / jitter_ms delay each response (uniform jitter); error_rate is the chance
+    a request gets error_status instead of data. Use as a context manager or start()/stop().
+    """
+
+    def __init__(
+        self,
+        bundle: FixtureBundle,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        clone: bool = True,
+        seed: int = 0,
+    ) -> None:
+        self.bundle = bundle
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.clone = clone
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        if self._server is None:
+            raise RuntimeError("stub server not started")
+        return "http://127.0.0.1:%d" % self._server.server_address[1]
+
+    def _delay_and_fail(self) -> Tuple[float, bool]:
+        with self._lock:
+            jitter = self._rng.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0.0
+            fail = self.error_rate > 0 and self._rng.random() < self.error_rate
+        return max(0.0, self.latency_ms + jitter) / 1000.0, fail
+
+    def _count(self, endpoint: str, **deltas: int) -> None:
+        with self._lock:
+            agg = self._stats.setdefault(endpoint, {"requests": 0, "errors": 0, "rows": 0, "bytes": 0})
+            for k, v in deltas.items():
+                agg[k] += v
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            by_endpoint = {k: dict(v) for k, v in sorted(self._stats.items())}
+        return {
+            "requests": sum(v["requests"] for v in by_endpoint.values()),
+            "errors": sum(v["errors"] for v in by_endpoint.values()),
+            "by_endpoint": by_endpoint,
+        }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def handle(self, path: str, params: Dict[str, str]) -> Tuple[int, bytes]:
+        """Status and body for one request (also used directly by tests)."""
+        endpoint = match_endpoint(urlparse(path).path) or "unknown"
+        delay, fail = self._delay_and_fail()
+        if delay:
+            time.sleep(delay)
+        if fail:
+            self._count(endpoint, requests=1, errors=1)
+            return self.error_status, json.dumps({"error": "injected failure"}).encode("utf-8")
+        payload = self.bundle.respond(urlparse(path).path, params, clone=self.clone)
+        if payload is None:
+            self._count(endpoint, requests=1, errors=1)
+            return 404, json.dumps({"error": f"unsupported path {path}"}).encode("utf-8")
+        body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        self._count(endpoint, requests=1, rows=len(payload["data"]), bytes=len(body))
+        return 200, body
+
+    def start(self) -> "OratsStubServer":
+        stub = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802
+                status, body = stub.handle(self.path, _query_params(self.path))
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name="orats-stub", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "OratsStubServer":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+
+# ---------------------------------------------------------------------------
+# Synthetic bundle
+# ---------------------------------------------------------------------------
+
+
+def _norm_cdf(x: float) -> float:
+    return 0.5 * (1.0 + math.erf(x / math.sqrt(2.0)))
+
+
+def synthetic_tickers(n: int, prefix: str = "X") -> List[str]:
+    """n alphabetic tickers (XAAAA, XAAAB, ...) that are valid OCC roots."""
+    out = []
+    for i in range(n):
+        s = ""
+        for _ in range(4):
+            i, r = divmod(i, 26)
+            s = chr(65 + r) + s
+        out.append(prefix + s)
+    return out
+
+
+def synthetic_bundle(
+    tickers: Optional[List[str]] = None,
+    as_of: Optional[str] = None,
+    seed: int = 7,
+    history_days: int = 260,
+) -> FixtureBundle:
+    """
+    Deterministic bundle with plausible rows for every recorded endpoint: a quote and
+    IV rank per ticker, cores volume fields, weekday daily bars and a weekly put/call
+    chain (DTE 7-63, strikes 75%-110% of spot) with OCC-level quotes.
+    """
+    from app.core.orats.orats_opra import build_orats_option_symbol
+
+    tickers = [t.upper() for t in (tickers or synthetic_tickers(8))]
+    bundle = FixtureBundle(as_of=as_of)
+    day = date.fromisoformat(bundle.as_of[:10])
+    rng = random.Random(seed)
+    for ticker in tickers:
+        spot = round(rng.uniform(25.0, 400.0), 2)
+        volume = rng.randint(2_000_000, 40_000_000)
+        iv = rng.uniform(0.2, 0.6)
+        bundle.tables["quotes"][ticker] = {
+            "ticker": ticker, "stockPrice": spot, "bid": round(spot - 0.02, 2), "ask": round(spot + 0.02, 2),
+            "volume": volume, "quoteDate": bundle.as_of,
+        }
+        bundle.tables["ivrank"][ticker] = {"ticker": ticker, "ivRank1m": round(rng.uniform(20, 80), 1), "ivPct1m": round(rng.uniform(20, 80), 1)}
+        bundle.tables["cores"][ticker] = {
+            "ticker": ticker, "stkVolu": volume, "avgOptVolu20d": float(rng.randint(20_000, 500_000)),
+            "stockPrice": spot, "ivPctile1y": round(rng.uniform(10, 90), 1),
+        }
+        bars: Dict[str, Dict[str, Any]] = {}
+        px = spot
+        d = day
+        while len(bars) < history_days:
+            if d.weekday() < 5:
+                bars[d.isoformat()] = {
+                    "ticker": ticker, "tradeDate": d.isoformat(), "openPx": round(px, 2), "hiPx": round(px * 1.01, 2),
+                    "loPx": round(px * 0.99, 2), "clsPx": round(px, 2), "stockVolume": int(volume * rng.uniform(0.7, 1.3)),
+                }
+                px = max(1.0, px / (1 + rng.gauss(0.0003, 0.015)))
+            d -= timedelta(days=1)
+        bundle.tables["dailies"][ticker] = bars
+        chain: Dict[str, Dict[str, Any]] = {}
+        first_friday = day + timedelta(days=(4 - day.weekday()) % 7 or 7)
+        step = 1.0 if spot < 100 else 2.5 if spot < 250 else 5.0
+        for week in range(9):
+            expiry = first_friday + timedelta(weeks=week)
+            dte = (expiry - day).days
+            if dte < 7:
+                continue
+            t = dte / 365.0
+            vol_t = iv * t ** 0.5
+            k = round(spot * 0.75 / step) * step
+            while k <= spot * 1.10:
+                # Black-Scholes (r=0) delta and premium so chain selection sees realistic values
+                d1 = (math.log(spot / k) + 0.5 * vol_t * vol_t) / vol_t
+                n1, n2 = _norm_cdf(d1), _norm_cdf(d1 - vol_t)
+                call_px = spot * n1 - k * n2
+                for side in ("P", "C"):
+                    mid = round(max(0.05, call_px if side == "C" else call_px - spot + k), 2)
+                    delta = round(n1 if side == "C" else n1 - 1.0, 4)
+                    row = {
+                        "ticker": ticker, "expirDate": expiry.isoformat(), "dte": dte, "strike": k, "stockPrice": spot,
+                        "optionType": "Put" if side == "P" else "Call", "delta": delta, "smvVol": round(iv, 4),
+                    }
+                    chain[_strike_row_id(row)] = row
+                    occ = build_orats_option_symbol(ticker, expiry.isoformat(), side, k)
+                    spread = max(0.01, round(mid * 0.015, 2))
+                    bundle.tables["options"][occ] = {
+                        "ticker": ticker, "optionSymbol": occ, "expirDate": expiry.isoformat(), "strike": k,
+                        "stockPrice": spot, "bidPrice": round(max(0.01, mid - spread / 2), 2),
+                        "askPrice": round(mid + spread / 2, 2), "volume": rng.randint(50, 5_000),
+                        "openInt": rng.randint(500, 50_000), "delta": delta, "gamma": 0.02, "theta": -0.03,
+                        "vega": 0.1, "iv": round(iv, 4), "quoteDate": bundle.as_of,
+                    }
+                k = round(k + step, 2)
+        bundle.tables["strikes"][ticker] = chain
+    return bundle
+
+
+__all__ = [
+    "BUNDLE_VERSION",
+    "FixtureBundle",
+    "OratsStubServer",
+    "RECORDED_PATHS",
+    "latest_weekday",
+    "match_endpoint",
+    "record_orats",
+    "route_orats_to",
+    "synthetic_bundle",
+    "synthetic_tickers",
+]
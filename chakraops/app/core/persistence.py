@@ -26,6 +26,7 @@ from app.core.position_lifecycle import (
     validate_lifecycle_transition,
 )
 from app.db.database import get_db_path
+from app.db.migrations import Migration, ensure_schema
 from app.core.config.paths import DB_PATH
 
 import logging
@@ -136,319 +137,320 @@ def _ensure_candidate_daily_tracking_schema(cursor: sqlite3.Cursor) -> None:
             logger.debug(f"[MIGRATION] Could not add created_at: {e}")
 
 
+def _migrate_persistence_v1(cursor: sqlite3.Cursor) -> None:
+    """Baseline schema (pre-versioning): trades, portfolio, universe, alerts, evaluations, ledger, reports.
+
+    Idempotent so databases created before schema_version existed adopt it as v1.
+    """
+    # Create trades table (immutable ledger)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS trades (
+            id TEXT PRIMARY KEY,
+            symbol TEXT NOT NULL,
+            action TEXT NOT NULL,
+            strike REAL,
+            expiry TEXT,
+            contracts INTEGER NOT NULL,
+            premium REAL NOT NULL,
+            timestamp TEXT NOT NULL,
+            notes TEXT,
+            created_at TEXT NOT NULL
+        )
+    """)
+
+    # Create portfolio_snapshots table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS portfolio_snapshots (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            account_value REAL NOT NULL,
+            cash REAL NOT NULL,
+            brokerage TEXT DEFAULT 'Robinhood',
+            timestamp TEXT NOT NULL,
+            notes TEXT,
+            created_at TEXT NOT NULL
+        )
+    """)
+
+    # Add brokerage column if it doesn't exist (migration)
+    try:
+        cursor.execute("ALTER TABLE portfolio_snapshots ADD COLUMN brokerage TEXT DEFAULT 'Robinhood'")
+    except sqlite3.OperationalError:
+        pass  # Column already exists
+
+    # Backfill existing rows with 'Robinhood'
+    cursor.execute("""
+        UPDATE portfolio_snapshots SET brokerage = 'Robinhood' WHERE brokerage IS NULL
+    """)
+
+    # Create symbol_universe table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS symbol_universe (
+            symbol TEXT PRIMARY KEY,
+            enabled INTEGER DEFAULT 1,
+            notes TEXT,
+            created_at TEXT NOT NULL
+        )
+    """)
+
+    # Initialize default universe if empty
+    cursor.execute("SELECT COUNT(*) FROM symbol_universe")
+    count = cursor.fetchone()[0]
+    if count == 0:
+        default_symbols = [
+            ("AAPL", "Apple Inc."),
+            ("MSFT", "Microsoft Corporation"),
+            ("GOOGL", "Alphabet Inc."),
+            ("AMZN", "Amazon.com Inc."),
+            ("META", "Meta Platforms Inc."),
+            ("SPY", "SPDR S&P 500 ETF"),
+            ("QQQ", "Invesco QQQ Trust"),
+        ]
+        created_at = datetime.now(timezone.utc).isoformat()
+        for symbol, note in default_symbols:
+            cursor.execute("""
+                INSERT INTO symbol_universe (symbol, enabled, notes, created_at)
+                VALUES (?, 1, ?, ?)
+            """, (symbol, note, created_at))
+
+    # Ensure alerts table exists before applying migrations
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS alerts (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            message TEXT NOT NULL,
+            level TEXT NOT NULL,
+            status TEXT DEFAULT 'OPEN',
+            created_at TEXT NOT NULL
+        )
+    """)
+
+    # Update alerts table: add status column if it doesn't exist (legacy migration)
+    try:
+        cursor.execute("ALTER TABLE alerts ADD COLUMN status TEXT DEFAULT 'OPEN'")
+    except sqlite3.OperationalError:
+        # Column already exists or legacy schema without alerts table; safe to ignore
+        pass
+
+    # Migrate existing alerts to OPEN status
+    cursor.execute("""
+        UPDATE alerts SET status = 'OPEN' WHERE status IS NULL
+    """)
+
+    # Legacy csp_candidates table removed - using csp_evaluations instead (Phase 2B)
+
+    # Create assignment_profile table (Phase 1B)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS assignment_profile (
+            symbol TEXT PRIMARY KEY,
+            assignment_score INTEGER NOT NULL,
+            assignment_label TEXT NOT NULL,
+            operator_override INTEGER DEFAULT 0,
+            override_reason TEXT,
+            updated_at TEXT NOT NULL
+        )
+    """)
+
+    # Create indexes
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_trades_symbol ON trades(symbol)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_trades_timestamp ON trades(timestamp DESC)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_trades_action ON trades(action)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_alerts_status ON alerts(status)")
+    # Legacy csp_candidates index removed - using csp_evaluations instead
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_portfolio_timestamp ON portfolio_snapshots(timestamp DESC)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_portfolio_brokerage ON portfolio_snapshots(brokerage)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_universe_enabled ON symbol_universe(enabled)")
+
+    # Create assignment_profile table (Phase 1B) - must be before indexes
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS assignment_profile (
+            symbol TEXT PRIMARY KEY,
+            assignment_score INTEGER NOT NULL,
+            assignment_label TEXT NOT NULL,
+            operator_override INTEGER DEFAULT 0,
+            override_reason TEXT,
+            updated_at TEXT NOT NULL
+        )
+    """)
+
+    # Create symbol_cache table (Phase 1B.2) - for ThetaData symbol search
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS symbol_cache (
+            symbol TEXT PRIMARY KEY,
+            name TEXT,
+            exchange TEXT,
+            cached_at TEXT NOT NULL
+        )
+    """)
+
+    # Create indexes for assignment_profile and symbol_cache (after table creation)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_assignment_label ON assignment_profile(assignment_label)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_assignment_override ON assignment_profile(operator_override)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_symbol_cache_symbol ON symbol_cache(symbol)")
+
+    # Ensure candidate_daily_tracking schema is correct (migration)
+    _ensure_candidate_daily_tracking_schema(cursor)
+
+    # Create market_regimes table (Phase 2B)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS market_regimes (
+            snapshot_id TEXT PRIMARY KEY,
+            regime TEXT NOT NULL,
+            benchmark_symbol TEXT,
+            benchmark_return REAL,
+            computed_at TEXT NOT NULL,
+            created_at TEXT NOT NULL
+        )
+    """)
+
+    # Create index for regime lookups
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_regimes_computed_at ON market_regimes(computed_at DESC)")
+
+    # Create csp_evaluations table (Phase 2B Step 2)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS csp_evaluations (
+            snapshot_id TEXT NOT NULL,
+            symbol TEXT NOT NULL,
+            eligible INTEGER NOT NULL,
+            score INTEGER NOT NULL,
+            reasons_json TEXT,
+            features_json TEXT,
+            created_at TEXT NOT NULL,
+            PRIMARY KEY (snapshot_id, symbol)
+        )
+    """)
+
+    # Create indexes for csp_evaluations
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_csp_eval_snapshot ON csp_evaluations(snapshot_id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_csp_eval_eligible ON csp_evaluations(eligible, score DESC)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_csp_eval_symbol ON csp_evaluations(symbol)")
+
+    # Phase 4.3: trade_proposals table for execution readiness and human acknowledgment
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS trade_proposals (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            decision_ts TEXT NOT NULL,
+            symbol TEXT NOT NULL,
+            strategy_type TEXT NOT NULL,
+            proposal_json TEXT NOT NULL,
+            execution_status TEXT NOT NULL,
+            user_acknowledged INTEGER NOT NULL DEFAULT 0,
+            execution_notes TEXT DEFAULT '',
+            skipped INTEGER NOT NULL DEFAULT 0,
+            created_at TEXT NOT NULL,
+            updated_at TEXT NOT NULL
+        )
+    """)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_trade_proposals_decision_ts ON trade_proposals(decision_ts DESC)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_trade_proposals_symbol ON trade_proposals(symbol)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_trade_proposals_ack ON trade_proposals(user_acknowledged, skipped)")
+
+    # Phase 5.2: rejection analytics daily summary
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS rejection_daily_summary (
+            date TEXT PRIMARY KEY,
+            summary_json TEXT NOT NULL,
+            created_at TEXT NOT NULL
+        )
+    """)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_rejection_daily_date ON rejection_daily_summary(date DESC)")
+
+    # Phase 5.3: trust reports (daily and weekly)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS trust_reports (
+            report_type TEXT NOT NULL,
+            date TEXT NOT NULL,
+            report_json TEXT NOT NULL,
+            created_at TEXT NOT NULL,
+            PRIMARY KEY (report_type, date)
+        )
+    """)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_trust_reports_type_date ON trust_reports(report_type, date DESC)")
+
+    # Phase 6.1: config freeze state (single row: last run hash/snapshot for freeze guard)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS config_freeze_state (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            config_hash TEXT NOT NULL,
+            config_snapshot TEXT NOT NULL,
+            run_mode TEXT NOT NULL,
+            updated_at TEXT NOT NULL
+        )
+    """)
+
+    # Phase 6.2: daily run cycles (one row per cycle_id = YYYY-MM-DD)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS daily_run_cycles (
+            cycle_id TEXT PRIMARY KEY,
+            started_at TEXT NOT NULL,
+            completed_at TEXT,
+            phase TEXT NOT NULL,
+            updated_at TEXT NOT NULL
+        )
+    """)
+    cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_daily_run_cycles_cycle_id ON daily_run_cycles(cycle_id)")
+
+    # Phase 6.3: position_events (audit trail per position)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS position_events (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            position_id TEXT NOT NULL,
+            event_type TEXT NOT NULL,
+            event_time TEXT NOT NULL,
+            metadata TEXT NOT NULL,
+            created_at TEXT NOT NULL
+        )
+    """)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_position_events_position_id ON position_events(position_id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_position_events_event_time ON position_events(event_time DESC)")
+
+    # Phase 6.4: capital_ledger_entries (capital movement and outcome accounting)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS capital_ledger_entries (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            date TEXT NOT NULL,
+            position_id TEXT NOT NULL,
+            event_type TEXT NOT NULL,
+            cash_delta REAL NOT NULL,
+            notes TEXT,
+            created_at TEXT NOT NULL
+        )
+    """)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_capital_ledger_date ON capital_ledger_entries(date)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_capital_ledger_position ON capital_ledger_entries(position_id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_capital_ledger_event ON capital_ledger_entries(event_type)")
+
+    # Phase 6.5: decision_artifacts_meta (subset for UI read models)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS decision_artifacts_meta (
+            decision_ts TEXT PRIMARY KEY,
+            meta_json TEXT NOT NULL,
+            created_at TEXT NOT NULL
+        )
+    """)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_decision_artifacts_ts ON decision_artifacts_meta(decision_ts DESC)")
+
+
+# Versioned schema steps for this module's tables (see app.db.migrations). Append new versions; never edit old ones.
+PERSISTENCE_MIGRATIONS = (
+    Migration(1, "baseline", _migrate_persistence_v1),
+)
+
+
 def init_persistence_db() -> None:
-    """Initialize database schema for Phase 1A persistence.
-    
-    Creates tables:
-    - trades: Immutable trade ledger
-    - portfolio_snapshots: Manual account value snapshots
-    - Updates alerts table with status column
-    - Initializes all required tables
+    """Ensure the Phase 1A persistence schema (and market snapshot schema) is migrated.
+
+    Migrations run once per process per DB file (app.db.migrations); afterwards this is an
+    in-memory check, so read/write helpers keep calling it at the top without paying for
+    a schema pass on every call.
     """
-    db_path = get_db_path()
-    db_path.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(str(db_path))
-    cursor = conn.cursor()
-    
     try:
-        # Create trades table (immutable ledger)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS trades (
-                id TEXT PRIMARY KEY,
-                symbol TEXT NOT NULL,
-                action TEXT NOT NULL,
-                strike REAL,
-                expiry TEXT,
-                contracts INTEGER NOT NULL,
-                premium REAL NOT NULL,
-                timestamp TEXT NOT NULL,
-                notes TEXT,
-                created_at TEXT NOT NULL
-            )
-        """)
-        
-        # Create portfolio_snapshots table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS portfolio_snapshots (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                account_value REAL NOT NULL,
-                cash REAL NOT NULL,
-                brokerage TEXT DEFAULT 'Robinhood',
-                timestamp TEXT NOT NULL,
-                notes TEXT,
-                created_at TEXT NOT NULL
-            )
-        """)
-        
-        # Add brokerage column if it doesn't exist (migration)
-        try:
-            cursor.execute("ALTER TABLE portfolio_snapshots ADD COLUMN brokerage TEXT DEFAULT 'Robinhood'")
-        except sqlite3.OperationalError:
-            pass  # Column already exists
-        
-        # Backfill existing rows with 'Robinhood'
-        cursor.execute("""
-            UPDATE portfolio_snapshots SET brokerage = 'Robinhood' WHERE brokerage IS NULL
-        """)
-        
-        # Create symbol_universe table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS symbol_universe (
-                symbol TEXT PRIMARY KEY,
-                enabled INTEGER DEFAULT 1,
-                notes TEXT,
-                created_at TEXT NOT NULL
-            )
-        """)
-        
-        # Initialize default universe if empty
-        cursor.execute("SELECT COUNT(*) FROM symbol_universe")
-        count = cursor.fetchone()[0]
-        if count == 0:
-            default_symbols = [
-                ("AAPL", "Apple Inc."),
-                ("MSFT", "Microsoft Corporation"),
-                ("GOOGL", "Alphabet Inc."),
-                ("AMZN", "Amazon.com Inc."),
-                ("META", "Meta Platforms Inc."),
-                ("SPY", "SPDR S&P 500 ETF"),
-                ("QQQ", "Invesco QQQ Trust"),
-            ]
-            created_at = datetime.now(timezone.utc).isoformat()
-            for symbol, note in default_symbols:
-                cursor.execute("""
-                    INSERT INTO symbol_universe (symbol, enabled, notes, created_at)
-                    VALUES (?, 1, ?, ?)
-                """, (symbol, note, created_at))
-        
-        # Ensure alerts table exists before applying migrations
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS alerts (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                message TEXT NOT NULL,
-                level TEXT NOT NULL,
-                status TEXT DEFAULT 'OPEN',
-                created_at TEXT NOT NULL
-            )
-        """)
-        
-        # Update alerts table: add status column if it doesn't exist (legacy migration)
-        try:
-            cursor.execute("ALTER TABLE alerts ADD COLUMN status TEXT DEFAULT 'OPEN'")
-        except sqlite3.OperationalError:
-            # Column already exists or legacy schema without alerts table; safe to ignore
-            pass
-        
-        # Migrate existing alerts to OPEN status
-        cursor.execute("""
-            UPDATE alerts SET status = 'OPEN' WHERE status IS NULL
-        """)
-        
-        # Legacy csp_candidates table removed - using csp_evaluations instead (Phase 2B)
-        
-        # Create assignment_profile table (Phase 1B)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS assignment_profile (
-                symbol TEXT PRIMARY KEY,
-                assignment_score INTEGER NOT NULL,
-                assignment_label TEXT NOT NULL,
-                operator_override INTEGER DEFAULT 0,
-                override_reason TEXT,
-                updated_at TEXT NOT NULL
-            )
-        """)
-        
-        # Create indexes
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_trades_symbol ON trades(symbol)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_trades_timestamp ON trades(timestamp DESC)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_trades_action ON trades(action)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_alerts_status ON alerts(status)")
-        # Legacy csp_candidates index removed - using csp_evaluations instead
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_portfolio_timestamp ON portfolio_snapshots(timestamp DESC)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_portfolio_brokerage ON portfolio_snapshots(brokerage)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_universe_enabled ON symbol_universe(enabled)")
-        
-        # Create assignment_profile table (Phase 1B) - must be before indexes
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS assignment_profile (
-                symbol TEXT PRIMARY KEY,
-                assignment_score INTEGER NOT NULL,
-                assignment_label TEXT NOT NULL,
-                operator_override INTEGER DEFAULT 0,
-                override_reason TEXT,
-                updated_at TEXT NOT NULL
-            )
-        """)
-        
-        # Create symbol_cache table (Phase 1B.2) - for ThetaData symbol search
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS symbol_cache (
-                symbol TEXT PRIMARY KEY,
-                name TEXT,
-                exchange TEXT,
-                cached_at TEXT NOT NULL
-            )
-        """)
-        
-        # Create indexes for assignment_profile and symbol_cache (after table creation)
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_assignment_label ON assignment_profile(assignment_label)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_assignment_override ON assignment_profile(operator_override)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_symbol_cache_symbol ON symbol_cache(symbol)")
-        
-        # Ensure candidate_daily_tracking schema is correct (migration)
-        _ensure_candidate_daily_tracking_schema(cursor)
-        
-        # Create market_regimes table (Phase 2B)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS market_regimes (
-                snapshot_id TEXT PRIMARY KEY,
-                regime TEXT NOT NULL,
-                benchmark_symbol TEXT,
-                benchmark_return REAL,
-                computed_at TEXT NOT NULL,
-                created_at TEXT NOT NULL
-            )
-        """)
-        
-        # Create index for regime lookups
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_regimes_computed_at ON market_regimes(computed_at DESC)")
-        
-        # Create csp_evaluations table (Phase 2B Step 2)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS csp_evaluations (
-                snapshot_id TEXT NOT NULL,
-                symbol TEXT NOT NULL,
-                eligible INTEGER NOT NULL,
-                score INTEGER NOT NULL,
-                reasons_json TEXT,
-                features_json TEXT,
-                created_at TEXT NOT NULL,
-                PRIMARY KEY (snapshot_id, symbol)
-            )
-        """)
-        
-        # Create indexes for csp_evaluations
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_csp_eval_snapshot ON csp_evaluations(snapshot_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_csp_eval_eligible ON csp_evaluations(eligible, score DESC)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_csp_eval_symbol ON csp_evaluations(symbol)")
-        
-        # Phase 4.3: trade_proposals table for execution readiness and human acknowledgment
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS trade_proposals (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                decision_ts TEXT NOT NULL,
-                symbol TEXT NOT NULL,
-                strategy_type TEXT NOT NULL,
-                proposal_json TEXT NOT NULL,
-                execution_status TEXT NOT NULL,
-                user_acknowledged INTEGER NOT NULL DEFAULT 0,
-                execution_notes TEXT DEFAULT '',
-                skipped INTEGER NOT NULL DEFAULT 0,
-                created_at TEXT NOT NULL,
-                updated_at TEXT NOT NULL
-            )
-        """)
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_trade_proposals_decision_ts ON trade_proposals(decision_ts DESC)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_trade_proposals_symbol ON trade_proposals(symbol)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_trade_proposals_ack ON trade_proposals(user_acknowledged, skipped)")
-        
-        # Phase 5.2: rejection analytics daily summary
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS rejection_daily_summary (
-                date TEXT PRIMARY KEY,
-                summary_json TEXT NOT NULL,
-                created_at TEXT NOT NULL
-            )
-        """)
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_rejection_daily_date ON rejection_daily_summary(date DESC)")
-        
-        # Phase 5.3: trust reports (daily and weekly)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS trust_reports (
-                report_type TEXT NOT NULL,
-                date TEXT NOT NULL,
-                report_json TEXT NOT NULL,
-                created_at TEXT NOT NULL,
-                PRIMARY KEY (report_type, date)
-            )
-        """)
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_trust_reports_type_date ON trust_reports(report_type, date DESC)")
-        
-        # Phase 6.1: config freeze state (single row: last run hash/snapshot for freeze guard)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS config_freeze_state (
-                id INTEGER PRIMARY KEY CHECK (id = 1),
-                config_hash TEXT NOT NULL,
-                config_snapshot TEXT NOT NULL,
-                run_mode TEXT NOT NULL,
-                updated_at TEXT NOT NULL
-            )
-        """)
-        
-        # Phase 6.2: daily run cycles (one row per cycle_id = YYYY-MM-DD)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS daily_run_cycles (
-                cycle_id TEXT PRIMARY KEY,
-                started_at TEXT NOT NULL,
-                completed_at TEXT,
-                phase TEXT NOT NULL,
-                updated_at TEXT NOT NULL
-            )
-        """)
-        cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_daily_run_cycles_cycle_id ON daily_run_cycles(cycle_id)")
-        
-        # Phase 6.3: position_events (audit trail per position)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS position_events (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                position_id TEXT NOT NULL,
-                event_type TEXT NOT NULL,
-                event_time TEXT NOT NULL,
-                metadata TEXT NOT NULL,
-                created_at TEXT NOT NULL
-            )
-        """)
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_position_events_position_id ON position_events(position_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_position_events_event_time ON position_events(event_time DESC)")
-        
-        # Phase 6.4: capital_ledger_entries (capital movement and outcome accounting)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS capital_ledger_entries (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                date TEXT NOT NULL,
-                position_id TEXT NOT NULL,
-                event_type TEXT NOT NULL,
-                cash_delta REAL NOT NULL,
-                notes TEXT,
-                created_at TEXT NOT NULL
-            )
-        """)
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_capital_ledger_date ON capital_ledger_entries(date)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_capital_ledger_position ON capital_ledger_entries(position_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_capital_ledger_event ON capital_ledger_entries(event_type)")
-        
-        # Phase 6.5: decision_artifacts_meta (subset for UI read models)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS decision_artifacts_meta (
-                decision_ts TEXT PRIMARY KEY,
-                meta_json TEXT NOT NULL,
-                created_at TEXT NOT NULL
-            )
-        """)
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_decision_artifacts_ts ON decision_artifacts_meta(decision_ts DESC)")
-        
-        conn.commit()
+        ensure_schema(get_db_path(), "persistence", PERSISTENCE_MIGRATIONS)
     except Exception as e:
         # Log clear error if schema init fails
-        import logging
-        logger = logging.getLogger(__name__)
         logger.error(f"Failed to initialize persistence database: {e}")
         raise
-    finally:
-        conn.close()
-    
-    # Initialize market snapshot schema (Phase 2A) AFTER closing persistence connection
-    # This avoids concurrent writes to the same SQLite file on Windows.
+
+    # Market snapshot schema (Phase 2A) runs in its own transaction after persistence's,
+    # avoiding concurrent writes to the same SQLite file on Windows.
     from app.core.market_snapshot import init_snapshot_schema
     init_snapshot_schema()
 
@@ -2667,157 +2669,20 @@ def get_trade_proposal_by_decision_ts(decision_ts: str) -> Optional[Dict[str, An
 
 
 def initialize_schema() -> None:
-    """Initialize all required SQLite tables on startup.
-    
-    This function ensures all tables exist with correct schema before any
-    SELECT/INSERT operations. Called automatically on module import.
-    
-    Creates tables:
-    - market_snapshots: Snapshot metadata
-    - market_snapshot_data: Per-symbol snapshot data
-    - symbol_universe: Enabled/disabled symbols
-    - market_regimes: Market regime tracking
-    - csp_evaluations: CSP candidate evaluation results
-    - alerts: Alert lifecycle management
+    """Migrate the canonical database on startup.
+
+    Called once on module import so the first SELECT/INSERT finds every table. Applies
+    the versioned persistence and market snapshot migrations (app.db.migrations) to
+    DB_PATH; later init_persistence_db() calls for the same file are in-memory checks.
     """
-    db_path = DB_PATH
-    db_path.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(str(db_path))
-    cursor = conn.cursor()
-    
     try:
-        # market_snapshots (Phase 2A)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS market_snapshots (
-                snapshot_id TEXT PRIMARY KEY,
-                snapshot_timestamp_et TEXT NOT NULL,
-                provider TEXT NOT NULL DEFAULT 'snapshot',
-                symbol_count INTEGER NOT NULL,
-                data_age_minutes REAL NOT NULL,
-                is_frozen INTEGER NOT NULL DEFAULT 1,
-                created_at TEXT NOT NULL
-            )
-        """)
-        
-        # market_snapshot_data (Phase 2A)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS market_snapshot_data (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                snapshot_id TEXT NOT NULL,
-                symbol TEXT NOT NULL,
-                data_json TEXT,
-                has_data INTEGER NOT NULL DEFAULT 0,
-                created_at TEXT NOT NULL,
-                UNIQUE(snapshot_id, symbol)
-            )
-        """)
-        
-        # symbol_universe (Phase 1A.1)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS symbol_universe (
-                symbol TEXT PRIMARY KEY,
-                enabled INTEGER DEFAULT 1,
-                notes TEXT,
-                created_at TEXT NOT NULL
-            )
-        """)
-        
-        # market_regimes (Phase 2B Step 1)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS market_regimes (
-                snapshot_id TEXT PRIMARY KEY,
-                regime TEXT NOT NULL,
-                benchmark_symbol TEXT,
-                benchmark_return REAL,
-                computed_at TEXT NOT NULL,
-                created_at TEXT NOT NULL
-            )
-        """)
-        
-        # csp_evaluations (Phase 2B Step 2)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS csp_evaluations (
-                snapshot_id TEXT NOT NULL,
-                symbol TEXT NOT NULL,
-                eligible INTEGER NOT NULL,
-                score INTEGER NOT NULL,
-                reasons_json TEXT,
-                features_json TEXT,
-                created_at TEXT NOT NULL,
-                PRIMARY KEY (snapshot_id, symbol)
-            )
-        """)
-        
-        # alerts (Phase 1A.1) - ensure it has status column
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS alerts (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                message TEXT NOT NULL,
-                level TEXT NOT NULL,
-                status TEXT DEFAULT 'OPEN',
-                created_at TEXT NOT NULL
-            )
-        """)
-        
-        # Add status column if it doesn't exist (migration)
-        try:
-            cursor.execute("ALTER TABLE alerts ADD COLUMN status TEXT DEFAULT 'OPEN'")
-        except sqlite3.OperationalError:
-            pass  # Column already exists
-        
-        # Migrate existing alerts to OPEN status
-        cursor.execute("""
-            UPDATE alerts SET status = 'OPEN' WHERE status IS NULL
-        """)
-        
-        # Phase 4.3: trade_proposals (execution readiness and human acknowledgment)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS trade_proposals (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                decision_ts TEXT NOT NULL,
-                symbol TEXT NOT NULL,
-                strategy_type TEXT NOT NULL,
-                proposal_json TEXT NOT NULL,
-                execution_status TEXT NOT NULL,
-                user_acknowledged INTEGER NOT NULL DEFAULT 0,
-                execution_notes TEXT DEFAULT '',
-                skipped INTEGER NOT NULL DEFAULT 0,
-                created_at TEXT NOT NULL,
-                updated_at TEXT NOT NULL
-            )
-        """)
-        
-        # Create indexes
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_snapshot_timestamp ON market_snapshots(snapshot_timestamp_et DESC)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_snapshot_data_symbol ON market_snapshot_data(symbol)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_snapshot_data_snapshot ON market_snapshot_data(snapshot_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_universe_enabled ON symbol_universe(enabled)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_regimes_computed_at ON market_regimes(computed_at DESC)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_csp_eval_snapshot ON csp_evaluations(snapshot_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_csp_eval_eligible ON csp_evaluations(eligible, score DESC)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_csp_eval_symbol ON csp_evaluations(symbol)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_alerts_status ON alerts(status)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_trade_proposals_decision_ts ON trade_proposals(decision_ts DESC)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_trade_proposals_symbol ON trade_proposals(symbol)")
-        
-        # Phase 5.2: rejection_daily_summary
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS rejection_daily_summary (
-                date TEXT PRIMARY KEY,
-                summary_json TEXT NOT NULL,
-                created_at TEXT NOT NULL
-            )
-        """)
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_rejection_daily_date ON rejection_daily_summary(date DESC)")
-        
-        conn.commit()
+        ensure_schema(DB_PATH, "persistence", PERSISTENCE_MIGRATIONS)
+        from app.core.market_snapshot import SNAPSHOT_MIGRATIONS
+        ensure_schema(DB_PATH, "market_snapshot", SNAPSHOT_MIGRATIONS)
         logger.info("[DB INIT] Schema initialization complete")
-        logger.info("[DB INIT] csp_evaluations schema verified")
     except Exception as e:
         logger.error(f"[DB INIT] Failed to initialize schema: {e}")
         raise
-    finally:
-        conn.close()
 
 
 # Initialize schema on module import (guarded to run once)
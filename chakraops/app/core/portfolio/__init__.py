@@ -14,6 +14,13 @@ from app.core.portfolio.assignment_stress_simulator import (
     simulate_assignment_stress,
     simulate_assignment_stress_dynamic,
 )
+from app.core.portfolio.stress_grid import StressGridResult, build_shock_grid, simulate_stress_grid
+from app.core.portfolio.monte_carlo_risk import (
+    MonteCarloRiskConfig,
+    MonteCarloRiskResult,
+    load_symbol_vols,
+    simulate_assignment_risk_mc,
+)
 
 __all__ = [
     "ExposureItem",
@@ -34,4 +41,11 @@ __all__ = [
     "format_stress_summary",
     "simulate_assignment_stress_dynamic",
     "format_stress_summary_dynamic",
+    "StressGridResult",
+    "build_shock_grid",
+    "simulate_stress_grid",
+    "MonteCarloRiskConfig",
+    "MonteCarloRiskResult",
+    "load_symbol_vols",
+    "simulate_assignment_risk_mc",
 ]
@@ -9,10 +9,11 @@ Unknown symbol -> cluster="UNKNOWN", sector="UNKNOWN".
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any, Dict, Optional, Union
 
+from app.core.config.registry import get_config, register_config
+
 # Pragmatic starter set — editable, additive
 DEFAULT_CLUSTER_GROUPS: Dict[str, list[str]] = {
     "MEGA_CAP_TECH": ["AAPL", "MSFT", "NVDA", "AMZN", "GOOGL", "META"],
@@ -84,24 +85,7 @@ def get_symbol_tags(
     return {"cluster": "UNKNOWN", "sector": "UNKNOWN", "source": "UNKNOWN"}
 
 
-def load_cluster_map(path: Union[str, Path]) -> Dict[str, Dict[str, str]]:
-    """
-    Load cluster map from JSON file.
-
-    Args:
-        path: Path to artifacts/config/cluster_map.json (or similar).
-
-    Returns:
-        Dict symbol -> {"cluster": str, "sector": str}. Empty dict if file missing.
-    """
-    p = Path(path)
-    if not p.exists():
-        return {}
-    try:
-        with open(p, encoding="utf-8") as f:
-            data = json.load(f)
-    except (OSError, json.JSONDecodeError):
-        return {}
+def _normalize_cluster_map(data: Any) -> Dict[str, Dict[str, str]]:
     if not isinstance(data, dict):
         return {}
     out: Dict[str, Dict[str, str]] = {}
@@ -115,3 +99,20 @@ def load_cluster_map(path: Union[str, Path]) -> Dict[str, Dict[str, str]]:
                     "sector": str(sector) if sector is not None else "UNKNOWN",
                 }
     return out
+
+
+register_config("cluster_map", validate=_normalize_cluster_map, fallback=lambda e: {})
+
+
+def load_cluster_map(path: Union[str, Path]) -> Dict[str, Dict[str, str]]:
+    """
+    Load cluster map from JSON file.
+
+    Args:
+        path: Path to artifacts/config/cluster_map.json (or similar).
+
+    Returns:
+        Dict symbol -> {"cluster": str, "sector": str}. Empty dict if file missing.
+        Parsed once per file version via the config registry.
+    """
+    return get_config("cluster_map", Path(path)).mutable()
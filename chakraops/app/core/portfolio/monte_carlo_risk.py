@@ -0,0 +1,616 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""
+Phase 8.3d – Monte Carlo Assignment Risk (Read-Only Risk Modeling).
+
+Complements the deterministic shocks of Phase 8.3b/8.3c with a path simulation over
+each position's actual DTE. Per symbol, log prices follow GBM with optional Merton
+jumps; a one-factor model (market_correlation) ties symbols together:
+
+    log(S_T / S_0) = (drift - sigma^2/2 - lambda*kappa) * T + sigma * W_T + J_T
+
+Terminal prices are evaluated per position (CSP assignment at S_T <= strike, CC
+shares marked to min(S_T, call strike)) and aggregated per path into assignment
+capital and NAV shrink; VaR/CVaR are reported on those distributions.
+
+Volatility per symbol comes from the latest decision artifact: an explicit IV field
+when present, else annualized ATR% (atr_pct * sqrt(252)), else default_iv.
+
+Paths run in fixed-size chunks on one long-lived process pool shared by every call
+(sized by MC_RISK_POOL_WORKERS, default cpu count; shut down at exit); inputs live in
+one shared memory block. Chunk k always draws from SeedSequence(seed).spawn(n_chunks)[k], so
+results depend only on (inputs, config), never on the worker count.
+Read-only. No trading logic mutation.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import math
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.core.portfolio.assignment_stress_simulator import (
+    SURVIVAL_OK_BUFFER_PCT,
+    SURVIVAL_TIGHT_BUFFER_PCT,
+    _get_spot,
+    _position_mode,
+)
+from app.core.portfolio.portfolio_snapshot import _parse_date
+
+logger = logging.getLogger(__name__)
+
+TRADING_DAYS_PER_YEAR = 252
+CALENDAR_DAYS_PER_YEAR = 365.0
+# Sanity clamp for per-symbol annualized vol (5% .. 300%)
+MIN_SYMBOL_VOL = 0.05
+MAX_SYMBOL_VOL = 3.0
+# Explicit IV keys looked up in artifact stock snapshot / symbol row (first hit wins)
+IV_FIELDS = ("iv", "implied_volatility", "atm_iv", "iv30")
+# Size of the shared simulation pool (per-call max_workers caps chunks in flight, not the pool)
+MC_RISK_POOL_WORKERS = max(1, int(os.getenv("MC_RISK_POOL_WORKERS", "0")) or (os.cpu_count() or 1))
+
+# Columns of the packed per-position input matrix
+_COL_SYMBOL, _COL_HORIZON, _COL_SPOT, _COL_STRIKE, _COL_SHARES, _COL_IS_CSP = range(6)
+_N_POS_COLS = 6
+
+
+@dataclass(frozen=True)
+class MonteCarloRiskConfig:
+    """Simulation knobs. jump_intensity is expected jumps per year (0 = pure GBM)."""
+
+    n_paths: int = 20_000
+    seed: int = 42
+    chunk_size: int = 5_000
+    max_workers: Optional[int] = None  # None = min(cpu, chunks); <=1 runs inline
+    drift: float = 0.0
+    market_correlation: float = 0.5
+    jump_intensity: float = 0.0
+    jump_mean: float = -0.05
+    jump_std: float = 0.10
+    default_iv: float = 0.30
+    confidence_levels: Tuple[float, ...] = (0.95, 0.99)
+
+
+@dataclass(frozen=True)
+class MonteCarloRiskResult:
+    """Distribution summary of assignment capital and NAV shrink at each position's expiry."""
+
+    n_paths: int
+    seed: int
+    horizons_days: List[int]
+    starting_equity: Optional[float]
+    expected_assignments: float
+    expected_assignment_capital: float
+    prob_any_assignment: float
+    prob_capital_shortfall: Optional[float]
+    assignment_capital_var: Dict[str, float]
+    assignment_capital_cvar: Dict[str, float]
+    expected_nav_shrink: float
+    nav_shrink_var: Dict[str, float]
+    nav_shrink_cvar: Dict[str, float]
+    survival_status: str
+    by_position: List[Dict[str, Any]]
+    symbol_vols: Dict[str, Dict[str, Any]]
+    positions_evaluated: int = 0
+    chunks: int = 0
+    workers: int = 1
+    elapsed_ms: float = 0.0
+    warnings: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "n_paths": self.n_paths,
+            "seed": self.seed,
+            "horizons_days": list(self.horizons_days),
+            "starting_equity": self.starting_equity,
+            "expected_assignments": self.expected_assignments,
+            "expected_assignment_capital": self.expected_assignment_capital,
+            "prob_any_assignment": self.prob_any_assignment,
+            "prob_capital_shortfall": self.prob_capital_shortfall,
+            "assignment_capital_var": dict(self.assignment_capital_var),
+            "assignment_capital_cvar": dict(self.assignment_capital_cvar),
+            "expected_nav_shrink": self.expected_nav_shrink,
+            "nav_shrink_var": dict(self.nav_shrink_var),
+            "nav_shrink_cvar": dict(self.nav_shrink_cvar),
+            "survival_status": self.survival_status,
+            "by_position": [dict(p) for p in self.by_position],
+            "symbol_vols": {s: dict(v) for s, v in self.symbol_vols.items()},
+            "positions_evaluated": self.positions_evaluated,
+            "chunks": self.chunks,
+            "workers": self.workers,
+            "elapsed_ms": self.elapsed_ms,
+            "warnings": list(self.warnings),
+        }
+
+
+# ---------------------------------------------------------------------------
+# Volatility seeding from the decision artifact
+# ---------------------------------------------------------------------------
+
+
+def _as_vol(value: Any) -> Optional[float]:
+    """Annualized vol as a fraction; values > 3 are treated as percent (e.g. 32.5 -> 0.325)."""
+    try:
+        v = float(value)
+    except (TypeError, ValueError):
+        return None
+    if not math.isfinite(v) or v <= 0:
+        return None
+    if v > MAX_SYMBOL_VOL:
+        v = v / 100.0
+    return min(MAX_SYMBOL_VOL, max(MIN_SYMBOL_VOL, v))
+
+
+def load_symbol_vols(artifact: Any = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Per-symbol annualized vol from the latest decision artifact (v2).
+
+    Returns {symbol: {"sigma": float, "source": "IV"|"ATR", "spot": float|None}}.
+    Symbols without IV or ATR% are omitted (caller falls back to default_iv).
+    """
+    if artifact is None:
+        try:
+            from app.core.eval.evaluation_store_v2 import get_evaluation_store_v2
+
+            artifact = get_evaluation_store_v2().get_latest()
+        except Exception as e:
+            logger.warning("[MC_RISK] Could not load decision artifact: %s", e)
+            return {}
+    if artifact is None:
+        return {}
+
+    out: Dict[str, Dict[str, Any]] = {}
+    diagnostics = getattr(artifact, "diagnostics_by_symbol", None) or {}
+    for row in getattr(artifact, "symbols", None) or []:
+        sym = (getattr(row, "symbol", None) or "").strip().upper()
+        if not sym:
+            continue
+        diag = diagnostics.get(sym) or diagnostics.get(getattr(row, "symbol", ""))
+        stock = (getattr(diag, "stock", None) or {}) if diag is not None else {}
+        technicals = (getattr(diag, "technicals", None) or {}) if diag is not None else {}
+
+        sigma: Optional[float] = None
+        source = None
+        for k in IV_FIELDS:
+            sigma = _as_vol(stock.get(k)) or _as_vol(getattr(row, k, None))
+            if sigma is not None:
+                source = "IV"
+                break
+        if sigma is None:
+            atr_pct = technicals.get("atr_pct")
+            if atr_pct is not None:
+                try:
+                    sigma = _as_vol(float(atr_pct) * math.sqrt(TRADING_DAYS_PER_YEAR))
+                except (TypeError, ValueError):
+                    sigma = None
+                source = "ATR" if sigma is not None else None
+        if sigma is None:
+            continue
+        spot = getattr(row, "price", None) or getattr(row, "underlying_price", None) or stock.get("price")
+        out[sym] = {"sigma": sigma, "source": source, "spot": float(spot) if spot else None}
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Shared-memory inputs and chunk worker
+# ---------------------------------------------------------------------------
+
+
+def _pack_shared(arrays: Dict[str, np.ndarray]) -> Tuple[shared_memory.SharedMemory, Dict[str, Tuple[int, Tuple[int, ...]]]]:
+    """Copy float64 arrays into one shared block; returns (shm, layout {name: (offset, shape)})."""
+    layout: Dict[str, Tuple[int, Tuple[int, ...]]] = {}
+    offset = 0
+    for name, arr in arrays.items():
+        layout[name] = (offset, tuple(arr.shape))
+        offset += int(arr.size)
+    shm = shared_memory.SharedMemory(create=True, size=max(8, offset * 8))
+    buf = np.ndarray((offset,), dtype=np.float64, buffer=shm.buf)
+    for name, arr in arrays.items():
+        off, shape = layout[name]
+        buf[off: off + arr.size] = np.asarray(arr, dtype=np.float64).ravel()
+    return shm, layout
+
+
+def _views(buf: Any, layout: Dict[str, Tuple[int, Tuple[int, ...]]]) -> Dict[str, np.ndarray]:
+    total = sum(int(np.prod(shape)) for _, shape in layout.values())
+    flat = np.ndarray((total,), dtype=np.float64, buffer=buf)
+    return {
+        name: flat[off: off + int(np.prod(shape))].reshape(shape)
+        for name, (off, shape) in layout.items()
+    }
+
+
+def _simulate_chunk(
+    shm_name: str,
+    layout: Dict[str, Tuple[int, Tuple[int, ...]]],
+    params: Dict[str, float],
+    seed_seq: np.random.SeedSequence,
+    n_paths: int,
+) -> Dict[str, np.ndarray]:
+    """Worker: attach to shared inputs, simulate n_paths, return per-path aggregates."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        return _simulate_paths(_views(shm.buf, layout), params, seed_seq, n_paths)
+    finally:
+        shm.close()
+
+
+def _simulate_paths(
+    inputs: Dict[str, np.ndarray],
+    params: Dict[str, float],
+    seed_seq: np.random.SeedSequence,
+    n_paths: int,
+) -> Dict[str, np.ndarray]:
+    rng = np.random.default_rng(seed_seq)
+    sigma = inputs["sigma"]  # (S,)
+    dt = inputs["dt"]  # (K,) year fractions between consecutive horizons
+    pos = inputs["positions"]  # (N, _N_POS_COLS)
+    cc_strike = inputs["cc_strike"]  # (N,) NaN when uncapped
+    n_sym, n_int = sigma.size, dt.size
+
+    rho = params["market_correlation"]
+    z = math.sqrt(rho) * rng.standard_normal((n_paths, 1, n_int))
+    z = z + math.sqrt(1.0 - rho) * rng.standard_normal((n_paths, n_sym, n_int))
+    w = np.cumsum(z * np.sqrt(dt), axis=2)  # (P, S, K) Brownian value at each horizon
+    t = np.cumsum(dt)
+
+    lam = params["jump_intensity"]
+    mu_j, sd_j = params["jump_mean"], params["jump_std"]
+    kappa = math.exp(mu_j + 0.5 * sd_j * sd_j) - 1.0
+    log_ret = ((params["drift"] - 0.5 * sigma * sigma - lam * kappa)[:, None] * t[None, :])[None, :, :]
+    log_ret = log_ret + sigma[None, :, None] * w
+    if lam > 0:
+        n_jumps = rng.poisson(lam * dt, size=(n_paths, n_sym, n_int)).astype(np.float64)
+        jumps = n_jumps * mu_j + np.sqrt(n_jumps) * sd_j * rng.standard_normal((n_paths, n_sym, n_int))
+        log_ret = log_ret + np.cumsum(jumps, axis=2)
+
+    sym_idx = pos[:, _COL_SYMBOL].astype(np.intp)
+    hor_idx = pos[:, _COL_HORIZON].astype(np.intp)
+    spot = pos[:, _COL_SPOT]
+    strike = pos[:, _COL_STRIKE]
+    shares = pos[:, _COL_SHARES]
+    is_csp = pos[:, _COL_IS_CSP] > 0.5
+
+    s_t = spot[None, :] * np.exp(log_ret[:, sym_idx, hor_idx])  # (P, N)
+    assigned = is_csp[None, :] & (s_t <= strike[None, :])
+    capital = (assigned * (strike * shares)[None, :]).sum(axis=1)
+    contracts = (assigned * (shares / 100.0)[None, :]).sum(axis=1)
+    csp_loss = np.where(is_csp[None, :], np.maximum(strike[None, :] - s_t, 0.0) * shares[None, :], 0.0).sum(axis=1)
+    capped = np.where(np.isnan(cc_strike)[None, :], s_t, np.minimum(s_t, cc_strike[None, :]))
+    cc_loss = np.where(is_csp[None, :], 0.0, (spot[None, :] - capped) * shares[None, :]).sum(axis=1)
+    called = ~is_csp[None, :] & ~np.isnan(cc_strike)[None, :] & (s_t >= cc_strike[None, :])
+    return {
+        "assignment_capital": capital,
+        "assigned_contracts": contracts,
+        "nav_shrink": csp_loss + cc_loss,
+        "position_hits": (assigned | called).sum(axis=0).astype(np.float64),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Orchestration
+# ---------------------------------------------------------------------------
+
+
+def _starting_equity(portfolio_snapshot: Dict[str, Any]) -> Optional[float]:
+    for k in ("portfolio_equity_usd", "equity_usd"):
+        v = portfolio_snapshot.get(k)
+        if v is not None:
+            try:
+                f = float(v)
+                if f > 0:
+                    return f
+            except (TypeError, ValueError):
+                pass
+    return None
+
+
+def _position_dte(pos: Dict[str, Any], today: date) -> Optional[int]:
+    """Explicit numeric dte first, else expiration/expiry date (same rule as portfolio snapshot)."""
+    raw = pos.get("dte")
+    if raw is not None:
+        try:
+            d = int(float(raw))
+            if d >= 0:
+                return d
+        except (TypeError, ValueError):
+            pass
+    exp = _parse_date(pos.get("expiration") or pos.get("expiry"))
+    if exp is None:
+        return None
+    return max(0, (exp - today).days)
+
+
+def _tail(values: np.ndarray, levels: Tuple[float, ...]) -> Tuple[Dict[str, float], Dict[str, float]]:
+    """VaR (quantile) and CVaR (mean beyond VaR) of a loss-like distribution per confidence level."""
+    var: Dict[str, float] = {}
+    cvar: Dict[str, float] = {}
+    for lvl in levels:
+        key = "%g" % (lvl * 100)
+        if values.size == 0:
+            var[key] = cvar[key] = 0.0
+            continue
+        q = float(np.quantile(values, lvl))
+        var[key] = q
+        cvar[key] = float(values[values >= q].mean())
+    return var, cvar
+
+
+def _resolve_workers(config: MonteCarloRiskConfig, n_chunks: int) -> int:
+    if config.max_workers is not None:
+        return max(1, min(int(config.max_workers), MC_RISK_POOL_WORKERS, n_chunks))
+    return max(1, min(MC_RISK_POOL_WORKERS, n_chunks))
+
+
+_POOL: Optional[ProcessPoolExecutor] = None
+_POOL_LOCK = threading.Lock()
+
+
+def _risk_pool() -> ProcessPoolExecutor:
+    """The shared simulation pool, started on first use (workers spawn lazily per submit)."""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = ProcessPoolExecutor(max_workers=MC_RISK_POOL_WORKERS)
+        return _POOL
+
+
+def shutdown_risk_pool(wait_for_workers: bool = True) -> None:
+    """Stop the shared pool; the next parallel simulation starts a fresh one."""
+    global _POOL
+    with _POOL_LOCK:
+        pool, _POOL = _POOL, None
+    if pool is not None:
+        pool.shutdown(wait=wait_for_workers, cancel_futures=True)
+
+
+atexit.register(shutdown_risk_pool, False)
+
+
+def _run_chunks_on_pool(
+    shm_name: str,
+    layout: Dict[str, Tuple[int, Tuple[int, ...]]],
+    params: Dict[str, float],
+    seeds: List[np.random.SeedSequence],
+    sizes: List[int],
+    workers: int,
+) -> List[Dict[str, np.ndarray]]:
+    """Simulate every chunk on the shared pool with at most `workers` chunks in flight (results in chunk order)."""
+    pool = _risk_pool()
+    results: List[Optional[Dict[str, np.ndarray]]] = [None] * len(sizes)
+    pending: Dict[Future, int] = {}
+    next_chunk = 0
+    try:
+        while next_chunk < len(sizes) or pending:
+            while next_chunk < len(sizes) and len(pending) < workers:
+                fut = pool.submit(_simulate_chunk, shm_name, layout, params, seeds[next_chunk], sizes[next_chunk])
+                pending[fut] = next_chunk
+                next_chunk += 1
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                results[pending.pop(fut)] = fut.result()
+    except BrokenProcessPool:
+        # A worker died (OOM, kill): drop the pool so the next call starts a fresh one
+        shutdown_risk_pool(wait_for_workers=False)
+        raise
+    finally:
+        for fut in pending:
+            fut.cancel()
+    return results  # type: ignore[return-value]
+
+
+def simulate_assignment_risk_mc(
+    portfolio_snapshot: Dict[str, Any],
+    open_positions: List[Dict[str, Any]],
+    symbol_vols: Optional[Dict[str, Any]] = None,
+    config: Optional[MonteCarloRiskConfig] = None,
+    as_of: Optional[date] = None,
+) -> MonteCarloRiskResult:
+    """
+    Phase 8.3d: Monte Carlo assignment capital / NAV shrink over each position's DTE.
+
+    Args:
+        portfolio_snapshot: Snapshot with portfolio_equity_usd or equity_usd (user-supplied).
+        open_positions: Position dicts (mode, symbol, strike, contracts, spot, dte|expiration).
+        symbol_vols: {symbol: sigma | {"sigma", "spot"}}; None loads from the latest artifact.
+        config: MonteCarloRiskConfig (paths, seed, jumps, workers).
+        as_of: Date for DTE from expiration (default: today UTC).
+    """
+    started = time.perf_counter()
+    cfg = config or MonteCarloRiskConfig()
+    if cfg.n_paths <= 0 or cfg.chunk_size <= 0:
+        raise ValueError("n_paths and chunk_size must be positive")
+    if not 0.0 <= cfg.market_correlation <= 1.0:
+        raise ValueError("market_correlation must be in [0, 1]")
+    today = as_of or datetime.now(timezone.utc).date()
+    warnings: List[str] = []
+    starting_equity = _starting_equity(portfolio_snapshot)
+
+    vols_raw = load_symbol_vols() if symbol_vols is None else symbol_vols
+    vols: Dict[str, Dict[str, Any]] = {}
+    for sym, v in vols_raw.items():
+        entry = dict(v) if isinstance(v, dict) else {"sigma": v, "source": "INPUT"}
+        entry.setdefault("source", "INPUT")
+        sigma = _as_vol(entry.get("sigma"))
+        if sigma is not None:
+            entry["sigma"] = sigma
+            vols[str(sym).strip().upper()] = entry
+
+    symbols: List[str] = []
+    sym_sigma: List[float] = []
+    sym_index: Dict[str, int] = {}
+    rows: List[Tuple[int, int, float, float, float, float, float]] = []  # sym, dte, spot, strike, shares, is_csp, cc_strike
+    labels: List[Dict[str, Any]] = []
+    used_vols: Dict[str, Dict[str, Any]] = {}
+
+    for pos in open_positions:
+        label = pos.get("symbol") or pos.get("position_id") or "?"
+        sym = (pos.get("symbol") or "").strip().upper()
+        mode = _position_mode(pos)
+        contracts = int(pos.get("contracts") or 0)
+        shares = pos.get("shares") or pos.get("quantity")
+        shares = int(shares) if shares is not None else contracts * 100
+        if shares <= 0:
+            continue
+        vol_entry = vols.get(sym) or {}
+        spot = _get_spot(pos) or vol_entry.get("spot")
+        strike = pos.get("strike")
+        if spot is None or (mode == "CSP" and strike is None):
+            warnings.append("%s position %s missing spot or strike; skipped" % (mode, label))
+            continue
+        dte = _position_dte(pos, today)
+        if dte is None:
+            warnings.append("Position %s missing dte and expiration; skipped" % label)
+            continue
+        if sym not in sym_index:
+            if vol_entry:
+                used_vols[sym] = {"sigma": vol_entry["sigma"], "source": vol_entry.get("source")}
+            else:
+                used_vols[sym] = {"sigma": cfg.default_iv, "source": "DEFAULT"}
+                warnings.append("No IV/ATR for %s; using default_iv %.2f" % (sym or label, cfg.default_iv))
+            sym_index[sym] = len(symbols)
+            symbols.append(sym)
+            sym_sigma.append(float(used_vols[sym]["sigma"]))
+        is_csp = mode == "CSP"
+        rows.append((
+            sym_index[sym],
+            dte,
+            float(spot),
+            float(strike) if is_csp else 0.0,
+            float(shares),
+            1.0 if is_csp else 0.0,
+            float(strike) if (not is_csp and strike is not None) else float("nan"),
+        ))
+        labels.append({
+            "symbol": sym or label,
+            "mode": mode,
+            "strike": float(strike) if strike is not None else None,
+            "dte": dte,
+            "contracts": shares / 100.0,
+            "sigma": used_vols[sym]["sigma"],
+        })
+
+    n_chunks = int(math.ceil(cfg.n_paths / cfg.chunk_size))
+    if not rows:
+        empty = np.zeros(0)
+        var, cvar = _tail(empty, cfg.confidence_levels)
+        return MonteCarloRiskResult(
+            n_paths=cfg.n_paths, seed=cfg.seed, horizons_days=[], starting_equity=starting_equity,
+            expected_assignments=0.0, expected_assignment_capital=0.0, prob_any_assignment=0.0,
+            prob_capital_shortfall=0.0 if starting_equity else None,
+            assignment_capital_var=var, assignment_capital_cvar=cvar,
+            expected_nav_shrink=0.0, nav_shrink_var=dict(var), nav_shrink_cvar=dict(cvar),
+            survival_status="OK" if starting_equity else "UNKNOWN",
+            by_position=[], symbol_vols={}, positions_evaluated=0, chunks=0, workers=0,
+            elapsed_ms=round((time.perf_counter() - started) * 1000, 2), warnings=warnings,
+        )
+
+    # Horizon grid: unique DTEs (expiring-today counts as one day of risk)
+    horizons = sorted({max(1, r[1]) for r in rows})
+    hor_index = {d: i for i, d in enumerate(horizons)}
+    years = np.array(horizons, dtype=np.float64) / CALENDAR_DAYS_PER_YEAR
+    dt = np.diff(np.concatenate(([0.0], years)))
+    positions = np.array(
+        [[r[0], hor_index[max(1, r[1])], r[2], r[3], r[4], r[5]] for r in rows], dtype=np.float64
+    )
+    inputs = {
+        "sigma": np.array(sym_sigma, dtype=np.float64),
+        "dt": dt,
+        "positions": positions,
+        "cc_strike": np.array([r[6] for r in rows], dtype=np.float64),
+    }
+    params = {
+        "drift": float(cfg.drift),
+        "market_correlation": float(cfg.market_correlation),
+        "jump_intensity": max(0.0, float(cfg.jump_intensity)),
+        "jump_mean": float(cfg.jump_mean),
+        "jump_std": max(0.0, float(cfg.jump_std)),
+    }
+    seeds = np.random.SeedSequence(cfg.seed).spawn(n_chunks)
+    sizes = [min(cfg.chunk_size, cfg.n_paths - k * cfg.chunk_size) for k in range(n_chunks)]
+    workers = _resolve_workers(cfg, n_chunks)
+
+    shm, layout = _pack_shared(inputs)
+    try:
+        chunks: Optional[List[Dict[str, np.ndarray]]] = None
+        if workers > 1:
+            try:
+                chunks = _run_chunks_on_pool(shm.name, layout, params, seeds, sizes, workers)
+            except (OSError, RuntimeError) as e:
+                logger.warning("[MC_RISK] Process pool unavailable (%s); running %d chunks inline", e, n_chunks)
+                workers = 1
+        if chunks is None:
+            shared = _views(shm.buf, layout)
+            chunks = [_simulate_paths(shared, params, seeds[k], sizes[k]) for k in range(n_chunks)]
+            del shared
+    finally:
+        shm.close()
+        shm.unlink()
+
+    capital = np.concatenate([c["assignment_capital"] for c in chunks])
+    contracts = np.concatenate([c["assigned_contracts"] for c in chunks])
+    nav_shrink = np.concatenate([c["nav_shrink"] for c in chunks])
+    hits = np.sum([c["position_hits"] for c in chunks], axis=0)
+
+    cap_var, cap_cvar = _tail(capital, cfg.confidence_levels)
+    nav_var, nav_cvar = _tail(nav_shrink, cfg.confidence_levels)
+
+    prob_shortfall: Optional[float] = None
+    survival_status = "UNKNOWN"
+    if starting_equity is not None:
+        prob_shortfall = float(np.mean(capital > starting_equity))
+        worst_key = "%g" % (max(cfg.confidence_levels) * 100)
+        buf_pct = (starting_equity - cap_var.get(worst_key, 0.0)) / starting_equity
+        if buf_pct >= SURVIVAL_OK_BUFFER_PCT:
+            survival_status = "OK"
+        elif buf_pct >= SURVIVAL_TIGHT_BUFFER_PCT:
+            survival_status = "TIGHT"
+        else:
+            survival_status = "CRITICAL"
+
+    by_position = []
+    for i, lab in enumerate(labels):
+        p = dict(lab)
+        key = "assignment_probability" if p["mode"] == "CSP" else "call_away_probability"
+        p[key] = float(hits[i] / cfg.n_paths)
+        by_position.append(p)
+
+    elapsed_ms = round((time.perf_counter() - started) * 1000, 2)
+    logger.info(
+        "[MC_RISK] %d positions x %d paths (%d chunks, %d workers) in %.1f ms",
+        len(rows), cfg.n_paths, n_chunks, workers, elapsed_ms,
+    )
+    return MonteCarloRiskResult(
+        n_paths=cfg.n_paths,
+        seed=cfg.seed,
+        horizons_days=list(horizons),
+        starting_equity=starting_equity,
+        expected_assignments=float(contracts.mean()),
+        expected_assignment_capital=float(capital.mean()),
+        prob_any_assignment=float(np.mean(contracts > 0)),
+        prob_capital_shortfall=prob_shortfall,
+        assignment_capital_var=cap_var,
+        assignment_capital_cvar=cap_cvar,
+        expected_nav_shrink=float(nav_shrink.mean()),
+        nav_shrink_var=nav_var,
+        nav_shrink_cvar=nav_cvar,
+        survival_status=survival_status,
+        by_position=by_position,
+        symbol_vols=used_vols,
+        positions_evaluated=len(rows),
+        chunks=n_chunks,
+        workers=workers,
+        elapsed_ms=elapsed_ms,
+        warnings=warnings,
+    )
@@ -0,0 +1,522 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""
+Portfolio read model — per-account aggregates maintained on write.
+
+The positions store, wheel state store and wheel actions store notify this model on every
+write, so /portfolio/metrics, /portfolio/risk, /wheel/overview and /api/portfolio/* read
+aggregates from memory instead of reloading and re-filtering positions.json per request.
+
+Aggregates are kept per (account_id, is_test) bucket; each position contributes additively
+(open count, capital deployed, per-symbol / per-cluster exposure, realized totals), so an
+update is "subtract old contribution, add new one". Writes made by another process are
+picked up by comparing source file signatures (path, mtime, size, inode) on read and
+rebuilding. check_consistency() rebuilds from the raw stores and diffs against memory.
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+OPEN_STATUSES = ("OPEN", "PARTIAL_EXIT")
+CLOSED_STATUSES = ("CLOSED", "ABORTED")
+
+# Float sums are maintained by add/subtract; allow this much drift before reporting a mismatch
+_TOLERANCE = 0.005
+
+_BucketKey = Tuple[str, bool]
+
+
+def _file_sig(path: Optional[Path]) -> Optional[tuple]:
+    if path is None:
+        return None
+    try:
+        st = path.stat()
+    except OSError:
+        return (str(path), None)
+    return (str(path), st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _positions_file() -> Optional[Path]:
+    try:
+        from app.core.positions.store import _positions_path
+        return _positions_path()
+    except Exception:
+        return None
+
+
+def _wheel_state_file() -> Optional[Path]:
+    try:
+        from app.core.wheel.state_store import _wheel_state_path
+        return _wheel_state_path()
+    except Exception:
+        return None
+
+
+def _wheel_actions_file() -> Optional[Path]:
+    try:
+        from app.core.wheel.actions_store import _wheel_actions_path
+        return _wheel_actions_path()
+    except Exception:
+        return None
+
+
+def _position_capital(p: Any) -> float:
+    """Capital deployed as /portfolio/metrics counts it: collateral, else strike*100*contracts."""
+    c = getattr(p, "collateral", None)
+    if c is not None:
+        return float(c)
+    if getattr(p, "strike", None) and getattr(p, "contracts", None):
+        return float(p.strike) * 100 * int(p.contracts)
+    return 0.0
+
+
+def _dte_at_entry(p: Any) -> Optional[int]:
+    """Days from opened_at to expiration."""
+    if not (p.expiration and p.opened_at):
+        return None
+    try:
+        exp = datetime.strptime(str(p.expiration).strip()[:10], "%Y-%m-%d").date()
+        opened = datetime.fromisoformat(str(p.opened_at).replace("Z", "+00:00")).date()
+        return (exp - opened).days
+    except (ValueError, TypeError):
+        return None
+
+
+def _cluster_for(symbol: str) -> str:
+    try:
+        from app.core.portfolio.cluster_mapper import get_symbol_tags
+        return get_symbol_tags(symbol).get("cluster") or "UNKNOWN"
+    except Exception:
+        return "UNKNOWN"
+
+
+def _bucket_key(p: Any) -> _BucketKey:
+    return ((getattr(p, "account_id", None) or "").strip(), bool(getattr(p, "is_test", False)))
+
+
+def _copy_position(p: Any) -> Any:
+    try:
+        return type(p).from_dict(p.to_dict())
+    except Exception:
+        return copy.deepcopy(p)
+
+
+def _add_to(d: Dict[str, float], key: str, value: float) -> None:
+    v = d.get(key, 0.0) + value
+    if abs(v) < 1e-9:
+        d.pop(key, None)
+    else:
+        d[key] = v
+
+
+@dataclass
+class PortfolioAggregate:
+    """Additive aggregates over the positions of one (account_id, is_test) bucket, or a merge of buckets."""
+
+    open_count: int = 0
+    capital_deployed: float = 0.0
+    closed_count: int = 0
+    realized_pnl_total: float = 0.0
+    realized_count: int = 0
+    wins: int = 0
+    credit_sum: float = 0.0
+    credit_count: int = 0
+    dte_sum: int = 0
+    dte_count: int = 0
+    exposure_by_symbol: Dict[str, float] = field(default_factory=dict)
+    exposure_by_cluster: Dict[str, float] = field(default_factory=dict)
+    open_positions: Dict[str, Any] = field(default_factory=dict)
+
+    def apply(self, p: Any, sign: int) -> None:
+        """Add (sign=+1) or remove (sign=-1) one position's contribution."""
+        status = (p.status or "").upper()
+        if status in OPEN_STATUSES:
+            cap = _position_capital(p)
+            self.open_count += sign
+            self.capital_deployed += sign * cap
+            sym = (p.symbol or "").strip().upper()
+            if sym:
+                _add_to(self.exposure_by_symbol, sym, sign * cap)
+                _add_to(self.exposure_by_cluster, _cluster_for(sym), sign * cap)
+            if sign > 0:
+                self.open_positions[p.position_id] = p
+            else:
+                self.open_positions.pop(p.position_id, None)
+        elif status in CLOSED_STATUSES:
+            self.closed_count += sign
+            rp = getattr(p, "realized_pnl", None)
+            if rp is not None:
+                rv = float(rp)
+                self.realized_pnl_total += sign * rv
+                self.realized_count += sign
+                if rv > 0:
+                    self.wins += sign
+            oc = p.open_credit or p.credit_expected
+            if oc is not None:
+                self.credit_sum += sign * float(oc)
+                self.credit_count += sign
+            dte = _dte_at_entry(p)
+            if dte is not None:
+                self.dte_sum += sign * dte
+                self.dte_count += sign
+
+    def merge(self, other: "PortfolioAggregate") -> None:
+        for name in ("open_count", "capital_deployed", "closed_count", "realized_pnl_total", "realized_count",
+                     "wins", "credit_sum", "credit_count", "dte_sum", "dte_count"):
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        for k, v in other.exposure_by_symbol.items():
+            _add_to(self.exposure_by_symbol, k, v)
+        for k, v in other.exposure_by_cluster.items():
+            _add_to(self.exposure_by_cluster, k, v)
+        self.open_positions.update(other.open_positions)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Same shape and rounding as /api/ui/portfolio/metrics."""
+        win_rate = (self.wins / self.closed_count) if self.closed_count else None
+        avg_pnl = (self.realized_pnl_total / self.realized_count) if self.realized_count else None
+        avg_credit = (self.credit_sum / self.credit_count) if self.credit_count else None
+        avg_dte = (self.dte_sum / self.dte_count) if self.dte_count else None
+        return {
+            "open_positions_count": self.open_count,
+            "capital_deployed": round(self.capital_deployed, 2),
+            "realized_pnl_total": round(self.realized_pnl_total, 2),
+            "win_rate": round(win_rate, 4) if win_rate is not None else None,
+            "avg_pnl": round(avg_pnl, 2) if avg_pnl is not None else None,
+            "avg_credit": round(avg_credit, 2) if avg_credit is not None else None,
+            "avg_dte_at_entry": round(avg_dte, 1) if avg_dte is not None else None,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        out = self.metrics()
+        out["closed_positions_count"] = self.closed_count
+        out["exposure_by_symbol"] = {k: round(v, 2) for k, v in sorted(self.exposure_by_symbol.items())}
+        out["exposure_by_cluster"] = {k: round(v, 2) for k, v in sorted(self.exposure_by_cluster.items())}
+        out["open_position_ids"] = sorted(self.open_positions)
+        return out
+
+
+class PortfolioReadModel:
+    """In-memory per-account portfolio aggregates plus wheel state, kept current by store write hooks."""
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._positions: Dict[str, Any] = {}
+        self._buckets: Dict[_BucketKey, PortfolioAggregate] = {}
+        self._wheel_symbols: Dict[str, Dict[str, Any]] = {}
+        self._last_wheel_actions: Dict[str, Dict[str, Any]] = {}
+        self._sigs: Dict[str, Optional[tuple]] = {}
+        self._loaded: set = set()
+        self._generation = 0
+        self._stats = {"incremental_updates": 0, "rebuilds": 0}
+
+    # ------------------------------------------------------------------
+    # Loading from the raw stores
+    # ------------------------------------------------------------------
+    # Loaders only read and return {attribute: value}; they run without self._lock because the
+    # stores call the write hooks (which take self._lock) while holding their own store locks.
+
+    def _load_positions(self) -> Dict[str, Any]:
+        from app.core.positions.store import list_positions
+        positions: Dict[str, Any] = {}
+        buckets: Dict[_BucketKey, PortfolioAggregate] = {}
+        for p in list_positions():
+            positions[p.position_id] = p
+            key = _bucket_key(p)
+            if key not in buckets:
+                buckets[key] = PortfolioAggregate()
+            buckets[key].apply(p, +1)
+        return {"_positions": positions, "_buckets": buckets}
+
+    def _load_wheel_state(self) -> Dict[str, Any]:
+        from app.core.wheel.state_store import load_state
+        return {"_wheel_symbols": load_state().get("symbols") or {}}
+
+    def _load_wheel_actions(self) -> Dict[str, Any]:
+        from app.core.wheel.actions_store import get_last_wheel_action_per_symbol
+        return {"_last_wheel_actions": get_last_wheel_action_per_symbol()}
+
+    _SOURCES = (
+        ("positions", _positions_file, "_load_positions"),
+        ("wheel_state", _wheel_state_file, "_load_wheel_state"),
+        ("wheel_actions", _wheel_actions_file, "_load_wheel_actions"),
+    )
+
+    def _ensure_fresh(self, *sources: str) -> None:
+        """Rebuild any source never loaded or whose file changed outside our write hooks.
+        Call without self._lock held (see the loaders)."""
+        for name, path_fn, loader in self._SOURCES:
+            if sources and name not in sources:
+                continue
+            with self._lock:
+                if name in self._loaded and _file_sig(path_fn()) == self._sigs.get(name):
+                    continue
+            # Signature taken before the read: a write landing mid-read leaves it stale, so the
+            # next read rebuilds again instead of keeping a state that missed the write.
+            sig = _file_sig(path_fn())
+            fields = getattr(self, loader)()
+            with self._lock:
+                for attr, value in fields.items():
+                    setattr(self, attr, value)
+                self._sigs[name] = sig
+                self._loaded.add(name)
+                self._generation += 1
+                self._stats["rebuilds"] += 1
+            logger.debug("[PORTFOLIO_RM] Rebuilt %s from store", name)
+
+    def _bucket(self, key: _BucketKey) -> PortfolioAggregate:
+        b = self._buckets.get(key)
+        if b is None:
+            b = self._buckets[key] = PortfolioAggregate()
+        return b
+
+    # ------------------------------------------------------------------
+    # Write hooks (called by the stores after a successful write, under the store's lock)
+    # ------------------------------------------------------------------
+
+    def before_write(self, name: str) -> None:
+        """Called just before a store write: if the file already changed under us, rebuild lazily."""
+        path_fn = {n: fn for n, fn, _ in self._SOURCES}[name]
+        with self._lock:
+            if name in self._loaded and _file_sig(path_fn()) != self._sigs.get(name):
+                self._loaded.discard(name)
+
+    def _after_write(self, name: str, path: Optional[Path]) -> bool:
+        """True if the in-memory state for `name` can be patched; otherwise it is rebuilt lazily."""
+        if name not in self._loaded:
+            return False
+        self._sigs[name] = _file_sig(path)
+        self._generation += 1
+        self._stats["incremental_updates"] += 1
+        return True
+
+    def on_position_saved(self, position: Any) -> None:
+        with self._lock:
+            if not self._after_write("positions", _positions_file()):
+                return
+            old = self._positions.pop(position.position_id, None)
+            if old is not None:
+                self._bucket(_bucket_key(old)).apply(old, -1)
+            new = _copy_position(position)
+            self._positions[new.position_id] = new
+            self._bucket(_bucket_key(new)).apply(new, +1)
+
+    def on_position_deleted(self, position_id: str) -> None:
+        with self._lock:
+            if not self._after_write("positions", _positions_file()):
+                return
+            old = self._positions.pop(position_id, None)
+            if old is not None:
+                self._bucket(_bucket_key(old)).apply(old, -1)
+
+    def on_wheel_state_saved(self, state: Dict[str, Any]) -> None:
+        with self._lock:
+            if not self._after_write("wheel_state", _wheel_state_file()):
+                return
+            symbols = copy.deepcopy((state or {}).get("symbols") or {})
+            for sym, ent in list(symbols.items()):
+                if not isinstance(ent, dict):
+                    symbols[sym] = {"state": "EMPTY", "last_updated_utc": None, "linked_position_ids": []}
+                elif "linked_position_ids" not in ent:
+                    ent["linked_position_ids"] = []
+            self._wheel_symbols = symbols
+
+    def on_wheel_action(self, record: Dict[str, Any]) -> None:
+        with self._lock:
+            if not self._after_write("wheel_actions", _wheel_actions_file()):
+                return
+            sym = (record.get("symbol") or "").strip().upper()
+            if sym:
+                self._last_wheel_actions[sym] = {"action": record.get("action"), "at_utc": record.get("at_utc")}
+
+    def invalidate(self) -> None:
+        """Drop everything; the next read rebuilds from the stores."""
+        with self._lock:
+            self._loaded.clear()
+            self._generation += 1
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def aggregate(self, account_id: Optional[str] = None, exclude_test: bool = True) -> PortfolioAggregate:
+        """Merged aggregate for one account (or all accounts when account_id is None)."""
+        acct = account_id.strip() if account_id else None
+        self._ensure_fresh("positions")
+        with self._lock:
+            out = PortfolioAggregate()
+            for (bucket_acct, is_test), b in self._buckets.items():
+                if acct is not None and bucket_acct != acct:
+                    continue
+                if exclude_test and is_test:
+                    continue
+                out.merge(b)
+            return out
+
+    def metrics(self, account_id: Optional[str] = None, exclude_test: bool = True) -> Dict[str, Any]:
+        return self.aggregate(account_id, exclude_test).metrics()
+
+    def open_positions(self, account_id: Optional[str] = None, exclude_test: bool = True) -> List[Any]:
+        """Open/partial positions, newest first (list_positions order). Treat as read-only."""
+        out = list(self.aggregate(account_id, exclude_test).open_positions.values())
+        out.sort(key=lambda p: p.opened_at or "", reverse=True)
+        return out
+
+    def wheel_symbols(self) -> Dict[str, Dict[str, Any]]:
+        """{symbol: {state, last_updated_utc, linked_position_ids}} as load_state() returns it."""
+        self._ensure_fresh("wheel_state")
+        with self._lock:
+            return dict(self._wheel_symbols)
+
+    def last_wheel_actions(self) -> Dict[str, Dict[str, Any]]:
+        self._ensure_fresh("wheel_actions")
+        with self._lock:
+            return dict(self._last_wheel_actions)
+
+    @property
+    def generation(self) -> int:
+        with self._lock:
+            return self._generation
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self._stats,
+                "generation": self._generation,
+                "positions": len(self._positions),
+                "buckets": len(self._buckets),
+                "loaded": sorted(self._loaded),
+            }
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Full comparable state: per-bucket aggregates plus wheel maps."""
+        self._ensure_fresh()
+        with self._lock:
+            return {
+                "buckets": {
+                    f"{acct or '-'}{'|test' if is_test else ''}": b.to_dict()
+                    for (acct, is_test), b in sorted(self._buckets.items())
+                    if b.open_count or b.closed_count
+                },
+                "wheel_symbols": copy.deepcopy(self._wheel_symbols),
+                "last_wheel_actions": copy.deepcopy(self._last_wheel_actions),
+            }
+
+    # ------------------------------------------------------------------
+    # Consistency
+    # ------------------------------------------------------------------
+
+    def check_consistency(self, repair: bool = False) -> Dict[str, Any]:
+        """
+        Rebuild from the raw stores and diff against the in-memory model.
+        Returns {ok, mismatches: [{path, model, rebuilt}], generation}. With repair=True a
+        mismatching model is replaced by the rebuilt one.
+        """
+        current = self.snapshot()
+        fresh = PortfolioReadModel()
+        rebuilt = fresh.snapshot()
+        mismatches = list(_diff(current, rebuilt))
+        with self._lock:
+            if mismatches:
+                logger.warning("[PORTFOLIO_RM] Consistency check found %d mismatch(es)", len(mismatches))
+                if repair:
+                    self._positions, self._buckets = fresh._positions, fresh._buckets
+                    self._wheel_symbols, self._last_wheel_actions = fresh._wheel_symbols, fresh._last_wheel_actions
+                    self._sigs, self._loaded = dict(fresh._sigs), set(fresh._loaded)
+                    self._generation += 1
+                    self._stats["rebuilds"] += 1
+            return {
+                "ok": not mismatches,
+                "mismatches": mismatches,
+                "repaired": bool(mismatches and repair),
+                "generation": self._generation,
+            }
+
+
+def _diff(a: Any, b: Any, path: str = "") -> Iterable[Dict[str, Any]]:
+    if isinstance(a, dict) and isinstance(b, dict):
+        for k in sorted(set(a) | set(b), key=str):
+            yield from _diff(a.get(k), b.get(k), f"{path}.{k}" if path else str(k))
+        return
+    if isinstance(a, (int, float)) and isinstance(b, (int, float)) and not isinstance(a, bool):
+        if abs(float(a) - float(b)) <= _TOLERANCE:
+            return
+    elif a == b:
+        return
+    yield {"path": path, "model": a, "rebuilt": b}
+
+
+_MODEL: Optional[PortfolioReadModel] = None
+_MODEL_LOCK = threading.Lock()
+
+
+def get_portfolio_read_model() -> PortfolioReadModel:
+    global _MODEL
+    with _MODEL_LOCK:
+        if _MODEL is None:
+            _MODEL = PortfolioReadModel()
+        return _MODEL
+
+
+def notify_before_write(source: str) -> None:
+    """Store hook: `source` ("positions", "wheel_state", "wheel_actions") is about to be written."""
+    try:
+        get_portfolio_read_model().before_write(source)
+    except Exception as e:
+        logger.warning("[PORTFOLIO_RM] Pre-write hook failed, invalidating: %s", e)
+        get_portfolio_read_model().invalidate()
+
+
+def notify_position_saved(position: Any) -> None:
+    """Store hook: position created or updated. Never raises into the writer."""
+    try:
+        get_portfolio_read_model().on_position_saved(position)
+    except Exception as e:
+        logger.warning("[PORTFOLIO_RM] Position hook failed, invalidating: %s", e)
+        get_portfolio_read_model().invalidate()
+
+
+def notify_position_deleted(position_id: str) -> None:
+    try:
+        get_portfolio_read_model().on_position_deleted(position_id)
+    except Exception as e:
+        logger.warning("[PORTFOLIO_RM] Delete hook failed, invalidating: %s", e)
+        get_portfolio_read_model().invalidate()
+
+
+def notify_wheel_state_saved(state: Dict[str, Any]) -> None:
+    try:
+        get_portfolio_read_model().on_wheel_state_saved(state)
+    except Exception as e:
+        logger.warning("[PORTFOLIO_RM] Wheel state hook failed, invalidating: %s", e)
+        get_portfolio_read_model().invalidate()
+
+
+def notify_wheel_action(record: Dict[str, Any]) -> None:
+    try:
+        get_portfolio_read_model().on_wheel_action(record)
+    except Exception as e:
+        logger.warning("[PORTFOLIO_RM] Wheel action hook failed, invalidating: %s", e)
+        get_portfolio_read_model().invalidate()
+
+
+__all__ = [
+    "CLOSED_STATUSES",
+    "OPEN_STATUSES",
+    "PortfolioAggregate",
+    "PortfolioReadModel",
+    "get_portfolio_read_model",
+    "notify_before_write",
+    "notify_position_deleted",
+    "notify_position_saved",
+    "notify_wheel_action",
+    "notify_wheel_state_saved",
+]
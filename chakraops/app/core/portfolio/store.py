@@ -10,6 +10,7 @@ import threading
 from pathlib import Path
 from typing import Any, Dict
 
+from app.core.config.registry import get_config, invalidate, register_config
 from app.core.portfolio.models import RiskProfile
 
 logger = logging.getLogger(__name__)
@@ -37,19 +38,26 @@ def _risk_profile_path() -> Path:
 _LOCK = threading.Lock()
 
 
+def _normalize_risk_profile(data: Any) -> Dict[str, Any]:
+    return RiskProfile.from_dict(data).to_dict()
+
+
+def _risk_profile_fallback(exc: Exception) -> Dict[str, Any]:
+    return RiskProfile().to_dict()
+
+
+register_config(
+    "risk_profile",
+    validate=_normalize_risk_profile,
+    missing=lambda: RiskProfile().to_dict(),
+    fallback=_risk_profile_fallback,
+)
+
+
 def load_risk_profile() -> RiskProfile:
-    """Load risk profile from JSON. Returns defaults if missing."""
-    path = _risk_profile_path()
-    if not path.exists():
-        return RiskProfile()
-    with _LOCK:
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            return RiskProfile.from_dict(data)
-        except Exception as e:
-            logger.warning("[PORTFOLIO] Failed to load risk profile: %s", e)
-            return RiskProfile()
+    """Load risk profile from JSON. Returns defaults if missing.
+    Parsed once per file version via the config registry."""
+    return RiskProfile.from_dict(get_config("risk_profile", _risk_profile_path()).mutable())
 
 
 def save_risk_profile(profile: RiskProfile) -> RiskProfile:
@@ -59,6 +67,7 @@ def save_risk_profile(profile: RiskProfile) -> RiskProfile:
     with _LOCK:
         with open(path, "w", encoding="utf-8") as f:
             json.dump(profile.to_dict(), f, indent=2)
+    invalidate("risk_profile", path)
     logger.info("[PORTFOLIO] Saved risk profile")
     return profile
 
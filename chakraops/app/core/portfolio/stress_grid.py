@@ -0,0 +1,331 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""
+Phase 8.3c – Vectorized Assignment Stress Grid (Read-Only Risk Modeling).
+
+Dense scenario grid over all open CSP/CC positions in one NumPy pass. Same math as
+simulate_assignment_stress_dynamic (Phase 8.3b) per scenario, extended with per-symbol
+betas and correlated cluster shocks from the cluster map:
+
+    position_shock[p, k] = beta[p] * market_shock[k] + cluster_shock[cluster(p)]
+
+With all betas 1.0 and no cluster shocks the per-scenario results equal
+simulate_assignment_stress_dynamic at the same shock levels.
+Read-only. No trading logic mutation.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from app.core.portfolio.assignment_stress_simulator import (
+    SURVIVAL_OK_BUFFER_PCT,
+    SURVIVAL_TIGHT_BUFFER_PCT,
+    _cc_equity_notional,
+    _get_spot,
+    _position_mode,
+)
+from app.core.portfolio.cluster_mapper import get_symbol_tags
+
+# Default grid: -50% .. +20% in 0.5% steps (141 scenarios)
+DEFAULT_GRID_MIN = -0.50
+DEFAULT_GRID_MAX = 0.20
+DEFAULT_GRID_STEP = 0.005
+
+# Starter betas vs. the market shock per cluster (editable; symbol betas override)
+DEFAULT_CLUSTER_BETAS: Dict[str, float] = {
+    "MEGA_CAP_TECH": 1.2,
+    "SEMIS": 1.5,
+    "FINANCIALS": 1.1,
+    "ENERGY": 0.9,
+    "ENERGY_ETF": 0.9,
+    "HEALTHCARE": 0.7,
+    "INDEX_ETF": 1.0,
+    "VOL_ETF": -3.0,
+    "DIVIDEND_YIELD": 0.6,
+    "UNKNOWN": 1.0,
+}
+
+
+def build_shock_grid(
+    min_shock: float = DEFAULT_GRID_MIN,
+    max_shock: float = DEFAULT_GRID_MAX,
+    step: float = DEFAULT_GRID_STEP,
+) -> np.ndarray:
+    """Inclusive, ascending grid of market shocks (e.g. -0.50 .. 0.20)."""
+    if step <= 0 or max_shock < min_shock:
+        raise ValueError("stress grid requires step > 0 and max_shock >= min_shock")
+    n = int(round((max_shock - min_shock) / step)) + 1
+    return np.round(min_shock + step * np.arange(n), 10)
+
+
+@dataclass(frozen=True)
+class StressGridResult:
+    """Scenario surfaces (one value per shock) plus per-cluster capital/drawdown surfaces."""
+
+    shock_pct: np.ndarray
+    estimated_assignments: np.ndarray
+    assignment_capital_required: np.ndarray
+    estimated_unrealized_drawdown: np.ndarray
+    shocked_equity: Optional[np.ndarray]
+    equity_drawdown_pct: Optional[np.ndarray]
+    post_shock_exposure_pct: Optional[np.ndarray]
+    cash_buffer: Optional[np.ndarray]
+    survival_status: List[str]
+    total_notional_post_shock: np.ndarray
+    starting_equity: Optional[float]
+    csp_reserved_cash: float
+    cc_equity_notional: float
+    by_cluster: Dict[str, Dict[str, np.ndarray]] = field(default_factory=dict)
+    positions_evaluated: int = 0
+    warnings: List[str] = field(default_factory=list)
+
+    def worst_case(self) -> Dict[str, Any]:
+        """Largest drawdown; tie-break most negative shock (same rule as Phase 8.3b)."""
+        if self.shock_pct.size == 0:
+            return {"shock_pct": None, "estimated_unrealized_drawdown": 0.0, "survival_status": "UNKNOWN"}
+        k = int(np.lexsort((self.shock_pct, -self.estimated_unrealized_drawdown))[0])
+        return {
+            "shock_pct": float(self.shock_pct[k]),
+            "estimated_unrealized_drawdown": float(self.estimated_unrealized_drawdown[k]),
+            "assignment_capital_required": float(self.assignment_capital_required[k]),
+            "shocked_equity": _item(self.shocked_equity, k),
+            "post_shock_exposure_pct": _item(self.post_shock_exposure_pct, k),
+            "cash_buffer": _item(self.cash_buffer, k),
+            "survival_status": self.survival_status[k],
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable surfaces (lists aligned with shock_pct)."""
+        return {
+            "shock_pct": self.shock_pct.tolist(),
+            "estimated_assignments": self.estimated_assignments.tolist(),
+            "assignment_capital_required": self.assignment_capital_required.tolist(),
+            "estimated_unrealized_drawdown": self.estimated_unrealized_drawdown.tolist(),
+            "shocked_equity": _tolist(self.shocked_equity),
+            "equity_drawdown_pct": _tolist(self.equity_drawdown_pct),
+            "post_shock_exposure_pct": _tolist(self.post_shock_exposure_pct),
+            "cash_buffer": _tolist(self.cash_buffer),
+            "survival_status": list(self.survival_status),
+            "total_notional_post_shock": self.total_notional_post_shock.tolist(),
+            "starting_equity": self.starting_equity,
+            "csp_reserved_cash": self.csp_reserved_cash,
+            "cc_equity_notional": self.cc_equity_notional,
+            "by_cluster": {
+                c: {k: v.tolist() for k, v in surfaces.items()} for c, surfaces in self.by_cluster.items()
+            },
+            "positions_evaluated": self.positions_evaluated,
+            "worst_case": self.worst_case(),
+            "warnings": list(self.warnings),
+        }
+
+
+def _item(arr: Optional[np.ndarray], k: int) -> Optional[float]:
+    if arr is None:
+        return None
+    v = float(arr[k])
+    return None if np.isnan(v) else v
+
+
+def _tolist(arr: Optional[np.ndarray]) -> Optional[List[Optional[float]]]:
+    if arr is None:
+        return None
+    return [None if np.isnan(v) else float(v) for v in arr]
+
+
+def _starting_equity(portfolio_snapshot: Dict[str, Any]) -> Optional[float]:
+    for k in ("portfolio_equity_usd", "equity_usd"):
+        v = portfolio_snapshot.get(k)
+        if v is not None:
+            try:
+                f = float(v)
+                if f > 0:
+                    return f
+            except (TypeError, ValueError):
+                pass
+    return None
+
+
+def simulate_stress_grid(
+    portfolio_snapshot: Dict[str, Any],
+    open_positions: List[Dict[str, Any]],
+    shocks: Optional[Any] = None,
+    symbol_betas: Optional[Dict[str, float]] = None,
+    cluster_betas: Optional[Dict[str, float]] = None,
+    cluster_shocks: Optional[Dict[str, float]] = None,
+    cluster_map: Optional[Dict[str, Dict[str, str]]] = None,
+    nav_shrink_mode: str = "CONSERVATIVE",
+) -> StressGridResult:
+    """
+    Evaluate every (position, scenario) pair in one vectorized pass.
+
+    Args:
+        portfolio_snapshot: Needs portfolio_equity_usd or equity_usd (user-supplied).
+        open_positions: Position dicts (symbol, mode, strike, contracts, spot/entry_spot, shares).
+        shocks: Market shocks (fractions). Default build_shock_grid().
+        symbol_betas: symbol -> beta; overrides the cluster beta.
+        cluster_betas: cluster -> beta. Default DEFAULT_CLUSTER_BETAS when symbol/cluster betas
+            are both None; pass {} to run every position at beta 1.0.
+        cluster_shocks: cluster -> extra shock added to every scenario (correlated within cluster).
+        cluster_map: Override map for get_symbol_tags (e.g. load_cluster_map(...)).
+        nav_shrink_mode: CONSERVATIVE (equity - drawdown) or LINEAR (equity * (1 + shock)).
+    """
+    warnings: List[str] = []
+    grid = build_shock_grid() if shocks is None else np.asarray(shocks, dtype=float).ravel()
+    mode = (nav_shrink_mode or "CONSERVATIVE").strip().upper()
+    if mode not in ("CONSERVATIVE", "LINEAR"):
+        mode = "CONSERVATIVE"
+    if cluster_betas is None:
+        cluster_betas = DEFAULT_CLUSTER_BETAS if symbol_betas is None else {}
+    sym_betas = {k.upper(): float(v) for k, v in (symbol_betas or {}).items()}
+    cluster_shocks = cluster_shocks or {}
+    starting_equity = _starting_equity(portfolio_snapshot)
+
+    # Flatten positions into parallel columns (one Python pass; everything after is NumPy)
+    csp_spot: List[float] = []
+    csp_strike: List[float] = []
+    csp_contracts: List[int] = []
+    csp_cluster: List[str] = []
+    csp_beta: List[float] = []
+    csp_offset: List[float] = []
+    cc_shares: List[float] = []
+    cc_spot: List[float] = []
+    cc_beta: List[float] = []
+    cc_offset: List[float] = []
+    csp_reserved_cash = 0.0
+    cc_unshocked_notional = 0.0
+    cc_equity_notional = 0.0
+    cc_missing_spot = False
+
+    tag_cache: Dict[str, str] = {}
+
+    def _cluster_of(symbol: str) -> str:
+        if symbol not in tag_cache:
+            tag_cache[symbol] = get_symbol_tags(symbol, cluster_map)["cluster"]
+        return tag_cache[symbol]
+
+    for pos in open_positions:
+        symbol = str(pos.get("symbol") or "").upper()
+        cluster = _cluster_of(symbol)
+        beta = sym_betas.get(symbol, cluster_betas.get(cluster, 1.0))
+        offset = float(cluster_shocks.get(cluster, 0.0))
+        contracts = int(pos.get("contracts") or 0)
+        if _position_mode(pos) == "CSP":
+            strike = pos.get("strike")
+            if strike is not None and contracts > 0:
+                csp_reserved_cash += float(strike) * 100 * contracts
+            spot = _get_spot(pos)
+            if spot is not None and strike is not None and contracts > 0:
+                csp_spot.append(spot)
+                csp_strike.append(float(strike))
+                csp_contracts.append(contracts)
+                csp_cluster.append(cluster)
+                csp_beta.append(beta)
+                csp_offset.append(offset)
+            elif spot is None or strike is None:
+                sym = pos.get("symbol") or pos.get("position_id") or "?"
+                warnings.append("CSP position %s missing spot or strike; skipped" % sym)
+        else:
+            cc_equity_notional += _cc_equity_notional(pos, warnings)
+            shares = pos.get("shares") or pos.get("quantity")
+            shares = contracts * 100 if shares is None else int(shares)
+            spot = _get_spot(pos)
+            if spot is not None and shares > 0:
+                cc_shares.append(float(shares))
+                cc_spot.append(spot)
+                cc_beta.append(beta)
+                cc_offset.append(offset)
+            else:
+                cc_unshocked_notional += _cc_equity_notional(pos, [])
+                cc_missing_spot = True
+
+    # CSP surfaces: (positions x scenarios)
+    spot = np.asarray(csp_spot)
+    strike = np.asarray(csp_strike)
+    contracts = np.asarray(csp_contracts, dtype=float)
+    pos_shock = np.asarray(csp_beta)[:, None] * grid[None, :] + np.asarray(csp_offset)[:, None]
+    new_spot = np.maximum(spot[:, None] * (1.0 + pos_shock), 0.0)
+    assigned = new_spot <= strike[:, None]
+    capital = np.where(assigned, (strike * 100.0 * contracts)[:, None], 0.0)
+    drawdown = np.where(assigned, np.maximum(strike[:, None] - new_spot, 0.0) * 100.0 * contracts[:, None], 0.0)
+
+    estimated_assignments = (assigned * contracts[:, None]).sum(axis=0).astype(int)
+    assignment_capital_required = capital.sum(axis=0)
+    estimated_unrealized_drawdown = np.maximum(drawdown.sum(axis=0), 0.0)
+
+    by_cluster: Dict[str, Dict[str, np.ndarray]] = {}
+    if csp_cluster:
+        clusters, inverse = np.unique(np.asarray(csp_cluster), return_inverse=True)
+        membership = np.zeros((len(clusters), len(csp_cluster)))
+        membership[inverse, np.arange(len(csp_cluster))] = 1.0
+        cap_by_cluster = membership @ capital
+        dd_by_cluster = membership @ drawdown
+        for i, c in enumerate(clusters.tolist()):
+            by_cluster[c] = {
+                "assignment_capital_required": cap_by_cluster[i],
+                "estimated_unrealized_drawdown": dd_by_cluster[i],
+            }
+
+    # CC equity notional shocked
+    cc_pos_shock = np.asarray(cc_beta)[:, None] * grid[None, :] + np.asarray(cc_offset)[:, None]
+    cc_shocked = (np.asarray(cc_shares)[:, None] * np.maximum(np.asarray(cc_spot)[:, None] * (1.0 + cc_pos_shock), 0.0)).sum(axis=0)
+    has_positions = bool(csp_spot or cc_spot or cc_missing_spot)
+    if has_positions:
+        total_notional_post_shock = cc_shocked + cc_unshocked_notional + csp_reserved_cash
+    else:
+        total_notional_post_shock = np.full(grid.shape, csp_reserved_cash + cc_equity_notional)
+    if cc_missing_spot:
+        warnings.append("CC notional used pre-shock (no spot)")
+
+    shocked_equity = equity_drawdown_pct = post_shock_exposure_pct = cash_buffer = None
+    survival_status = ["UNKNOWN"] * grid.size
+    if starting_equity is not None:
+        if mode == "CONSERVATIVE":
+            shocked_equity = np.maximum(starting_equity - estimated_unrealized_drawdown, 0.0)
+        else:
+            shocked_equity = np.maximum(starting_equity * (1.0 + grid), 0.0)
+        equity_drawdown_pct = 100.0 * estimated_unrealized_drawdown / starting_equity
+        with np.errstate(divide="ignore", invalid="ignore"):
+            post_shock_exposure_pct = np.where(
+                shocked_equity > 0, 100.0 * total_notional_post_shock / shocked_equity, np.nan
+            )
+        cash_buffer = starting_equity - assignment_capital_required
+        buf_pct = cash_buffer / starting_equity
+        survival_status = np.select(
+            [buf_pct >= SURVIVAL_OK_BUFFER_PCT, buf_pct >= SURVIVAL_TIGHT_BUFFER_PCT],
+            ["OK", "TIGHT"],
+            default="CRITICAL",
+        ).tolist()
+
+    return StressGridResult(
+        shock_pct=grid,
+        estimated_assignments=estimated_assignments,
+        assignment_capital_required=assignment_capital_required,
+        estimated_unrealized_drawdown=estimated_unrealized_drawdown,
+        shocked_equity=shocked_equity,
+        equity_drawdown_pct=equity_drawdown_pct,
+        post_shock_exposure_pct=post_shock_exposure_pct,
+        cash_buffer=cash_buffer,
+        survival_status=survival_status,
+        total_notional_post_shock=total_notional_post_shock,
+        starting_equity=starting_equity,
+        csp_reserved_cash=csp_reserved_cash,
+        cc_equity_notional=cc_equity_notional,
+        by_cluster=by_cluster,
+        positions_evaluated=len(csp_spot) + len(cc_spot),
+        warnings=warnings,
+    )
+
+
+__all__ = [
+    "DEFAULT_CLUSTER_BETAS",
+    "DEFAULT_GRID_MIN",
+    "DEFAULT_GRID_MAX",
+    "DEFAULT_GRID_STEP",
+    "StressGridResult",
+    "build_shock_grid",
+    "simulate_stress_grid",
+]
@@ -4,12 +4,12 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import threading
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, List, Optional
 
+from app.core.io import json_codec
 from app.core.positions.models import Position
 
 logger = logging.getLogger(__name__)
@@ -54,8 +54,7 @@ def _load_all() -> List[Position]:
         return []
     with _LOCK:
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = json_codec.read_json(path)
             if isinstance(data, list):
                 return [Position.from_dict(d) for d in data]
             return []
@@ -64,16 +63,36 @@ def _load_all() -> List[Position]:
             return []
 
 
-def _save_all(positions: List[Position]) -> None:
-    """Save all positions to JSON file."""
+def _save_all(positions: List[Position], after_write: Optional[Callable[[], None]] = None) -> None:
+    """Save all positions to JSON file. after_write (the read model / trigger hooks) runs under the
+    same lock as the write, so concurrent writers notify in file order."""
+    from app.core.portfolio.read_model import notify_before_write
     path = _positions_path()
     _ensure_positions_dir()
+    notify_before_write("positions")
     with _LOCK:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump([p.to_dict() for p in positions], f, indent=2, default=str)
+        with open(path, "wb") as f:
+            json_codec.dump([p.to_dict() for p in positions], f)
+        if after_write is not None:
+            after_write()
     logger.info("[POSITIONS] Saved %d positions", len(positions))
 
 
+def _notify_saved(position: Position) -> None:
+    """Keep the portfolio read model and the armed lifecycle triggers current without a reload."""
+    from app.core.lifecycle import trigger_index
+    from app.core.portfolio.read_model import notify_position_saved
+    notify_position_saved(position)
+    trigger_index.notify_position_saved(position)
+
+
+def _notify_deleted(position_id: str) -> None:
+    from app.core.lifecycle import trigger_index
+    from app.core.portfolio.read_model import notify_position_deleted
+    notify_position_deleted(position_id)
+    trigger_index.notify_position_deleted(position_id)
+
+
 # ---------------------------------------------------------------------------
 # CRUD operations
 # ---------------------------------------------------------------------------
@@ -115,7 +134,7 @@ def create_position(position: Position) -> Position:
         if p.position_id == position.position_id:
             raise ValueError(f"Position {position.position_id} already exists")
     positions.append(position)
-    _save_all(positions)
+    _save_all(positions, lambda: _notify_saved(position))
     logger.info("[POSITIONS] Created position %s for %s", position.position_id, position.symbol)
     return position
 
@@ -159,7 +178,7 @@ def update_position(position_id: str, updates: dict) -> Optional[Position]:
         except Exception as e:
             logger.warning("[POSITIONS] Failed to log data_sufficiency override: %s", e)
 
-    _save_all(positions)
+    _save_all(positions, lambda: _notify_saved(target))
     logger.info("[POSITIONS] Updated position %s", position_id)
     return target
 
@@ -171,6 +190,6 @@ def delete_position(position_id: str) -> bool:
     positions = [p for p in positions if p.position_id != position_id]
     if len(positions) == before:
         return False
-    _save_all(positions)
+    _save_all(positions, lambda: _notify_deleted(position_id))
     logger.info("[POSITIONS] Deleted position %s", position_id)
     return True
@@ -2,8 +2,10 @@
 # SPDX-License-Identifier: MIT
 """Volatility kill switch: halt new openings when VIX or SPY range exceeds thresholds.
 
-Uses publicly available data from yfinance (VIX, SPY). Logic is separate from
-the existing risk_off / regime logic so it can be tested independently.
+Uses publicly available data from yfinance (VIX). SPY bars come from the shared
+daily-bar store, with yfinance as fallback; ORATS has no ^VIX series.
+Logic is separate from the existing risk_off / regime logic so it can be tested
+independently.
 """
 
 from __future__ import annotations
@@ -50,6 +52,35 @@ def fetch_vix(lookback_days: int = 5) -> Optional[float]:
         return None
 
 
+def _range_and_atr(high: Any, low: Any, close: Any) -> Tuple[Optional[float], Optional[float]]:
+    """(last high - low, 20-day mean true range) from ascending pandas Series."""
+    import pandas as pd
+    # True range: max(high-low, |high-prev_close|, |low-prev_close|)
+    prev_close = close.shift(1)
+    tr = pd.concat(
+        [high - low, (high - prev_close).abs(), (low - prev_close).abs()],
+        axis=1,
+    ).max(axis=1)
+    atr_20 = float(tr.rolling(20).mean().iloc[-1]) if len(tr) >= 20 else None
+
+    # Current day range = last row high - low
+    last_high, last_low = high.iloc[-1], low.iloc[-1]
+    day_range = float(last_high - last_low) if pd.notna(last_high) and pd.notna(last_low) else None
+    return day_range, atr_20
+
+
+def _spy_range_from_store(lookback_days: int) -> Tuple[Optional[float], Optional[float]]:
+    try:
+        from app.core.data.daily_bars import get_daily_bar_repository
+        df = get_daily_bar_repository().bars_dataframe(SPY_SYMBOL, max(lookback_days, 30))
+    except Exception as e:
+        logger.debug("SPY bars unavailable from daily-bar store: %s", e)
+        return None, None
+    if df is None or len(df) < 21:
+        return None, None
+    return _range_and_atr(df["high"], df["low"], df["close"])
+
+
 def compute_spy_range(lookback_days: int = 25) -> Tuple[Optional[float], Optional[float]]:
     """Compute SPY current-day range and 20-day average true range (ATR).
 
@@ -65,34 +96,22 @@ def compute_spy_range(lookback_days: int = 25) -> Tuple[Optional[float], Optiona
         recent trading day. atr_20 = 20-day average of true range.
         Either may be None if data is insufficient or fetch fails.
     """
+    day_range, atr_20 = _spy_range_from_store(lookback_days)
+    if day_range is not None or atr_20 is not None:
+        return day_range, atr_20
+
     if yf is None:
         logger.warning("yfinance not installed; cannot compute SPY range")
         return None, None
 
     try:
-        import pandas as pd
         ticker = yf.Ticker(SPY_SYMBOL)
         hist = ticker.history(period=f"{max(lookback_days, 30)}d", auto_adjust=True)
         if hist.empty or len(hist) < 21:
             return None, None
 
         df = hist.sort_index(ascending=True)
-        # True range: max(high-low, |high-prev_close|, |low-prev_close|)
-        high = df["High"]
-        low = df["Low"]
-        close = df["Close"]
-        prev_close = close.shift(1)
-        tr = pd.concat(
-            [high - low, (high - prev_close).abs(), (low - prev_close).abs()],
-            axis=1,
-        ).max(axis=1)
-        atr_20 = float(tr.rolling(20).mean().iloc[-1]) if len(tr) >= 20 else None
-
-        # Current day range = last row high - low
-        last = df.iloc[-1]
-        day_range = float(last["High"] - last["Low"]) if pd.notna(last["High"]) and pd.notna(last["Low"]) else None
-
-        return day_range, atr_20
+        return _range_and_atr(df["High"], df["Low"], df["Close"])
     except Exception as e:
         logger.warning("Failed to compute SPY range: %s", e)
         return None, None
@@ -122,34 +141,33 @@ def is_volatility_high(config: Optional[Dict[str, Any]] = None) -> bool:
     vix_change_pct = float(cfg.get("vix_change_pct", 20.0))
     range_multiplier = float(cfg.get("range_multiplier", 2.0))
 
-    if yf is None:
-        return False
-
-    # a) VIX level
-    vix_now = fetch_vix(lookback_days=5)
-    if vix_now is not None and vix_now > vix_threshold:
-        logger.info("Volatility kill switch: VIX %.2f > threshold %.2f", vix_now, vix_threshold)
-        return True
+    # a) and b) need yfinance; c) works from the daily-bar store alone
+    if yf is not None:
+        # a) VIX level
+        vix_now = fetch_vix(lookback_days=5)
+        if vix_now is not None and vix_now > vix_threshold:
+            logger.info("Volatility kill switch: VIX %.2f > threshold %.2f", vix_now, vix_threshold)
+            return True
 
-    # b) VIX 3-day change %
-    try:
-        ticker = yf.Ticker(VIX_SYMBOL)
-        hist = ticker.history(period="10d", auto_adjust=True)
-        if not hist.empty and len(hist) >= 4 and "Close" in hist.columns:
-            close = hist["Close"]
-            vix_today = float(close.iloc[-1])
-            vix_3d_ago = float(close.iloc[-4])
-            if vix_3d_ago and vix_3d_ago > 0:
-                change_pct = 100.0 * (vix_today - vix_3d_ago) / vix_3d_ago
-                if change_pct >= vix_change_pct:
-                    logger.info(
-                        "Volatility kill switch: VIX 3-day change %.1f%% >= %.1f%%",
-                        change_pct,
-                        vix_change_pct,
-                    )
-                    return True
-    except Exception as e:
-        logger.debug("VIX 3-day change check failed: %s", e)
+        # b) VIX 3-day change %
+        try:
+            ticker = yf.Ticker(VIX_SYMBOL)
+            hist = ticker.history(period="10d", auto_adjust=True)
+            if not hist.empty and len(hist) >= 4 and "Close" in hist.columns:
+                close = hist["Close"]
+                vix_today = float(close.iloc[-1])
+                vix_3d_ago = float(close.iloc[-4])
+                if vix_3d_ago and vix_3d_ago > 0:
+                    change_pct = 100.0 * (vix_today - vix_3d_ago) / vix_3d_ago
+                    if change_pct >= vix_change_pct:
+                        logger.info(
+                            "Volatility kill switch: VIX 3-day change %.1f%% >= %.1f%%",
+                            change_pct,
+                            vix_change_pct,
+                        )
+                        return True
+        except Exception as e:
+            logger.debug("VIX 3-day change check failed: %s", e)
 
     # c) SPY day range vs 20-day ATR
     day_range, atr_20 = compute_spy_range(lookback_days=25)
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: MIT
 """Snapshot archival (EOD freeze). Never read by runtime."""
 
+from app.core.snapshots.archive import ArchiveError, SnapshotArchive
 from app.core.snapshots.freeze import run_freeze_snapshot
 
-__all__ = ["run_freeze_snapshot"]
+__all__ = ["ArchiveError", "SnapshotArchive", "run_freeze_snapshot"]
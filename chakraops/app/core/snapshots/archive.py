@@ -0,0 +1,362 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""
+Content-addressed, compressed archive shared by EOD freeze snapshots and run artifacts.
+
+Layout (root defaults to artifacts/archive):
+  objects/ab/<sha256>.zst|.gz        one compressed chunk, named by the SHA-256 of its raw bytes
+  manifests/<namespace>/<id>.json    one manifest per snapshot/run: files -> ordered chunk hashes
+
+Files are cut into content-defined chunks at line boundaries (a line whose CRC matches a
+mask ends a chunk, within min/max sizes). An append to a JSONL log or an edit inside one
+block of an indented JSON file therefore only produces new chunks around the change; all
+other chunks are already in objects/ and are referenced, not stored again.
+
+Chunks are compressed with zstd when the optional `zstandard` package is installed and
+gzip otherwise. The codec is part of the object name, so archives written with either
+can be read back (zstd objects need zstandard).
+
+restore() rebuilds files from a manifest and verifies each file's SHA-256, gc() removes
+objects no manifest references, report() compares logical vs stored bytes over a window.
+
+Writers store chunks before the manifest that references them, so gc() only removes
+unreferenced objects older than GC_GRACE_SEC; put_chunk() refreshes the mtime of an object
+it reuses, so a chunk picked up by an in-flight write is never collected under it.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import zlib
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+try:
+    import zstandard as _zstd
+except ImportError:  # optional; gzip is used without it
+    _zstd = None
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FORMAT = 1
+
+# Chunking: cut after a line whose CRC32 & _CUT_MASK == 0 once a chunk has _MIN_CHUNK bytes;
+# lines longer than _MAX_CHUNK are split at fixed offsets.
+_MIN_CHUNK = 16 * 1024
+_MAX_CHUNK = 256 * 1024
+_CUT_MASK = 0x3FF
+
+_CODECS = ("zst", "gz")
+
+# gc() keeps unreferenced objects younger than this: chunks of a snapshot/run still being written
+GC_GRACE_SEC = 3600.0
+
+
+class ArchiveError(RuntimeError):
+    """Archive content is missing or does not match its manifest."""
+
+
+def default_archive_root() -> Path:
+    """chakraops/artifacts/archive (sibling of artifacts/runs)."""
+    return Path(__file__).resolve().parents[3] / "artifacts" / "archive"
+
+
+def default_codec() -> str:
+    return "zst" if _zstd is not None else "gz"
+
+
+def iter_chunks(data: bytes) -> Iterator[bytes]:
+    """Split data into content-defined chunks (see module docstring). Concatenation == data."""
+    n = len(data)
+    start = pos = 0
+    while pos < n:
+        limit = min(n, start + _MAX_CHUNK)
+        nl = data.find(b"\n", pos, limit)
+        if nl < 0:
+            yield data[start:limit]
+            start = pos = limit
+            continue
+        line_end = nl + 1
+        cut = line_end - start >= _MIN_CHUNK and (zlib.crc32(data[pos:line_end]) & _CUT_MASK) == 0
+        pos = line_end
+        if cut:
+            yield data[start:pos]
+            start = pos
+    if start < n:
+        yield data[start:n]
+
+
+def _compress(raw: bytes, codec: str) -> bytes:
+    if codec == "zst":
+        return _zstd.ZstdCompressor(level=10).compress(raw)
+    return gzip.compress(raw, compresslevel=6, mtime=0)
+
+
+def _decompress(blob: bytes, codec: str) -> bytes:
+    if codec == "zst":
+        if _zstd is None:
+            raise ArchiveError("zstd object found but the zstandard package is not installed")
+        return _zstd.ZstdDecompressor().decompress(blob)
+    return gzip.decompress(blob)
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=".tmp_", dir=path.parent)
+    try:
+        with open(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def _utc_iso(ts: float) -> str:
+    return datetime.fromtimestamp(ts, tz=timezone.utc).isoformat()
+
+
+class SnapshotArchive:
+    """Chunk store + manifests under one root. Safe for concurrent writers (objects are immutable)."""
+
+    def __init__(self, root: Optional[Union[str, Path]] = None, codec: Optional[str] = None) -> None:
+        self.root = Path(root) if root is not None else default_archive_root()
+        self.codec = codec or default_codec()
+        if self.codec not in _CODECS:
+            raise ValueError(f"unknown archive codec {self.codec!r}")
+        if self.codec == "zst" and _zstd is None:
+            raise ValueError("zst codec requires the zstandard package")
+
+    # -- objects ---------------------------------------------------------------
+
+    def _object_path(self, digest: str, codec: str) -> Path:
+        return self.root / "objects" / digest[:2] / f"{digest}.{codec}"
+
+    def _find_object(self, digest: str) -> Optional[Path]:
+        for codec in _CODECS:
+            p = self._object_path(digest, codec)
+            if p.exists():
+                return p
+        return None
+
+    def put_chunk(self, raw: bytes) -> Tuple[str, int]:
+        """Store one chunk. Returns (sha256, compressed bytes newly written; 0 if already stored)."""
+        digest = hashlib.sha256(raw).hexdigest()
+        existing = self._find_object(digest)
+        if existing is not None:
+            try:
+                os.utime(existing)  # now in use again: restart its gc grace window
+                return digest, 0
+            except FileNotFoundError:
+                pass  # collected meanwhile; store it again
+        blob = _compress(raw, self.codec)
+        _atomic_write_bytes(self._object_path(digest, self.codec), blob)
+        return digest, len(blob)
+
+    def get_chunk(self, digest: str) -> bytes:
+        p = self._find_object(digest)
+        if p is None:
+            raise ArchiveError(f"chunk {digest} missing from {self.root}")
+        raw = _decompress(p.read_bytes(), p.suffix[1:])
+        if hashlib.sha256(raw).hexdigest() != digest:
+            raise ArchiveError(f"chunk {digest} is corrupt")
+        return raw
+
+    # -- files -----------------------------------------------------------------
+
+    def put_bytes(self, name: str, data: bytes, last_modified_utc: Optional[str] = None) -> Dict[str, Any]:
+        """Store data as chunks. Returns the manifest file entry."""
+        chunks: List[str] = []
+        stored = 0
+        for raw in iter_chunks(data):
+            digest, new = self.put_chunk(raw)
+            chunks.append(digest)
+            stored += new
+        return {
+            "name": name,
+            "size_bytes": len(data),
+            "sha256": hashlib.sha256(data).hexdigest(),
+            "last_modified_utc": last_modified_utc or datetime.now(timezone.utc).isoformat(),
+            "chunks": chunks,
+            "stored_bytes": stored,
+        }
+
+    def put_file(self, src: Path, name: Optional[str] = None) -> Dict[str, Any]:
+        src = Path(src)
+        data = src.read_bytes()
+        return self.put_bytes(name or src.name, data, last_modified_utc=_utc_iso(src.stat().st_mtime))
+
+    def read_bytes(self, entry: Dict[str, Any]) -> bytes:
+        """Reassemble one manifest file entry and verify its SHA-256."""
+        data = b"".join(self.get_chunk(d) for d in entry.get("chunks") or [])
+        if hashlib.sha256(data).hexdigest() != entry.get("sha256"):
+            raise ArchiveError(f"{entry.get('name')}: content does not match manifest sha256")
+        return data
+
+    # -- manifests -------------------------------------------------------------
+
+    def manifest_path(self, namespace: str, manifest_id: str) -> Path:
+        return self.root / "manifests" / namespace / f"{manifest_id}.json"
+
+    def write_manifest(
+        self,
+        namespace: str,
+        manifest_id: str,
+        files: List[Dict[str, Any]],
+        meta: Optional[Dict[str, Any]] = None,
+        created_at_utc: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Write manifests/<namespace>/<id>.json (replacing an earlier one with the same id)."""
+        manifest = {
+            "format": MANIFEST_FORMAT,
+            "namespace": namespace,
+            "id": manifest_id,
+            "created_at_utc": created_at_utc or datetime.now(timezone.utc).isoformat(),
+            "codec": self.codec,
+            "logical_bytes": sum(int(f.get("size_bytes") or 0) for f in files),
+            "stored_bytes": sum(int(f.get("stored_bytes") or 0) for f in files),
+            "files": files,
+            "meta": meta or {},
+        }
+        _atomic_write_bytes(
+            self.manifest_path(namespace, manifest_id),
+            json.dumps(manifest, indent=2, default=str).encode("utf-8"),
+        )
+        return manifest
+
+    def load_manifest(self, namespace: str, manifest_id: str) -> Optional[Dict[str, Any]]:
+        p = self.manifest_path(namespace, manifest_id)
+        if not p.exists():
+            return None
+        with open(p, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def delete_manifest(self, namespace: str, manifest_id: str) -> bool:
+        p = self.manifest_path(namespace, manifest_id)
+        if not p.exists():
+            return False
+        p.unlink()
+        return True
+
+    def iter_manifests(self) -> Iterator[Dict[str, Any]]:
+        base = self.root / "manifests"
+        if not base.exists():
+            return
+        for p in sorted(base.glob("*/*.json")):
+            try:
+                with open(p, "r", encoding="utf-8") as f:
+                    yield json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning("[ARCHIVE] Unreadable manifest %s: %s", p, e)
+
+    # -- restore / maintenance -------------------------------------------------
+
+    def restore(
+        self,
+        manifest: Dict[str, Any],
+        dest_dir: Path,
+        names: Optional[Iterable[str]] = None,
+    ) -> List[Path]:
+        """Write the manifest's files (or only `names`) into dest_dir. Content is verified before writing."""
+        wanted = set(names) if names is not None else None
+        dest_dir = Path(dest_dir)
+        written: List[Path] = []
+        for entry in manifest.get("files") or []:
+            if wanted is not None and entry["name"] not in wanted:
+                continue
+            data = self.read_bytes(entry)
+            out = dest_dir / entry["name"]
+            _atomic_write_bytes(out, data)
+            mtime = entry.get("last_modified_utc")
+            if mtime:
+                try:
+                    ts = datetime.fromisoformat(str(mtime).replace("Z", "+00:00")).timestamp()
+                    os.utime(out, (ts, ts))
+                except (ValueError, OSError):
+                    pass
+            written.append(out)
+        return written
+
+    def gc(self, dry_run: bool = False, min_age_seconds: Optional[float] = None) -> Dict[str, int]:
+        """
+        Delete objects referenced by no manifest and not modified for min_age_seconds (default
+        GC_GRACE_SEC), so objects of a write whose manifest is not on disk yet are kept.
+        Returns {objects_removed, bytes_freed, objects_kept}.
+        """
+        grace = GC_GRACE_SEC if min_age_seconds is None else min_age_seconds
+        cutoff = datetime.now(timezone.utc).timestamp() - grace
+        live = {d for m in self.iter_manifests() for f in m.get("files") or [] for d in f.get("chunks") or []}
+        removed = freed = kept = 0
+        base = self.root / "objects"
+        if base.exists():
+            for p in base.glob("*/*"):
+                if p.name.startswith(".tmp_"):
+                    continue
+                try:
+                    st = p.stat()
+                except FileNotFoundError:
+                    continue
+                if p.stem in live or st.st_mtime > cutoff:
+                    kept += 1
+                    continue
+                removed += 1
+                freed += st.st_size
+                if not dry_run:
+                    p.unlink(missing_ok=True)
+        if removed:
+            logger.info("[ARCHIVE] gc %s %d unreferenced objects (%d bytes)",
+                        "would remove" if dry_run else "removed", removed, freed)
+        return {"objects_removed": removed, "bytes_freed": freed, "objects_kept": kept}
+
+    def report(self, days: int = 90, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Space report for manifests created in the last `days` days: logical bytes (what plain
+        copies would take) vs compressed bytes those manifests actually added to the archive.
+        """
+        now = now or datetime.now(timezone.utc)
+        since = now - timedelta(days=days)
+        by_ns: Dict[str, Dict[str, int]] = {}
+        for m in self.iter_manifests():
+            try:
+                created = datetime.fromisoformat(str(m.get("created_at_utc")).replace("Z", "+00:00"))
+            except ValueError:
+                continue
+            if created < since:
+                continue
+            ns = by_ns.setdefault(m.get("namespace") or "?", {"manifests": 0, "files": 0, "logical_bytes": 0, "stored_bytes": 0})
+            ns["manifests"] += 1
+            ns["files"] += len(m.get("files") or [])
+            ns["logical_bytes"] += int(m.get("logical_bytes") or 0)
+            ns["stored_bytes"] += int(m.get("stored_bytes") or 0)
+        logical = sum(v["logical_bytes"] for v in by_ns.values())
+        stored = sum(v["stored_bytes"] for v in by_ns.values())
+        objects = list((self.root / "objects").glob("*/*")) if (self.root / "objects").exists() else []
+        return {
+            "root": str(self.root),
+            "days": days,
+            "since_utc": since.isoformat(),
+            "logical_bytes": logical,
+            "stored_bytes": stored,
+            "saved_bytes": logical - stored,
+            "saved_pct": round(100.0 * (logical - stored) / logical, 1) if logical else 0.0,
+            "by_namespace": by_ns,
+            "objects": len(objects),
+            "archive_bytes": sum(p.stat().st_size for p in objects),
+        }
+
+
+__all__ = [
+    "ArchiveError",
+    "GC_GRACE_SEC",
+    "MANIFEST_FORMAT",
+    "SnapshotArchive",
+    "default_archive_root",
+    "default_codec",
+    "iter_chunks",
+]
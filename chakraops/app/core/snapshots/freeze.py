@@ -2,19 +2,22 @@
 # SPDX-License-Identifier: MIT
 """
 EOD freeze snapshot — archival copy of persisted stores.
-Creates out/snapshots/YYYY-MM-DD_eod/ with copies. NEVER read by runtime.
+Creates out/snapshots/YYYY-MM-DD_eod/snapshot_manifest.json. NEVER read by runtime.
+File content goes to the shared content-addressed archive (app.core.snapshots.archive),
+so days where a store did not change cost no extra space; restore with scripts/snapshot_archive.py.
 """
 
 from __future__ import annotations
 
 import json
 import logging
-import shutil
 import subprocess
 import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Literal
+from typing import Any, Dict, List, Literal, Optional
+
+from app.core.snapshots.archive import SnapshotArchive
 
 logger = logging.getLogger(__name__)
 
@@ -45,14 +48,19 @@ def run_freeze_snapshot(
     extra_paths: List[Path],
     mode: FreezeMode,
     now_utc: datetime | None = None,
+    archive: Optional[SnapshotArchive] = None,
 ) -> Dict[str, Any]:
     """
-    Archive persisted stores into out/snapshots/YYYY-MM-DD_eod/.
+    Archive persisted stores for out/snapshots/YYYY-MM-DD_eod/.
     mode: archive_only = just copy; eval_then_archive is handled by caller (run eval, then call with archive_only).
+    Files are stored in `archive` (default: shared archive root) and listed with their chunk hashes in
+    snapshot_manifest.json, which is also kept in the archive as manifests/eod/YYYY-MM-DD_eod.json.
     Uses atomic manifest write (temp then rename).
     Skips missing files with note in manifest.
     Returns {snapshot_dir, manifest, copied_files}.
     """
+    if archive is None:
+        archive = SnapshotArchive()
     if now_utc is None:
         now_utc = datetime.now(timezone.utc)
     try:
@@ -79,15 +87,8 @@ def run_freeze_snapshot(
         if not src.exists():
             manifest["skipped"].append({"name": dest_name, "reason": "not found"})
             return False
-        dst = snap_dir / dest_name
         try:
-            shutil.copy2(src, dst)
-            st = dst.stat()
-            manifest["files"].append({
-                "name": dest_name,
-                "size_bytes": st.st_size,
-                "last_modified_utc": datetime.fromtimestamp(st.st_mtime, tz=timezone.utc).isoformat(),
-            })
+            manifest["files"].append(archive.put_file(src, dest_name))
             copied_files.append(dest_name)
             return True
         except Exception as e:
@@ -117,6 +118,21 @@ def run_freeze_snapshot(
         if dest_name not in copied_files:
             _copy_one(src, dest_name)
 
+    snapshot_id = snap_dir.name
+    archived = archive.write_manifest(
+        "eod", snapshot_id, manifest["files"],
+        meta={"mode": mode, "git_commit": manifest["git_commit"], "skipped": manifest["skipped"]},
+        created_at_utc=manifest["created_at_utc"],
+    )
+    manifest["archive"] = {
+        "root": str(archive.root),
+        "namespace": "eod",
+        "id": snapshot_id,
+        "codec": archived["codec"],
+        "logical_bytes": archived["logical_bytes"],
+        "stored_bytes": archived["stored_bytes"],
+    }
+
     # Atomic manifest write
     manifest_path = snap_dir / "snapshot_manifest.json"
     try:
@@ -135,7 +151,10 @@ def run_freeze_snapshot(
         with open(manifest_path, "w", encoding="utf-8") as f:
             json.dump(manifest, f, indent=2)
 
-    logger.info("[FREEZE] Created %s with %d files", snap_dir, len(copied_files))
+    logger.info(
+        "[FREEZE] Created %s with %d files (%d bytes, %d new archived bytes)",
+        snap_dir, len(copied_files), archived["logical_bytes"], archived["stored_bytes"],
+    )
     return {
         "snapshot_dir": str(snap_dir),
         "manifest": manifest,
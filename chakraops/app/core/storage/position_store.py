@@ -24,9 +24,102 @@ from typing import Any, List, Optional
 
 from app.core.models.position import Position, PositionStatus
 from app.core.config.paths import DB_PATH
+from app.db.migrations import Migration, ensure_schema
 from app.models.exit_plan import exit_plan_from_dict, exit_plan_to_dict, get_default_exit_plan
 
 
+def _migrate_positions_v1(cursor: sqlite3.Cursor) -> None:
+    """Baseline positions schema (pre-versioning): table, state/exit-plan columns, Phase 6.3 lifecycle/PnL columns.
+
+    Idempotent so existing databases adopt it as v1.
+    """
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS positions (
+            id TEXT PRIMARY KEY,
+            symbol TEXT NOT NULL,
+            position_type TEXT NOT NULL,
+            strike REAL,
+            expiry TEXT,
+            contracts INTEGER NOT NULL,
+            premium_collected REAL NOT NULL,
+            entry_date TEXT NOT NULL,
+            status TEXT NOT NULL,
+            state TEXT,
+            state_history TEXT,
+            notes TEXT,
+            exit_plan TEXT
+        )
+        """
+    )
+
+    # Migrate existing data: add state and state_history columns if they don't exist
+    try:
+        cursor.execute("ALTER TABLE positions ADD COLUMN state TEXT")
+    except sqlite3.OperationalError:
+        pass  # Column already exists
+
+    try:
+        cursor.execute("ALTER TABLE positions ADD COLUMN state_history TEXT")
+    except sqlite3.OperationalError:
+        pass  # Column already exists
+
+    try:
+        cursor.execute("ALTER TABLE positions ADD COLUMN exit_plan TEXT")
+    except sqlite3.OperationalError:
+        pass  # Column already exists
+
+    # Migrate existing positions: set state from status if state is NULL
+    cursor.execute("""
+        UPDATE positions
+        SET state = CASE
+            WHEN status = 'OPEN' THEN 'OPEN'
+            WHEN status = 'ASSIGNED' THEN 'ASSIGNED'
+            WHEN status = 'CLOSED' THEN 'CLOSED'
+            ELSE 'OPEN'
+        END
+        WHERE state IS NULL
+    """)
+
+    # Initialize empty state_history for positions that don't have it
+    cursor.execute("""
+        UPDATE positions
+        SET state_history = '[]'
+        WHERE state_history IS NULL
+    """)
+
+    # Phase 6.3: position lifecycle and PnL columns
+    for col, typ in [
+        ("entry_credit", "REAL"),
+        ("open_date", "TEXT"),
+        ("close_date", "TEXT"),
+        ("realized_pnl", "REAL"),
+        ("lifecycle_state", "TEXT"),
+    ]:
+        try:
+            cursor.execute(f"ALTER TABLE positions ADD COLUMN {col} {typ}")
+        except sqlite3.OperationalError:
+            pass  # Column already exists
+    cursor.execute("""
+        UPDATE positions SET lifecycle_state = state WHERE lifecycle_state IS NULL
+    """)
+    cursor.execute("""
+        UPDATE positions SET entry_credit = premium_collected WHERE entry_credit IS NULL
+    """)
+    cursor.execute("""
+        UPDATE positions SET open_date = substr(entry_date, 1, 10) WHERE open_date IS NULL AND entry_date IS NOT NULL
+    """)
+    cursor.execute("""
+        UPDATE positions SET realized_pnl = 0 WHERE realized_pnl IS NULL
+    """)
+
+
+# Versioned schema steps for the positions table (see app.db.migrations).
+POSITION_MIGRATIONS = (
+    Migration(1, "baseline", _migrate_positions_v1),
+)
+
+
 class PositionStore:
     """Persistence layer for :class:`Position` objects using SQLite."""
 
@@ -56,94 +149,8 @@ class PositionStore:
         return conn
 
     def _init_db(self) -> None:
-        """Initialize the database schema if it does not exist."""
-        conn = self._get_connection()
-        try:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS positions (
-                    id TEXT PRIMARY KEY,
-                    symbol TEXT NOT NULL,
-                    position_type TEXT NOT NULL,
-                    strike REAL,
-                    expiry TEXT,
-                    contracts INTEGER NOT NULL,
-                    premium_collected REAL NOT NULL,
-                    entry_date TEXT NOT NULL,
-                    status TEXT NOT NULL,
-                    state TEXT,
-                    state_history TEXT,
-                    notes TEXT,
-                    exit_plan TEXT
-                )
-                """
-            )
-            conn.commit()
-            
-            # Migrate existing data: add state and state_history columns if they don't exist
-            try:
-                cursor.execute("ALTER TABLE positions ADD COLUMN state TEXT")
-            except sqlite3.OperationalError:
-                pass  # Column already exists
-            
-            try:
-                cursor.execute("ALTER TABLE positions ADD COLUMN state_history TEXT")
-            except sqlite3.OperationalError:
-                pass  # Column already exists
-
-            try:
-                cursor.execute("ALTER TABLE positions ADD COLUMN exit_plan TEXT")
-            except sqlite3.OperationalError:
-                pass  # Column already exists
-
-            # Migrate existing positions: set state from status if state is NULL
-            cursor.execute("""
-                UPDATE positions
-                SET state = CASE
-                    WHEN status = 'OPEN' THEN 'OPEN'
-                    WHEN status = 'ASSIGNED' THEN 'ASSIGNED'
-                    WHEN status = 'CLOSED' THEN 'CLOSED'
-                    ELSE 'OPEN'
-                END
-                WHERE state IS NULL
-            """)
-            
-            # Initialize empty state_history for positions that don't have it
-            cursor.execute("""
-                UPDATE positions
-                SET state_history = '[]'
-                WHERE state_history IS NULL
-            """)
-
-            # Phase 6.3: position lifecycle and PnL columns
-            for col, typ in [
-                ("entry_credit", "REAL"),
-                ("open_date", "TEXT"),
-                ("close_date", "TEXT"),
-                ("realized_pnl", "REAL"),
-                ("lifecycle_state", "TEXT"),
-            ]:
-                try:
-                    cursor.execute(f"ALTER TABLE positions ADD COLUMN {col} {typ}")
-                except sqlite3.OperationalError:
-                    pass  # Column already exists
-            cursor.execute("""
-                UPDATE positions SET lifecycle_state = state WHERE lifecycle_state IS NULL
-            """)
-            cursor.execute("""
-                UPDATE positions SET entry_credit = premium_collected WHERE entry_credit IS NULL
-            """)
-            cursor.execute("""
-                UPDATE positions SET open_date = substr(entry_date, 1, 10) WHERE open_date IS NULL AND entry_date IS NOT NULL
-            """)
-            cursor.execute("""
-                UPDATE positions SET realized_pnl = 0 WHERE realized_pnl IS NULL
-            """)
-            
-            conn.commit()
-        finally:
-            conn.close()
+        """Ensure the positions schema is migrated (runs once per process per DB file)."""
+        ensure_schema(self.db_path, "positions", POSITION_MIGRATIONS)
 
     # ------------------------------------------------------------------ #
     # Public API
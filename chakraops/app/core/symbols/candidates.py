@@ -22,11 +22,8 @@ def _load_symbol_from_latest(symbol: str) -> Optional[Dict[str, Any]]:
         return None
     if not run or not run.symbols:
         return None
-    sym_upper = (symbol or "").strip().upper()
-    for s in run.symbols:
-        if isinstance(s, dict) and (s.get("symbol") or "").strip().upper() == sym_upper:
-            return s
-    return None
+    s = run.get_symbol_row(symbol)
+    return s if isinstance(s, dict) else None
 
 # Delta-based labels for CSP puts: more negative = more OTM = conservative
 def _csp_label(delta: Optional[float]) -> str:
@@ -30,11 +30,8 @@ def _load_symbol_from_latest(symbol: str) -> Optional[Dict[str, Any]]:
     if not run or not run.symbols:
         return None
 
-    sym_upper = (symbol or "").strip().upper()
-    for s in run.symbols:
-        if isinstance(s, dict) and (s.get("symbol") or "").strip().upper() == sym_upper:
-            return s
-    return None
+    s = run.get_symbol_row(symbol)
+    return s if isinstance(s, dict) else None
 
 
 def _normalize_gate(g: Dict[str, Any]) -> Dict[str, Any]:
@@ -91,6 +91,8 @@ def put_targets(symbol: str, data: Dict[str, Any]) -> Dict[str, Any]:
     with _LOCK:
         with open(path, "w", encoding="utf-8") as f:
             json.dump(out, f, indent=2)
+    from app.core.lifecycle.trigger_index import notify_targets_saved
+    notify_targets_saved(sym, out)
     return out
 
 
@@ -7,6 +7,7 @@ Phase 8.7: Universe Manifest + Tiered Scheduler.
 - Tiering controls evaluation cadence per symbol group.
 - Round-robin prevents stalls when max_symbols_per_cycle caps selection.
 - Benchmark script provides estimates only (no external calls).
+- TieredScheduler dispatches due symbols continuously in small merged batches.
 """
 
 from __future__ import annotations
@@ -16,9 +17,12 @@ from app.core.universe.universe_manager import (
     load_universe_manifest,
 )
 from app.core.universe.universe_state_store import UniverseStateStore
+from app.core.universe.tiered_scheduler import TieredScheduler, get_tiered_scheduler
 
 __all__ = [
     "get_symbols_for_cycle",
     "load_universe_manifest",
     "UniverseStateStore",
+    "TieredScheduler",
+    "get_tiered_scheduler",
 ]
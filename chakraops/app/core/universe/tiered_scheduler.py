@@ -0,0 +1,373 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""
+Continuous tiered scheduler — per-symbol due times instead of a fixed-interval full run.
+
+The interval scheduler re-evaluated the whole universe every UNIVERSE_EVAL_MINUTES, so every
+ORATS request for the cycle landed in one burst and the tiers' cadence_minutes were ignored
+by the API. TieredScheduler keeps one priority queue of (next_due, symbol) over all tiers:
+
+  - every enabled tier symbol (symbol_overrides enabled=false skipped) is due every
+    cadence_minutes; universe symbols not listed in any tier use the manifest's cycle_minutes
+  - each tick pops at most batch_size due symbols and runs them through
+    evaluate_symbols_and_merge, which merges the results into the v2 store incrementally
+  - symbols never evaluated are staggered across their cadence, so load is spread evenly
+    from the first cycle; last evaluation times persist in UniverseStateStore
+  - cadence is scaled per market phase (PHASE_CADENCE_FACTORS; a phase without a factor
+    pauses dispatch) and stretched when the projected request rate would exceed the
+    EvaluationBudget request estimate for a cycle; batches are also paced within the cycle
+
+A failed batch is retried after RETRY_DELAY_SEC. Enabled in the API with TIERED_SCHEDULER_ENABLED.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import os
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from app.core.config.eval_config import EVAL_BATCH_SIZE
+from app.core.universe.universe_manager import load_universe_manifest
+from app.core.universe.universe_state_store import UniverseStateStore
+
+logger = logging.getLogger(__name__)
+
+# Batches only merge into the v2 decision store. Unlike trigger_evaluation, the tiered path does
+# not save an evaluation run (run store, run artifacts, latest pointer) or run the run-completed
+# alert / eval-summary hooks, and the universe-evaluation views keep the last full run. Keep the
+# nightly run (or /api/ops/evaluate) for those.
+TIERED_SCHEDULER_ENABLED = os.getenv("TIERED_SCHEDULER_ENABLED", "false").lower() in ("true", "1", "yes")
+TICK_SECONDS = max(1, int(os.getenv("TIERED_SCHEDULER_TICK_SEC", "30")))
+RETRY_DELAY_SEC = 120.0
+FALLBACK_TIER = "UNIVERSE"
+
+
+def _parse_phase_factors(raw: str) -> Dict[str, float]:
+    """'OPEN=1,POST=4' -> {"OPEN": 1.0, "POST": 4.0}. Factors <= 0 or unparsable entries are dropped."""
+    out: Dict[str, float] = {}
+    for part in raw.split(","):
+        name, _, value = part.partition("=")
+        try:
+            factor = float(value)
+        except ValueError:
+            continue
+        if name.strip() and factor > 0:
+            out[name.strip().upper()] = factor
+    return out
+
+
+# Market phase -> cadence multiplier. Phases not listed pause dispatch (the interval scheduler
+# also only evaluates while OPEN). e.g. TIERED_SCHEDULER_PHASES="OPEN=1,PRE=4,POST=4"
+PHASE_CADENCE_FACTORS: Dict[str, float] = _parse_phase_factors(os.getenv("TIERED_SCHEDULER_PHASES", "OPEN=1"))
+
+
+def _default_evaluate(symbols: List[str]) -> Any:
+    from app.core.eval.evaluation_service_v2 import evaluate_symbols_and_merge
+    return evaluate_symbols_and_merge(symbols)
+
+
+def _default_busy() -> bool:
+    """True while a triggered full universe run is in progress (its results would overwrite the merge)."""
+    from app.core.eval.universe_evaluator import is_evaluation_running
+    return is_evaluation_running()
+
+
+def _default_fallback_symbols() -> List[str]:
+    from app.api.data_health import UNIVERSE_SYMBOLS
+    return list(UNIVERSE_SYMBOLS or [])
+
+
+def _parse_iso(value: Any) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+    except (ValueError, TypeError):
+        return None
+
+
+def _iso(ts: Optional[float]) -> Optional[str]:
+    return datetime.fromtimestamp(ts, tz=timezone.utc).isoformat() if ts is not None else None
+
+
+class TieredScheduler:
+    """Priority queue of per-symbol due times; tick() dispatches small batches of due symbols."""
+
+    def __init__(
+        self,
+        manifest_path: Optional[Union[str, Path]] = None,
+        state_store: Optional[UniverseStateStore] = None,
+        *,
+        evaluate: Callable[[List[str]], Any] = _default_evaluate,
+        busy: Callable[[], bool] = _default_busy,
+        fallback_symbols: Callable[[], List[str]] = _default_fallback_symbols,
+        batch_size: int = EVAL_BATCH_SIZE,
+        phase_factors: Optional[Dict[str, float]] = None,
+    ) -> None:
+        self._manifest_path = manifest_path
+        self._state_store = state_store or UniverseStateStore()
+        self._evaluate = evaluate
+        self._busy = busy
+        self._fallback_symbols = fallback_symbols
+        self.batch_size = max(1, int(batch_size))
+        self.phase_factors = dict(PHASE_CADENCE_FACTORS if phase_factors is None else phase_factors)
+        self._lock = threading.Lock()
+        # (due epoch, seq, symbol); entries whose due no longer matches self._due are stale
+        self._heap: List[Tuple[float, int, str]] = []
+        self._seq = itertools.count()
+        self._due: Dict[str, float] = {}
+        self._tier_of: Dict[str, str] = {}
+        self._cadence_sec: Dict[str, float] = {}
+        self._last_eval: Dict[str, float] = {}
+        self._signature: Optional[Tuple[Any, ...]] = None
+        self._loaded = False
+        self.cycle_sec = 1800.0
+        self.budget_factor = 1.0
+        self._budget: Any = None
+        self._stats: Dict[str, Any] = {
+            "ticks": 0,
+            "batches": 0,
+            "symbols_evaluated": 0,
+            "errors": 0,
+            "last_tick_at": None,
+            "last_batch": [],
+            "last_batch_at": None,
+            "last_skip_reason": None,
+            "last_error": None,
+        }
+
+    # ------------------------------------------------------------------ queue
+
+    def _push(self, symbol: str, due: float) -> None:
+        self._due[symbol] = due
+        heapq.heappush(self._heap, (due, next(self._seq), symbol))
+
+    def _assignments(self, manifest: Dict[str, Any]) -> Dict[str, Tuple[str, float]]:
+        """symbol -> (tier name, cadence seconds); first enabled tier listing a symbol wins."""
+        overrides = manifest.get("symbol_overrides") or {}
+        out: Dict[str, Tuple[str, float]] = {}
+        for t in manifest.get("tiers") or []:
+            if not t.get("enabled", True):
+                continue
+            cadence = 60.0 * float(t.get("cadence_minutes") or manifest.get("cycle_minutes") or 30)
+            for sym in t.get("symbols") or []:
+                s = (sym or "").strip().upper()
+                ov = overrides.get(s) if isinstance(overrides.get(s), dict) else None
+                if not s or s in out or (ov is not None and ov.get("enabled") is False):
+                    continue
+                out[s] = (t.get("name") or "?", cadence)
+        for sym in self._fallback_symbols():
+            s = (sym or "").strip().upper()
+            ov = overrides.get(s) if isinstance(overrides.get(s), dict) else None
+            if s and s not in out and not (ov is not None and ov.get("enabled") is False):
+                out[s] = (FALLBACK_TIER, self.cycle_sec)
+        return out
+
+    def _sync_locked(self, now: float) -> None:
+        """Reconcile the queue with the manifest: add new symbols, drop removed ones, apply cadence changes."""
+        manifest = load_universe_manifest(self._manifest_path)
+        self.cycle_sec = 60.0 * float(manifest.get("cycle_minutes") or 30)
+        assignments = self._assignments(manifest)
+        signature = (self.cycle_sec, tuple(sorted(assignments.items())))
+        if signature == self._signature:
+            return
+        self._signature = signature
+        if not self._loaded:
+            state = self._state_store.load()
+            for sym, iso in (state.get("symbol_last_eval_utc") or {}).items():
+                ts = _parse_iso(iso)
+                if ts is not None:
+                    self._last_eval[sym] = ts
+            self._loaded = True
+
+        for sym in list(self._due):
+            if sym not in assignments:
+                del self._due[sym]
+                self._tier_of.pop(sym, None)
+                self._cadence_sec.pop(sym, None)
+
+        fresh: Dict[str, List[str]] = {}
+        for sym, (tier, cadence) in assignments.items():
+            changed = self._cadence_sec.get(sym) != cadence
+            self._tier_of[sym] = tier
+            self._cadence_sec[sym] = cadence
+            last = self._last_eval.get(sym)
+            if last is None:
+                if sym not in self._due:
+                    fresh.setdefault(tier, []).append(sym)
+            elif changed or sym not in self._due:
+                self._push(sym, last + cadence)
+        # Never-evaluated symbols are spread evenly over their tier's cadence
+        for syms in fresh.values():
+            for i, sym in enumerate(syms):
+                self._push(sym, now + self._cadence_sec[sym] * i / len(syms))
+        self._update_budget_factor_locked()
+        logger.info(
+            "[TIERED_SCHED] synced %d symbols in %d tiers (budget_factor=%.2f)",
+            len(self._due), len(set(self._tier_of.values())), self.budget_factor,
+        )
+
+    def _update_budget_factor_locked(self) -> None:
+        """Stretch every cadence when the projected requests per cycle exceed the budget estimate."""
+        from app.core.eval.evaluation_budget import EvaluationBudget
+        from app.core.eval.request_cost_model import estimate_requests_for_symbols
+
+        budget = EvaluationBudget.from_config()
+        per_symbol = estimate_requests_for_symbols(["_"])
+        projected = sum(per_symbol * self.cycle_sec / c for c in self._cadence_sec.values() if c > 0)
+        self.budget_factor = max(1.0, projected / budget.max_requests_estimate) if budget.max_requests_estimate else 1.0
+
+    def _pop_due_locked(self, now: float) -> List[str]:
+        batch: List[str] = []
+        while self._heap and len(batch) < self.batch_size and self._heap[0][0] <= now:
+            due, _, sym = heapq.heappop(self._heap)
+            if self._due.get(sym) == due:
+                del self._due[sym]
+                batch.append(sym)
+        return batch
+
+    # ------------------------------------------------------------------ budget
+
+    def _budget_allows_locked(self, now: float) -> bool:
+        """
+        Pace requests across the cycle: a new batch starts only while the cycle's request
+        estimate is within its pro-rata share of max_requests_estimate.
+        """
+        from app.core.eval.evaluation_budget import EvaluationBudget
+
+        now_dt = datetime.fromtimestamp(now, tz=timezone.utc)
+        if self._budget is None or not self._budget.can_continue(now_dt):
+            self._budget = EvaluationBudget.from_config(max_wall_time_sec=int(self.cycle_sec), started_at=now_dt)
+        elapsed = (now_dt - self._budget.started_at).total_seconds()
+        return self._budget.requests_estimated <= self._budget.max_requests_estimate * elapsed / self.cycle_sec
+
+    # ------------------------------------------------------------------ API
+
+    def tick(self, now: Optional[datetime] = None, phase: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Dispatch one batch of due symbols, if any. Returns {"dispatched", "symbols", "skip_reason"}.
+        Symbols are rescheduled before returning, whether the batch succeeded or not.
+        """
+        from app.core.eval.request_cost_model import estimate_requests_for_symbols
+        from app.market.market_hours import get_market_phase
+
+        now_dt = now or datetime.now(timezone.utc)
+        ts = now_dt.timestamp()
+        phase = phase or get_market_phase(now_dt) or "UNKNOWN"
+        with self._lock:
+            self._stats["ticks"] += 1
+            self._stats["last_tick_at"] = now_dt.isoformat()
+            self._sync_locked(ts)
+            factor = self.phase_factors.get(phase)
+            skip = None
+            if factor is None:
+                skip = "market_closed"
+            elif not self._heap or self._heap[0][0] > ts:
+                skip = "nothing_due"
+            elif not self._budget_allows_locked(ts):
+                skip = "budget_pacing"
+            batch = [] if skip else self._pop_due_locked(ts)
+        if not skip and self._busy():
+            skip = "evaluation_running"
+            with self._lock:
+                for sym in batch:
+                    self._push(sym, ts)
+            batch = []
+        if skip or not batch:
+            with self._lock:
+                self._stats["last_skip_reason"] = skip or "nothing_due"
+            return {"dispatched": 0, "symbols": [], "skip_reason": skip or "nothing_due"}
+
+        error: Optional[str] = None
+        try:
+            self._evaluate(batch)
+        except Exception as e:
+            error = str(e)
+            logger.warning("[TIERED_SCHED] batch %s failed: %s", ",".join(batch), e)
+
+        with self._lock:
+            self._stats["last_batch"] = list(batch)
+            self._stats["last_batch_at"] = now_dt.isoformat()
+            self._stats["last_skip_reason"] = None
+            if error is not None:
+                self._stats["errors"] += 1
+                self._stats["last_error"] = error
+                for sym in batch:
+                    if sym in self._tier_of:
+                        self._push(sym, ts + min(RETRY_DELAY_SEC, self._cadence_sec[sym]))
+            else:
+                self._stats["batches"] += 1
+                self._stats["symbols_evaluated"] += len(batch)
+                if self._budget is not None:
+                    self._budget.record_batch(len(batch), requests_estimate=estimate_requests_for_symbols(batch))
+                for sym in batch:
+                    self._last_eval[sym] = ts
+                    if sym in self._tier_of:
+                        self._push(sym, ts + self._cadence_sec[sym] * factor * self.budget_factor)
+                self._save_state_locked()
+        logger.info("[TIERED_SCHED] phase=%s dispatched %d symbols ok=%s", phase, len(batch), error is None)
+        return {"dispatched": len(batch), "symbols": batch, "skip_reason": None, "error": error}
+
+    def _save_state_locked(self) -> None:
+        try:
+            state = self._state_store.load()
+            state["symbol_last_eval_utc"] = {
+                sym: _iso(ts) for sym, ts in sorted(self._last_eval.items()) if sym in self._tier_of
+            }
+            self._state_store.save(state)
+        except OSError as e:
+            logger.warning("[TIERED_SCHED] state save failed: %s", e)
+
+    def next_due_at(self) -> Optional[str]:
+        with self._lock:
+            return _iso(min(self._due.values())) if self._due else None
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            tiers: Dict[str, Dict[str, Any]] = {}
+            for sym, tier in self._tier_of.items():
+                t = tiers.setdefault(tier, {"symbols": 0, "cadence_minutes": self._cadence_sec[sym] / 60.0, "next_due_at": None})
+                t["symbols"] += 1
+                due = self._due.get(sym)
+                if due is not None and (t["next_due_at"] is None or due < t["next_due_at"]):
+                    t["next_due_at"] = due
+            for t in tiers.values():
+                t["next_due_at"] = _iso(t["next_due_at"])
+            out = dict(self._stats)
+            out.update({
+                "queued": len(self._due),
+                "batch_size": self.batch_size,
+                "phase_factors": dict(self.phase_factors),
+                "budget_factor": round(self.budget_factor, 3),
+                "budget": self._budget.budget_status() if self._budget is not None else None,
+                "next_due_at": _iso(min(self._due.values())) if self._due else None,
+                "tiers": dict(sorted(tiers.items())),
+            })
+            return out
+
+
+_SCHEDULER: Optional[TieredScheduler] = None
+_SCHEDULER_LOCK = threading.Lock()
+
+
+def get_tiered_scheduler() -> TieredScheduler:
+    """Process-wide scheduler over the default manifest and universe state paths."""
+    global _SCHEDULER
+    with _SCHEDULER_LOCK:
+        if _SCHEDULER is None:
+            _SCHEDULER = TieredScheduler()
+        return _SCHEDULER
+
+
+__all__ = [
+    "PHASE_CADENCE_FACTORS",
+    "TIERED_SCHEDULER_ENABLED",
+    "TICK_SECONDS",
+    "TieredScheduler",
+    "get_tiered_scheduler",
+]
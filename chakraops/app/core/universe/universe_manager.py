@@ -16,6 +16,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
+from app.core.config.registry import get_config, register_config
 from app.core.universe.universe_state_store import UniverseStateStore
 
 logger = logging.getLogger(__name__)
@@ -43,21 +44,15 @@ def _default_manifest_path() -> Path:
     return repo / "artifacts" / "config" / "universe.json"
 
 
-def load_universe_manifest(path: Optional[Union[str, Path]] = None) -> Dict[str, Any]:
-    """
-    Load universe manifest from JSON.
-    If file missing, return safe default manifest with CORE tier only.
-    If invalid (missing required keys), raise ValueError.
-    """
-    p = Path(path) if path is not None else _default_manifest_path()
-    if not p.exists():
-        logger.info("[UNIVERSE] Manifest not found at %s, using default", p)
-        return dict(_DEFAULT_MANIFEST)
+def _parse_manifest(path: Path) -> Any:
     try:
-        with open(p, encoding="utf-8") as f:
-            data = json.load(f)
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
     except (OSError, json.JSONDecodeError) as e:
         raise ValueError(f"Universe manifest invalid or unreadable: {e}") from e
+
+
+def _validate_manifest(data: Any) -> Dict[str, Any]:
     if not isinstance(data, dict):
         raise ValueError("Universe manifest must be a JSON object")
     # Validate required keys
@@ -77,6 +72,30 @@ def load_universe_manifest(path: Optional[Union[str, Path]] = None) -> Dict[str,
     return data
 
 
+register_config(
+    "universe_manifest",
+    parse=_parse_manifest,
+    validate=_validate_manifest,
+    missing=lambda: dict(_DEFAULT_MANIFEST),
+)
+
+
+def load_universe_manifest(path: Optional[Union[str, Path]] = None) -> Dict[str, Any]:
+    """
+    Load universe manifest from JSON.
+    If file missing, return safe default manifest with CORE tier only.
+    If invalid (missing required keys), raise ValueError.
+    Parsed and validated once per file version via the config registry.
+    """
+    p = Path(path) if path is not None else _default_manifest_path()
+    snapshot = get_config("universe_manifest", p)
+    if snapshot.error is not None:
+        raise ValueError(snapshot.error)
+    if not snapshot.exists:
+        logger.info("[UNIVERSE] Manifest not found at %s, using default", p)
+    return snapshot.mutable()
+
+
 def get_symbols_for_cycle(
     manifest: Dict[str, Any],
     now_utc: datetime,
@@ -4,6 +4,7 @@
 Phase 8.7: File-backed state for universe tier scheduling.
 
 Watchdog-safe: creates path if missing, atomic writes.
+Also holds symbol_last_eval_utc for the continuous tiered scheduler.
 """
 
 from __future__ import annotations
@@ -20,9 +21,14 @@ def _default_state_path() -> Path:
     return repo / "artifacts" / "state" / "universe_state.json"
 
 
+def _empty_state() -> Dict[str, Any]:
+    return {"tier_last_run_utc": {}, "tier_cursor": {}, "symbol_last_eval_utc": {}}
+
+
 class UniverseStateStore:
     """
-    Persists tier_last_run_utc and tier_cursor for round-robin scheduling.
+    Persists tier_last_run_utc and tier_cursor for round-robin scheduling, and
+    symbol_last_eval_utc (symbol -> ISO time) for the tiered scheduler's due times.
     Creates state file if missing; uses atomic write (write to temp, then rename).
     """
 
@@ -32,17 +38,18 @@ class UniverseStateStore:
     def load(self) -> Dict[str, Any]:
         """Load state; returns defaults if file missing or invalid."""
         if not self._path.exists():
-            return {"tier_last_run_utc": {}, "tier_cursor": {}}
+            return _empty_state()
         try:
             with open(self._path, encoding="utf-8") as f:
                 data = json.load(f)
         except (OSError, json.JSONDecodeError):
-            return {"tier_last_run_utc": {}, "tier_cursor": {}}
+            return _empty_state()
         if not isinstance(data, dict):
-            return {"tier_last_run_utc": {}, "tier_cursor": {}}
+            return _empty_state()
         return {
             "tier_last_run_utc": dict(data.get("tier_last_run_utc") or {}),
             "tier_cursor": dict(data.get("tier_cursor") or {}),
+            "symbol_last_eval_utc": dict(data.get("symbol_last_eval_utc") or {}),
         }
 
     def save(self, state: Dict[str, Any]) -> None:
@@ -51,6 +58,7 @@ class UniverseStateStore:
         data = {
             "tier_last_run_utc": dict(state.get("tier_last_run_utc") or {}),
             "tier_cursor": dict(state.get("tier_cursor") or {}),
+            "symbol_last_eval_utc": dict(state.get("symbol_last_eval_utc") or {}),
         }
         fd, tmp = tempfile.mkstemp(
             dir=self._path.parent,
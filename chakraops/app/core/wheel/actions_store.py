@@ -69,14 +69,17 @@ def append_wheel_action(symbol: str, action: str, position_id: Optional[str] = N
     }
     if position_id:
         record["position_id"] = position_id
+    from app.core.portfolio.read_model import notify_before_write, notify_wheel_action
     path = _wheel_actions_path()
     line = json.dumps(record, default=str)
+    notify_before_write("wheel_actions")
     with _LOCK:
         from app.core.io.locks import with_file_lock
         with with_file_lock(path, timeout_ms=2000):
             with open(path, "a", encoding="utf-8") as f:
                 f.write(line + "\n")
             _prune_if_needed(path)
+        notify_wheel_action(record)
     logger.info("[WHEEL_ACTIONS] %s %s", symbol, action)
 
 
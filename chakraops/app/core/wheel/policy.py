@@ -28,15 +28,14 @@ def _get_symbol_iv_rank(latest_decision: Any, symbol: str) -> Optional[float]:
                     pass
     # Symbol row might have iv_rank on SymbolEvalSummary (if we add it later)
     if hasattr(latest_decision, "symbols") and latest_decision.symbols:
-        for s in latest_decision.symbols:
-            if (getattr(s, "symbol", None) or "").strip().upper() == sym:
-                iv = getattr(s, "iv_rank", None)
-                if iv is not None:
-                    try:
-                        return float(iv)
-                    except (TypeError, ValueError):
-                        pass
-                break
+        from app.core.eval.symbol_index import symbol_row
+        s = symbol_row(latest_decision, sym)
+        iv = getattr(s, "iv_rank", None) if s is not None else None
+        if iv is not None:
+            try:
+                return float(iv)
+            except (TypeError, ValueError):
+                pass
     return None
 
 
@@ -4,15 +4,19 @@
 
 from __future__ import annotations
 
-import json
 import logging
+import threading
 from pathlib import Path
 from typing import Any, Dict
 
+from app.core.config.registry import get_config, invalidate, register_config
+
 logger = logging.getLogger(__name__)
 
 WHEEL_STATES = frozenset({"EMPTY", "ASSIGNED", "OPEN", "CLOSED"})
 
+_LOCK = threading.Lock()
+
 
 def _wheel_state_path() -> Path:
     try:
@@ -24,31 +28,40 @@ def _wheel_state_path() -> Path:
     return out / "wheel_state.json"
 
 
+def _normalize_state(data: Any) -> Dict[str, Any]:
+    symbols = (data or {}).get("symbols") or {}
+    for sym, ent in list(symbols.items()):
+        if not isinstance(ent, dict):
+            symbols[sym] = {"state": "EMPTY", "last_updated_utc": None, "linked_position_ids": []}
+        elif "linked_position_ids" not in ent:
+            ent["linked_position_ids"] = []
+    return {"symbols": symbols}
+
+
+register_config(
+    "wheel_state",
+    validate=_normalize_state,
+    missing=lambda: {"symbols": {}},
+    fallback=lambda e: {"symbols": {}},
+)
+
+
 def load_state() -> Dict[str, Any]:
-    """Load wheel state. Returns {symbols: {symbol: {state, last_updated_utc, linked_position_ids[]}}}."""
-    path = _wheel_state_path()
-    if not path.exists():
-        return {"symbols": {}}
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        symbols = data.get("symbols") or {}
-        for sym, ent in list(symbols.items()):
-            if not isinstance(ent, dict):
-                symbols[sym] = {"state": "EMPTY", "last_updated_utc": None, "linked_position_ids": []}
-            elif "linked_position_ids" not in ent:
-                ent["linked_position_ids"] = []
-        return {"symbols": symbols}
-    except Exception as e:
-        logger.warning("[WHEEL] Failed to load state: %s", e)
-        return {"symbols": {}}
+    """Load wheel state. Returns {symbols: {symbol: {state, last_updated_utc, linked_position_ids[]}}}.
+    Parsed once per file version via the config registry; returns a private copy."""
+    return get_config("wheel_state", _wheel_state_path()).mutable()
 
 
 def save_state_atomic(state: Dict[str, Any]) -> None:
-    """Save wheel state atomically via atomic_write_json."""
+    """Save wheel state atomically via atomic_write_json; the read model hook runs under the write lock."""
     from app.core.io.atomic import atomic_write_json
+    from app.core.portfolio.read_model import notify_before_write, notify_wheel_state_saved
     path = _wheel_state_path()
-    atomic_write_json(path, state, indent=2)
+    notify_before_write("wheel_state")
+    with _LOCK:
+        atomic_write_json(path, state, indent=2)
+        invalidate("wheel_state", path)
+        notify_wheel_state_saved(state)
 
 
 def clear_symbol_from_state(symbol: str) -> None:
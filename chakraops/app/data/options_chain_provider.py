@@ -15,6 +15,9 @@ logger = logging.getLogger(__name__)
 # Timeout for provider calls
 CHAIN_REQUEST_TIMEOUT = 30.0
 
+# Parallel signal-engine workers allowed against ORATS (the engine reads max_concurrency)
+ORATS_CHAIN_MAX_CONCURRENCY = max(1, int(os.getenv("ORATS_CHAIN_MAX_CONCURRENCY", "4")))
+
 # Fallback weekly expirations: OFF by default
 OPTIONS_FALLBACK_WEEKLY_ENV = "OPTIONS_FALLBACK_WEEKLY_EXPIRATIONS"
 OPTIONS_FALLBACK_DAYS_ENV = "OPTIONS_FALLBACK_DAYS"
@@ -43,13 +46,29 @@ class OptionsChainProvider(ABC):
         """Return contracts for symbol/expiry/right."""
         ...
 
+    def get_expiry_chain(self, symbol: str, expiry: date) -> Dict[str, List[Dict[str, Any]]]:
+        """Return {"PUT": [...], "CALL": [...]} for symbol/expiry.
+
+        Default issues one get_chain per right; providers whose endpoint returns both
+        rights in one response override this so an expiry costs a single fetch.
+        """
+        return {
+            "PUT": self.get_chain(symbol, expiry, "PUT") or [],
+            "CALL": self.get_chain(symbol, expiry, "CALL") or [],
+        }
+
 
 class OratsOptionsChainProvider(OptionsChainProvider):
     """ORATS Live Data provider. Token from ORATS_API_TOKEN only."""
 
-    def __init__(self, timeout: float = CHAIN_REQUEST_TIMEOUT) -> None:
+    def __init__(
+        self,
+        timeout: float = CHAIN_REQUEST_TIMEOUT,
+        max_concurrency: int = ORATS_CHAIN_MAX_CONCURRENCY,
+    ) -> None:
         from app.core.options.providers.orats_provider import OratsOptionsChainProvider as _OratsImpl
         self._impl = _OratsImpl(timeout=timeout)
+        self.max_concurrency = max_concurrency
 
     def get_expirations(self, symbol: str) -> List[date]:
         return self._impl.get_expirations(symbol)
@@ -62,6 +81,9 @@ class OratsOptionsChainProvider(OptionsChainProvider):
     ) -> List[Dict[str, Any]]:
         return self._impl.get_chain(symbol, expiry, right)
 
+    def get_expiry_chain(self, symbol: str, expiry: date) -> Dict[str, List[Dict[str, Any]]]:
+        return self._impl.get_expiry_chain(symbol, expiry)
+
     def get_option_context(self, symbol: str) -> Optional[Any]:
         return self._impl.get_option_context(symbol)
 
@@ -102,6 +124,10 @@ class FallbackWeeklyExpirationsProvider(OptionsChainProvider):
         except ValueError:
             self._days = DEFAULT_FALLBACK_DAYS
 
+    @property
+    def max_concurrency(self) -> Optional[int]:
+        return getattr(self._inner, "max_concurrency", None)
+
     def get_expirations(self, symbol: str) -> List[date]:
         result = self._inner.get_expirations(symbol)
         if result:
@@ -121,6 +147,9 @@ class FallbackWeeklyExpirationsProvider(OptionsChainProvider):
     ) -> List[Dict[str, Any]]:
         return self._inner.get_chain(symbol, expiry, right)
 
+    def get_expiry_chain(self, symbol: str, expiry: date) -> Dict[str, List[Dict[str, Any]]]:
+        return self._inner.get_expiry_chain(symbol, expiry)
+
     def get_option_context(self, symbol: str) -> Optional[Any]:
         return getattr(self._inner, "get_option_context", lambda s: None)(symbol)
 
@@ -151,4 +180,5 @@ __all__ = [
     "OratsOptionsChainProvider",
     "FallbackWeeklyExpirationsProvider",
     "CHAIN_REQUEST_TIMEOUT",
+    "ORATS_CHAIN_MAX_CONCURRENCY",
 ]
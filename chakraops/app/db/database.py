@@ -12,6 +12,7 @@ from typing import Any, Dict, List, Optional
 
 from app.core.utils import safe_json
 from app.core.config.paths import DB_PATH
+from app.db.migrations import Migration, ensure_schema
 
 
 def get_db_path() -> Path:
@@ -23,12 +24,8 @@ def get_db_path() -> Path:
     return DB_PATH
 
 
-def init_db() -> None:
-    """Initialize database with required tables."""
-    db_path = get_db_path()
-    conn = sqlite3.connect(str(db_path))
-    cursor = conn.cursor()
-
+def _migrate_database_v1(cursor: sqlite3.Cursor) -> None:
+    """Baseline legacy tables: regime_snapshots and alerts (pre-versioning; idempotent)."""
     # Create regime_snapshots table
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS regime_snapshots (
@@ -54,9 +51,17 @@ def init_db() -> None:
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_regime_created_at ON regime_snapshots(created_at DESC)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_alerts_created_at ON alerts(created_at DESC)")
 
-    conn.commit()
-    conn.close()
-    
+
+# Versioned schema steps for the legacy tables (see app.db.migrations).
+DATABASE_MIGRATIONS = (
+    Migration(1, "baseline", _migrate_database_v1),
+)
+
+
+def init_db() -> None:
+    """Initialize database with required tables (versioned; runs once per process per DB file)."""
+    ensure_schema(get_db_path(), "database", DATABASE_MIGRATIONS)
+
     # Initialize Phase 1A persistence tables
     from app.core.persistence import init_persistence_db
     init_persistence_db()
@@ -0,0 +1,194 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""Versioned, run-once schema migrations for the ChakraOps SQLite database.
+
+Each schema owner (persistence, market_snapshot, positions, database) declares an
+ordered list of Migration steps for its *component*. ensure_schema() applies the
+steps newer than the component's recorded version, once per process per DB file,
+and records them in the ``schema_version`` table:
+
+    schema_version(component, version, name, applied_at)  PRIMARY KEY (component, version)
+
+Pending steps run inside one ``BEGIN IMMEDIATE`` transaction, so concurrent
+processes serialize on the SQLite write lock and the second one sees the steps
+already applied. After the first successful call for a (DB file, component) pair
+the check is an in-memory lookup plus one stat() — cheap enough to keep at the
+top of every read/write helper.
+
+Version 1 of each component is the pre-migration baseline (idempotent CREATE IF
+NOT EXISTS / ALTER-if-missing), so databases created before this module adopt the
+versioned scheme without manual steps. New schema changes must be appended as new
+versions; never edit a released step.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION_TABLE = "schema_version"
+
+
+@dataclass(frozen=True)
+class Migration:
+    """One ordered schema step for a component. apply() receives a cursor inside the migration transaction."""
+
+    version: int
+    name: str
+    apply: Callable[[sqlite3.Cursor], None]
+
+
+class MigrationError(RuntimeError):
+    """A migration step failed; the transaction was rolled back and nothing was recorded."""
+
+
+_lock = threading.Lock()
+# (resolved db path, component) -> (file identity, applied version)
+_applied: Dict[Tuple[str, str], Tuple[Tuple[int, int], int]] = {}
+_stats = {"checks": 0, "fast_path": 0, "migrations_run": 0, "steps_applied": 0}
+
+
+def _file_identity(path: str) -> Optional[Tuple[int, int]]:
+    """(device, inode) of the DB file, or None when missing. Detects a deleted/replaced database."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_dev, st.st_ino)
+
+
+def _validate(component: str, migrations: Sequence[Migration]) -> None:
+    versions = [m.version for m in migrations]
+    if versions != sorted(set(versions)) or (versions and versions[0] < 1):
+        raise ValueError(f"migrations for {component!r} must have unique ascending versions >= 1: {versions}")
+
+
+def _ensure_version_table(cursor: sqlite3.Cursor) -> None:
+    cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS {SCHEMA_VERSION_TABLE} (
+            component TEXT NOT NULL,
+            version INTEGER NOT NULL,
+            name TEXT NOT NULL,
+            applied_at TEXT NOT NULL,
+            PRIMARY KEY (component, version)
+        )
+    """)
+
+
+def _current_version(cursor: sqlite3.Cursor, component: str) -> int:
+    cursor.execute(f"SELECT MAX(version) FROM {SCHEMA_VERSION_TABLE} WHERE component = ?", (component,))
+    row = cursor.fetchone()
+    return int(row[0]) if row and row[0] is not None else 0
+
+
+def _migrate(path: str, component: str, migrations: Sequence[Migration]) -> int:
+    """Apply pending steps in one IMMEDIATE transaction. Returns the component's version afterwards."""
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path, timeout=30.0, isolation_level=None)
+    try:
+        cursor = conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            _ensure_version_table(cursor)
+            current = _current_version(cursor, component)
+            pending = [m for m in migrations if m.version > current]
+            for m in pending:
+                try:
+                    m.apply(cursor)
+                except Exception as e:
+                    raise MigrationError(f"{component} v{m.version} ({m.name}) failed: {e}") from e
+                cursor.execute(
+                    f"INSERT INTO {SCHEMA_VERSION_TABLE} (component, version, name, applied_at) VALUES (?, ?, ?, ?)",
+                    (component, m.version, m.name, datetime.now(timezone.utc).isoformat()),
+                )
+            cursor.execute("COMMIT")
+        except BaseException:
+            cursor.execute("ROLLBACK")
+            raise
+    finally:
+        conn.close()
+    for m in pending:
+        logger.info("[MIGRATION] %s v%d applied: %s (%s)", component, m.version, m.name, path)
+    _stats["migrations_run"] += 1
+    _stats["steps_applied"] += len(pending)
+    return pending[-1].version if pending else current
+
+
+def ensure_schema(db_path: Union[str, Path], component: str, migrations: Sequence[Migration]) -> int:
+    """Bring `component` in the DB at db_path up to its latest migration; returns the applied version.
+
+    Runs the migrations at most once per process per DB file (re-runs if the file was
+    deleted or replaced). Thread-safe; cross-process safe via SQLite's write lock.
+    """
+    path = str(Path(db_path).resolve())
+    key = (path, component)
+    target = migrations[-1].version if migrations else 0
+    _stats["checks"] += 1
+    ident = _file_identity(path)
+    cached = _applied.get(key)
+    if cached is not None and ident is not None and cached[0] == ident and cached[1] >= target:
+        _stats["fast_path"] += 1
+        return cached[1]
+    with _lock:
+        ident = _file_identity(path)
+        cached = _applied.get(key)
+        if cached is not None and ident is not None and cached[0] == ident and cached[1] >= target:
+            _stats["fast_path"] += 1
+            return cached[1]
+        _validate(component, migrations)
+        version = _migrate(path, component, migrations)
+        ident = _file_identity(path)
+        if ident is not None:
+            _applied[key] = (ident, version)
+        return version
+
+
+def schema_versions(db_path: Union[str, Path]) -> Dict[str, List[Dict[str, object]]]:
+    """Applied steps per component from the schema_version table (empty if the table does not exist)."""
+    conn = sqlite3.connect(str(db_path))
+    try:
+        try:
+            rows = conn.execute(
+                f"SELECT component, version, name, applied_at FROM {SCHEMA_VERSION_TABLE} ORDER BY component, version"
+            ).fetchall()
+        except sqlite3.OperationalError:
+            return {}
+    finally:
+        conn.close()
+    out: Dict[str, List[Dict[str, object]]] = {}
+    for component, version, name, applied_at in rows:
+        out.setdefault(component, []).append({"version": version, "name": name, "applied_at": applied_at})
+    return out
+
+
+def migration_stats() -> Dict[str, int]:
+    """Process counters: ensure_schema checks, fast-path hits, migration transactions and steps applied."""
+    with _lock:
+        return dict(_stats)
+
+
+def reset_migration_cache() -> None:
+    """Forget which DB files are migrated in this process (tests). The schema_version table is untouched."""
+    with _lock:
+        _applied.clear()
+        for k in _stats:
+            _stats[k] = 0
+
+
+__all__ = [
+    "Migration",
+    "MigrationError",
+    "SCHEMA_VERSION_TABLE",
+    "ensure_schema",
+    "migration_stats",
+    "reset_migration_cache",
+    "schema_versions",
+]
@@ -0,0 +1,75 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""Per-symbol option chain index grouped by (expiry, right).
+
+Built once per symbol by the signal engine and shared by the CSP, CC and iron
+condor generators so each generator does not regroup the same quotes. Quote
+order inside a group is the input order, so generator output is identical to
+grouping the flat list directly.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Tuple
+
+from app.signals.adapters.theta_options_adapter import NormalizedOptionQuote
+from app.signals.utils import calc_dte
+
+RIGHTS = ("PUT", "CALL")
+
+
+@dataclass(frozen=True)
+class ChainIndex:
+    """Immutable quotes-by-(expiry, right) index for one underlying."""
+
+    underlying: str
+    groups: Dict[Tuple[date, str], Tuple[NormalizedOptionQuote, ...]] = field(default_factory=dict)
+    total_quotes: int = 0
+
+    def quotes(self, expiry: date, right: str) -> Tuple[NormalizedOptionQuote, ...]:
+        """Quotes for one expiry/right (empty tuple when absent)."""
+        return self.groups.get((expiry, right), ())
+
+    def expiries(self, right: str) -> List[date]:
+        """Sorted expiries that have at least one quote for right."""
+        return sorted({exp for (exp, r) in self.groups if r == right})
+
+    def count(self, right: str) -> int:
+        """Number of quotes for right across all expiries."""
+        return sum(len(q) for (_, r), q in self.groups.items() if r == right)
+
+    def by_expiry(
+        self,
+        right: str,
+        as_of: datetime,
+        dte_min: int,
+        dte_max: int,
+    ) -> Dict[date, Tuple[NormalizedOptionQuote, ...]]:
+        """Expiry -> quotes for right, restricted to the DTE window, in expiry order."""
+        out: Dict[date, Tuple[NormalizedOptionQuote, ...]] = {}
+        for expiry in self.expiries(right):
+            if dte_min <= calc_dte(as_of, expiry) <= dte_max:
+                out[expiry] = self.groups[(expiry, right)]
+        return out
+
+
+def build_chain_index(options: Iterable[NormalizedOptionQuote], underlying: str) -> ChainIndex:
+    """Group quotes for underlying by (expiry, right); quotes for other underlyings are dropped."""
+    symbol = (underlying or "").upper()
+    grouped: Dict[Tuple[date, str], List[NormalizedOptionQuote]] = {}
+    total = 0
+    for opt in options:
+        if opt.underlying.upper() != symbol:
+            continue
+        grouped.setdefault((opt.expiry, opt.right), []).append(opt)
+        total += 1
+    return ChainIndex(
+        underlying=symbol,
+        groups={k: tuple(v) for k, v in grouped.items()},
+        total_quotes=total,
+    )
+
+
+__all__ = ["ChainIndex", "build_chain_index", "RIGHTS"]
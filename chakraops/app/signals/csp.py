@@ -4,13 +4,13 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
 from datetime import date, datetime
 from decimal import Decimal
-from typing import Any, List
+from typing import Any, List, Optional
 
 from app.core.market.stock_models import StockSnapshot
 from app.signals.adapters.theta_options_adapter import NormalizedOptionQuote
+from app.signals.chain_index import ChainIndex, build_chain_index
 from app.signals.models import (
     CSPConfig,
     ExclusionReason,
@@ -28,6 +28,7 @@ def generate_csp_candidates(
     cfg: CSPConfig,
     base_cfg: SignalEngineConfig,
     option_context: Any = None,
+    chain_index: Optional[ChainIndex] = None,
 ) -> tuple[List[SignalCandidate], List[ExclusionReason]]:
     """Generate CSP signal candidates from stock snapshot and normalized options.
 
@@ -36,6 +37,7 @@ def generate_csp_candidates(
         options: List of normalized option quotes (should include PUTs)
         cfg: CSP-specific configuration
         base_cfg: Base signal engine configuration
+        chain_index: Prebuilt (expiry, right) index for this symbol; built from options when None
 
     Returns:
         Tuple of (candidates, exclusions)
@@ -57,10 +59,12 @@ def generate_csp_candidates(
         )
         return candidates, exclusions
 
-    # Filter PUT options only
-    put_options = [opt for opt in options if opt.right == "PUT" and opt.underlying.upper() == stock.symbol.upper()]
+    # Group PUTs by expiry once (shared index when the engine provides one)
+    if chain_index is None:
+        chain_index = build_chain_index(options, stock.symbol)
+    put_count = chain_index.count("PUT")
 
-    if not put_options:
+    if put_count == 0:
         exclusions.append(
             ExclusionReason(
                 code="NO_OPTIONS_FOR_SYMBOL",
@@ -70,14 +74,9 @@ def generate_csp_candidates(
         )
         return candidates, exclusions
 
-    # Group by expiry and filter by DTE
+    # Filter expiries by DTE
     as_of = stock.snapshot_time
-    expiry_groups: dict[date, List[NormalizedOptionQuote]] = defaultdict(list)
-
-    for opt in put_options:
-        dte = calc_dte(as_of, opt.expiry)
-        if base_cfg.dte_min <= dte <= base_cfg.dte_max:
-            expiry_groups[opt.expiry].append(opt)
+    expiry_groups = chain_index.by_expiry("PUT", as_of, base_cfg.dte_min, base_cfg.dte_max)
 
     if not expiry_groups:
         exclusions.append(
@@ -88,7 +87,7 @@ def generate_csp_candidates(
                     "symbol": stock.symbol,
                     "dte_min": base_cfg.dte_min,
                     "dte_max": base_cfg.dte_max,
-                    "total_puts": len(put_options),
+                    "total_puts": put_count,
                 },
             )
         )
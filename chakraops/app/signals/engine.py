@@ -4,7 +4,8 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from time import perf_counter
@@ -16,9 +17,11 @@ if TYPE_CHECKING:
     from app.core.options.options_availability import OptionsAvailabilityRecorder
 from app.data.options_chain_provider import OptionsChainProvider
 from app.signals.adapters.theta_options_adapter import normalize_theta_chain
+from app.signals.chain_index import build_chain_index
 from app.signals.cc import generate_cc_candidates
 from app.signals.csp import generate_csp_candidates
 from app.signals.iron_condor import IronCondorCandidate, generate_iron_condor_candidates
+from app.signals.iron_condor_search import search_iron_condors
 from app.signals.utils import calc_dte
 from app.signals.scoring import ScoredSignalCandidate, score_signals
 from app.signals.selection import SelectedSignal, select_signals
@@ -32,6 +35,8 @@ from app.signals.models import (
     SignalEngineConfig,
 )
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass(frozen=True)
 class SignalRunResult:
@@ -53,6 +58,8 @@ class SignalRunResult:
     decision_snapshot: DecisionSnapshot = field(default_factory=lambda: None)  # type: ignore
     # Phase 4.2: iron condor candidates (one per symbol/expiry when valid).
     iron_condor_candidates: List[IronCondorCandidate] = field(default_factory=list)
+    # Structured timing: run totals plus per-symbol expirations/chain fetch/generate ms.
+    timing_metrics: Dict[str, Any] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
         """Compute stats after initialization."""
@@ -63,356 +70,379 @@ class SignalRunResult:
 
 SYMBOL_PROCESSING_TIMEOUT_SECONDS: float = 30.0
 
+# Hard cap on symbol workers in parallel mode. Providers may lower it by exposing
+# a ``max_concurrency`` attribute (e.g. ORATS rate limits).
+MAX_SIGNAL_ENGINE_WORKERS: int = 8
 
-def run_signal_engine(
-    stock_snapshots: List[StockSnapshot],
-    options_chain_provider: OptionsChainProvider,
-    base_config: SignalEngineConfig,
-    csp_config: CSPConfig,
-    cc_config: CCConfig,
-    universe_id_or_hash: str = "default",
-    options_availability_recorder: Optional["OptionsAvailabilityRecorder"] = None,
-) -> SignalRunResult:
-    """Run signal engine for a list of stock snapshots.
 
-    Args:
-        stock_snapshots: List of stock snapshots to evaluate
-        options_chain_provider: Provider for fetching options chains
-        base_config: Base signal engine configuration
-        csp_config: CSP-specific configuration
-        cc_config: CC-specific configuration
-        universe_id_or_hash: Identifier for the universe used
+@dataclass
+class _SymbolOutcome:
+    """Per-symbol output of one engine pass (merged in input order by run_signal_engine)."""
 
-    Returns:
-        SignalRunResult with candidates, exclusions, and stats
-    """
-    all_candidates: List[SignalCandidate] = []
-    all_exclusions: List[ExclusionReason] = []
-    all_iron_condor_candidates: List[IronCondorCandidate] = []
-    as_of = datetime.now()
+    candidates: List[SignalCandidate] = field(default_factory=list)
+    iron_condor_candidates: List[IronCondorCandidate] = field(default_factory=list)
+    exclusions: List[ExclusionReason] = field(default_factory=list)
+    timing: Dict[str, Any] = field(default_factory=dict)
 
-    # Process each stock snapshot
-    for snapshot in stock_snapshots:
-        if not snapshot.has_options:
-            continue
 
-        symbol = snapshot.symbol.upper()
-        symbol_exclusions: List[ExclusionReason] = []
+def _elapsed_ms(start: float) -> int:
+    return int((perf_counter() - start) * 1000)
 
-        # Per-symbol timing and progress logging
-        symbol_start = perf_counter()
-        print(f"-> Processing symbol {symbol}", flush=True)
 
-        # Fetch expirations for this symbol
-        try:
-            exp_start = perf_counter()
-            print(f"  [timing] fetch_expirations start for {symbol}", flush=True)
-            expirations = options_chain_provider.get_expirations(symbol)
-            exp_elapsed_ms = int((perf_counter() - exp_start) * 1000)
-            total_expirations = len(expirations) if expirations is not None else 0
-            print(
-                f"  [timing] fetch_expirations done for {symbol} in {exp_elapsed_ms} ms "
-                f"(total_expirations={total_expirations})",
-                flush=True,
-            )
-        except Exception as e:
-            if options_availability_recorder:
-                options_availability_recorder.record_reason(symbol, "CHAIN_FETCH_ERROR")
-            symbol_exclusions.append(
-                ExclusionReason(
-                    code="CHAIN_FETCH_ERROR",
-                    message=f"Failed to fetch expirations for {symbol}: {e}",
-                    data={"symbol": symbol, "error": str(e)},
-                )
-            )
-            all_exclusions.extend(symbol_exclusions)
-            continue
+def _resolve_max_workers(
+    requested: Optional[int],
+    options_chain_provider: OptionsChainProvider,
+    symbol_count: int,
+) -> int:
+    """Effective worker count: requested, capped by engine and provider limits and symbol count."""
+    workers = int(requested or 1)
+    provider_limit = getattr(options_chain_provider, "max_concurrency", None)
+    if isinstance(provider_limit, int) and provider_limit > 0:
+        workers = min(workers, provider_limit)
+    return max(1, min(workers, MAX_SIGNAL_ENGINE_WORKERS, symbol_count))
 
-        if not expirations:
-            if options_availability_recorder:
-                options_availability_recorder.record_reason(symbol, "NO_EXPIRATIONS")
-            symbol_exclusions.append(
-                ExclusionReason(
-                    code="NO_EXPIRATIONS",
-                    message=f"No expirations found for {symbol}",
-                    data={"symbol": symbol},
-                )
+
+def _fetch_expiry_chain(
+    options_chain_provider: OptionsChainProvider,
+    symbol: str,
+    expiry: date,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """One chain fetch per (symbol, expiry), returning both rights."""
+    getter = getattr(options_chain_provider, "get_expiry_chain", None)
+    if callable(getter):
+        return getter(symbol, expiry)
+    return {
+        "PUT": options_chain_provider.get_chain(symbol, expiry, "PUT") or [],
+        "CALL": options_chain_provider.get_chain(symbol, expiry, "CALL") or [],
+    }
+
+
+def _with_symbol_context(
+    symbol: str,
+    exclusions: List[ExclusionReason],
+    expiry: Optional[date] = None,
+) -> List[ExclusionReason]:
+    out: List[ExclusionReason] = []
+    for excl in exclusions:
+        excl_data = dict(excl.data)
+        excl_data["symbol"] = symbol
+        if expiry is not None:
+            excl_data["expiry"] = expiry.isoformat()
+        out.append(
+            ExclusionReason(
+                code=excl.code,
+                message=f"{symbol}: {excl.message}",
+                data=excl_data,
             )
-            all_exclusions.extend(symbol_exclusions)
-            continue
+        )
+    return out
 
-        # Normalize expirations to date objects and filter by DTE window
-        normalized_expirations: List[date] = []
-        for expiry in expirations:
-            if isinstance(expiry, date):
-                expiry_date = expiry
-            else:
-                # Try to parse from string or other date-like objects
-                try:
-                    # Support ISO string "YYYY-MM-DD"
-                    expiry_date = date.fromisoformat(str(expiry))
-                except Exception:
-                    # Skip unparseable expirations
-                    continue
-            normalized_expirations.append(expiry_date)
-
-        # Deduplicate and sort ascending for deterministic behavior
-        if normalized_expirations:
-            unique_sorted_expirations = sorted(set(normalized_expirations))
+
+def _process_symbol(
+    snapshot: StockSnapshot,
+    options_chain_provider: OptionsChainProvider,
+    base_config: SignalEngineConfig,
+    csp_config: CSPConfig,
+    cc_config: CCConfig,
+    as_of: datetime,
+    options_availability_recorder: Optional["OptionsAvailabilityRecorder"],
+) -> _SymbolOutcome:
+    """Fetch chains and run CSP/CC/IC generators for one symbol."""
+    symbol = snapshot.symbol.upper()
+    outcome = _SymbolOutcome()
+    symbol_exclusions = outcome.exclusions
+    timing: Dict[str, Any] = {"chain_fetches": 0, "chain_fetch_ms": 0}
+    outcome.timing = timing
+    symbol_start = perf_counter()
+
+    # Fetch expirations for this symbol
+    try:
+        exp_start = perf_counter()
+        expirations = options_chain_provider.get_expirations(symbol)
+        timing["expirations_ms"] = _elapsed_ms(exp_start)
+        total_expirations = len(expirations) if expirations is not None else 0
+        timing["total_expirations"] = total_expirations
+    except Exception as e:
+        if options_availability_recorder:
+            options_availability_recorder.record_reason(symbol, "CHAIN_FETCH_ERROR")
+        symbol_exclusions.append(
+            ExclusionReason(
+                code="CHAIN_FETCH_ERROR",
+                message=f"Failed to fetch expirations for {symbol}: {e}",
+                data={"symbol": symbol, "error": str(e)},
+            )
+        )
+        timing["total_ms"] = _elapsed_ms(symbol_start)
+        return outcome
+
+    if not expirations:
+        if options_availability_recorder:
+            options_availability_recorder.record_reason(symbol, "NO_EXPIRATIONS")
+        symbol_exclusions.append(
+            ExclusionReason(
+                code="NO_EXPIRATIONS",
+                message=f"No expirations found for {symbol}",
+                data={"symbol": symbol},
+            )
+        )
+        timing["total_ms"] = _elapsed_ms(symbol_start)
+        return outcome
+
+    # Normalize expirations to date objects and filter by DTE window
+    normalized_expirations: List[date] = []
+    for expiry in expirations:
+        if isinstance(expiry, date):
+            expiry_date = expiry
         else:
-            unique_sorted_expirations = []
-
-        # Filter by DTE window based on as_of
-        dte_filtered_expirations: List[date] = []
-        for expiry_date in unique_sorted_expirations:
-            dte = calc_dte(as_of, expiry_date)
-            if base_config.dte_min <= dte <= base_config.dte_max:
-                dte_filtered_expirations.append(expiry_date)
-
-        print(
-            f"  [timing] expirations after DTE filter for {symbol}: "
-            f"{len(dte_filtered_expirations)} "
-            f"(window=[{base_config.dte_min}, {base_config.dte_max}] days)",
-            flush=True,
+            # Try to parse from string or other date-like objects
+            try:
+                # Support ISO string "YYYY-MM-DD"
+                expiry_date = date.fromisoformat(str(expiry))
+            except Exception:
+                # Skip unparseable expirations
+                continue
+        normalized_expirations.append(expiry_date)
+
+    # Deduplicate and sort ascending for deterministic behavior
+    unique_sorted_expirations = sorted(set(normalized_expirations))
+
+    # Filter by DTE window based on as_of
+    dte_filtered_expirations: List[date] = []
+    for expiry_date in unique_sorted_expirations:
+        dte = calc_dte(as_of, expiry_date)
+        if base_config.dte_min <= dte <= base_config.dte_max:
+            dte_filtered_expirations.append(expiry_date)
+
+    if not dte_filtered_expirations:
+        if options_availability_recorder:
+            options_availability_recorder.record_reason(symbol, "NO_EXPIRY_IN_DTE_WINDOW")
+        symbol_exclusions.append(
+            ExclusionReason(
+                code="NO_EXPIRY_IN_DTE_WINDOW",
+                message=(
+                    f"No expirations for {symbol} within DTE window "
+                    f"[{base_config.dte_min}, {base_config.dte_max}]"
+                ),
+                data={
+                    "symbol": symbol,
+                    "dte_min": base_config.dte_min,
+                    "dte_max": base_config.dte_max,
+                    "total_expirations": total_expirations,
+                },
+            )
         )
-
-        if not dte_filtered_expirations:
-            if options_availability_recorder:
-                options_availability_recorder.record_reason(symbol, "NO_EXPIRY_IN_DTE_WINDOW")
+        timing["total_ms"] = _elapsed_ms(symbol_start)
+        return outcome
+
+    # Apply hard cap on number of expirations per symbol
+    max_expiries = max(base_config.max_expiries_per_symbol, 0)
+    if max_expiries > 0:
+        capped_expirations = dte_filtered_expirations[:max_expiries]
+    else:
+        capped_expirations = dte_filtered_expirations
+    timing["expirations_processed"] = len(capped_expirations)
+
+    # One chain fetch per (symbol, expiry); PUT and CALL rows come from the same response
+    all_normalized_quotes: List = []
+    for expiry in capped_expirations:
+        # Per-symbol timeout guard inside expiry loop
+        symbol_elapsed_seconds = perf_counter() - symbol_start
+        if symbol_elapsed_seconds > SYMBOL_PROCESSING_TIMEOUT_SECONDS:
+            elapsed_ms = int(symbol_elapsed_seconds * 1000)
             symbol_exclusions.append(
                 ExclusionReason(
-                    code="NO_EXPIRY_IN_DTE_WINDOW",
+                    code="SYMBOL_PROCESSING_TIMEOUT",
                     message=(
-                        f"No expirations for {symbol} within DTE window "
-                        f"[{base_config.dte_min}, {base_config.dte_max}]"
+                        f"Processing symbol {symbol} exceeded timeout "
+                        f"while processing expirations ({elapsed_ms} ms)"
                     ),
                     data={
                         "symbol": symbol,
-                        "dte_min": base_config.dte_min,
-                        "dte_max": base_config.dte_max,
-                        "total_expirations": total_expirations,
+                        "elapsed_ms": elapsed_ms,
+                        "timeout_ms": int(SYMBOL_PROCESSING_TIMEOUT_SECONDS * 1000),
+                        "last_expiry": expiry.isoformat(),
                     },
                 )
             )
-            all_exclusions.extend(symbol_exclusions)
-            continue
-
-        # Apply hard cap on number of expirations per symbol
-        max_expiries = max(base_config.max_expiries_per_symbol, 0)
-        if max_expiries > 0:
-            capped_expirations = dte_filtered_expirations[:max_expiries]
-        else:
-            capped_expirations = dte_filtered_expirations
-
-        print(
-            f"  [timing] expirations processed for {symbol}: "
-            f"{len(capped_expirations)} (cap={base_config.max_expiries_per_symbol})",
-            flush=True,
-        )
-
-        # Fetch and normalize options chain for filtered/capped expirations
-        all_normalized_quotes: List = []
-        for expiry in capped_expirations:
-            # Per-symbol timeout guard inside expiry loop
-            symbol_elapsed_seconds = perf_counter() - symbol_start
-            if symbol_elapsed_seconds > SYMBOL_PROCESSING_TIMEOUT_SECONDS:
-                elapsed_ms = int(symbol_elapsed_seconds * 1000)
-                symbol_exclusions.append(
-                    ExclusionReason(
-                        code="SYMBOL_PROCESSING_TIMEOUT",
-                        message=(
-                            f"Processing symbol {symbol} exceeded timeout "
-                            f"while processing expirations ({elapsed_ms} ms)"
-                        ),
-                        data={
-                            "symbol": symbol,
-                            "elapsed_ms": elapsed_ms,
-                            "timeout_ms": int(SYMBOL_PROCESSING_TIMEOUT_SECONDS * 1000),
-                            "last_expiry": expiry.isoformat(),
-                        },
-                    )
-                )
-                print(f"[TIMEOUT] symbol {symbol} after {elapsed_ms} ms", flush=True)
-                break
+            logger.warning("[SIGNAL_ENGINE] Timeout for %s after %d ms", symbol, elapsed_ms)
+            timing["timed_out"] = True
+            break
 
-            # Fetch PUT chain via bulk endpoint (one API call per expiration)
-            try:
-                put_start = perf_counter()
-                print(
-                    f"  [timing] get_chain PUT start for {symbol} {expiry}",
-                    flush=True,
-                )
-                put_chain = options_chain_provider.get_chain(symbol, expiry, "PUT")
-                put_elapsed_ms = int((perf_counter() - put_start) * 1000)
-                print(
-                    f"  [timing] get_chain PUT done for {symbol} {expiry} in {put_elapsed_ms} ms ({len(put_chain) if put_chain else 0} contracts)",
-                    flush=True,
-                )
-                if put_chain:
-                    normalized_puts, put_exclusions = normalize_theta_chain(
-                        put_chain, snapshot.snapshot_time, underlying=symbol
-                    )
-                    all_normalized_quotes.extend(normalized_puts)
-                    # Add symbol context to exclusions
-                    for excl in put_exclusions:
-                        excl_data = dict(excl.data)
-                        excl_data["symbol"] = symbol
-                        excl_data["expiry"] = expiry.isoformat()
-                        symbol_exclusions.append(
-                            ExclusionReason(
-                                code=excl.code,
-                                message=f"{symbol}: {excl.message}",
-                                data=excl_data,
-                            )
-                        )
-            except Exception as e:
-                if options_availability_recorder:
-                    options_availability_recorder.record_reason(symbol, "CHAIN_FETCH_ERROR")
-                print(
-                    f"  [timing] get_chain PUT error for {symbol} {expiry}: {e}",
-                    flush=True,
-                )
-                symbol_exclusions.append(
-                    ExclusionReason(
-                        code="CHAIN_FETCH_ERROR",
-                        message=f"Failed to fetch PUT chain for {symbol} {expiry}: {e}",
-                        data={
-                            "symbol": symbol,
-                            "expiry": expiry.isoformat(),
-                            "right": "PUT",
-                            "error": str(e),
-                        },
-                    )
-                )
-
-            # Fetch CALL chain (uses cached data from PUT fetch)
-            try:
-                call_start = perf_counter()
-                print(
-                    f"  [timing] get_chain CALL start for {symbol} {expiry}",
-                    flush=True,
-                )
-                call_chain = options_chain_provider.get_chain(symbol, expiry, "CALL")
-                call_elapsed_ms = int((perf_counter() - call_start) * 1000)
-                print(
-                    f"  [timing] get_chain CALL done for {symbol} {expiry} in {call_elapsed_ms} ms ({len(call_chain) if call_chain else 0} contracts)",
-                    flush=True,
-                )
-                if call_chain:
-                    normalized_calls, call_exclusions = normalize_theta_chain(
-                        call_chain, snapshot.snapshot_time, underlying=symbol
-                    )
-                    all_normalized_quotes.extend(normalized_calls)
-                    # Add symbol context to exclusions
-                    for excl in call_exclusions:
-                        excl_data = dict(excl.data)
-                        excl_data["symbol"] = symbol
-                        excl_data["expiry"] = expiry.isoformat()
-                        symbol_exclusions.append(
-                            ExclusionReason(
-                                code=excl.code,
-                                message=f"{symbol}: {excl.message}",
-                                data=excl_data,
-                            )
-                        )
-            except Exception as e:
-                if options_availability_recorder:
-                    options_availability_recorder.record_reason(symbol, "CHAIN_FETCH_ERROR")
-                print(
-                    f"  [timing] get_chain CALL error for {symbol} {expiry}: {e}",
-                    flush=True,
-                )
+        fetch_start = perf_counter()
+        try:
+            chains = _fetch_expiry_chain(options_chain_provider, symbol, expiry)
+        except Exception as e:
+            timing["chain_fetch_ms"] += _elapsed_ms(fetch_start)
+            if options_availability_recorder:
+                options_availability_recorder.record_reason(symbol, "CHAIN_FETCH_ERROR")
+            logger.warning("[SIGNAL_ENGINE] Chain fetch error for %s %s: %s", symbol, expiry, e)
+            # One fetch serves both rights; keep one exclusion per right as consumers expect
+            for right in ("PUT", "CALL"):
                 symbol_exclusions.append(
                     ExclusionReason(
                         code="CHAIN_FETCH_ERROR",
-                        message=f"Failed to fetch CALL chain for {symbol} {expiry}: {e}",
+                        message=f"Failed to fetch {right} chain for {symbol} {expiry}: {e}",
                         data={
                             "symbol": symbol,
                             "expiry": expiry.isoformat(),
-                            "right": "CALL",
+                            "right": right,
                             "error": str(e),
                         },
                     )
                 )
-
-        # Phase 3.2: fetch option context for symbol (expected move, IV rank, etc.)
-        option_context = None
-        if hasattr(options_chain_provider, "get_option_context") and callable(
-            getattr(options_chain_provider, "get_option_context", None)
-        ):
-            try:
-                option_context = options_chain_provider.get_option_context(symbol)
-            except Exception:
-                option_context = None
-
-        # Generate CSP candidates
-        csp_candidates, csp_exclusions = generate_csp_candidates(
-            stock=snapshot,
-            options=all_normalized_quotes,
-            cfg=csp_config,
-            base_cfg=base_config,
-            option_context=option_context,
-        )
-        all_candidates.extend(csp_candidates)
-
-        # Add symbol context to CSP exclusions
-        for excl in csp_exclusions:
-            excl_data = dict(excl.data)
-            excl_data["symbol"] = symbol
-            symbol_exclusions.append(
-                ExclusionReason(
-                    code=excl.code,
-                    message=f"{symbol}: {excl.message}",
-                    data=excl_data,
-                )
+            continue
+        timing["chain_fetch_ms"] += _elapsed_ms(fetch_start)
+        timing["chain_fetches"] += 1
+
+        for right in ("PUT", "CALL"):
+            chain = chains.get(right) or []
+            if not chain:
+                continue
+            normalized, chain_exclusions = normalize_theta_chain(
+                chain, snapshot.snapshot_time, underlying=symbol
             )
+            all_normalized_quotes.extend(normalized)
+            symbol_exclusions.extend(_with_symbol_context(symbol, chain_exclusions, expiry))
+
+    # Phase 3.2: fetch option context for symbol (expected move, IV rank, etc.)
+    option_context = None
+    if hasattr(options_chain_provider, "get_option_context") and callable(
+        getattr(options_chain_provider, "get_option_context", None)
+    ):
+        try:
+            option_context = options_chain_provider.get_option_context(symbol)
+        except Exception:
+            option_context = None
+
+    # Grouped (expiry, right) index built once and shared by all generators
+    generate_start = perf_counter()
+    chain_index = build_chain_index(all_normalized_quotes, symbol)
+    timing["quotes"] = chain_index.total_quotes
+
+    csp_candidates, csp_exclusions = generate_csp_candidates(
+        stock=snapshot,
+        options=all_normalized_quotes,
+        cfg=csp_config,
+        base_cfg=base_config,
+        option_context=option_context,
+        chain_index=chain_index,
+    )
+    outcome.candidates.extend(csp_candidates)
+    symbol_exclusions.extend(_with_symbol_context(symbol, csp_exclusions))
+
+    cc_candidates, cc_exclusions = generate_cc_candidates(
+        stock=snapshot,
+        options=all_normalized_quotes,
+        cfg=cc_config,
+        base_cfg=base_config,
+        option_context=option_context,
+        chain_index=chain_index,
+    )
+    outcome.candidates.extend(cc_candidates)
+    symbol_exclusions.extend(_with_symbol_context(symbol, cc_exclusions))
 
-        # Generate CC candidates
-        cc_candidates, cc_exclusions = generate_cc_candidates(
+    # Phase 4.2: generate iron condor candidates (bull put + bear call, same expiry)
+    if base_config.iron_condor_search is not None:
+        scored_ics, ic_exclusions = search_iron_condors(
             stock=snapshot,
             options=all_normalized_quotes,
-            cfg=cc_config,
             base_cfg=base_config,
+            search_cfg=base_config.iron_condor_search,
             option_context=option_context,
+            chain_index=chain_index,
         )
-        all_candidates.extend(cc_candidates)
-
-        # Add symbol context to CC exclusions
-        for excl in cc_exclusions:
-            excl_data = dict(excl.data)
-            excl_data["symbol"] = symbol
-            symbol_exclusions.append(
-                ExclusionReason(
-                    code=excl.code,
-                    message=f"{symbol}: {excl.message}",
-                    data=excl_data,
-                )
-            )
-
-        # Phase 4.2: generate iron condor candidates (bull put + bear call, same expiry)
+        ic_candidates = [s.candidate for s in scored_ics]
+    else:
         ic_candidates, ic_exclusions = generate_iron_condor_candidates(
             stock=snapshot,
             options=all_normalized_quotes,
             base_cfg=base_config,
             option_context=option_context,
+            chain_index=chain_index,
         )
-        all_iron_condor_candidates.extend(ic_candidates)
-        for excl in ic_exclusions:
-            excl_data = dict(excl.data)
-            excl_data["symbol"] = symbol
-            symbol_exclusions.append(
-                ExclusionReason(
-                    code=excl.code,
-                    message=f"{symbol}: {excl.message}",
-                    data=excl_data,
-                )
-            )
+    outcome.iron_condor_candidates.extend(ic_candidates)
+    symbol_exclusions.extend(_with_symbol_context(symbol, ic_exclusions))
+
+    timing["generate_ms"] = _elapsed_ms(generate_start)
+    timing["total_ms"] = _elapsed_ms(symbol_start)
+    return outcome
 
-        all_exclusions.extend(symbol_exclusions)
 
-        # Per-symbol completion logging
-        total_elapsed_ms = int((perf_counter() - symbol_start) * 1000)
-        print(f"[OK] Finished symbol {symbol} in {total_elapsed_ms} ms", flush=True)
+def run_signal_engine(
+    stock_snapshots: List[StockSnapshot],
+    options_chain_provider: OptionsChainProvider,
+    base_config: SignalEngineConfig,
+    csp_config: CSPConfig,
+    cc_config: CCConfig,
+    universe_id_or_hash: str = "default",
+    options_availability_recorder: Optional["OptionsAvailabilityRecorder"] = None,
+    max_workers: Optional[int] = None,
+) -> SignalRunResult:
+    """Run signal engine for a list of stock snapshots.
+
+    Args:
+        stock_snapshots: List of stock snapshots to evaluate
+        options_chain_provider: Provider for fetching options chains
+        base_config: Base signal engine configuration
+        csp_config: CSP-specific configuration
+        cc_config: CC-specific configuration
+        universe_id_or_hash: Identifier for the universe used
+        max_workers: Symbols processed concurrently (default 1 = sequential). Capped by
+            MAX_SIGNAL_ENGINE_WORKERS and the provider's ``max_concurrency`` when set.
+            Output ordering is identical to the sequential run.
+
+    Returns:
+        SignalRunResult with candidates, exclusions, stats and timing metrics
+    """
+    all_candidates: List[SignalCandidate] = []
+    all_exclusions: List[ExclusionReason] = []
+    all_iron_condor_candidates: List[IronCondorCandidate] = []
+    as_of = datetime.now()
+    run_start = perf_counter()
+
+    option_snapshots = [s for s in stock_snapshots if s.has_options]
+    workers = _resolve_max_workers(max_workers, options_chain_provider, len(option_snapshots))
+
+    def _run(snapshot: StockSnapshot) -> _SymbolOutcome:
+        return _process_symbol(
+            snapshot,
+            options_chain_provider,
+            base_config,
+            csp_config,
+            cc_config,
+            as_of,
+            options_availability_recorder,
+        )
+
+    # executor.map yields in input order, so merged output matches the sequential run
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            outcomes = list(executor.map(_run, option_snapshots))
+    else:
+        outcomes = [_run(snapshot) for snapshot in option_snapshots]
+
+    symbol_timings: Dict[str, Dict[str, Any]] = {}
+    for snapshot, outcome in zip(option_snapshots, outcomes):
+        all_candidates.extend(outcome.candidates)
+        all_iron_condor_candidates.extend(outcome.iron_condor_candidates)
+        all_exclusions.extend(outcome.exclusions)
+        symbol_timings[snapshot.symbol.upper()] = outcome.timing
+        logger.debug("[SIGNAL_ENGINE] %s timing %s", snapshot.symbol.upper(), outcome.timing)
+
+    timing_metrics: Dict[str, Any] = {
+        "total_ms": _elapsed_ms(run_start),
+        "max_workers": workers,
+        "chain_fetches": sum(t.get("chain_fetches", 0) for t in symbol_timings.values()),
+        "chain_fetch_ms": sum(t.get("chain_fetch_ms", 0) for t in symbol_timings.values()),
+        "symbols": symbol_timings,
+    }
+    logger.info(
+        "[SIGNAL_ENGINE] %d symbols in %d ms (workers=%d, chain_fetches=%d)",
+        len(option_snapshots),
+        timing_metrics["total_ms"],
+        workers,
+        timing_metrics["chain_fetches"],
+    )
 
     # Sort candidates deterministically: (symbol, signal_type, expiry, strike)
     sorted_candidates = sorted(
@@ -497,6 +527,7 @@ def run_signal_engine(
         explanations=explanations,
         decision_snapshot=None,  # Placeholder, will be replaced
         iron_condor_candidates=all_iron_condor_candidates,
+        timing_metrics=timing_metrics,
     )
 
     # Build JSON-serializable decision snapshot (Phase 4B Step 2)
@@ -521,6 +552,7 @@ def run_signal_engine(
         explanations=result.explanations,
         decision_snapshot=decision_snapshot,
         iron_condor_candidates=result.iron_condor_candidates,
+        timing_metrics=result.timing_metrics,
     )
 
 
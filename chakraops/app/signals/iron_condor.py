@@ -7,15 +7,15 @@ Builds bull put spread + bear call spread, same expiry. Rejects if either leg in
 
 from __future__ import annotations
 
-from collections import defaultdict
 from dataclasses import dataclass
 from datetime import date, datetime
 from typing import Any, List, Optional
 
 from app.core.market.stock_models import StockSnapshot
 from app.signals.adapters.theta_options_adapter import NormalizedOptionQuote
+from app.signals.chain_index import ChainIndex, build_chain_index
 from app.signals.models import ExclusionReason, SignalEngineConfig
-from app.signals.utils import calc_dte, mid, spread_pct
+from app.signals.utils import mid, spread_pct
 
 
 # Allowed spread widths (points) for iron condor legs
@@ -58,11 +58,13 @@ def generate_iron_condor_candidates(
     options: List[NormalizedOptionQuote],
     base_cfg: SignalEngineConfig,
     option_context: Any = None,
+    chain_index: Optional[ChainIndex] = None,
 ) -> tuple[List[IronCondorCandidate], List[ExclusionReason]]:
     """Generate iron condor candidates: bull put spread + bear call spread, same expiry.
 
     Groups options by expiry; for each expiry builds one IC when both legs are valid.
     Rejects if either leg invalid (no liquidity, negative credit, etc.).
+    chain_index: prebuilt (expiry, right) index for this symbol; built from options when None.
     """
     candidates: List[IronCondorCandidate] = []
     exclusions: List[ExclusionReason] = []
@@ -81,20 +83,11 @@ def generate_iron_condor_candidates(
     symbol_upper = stock.symbol.upper()
     as_of = stock.snapshot_time
 
-    # Group by expiry: PUTs and CALLs per expiry
-    puts_by_expiry: dict[date, List[NormalizedOptionQuote]] = defaultdict(list)
-    calls_by_expiry: dict[date, List[NormalizedOptionQuote]] = defaultdict(list)
-
-    for opt in options:
-        if opt.underlying.upper() != symbol_upper:
-            continue
-        dte = calc_dte(as_of, opt.expiry)
-        if not (base_cfg.dte_min <= dte <= base_cfg.dte_max):
-            continue
-        if opt.right == "PUT":
-            puts_by_expiry[opt.expiry].append(opt)
-        elif opt.right == "CALL":
-            calls_by_expiry[opt.expiry].append(opt)
+    # PUTs and CALLs per expiry within the DTE window (shared index when the engine provides one)
+    if chain_index is None:
+        chain_index = build_chain_index(options, symbol_upper)
+    puts_by_expiry = chain_index.by_expiry("PUT", as_of, base_cfg.dte_min, base_cfg.dte_max)
+    calls_by_expiry = chain_index.by_expiry("CALL", as_of, base_cfg.dte_min, base_cfg.dte_max)
 
     expiries_with_both = sorted(set(puts_by_expiry.keys()) & set(calls_by_expiry.keys()))
 
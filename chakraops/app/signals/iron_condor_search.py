@@ -0,0 +1,387 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""Vectorized iron condor search across all strike combinations (Phase 4.2 extension).
+
+generate_iron_condor_candidates builds one heuristic condor per expiry. This module
+evaluates every valid (short put, long put, short call, long call) combination within
+width/delta constraints per expiry with NumPy broadcasting, scores credit, max loss and
+probability of profit, and returns the Pareto-best set (no other condor has more
+credit, less max loss and higher POP at the same time).
+
+Definitions (per 1 contract, dollars):
+    credit     = (mid short put - mid long put + mid short call - mid long call) * 100
+    max_loss   = max(put width, call width) * 100 - credit
+    pop        = 1 - |delta short put| - |delta short call|  (both shorts expire OTM)
+    expected_value = pop * credit - (1 - pop) * max_loss
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.core.market.stock_models import StockSnapshot
+from app.signals.adapters.theta_options_adapter import NormalizedOptionQuote
+from app.signals.chain_index import ChainIndex, build_chain_index
+from app.signals.iron_condor import IronCondorCandidate
+from app.signals.models import ExclusionReason, SignalEngineConfig
+from app.signals.utils import mid, spread_pct
+
+# Pareto dominance is checked in blocks to bound the (block x front) comparison matrix.
+_PARETO_BLOCK = 512
+# Max put x call pairs materialized at once when a width level needs the full product.
+_PAIR_CHUNK = 1 << 20
+
+
+@dataclass(frozen=True)
+class IronCondorSearchConfig:
+    """Constraints for the full-chain iron condor search."""
+
+    short_delta_min: float = 0.10  # Absolute delta of each short leg
+    short_delta_max: float = 0.30
+    width_min: float = 1.0  # Spread width (points) per side
+    width_max: float = 5.0
+    min_credit: float = 0.0  # Minimum total credit (dollars per contract)
+    max_results_per_expiry: int = 3  # Pareto set is ranked by expected value then truncated
+
+
+@dataclass(frozen=True)
+class ScoredIronCondor:
+    """Iron condor from the full-chain search with its scores."""
+
+    candidate: IronCondorCandidate
+    credit: float
+    max_loss: float
+    pop: float
+    return_on_risk: float
+    expected_value: float
+
+
+@dataclass(frozen=True)
+class _Side:
+    """All valid vertical spreads for one side of one expiry, as parallel arrays."""
+
+    short_strike: np.ndarray
+    long_strike: np.ndarray
+    credit: np.ndarray  # dollars per contract
+    width: np.ndarray  # points
+    short_delta: np.ndarray  # absolute
+
+
+def _liquid(quotes: Sequence[NormalizedOptionQuote], base_cfg: SignalEngineConfig) -> List[NormalizedOptionQuote]:
+    """Same liquidity rules as generate_iron_condor_candidates; mid must be available."""
+    out: List[NormalizedOptionQuote] = []
+    for opt in quotes:
+        if opt.bid is None or opt.bid < base_cfg.min_bid:
+            continue
+        if opt.open_interest is not None and opt.open_interest < base_cfg.min_open_interest:
+            continue
+        sp = spread_pct(opt.bid, opt.ask)
+        if sp is not None and sp > base_cfg.max_spread_pct:
+            continue
+        if mid(opt.bid, opt.ask) is None:
+            continue
+        out.append(opt)
+    return out
+
+
+def _side_arrays(
+    quotes: Sequence[NormalizedOptionQuote],
+    is_call: bool,
+    cfg: IronCondorSearchConfig,
+) -> _Side:
+    """Broadcast short x long legs for one side and keep pairs satisfying width/delta/credit."""
+    strikes = np.array([float(q.strike) for q in quotes], dtype=float)
+    mids = np.array([mid(q.bid, q.ask) for q in quotes], dtype=float)
+    deltas = np.array([abs(q.delta) if q.delta is not None else np.nan for q in quotes], dtype=float)
+
+    short_k = strikes[:, None]
+    long_k = strikes[None, :]
+    # Bull put: long strike below short; bear call: long strike above short
+    width = (long_k - short_k) if is_call else (short_k - long_k)
+    credit = (mids[:, None] - mids[None, :]) * 100.0
+    with np.errstate(invalid="ignore"):
+        delta_ok = (deltas >= cfg.short_delta_min) & (deltas <= cfg.short_delta_max)
+    mask = (
+        (width >= cfg.width_min)
+        & (width <= cfg.width_max)
+        & (credit > 0)
+        & (credit < width * 100.0)
+        & delta_ok[:, None]
+    )
+    si, li = np.nonzero(mask)
+    return _Side(
+        short_strike=strikes[si],
+        long_strike=strikes[li],
+        credit=credit[si, li],
+        width=width[si, li],
+        short_delta=deltas[si],
+    )
+
+
+def _front_2d(gain: np.ndarray, cost: np.ndarray) -> np.ndarray:
+    """Indices of points with no other point having >= gain and <= cost (exact duplicates keep the first)."""
+    order = np.lexsort((cost, -gain))
+    c = cost[order]
+    prev_min = np.concatenate(([np.inf], np.minimum.accumulate(c)[:-1]))
+    return order[c < prev_min]
+
+
+def pareto_front(credit: np.ndarray, max_loss: np.ndarray, pop: np.ndarray) -> np.ndarray:
+    """Indices of non-dominated points (maximize credit, minimize max_loss, maximize pop).
+
+    Points are sorted by (credit desc, max_loss asc, pop desc), so a later point can never
+    strictly dominate an earlier one; each block is therefore checked only against the
+    front so far plus itself.
+    """
+    n = len(credit)
+    if n == 0:
+        return np.zeros(0, dtype=int)
+    order = np.lexsort((-pop, max_loss, -credit))
+    c, m, p = credit[order], max_loss[order], pop[order]
+    front: List[int] = []
+    for start in range(0, n, _PARETO_BLOCK):
+        blk = np.arange(start, min(start + _PARETO_BLOCK, n))
+        ref = np.concatenate([np.asarray(front, dtype=int), blk])
+        ge = (c[ref][None, :] >= c[blk][:, None]) & (m[ref][None, :] <= m[blk][:, None]) & (p[ref][None, :] >= p[blk][:, None])
+        gt = (c[ref][None, :] > c[blk][:, None]) | (m[ref][None, :] < m[blk][:, None]) | (p[ref][None, :] > p[blk][:, None])
+        dominated = (ge & gt).any(axis=1)
+        front.extend(blk[~dominated].tolist())
+    return order[np.asarray(front, dtype=int)]
+
+
+def _leg_reduction_is_exact(put_side: _Side, call_side: _Side, pa: np.ndarray, ca: np.ndarray) -> bool:
+    """True when replacing a leg by one with more credit and less delta keeps every pair valid.
+
+    Holds when no put short strike reaches a call short strike and the credit/width ratios
+    of the two sides cannot sum to 1 (so max_loss stays > 0); min_credit only gets easier.
+    """
+    if put_side.short_strike[pa].max() >= call_side.short_strike[ca].min():
+        return False
+    put_ratio = put_side.credit[pa] / (put_side.width[pa] * 100.0)
+    call_ratio = call_side.credit[ca] / (call_side.width[ca] * 100.0)
+    return bool(put_ratio.max() + call_ratio.max() < 1.0)
+
+
+def _valid_pair_front(
+    put_side: _Side,
+    call_side: _Side,
+    pa: np.ndarray,
+    ca: np.ndarray,
+    cfg: IronCondorSearchConfig,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """(credit sum, short delta sum) front of the valid pa x ca condors, built in bounded chunks."""
+    rows = max(1, _PAIR_CHUNK // ca.size)
+    cand_p: List[np.ndarray] = []
+    cand_c: List[np.ndarray] = []
+    for start in range(0, pa.size, rows):
+        pair_p = np.repeat(pa[start:start + rows], ca.size)
+        pair_c = np.tile(ca, min(rows, pa.size - start))
+        credit = put_side.credit[pair_p] + call_side.credit[pair_c]
+        max_loss = np.maximum(put_side.width[pair_p], call_side.width[pair_c]) * 100.0 - credit
+        ok = (
+            (put_side.short_strike[pair_p] < call_side.short_strike[pair_c])
+            & (credit >= cfg.min_credit)
+            & (max_loss > 0)
+        )
+        pair_p, pair_c = pair_p[ok], pair_c[ok]
+        if pair_p.size == 0:
+            continue
+        front = _front_2d(
+            put_side.credit[pair_p] + call_side.credit[pair_c],
+            put_side.short_delta[pair_p] + call_side.short_delta[pair_c],
+        )
+        cand_p.append(pair_p[front])
+        cand_c.append(pair_c[front])
+    if not cand_p:
+        return np.zeros(0, dtype=int), np.zeros(0, dtype=int)
+    pair_p, pair_c = np.concatenate(cand_p), np.concatenate(cand_c)
+    if len(cand_p) > 1:
+        front = _front_2d(
+            put_side.credit[pair_p] + call_side.credit[pair_c],
+            put_side.short_delta[pair_p] + call_side.short_delta[pair_c],
+        )
+        pair_p, pair_c = pair_p[front], pair_c[front]
+    return pair_p, pair_c
+
+
+def _search_expiry(
+    symbol: str,
+    expiry: date,
+    underlying_price: float,
+    puts: Sequence[NormalizedOptionQuote],
+    calls: Sequence[NormalizedOptionQuote],
+    cfg: IronCondorSearchConfig,
+    option_context: Any,
+) -> List[ScoredIronCondor]:
+    put_side = _side_arrays(puts, is_call=False, cfg=cfg)
+    call_side = _side_arrays(calls, is_call=True, cfg=cfg)
+    if put_side.credit.size == 0 or call_side.credit.size == 0:
+        return []
+
+    # Reduce the put x call product before the 3-objective front. For a condor with
+    # W = max(put width, call width), max_loss = W*100 - credit, so a valid condor can only
+    # be Pareto-best if it is on the (credit, short delta sum) front of the valid condors
+    # with width <= W. Validity (strike order, min_credit, max_loss > 0) is applied before
+    # that front; each leg is first cut to its side's (credit, short delta) front only when
+    # that cannot swap a valid condor for an invalid one.
+    pi_parts: List[np.ndarray] = []
+    ci_parts: List[np.ndarray] = []
+    for level in np.unique(np.concatenate([put_side.width, call_side.width])):
+        pa = np.nonzero(put_side.width <= level)[0]
+        ca = np.nonzero(call_side.width <= level)[0]
+        if pa.size == 0 or ca.size == 0:
+            continue
+        if _leg_reduction_is_exact(put_side, call_side, pa, ca):
+            pa = pa[_front_2d(put_side.credit[pa], put_side.short_delta[pa])]
+            ca = ca[_front_2d(call_side.credit[ca], call_side.short_delta[ca])]
+        pair_p, pair_c = _valid_pair_front(put_side, call_side, pa, ca, cfg)
+        if pair_p.size:
+            pi_parts.append(pair_p)
+            ci_parts.append(pair_c)
+    if not pi_parts:
+        return []
+    pair_key = np.unique(np.concatenate(pi_parts) * call_side.credit.size + np.concatenate(ci_parts))
+    pi, ci = np.divmod(pair_key, call_side.credit.size)
+
+    credit = put_side.credit[pi] + call_side.credit[ci]
+    max_loss = np.maximum(put_side.width[pi], call_side.width[ci]) * 100.0 - credit
+    pop = 1.0 - put_side.short_delta[pi] - call_side.short_delta[ci]
+    valid = (
+        (put_side.short_strike[pi] < call_side.short_strike[ci])
+        & (credit >= cfg.min_credit)
+        & (max_loss > 0)
+    )
+    pi, ci = pi[valid], ci[valid]
+    if pi.size == 0:
+        return []
+    credit, max_loss, pop = credit[valid], max_loss[valid], pop[valid]
+
+    keep = pareto_front(credit, max_loss, pop)
+    ev = pop[keep] * credit[keep] - (1.0 - pop[keep]) * max_loss[keep]
+    # Deterministic ranking: expected value desc, then strikes asc
+    rank = np.lexsort((
+        call_side.short_strike[ci[keep]],
+        put_side.short_strike[pi[keep]],
+        -ev,
+    ))
+    if cfg.max_results_per_expiry > 0:
+        rank = rank[: cfg.max_results_per_expiry]
+
+    out: List[ScoredIronCondor] = []
+    for r in rank:
+        k = keep[r]
+        p, c = pi[k], ci[k]
+        credit_put = float(put_side.credit[p])
+        credit_call = float(call_side.credit[c])
+        candidate = IronCondorCandidate(
+            symbol=symbol,
+            expiry=expiry,
+            put_short_strike=float(put_side.short_strike[p]),
+            put_long_strike=float(put_side.long_strike[p]),
+            call_short_strike=float(call_side.short_strike[c]),
+            call_long_strike=float(call_side.long_strike[c]),
+            credit_put=credit_put,
+            credit_call=credit_call,
+            max_loss_put=float(put_side.width[p]) * 100 - credit_put,
+            max_loss_call=float(call_side.width[c]) * 100 - credit_call,
+            underlying_price=underlying_price,
+            option_context=option_context,
+        )
+        out.append(
+            ScoredIronCondor(
+                candidate=candidate,
+                credit=float(credit[k]),
+                max_loss=float(max_loss[k]),
+                pop=float(pop[k]),
+                return_on_risk=float(credit[k] / max_loss[k]),
+                expected_value=float(ev[r]),
+            )
+        )
+    return out
+
+
+def search_iron_condors(
+    stock: StockSnapshot,
+    options: List[NormalizedOptionQuote],
+    base_cfg: SignalEngineConfig,
+    search_cfg: Optional[IronCondorSearchConfig] = None,
+    option_context: Any = None,
+    chain_index: Optional[ChainIndex] = None,
+) -> Tuple[List[ScoredIronCondor], List[ExclusionReason]]:
+    """Search every valid condor per expiry and return the Pareto-best set.
+
+    Results are ordered by expiry, then expected value (desc). Exclusion codes mirror
+    generate_iron_condor_candidates where they overlap.
+    """
+    cfg = search_cfg or IronCondorSearchConfig()
+    results: List[ScoredIronCondor] = []
+    exclusions: List[ExclusionReason] = []
+
+    underlying_price = stock.price
+    if underlying_price is None or underlying_price <= 0:
+        exclusions.append(
+            ExclusionReason(
+                code="NO_UNDERLYING_PRICE",
+                message=f"No underlying price for {stock.symbol}",
+                data={"symbol": stock.symbol},
+            )
+        )
+        return results, exclusions
+
+    if chain_index is None:
+        chain_index = build_chain_index(options, stock.symbol)
+    as_of = stock.snapshot_time
+    puts_by_expiry = chain_index.by_expiry("PUT", as_of, base_cfg.dte_min, base_cfg.dte_max)
+    calls_by_expiry = chain_index.by_expiry("CALL", as_of, base_cfg.dte_min, base_cfg.dte_max)
+
+    for expiry in sorted(set(puts_by_expiry) & set(calls_by_expiry)):
+        puts = [p for p in _liquid(puts_by_expiry[expiry], base_cfg) if float(p.strike) < underlying_price]
+        calls = [c for c in _liquid(calls_by_expiry[expiry], base_cfg) if float(c.strike) > underlying_price]
+        if len(puts) < 2 or len(calls) < 2:
+            exclusions.append(
+                ExclusionReason(
+                    code="IC_INSUFFICIENT_STRIKES",
+                    message=f"Iron condor: need 2+ liquid puts below and calls above spot for {stock.symbol} {expiry}",
+                    data={
+                        "symbol": stock.symbol,
+                        "expiry": expiry.isoformat(),
+                        "puts_below": len(puts),
+                        "calls_above": len(calls),
+                    },
+                )
+            )
+            continue
+        found = _search_expiry(
+            stock.symbol, expiry, underlying_price, puts, calls, cfg, option_context
+        )
+        if not found:
+            exclusions.append(
+                ExclusionReason(
+                    code="IC_NO_VALID_COMBINATION",
+                    message=f"Iron condor: no combination within width/delta constraints for {stock.symbol} {expiry}",
+                    data={
+                        "symbol": stock.symbol,
+                        "expiry": expiry.isoformat(),
+                        "short_delta_min": cfg.short_delta_min,
+                        "short_delta_max": cfg.short_delta_max,
+                        "width_min": cfg.width_min,
+                        "width_max": cfg.width_max,
+                    },
+                )
+            )
+            continue
+        results.extend(found)
+
+    return results, exclusions
+
+
+__all__ = [
+    "IronCondorSearchConfig",
+    "ScoredIronCondor",
+    "pareto_front",
+    "search_iron_condors",
+]
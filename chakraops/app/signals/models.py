@@ -11,6 +11,7 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 if TYPE_CHECKING:
     from app.models.option_context import OptionContext
+    from app.signals.iron_condor_search import IronCondorSearchConfig
 
 
 class SignalType(str, Enum):
@@ -125,6 +126,9 @@ class SignalEngineConfig:
     # Optional selection configuration (Phase 4A Step 2). When None, selection
     # is skipped even if scoring is enabled.
     selection_config: "SelectionConfig | None" = None
+    # Optional full-chain iron condor search. When None, the engine builds one
+    # heuristic condor per expiry (generate_iron_condor_candidates).
+    iron_condor_search: "IronCondorSearchConfig | None" = None
 
 
 @dataclass(frozen=True)
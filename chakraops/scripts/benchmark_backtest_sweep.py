@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Phase 5: Benchmark for the panel backtest and parallel parameter sweeps.
+
+Builds a synthetic (dates x symbols) snapshot panel (default 5 years x 500 symbols),
+then times one vectorized run and a sweep of 50 configs (DTE x delta band x price
+bounds) across processes. --with-csv also writes the panel as dated CSVs and times
+the cold load vs the cached (npz) load. No external calls.
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.backtest.engine import SnapshotCSVDataSource  # noqa: E402
+from app.backtest.panel import SnapshotPanel, load_snapshot_panel  # noqa: E402
+from app.backtest.sweep import build_param_grid, run_panel_backtest, run_parameter_sweep  # noqa: E402
+
+
+def _business_days(start: date, n: int) -> list:
+    out, d = [], start
+    while len(out) < n:
+        if d.weekday() < 5:
+            out.append(d)
+        d += timedelta(days=1)
+    return out
+
+
+def synthetic_panel(years: int, symbols: int, seed: int = 11) -> SnapshotPanel:
+    rng = np.random.default_rng(seed)
+    n_dates = years * 252
+    dates = _business_days(date(2020, 1, 2), n_dates)
+    start = rng.uniform(15, 600, symbols)
+    log_ret = rng.normal(0.0002, 0.02, (n_dates, symbols))
+    price = np.round(start * np.exp(np.cumsum(log_ret, axis=0)), 2)
+    price[rng.random(price.shape) < 0.01] = np.nan  # occasional missing rows
+    volume = rng.uniform(0.5e6, 5e6, price.shape)
+    iv_rank = np.round(rng.uniform(5, 90, price.shape), 1)
+    regimes = ["RISK_OFF" if 0.0 < (i % 120) / 120.0 < 0.08 else "RISK_ON" for i in range(n_dates)]
+    return SnapshotPanel(
+        dates=dates,
+        symbols=["S%04d" % j for j in range(symbols)],
+        regimes=regimes,
+        price=price,
+        volume=volume,
+        iv_rank=iv_rank,
+    )
+
+
+def _write_csvs(panel: SnapshotPanel, folder: Path) -> None:
+    folder.mkdir(parents=True, exist_ok=True)
+    for i, d in enumerate(panel.dates):
+        with open(folder / f"{d.isoformat()}.csv", "w", newline="", encoding="utf-8") as f:
+            w = csv.writer(f)
+            w.writerow(["symbol", "price", "volume", "iv_rank"])
+            for j, sym in enumerate(panel.symbols):
+                if not np.isnan(panel.price[i, j]):
+                    w.writerow([sym, f"{panel.price[i, j]:.2f}", int(panel.volume[i, j]), panel.iv_rank[i, j]])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Phase 5: Benchmark panel backtest + parameter sweeps")
+    parser.add_argument("--years", type=int, default=5, help="Years of daily snapshots (default: 5)")
+    parser.add_argument("--symbols", type=int, default=500, help="Symbols per snapshot (default: 500)")
+    parser.add_argument("--workers", type=int, default=None, help="Sweep processes (default: cpu count)")
+    parser.add_argument("--with-csv", action="store_true", help="Also time CSV load and cached panel load")
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    panel = synthetic_panel(args.years, args.symbols)
+    print(f"Panel: {panel.shape[0]} dates x {panel.shape[1]} symbols built in {time.perf_counter() - t0:.2f}s")
+
+    if args.with_csv:
+        with tempfile.TemporaryDirectory() as tmp:
+            folder = Path(tmp) / "snapshots"
+            _write_csvs(panel, folder)
+            source = SnapshotCSVDataSource(folder)
+            t0 = time.perf_counter()
+            load_snapshot_panel(source, cache_dir=Path(tmp) / "cache")
+            cold = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            load_snapshot_panel(source, cache_dir=Path(tmp) / "cache")
+            print(f"CSV load: cold {cold:.2f}s, cached {time.perf_counter() - t0:.3f}s")
+
+    t0 = time.perf_counter()
+    report = run_panel_backtest(panel)
+    print(f"Single run: {report.total_trades} trades, pnl={report.total_pnl:,.0f} in {time.perf_counter() - t0:.2f}s")
+
+    grid = build_param_grid(
+        dte_days=[30, 35, 40, 42, 45],
+        delta_max=[0.25, 0.30, 0.35, 0.40, 0.45],
+        min_price=[20.0, 50.0],
+    )
+    report = run_parameter_sweep(panel, grid, max_workers=args.workers, write_report=False)
+    best = report.best()
+    print(
+        f"Sweep: {len(grid)} configs, {report.workers} workers in {report.elapsed_ms / 1000:.2f}s "
+        f"({len(grid) / max(report.elapsed_ms / 1000, 1e-9):.1f} configs/s); best={best['label'] if best else None}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Benchmark full-history vs incremental hist/dailies sync against a local ORATS stub.
+
+Starts a threaded HTTP server that answers /datav2/hist/dailies with --years of synthetic
+bars (honouring the tradeDate=<from>,<to> window) after a fixed latency, then runs one
+"nightly" over --symbols tickers twice:
+
+  full:        empty store every night (the previous full-pull behaviour)
+  incremental: store synced yesterday, so only the missing window is requested
+
+and prints bytes transferred, request latency and wall time from daily_bars.sync_stats().
+
+Example:
+    python scripts/benchmark_daily_bars.py --symbols 200 --years 10 --latency-ms 50
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.core.data import daily_bars  # noqa: E402
+
+
+def _history(years: int):
+    today = date.today()
+    d = today - timedelta(days=365 * years)
+    out = []
+    while d <= today:
+        if d.weekday() < 5:
+            out.append(d.isoformat())
+        d += timedelta(days=1)
+    return out
+
+
+def _make_handler(latency_sec: float, dates):
+    class _Handler(BaseHTTPRequestHandler):
+        def do_GET(self):  # noqa: N802
+            url = urlparse(self.path)
+            if not url.path.endswith("/hist/dailies"):
+                self.send_error(404)
+                return
+            qs = parse_qs(url.query)
+            ticker = qs.get("ticker", [""])[0]
+            window = qs.get("tradeDate", [""])[0]
+            lo, _, hi = window.partition(",")
+            time.sleep(latency_sec)
+            rows = [
+                {"tradeDate": d, "openPx": 100.0, "hiPx": 101.5, "loPx": 98.5, "clsPx": 100.25,
+                 "stockVolume": 1_250_000, "ticker": ticker}
+                for d in dates
+                if not window or (lo <= d <= (hi or lo))
+            ]
+            body = json.dumps({"data": rows}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return _Handler
+
+
+def _age_store(store: Path, days: int) -> None:
+    """Make every store file look like it was last synced `days` ago, minus the newest bars."""
+    stamp = time.time() - days * 86400
+    for p in store.glob("*.json"):
+        bars = json.loads(p.read_text(encoding="utf-8"))
+        p.write_text(json.dumps(bars[:-days] if days else bars), encoding="utf-8")
+        os.utime(p, (stamp, stamp))
+
+
+def _nightly(store: Path, tickers) -> dict:
+    repo = daily_bars.DailyBarRepository(store, token="bench")
+    daily_bars.reset_sync_stats()
+    t0 = time.perf_counter()
+    for t in tickers:
+        repo.get_bars(t, 400)
+    stats = daily_bars.sync_stats()
+    stats["wall_sec"] = time.perf_counter() - t0
+    return stats
+
+
+def _line(label: str, s: dict) -> str:
+    return (
+        f"  {label:<12} requests={s['requests']:<5} bytes={s['bytes'] / 1e6:8.2f} MB "
+        f"latency={s['latency_ms'] / 1000:7.2f}s (avg {s['avg_latency_ms']:.0f} ms) wall={s['wall_sec']:.2f}s"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark full vs incremental daily-bar sync")
+    parser.add_argument("--symbols", type=int, default=200, help="Universe size")
+    parser.add_argument("--years", type=int, default=10, help="Years of history served per symbol")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="Stub latency per request (ms)")
+    parser.add_argument("--gap-days", type=int, default=1, help="Days since the store was last synced")
+    args = parser.parse_args()
+
+    dates = _history(args.years)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(args.latency_ms / 1000.0, dates))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    daily_bars.BASE_DATAV2 = "http://127.0.0.1:%d/datav2" % server.server_address[1]
+    tickers = ["T%04d" % i for i in range(args.symbols)]
+
+    print(f"{args.symbols} symbols, {len(dates)} bars/symbol, stub latency {args.latency_ms:.0f} ms")
+    with tempfile.TemporaryDirectory() as tmp:
+        store = Path(tmp)
+        full = _nightly(store, tickers)
+        _age_store(store, args.gap_days)
+        incr = _nightly(store, tickers)
+    print(_line("full", full))
+    print(_line("incremental", incr))
+    if incr["bytes"]:
+        print(f"  bytes reduction: {full['bytes'] / incr['bytes']:.0f}x")
+    server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
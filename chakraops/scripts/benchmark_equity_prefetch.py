@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark the Stage-1 equity pre-fetch against a local ORATS stub.
+
+Starts a threaded HTTP server that answers /datav2/strikes/options and /datav2/ivrank
+with synthetic rows after a fixed latency, points orats_equity_quote at it, and times
+fetch_full_equity_snapshots sequentially (max_workers=1) vs concurrently at each
+universe size. The disk cache is disabled so every batch is a live call.
+
+Example:
+    python scripts/benchmark_equity_prefetch.py --sizes 100 500 1000 --latency-ms 150 --rate 5
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.core.orats import orats_equity_quote as eq  # noqa: E402
+
+
+def _make_handler(latency_sec: float):
+    class _Handler(BaseHTTPRequestHandler):
+        def do_GET(self):  # noqa: N802
+            url = urlparse(self.path)
+            qs = parse_qs(url.query)
+            time.sleep(latency_sec)
+            if url.path.endswith("/strikes/options"):
+                tickers = qs.get("tickers", [""])[0].split(",")
+                rows = [
+                    {"ticker": t, "stockPrice": 100.0, "bid": 99.9, "ask": 100.1, "volume": 1_500_000,
+                     "quoteDate": "2026-10-16"}
+                    for t in tickers if t
+                ]
+            elif url.path.endswith("/ivrank"):
+                tickers = qs.get("ticker", [""])[0].split(",")
+                rows = [{"ticker": t, "ivRank1m": 35.0, "ivPct1m": 40.0} for t in tickers if t]
+            else:
+                self.send_error(404)
+                return
+            body = json.dumps({"data": rows}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return _Handler
+
+
+def _time_fetch(tickers, max_workers: int) -> float:
+    t0 = time.perf_counter()
+    snaps = eq.fetch_full_equity_snapshots(tickers, eq.EquityQuoteCache(), max_workers=max_workers)
+    elapsed = time.perf_counter() - t0
+    missing = sum(1 for s in snaps.values() if s.missing_fields)
+    if missing:
+        print(f"  warning: {missing} snapshots with missing fields")
+    return elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark equity pre-fetch (sequential vs concurrent)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 500, 1000], help="Universe sizes")
+    parser.add_argument("--latency-ms", type=float, default=150.0, help="Stub response latency per call (ms)")
+    parser.add_argument("--rate", type=float, default=eq.RATE_LIMIT_CALLS_PER_SEC, help="Shared calls/sec budget")
+    parser.add_argument("--workers", type=int, default=eq.EQUITY_PREFETCH_MAX_WORKERS, help="Concurrent batches")
+    parser.add_argument("--skip-sequential", action="store_true", help="Only time the concurrent path")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(args.latency_ms / 1000.0))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    eq.ORATS_BASE_URL = "http://127.0.0.1:%d/datav2" % server.server_address[1]
+    import app.core.data.cache_store as cache_store
+    cache_store.CACHE_ENABLED = False
+
+    print(
+        f"Stub latency {args.latency_ms:.0f} ms, rate budget {args.rate:g} calls/s, "
+        f"batch size {eq.BATCH_SIZE}, workers {args.workers}"
+    )
+    for n in args.sizes:
+        tickers = ["T%04d" % i for i in range(n)]
+        calls = 2 * -(-n // eq.BATCH_SIZE)
+        floor = calls / args.rate
+        line = f"{n:>5} symbols ({calls} calls, rate floor {floor:.1f}s):"
+        if not args.skip_sequential:
+            eq._RATE_LIMITER = eq._RateLimiter(args.rate)
+            line += f" sequential {_time_fetch(tickers, 1):.2f}s"
+        eq._RATE_LIMITER = eq._RateLimiter(args.rate)
+        line += f" concurrent {_time_fetch(tickers, args.workers):.2f}s"
+        print(line)
+    server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+End-to-end benchmark of evaluate_universe_staged against replayed ORATS data.
+
+Each universe size runs in a fresh child process (cold caches, honest peak RSS) with
+every ORATS call routed to a local OratsStubServer that serves a fixture bundle with
+the configured latency / jitter / error rate. Reported per size: wall time, requests
+by endpoint, cache and singleflight hit rates, peak RSS, per-stage timings (from the
+run trace) and verdict counts. Results are compared against the checked-in baseline.
+
+Without --bundle a deterministic synthetic bundle is used; tickers beyond the bundle
+are cloned from recorded ones, so any size works.
+
+Examples:
+    python scripts/benchmark_eval_replay.py                        # run + compare to baseline
+    python scripts/benchmark_eval_replay.py --sizes 25 100 --check  # exit 1 on regression
+    python scripts/benchmark_eval_replay.py --update-baseline
+    python scripts/benchmark_eval_replay.py --record out/orats_bundle.json.gz --symbols AAPL,MSFT,SPY
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO))
+
+DEFAULT_BASELINE = REPO / "scripts" / "baselines" / "eval_replay_baseline.json"
+STAGE_SPANS = ("equity_prefetch", "stage1", "stage2", "regime_position_gates", "scoring")
+# Metrics compared against the baseline (higher is worse)
+COMPARED = ("wall_s", "requests", "peak_rss_mb")
+
+
+def _isolate_stores(tmp: Path) -> None:
+    """Point the disk-backed ORATS caches at tmp so runs start cold and leave the repo untouched."""
+    from app.core.data import daily_bars
+    from app.core.eligibility import candles
+    from app.core.eligibility.providers.orats_daily_provider import OratsDailyProvider
+
+    daily_bars._REPOSITORY = daily_bars.DailyBarRepository(cache_dir=tmp / "candles")
+    candles._provider = OratsDailyProvider(cache_dir=tmp / "candles")
+
+
+def _load_bundle(args: argparse.Namespace):
+    from app.core.orats.replay import FixtureBundle, synthetic_bundle, synthetic_tickers
+
+    if args.bundle:
+        return FixtureBundle.load(args.bundle)
+    return synthetic_bundle(synthetic_tickers(args.templates, prefix="B"))
+
+
+def _universe(bundle, size: int) -> List[str]:
+    from app.core.orats.replay import synthetic_tickers
+
+    recorded = bundle.tickers()
+    extra = [t for t in synthetic_tickers(size) if t not in recorded]
+    return (recorded + extra)[:size]
+
+
+def run_child(args: argparse.Namespace, size: int) -> Dict[str, Any]:
+    """One measured evaluation of `size` symbols in this (fresh) process."""
+    import logging
+
+    logging.disable(logging.WARNING)
+    tmp = Path(os.environ["CACHE_DIR"]).parent
+    _isolate_stores(tmp)
+
+    from app.core.data.cache_store import cache_stats
+    from app.core.data.daily_bars import sync_stats
+    from app.core.eval.staged_evaluator import evaluate_universe_staged
+    from app.core.observability.tracing import summarize_trace, trace_run
+    from app.core.orats.replay import OratsStubServer, route_orats_to
+
+    bundle = _load_bundle(args)
+    symbols = _universe(bundle, size)
+    stub = OratsStubServer(
+        bundle, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, error_rate=args.error_rate, seed=size,
+    )
+    with stub, route_orats_to(stub.url), trace_run(f"bench_{size}", save=False) as trace:
+        t0 = time.perf_counter()
+        result = evaluate_universe_staged(symbols)
+        wall = time.perf_counter() - t0
+    profile = summarize_trace(trace.to_dict()) if trace is not None else {"by_name": {}, "waits": {}}
+
+    try:
+        import resource
+        peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (1024.0 if sys.platform != "darwin" else 1024.0 ** 2)
+    except ImportError:
+        peak_rss_mb = None
+
+    verdicts: Dict[str, int] = {}
+    stages: Dict[str, int] = {}
+    for r in result.results:
+        verdicts[str(r.verdict)] = verdicts.get(str(r.verdict), 0) + 1
+        stage = getattr(r.stage_reached, "value", str(r.stage_reached))
+        stages[stage] = stages.get(stage, 0) + 1
+    served = stub.stats()
+    caches = cache_stats()
+    bars = sync_stats()
+    return {
+        "symbols": size,
+        "wall_s": round(wall, 3),
+        "symbols_per_s": round(size / wall, 2) if wall > 0 else None,
+        "requests": served["requests"],
+        "errors": served["errors"],
+        "requests_by_endpoint": {k: v["requests"] for k, v in served["by_endpoint"].items()},
+        "cache_hit_rate_pct": caches.get("cache_hit_rate_pct"),
+        "singleflight_collapsed": caches.get("singleflight_collapsed"),
+        "daily_bar_store_hits": bars.get("store_hits"),
+        "peak_rss_mb": round(peak_rss_mb, 1) if peak_rss_mb is not None else None,
+        "stage_ms": {
+            name: round(profile["by_name"][name]["total_ms"], 1) for name in STAGE_SPANS if name in profile["by_name"]
+        },
+        "queue_wait_ms": profile["waits"].get("queue_wait_ms", {}),
+        "verdicts": dict(sorted(verdicts.items())),
+        "stage_reached": dict(sorted(stages.items())),
+    }
+
+
+def _spawn(args: argparse.Namespace, size: int) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory(prefix="bench_eval_") as tmp:
+        env = dict(os.environ, CACHE_DIR=str(Path(tmp) / "cache"), EVAL_TRACING="1")
+        cmd = [
+            sys.executable, __file__, "--child", str(size),
+            "--latency-ms", str(args.latency_ms), "--jitter-ms", str(args.jitter_ms),
+            "--error-rate", str(args.error_rate), "--templates", str(args.templates),
+        ]
+        if args.bundle:
+            cmd += ["--bundle", str(args.bundle)]
+        proc = subprocess.run(cmd, env=env, cwd=str(REPO), capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"benchmark child for {size} symbols failed:\n{proc.stderr[-2000:]}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def _config(args: argparse.Namespace) -> Dict[str, Any]:
+    return {
+        "bundle": Path(args.bundle).name if args.bundle else f"synthetic:{args.templates}",
+        "latency_ms": args.latency_ms,
+        "jitter_ms": args.jitter_ms,
+        "error_rate": args.error_rate,
+    }
+
+
+def compare(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Regression messages for metrics above baseline * (1 + tolerance)."""
+    problems: List[str] = []
+    base_results = baseline.get("results") or {}
+    for size, cur in results.items():
+        base = base_results.get(size)
+        if not base:
+            continue
+        for metric in COMPARED:
+            b, c = base.get(metric), cur.get(metric)
+            if b is None or c is None or b <= 0:
+                continue
+            if c > b * (1.0 + tolerance):
+                problems.append(f"{size} symbols: {metric} {c} vs baseline {b} (+{(c / b - 1) * 100:.0f}%)")
+    return problems
+
+
+def _print_row(size: str, r: Dict[str, Any], base: Optional[Dict[str, Any]]) -> None:
+    def delta(metric: str) -> str:
+        if not base or not base.get(metric) or r.get(metric) is None:
+            return ""
+        return f" ({(r[metric] / base[metric] - 1) * 100:+.0f}%)"
+
+    print(
+        f"{size:>6} symbols: wall {r['wall_s']:.2f}s{delta('wall_s')}  requests {r['requests']}{delta('requests')}"
+        f"  errors {r['errors']}  cache hit {r['cache_hit_rate_pct']}%  peak RSS {r['peak_rss_mb']} MB{delta('peak_rss_mb')}"
+    )
+    print(f"{'':>15}stages(ms) {r['stage_ms']}")
+    print(f"{'':>15}by endpoint {r['requests_by_endpoint']}  stage_reached {r['stage_reached']}")
+
+
+def record(args: argparse.Namespace) -> int:
+    """Run a live evaluation for --symbols and save every ORATS response as a bundle."""
+    from app.core.eval.staged_evaluator import evaluate_universe_staged
+    from app.core.orats.replay import FixtureBundle, record_orats
+
+    symbols = [s.strip().upper() for s in (args.symbols or "").split(",") if s.strip()]
+    if not symbols:
+        print("--record needs --symbols", file=sys.stderr)
+        return 2
+    with tempfile.TemporaryDirectory(prefix="bench_record_") as tmp:
+        _isolate_stores(Path(tmp))
+        bundle = FixtureBundle()
+        with record_orats(bundle):
+            evaluate_universe_staged(symbols)
+    path = bundle.save(args.record)
+    print(f"Recorded {bundle.row_count()} rows for {len(bundle.tickers())} tickers -> {path}")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Replay-backed end-to-end evaluation benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[25, 100, 250], help="Universe sizes")
+    parser.add_argument("--bundle", default=None, help="Fixture bundle (.json/.json.gz); default synthetic")
+    parser.add_argument("--templates", type=int, default=16, help="Synthetic bundle tickers (no --bundle)")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Stub latency per request")
+    parser.add_argument("--jitter-ms", type=float, default=5.0, help="Uniform +/- latency jitter")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered 503")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE), help="Baseline JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.30, help="Allowed regression before --check fails")
+    parser.add_argument("--check", action="store_true", help="Exit 1 when a metric regresses past tolerance")
+    parser.add_argument("--update-baseline", action="store_true", help="Write results as the new baseline")
+    parser.add_argument("--json", default=None, help="Also write results to this file")
+    parser.add_argument("--record", default=None, help="Record live ORATS responses for --symbols to this bundle")
+    parser.add_argument("--symbols", default=None, help="Comma list of tickers for --record")
+    parser.add_argument("--child", type=int, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child is not None:
+        print(json.dumps(run_child(args, args.child)))
+        return 0
+    if args.record:
+        return record(args)
+
+    baseline_path = Path(args.baseline)
+    baseline: Dict[str, Any] = json.loads(baseline_path.read_text()) if baseline_path.exists() else {}
+    config = _config(args)
+    if baseline and baseline.get("config") != config:
+        print(f"Note: baseline config {baseline.get('config')} differs from this run {config}; deltas are indicative only")
+
+    print(f"Replay benchmark: {config}")
+    results: Dict[str, Dict[str, Any]] = {}
+    for size in args.sizes:
+        results[str(size)] = _spawn(args, size)
+        _print_row(str(size), results[str(size)], (baseline.get("results") or {}).get(str(size)))
+
+    report = {
+        "config": config,
+        "recorded_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2))
+    if args.update_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"Baseline written to {baseline_path}")
+        return 0
+
+    problems = compare(results, baseline, args.tolerance) if baseline else []
+    for p in problems:
+        print(f"REGRESSION: {p}")
+    if not problems and baseline:
+        print(f"No regressions beyond {args.tolerance:.0%} of baseline.")
+    return 1 if (problems and args.check) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
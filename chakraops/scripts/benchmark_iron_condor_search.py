@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Iron condor search benchmark — vectorized full-chain search_iron_condors on a synthetic chain.
+
+One expiry, P puts below and P calls above spot (seeded shape, no external calls). Reports the
+median wall time and the Pareto set size; the target is a 300-strike chain under two seconds.
+
+Example:
+    python scripts/benchmark_iron_condor_search.py --strikes-per-side 150 --step 0.5
+"""
+from __future__ import annotations
+
+import argparse
+import math
+import statistics
+import sys
+import time
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.core.market.stock_models import StockSnapshot  # noqa: E402
+from app.signals.adapters.theta_options_adapter import NormalizedOptionQuote  # noqa: E402
+from app.signals.iron_condor_search import IronCondorSearchConfig, search_iron_condors  # noqa: E402
+from app.signals.models import SignalEngineConfig  # noqa: E402
+
+AS_OF = datetime(2026, 1, 22, 10, 0, 0)
+EXPIRY = date(2026, 2, 20)
+
+
+def _chain(spot: float, step: float, n_each_side: int) -> List[NormalizedOptionQuote]:
+    quotes: List[NormalizedOptionQuote] = []
+    for i in range(1, n_each_side + 1):
+        for right in ("PUT", "CALL"):
+            strike = spot - i * step if right == "PUT" else spot + i * step
+            dist = i * step / spot
+            delta = max(0.01, 0.5 * math.exp(-dist * 12))
+            bid = round(max(0.02, 4.0 * math.exp(-dist * 10)), 2)
+            quotes.append(NormalizedOptionQuote(
+                underlying="BENCH", expiry=EXPIRY, strike=Decimal(str(strike)), right=right,
+                bid=bid, ask=round(bid + 0.04, 2), last=None, volume=100, open_interest=500, as_of=AS_OF,
+                delta=-delta if right == "PUT" else delta,
+            ))
+    return quotes
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Iron condor search benchmark")
+    parser.add_argument("--strikes-per-side", type=int, default=150)
+    parser.add_argument("--step", type=float, default=0.5)
+    parser.add_argument("--width-max", type=float, default=10.0)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--target-sec", type=float, default=2.0)
+    args = parser.parse_args()
+
+    spot = 100.0
+    stock = StockSnapshot(
+        symbol="BENCH", price=spot, bid=spot - 0.01, ask=spot + 0.01, volume=1_000_000,
+        avg_stock_volume_20d=2_000_000.0, has_options=True, snapshot_time=AS_OF, data_source="ORATS",
+    )
+    chain = _chain(spot, args.step, args.strikes_per_side)
+    base = SignalEngineConfig(dte_min=7, dte_max=45, min_bid=0.01, min_open_interest=0, max_spread_pct=100.0)
+    cfg = IronCondorSearchConfig(short_delta_min=0.02, short_delta_max=0.45, width_min=args.step, width_max=args.width_max)
+
+    samples = []
+    results: list = []
+    for _ in range(args.repeats):
+        t0 = time.perf_counter()
+        results, _ = search_iron_condors(stock, chain, base, cfg)
+        samples.append(time.perf_counter() - t0)
+    median = statistics.median(samples)
+    print(f"strikes/side={args.strikes_per_side} step={args.step} width_max={args.width_max} repeats={args.repeats}")
+    print(f"  pareto candidates {len(results)}  median {median * 1000:.1f} ms  min {min(samples) * 1000:.1f} ms  "
+          f"target < {args.target_sec * 1000:.0f} ms  {'ok' if median < args.target_sec else 'SLOW'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
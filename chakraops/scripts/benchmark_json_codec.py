@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+JSON codec benchmark — encode/decode time and peak memory for a large run artifact.
+
+  legacy:        asdict(run) + json.dump(indent=2, default=str), json.load
+  codec/stdlib:  shallow fields + streamed app.core.io.json_codec.dump, stdlib loads
+  codec/orjson:  same with the orjson backend (skipped when orjson is not installed)
+
+Peak memory is measured with tracemalloc around each encode/decode (Python allocations).
+Synthetic EvaluationRunFull with N symbol rows; no external calls.
+
+Example:
+    python scripts/benchmark_json_codec.py --symbols 2000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Callable, Dict, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.core.eval.evaluation_store import EvaluationRunFull  # noqa: E402
+from app.core.io import json_codec  # noqa: E402
+
+
+def _run(n: int, seed: int) -> EvaluationRunFull:
+    rng = random.Random(seed)
+    symbols = []
+    for i in range(n):
+        sym = f"S{i:04d}"
+        symbols.append({
+            "symbol": sym,
+            "verdict": rng.choice(["ELIGIBLE", "HOLD", "BLOCKED"]),
+            "score": rng.randint(0, 100),
+            "price": round(rng.uniform(5, 900), 2),
+            "bid": round(rng.uniform(5, 900), 2),
+            "ask": round(rng.uniform(5, 900), 2),
+            "volume": rng.randint(10_000, 50_000_000),
+            "iv_rank": round(rng.uniform(0, 100), 2),
+            "quote_date": "2026-03-02",
+            "fetched_at": "2026-03-02T20:59:00+00:00",
+            "primary_reason": rng.choice(["Stage 2 passed", "IV rank below threshold", "Earnings within 7 days"]),
+            "score_breakdown": {k: rng.randint(0, 100) for k in ("data_quality", "regime", "options_liquidity", "strategy_fit", "capital_efficiency")},
+            "symbol_eligibility": {"status": "PASS", "reasons": [], "required_data_missing": []},
+            "contract_data": {"available": True, "source": "DELAYED", "expiration_count": rng.randint(4, 20),
+                              "contract_count": rng.randint(50, 900), "rejection_counts": {"delta": rng.randint(0, 40), "oi": rng.randint(0, 40)}},
+            "candidates": [
+                {"strategy": "CSP", "strike": round(rng.uniform(5, 900), 1), "expiry": "2026-04-17",
+                 "delta": round(-rng.uniform(0.1, 0.35), 3), "credit_estimate": round(rng.uniform(0.2, 12), 2)}
+                for _ in range(3)
+            ],
+        })
+    return EvaluationRunFull(
+        run_id="eval_20260302_210000_bench", started_at="2026-03-02T20:58:00+00:00",
+        completed_at="2026-03-02T21:00:00+00:00", status="COMPLETED", total=n, evaluated=n, symbols=symbols,
+        top_candidates=symbols[:20],
+    )
+
+
+def _measure(fn: Callable[[], Any], repeats: int) -> Tuple[float, float, Any]:
+    samples, result = [], None
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(samples), peak / (1 << 20), result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="JSON codec benchmark")
+    parser.add_argument("--symbols", type=int, default=2000)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+
+    run = _run(args.symbols, args.seed)
+    tmp = Path(tempfile.mkdtemp(prefix="chakraops_json_bench_"))
+    reference = json.loads(json.dumps(asdict(run), default=str))
+
+    def legacy_encode() -> int:
+        with open(tmp / "legacy.json", "w", encoding="utf-8") as f:
+            json.dump(asdict(run), f, indent=2, default=str)
+        return (tmp / "legacy.json").stat().st_size
+
+    def legacy_decode() -> Dict[str, Any]:
+        with open(tmp / "legacy.json", "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def codec_encode(name: str) -> Callable[[], int]:
+        def _enc() -> int:
+            with open(tmp / f"{name}.json", "wb") as f:
+                return json_codec.dump(json_codec.shallow_asdict(run), f)
+        return _enc
+
+    def codec_decode(name: str) -> Callable[[], Any]:
+        return lambda: json_codec.read_json(tmp / f"{name}.json")
+
+    modes: Dict[str, Tuple[Callable[[], Any], Callable[[], Any], str]] = {"legacy json indent=2": (legacy_encode, legacy_decode, "")}
+    for name in ("stdlib", "orjson"):
+        try:
+            json_codec.use_backend(name)
+        except ValueError:
+            print(f"  (codec/{name} skipped: backend not available)")
+            continue
+        modes[f"codec/{name} streamed"] = (codec_encode(name), codec_decode(name), name)
+
+    print(f"symbols={args.symbols} repeats={args.repeats}")
+    print(f"  {'mode':<26}{'encode ms':>11}{'peak MiB':>10}{'decode ms':>11}{'peak MiB':>10}{'file KiB':>10}  parity")
+    for label, (enc, dec, backend) in modes.items():
+        if backend:
+            json_codec.use_backend(backend)
+        enc_ms, enc_peak, size = _measure(enc, args.repeats)
+        dec_ms, dec_peak, parsed = _measure(dec, args.repeats)
+        ok = parsed == reference
+        print(f"  {label:<26}{enc_ms:>11.1f}{enc_peak:>10.1f}{dec_ms:>11.1f}{dec_peak:>10.1f}{size / 1024:>10.0f}  {'ok' if ok else 'MISMATCH'}")
+    json_codec.use_backend(None)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
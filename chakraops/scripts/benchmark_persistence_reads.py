@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Per-call latency of the hot persistence read helpers, before vs after run-once migrations.
+
+  before: every call runs the full schema pass first (the previous init_persistence_db:
+          open a connection, ~40 CREATE/ALTER/INDEX/UPDATE statements, commit, then the
+          market snapshot schema the same way)
+  after:  init_persistence_db() is the versioned ensure_schema() check (in-memory once
+          the DB file is migrated)
+
+Runs against a seeded temporary database; the repo DB is never touched.
+
+Example:
+    python scripts/benchmark_persistence_reads.py --calls 300
+"""
+from __future__ import annotations
+
+import argparse
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.core import market_snapshot, persistence  # noqa: E402
+from app.db.migrations import migration_stats, reset_migration_cache  # noqa: E402
+
+
+def _legacy_init(db_path: Path) -> Callable[[], None]:
+    """The pre-migration init_persistence_db: a full schema pass on every call."""
+
+    def init() -> None:
+        for step in (persistence._migrate_persistence_v1, market_snapshot._migrate_snapshot_v1):
+            conn = sqlite3.connect(str(db_path))
+            try:
+                step(conn.cursor())
+                conn.commit()
+            finally:
+                conn.close()
+
+    return init
+
+
+def _seed(days: int) -> None:
+    today = datetime.now(timezone.utc).date()
+    for i in range(days):
+        d = (today - timedelta(days=i)).isoformat()
+        persistence.save_daily_rejection_summary(d, {"total": 100 + i, "by_reason": {"low_iv": i}})
+        persistence.add_capital_ledger_entry(d, f"pos-{i % 5}", "OPEN", 150.0 + i)
+        persistence.add_position_event(f"pos-{i % 5}", "OPENED", {"i": i})
+
+
+def _helpers() -> Dict[str, Callable[[], object]]:
+    today = datetime.now(timezone.utc).date()
+    return {
+        "get_rejection_history": lambda: persistence.get_rejection_history(30),
+        "compute_monthly_summary": lambda: persistence.compute_monthly_summary(today.year, today.month),
+        "get_recent_position_events": lambda: persistence.get_recent_position_events(7),
+        "get_trust_report_history": lambda: persistence.get_trust_report_history("daily", 30),
+        "get_enabled_symbols": persistence.get_enabled_symbols,
+    }
+
+
+def _measure(fn: Callable[[], object], calls: int) -> Dict[str, float]:
+    fn()  # warm
+    samples: List[float] = []
+    for _ in range(calls):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1e6)
+    samples.sort()
+    return {
+        "p50_us": round(statistics.median(samples), 1),
+        "p95_us": round(samples[int(len(samples) * 0.95) - 1], 1),
+        "mean_us": round(statistics.fmean(samples), 1),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Persistence read helper latency, before/after migrations")
+    parser.add_argument("--calls", type=int, default=200, help="Timed calls per helper and mode")
+    parser.add_argument("--seed-days", type=int, default=60, help="Days of seeded rows")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="bench_persist_") as tmp:
+        db_path = Path(tmp) / "chakraops.db"
+        persistence.get_db_path = lambda: db_path  # type: ignore[assignment]
+        market_snapshot.get_db_path = lambda: db_path  # type: ignore[assignment]
+        reset_migration_cache()
+        _seed(args.seed_days)
+
+        migrated_init = persistence.init_persistence_db
+        legacy_init = _legacy_init(db_path)
+        print(f"{'helper':<32}{'before p50':>12}{'after p50':>12}{'before p95':>12}{'after p95':>12}{'speedup':>9}")
+        for name, fn in _helpers().items():
+            persistence.init_persistence_db = legacy_init  # type: ignore[assignment]
+            before = _measure(fn, args.calls)
+            persistence.init_persistence_db = migrated_init  # type: ignore[assignment]
+            after = _measure(fn, args.calls)
+            speedup = before["p50_us"] / after["p50_us"] if after["p50_us"] else float("inf")
+            print(
+                f"{name:<32}{before['p50_us']:>10.0f}us{after['p50_us']:>10.0f}us"
+                f"{before['p95_us']:>10.0f}us{after['p95_us']:>10.0f}us{speedup:>8.1f}x"
+            )
+        print(f"migrations: {migration_stats()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
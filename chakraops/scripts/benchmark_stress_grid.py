@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Phase 8.3c: Stress grid benchmark — vectorized simulate_stress_grid over P positions x S shocks.
+
+Synthetic CSP/CC book (seeded), no external calls. Reports the median wall time; the
+Phase 8.3c target is 10k positions x 200 scenarios under one second.
+
+Example:
+    python scripts/benchmark_stress_grid.py --positions 10000 --scenarios 200
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.core.portfolio.stress_grid import simulate_stress_grid  # noqa: E402
+
+_SYMBOLS = ["SPY", "QQQ", "AAPL", "NVDA", "AMD", "JPM", "XOM", "KO", "ZZZ"]
+
+
+def _positions(n: int, seed: int) -> List[Dict[str, Any]]:
+    rng = np.random.default_rng(seed)
+    out = []
+    for i in range(n):
+        spot = float(rng.uniform(20, 500))
+        out.append({
+            "symbol": _SYMBOLS[i % len(_SYMBOLS)],
+            "mode": "CSP" if i % 4 else "CC",
+            "strike": round(spot * float(rng.uniform(0.8, 1.0)), 2),
+            "contracts": int(rng.integers(1, 5)),
+            "spot": spot,
+            "cost_basis_per_share": spot,
+        })
+    return out
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Phase 8.3c: stress grid benchmark")
+    parser.add_argument("--positions", type=int, default=10_000)
+    parser.add_argument("--scenarios", type=int, default=200)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--target-sec", type=float, default=1.0)
+    args = parser.parse_args()
+
+    positions = _positions(args.positions, args.seed)
+    shocks = np.linspace(-0.5, 0.2, args.scenarios)
+    samples = []
+    for _ in range(args.repeats):
+        t0 = time.perf_counter()
+        out = simulate_stress_grid({"portfolio_equity_usd": 5_000_000.0}, positions, shocks=shocks)
+        samples.append(time.perf_counter() - t0)
+    median = statistics.median(samples)
+    print(f"positions={out.positions_evaluated} scenarios={len(shocks)} repeats={args.repeats}")
+    print(f"  median {median * 1000:.1f} ms  min {min(samples) * 1000:.1f} ms  target < {args.target_sec * 1000:.0f} ms  "
+          f"{'ok' if median < args.target_sec else 'SLOW'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
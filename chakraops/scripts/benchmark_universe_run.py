@@ -3,7 +3,8 @@
 Phase 8.7: Benchmark tool for universe run planning.
 
 Estimates runtime, HTTP calls, and per-hour volume. No external calls.
-Planning tool only.
+Planning tool only; scripts/benchmark_eval_replay.py measures real runs against
+replayed ORATS data.
 """
 from __future__ import annotations
 
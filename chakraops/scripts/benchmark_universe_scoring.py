@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Universe scoring cost, per-symbol vs compiled profile vs batch.
+
+  legacy:   compute_score_breakdown per symbol, re-parsing config/scoring.yaml and
+            resolving account equity on every call (the pre-profile behaviour)
+  profile:  compute_score_breakdown per symbol with one compiled ScoringProfile
+  batch:    score_universe over all symbols with the same profile
+
+Caps, A-D band and rank_score are computed in every mode, and the batch results
+are checked against the per-symbol ones. Synthetic inputs; no external calls.
+
+Example:
+    python scripts/benchmark_universe_scoring.py --symbols 2000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.core.eval import scoring  # noqa: E402
+from app.core.eval.decision_artifact_v2 import assign_band, compute_rank_score  # noqa: E402
+from app.core.eval.scoring_batch import score_universe  # noqa: E402
+
+_CAPS = {"RISK_OFF": 50, "NEUTRAL": 65}
+
+
+def _rows(n: int, seed: int) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    out = []
+    for _ in range(n):
+        stage1_only = rng.random() < 0.7
+        out.append({
+            "data_completeness": rng.uniform(0.4, 1.0),
+            "regime": rng.choice(["LOW_VOL", "NEUTRAL", "HIGH_VOL"]),
+            "liquidity_ok": rng.random() < 0.6,
+            "liquidity_grade": rng.choice(["A", "B", "C", None]),
+            "verdict": rng.choice(["ELIGIBLE", "HOLD", "BLOCKED"]),
+            "position_open": rng.random() < 0.05,
+            "selected_put_strike": None if stage1_only else round(rng.uniform(5, 600), 1),
+            "stage1_only": stage1_only,
+            "stage1_score": rng.randint(20, 95) if stage1_only else None,
+            "premium_yield_pct": None if stage1_only else rng.uniform(0.2, 3.0),
+            "capital_required": rng.uniform(500, 60_000),
+            "market_cap": rng.uniform(1e9, 2e12),
+        })
+    return out
+
+
+def _per_symbol(rows: List[Dict[str, Any]], market_regime: str, profile_fn: Callable[[], Any]) -> List[tuple]:
+    cap = _CAPS.get(market_regime)
+    out = []
+    for row in rows:
+        bd, composite = scoring.compute_score_breakdown(
+            data_completeness=row["data_completeness"], regime=row["regime"], liquidity_ok=row["liquidity_ok"],
+            liquidity_grade=row["liquidity_grade"], verdict=row["verdict"], position_open=row["position_open"],
+            price=None, selected_put_strike=row["selected_put_strike"], profile=profile_fn(),
+        )
+        raw = (row["stage1_score"] or 0) if row["stage1_only"] else max(0, min(100, composite))
+        final = min(raw, cap) if cap is not None else raw
+        band = assign_band(final)
+        rank = compute_rank_score(band, float(final), row["premium_yield_pct"], row["capital_required"], row["market_cap"])
+        out.append((bd.to_dict(), raw, final, band, rank))
+    return out
+
+
+def _time(fn: Callable[[], Any], repeats: int) -> Dict[str, float]:
+    samples = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return {"median_ms": statistics.median(samples), "min_ms": min(samples)}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Universe scoring benchmark (per-symbol vs batch)")
+    parser.add_argument("--symbols", type=int, default=2000, help="Universe size (default: 2000)")
+    parser.add_argument("--repeats", type=int, default=5, help="Timed repetitions per mode")
+    parser.add_argument("--regime", default="NEUTRAL", help="Run-level market regime for caps")
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    rows = _rows(args.symbols, args.seed)
+    profile = scoring.compile_scoring_profile()
+
+    def legacy_profile() -> Any:
+        scoring.reset_scoring_config_cache()  # force the YAML re-parse the old getters did per call
+        return scoring.compile_scoring_profile()
+
+    modes = {
+        "legacy (per-symbol, config+equity per call)": lambda: _per_symbol(rows, args.regime, legacy_profile),
+        "per-symbol, compiled profile": lambda: _per_symbol(rows, args.regime, lambda: profile),
+        "batch score_universe": lambda: score_universe(rows, profile=profile, market_regime=args.regime),
+    }
+    print(f"symbols={args.symbols} regime={args.regime} account_equity={profile.account_equity}")
+    baseline = None
+    for name, fn in modes.items():
+        t = _time(fn, args.repeats)
+        baseline = baseline or t["median_ms"]
+        print(f"  {name:<46}{t['median_ms']:>10.1f} ms  (min {t['min_ms']:.1f})  {baseline / t['median_ms']:>7.1f}x")
+
+    batch = score_universe(rows, profile=profile, market_regime=args.regime)
+    reference = _per_symbol(rows, args.regime, lambda: profile)
+    mismatches = sum(
+        1 for i, (bd, raw, final, band, rank) in enumerate(reference)
+        if (batch.breakdown(i).to_dict(), int(batch.raw_score[i]), int(batch.final_score[i]), batch.band[i],
+            float(batch.rank_score[i])) != (bd, raw, final, band, rank)
+    )
+    print(f"parity: {len(reference) - mismatches}/{len(reference)} rows identical")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""Phase 10: Long-lived evaluation worker for /api/ops/evaluate.
+
+Started on demand by the API (detached, so it survives API reloads) or by hand:
+  cd chakraops
+  python -m scripts.eval_worker --port 8767
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+try:
+    from dotenv import load_dotenv
+    load_dotenv(_REPO_ROOT / ".env")
+except ImportError:
+    pass
+
+
+def main() -> int:
+    from app.core.eval import eval_worker
+
+    parser = argparse.ArgumentParser(description="Run the ChakraOps evaluation worker")
+    parser.add_argument("--host", default=eval_worker.WORKER_HOST, help="Bind host (local only)")
+    parser.add_argument("--port", type=int, default=eval_worker.WORKER_PORT, help="Port")
+    parser.add_argument("--no-fast-lane", action="store_true", help="Run symbol jobs on the general lane only")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    worker = eval_worker.EvalWorker(fast_lane=not args.no_fast_lane)
+    try:
+        eval_worker.serve_eval_worker(worker, address=(args.host, args.port))
+    except OSError as e:
+        # Another worker already owns the port: nothing to do
+        print(f"Eval worker not started: {e}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        worker.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
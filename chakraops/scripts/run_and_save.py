@@ -17,7 +17,6 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import json
 import sys
 import time
 from dataclasses import asdict
@@ -35,9 +34,6 @@ try:
 except ImportError:
     pass
 
-DEFAULT_SYMBOLS = ["SPY", "AAPL"]
-
-
 def _band_from_hint(capital_hint: Any, score: int) -> str:
     """Derive band A/B/C/NONE from capital_hint or score."""
     if capital_hint and isinstance(capital_hint, dict):
@@ -127,22 +123,9 @@ def _build_decision_artifact_from_evaluation(eval_result: Any) -> Dict[str, Any]
 
 def _resolve_symbols(args: argparse.Namespace) -> List[str]:
     """Resolve symbol list from CLI or defaults. No DB dependency."""
-    if getattr(args, "all", False):
-        try:
-            from app.api.data_health import get_universe_symbols
-            return list(get_universe_symbols())
-        except Exception as e:
-            raise RuntimeError(f"Failed to load universe: {e}") from e
-    if args.symbols:
-        symbols = [s.strip().upper() for s in args.symbols.split(",") if s.strip()]
-    else:
-        try:
-            from app.api.data_health import get_universe_symbols
-            all_syms = get_universe_symbols()
-            symbols = all_syms[: args.limit]
-        except Exception:
-            symbols = (DEFAULT_SYMBOLS * 2)[: args.limit]
-    return symbols or DEFAULT_SYMBOLS.copy()
+    from app.core.eval.decision_snapshots import resolve_symbols
+    explicit = args.symbols.split(",") if args.symbols else None
+    return resolve_symbols(explicit, all_symbols=getattr(args, "all", False), limit=args.limit)
 
 
 def run_one(args: argparse.Namespace, out_dir: Path) -> Tuple[int, Optional[Path]]:
@@ -166,12 +149,8 @@ def run_one(args: argparse.Namespace, out_dir: Path) -> Tuple[int, Optional[Path
         print(f"Evaluation failed: {e}")
         return 1, None
 
-    ts = datetime.now(timezone.utc)
-    fname = f"decision_{ts.strftime('%Y-%m-%dT%H%M%S')}Z.json"
-    out_path = out_dir / fname
-    artifact_dict = artifact.to_dict()
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(artifact_dict, f, indent=2, default=str)
+    from app.core.eval.decision_snapshots import write_timestamped_decision
+    out_path = write_timestamped_decision(artifact.to_dict(), out_dir)
     latest_path = get_decision_store_path()
     print(f"Wrote {out_path}")
     print(f"Latest: {latest_path} (v2, written by store)")
@@ -180,21 +159,8 @@ def run_one(args: argparse.Namespace, out_dir: Path) -> Tuple[int, Optional[Path
 
 def enforce_retention(output_dir: Path, max_days: int = 7) -> Tuple[int, List[str]]:
     """Delete old timestamped decision files beyond retention. Keep decision_latest.json."""
-    from datetime import date, timedelta
-    keep = {"decision_latest.json", "sample_decision.json", "sample_decision_rich.json"}
-    files = [f for f in output_dir.glob("decision_*.json") if f.name not in keep]
-    if not files:
-        return 0, []
-    cutoff_ts = (datetime.now(timezone.utc) - timedelta(days=max_days)).timestamp()
-    deleted: List[str] = []
-    for f in files:
-        try:
-            if f.stat().st_mtime < cutoff_ts:
-                f.unlink()
-                deleted.append(f.name)
-        except Exception as e:
-            print(f"  Warning: failed to delete {f.name}: {e}", file=sys.stderr)
-    return len(deleted), deleted
+    from app.core.eval.decision_snapshots import enforce_retention as _enforce_retention
+    return _enforce_retention(output_dir, max_days=max_days)
 
 
 def main() -> int:
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""
+Snapshot archive tool — restore, space report, gc, and ingest of plain-copy snapshots.
+
+  restore  Rebuild the files of one manifest into --dest (content is SHA-256 verified).
+           MANIFEST is a snapshot_manifest.json / archive_manifest.json, the EOD snapshot or
+           run directory holding one, or NAMESPACE/ID (e.g. eod/2026-03-02_eod, runs/eval_...).
+  report   Logical vs stored bytes for manifests created in the last --days (default 90).
+  gc       Delete chunks no manifest references (--dry-run to only count).
+  ingest   Move plain copies from older layouts into the archive: out/snapshots/*_eod/ files
+           and artifacts/runs/*/run_*/{snapshot,evaluation}.json (--remove-originals deletes them).
+
+Examples:
+    python scripts/snapshot_archive.py restore eod/2026-03-02_eod --dest /tmp/restore
+    python scripts/snapshot_archive.py report --days 90
+    python scripts/snapshot_archive.py ingest --remove-originals
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+_REPO = Path(__file__).resolve().parents[1]
+if str(_REPO) not in sys.path:
+    sys.path.insert(0, str(_REPO))
+
+from app.core.snapshots.archive import ArchiveError, SnapshotArchive, default_archive_root  # noqa: E402
+
+_RUN_FILES = ("snapshot.json", "evaluation.json")
+
+
+def _load_manifest(archive: SnapshotArchive, ref: str) -> Dict[str, Any]:
+    p = Path(ref)
+    if p.is_dir():
+        for name in ("snapshot_manifest.json", "archive_manifest.json"):
+            if (p / name).exists():
+                p = p / name
+                break
+    if p.is_file():
+        with open(p, "r", encoding="utf-8") as f:
+            return json.load(f)
+    if "/" in ref:
+        namespace, manifest_id = ref.split("/", 1)
+        manifest = archive.load_manifest(namespace, manifest_id)
+        if manifest is not None:
+            return manifest
+    raise SystemExit(f"manifest not found: {ref}")
+
+
+def _fmt_bytes(n: int) -> str:
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if abs(n) < 1024 or unit == "GiB":
+            return f"{n:.1f} {unit}" if unit != "B" else f"{n} B"
+        n /= 1024
+    return str(n)
+
+
+def cmd_restore(archive: SnapshotArchive, args: argparse.Namespace) -> int:
+    manifest = _load_manifest(archive, args.manifest)
+    try:
+        written = archive.restore(manifest, Path(args.dest), names=args.files or None)
+    except ArchiveError as e:
+        print(f"[ARCHIVE] restore failed: {e}", file=sys.stderr)
+        return 1
+    for p in written:
+        print(f"  {p}")
+    print(f"[ARCHIVE] Restored {len(written)} file(s) from {manifest.get('namespace')}/{manifest.get('id')}")
+    return 0
+
+
+def cmd_report(archive: SnapshotArchive, args: argparse.Namespace) -> int:
+    rep = archive.report(days=args.days)
+    if args.json:
+        print(json.dumps(rep, indent=2))
+        return 0
+    print(f"archive {rep['root']} — last {rep['days']} days")
+    for ns, v in sorted(rep["by_namespace"].items()):
+        print(f"  {ns:<6} {v['manifests']:>5} manifests {v['files']:>6} files  "
+              f"logical {_fmt_bytes(v['logical_bytes']):>12}  stored {_fmt_bytes(v['stored_bytes']):>12}")
+    print(f"  saved {_fmt_bytes(rep['saved_bytes'])} ({rep['saved_pct']}%) vs plain copies; "
+          f"archive holds {rep['objects']} chunks, {_fmt_bytes(rep['archive_bytes'])} on disk")
+    return 0
+
+
+def cmd_gc(archive: SnapshotArchive, args: argparse.Namespace) -> int:
+    res = archive.gc(dry_run=args.dry_run)
+    verb = "would remove" if args.dry_run else "removed"
+    print(f"[ARCHIVE] gc {verb} {res['objects_removed']} chunk(s), {_fmt_bytes(res['bytes_freed'])}; kept {res['objects_kept']}")
+    return 0
+
+
+def _ingest_eod(archive: SnapshotArchive, snap_dir: Path, remove: bool) -> Optional[int]:
+    mp = snap_dir / "snapshot_manifest.json"
+    if not mp.exists():
+        return None
+    with open(mp, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("archive"):
+        return None
+    plain: List[Path] = [snap_dir / f["name"] for f in manifest.get("files") or [] if (snap_dir / f["name"]).is_file()]
+    if not plain:
+        return None
+    entries = [archive.put_file(p) for p in plain]
+    archived = archive.write_manifest(
+        "eod", snap_dir.name, entries,
+        meta={"mode": manifest.get("mode"), "git_commit": manifest.get("git_commit"), "ingested": True},
+        created_at_utc=manifest.get("created_at_utc"),
+    )
+    manifest["files"] = entries
+    manifest["archive"] = {
+        "root": str(archive.root), "namespace": "eod", "id": snap_dir.name, "codec": archived["codec"],
+        "logical_bytes": archived["logical_bytes"], "stored_bytes": archived["stored_bytes"],
+    }
+    with open(mp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    if remove:
+        for p in plain:
+            p.unlink()
+    return archived["logical_bytes"]
+
+
+def _ingest_run(archive: SnapshotArchive, run_dir: Path, remove: bool) -> Optional[int]:
+    from app.core.eval.run_artifacts import ARCHIVE_MANIFEST_NAME
+
+    plain = [run_dir / n for n in _RUN_FILES if (run_dir / n).is_file()]
+    if not plain or (run_dir / ARCHIVE_MANIFEST_NAME).exists():
+        return None
+    try:
+        with open(run_dir / "evaluation.json", "r", encoding="utf-8") as f:
+            ev = json.load(f)
+        run_id, completed_at = ev.get("run_id"), ev.get("completed_at")
+    except (OSError, ValueError):
+        run_id, completed_at = None, None
+    run_id = run_id or run_dir.name
+    archived = archive.write_manifest(
+        "runs", run_id, [archive.put_file(p) for p in plain],
+        meta={"run_id": run_id, "completed_at": completed_at, "run_dir": str(run_dir), "ingested": True},
+        created_at_utc=completed_at,
+    )
+    with open(run_dir / ARCHIVE_MANIFEST_NAME, "w", encoding="utf-8") as f:
+        json.dump(archived, f, indent=2)
+    if remove:
+        for p in plain:
+            p.unlink()
+    return archived["logical_bytes"]
+
+
+def cmd_ingest(archive: SnapshotArchive, args: argparse.Namespace) -> int:
+    snapshots = Path(args.snapshots_dir)
+    runs = Path(args.runs_dir)
+    count = total = 0
+    if snapshots.is_dir():
+        for d in sorted(snapshots.glob("*_eod")):
+            n = _ingest_eod(archive, d, args.remove_originals)
+            if n is not None:
+                count, total = count + 1, total + n
+    if runs.is_dir():
+        for d in sorted(runs.glob("*/run_*")):
+            n = _ingest_run(archive, d, args.remove_originals)
+            if n is not None:
+                count, total = count + 1, total + n
+    print(f"[ARCHIVE] Ingested {count} snapshot/run dir(s), {_fmt_bytes(total)} logical")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Snapshot archive (restore / report / gc / ingest)")
+    parser.add_argument("--archive-root", default=str(default_archive_root()), help="Archive root (default: artifacts/archive)")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    p = sub.add_parser("restore", help="Restore files of one manifest")
+    p.add_argument("manifest")
+    p.add_argument("--dest", required=True)
+    p.add_argument("--files", nargs="*", help="Only these file names")
+
+    p = sub.add_parser("report", help="Space saved vs plain copies")
+    p.add_argument("--days", type=int, default=90)
+    p.add_argument("--json", action="store_true")
+
+    p = sub.add_parser("gc", help="Remove unreferenced chunks")
+    p.add_argument("--dry-run", action="store_true")
+
+    p = sub.add_parser("ingest", help="Archive plain-copy EOD snapshots and run artifacts")
+    p.add_argument("--snapshots-dir", default=str(_REPO.parent / "out" / "snapshots"))
+    p.add_argument("--runs-dir", default=str(_REPO / "artifacts" / "runs"))
+    p.add_argument("--remove-originals", action="store_true")
+
+    args = parser.parse_args()
+    archive = SnapshotArchive(args.archive_root)
+    return {"restore": cmd_restore, "report": cmd_report, "gc": cmd_gc, "ingest": cmd_ingest}[args.cmd](archive, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
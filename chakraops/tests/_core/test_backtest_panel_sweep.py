@@ -0,0 +1,159 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""Phase 5 backtest: columnar panel + vectorized engine parity with BacktestEngine, sweeps, panel cache."""
+
+from __future__ import annotations
+
+import csv
+import json
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from app.backtest.engine import BacktestConfig, BacktestEngine, SnapshotCSVDataSource
+from app.backtest.panel import build_snapshot_panel, load_snapshot_panel
+from app.backtest.sweep import (
+    PanelBacktestParams,
+    SweepReport,
+    _array_metrics,
+    _run_one,
+    _simulate,
+    _write_sweep,
+    build_param_grid,
+    run_panel_backtest,
+    run_parameter_sweep,
+)
+
+START = date(2025, 1, 2)
+
+
+class _RegimeSource(SnapshotCSVDataSource):
+    """CSV source with a RISK_OFF stretch so both engines skip the same dates."""
+
+    def get_regime(self, as_of: date) -> str:
+        return "RISK_OFF" if date(2025, 2, 10) <= as_of <= date(2025, 2, 20) else "RISK_ON"
+
+
+def _write_fixtures(folder: Path, n_days: int = 140, n_symbols: int = 12, seed: int = 3) -> None:
+    rng = np.random.default_rng(seed)
+    folder.mkdir(parents=True, exist_ok=True)
+    prices = rng.uniform(15, 520, n_symbols)
+    for k in range(n_days):
+        d = START + timedelta(days=k)
+        prices = prices * np.exp(rng.normal(0, 0.02, n_symbols))
+        with open(folder / f"{d.isoformat()}.csv", "w", newline="", encoding="utf-8") as f:
+            w = csv.writer(f)
+            w.writerow(["symbol", "price", "volume", "iv_rank"])
+            for j in range(n_symbols):
+                if rng.random() < 0.05:
+                    continue  # symbol missing that day
+                w.writerow([
+                    f"S{j:02d}",
+                    f"{prices[j]:.2f}",
+                    int(rng.uniform(0.6e6, 3e6)),
+                    f"{rng.uniform(5, 80):.1f}",
+                ])
+
+
+def _key(trades):
+    return sorted(
+        (t.symbol, t.entry_date, t.exit_date, round(t.strike, 6), round(t.entry_premium, 6), round(t.pnl, 6))
+        for t in trades
+    )
+
+
+@pytest.mark.parametrize("use_options", [True, False])
+def test_panel_backtest_matches_row_engine(tmp_path, use_options):
+    _write_fixtures(tmp_path / "snaps")
+    source = _RegimeSource(tmp_path / "snaps")
+    legacy = BacktestEngine(
+        BacktestConfig(data_source=source, use_options_layer=use_options, output_dir=tmp_path / "out")
+    ).run()
+    panel = load_snapshot_panel(source)
+    fast = run_panel_backtest(panel, PanelBacktestParams(options_gate=use_options), output_dir=tmp_path / "out")
+
+    assert legacy.total_trades > 10
+    assert _key(fast.trades) == _key(legacy.trades)
+    assert fast.total_pnl == pytest.approx(legacy.total_pnl)
+    assert fast.win_rate == pytest.approx(legacy.win_rate)
+    assert fast.roc_mean == pytest.approx(legacy.roc_mean)
+    assert (tmp_path / "out" / fast.run_id / "backtest_trades.csv").exists()
+
+
+def test_array_metrics_match_report_and_start_end_slice(tmp_path):
+    _write_fixtures(tmp_path / "snaps")
+    panel = load_snapshot_panel(SnapshotCSVDataSource(tmp_path / "snaps"))
+    params = PanelBacktestParams(strategies=("CSP", "CC"), min_iv_rank=0, min_volume=0)
+    report = run_panel_backtest(panel, params)
+    metrics = _array_metrics(_simulate(panel, params))
+    assert metrics["total_trades"] == report.total_trades
+    assert metrics["total_pnl"] == pytest.approx(report.total_pnl)
+    assert metrics["wins"] == report.wins
+    assert metrics["roc_std"] == pytest.approx(report.roc_std)
+    assert metrics["max_drawdown"] == pytest.approx(report.max_drawdown)
+    # Wheel: CC legs only follow an assignment, and called-away legs realize strike - basis
+    outcomes = {t.outcome for t in report.trades}
+    assert "assigned" in outcomes
+    assert any(t.strategy == "CC" for t in report.trades)
+
+    sliced = run_panel_backtest(panel, params, start_date=date(2025, 3, 1))
+    assert all(t.entry_date >= date(2025, 3, 1) for t in sliced.trades)
+
+
+def test_sweep_parallel_matches_inline_and_writes_combined_report(tmp_path):
+    _write_fixtures(tmp_path / "snaps", n_days=90)
+    panel = load_snapshot_panel(SnapshotCSVDataSource(tmp_path / "snaps"))
+    grid = build_param_grid(dte_days=[28, 35, 42], delta_max=[0.25, 0.35], min_price=[20.0, 50.0])
+    assert len(grid) == 12
+    inline = run_parameter_sweep(panel, grid, max_workers=1, write_report=False)
+    pooled = run_parameter_sweep(panel, grid, max_workers=2, output_dir=tmp_path / "out")
+
+    strip = lambda rows: [{k: v for k, v in r.items() if k != "elapsed_ms"} for r in rows]  # noqa: E731
+    assert strip(inline.results) == strip(pooled.results)
+    # dte 42 is inside the default 30..45 window, 28 is not
+    by_label = {r["label"]: r for r in inline.results}
+    assert by_label["dte28_d0.15-0.25_p20-500"]["total_trades"] == 0
+    assert by_label["dte42_d0.15-0.25_p20-500"]["total_trades"] > 0
+
+    out = pooled.output_dir
+    report = json.loads((out / "sweep_report.json").read_text())
+    assert len(report["results"]) == 12
+    assert report["best_by_total_pnl"] == pooled.best()["label"]
+    rows = list(csv.DictReader(open(out / "sweep_results.csv", encoding="utf-8")))
+    assert [r["label"] for r in rows] == [r["label"] for r in pooled.results]
+    with pytest.raises(ValueError):
+        build_param_grid(not_a_field=[1])
+
+
+def test_panel_cache_reused_until_csv_changes(tmp_path):
+    _write_fixtures(tmp_path / "snaps", n_days=20)
+    source = SnapshotCSVDataSource(tmp_path / "snaps")
+    first = load_snapshot_panel(source, cache_dir=tmp_path / "cache")
+    cached = list((tmp_path / "cache").glob("snapshot_panel_*.npz"))
+    assert len(cached) == 1
+    again = load_snapshot_panel(source, cache_dir=tmp_path / "cache")
+    assert again.dates == first.dates and again.symbols == first.symbols
+    np.testing.assert_array_equal(again.price, first.price)
+
+    with open(tmp_path / "snaps" / "2025-01-03.csv", "a", encoding="utf-8") as f:
+        f.write("NEW,100.00,2000000,50\n")
+    changed = load_snapshot_panel(source, cache_dir=tmp_path / "cache")
+    assert "NEW" in changed.symbols
+    assert len(list((tmp_path / "cache").glob("snapshot_panel_*.npz"))) == 2
+
+
+def test_empty_panel():
+    panel = build_snapshot_panel([], [], [])
+    report = run_panel_backtest(panel)
+    assert report.total_trades == 0
+    assert report.config_summary["reason"] == "no_dates_in_range"
+
+
+def test_uninitialized_worker_and_missing_output_dir_raise():
+    panel = build_snapshot_panel([], [], [])
+    with pytest.raises(RuntimeError, match="not initialized"):
+        _run_one(PanelBacktestParams())
+    with pytest.raises(ValueError, match="output_dir"):
+        _write_sweep(SweepReport(run_id="r", results=[], panel_shape=(0, 0), workers=1, elapsed_ms=0.0), panel)
@@ -0,0 +1,108 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""Bounded in-memory cache — LRU, TTL, byte budget, metrics, and concurrent snapshot miss-filling."""
+
+from __future__ import annotations
+
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from app.core.data.bounded_cache import MISSING, BoundedCache, approx_size, bounded_cache_stats
+
+
+def test_lru_ttl_and_none_values():
+    cache = BoundedCache("t_lru", max_entries=3, stripes=1, register=False)
+    for k in "abc":
+        cache.set(k, k.upper())
+    assert cache.get("a") == "A"  # a becomes most recent
+    cache.set("d", "D")
+    assert "b" not in cache and cache.get("b") is MISSING
+    assert cache.keys() == ["c", "a", "d"]
+    cache.set("n", None)
+    assert cache.get("n") is None  # None is a cacheable value
+
+    cache.set("short", 1, ttl_seconds=0)
+    assert cache.get("short", "gone") == "gone"
+    st = cache.stats()
+    assert st["evictions"] == 3 and st["expirations"] == 1  # b, c, a
+    assert st["hits"] == 2 and st["misses"] == 2 and st["entries"] == 2
+
+
+def test_byte_budget_evicts_and_rejects_oversized():
+    cache = BoundedCache("t_bytes", max_entries=1000, max_bytes=4000, stripes=1, register=False)
+    for i in range(20):
+        cache.set(i, "x" * 500)
+    st = cache.stats()
+    assert st["bytes"] <= 4000 and st["entries"] < 20 and st["evictions"] > 0
+    assert cache.get(19) is not MISSING and cache.get(0) is MISSING
+    cache.set("huge", "y" * 10_000)
+    assert "huge" not in cache and cache.stats()["rejected"] == 1
+    # Sampled sizing of long containers stays in the right order of magnitude
+    rows = [{"strike": float(i), "bid": 1.0, "ask": 1.1} for i in range(5000)]
+    assert approx_size(rows) > 5000 * 100
+
+
+def test_concurrent_writers_stay_bounded_and_registry_reports():
+    cache = BoundedCache("t_registry", max_entries=256, stripes=8)
+
+    def worker(n):
+        for i in range(2000):
+            cache.set(f"{n}:{i}", i)
+            cache.get(f"{n}:{i - 1}")
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    st = bounded_cache_stats()["t_registry"]
+    assert st["entries"] <= 256
+    assert st["hits"] + st["misses"] == 8 * 2000
+    assert st["evictions"] == 8 * 2000 - st["entries"]
+
+
+def test_snapshot_batch_fills_misses_concurrently_and_keeps_order():
+    from app.core.data import symbol_snapshot_service as svc
+
+    syms = [f"S{i}" for i in range(12)]
+    active = {"now": 0, "max": 0}
+    lock = threading.Lock()
+
+    def slow_core(sym, fields, token):
+        with lock:
+            active["now"] += 1
+            active["max"] = max(active["max"], active["now"])
+        time.sleep(0.02)
+        with lock:
+            active["now"] -= 1
+        return {"ticker": sym, "stkVolu": 1000 + int(sym[1:]), "avgOptVolu20d": 50.0}
+
+    def avg(sym, token, trade_date=None):
+        if sym == "S3":
+            raise RuntimeError("boom")
+        return None if sym == "S4" else 2_000_000.0
+
+    quotes = {s: SimpleNamespace(price=10.0, bid=9.9, ask=10.1, volume=100, quote_date="2026-03-02", iv_rank=40.0) for s in syms}
+    svc.clear_snapshot_cache()
+    svc._snapshot_cache.reset_stats()
+    with (
+        patch("app.core.data.orats_client.fetch_full_equity_snapshots", return_value=quotes),
+        patch("app.core.orats.orats_core_client.fetch_core_snapshot", side_effect=slow_core) as core,
+        patch("app.core.orats.orats_core_client.derive_avg_stock_volume_20d", side_effect=avg),
+        patch("app.core.config.orats_secrets.ORATS_API_TOKEN", "tok"),
+    ):
+        out = svc.get_snapshots_batch(list(reversed(syms)), max_workers=6)
+        assert list(out) == list(reversed(syms))
+        assert active["max"] > 1
+        assert out["S7"].stock_volume_today == 1007 and out["S7"].avg_stock_volume_20d == 2_000_000.0
+        assert out["S3"].missing_reasons["avg_stock_volume_20d"].startswith("Derived calculation failed")
+        assert "avg_stock_volume_20d" in out["S4"].missing_reasons
+
+        # Second batch is served from the cache, with the core fields applied
+        again = svc.get_snapshots_batch(syms)
+        assert core.call_count == len(syms)
+        assert again["S7"].stock_volume_today == 1007 and again["S7"].field_sources["stock_volume_today"] == "datav2/cores"
+    assert svc._snapshot_cache.stats()["hits"] == 2 * len(syms) - 1  # S3's failed derivation is not cached
+    svc.clear_snapshot_cache()
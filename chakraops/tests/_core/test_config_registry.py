@@ -0,0 +1,141 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""Config registry — parse once per file version, immutable snapshots, generations, pinning."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+
+import pytest
+
+from app.core.config import registry
+from app.core.config.registry import get_config, invalidate, pinned_configs, refresh_all, register_config
+
+
+@pytest.fixture
+def kind():
+    parses = []
+
+    def _parse(path):
+        parses.append(1)
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    def _validate(data):
+        if not isinstance(data, dict) or "level" not in data:
+            raise ValueError("level is required")
+        return {"level": int(data["level"]), "tags": list(data.get("tags") or [])}
+
+    register_config("unit_cfg", parse=_parse, validate=_validate, missing=lambda: {"level": 0, "tags": []},
+                    fallback=lambda e: {"level": -1, "tags": []})
+    yield parses
+    registry.reset_registry()
+
+
+def _write(path, obj, age_s=60):
+    path.write_text(json.dumps(obj) if not isinstance(obj, str) else obj, encoding="utf-8")
+    t = time.time() - age_s
+    os.utime(path, (t, t))
+
+
+def test_parsed_once_frozen_and_generation_tracks_content(kind, tmp_path):
+    cfg = tmp_path / "unit.json"
+    assert get_config("unit_cfg", cfg).data["level"] == 0 and not get_config("unit_cfg", cfg).exists
+
+    _write(cfg, {"level": 3, "tags": ["a"]})
+    snap = get_config("unit_cfg", cfg)
+    for _ in range(5):
+        assert get_config("unit_cfg", cfg) is snap
+    assert len(kind) == 1 and snap.exists and snap.data["tags"] == ("a",)
+    with pytest.raises(TypeError):
+        snap.data["level"] = 9  # type: ignore[index]
+    copy = snap.mutable()
+    copy["tags"].append("b")
+    assert snap.data["tags"] == ("a",)
+
+    # Rewrite with the same content: re-parsed, generation kept
+    _write(cfg, {"tags": ["a"], "level": 3}, age_s=50)
+    same = get_config("unit_cfg", cfg)
+    assert len(kind) == 2 and same.generation == snap.generation
+
+    _write(cfg, {"level": 4}, age_s=40)
+    assert refresh_all() == ["unit_cfg"]
+    new = get_config("unit_cfg", cfg)
+    assert new.generation > snap.generation and new.data["level"] == 4 and len(kind) == 3
+
+    status = registry.registry_status()
+    row = next(c for c in status["configs"] if c["name"] == "unit_cfg")
+    assert row["generation"] == new.generation and row["loads"] == 4 and row["reloads"] == 2
+    assert row["hits"] >= 5 and row["load_ms"] >= 0 and "unit_cfg" in status["registered"]
+
+
+def test_racy_same_size_rewrite_is_detected(kind, tmp_path):
+    cfg = tmp_path / "unit.json"
+    cfg.write_text(json.dumps({"level": 1}), encoding="utf-8")
+    assert get_config("unit_cfg", cfg).data["level"] == 1
+    # Same size, possibly the same mtime tick: the fresh load is racy so the next read re-parses
+    st = cfg.stat()
+    cfg.write_text(json.dumps({"level": 2}), encoding="utf-8")
+    os.utime(cfg, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert get_config("unit_cfg", cfg).data["level"] == 2
+
+    # Settled files are trusted until invalidate()
+    _write(cfg, {"level": 5})
+    assert get_config("unit_cfg", cfg).data["level"] == 5
+    n = len(kind)
+    get_config("unit_cfg", cfg)
+    assert len(kind) == n
+    invalidate("unit_cfg", cfg)
+    get_config("unit_cfg", cfg)
+    assert len(kind) == n + 1
+
+
+def test_invalid_file_uses_fallback_or_raises(kind, tmp_path):
+    cfg = tmp_path / "unit.json"
+    _write(cfg, "{not json")
+    snap = get_config("unit_cfg", cfg)
+    assert snap.data["level"] == -1 and snap.error
+    _write(cfg, {"tags": []}, age_s=30)
+    assert get_config("unit_cfg", cfg).error == "level is required"
+
+    from app.core.universe.universe_manager import load_universe_manifest
+    manifest = tmp_path / "universe.json"
+    _write(manifest, {"tiers": "nope"})
+    with pytest.raises(ValueError):
+        load_universe_manifest(manifest)
+    with pytest.raises(KeyError):
+        get_config("never_registered", cfg)
+
+
+def test_pinned_configs_keep_one_snapshot_per_run(kind, tmp_path):
+    cfg = tmp_path / "unit.json"
+    _write(cfg, {"level": 1})
+    with pinned_configs():
+        assert get_config("unit_cfg", cfg).data["level"] == 1
+        _write(cfg, {"level": 2}, age_s=30)
+        assert get_config("unit_cfg", cfg).data["level"] == 1
+    assert get_config("unit_cfg", cfg).data["level"] == 2
+
+
+def test_wheel_state_save_is_visible_and_ops_status_reports_config(tmp_path, monkeypatch):
+    from fastapi.testclient import TestClient
+
+    from app.api.server import app
+    from app.core.wheel import state_store
+
+    path = tmp_path / "wheel_state.json"
+    monkeypatch.setattr(state_store, "_wheel_state_path", lambda: path)
+    try:
+        assert state_store.load_state() == {"symbols": {}}
+        state_store.save_state_atomic({"symbols": {"AAPL": {"state": "OPEN", "last_updated_utc": None}}})
+        state = state_store.load_state()
+        assert state["symbols"]["AAPL"]["linked_position_ids"] == []
+        state["symbols"].clear()
+        assert "AAPL" in state_store.load_state()["symbols"]
+
+        body = TestClient(app).get("/api/ops/status").json()
+        rows = [c for c in body["config"]["configs"] if c["name"] == "wheel_state"]
+        assert rows and rows[0]["path"] == str(path) and rows[0]["generation"] <= body["config"]["generation"]
+    finally:
+        registry.reset_registry()
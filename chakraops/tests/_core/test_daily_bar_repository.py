@@ -0,0 +1,130 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""Incremental daily-bar store — backfill once, tradeDate window after, shared consumers."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from datetime import date, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.core.data import daily_bars
+from app.core.data.daily_bars import DailyBarRepository, reset_sync_stats, sync_stats
+
+
+def _raw(d: date, px: float, vol: int = 1_000) -> dict:
+    return {"tradeDate": d.isoformat(), "openPx": px, "hiPx": px + 1, "loPx": px - 1, "clsPx": px, "stockVolume": vol}
+
+
+def _bar(d: date, px: float, vol: int = 1_000) -> dict:
+    return daily_bars._normalize_row(_raw(d, px, vol))
+
+
+def _resp(rows, status=200):
+    body = json.dumps({"data": rows}).encode()
+    resp = MagicMock(status_code=status, content=body, text="")
+    resp.json.return_value = {"data": rows}
+    return resp
+
+
+def _write_store(path, bars, age_days=1):
+    path.write_text(json.dumps(bars), encoding="utf-8")
+    stamp = time.time() - age_days * 86400
+    os.utime(path, (stamp, stamp))
+
+
+@pytest.fixture(autouse=True)
+def _fresh_stats():
+    reset_sync_stats()
+    yield
+    reset_sync_stats()
+
+
+def test_backfill_then_incremental_window(tmp_path):
+    today = date.today()
+    days = [today - timedelta(days=i) for i in range(5, 0, -1)]
+    repo = DailyBarRepository(tmp_path, token="t")
+
+    with patch.object(daily_bars.requests, "get", return_value=_resp([_raw(d, 100 + i) for i, d in enumerate(days)])) as get:
+        assert [b["ts"] for b in repo.get_bars("spy", 3)] == [d.isoformat() for d in days[-3:]]
+    assert "tradeDate" not in get.call_args.kwargs["params"]
+
+    # Next day: only the window from the last stored bar is requested; that bar is replaced
+    _write_store(tmp_path / "SPY.json", json.loads((tmp_path / "SPY.json").read_text()))
+    window = [_raw(days[-1], 999.0), _raw(today, 105.0)]
+    with patch.object(daily_bars.requests, "get", return_value=_resp(window)) as get:
+        bars = repo.get_bars("SPY", 0)
+        assert repo.get_bars("SPY", 0) == bars  # same day: served from the store
+    assert get.call_count == 1
+    assert get.call_args.kwargs["params"]["tradeDate"] == f"{days[-1].isoformat()},{today.isoformat()}"
+    assert [b["ts"] for b in bars] == [d.isoformat() for d in days] + [today.isoformat()]
+    assert bars[-2]["close"] == 999.0
+
+    stats = sync_stats()
+    assert stats["backfills"] == 1 and stats["incremental"] == 1 and stats["store_hits"] == 1
+    assert stats["requests"] == 2 and stats["rows_added"] == 6
+    assert stats["bytes"] > 0
+
+
+def test_failed_sync_serves_stale_bars(tmp_path):
+    stale = [_bar(date.today() - timedelta(days=3), 50.0)]
+    _write_store(tmp_path / "QQQ.json", stale)
+    repo = DailyBarRepository(tmp_path, token="t")
+    with patch.object(daily_bars.requests, "get", return_value=_resp([], status=503)):
+        assert repo.get_bars("QQQ", 10) == stale
+    assert sync_stats()["failures"] == 1
+
+
+def test_avg_volume_uses_newest_20_bars(tmp_path):
+    from app.core.orats import orats_core_client
+
+    today = date.today()
+    bars = [_bar(today - timedelta(days=30 - i), 100.0, vol=i + 1) for i in range(30)]
+    _write_store(tmp_path / "AVGV.json", bars, age_days=0)
+    with (
+        patch.object(daily_bars, "_REPOSITORY", DailyBarRepository(tmp_path)),
+        patch.object(orats_core_client, "_hist_dailies_avg_cache", None),
+    ):
+        avg = orats_core_client.derive_avg_stock_volume_20d("AVGV", "t", trade_date="2026-10-16")
+    assert avg == pytest.approx(sum(range(11, 31)) / 20)
+
+
+def test_spy_range_from_store_without_yfinance(tmp_path):
+    from app.core.risk import volatility_kill_switch as vks
+
+    today = date.today()
+    bars = [_bar(today - timedelta(days=40 - i), 400.0) for i in range(40)]
+    bars[-1].update(high=410.0, low=396.0)
+    _write_store(tmp_path / "SPY.json", bars, age_days=0)
+    with (
+        patch.object(daily_bars, "_REPOSITORY", DailyBarRepository(tmp_path)),
+        patch.object(vks, "yf", None),
+    ):
+        day_range, atr_20 = vks.compute_spy_range()
+        assert vks.is_volatility_high({"range_multiplier": 2.0}) is True
+    assert day_range == pytest.approx(14.0)
+    assert atr_20 == pytest.approx((19 * 2.0 + 14.0) / 20)
+
+
+def test_avg_volume_backfill_is_stored_and_serves_eligibility_in_the_same_run(tmp_path):
+    from app.core.eligibility.providers.orats_daily_provider import OratsDailyProvider
+    from app.core.orats import orats_core_client
+
+    today = date.today()
+    history = [_raw(today - timedelta(days=300 - i), 100.0, vol=i + 1) for i in range(300)]
+    repo = DailyBarRepository(tmp_path)
+    with (
+        patch.object(daily_bars, "_REPOSITORY", repo),
+        patch.object(orats_core_client, "_hist_dailies_avg_cache", None),
+        patch.object(daily_bars.requests, "get", return_value=_resp(history)) as get,
+    ):
+        avg = orats_core_client.derive_avg_stock_volume_20d("NEWV", "t", trade_date="2026-10-16")
+        bars = OratsDailyProvider(token="t", cache_dir=tmp_path).get_daily("NEWV", lookback=250)
+    assert avg == pytest.approx(sum(range(281, 301)) / 20)
+    assert len(bars) == 250 and get.call_count == 1
+    assert (tmp_path / "NEWV.json").exists()
+    assert sync_stats()["backfills"] == 1 and sync_stats()["store_hits"] == 1
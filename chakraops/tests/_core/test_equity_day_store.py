@@ -0,0 +1,88 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""Day-scoped persistent quote / IV rank layer — TTLs, restarts, day roll, data_sources freshness."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from app.core.orats import equity_day_store as eds
+from app.core.orats import orats_equity_quote as eq
+from app.core.orats.equity_day_store import EquityDayStore
+from app.core.orats.orats_equity_quote import EquityQuote, EquityQuoteCache, IVRankData, fetch_full_equity_snapshots
+
+
+class _Stub:
+    def __init__(self):
+        self.calls = []
+
+    def quotes(self, tickers):
+        self.calls.append(("quotes", tuple(tickers)))
+        return {t: EquityQuote(symbol=t, price=100.0, bid=99.0, ask=101.0, volume=1000, quote_date="2026-03-02") for t in tickers}
+
+    def ivranks(self, tickers):
+        self.calls.append(("ivrank", tuple(tickers)))
+        return {t: IVRankData(symbol=t, iv_rank=42.0) for t in tickers}
+
+
+def test_iv_rank_survives_restart_while_quotes_expire(tmp_path):
+    store = EquityDayStore(tmp_path, flush_interval=3600)
+    cache = EquityQuoteCache(day_store=store)
+    cache.set_iv_rank("AAPL", IVRankData(symbol="AAPL", iv_rank=55.0, fetched_at="2026-03-02T15:00:00+00:00"))
+    cache.set_equity_quote("AAPL", EquityQuote(symbol="AAPL", price=190.0))
+    cache.set_iv_rank("MSFT", IVRankData(symbol="MSFT", error="HTTP 500"))  # errors are not persisted
+    assert not list(tmp_path.glob("*.json"))  # debounced
+    store.flush()
+
+    restarted = EquityQuoteCache(day_store=EquityDayStore(tmp_path))
+    iv = restarted.get_iv_rank("aapl")
+    assert iv.iv_rank == 55.0 and iv.origin == "day_cache"
+    assert restarted.get_equity_quote("AAPL").price == 190.0
+    assert restarted.get_iv_rank("MSFT") is None
+
+    with patch.dict("app.core.data.cache_policy.CACHE_TTL_SECONDS", {"quotes": 0}):
+        later = EquityQuoteCache(day_store=EquityDayStore(tmp_path))
+        assert later.get_equity_quote("AAPL") is None
+        assert later.get_iv_rank("AAPL") is not None
+
+
+def test_second_run_refetches_quotes_only_and_marks_sources(tmp_path):
+    stub = _Stub()
+    tickers = [f"S{i:02d}" for i in range(15)]
+    with (
+        patch.object(eq, "_fetch_equity_quotes_single_batch", stub.quotes),
+        patch.object(eq, "_fetch_iv_ranks_single_batch", stub.ivranks),
+        patch("app.core.data.cache_store.CACHE_ENABLED", True),
+        patch("app.core.data.cache_store.CACHE_DIR", tmp_path),
+        patch.dict("app.core.data.cache_policy.CACHE_TTL_SECONDS", {"quotes": 0}),
+        patch.object(eds, "_STORE", None),
+    ):
+        eq.reset_run_cache()
+        first = fetch_full_equity_snapshots(tickers, max_workers=1)
+        assert first["S01"].data_sources["iv_rank"] == "ivrank"
+        assert (tmp_path / "equity_day").is_dir()
+        stub.calls.clear()
+
+        eds._STORE = None  # a restart
+        eq.reset_run_cache()  # and the next cycle's run cache
+        second = fetch_full_equity_snapshots(tickers, max_workers=1)
+        assert {kind for kind, _ in stub.calls} == {"quotes"}
+        snap = second["S01"]
+        assert snap.iv_rank == 42.0 and snap.data_sources["iv_rank"] == "ivrank:day_cache"
+        assert snap.data_sources["price"] == "strikes/options"
+        assert snap.field_freshness["iv_rank"]["origin"] == "day_cache"
+        assert snap.field_freshness["iv_rank"]["ttl_sec"] == 6 * 3600
+        assert snap.field_freshness["price"]["origin"] == "live"
+        assert eds.equity_day_store_stats()["sections"]["iv_rank"]["hits"] == len(tickers)
+    eq.reset_run_cache()
+
+
+def test_new_day_starts_empty_and_prunes_old_files(tmp_path):
+    store = EquityDayStore(tmp_path, flush_interval=0)
+    for day in ("2026-02-27", "2026-03-01", "2026-03-02"):
+        with patch.object(eds, "_utc_day", return_value=day):
+            store.put("iv_rank", "SPY", {"symbol": "SPY", "iv_rank": 30.0})
+            assert store.get("iv_rank", "SPY") is not None
+    assert sorted(p.stem for p in tmp_path.glob("*.json")) == ["2026-03-01", "2026-03-02"]
+    with patch.object(eds, "_utc_day", return_value="2026-03-03"):
+        assert store.get("iv_rank", "SPY") is None
@@ -0,0 +1,154 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""Concurrent equity/ivrank batch fan-out, streaming readiness, shared rate budget."""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import asdict
+from unittest.mock import patch
+
+import pytest
+
+from app.core.orats import orats_equity_quote as eq
+from app.core.orats.orats_equity_quote import (
+    EquityQuote,
+    EquityQuoteCache,
+    IVRankData,
+    OratsEquityQuoteError,
+    _RateLimiter,
+    fetch_equity_quotes_batch,
+    fetch_full_equity_snapshots,
+    fetch_iv_ranks_batch,
+    start_equity_prefetch,
+)
+
+TICKERS = ["S%03d" % i for i in range(45)]
+
+
+class _StubOrats:
+    """Fake single-batch fetchers: fixed latency, tracks peak concurrency, optional failures."""
+
+    def __init__(self, delay: float = 0.0, fail_ivrank_for: str = "", drop: str = ""):
+        self.delay = delay
+        self.fail_ivrank_for = fail_ivrank_for
+        self.drop = drop
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def _enter(self, kind, tickers):
+        with self._lock:
+            self.calls.append((kind, tuple(tickers)))
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+
+    def quotes(self, tickers):
+        self._enter("quotes", tickers)
+        return {
+            t: EquityQuote(symbol=t, price=100.0 + i, bid=99.0, ask=101.0, volume=1_000_000, quote_date="2026-10-16")
+            for i, t in enumerate(tickers) if t != self.drop
+        }
+
+    def ivranks(self, tickers):
+        self._enter("ivrank", tickers)
+        if self.fail_ivrank_for in tickers:
+            raise OratsEquityQuoteError("HTTP 500")
+        return {t: IVRankData(symbol=t, iv_rank=42.0) for t in tickers if t != self.drop}
+
+
+@pytest.fixture
+def stub(request):
+    orats = _StubOrats(**getattr(request, "param", {}))
+    with (
+        patch.object(eq, "_fetch_equity_quotes_single_batch", orats.quotes),
+        patch.object(eq, "_fetch_iv_ranks_single_batch", orats.ivranks),
+        patch("app.core.data.cache_store.CACHE_ENABLED", False),
+    ):
+        yield orats
+
+
+def _comparable(snaps):
+    return {sym: {k: v for k, v in asdict(s).items() if k not in ("fetched_at", "field_freshness")} for sym, s in snaps.items()}
+
+
+@pytest.mark.parametrize("stub", [{"fail_ivrank_for": "S012", "drop": "S030"}], indirect=True)
+def test_concurrent_matches_sequential(stub):
+    seq = fetch_full_equity_snapshots(TICKERS, EquityQuoteCache(), max_workers=1)
+    par = fetch_full_equity_snapshots(TICKERS, EquityQuoteCache(), max_workers=6)
+    assert _comparable(par) == _comparable(seq)
+    assert par["S001"].price == 101.0 and par["S001"].iv_rank == 42.0
+    # Failed ivrank batch -> error entries for the whole batch; dropped ticker -> not in response
+    assert par["S012"].missing_reasons["iv_rank"] == "HTTP 500"
+    assert "iv_rank: HTTP 500" in par["S015"].errors
+    assert par["S030"].missing_reasons["price"] == "Not in ORATS response"
+    # 5 quote batches + 5 ivrank batches per run, each batch fetched once
+    assert len(stub.calls) == 20
+
+
+@pytest.mark.parametrize("stub", [{"delay": 0.05}], indirect=True)
+def test_batches_for_both_endpoints_overlap(stub):
+    cache = EquityQuoteCache()
+    fetch_full_equity_snapshots(TICKERS, cache, max_workers=10)
+    assert stub.peak >= 4  # sequential would never have more than one batch in flight
+    assert {k for k, _ in stub.calls} == {"quotes", "ivrank"}
+    # Everything now cached: per-symbol follow-ups make no calls
+    n = len(stub.calls)
+    assert fetch_equity_quotes_batch(["S003"], cache)["S003"].price == 103.0
+    assert fetch_iv_ranks_batch(["S003"], cache)["S003"].iv_rank == 42.0
+    assert len(stub.calls) == n
+
+
+@pytest.mark.parametrize("stub", [{"delay": 0.05, "drop": "S044"}], indirect=True)
+def test_iter_ready_streams_symbols_before_prefetch_finishes(stub):
+    cache = EquityQuoteCache()
+    prefetch = start_equity_prefetch(TICKERS, cache, max_workers=2)
+    seen = []
+    first_while_running = None
+    for sym in prefetch.iter_ready(poll_sec=0.01):
+        if first_while_running is None:
+            first_while_running = not prefetch.done()
+        seen.append(sym)
+    assert first_while_running is True
+    assert sorted(seen) == sorted(TICKERS) and len(seen) == len(set(seen))
+    assert seen[-1] == "S044"  # never returned by ORATS -> released only after completion
+    assert seen.index("S000") < seen.index("S040")  # interleaved batches complete in order
+    snaps = prefetch.result(timeout=5)
+    assert len(snaps) == len(TICKERS) and prefetch.wall_ms > 0
+
+
+def test_rate_limiter_spaces_concurrent_callers():
+    limiter = _RateLimiter(calls_per_second=50.0)
+    stamps = []
+    lock = threading.Lock()
+
+    def call():
+        limiter.acquire()
+        with lock:
+            stamps.append(time.monotonic())
+
+    threads = [threading.Thread(target=call) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    stamps.sort()
+    assert stamps[-1] - stamps[0] >= 7 * 0.02 * 0.9
+
+    # Frozen clock: the first `burst` calls never sleep, the next one waits a full interval
+    burst = _RateLimiter(calls_per_second=10.0, burst=4)
+    with (
+        patch.object(eq.time, "monotonic", return_value=1000.0),
+        patch.object(eq.time, "sleep") as sleep,
+    ):
+        for _ in range(4):
+            burst.acquire()
+        sleep.assert_not_called()
+        burst.acquire()
+    sleep.assert_called_once()
+    assert sleep.call_args.args[0] == pytest.approx(0.1)
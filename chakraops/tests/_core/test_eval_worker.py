@@ -0,0 +1,218 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""Phase 10: warm eval worker — priority lanes, progress, cancellation, local socket protocol."""
+
+from __future__ import annotations
+
+import os
+import stat
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from app.core.eval import eval_worker
+from app.core.eval.eval_worker import EvalWorker, EvalWorkerClient, code_version, serve_eval_worker
+from app.core.eval.run_control import raise_if_cancelled, report_progress
+
+
+def _wait_state(worker, job_id, states, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = worker.status(job_id)
+        if job and job["state"] in states:
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"job {job_id} never reached {states}: {worker.status(job_id)}")
+
+
+class _Runners:
+    """Universe jobs block on `release` while reporting progress; symbol jobs return at once."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.order = []
+
+    def universe(self, job):
+        self.order.append(("universe", job.job_id))
+        for i in range(1000):
+            raise_if_cancelled()
+            report_progress("stage1", i, 1000)
+            if self.release.wait(0.01):
+                break
+        return {"symbols_evaluated": 1000}
+
+    def symbol(self, job):
+        self.order.append(("symbol", job.symbols[0]))
+        return {"symbol": job.symbols[0]}
+
+    def runners(self):
+        return {"universe": self.universe, "symbol": self.symbol}
+
+
+def test_symbol_job_runs_on_fast_lane_during_universe_run():
+    r = _Runners()
+    worker = EvalWorker(runners=r.runners()).start()
+    try:
+        uni = worker.submit("universe")
+        _wait_state(worker, uni["job_id"], ("running",))
+        sym = worker.submit("symbol", symbols=["aapl"])
+        done = _wait_state(worker, sym["job_id"], ("done",))
+        assert done["result"] == {"symbol": "AAPL"} and done["priority"] == 0
+        running = worker.status(uni["job_id"])
+        assert running["state"] == "running" and running["progress"]["stage"] == "stage1"
+        r.release.set()
+        assert _wait_state(worker, uni["job_id"], ("done",))["result"] == {"symbols_evaluated": 1000}
+    finally:
+        worker.stop()
+
+
+def test_queue_orders_by_priority_then_submission():
+    r = _Runners()
+    worker = EvalWorker(runners=r.runners(), fast_lane=False).start()
+    try:
+        first = worker.submit("universe")
+        _wait_state(worker, first["job_id"], ("running",))
+        second = worker.submit("universe")
+        sym = worker.submit("symbol", symbols=["MSFT"])
+        assert worker.status(sym["job_id"])["queue_position"] == 0
+        assert worker.status(second["job_id"])["queue_position"] == 1
+        r.release.set()
+        _wait_state(worker, second["job_id"], ("done",))
+    finally:
+        worker.stop()
+    assert [kind for kind, _ in r.order] == ["universe", "symbol", "universe"]
+
+
+def test_cancel_queued_and_running_jobs():
+    r = _Runners()
+    worker = EvalWorker(runners=r.runners(), fast_lane=False).start()
+    try:
+        running = worker.submit("universe")
+        _wait_state(worker, running["job_id"], ("running",))
+        queued = worker.submit("universe")
+        assert worker.cancel(queued["job_id"])["state"] == "cancelled"
+        worker.cancel(running["job_id"])
+        job = _wait_state(worker, running["job_id"], ("cancelled", "failed", "done"))
+        assert job["state"] == "cancelled" and job["error"] == "Cancelled"
+        assert worker.cancel("missing") is None
+    finally:
+        worker.stop()
+    assert len(r.order) == 1
+
+
+def test_deadline_fails_job_with_timeout():
+    r = _Runners()
+    worker = EvalWorker(runners=r.runners(), timeout_sec=0.05).start()
+    try:
+        job = worker.submit("universe")
+        out = _wait_state(worker, job["job_id"], ("failed", "done"))
+    finally:
+        worker.stop()
+    assert out["state"] == "failed" and out["error"] == "Timeout"
+
+
+def _serve(worker, authkey=b"test", address=("127.0.0.1", 0)):
+    stop = threading.Event()
+    bound = {}
+    listening = threading.Event()
+
+    def on_listening(addr):
+        bound["addr"] = addr
+        listening.set()
+
+    t = threading.Thread(
+        target=serve_eval_worker,
+        kwargs=dict(worker=worker, address=address, authkey=authkey, stop_event=stop, on_listening=on_listening),
+        daemon=True,
+    )
+    t.start()
+    assert listening.wait(5)
+    return t, stop, bound["addr"]
+
+
+def test_client_server_roundtrip_over_local_socket():
+    r = _Runners()
+    r.release.set()
+    worker = EvalWorker(runners=r.runners())
+    t, stop, addr = _serve(worker)
+    client = EvalWorkerClient(address=addr, authkey=b"test")
+    try:
+        assert client.ping() and client.version() == code_version()
+        job = client.submit("symbol", symbols=["spy"])
+        deadline = time.monotonic() + 5
+        while client.status(job["job_id"])["state"] != "done" and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert client.status(job["job_id"])["result"] == {"symbol": "SPY"}
+        assert client.status("nope") is None
+        with pytest.raises(RuntimeError, match="Unknown job kind"):
+            client.submit("bogus")
+        assert not EvalWorkerClient(address=addr, authkey=b"wrong").ping()
+    finally:
+        assert client.shutdown()
+        t.join(timeout=5)
+    assert not t.is_alive() and stop.is_set()
+
+
+def test_protocol_is_json_not_pickle():
+    from multiprocessing.connection import Client
+
+    worker = EvalWorker(runners=_Runners().runners())
+    t, stop, addr = _serve(worker)
+    try:
+        with Client(addr, authkey=b"test") as conn:
+            conn.send({"op": "ping"})  # pickled payload is rejected, never unpickled
+            assert "error" in eval_worker._recv_json(conn)
+        with Client(addr, authkey=b"test") as conn:
+            conn.send_bytes(b'{"op": "ping"}')
+            assert eval_worker._recv_json(conn)["version"] == code_version()
+    finally:
+        EvalWorkerClient(address=addr, authkey=b"test").shutdown()
+        t.join(timeout=5)
+
+
+def test_authkey_is_a_private_per_install_secret(tmp_path, monkeypatch):
+    monkeypatch.delenv("EVAL_WORKER_AUTHKEY", raising=False)
+    key_path = tmp_path / "state" / "eval_worker.key"
+    with patch.object(eval_worker, "_authkey_path", return_value=key_path):
+        first = eval_worker.worker_authkey()
+        assert first == eval_worker.worker_authkey() and len(first) == 64
+        if os.name == "posix":
+            assert stat.S_IMODE(key_path.stat().st_mode) == 0o600
+        monkeypatch.setenv("EVAL_WORKER_AUTHKEY", "from-env")
+        assert eval_worker.worker_authkey() == b"from-env"
+
+
+def test_backend_restarts_a_worker_running_older_code(monkeypatch):
+    monkeypatch.delenv("EVAL_WORKER_MODE", raising=False)
+    stale = EvalWorker(runners=_Runners().runners())
+    real_handle = eval_worker._handle
+
+    def handle(worker, req):
+        resp = real_handle(worker, req)
+        if worker is stale and "version" in resp:
+            resp["version"] = "old-deploy"
+        return resp
+
+    with patch.object(eval_worker, "_handle", side_effect=handle):
+        t, stop, addr = _serve(stale)
+        fresh = []
+
+        def spawn():
+            fresh.append(_serve(EvalWorker(runners=_Runners().runners()), address=addr))
+
+        def client():
+            return EvalWorkerClient(address=addr, authkey=b"test")
+
+        with (
+            patch.object(eval_worker, "EvalWorkerClient", side_effect=client),
+            patch.object(eval_worker, "_spawn_worker_process", side_effect=spawn),
+            patch.object(eval_worker, "_CLIENT", None),
+        ):
+            backend = eval_worker._backend()
+        t.join(timeout=5)
+        assert stop.is_set() and not t.is_alive()  # the stale worker was told to exit
+        assert len(fresh) == 1 and backend.version() == code_version()
+        backend.shutdown()
+        fresh[0][0].join(timeout=5)
@@ -0,0 +1,177 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""Vectorized full-chain iron condor search: constraints, Pareto set vs exhaustive enumeration, full-chain scale."""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from decimal import Decimal
+from typing import List
+
+import numpy as np
+
+from app.signals.adapters.theta_options_adapter import NormalizedOptionQuote
+from app.signals.iron_condor_search import IronCondorSearchConfig, pareto_front, search_iron_condors
+from app.signals.models import SignalEngineConfig
+from tests.fixtures.csp_test_data import create_test_stock_snapshot
+
+AS_OF = datetime(2026, 1, 22, 10, 0, 0)
+EXPIRY = date(2026, 2, 20)
+BASE = SignalEngineConfig(dte_min=7, dte_max=45, min_bid=0.01, min_open_interest=0, max_spread_pct=100.0)
+
+
+def _chain(spot: float = 100.0, step: float = 1.0, n_each_side: int = 30) -> List[NormalizedOptionQuote]:
+    quotes: List[NormalizedOptionQuote] = []
+    for i in range(1, n_each_side + 1):
+        for right in ("PUT", "CALL"):
+            strike = spot - i * step if right == "PUT" else spot + i * step
+            dist = i * step / spot
+            delta = max(0.01, 0.5 * np.exp(-dist * 12))
+            bid = round(max(0.02, 4.0 * np.exp(-dist * 10)), 2)
+            quotes.append(
+                NormalizedOptionQuote(
+                    underlying="AAPL",
+                    expiry=EXPIRY,
+                    strike=Decimal(str(strike)),
+                    right=right,
+                    bid=bid,
+                    ask=round(bid + 0.04, 2),
+                    last=None,
+                    volume=100,
+                    open_interest=500,
+                    as_of=AS_OF,
+                    delta=-delta if right == "PUT" else delta,
+                )
+            )
+    return quotes
+
+
+def _brute_force_front(c, m, p):
+    keep = []
+    for i in range(len(c)):
+        dominated = False
+        for j in range(len(c)):
+            if c[j] >= c[i] and m[j] <= m[i] and p[j] >= p[i] and (c[j] > c[i] or m[j] < m[i] or p[j] > p[i]):
+                dominated = True
+                break
+        if not dominated:
+            keep.append(i)
+    return sorted(keep)
+
+
+def test_pareto_front_matches_brute_force():
+    rng = np.random.default_rng(7)
+    c = rng.integers(0, 20, 700).astype(float)
+    m = rng.integers(0, 20, 700).astype(float)
+    p = rng.integers(0, 20, 700).astype(float)
+    assert sorted(pareto_front(c, m, p).tolist()) == _brute_force_front(c, m, p)
+
+
+def test_search_respects_constraints_and_returns_non_dominated_set():
+    cfg = IronCondorSearchConfig(short_delta_min=0.10, short_delta_max=0.30, width_min=1, width_max=5, max_results_per_expiry=0)
+    stock = create_test_stock_snapshot(price=100.0, snapshot_time=AS_OF)
+    results, exclusions = search_iron_condors(stock, _chain(), BASE, cfg)
+    assert results and not exclusions
+    for r in results:
+        ic = r.candidate
+        assert ic.put_long_strike < ic.put_short_strike < 100.0 < ic.call_short_strike < ic.call_long_strike
+        assert 1 <= ic.put_short_strike - ic.put_long_strike <= 5
+        assert 1 <= ic.call_long_strike - ic.call_short_strike <= 5
+        assert abs(r.credit - ic.total_credit) < 1e-9
+        assert r.max_loss > 0
+    for a in results:
+        for b in results:
+            strictly_better = (
+                b.credit >= a.credit and b.max_loss <= a.max_loss and b.pop >= a.pop
+                and (b.credit > a.credit or b.max_loss < a.max_loss or b.pop > a.pop)
+            )
+            assert not strictly_better
+    evs = [r.expected_value for r in results]
+    assert evs == sorted(evs, reverse=True)
+
+
+def _exhaustive_front(chain, cfg):
+    def _mid(q):
+        return (q.bid + q.ask) / 2
+
+    def _spreads(right):
+        legs = [q for q in chain if q.right == right and (q.strike < 100) == (right == "PUT") and q.strike != 100]
+        out = []
+        for s in legs:
+            for lg in legs:
+                w = float(lg.strike - s.strike) if right == "CALL" else float(s.strike - lg.strike)
+                cr = (_mid(s) - _mid(lg)) * 100
+                if cfg.width_min <= w <= cfg.width_max and 0 < cr < w * 100 and cfg.short_delta_min <= abs(s.delta) <= cfg.short_delta_max:
+                    out.append((float(s.strike), w, cr, abs(s.delta)))
+        return out
+
+    points = []
+    for sp, wp, cp, dp in _spreads("PUT"):
+        for sc, wc, cc, dc in _spreads("CALL"):
+            credit = cp + cc
+            max_loss = max(wp, wc) * 100 - credit
+            if sp < sc and credit >= cfg.min_credit and max_loss > 0:
+                points.append((credit, max_loss, 1 - dp - dc))
+    c, m, p = (np.array(x) for x in zip(*points))
+    return {tuple(np.round(points[i], 6)) for i in _brute_force_front(c, m, p)}
+
+
+def test_search_front_matches_exhaustive_enumeration():
+    cfg = IronCondorSearchConfig(short_delta_min=0.05, short_delta_max=0.40, width_min=1, width_max=4, max_results_per_expiry=0)
+    stock = create_test_stock_snapshot(price=100.0, snapshot_time=AS_OF)
+    chain = _chain(n_each_side=12)
+    results, _ = search_iron_condors(stock, chain, BASE, cfg)
+    got = {tuple(np.round((r.credit, r.max_loss, r.pop), 6)) for r in results}
+    assert got == _exhaustive_front(chain, cfg)
+
+
+def test_filters_apply_before_leg_reduction():
+    # Irregular quotes: some spreads are priced near their width, so a leg with more credit
+    # can push a condor to max_loss <= 0 or a cheap leg is needed to clear min_credit; the
+    # legs those dominate must still be considered.
+    rng = np.random.default_rng(3)
+    quotes = []
+    for k in range(1, 13):
+        for right in ("PUT", "CALL"):
+            bid = round(float(rng.uniform(0.1, 3.0)), 2)
+            delta = float(rng.uniform(0.05, 0.45))
+            quotes.append(NormalizedOptionQuote(
+                underlying="AAPL", expiry=EXPIRY, strike=Decimal(str(100 - k if right == "PUT" else 100 + k)), right=right,
+                bid=bid, ask=round(bid + 0.04, 2), last=None, volume=100, open_interest=500, as_of=AS_OF,
+                delta=-delta if right == "PUT" else delta,
+            ))
+    stock = create_test_stock_snapshot(price=100.0, snapshot_time=AS_OF)
+    for min_credit in (0.0, 250.0):
+        cfg = IronCondorSearchConfig(
+            short_delta_min=0.05, short_delta_max=0.45, width_min=1, width_max=3, min_credit=min_credit, max_results_per_expiry=0,
+        )
+        results, _ = search_iron_condors(stock, quotes, BASE, cfg)
+        got = {tuple(np.round((r.credit, r.max_loss, r.pop), 6)) for r in results}
+        assert got == _exhaustive_front(quotes, cfg)
+        assert all(r.credit >= min_credit and r.max_loss > 0 for r in results)
+
+
+def test_search_truncates_and_is_deterministic():
+    cfg = IronCondorSearchConfig(max_results_per_expiry=2)
+    stock = create_test_stock_snapshot(price=100.0, snapshot_time=AS_OF)
+    first, _ = search_iron_condors(stock, _chain(), BASE, cfg)
+    second, _ = search_iron_condors(stock, list(reversed(_chain())), BASE, cfg)
+    assert len(first) == 2
+    assert [r.candidate for r in first] == [r.candidate for r in second]
+
+
+def test_search_no_combination_reports_exclusion():
+    cfg = IronCondorSearchConfig(short_delta_min=0.95, short_delta_max=0.99)
+    stock = create_test_stock_snapshot(price=100.0, snapshot_time=AS_OF)
+    results, exclusions = search_iron_condors(stock, _chain(), BASE, cfg)
+    assert results == []
+    assert [e.code for e in exclusions] == ["IC_NO_VALID_COMBINATION"]
+
+
+def test_full_chain_search():
+    # Timing lives in scripts/benchmark_iron_condor_search.py
+    cfg = IronCondorSearchConfig(short_delta_min=0.02, short_delta_max=0.45, width_min=0.5, width_max=10)
+    stock = create_test_stock_snapshot(price=100.0, snapshot_time=AS_OF)
+    chain = _chain(step=0.5, n_each_side=150)
+    results, _ = search_iron_condors(stock, chain, BASE, cfg)
+    assert results
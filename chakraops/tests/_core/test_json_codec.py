@@ -0,0 +1,128 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""JSON codec — backends agree, streamed layout, dataclass fast path, legacy files stay readable."""
+
+from __future__ import annotations
+
+import io
+import json
+import math
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any, Dict, List
+
+import pytest
+
+from app.core.io import json_codec
+
+BACKENDS = ["stdlib"] + (["orjson"] if json_codec._orjson is not None else [])
+
+
+class _Side(Enum):
+    PUT = "PUT"
+
+
+@dataclass
+class _Leg:
+    side: _Side
+    strike: float
+
+
+@dataclass
+class _Doc:
+    run_id: str
+    symbols: List[Dict[str, Any]] = field(default_factory=list)
+    legs: List[_Leg] = field(default_factory=list)
+    at: datetime = datetime(2026, 3, 2, 21, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    json_codec.use_backend(request.param)
+    yield request.param
+    json_codec.use_backend(None)
+
+
+def _doc(n=50):
+    return _Doc(
+        run_id="r1",
+        symbols=[{"symbol": f"S{i}", "score": i / 7, "tags": ["é", i], 3: None} for i in range(n)],
+        legs=[_Leg(_Side.PUT, 95.5)],
+    )
+
+
+def test_streamed_output_matches_one_shot_and_is_line_per_row(backend):
+    doc = _doc()
+    buf = io.BytesIO()
+    n = json_codec.dump(doc, buf)
+    raw = buf.getvalue()
+    assert n == len(raw)
+    parsed = json_codec.loads(raw)
+    assert parsed == json_codec.loads(json_codec.dumps(doc))
+    assert parsed["legs"] == [{"side": "PUT", "strike": 95.5}]
+    assert parsed["at"] == "2026-03-02 21:00:00+00:00"  # str(datetime), as default=str wrote it
+    assert parsed["symbols"][1] == {"symbol": "S1", "score": 1 / 7, "tags": ["é", 1], "3": None}
+    lines = raw.split(b"\n")
+    assert sum(1 for ln in lines if ln.startswith(b'{"symbol":')) == 50
+    assert "é".encode() in raw
+
+    text = io.StringIO()
+    json_codec.dump(doc, text)
+    assert json.loads(text.getvalue()) == parsed
+
+
+def test_backends_produce_the_same_document():
+    if len(BACKENDS) < 2:
+        pytest.skip("orjson not installed")
+    docs = {}
+    for name in BACKENDS:
+        json_codec.use_backend(name)
+        docs[name] = json_codec.loads(b"".join(json_codec.iter_encode(_doc())))
+        assert json_codec.dumps({"big": 2**70}) in (b'{"big":1180591620717411303424}',)
+    json_codec.use_backend(None)
+    assert docs["stdlib"] == docs["orjson"]
+    with pytest.raises(ValueError):
+        json_codec.use_backend("nope")
+
+
+def test_legacy_files_with_nan_stay_readable(tmp_path, backend):
+    p = tmp_path / "legacy.json"
+    p.write_text(json.dumps({"iv_rank": float("nan"), "rows": [1, 2]}, indent=2), encoding="utf-8")
+    data = json_codec.read_json(p)
+    assert math.isnan(data["iv_rank"]) and data["rows"] == [1, 2]
+    with pytest.raises(json.JSONDecodeError):
+        json_codec.loads(b"{not json")
+
+
+def test_run_store_checksum_survives_codec_roundtrip(tmp_path, monkeypatch, backend):
+    from app.core.eval import evaluation_store as store
+
+    monkeypatch.setattr(store, "_get_evaluations_dir", lambda: tmp_path)
+    monkeypatch.setattr("app.core.eval.data_completeness_report.write_data_completeness_report", lambda *a, **k: None)
+    run = store.EvaluationRunFull(
+        run_id="eval_20260302_210000_abcdef", started_at="2026-03-02T20:59:00+00:00", status="COMPLETED",
+        symbols=[{"symbol": "AAPL", "iv_rank": float("nan"), "legs": [_Leg(_Side.PUT, 95.0)]}],
+    )
+    store.save_run(run)
+    loaded = store.load_run(run.run_id)
+    assert loaded.symbols[0]["legs"] == [{"side": "PUT", "strike": 95.0}]
+    assert loaded.symbols[0]["iv_rank"] is None or math.isnan(loaded.symbols[0]["iv_rank"])
+    # The run object itself was not deep-copied or mutated by the write
+    assert isinstance(run.symbols[0]["legs"][0], _Leg)
+
+
+def test_numpy_values_encode_as_numbers_on_every_backend():
+    np = pytest.importorskip("numpy")
+    doc = {
+        "a": np.float64(1.5), "b": np.int64(3), "c": np.bool_(True), "d": np.array([1.0, 2.5]),
+        "rows": [{"iv": np.float32(0.5), "n": np.int32(7)}],
+    }
+    expected = {"a": 1.5, "b": 3, "c": True, "d": [1.0, 2.5], "rows": [{"iv": 0.5, "n": 7}]}
+    for name in BACKENDS:
+        json_codec.use_backend(name)
+        assert json_codec.loads(json_codec.dumps(doc)) == expected, name
+        buf = io.BytesIO()
+        json_codec.dump(doc, buf)
+        assert json_codec.loads(buf.getvalue()) == expected, name
+    json_codec.use_backend(None)
@@ -0,0 +1,135 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""Quote-driven lifecycle trigger index and its alert routing."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from app.core.lifecycle.engine import evaluate_position_lifecycle
+from app.core.lifecycle.models import ExitReason, LifecycleAction
+from app.core.lifecycle.trigger_index import TriggerIndex, poll_triggers
+
+TARGETS = {
+    "AAPL": {"stop": 90.0, "target1": 110.0, "target2": 120.0},
+    "MSFT": {"stop": 300.0, "target1": 350.0, "target2": None},
+    "SPY": {"stop": None, "target1": None, "target2": None},
+}
+
+
+def _pos(pid, sym, status="OPEN"):
+    return SimpleNamespace(position_id=pid, symbol=sym, status=status)
+
+
+def _index(*positions):
+    idx = TriggerIndex()
+    idx.build(positions, targets_loader=lambda s: TARGETS.get(s, {}))
+    return idx
+
+
+def _actions(events):
+    return [(e.position_id, e.action.value, e.reason.value if e.reason else None) for e in events]
+
+
+def test_quotes_fire_each_level_once_in_engine_priority_order():
+    idx = _index(_pos("p1", "aapl"), _pos("p2", "AAPL", "PARTIAL_EXIT"), _pos("p3", "SPY"), _pos("p4", "AAPL", "CLOSED"))
+    assert len(idx) == 2 and idx.symbols() == ["AAPL"]
+
+    assert idx.on_quote("AAPL", 100.0) == []
+    # p1 scales out at target1; p2 (already PARTIAL_EXIT) waits for target2
+    assert _actions(idx.on_quote("AAPL", 111.0, source="orats")) == [("p1", "SCALE_OUT", "TARGET_1")]
+    assert idx.on_quote("AAPL", 112.0) == []
+    ev = idx.on_quote("AAPL", 125.0)
+    assert sorted(_actions(ev)) == [("p1", "EXIT", "TARGET_2"), ("p2", "EXIT", "TARGET_2")]
+    assert ev[0].meta["trigger_source"] == "quote" and ev[0].meta["price"] == 125.0
+    # Exits disarm the positions
+    assert idx.on_quote("AAPL", 80.0) == [] and len(idx) == 0
+
+
+def test_stop_gap_and_parity_with_evaluation_engine():
+    idx = _index(_pos("m1", "MSFT"), _pos("m2", "MSFT", "PARTIAL_EXIT"))
+    ev = idx.on_quote("msft", 250.0)
+    assert {e.reason for e in ev} == {ExitReason.STOP_LOSS} and len(ev) == 2
+    assert all(e.directive == "EXIT IMMEDIATELY (STOP LOSS)" for e in ev)
+
+    # Same price through the evaluation path produces the same directive
+    run = SimpleNamespace(run_id="r1", regime="", symbols=[{"symbol": "MSFT", "verdict": "ELIGIBLE", "price": 250.0}])
+    eng = evaluate_position_lifecycle(_pos("m1", "MSFT"), {"verdict": "ELIGIBLE"}, TARGETS["MSFT"], run)
+    assert _actions(eng) == [a for a in _actions(ev) if a[0] == "m1"]
+
+    # PARTIAL_EXIT without target2: target1 exits the remainder; upsert re-arms after changes
+    idx.upsert_position(_pos("m2", "MSFT", "PARTIAL_EXIT"), TARGETS["MSFT"])
+    assert _actions(idx.on_quote("MSFT", 351.0)) == [("m2", "EXIT", "TARGET_2")]
+    idx.upsert_position(_pos("m1", "MSFT"), TARGETS["MSFT"])
+    assert idx.remove_position("m1") and idx.on_quote("MSFT", 100.0) == []
+    assert idx.stats()["stale_pops"] >= 1
+
+
+def test_poll_dispatches_through_lifecycle_alert_path(monkeypatch):
+    from app.core.alerts import alert_engine
+
+    records, sent = [], []
+
+    class _Notifier:
+        def __init__(self, config):
+            pass
+
+        def send(self, alert):
+            sent.append(alert)
+            return True
+
+        def _channel_for_alert(self, alert):
+            return "critical"
+
+    monkeypatch.setattr(alert_engine, "_append_alert_record", records.append)
+    monkeypatch.setattr(alert_engine, "_append_lifecycle_log_if_lifecycle", lambda a, sent: None)
+    monkeypatch.setattr(alert_engine, "_get_recent_sent_fingerprints", lambda s: set())
+    monkeypatch.setattr(alert_engine, "_load_alerts_config", lambda: {"enabled_alert_types": ["POSITION_EXIT"]})
+    monkeypatch.setattr("app.core.alerts.slack_notifier.SlackNotifier", _Notifier)
+
+    idx = _index(_pos("p1", "AAPL"))
+    events = poll_triggers(idx, source="thetaterminal", quote_fetcher=lambda syms: {s: 85.0 for s in syms})
+    assert [e.action for e in events] == [LifecycleAction.EXIT]
+    assert len(sent) == 1 and sent[0].severity.value == "CRITICAL" and sent[0].meta["trigger_source"] == "thetaterminal"
+    assert records[0]["sent"] is True and records[0]["reason_code"] == "STOP_LOSS"
+    assert poll_triggers(idx, quote_fetcher=lambda syms: {}) == []
+
+
+def test_shared_index_follows_position_and_target_writes(tmp_path, monkeypatch):
+    from app.core.lifecycle import trigger_index
+    from app.core.positions import store
+    from app.core.positions.models import Position
+    from app.core.symbols.targets import put_targets
+
+    def position(pid, sym):
+        return Position(
+            position_id=pid, account_id="acct_1", symbol=sym, strategy="CSP", contracts=1, strike=100.0,
+            expiration="2026-03-20", credit_expected=1.5, quantity=None, status="OPEN",
+            opened_at="2026-02-18T15:00:00+00:00", closed_at=None, notes="",
+        )
+
+    (tmp_path / "positions").mkdir()
+    monkeypatch.setattr("app.core.positions.store._get_positions_dir", lambda: tmp_path / "positions")
+    monkeypatch.setattr("app.core.symbols.targets._get_targets_dir", lambda: tmp_path / "symbols")
+    monkeypatch.setattr(trigger_index, "_INDEX", None)
+    put_targets("AAPL", TARGETS["AAPL"])
+    store.create_position(position("p1", "AAPL"))
+    # Hooks are no-ops until the index exists; first use arms it from the store
+    idx = trigger_index.get_trigger_index()
+    assert idx.symbols() == ["AAPL"] and len(idx) == 1
+
+    store.create_position(position("p2", "MSFT"))
+    assert idx.symbols() == ["AAPL"]  # no MSFT targets yet
+    put_targets("MSFT", TARGETS["MSFT"])
+    assert idx.symbols() == ["AAPL", "MSFT"]
+    store.update_position("p1", {"status": "CLOSED"})
+    assert idx.symbols() == ["MSFT"]
+    store.update_position("p2", {"status": "CLOSED"})
+    store.delete_position("p2")
+    assert len(idx) == 0
+
+    store.create_position(position("p3", "MSFT"))
+    fetched = []
+    monkeypatch.setitem(trigger_index._QUOTE_SOURCES, "orats", lambda syms: fetched.append(syms) or {"MSFT": 351.0})
+    events = trigger_index.poll_armed_triggers(dispatch=False)
+    assert fetched == [["MSFT"]] and _actions(events) == [("p3", "SCALE_OUT", "TARGET_1")]
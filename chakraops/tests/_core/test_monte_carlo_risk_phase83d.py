@@ -0,0 +1,164 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""Phase 8.3d: Monte Carlo assignment risk — determinism, analytic check, IV seeding, API."""
+
+from __future__ import annotations
+
+import math
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from app.core.portfolio.monte_carlo_risk import (
+    MonteCarloRiskConfig,
+    load_symbol_vols,
+    simulate_assignment_risk_mc,
+)
+
+AS_OF = date(2026, 3, 2)
+SNAP = {"portfolio_equity_usd": 250_000.0}
+
+
+def _positions():
+    return [
+        {"symbol": "SPY", "mode": "CSP", "strike": 500.0, "contracts": 2, "spot": 520.0, "dte": 30},
+        {"symbol": "NVDA", "mode": "CSP", "strike": 100.0, "contracts": 3, "spot": 110.0, "expiration": "2026-03-20"},
+        {"symbol": "AAPL", "mode": "CC", "strike": 210.0, "contracts": 1, "spot": 200.0, "dte": 14},
+        {"symbol": "XYZ", "mode": "CSP", "contracts": 1, "dte": 10},
+    ]
+
+
+VOLS = {"SPY": 0.18, "NVDA": {"sigma": 0.55, "source": "IV"}, "AAPL": 0.28}
+
+
+def _norm_cdf(x: float) -> float:
+    return 0.5 * (1.0 + math.erf(x / math.sqrt(2.0)))
+
+
+def test_deterministic_and_independent_of_worker_count():
+    cfg = MonteCarloRiskConfig(n_paths=8_000, chunk_size=2_000, seed=7, max_workers=1, jump_intensity=2.0)
+    inline = simulate_assignment_risk_mc(SNAP, _positions(), VOLS, cfg, as_of=AS_OF)
+    again = simulate_assignment_risk_mc(SNAP, _positions(), VOLS, cfg, as_of=AS_OF)
+    pooled = simulate_assignment_risk_mc(
+        SNAP, _positions(), VOLS, MonteCarloRiskConfig(**{**cfg.__dict__, "max_workers": 2}), as_of=AS_OF
+    )
+    a, b, c = inline.to_dict(), again.to_dict(), pooled.to_dict()
+    for d in (a, b, c):
+        d.pop("elapsed_ms")
+        d.pop("workers")
+    assert a == b == c
+    assert inline.chunks == 4
+    assert inline.horizons_days == [14, 18, 30]
+    assert any("XYZ" in w for w in inline.warnings)
+    other_seed = simulate_assignment_risk_mc(
+        SNAP, _positions(), VOLS, MonteCarloRiskConfig(n_paths=8_000, seed=8, max_workers=1), as_of=AS_OF
+    )
+    assert other_seed.expected_assignment_capital != inline.expected_assignment_capital
+
+
+def test_parallel_runs_share_one_long_lived_pool():
+    from app.core.portfolio import monte_carlo_risk as mc
+
+    cfg = MonteCarloRiskConfig(n_paths=8_000, chunk_size=2_000, seed=7, max_workers=2)
+    mc.shutdown_risk_pool()
+    try:
+        with patch.object(mc, "MC_RISK_POOL_WORKERS", 2):
+            first = simulate_assignment_risk_mc(SNAP, _positions(), VOLS, cfg, as_of=AS_OF)
+            pool = mc._POOL
+            second = simulate_assignment_risk_mc(SNAP, _positions(), VOLS, cfg, as_of=AS_OF)
+            assert pool is not None and mc._POOL is pool
+        assert first.workers == second.workers == 2
+        assert first.expected_assignment_capital == second.expected_assignment_capital
+    finally:
+        mc.shutdown_risk_pool()
+    assert mc._POOL is None
+
+
+def test_single_csp_matches_lognormal_assignment_probability():
+    pos = [{"symbol": "SPY", "mode": "CSP", "strike": 95.0, "contracts": 1, "spot": 100.0, "dte": 73}]
+    cfg = MonteCarloRiskConfig(n_paths=100_000, chunk_size=25_000, max_workers=1)
+    out = simulate_assignment_risk_mc(SNAP, pos, {"SPY": 0.30}, cfg, as_of=AS_OF)
+    t = 73 / 365.0
+    d2 = (math.log(100.0 / 95.0) - 0.5 * 0.30 ** 2 * t) / (0.30 * math.sqrt(t))
+    expected = _norm_cdf(-d2)
+    assert out.by_position[0]["assignment_probability"] == pytest.approx(expected, abs=0.006)
+    assert out.expected_assignment_capital == pytest.approx(expected * 9_500.0, rel=0.03)
+    # Tail: VaR99 capital is the full strike notional; CVaR >= VaR
+    assert out.assignment_capital_var["99"] == pytest.approx(9_500.0)
+    assert out.nav_shrink_cvar["99"] >= out.nav_shrink_var["99"] > 0
+    assert out.survival_status == "OK"
+
+
+def test_jumps_fatten_the_tail():
+    cfg = MonteCarloRiskConfig(n_paths=20_000, max_workers=1)
+    base = simulate_assignment_risk_mc(SNAP, _positions(), VOLS, cfg, as_of=AS_OF)
+    jumpy = simulate_assignment_risk_mc(
+        SNAP, _positions(), VOLS,
+        MonteCarloRiskConfig(n_paths=20_000, max_workers=1, jump_intensity=6.0, jump_mean=-0.10),
+        as_of=AS_OF,
+    )
+    assert jumpy.nav_shrink_cvar["99"] > base.nav_shrink_cvar["99"]
+    assert jumpy.prob_any_assignment > base.prob_any_assignment
+
+
+def test_symbol_vols_from_artifact_iv_then_atr():
+    artifact = SimpleNamespace(
+        symbols=[
+            SimpleNamespace(symbol="AAPL", price=263.2),
+            SimpleNamespace(symbol="MSFT", price=410.0),
+            SimpleNamespace(symbol="ZZZ", price=10.0),
+        ],
+        diagnostics_by_symbol={
+            "AAPL": SimpleNamespace(stock={"price": 263.2, "iv": 32.5}, technicals={"atr_pct": 0.02}),
+            "MSFT": SimpleNamespace(stock={"price": 410.0}, technicals={"atr_pct": 0.015}),
+            "ZZZ": SimpleNamespace(stock={}, technicals={}),
+        },
+    )
+    vols = load_symbol_vols(artifact)
+    assert vols["AAPL"] == {"sigma": pytest.approx(0.325), "source": "IV", "spot": 263.2}
+    assert vols["MSFT"]["source"] == "ATR"
+    assert vols["MSFT"]["sigma"] == pytest.approx(0.015 * math.sqrt(252))
+    assert "ZZZ" not in vols
+    # Spot falls back to the artifact price when the position has none
+    out = simulate_assignment_risk_mc(
+        SNAP,
+        [{"symbol": "MSFT", "mode": "CSP", "strike": 400.0, "contracts": 1, "dte": 20}],
+        vols,
+        MonteCarloRiskConfig(n_paths=2_000, max_workers=1),
+        as_of=AS_OF,
+    )
+    assert out.positions_evaluated == 1
+    assert out.symbol_vols["MSFT"]["source"] == "ATR"
+
+
+def test_empty_portfolio():
+    out = simulate_assignment_risk_mc(SNAP, [], {}, MonteCarloRiskConfig(max_workers=1), as_of=AS_OF)
+    assert out.positions_evaluated == 0
+    assert out.expected_assignment_capital == 0.0
+    assert out.survival_status == "OK"
+
+
+def test_risk_profile_api_includes_monte_carlo_when_requested():
+    try:
+        from fastapi.testclient import TestClient
+        from app.api.server import app
+    except ImportError:
+        pytest.skip("fastapi not installed")
+
+    positions = [{"symbol": "SPY", "mode": "CSP", "strike": 500.0, "contracts": 1, "spot": 505.0, "dte": 21}]
+    with (
+        patch("app.core.portfolio.portfolio_snapshot.load_open_positions", return_value=positions),
+        patch("app.core.portfolio.portfolio_snapshot.get_portfolio_equity_usd", return_value=150_000.0),
+        patch("app.core.portfolio.monte_carlo_risk.load_symbol_vols", return_value={"SPY": 0.2}),
+    ):
+        client = TestClient(app)
+        plain = client.get("/api/portfolio/risk-profile").json()
+        sim = client.get("/api/portfolio/risk-profile", params={"simulate": "true", "paths": 2000, "seed": 3}).json()
+
+    assert "monte_carlo" not in plain
+    mc = sim["monte_carlo"]
+    assert mc["n_paths"] == 2000 and mc["seed"] == 3
+    assert 0.0 < mc["by_position"][0]["assignment_probability"] < 1.0
+    assert set(mc["assignment_capital_var"]) == {"95", "99"}
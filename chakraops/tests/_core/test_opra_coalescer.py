@@ -0,0 +1,183 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""Cross-symbol OPRA coalescer — packing, routing, dedup, telemetry, pipeline parity."""
+
+from __future__ import annotations
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.core.options import orats_chain_pipeline as pipeline
+from app.core.options.opra_coalescer import OpraCoalescer, OpraLookupError
+
+
+def _occ(root: str, i: int) -> str:
+    return "%s260320P%08d" % (root, (100 + i) * 1000)
+
+
+class _FakeOrats:
+    def __init__(self, fail_on: str = ""):
+        self.batches = []
+        self.fail_on = fail_on
+        self._lock = threading.Lock()
+
+    def fetch(self, route, symbols):
+        with self._lock:
+            self.batches.append((route, list(symbols)))
+        if self.fail_on in symbols:
+            raise RuntimeError("boom")
+        return [{"optionSymbol": s, "bidPrice": 1.0, "askPrice": 1.2, "openInt": 50} for s in symbols]
+
+
+def _run_concurrently(coalescer, requests_):
+    out = [None] * len(requests_)
+    barrier = threading.Barrier(len(requests_))
+
+    def worker(i, route, syms):
+        barrier.wait()
+        out[i] = coalescer.lookup(route, syms)
+
+    threads = [threading.Thread(target=worker, args=(i, r, s)) for i, (r, s) in enumerate(requests_)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=10)
+    return out
+
+
+def test_packs_partial_batches_across_underlyings():
+    fake = _FakeOrats()
+    co = OpraCoalescer(fake.fetch, lambda r: r["optionSymbol"], batch_size=10, window_ms=200)
+    spy = [_occ("SPY", i) for i in range(13)]
+    aapl = [_occ("AAPL", i) for i in range(7)]
+    msft = [_occ("MSFT", i) for i in range(5)]
+    try:
+        out = _run_concurrently(co, [("d", spy), ("d", aapl), ("d", msft)])
+    finally:
+        co.close()
+
+    # Every caller gets exactly its own rows back
+    assert [sorted(o) for o in out] == [sorted(spy), sorted(aapl), sorted(msft)]
+    assert all(len(b) <= 10 for _, b in fake.batches)
+    stats = co.stats()
+    assert stats["batches_dispatched"] == len(fake.batches) == 3  # ceil(25 / 10)
+    assert stats["batches_without_coalescing"] == 4  # 2 + 1 + 1 per caller
+    assert stats["calls_saved"] == 1
+    assert stats["fill_ratio"] == pytest.approx(25 / 30, abs=1e-4)
+
+
+def test_shared_symbols_dispatched_once_and_routes_kept_apart():
+    fake = _FakeOrats()
+    co = OpraCoalescer(fake.fetch, lambda r: r["optionSymbol"], batch_size=10, window_ms=100)
+    shared = _occ("SPY", 1)
+    try:
+        out = _run_concurrently(co, [("d", [shared, _occ("SPY", 2)]), ("d", [shared]), ("live", [shared])])
+    finally:
+        co.close()
+    assert shared in out[0] and shared in out[1] and shared in out[2]
+    by_route = {}
+    for route, syms in fake.batches:
+        by_route.setdefault(route, []).extend(syms)
+    assert by_route["d"].count(shared) == 1
+    assert by_route["live"] == [shared]
+    assert co.stats()["symbols_deduped"] == 1
+
+
+def test_failed_batch_raises_for_its_callers_with_partial_rows():
+    fake = _FakeOrats(fail_on=_occ("BAD", 0))
+    co = OpraCoalescer(fake.fetch, lambda r: r["optionSymbol"], batch_size=2, window_ms=1)
+    ok = [_occ("OK", i) for i in range(2)]
+    try:
+        assert co.lookup("d", []) == {}
+        with pytest.raises(OpraLookupError, match="boom") as exc:
+            co.lookup("d", ok + [_occ("BAD", 0), _occ("BAD", 1)])
+        assert sorted(exc.value.rows) == ok
+        assert exc.value.failed == {_occ("BAD", 0): "boom", _occ("BAD", 1): "boom"}
+        assert co.lookup("d", [_occ("OK", 9)]) == {_occ("OK", 9): fake.fetch("x", [_occ("OK", 9)])[0]}
+    finally:
+        co.close()
+    stats = co.stats()
+    assert stats["batches_failed"] == 1 and stats["lookups_failed"] == 1
+
+
+def test_lookup_wait_is_bounded():
+    release = threading.Event()
+
+    def stuck(route, symbols):
+        release.wait(5)
+        return []
+
+    co = OpraCoalescer(stuck, lambda r: r["optionSymbol"], batch_size=10, window_ms=1, lookup_timeout_sec=0.05)
+    try:
+        with pytest.raises(OpraLookupError, match="not answered within") as exc:
+            co.lookup("d", [_occ("SPY", 0)])
+        assert exc.value.failed == {_occ("SPY", 0): "timed out"} and exc.value.rows == {}
+    finally:
+        release.set()
+        co.close()
+    assert co.stats()["lookups_timed_out"] == 1
+
+
+def test_fetch_enriched_contracts_coalesced_matches_per_call():
+    syms = [_occ("SPY", i) for i in range(23)]
+
+    def fake_get(url, params=None, timeout=None):
+        req = params["tickers"].split(",")
+        resp = MagicMock(status_code=200)
+        resp.json.return_value = {
+            "data": [
+                {"optionSymbol": s, "bidPrice": 1.0 + i, "askPrice": 1.5 + i, "openInt": 10 * i, "volume": i, "delta": -0.2}
+                for i, s in enumerate(req) if not s.endswith("00105000")
+            ]
+        }
+        return resp
+
+    with (
+        patch.object(pipeline.requests, "get", side_effect=fake_get) as get,
+        patch.object(pipeline._RATE_LIMITER, "acquire"),
+        patch.object(pipeline, "_OPRA_COALESCER", None),
+    ):
+        plain, t_plain = pipeline.fetch_enriched_contracts(syms, chain_mode="DELAYED", coalesce=False)
+        calls_plain = get.call_count
+        co = pipeline.get_opra_coalescer()
+        try:
+            merged, t_co = pipeline.fetch_enriched_contracts(syms, chain_mode="DELAYED", coalesce=True)
+        finally:
+            co.close()
+
+    assert calls_plain == 3 and get.call_count == 6
+    assert set(merged) == set(plain) and len(plain) == 22
+    # Batch position differs between paths, so compare fields that do not depend on it
+    assert all(merged[k]["delta"] == plain[k]["delta"] for k in plain)
+    assert t_co["coalesced"] is True and t_plain["coalesced"] is False
+    assert t_co["response_rows"] == t_plain["response_rows"] == 22
+    assert co.stats()["symbols_requested"] == 23
+
+
+def test_fetch_enriched_contracts_reports_failed_batches_on_both_paths():
+    syms = [_occ("SPY", i) for i in range(12)]
+
+    def fake_get(url, params=None, timeout=None):
+        req = params["tickers"].split(",")
+        if _occ("SPY", 0) in req:
+            return MagicMock(status_code=503, text="unavailable")
+        resp = MagicMock(status_code=200)
+        resp.json.return_value = {"data": [{"optionSymbol": s, "bidPrice": 1.0, "askPrice": 1.2} for s in req]}
+        return resp
+
+    with (
+        patch.object(pipeline.requests, "get", side_effect=fake_get),
+        patch.object(pipeline._RATE_LIMITER, "acquire"),
+        patch.object(pipeline, "_OPRA_COALESCER", None),
+    ):
+        plain, t_plain = pipeline.fetch_enriched_contracts(syms, chain_mode="DELAYED", coalesce=False)
+        co = pipeline.get_opra_coalescer()
+        try:
+            merged, t_co = pipeline.fetch_enriched_contracts(syms, chain_mode="DELAYED", coalesce=True)
+        finally:
+            co.close()
+    assert set(plain) == set(merged) == set(syms[10:])
+    assert t_plain["failed_symbols"] == t_co["failed_symbols"] == 10
+    assert co.stats()["batches_failed"] == 1
@@ -43,7 +43,7 @@ def test_normalize_row_empty_returns_none_fields():
     assert out["close"] is None
 
 
-@patch("app.core.eligibility.providers.orats_daily_provider.requests.get")
+@patch("app.core.data.daily_bars.requests.get")
 def test_get_daily_normalization_and_lookback(mock_get, tmp_path):
     """Full dataset returned; sort ascending; slice last lookback. Use tmp_path so cache is empty."""
     raw_data = [
@@ -68,7 +68,7 @@ def test_get_daily_normalization_and_lookback(mock_get, tmp_path):
     assert out[-1]["close"] == 104.0
 
 
-@patch("app.core.eligibility.providers.orats_daily_provider.requests.get")
+@patch("app.core.data.daily_bars.requests.get")
 def test_get_daily_empty_data_returns_empty_list(mock_get, tmp_path):
     """Empty data => return []."""
     mock_resp = MagicMock()
@@ -81,7 +81,7 @@ def test_get_daily_empty_data_returns_empty_list(mock_get, tmp_path):
     assert out == []
 
 
-@patch("app.core.eligibility.providers.orats_daily_provider.requests.get")
+@patch("app.core.data.daily_bars.requests.get")
 def test_get_daily_non_200_returns_empty_list(mock_get, tmp_path):
     """status != 200 => log and return []."""
     mock_resp = MagicMock()
@@ -102,7 +102,7 @@ def test_missing_token_raises():
         OratsDailyProvider(token="   ")
 
 
-@patch("app.core.eligibility.providers.orats_daily_provider.requests.get")
+@patch("app.core.data.daily_bars.requests.get")
 def test_cache_load_works(mock_get, tmp_path):
     """When cache exists and is from today, load from cache (no request)."""
     cached = [
@@ -122,7 +122,7 @@ def test_cache_load_works(mock_get, tmp_path):
     assert out[1]["close"] == 101.0
 
 
-@patch("app.core.eligibility.providers.orats_daily_provider.requests.get")
+@patch("app.core.data.daily_bars.requests.get")
 def test_provider_returns_minimum_lookback_rows(mock_get, tmp_path):
     """When API returns 500 rows and lookback=300, returned list has 300 rows (last N)."""
     raw_data = [
@@ -147,7 +147,7 @@ def test_provider_returns_minimum_lookback_rows(mock_get, tmp_path):
     assert out[-1]["close"] is not None
 
 
-@patch("app.core.eligibility.providers.orats_daily_provider.requests.get")
+@patch("app.core.data.daily_bars.requests.get")
 def test_cache_today_prevents_http_call(mock_get, tmp_path):
     """When cache file exists and is from today, get_daily does not call requests.get."""
     (tmp_path / "CACHE.json").write_text(
@@ -162,7 +162,7 @@ def test_cache_today_prevents_http_call(mock_get, tmp_path):
     assert out[0]["close"] == 100
 
 
-@patch("app.core.eligibility.providers.orats_daily_provider.requests.get")
+@patch("app.core.data.daily_bars.requests.get")
 def test_fetch_saves_cache(mock_get, tmp_path):
     """After fetch, cache is written."""
     raw_data = [
@@ -0,0 +1,100 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""ORATS record/replay harness — recording, date shift + cloning, stub errors, end-to-end replay."""
+
+from __future__ import annotations
+
+import time
+from datetime import date, timedelta
+
+import requests
+
+from app.core.orats.endpoints import BASE_DATAV2
+from app.core.orats.orats_opra import build_orats_option_symbol
+from app.core.orats.replay import (
+    FixtureBundle,
+    OratsStubServer,
+    latest_weekday,
+    record_orats,
+    route_orats_to,
+    synthetic_bundle,
+)
+
+
+def test_record_through_stub_and_roundtrip(tmp_path):
+    source = synthetic_bundle(["AAPL", "MSFT"])
+    recorded = FixtureBundle(as_of=source.as_of)
+    with OratsStubServer(source) as stub, route_orats_to(stub.url), record_orats(recorded):
+        r = requests.get(f"{BASE_DATAV2}/strikes/options", params={"token": "secret", "tickers": "AAPL,MSFT"}, timeout=5)
+        assert r.status_code == 200 and len(r.json()["data"]) == 2
+        requests.get(f"{BASE_DATAV2}/ivrank", params={"token": "secret", "ticker": "AAPL"}, timeout=5)
+        requests.get(f"{BASE_DATAV2}/strikes", params={"token": "secret", "ticker": "AAPL", "dte": "7,63"}, timeout=5)
+        assert stub.stats()["by_endpoint"]["/strikes/options"]["requests"] == 1
+
+    assert recorded.tickers() == ["AAPL", "MSFT"]
+    assert set(recorded.tables["ivrank"]) == {"AAPL"}
+    assert len(recorded.tables["strikes"]["AAPL"]) == len(source.tables["strikes"]["AAPL"])
+    path = recorded.save(tmp_path / "bundle.json.gz")
+    assert b"secret" not in path.read_bytes()
+    loaded = FixtureBundle.load(path)
+    assert loaded.to_dict() == recorded.to_dict()
+
+
+def test_replay_shifts_dates_and_clones_missing_tickers():
+    as_of = latest_weekday() - timedelta(days=28)
+    bundle = synthetic_bundle(["AAPL"], as_of=as_of.isoformat(), history_days=30)
+    today = latest_weekday()
+
+    quote = bundle.respond("/datav2/strikes/options", {"tickers": "ZZZ"})["data"][0]
+    assert quote["ticker"] == "ZZZ" and quote["quoteDate"] == today.isoformat()
+
+    strikes = bundle.respond("/datav2/strikes", {"ticker": "ZZZ", "dte": "20,40"})["data"]
+    assert strikes and all(r["ticker"] == "ZZZ" and 20 <= r["dte"] <= 40 for r in strikes)
+    row = strikes[0]
+    expiry = date.fromisoformat(row["expirDate"])
+    assert (expiry - today).days == row["dte"]
+
+    occ = build_orats_option_symbol("ZZZ", row["expirDate"], "P", row["strike"])
+    opt = bundle.respond("/datav2/strikes/options", {"tickers": occ})["data"]
+    assert len(opt) == 1 and opt[0]["optionSymbol"] == occ and opt[0]["expirDate"] == row["expirDate"]
+
+    bars = bundle.respond("/datav2/hist/dailies", {"ticker": "ZZZ", "tradeDate": f"{today - timedelta(days=6)},{today}"})["data"]
+    assert bars and bars[-1]["tradeDate"] == today.isoformat()
+    assert bundle.respond("/datav2/cores", {"ticker": "ZZZ"}, clone=False) == {"data": []}
+    assert bundle.respond("/datav2/live/summaries", {"ticker": "AAPL"}) is None
+
+
+def test_stub_latency_and_injected_errors():
+    stub = OratsStubServer(synthetic_bundle(["AAPL"], history_days=5), error_rate=1.0, error_status=503)
+    with stub, route_orats_to(stub.url):
+        r = requests.get(f"{BASE_DATAV2}/cores", params={"token": "t", "ticker": "AAPL"}, timeout=5)
+    assert r.status_code == 503
+    assert stub.stats() == {
+        "requests": 1, "errors": 1, "by_endpoint": {"/cores": {"requests": 1, "errors": 1, "rows": 0, "bytes": 0}},
+    }
+    slow = OratsStubServer(synthetic_bundle(["AAPL"], history_days=5), latency_ms=30)
+    t0 = time.perf_counter()
+    status, _ = slow.handle("/datav2/ivrank?ticker=AAPL", {"ticker": "AAPL"})
+    assert status == 200 and time.perf_counter() - t0 >= 0.025
+
+
+def test_staged_evaluation_runs_end_to_end_on_replay(tmp_path, monkeypatch):
+    from app.core.data import cache_store, daily_bars
+    from app.core.eligibility import candles
+    from app.core.eligibility.providers.orats_daily_provider import OratsDailyProvider
+    from app.core.eval.staged_evaluator import evaluate_universe_staged
+
+    monkeypatch.setattr(cache_store, "CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(daily_bars, "_REPOSITORY", daily_bars.DailyBarRepository(cache_dir=tmp_path / "candles"))
+    monkeypatch.setattr(candles, "_provider", OratsDailyProvider(cache_dir=tmp_path / "candles"))
+
+    bundle = synthetic_bundle(["XAAAA", "XAAAB", "XAAAC"])
+    with OratsStubServer(bundle) as stub, route_orats_to(stub.url):
+        result = evaluate_universe_staged(["XAAAA", "XAAAB", "XAAAC", "CLONE"])
+    by_symbol = {r.symbol: r for r in result.results}
+    assert set(by_symbol) == {"XAAAA", "XAAAB", "XAAAC", "CLONE"}
+    assert all(r.stage1 is not None and r.stage1.price for r in by_symbol.values())
+    served = stub.stats()["by_endpoint"]
+    assert served["/cores"]["requests"] == 4 and served["/hist/dailies"]["errors"] == 0
+    if any(r.stage2 is not None for r in by_symbol.values()):
+        assert served["/strikes"]["requests"] >= 1
@@ -0,0 +1,180 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""Portfolio read model — write-maintained aggregates, external-change rebuild, consistency check."""
+
+from __future__ import annotations
+
+import json
+from contextlib import contextmanager
+from unittest.mock import patch
+
+import pytest
+
+from app.core.portfolio.read_model import PortfolioReadModel
+from app.core.positions import store
+from app.core.positions.models import Position
+
+
+@contextmanager
+def _stores(tmp_path):
+    positions_dir = tmp_path / "positions"
+    positions_dir.mkdir()
+    with patch("app.core.positions.store._get_positions_dir", return_value=positions_dir), \
+         patch("app.core.wheel.state_store._wheel_state_path", return_value=tmp_path / "wheel_state.json"), \
+         patch("app.core.wheel.actions_store._wheel_actions_path", return_value=tmp_path / "wheel_actions.jsonl"), \
+         patch("app.core.portfolio.read_model._MODEL", PortfolioReadModel()):
+        yield
+
+
+def _pos(pid, symbol, account="acct_1", strike=100.0, contracts=1, status="OPEN", **kw):
+    return Position(
+        position_id=pid, account_id=account, symbol=symbol, strategy="CSP", contracts=contracts,
+        strike=strike, expiration="2026-03-20", credit_expected=kw.pop("credit", 150.0), quantity=None,
+        status=status, opened_at=kw.pop("opened_at", "2026-02-18T15:00:00+00:00"), closed_at=None, notes="", **kw,
+    )
+
+
+def _reference_metrics(account_id=None, exclude_test=True):
+    """Recompute the metrics the way the endpoint did before the read model."""
+    from app.core.portfolio.read_model import PortfolioAggregate
+    agg = PortfolioAggregate()
+    for p in store.list_positions(exclude_test=exclude_test):
+        if account_id and (p.account_id or "").strip() != account_id:
+            continue
+        agg.apply(p, +1)
+    return agg.metrics()
+
+
+def test_writes_update_aggregates_without_reloading(tmp_path):
+    from app.core.portfolio.read_model import get_portfolio_read_model
+
+    with _stores(tmp_path):
+        model = get_portfolio_read_model()
+        assert model.metrics()["open_positions_count"] == 0
+        store.create_position(_pos("p1", "AAPL", strike=200.0))
+        store.create_position(_pos("p2", "MSFT", strike=400.0, contracts=2))
+        store.create_position(_pos("p3", "SPY", account="acct_2", strike=500.0))
+        store.create_position(_pos("t1", "DIAG_TEST_X", strike=10.0))
+        with patch.object(store, "_load_all", side_effect=AssertionError("read model reloaded positions")):
+            m = model.metrics()
+            assert m["open_positions_count"] == 3 and m["capital_deployed"] == 20000 + 80000 + 50000
+            assert model.metrics(account_id="acct_2")["capital_deployed"] == 50000
+            assert model.metrics(exclude_test=False)["open_positions_count"] == 4
+            agg = model.aggregate(account_id="acct_1")
+            assert agg.exposure_by_symbol == {"AAPL": 20000.0, "MSFT": 80000.0}
+            assert agg.exposure_by_cluster == {"MEGA_CAP_TECH": 100000.0}
+
+        store.update_position("p2", {"status": "CLOSED", "realized_pnl": 120.0, "closed_at": "2026-03-01"})
+        store.update_position("p1", {"status": "CLOSED", "realized_pnl": -30.0, "closed_at": "2026-03-01"})
+        store.delete_position("p3")
+        m = model.metrics()
+        assert m == _reference_metrics()
+        assert m["open_positions_count"] == 0 and m["realized_pnl_total"] == 90.0
+        assert m["win_rate"] == 0.5 and m["avg_dte_at_entry"] == 30.0
+        assert model.open_positions(exclude_test=False)[0].position_id == "t1"
+        assert model.stats()["rebuilds"] == 1
+
+
+def test_external_write_triggers_rebuild_and_wheel_state_follows_hooks(tmp_path):
+    from app.core.portfolio.read_model import get_portfolio_read_model
+    from app.core.wheel.actions_store import append_wheel_action
+    from app.core.wheel.state_store import save_state_atomic
+
+    with _stores(tmp_path):
+        model = get_portfolio_read_model()
+        store.create_position(_pos("p1", "AAPL"))
+        assert model.metrics()["open_positions_count"] == 1
+        # Another process rewrites positions.json directly
+        path = store._positions_path()
+        data = json.loads(path.read_text())
+        data.append(_pos("p2", "KO", strike=60.0).to_dict())
+        path.write_text(json.dumps(data))
+        assert model.metrics()["open_positions_count"] == 2
+
+        assert model.wheel_symbols() == {}
+        save_state_atomic({"symbols": {"AAPL": {"state": "OPEN", "last_updated_utc": "t"}}})
+        append_wheel_action("aapl", "ASSIGNED")
+        assert model.wheel_symbols()["AAPL"]["linked_position_ids"] == []
+        assert model.last_wheel_actions()["AAPL"]["action"] == "ASSIGNED"
+        assert model.check_consistency()["ok"]
+
+
+def test_write_hooks_run_under_store_locks_and_do_not_deadlock_rebuilds(tmp_path):
+    import threading
+
+    from app.core.portfolio.read_model import get_portfolio_read_model
+    from app.core.wheel import actions_store, state_store
+
+    with _stores(tmp_path):
+        model = get_portfolio_read_model()
+        model.metrics()
+        held = []
+        hooks = {
+            "on_position_saved": store._LOCK,
+            "on_wheel_state_saved": state_store._LOCK,
+            "on_wheel_action": actions_store._LOCK,
+        }
+        originals = {name: getattr(model, name) for name in hooks}
+
+        def _spy(name):
+            return lambda arg: (held.append((name, hooks[name].locked())), originals[name](arg))
+
+        with patch.object(model, "on_position_saved", side_effect=_spy("on_position_saved")), \
+             patch.object(model, "on_wheel_state_saved", side_effect=_spy("on_wheel_state_saved")), \
+             patch.object(model, "on_wheel_action", side_effect=_spy("on_wheel_action")):
+            store.create_position(_pos("p1", "AAPL"))
+            state_store.save_state_atomic({"symbols": {"AAPL": {"state": "OPEN"}}})
+            actions_store.append_wheel_action("AAPL", "ASSIGNED")
+        assert sorted(held) == [(name, True) for name in sorted(hooks)]
+
+        # Writers hold the store lock while the hook takes the model lock; a cold rebuild must not
+        # hold the model lock while it reads the store.
+        def write():
+            for i in range(40):
+                store.create_position(_pos(f"w{i}", "MSFT"))
+
+        def read():
+            for _ in range(20):
+                model.invalidate()
+                model.metrics()
+
+        threads = [threading.Thread(target=write, daemon=True)] + [threading.Thread(target=read, daemon=True) for _ in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=30)
+        assert not any(t.is_alive() for t in threads)
+        assert model.metrics() == _reference_metrics()
+
+
+def test_consistency_check_detects_and_repairs_drift(tmp_path):
+    from app.core.portfolio.read_model import get_portfolio_read_model
+
+    with _stores(tmp_path):
+        model = get_portfolio_read_model()
+        store.create_position(_pos("p1", "AAPL"))
+        model.metrics()
+        # Simulate a lost update: mutate memory behind the model's back
+        model._buckets[("acct_1", False)].capital_deployed += 500.0
+        report = model.check_consistency()
+        assert not report["ok"]
+        assert any(m["path"].endswith("capital_deployed") for m in report["mismatches"])
+        assert model.check_consistency(repair=True)["repaired"]
+        assert model.check_consistency()["ok"]
+        assert model.metrics()["capital_deployed"] == 10000.0
+
+
+def test_metrics_and_ops_endpoints_use_read_model(tmp_path):
+    pytest.importorskip("fastapi")
+    from fastapi.testclient import TestClient
+
+    from app.api.server import app
+
+    with _stores(tmp_path):
+        store.create_position(_pos("p1", "AAPL", strike=200.0))
+        store.create_position(_pos("p2", "MSFT", status="CLOSED", realized_pnl=75.0))
+        client = TestClient(app)
+        metrics = client.get("/api/ui/portfolio/metrics").json()
+        assert metrics == _reference_metrics()
+        ops = client.get("/api/ops/portfolio-read-model?check=true").json()
+        assert ops["consistency"]["ok"] and ops["stats"]["positions"] == 2
@@ -23,6 +23,7 @@ from app.core.eval.run_artifacts import (
     build_universe_from_latest_artifact,
     get_latest_run_dir,
     purge_old_runs,
+    read_run_artifact,
     update_recent_manifest,
     update_latest_and_recent,
     write_latest_manifest,
@@ -87,23 +88,21 @@ def test_run_dir_name():
 
 
 def test_runner_writes_expected_files_and_latest_manifest(artifacts_tmp):
-    """Runner writes snapshot.json, evaluation.json, summary.md and latest manifest."""
+    """Runner archives snapshot.json + evaluation.json, writes summary.md and latest manifest."""
     run = _make_completed_run()
     run_dir = write_run_artifacts(run)
     assert run_dir is not None
-    assert (run_dir / "snapshot.json").exists()
-    assert (run_dir / "evaluation.json").exists()
+    assert (run_dir / "archive_manifest.json").exists()
+    assert not (run_dir / "evaluation.json").exists()
     assert (run_dir / "summary.md").exists()
 
-    with open(run_dir / "snapshot.json", encoding="utf-8") as f:
-        snap = json.load(f)
+    snap = json.loads(read_run_artifact(run_dir, "snapshot.json"))
     assert snap["run_id"] == run.run_id
     assert "symbols" in snap
     assert "AAPL" in snap["symbols"]
     assert snap["symbols"]["AAPL"]["price"] == 150.0
 
-    with open(run_dir / "evaluation.json", encoding="utf-8") as f:
-        ev = json.load(f)
+    ev = json.loads(read_run_artifact(run_dir, "evaluation.json"))
     assert ev["run_id"] == run.run_id
     assert ev["status"] == "COMPLETED"
     assert len(ev["symbols"]) == 2
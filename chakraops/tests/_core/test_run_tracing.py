@@ -0,0 +1,150 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""Run tracing — span tree, pool/singleflight waits, profile summary, persistence and endpoint."""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from app.core.observability import tracing
+from app.core.observability.tracing import (
+    add_wait,
+    bind_to_trace,
+    current_trace,
+    span,
+    summarize_trace,
+    trace_run,
+    traced,
+)
+
+
+def test_no_active_trace_is_a_noop():
+    calls = []
+
+    @traced("work")
+    def work(x):
+        calls.append(x)
+        return x * 2
+
+    fn = lambda: 1  # noqa: E731
+    assert current_trace() is None
+    assert bind_to_trace(fn, "task") is fn
+    with span("outside") as sp:
+        assert sp is None
+    add_wait("rate_limit", 5.0)
+    assert work(3) == 6 and calls == [3]
+
+
+def test_span_tree_and_pool_wait_across_threads():
+    @traced("leaf", "orats")
+    def leaf():
+        add_wait("rate_limit", 2.0)
+        return threading.current_thread().name
+
+    with trace_run("unit_tree", save=False) as trace:
+        with span("stage1", "stage"):
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                futs = [pool.submit(bind_to_trace(leaf, "stage1.task", symbol=s)) for s in ("AAPL", "MSFT")]
+                threads = [f.result() for f in futs]
+    assert current_trace() is None
+    spans = trace.to_dict()["spans"]
+    by_id = {s["id"]: s for s in spans}
+    root = next(s for s in spans if s["parent"] is None)
+    assert root["name"] == "run" and "open" not in root
+    tasks = [s for s in spans if s["name"] == "stage1.task"]
+    assert len(tasks) == 2 and all(by_id[t["parent"]]["name"] == "stage1" for t in tasks)
+    # Second task queued behind the first on a one-worker pool
+    assert max(t["wait_ms"]["pool"] for t in tasks) > 0
+    leaves = [s for s in spans if s["name"] == "leaf"]
+    assert {by_id[s["parent"]]["name"] for s in leaves} == {"stage1.task"}
+    assert all(s["wait_ms"]["rate_limit"] == 2.0 and s["thread"] in threads for s in leaves)
+
+
+def test_singleflight_follower_records_collapsed_wait():
+    from app.core.data.singleflight import orats_singleflight
+
+    gate = threading.Event()
+
+    def slow_fetch():
+        gate.wait(2)
+        return {"ok": True}
+
+    with trace_run("unit_sf", save=False) as trace:
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            leader = pool.submit(bind_to_trace(orats_singleflight), "/datav2/strikes", {"ticker": "SPY"}, slow_fetch)
+            time.sleep(0.05)
+            follower = pool.submit(bind_to_trace(orats_singleflight), "/datav2/strikes", {"ticker": "SPY"}, slow_fetch)
+            time.sleep(0.05)
+            gate.set()
+            assert leader.result() == follower.result() == {"ok": True}
+    flights = [s for s in trace.to_dict()["spans"] if s["name"] == "orats.datav2/strikes"]
+    assert len(flights) == 2
+    collapsed = [s for s in flights if (s.get("attrs") or {}).get("collapsed")]
+    assert len(collapsed) == 1 and collapsed[0]["wait_ms"]["singleflight"] > 0
+    ep = summarize_trace(trace.to_dict())["orats_endpoints"]["/datav2/strikes"]
+    assert ep["calls"] == 2 and ep["collapsed"] == 1
+    assert ep["network_ms"] < ep["total_ms"]
+
+
+def test_summarize_critical_path_self_time_and_waits():
+    data = {
+        "run_id": "r1",
+        "duration_ms": 100.0,
+        "spans": [
+            {"id": 1, "parent": None, "name": "run", "cat": "run", "start_ms": 0.0, "dur_ms": 100.0},
+            {"id": 2, "parent": 1, "name": "stage1", "cat": "stage", "start_ms": 0.0, "dur_ms": 30.0},
+            {"id": 3, "parent": 1, "name": "stage2", "cat": "stage", "start_ms": 30.0, "dur_ms": 65.0},
+            {"id": 4, "parent": 3, "name": "orats.strikes", "cat": "orats", "start_ms": 31.0, "dur_ms": 50.0,
+             "wait_ms": {"rate_limit": 10.0, "pool": 4.0}, "attrs": {"endpoint": "/datav2/strikes"}},
+            {"id": 5, "parent": 3, "name": "scoring", "cat": "scoring", "start_ms": 81.0, "dur_ms": 5.0},
+        ],
+    }
+    out = summarize_trace(data, top_n=2)
+    assert [n["name"] for n in out["critical_path"]] == ["run", "stage2", "scoring"]
+    assert out["critical_path"][0]["self_ms"] == 5.0
+    assert out["by_name"]["stage2"]["self_ms"] == 10.0
+    assert [t["name"] for t in out["top_self_time"]] == ["orats.strikes", "stage1"]
+    ep = out["orats_endpoints"]["/datav2/strikes"]
+    assert ep["network_ms"] == 40.0 and ep["wait_ms"] == {"rate_limit": 10.0, "pool": 4.0}
+    assert out["waits"] == {"queue_wait_ms": {"pool": 4.0, "rate_limit": 10.0}, "queue_wait_total_ms": 14.0, "network_ms": 40.0}
+
+
+def test_trace_saved_with_run_and_served_by_run_profile(tmp_path):
+    pytest.importorskip("fastapi")
+    from fastapi.testclient import TestClient
+
+    from app.api.server import app
+
+    run_id = "eval_20260301_150000_abc123"
+    with patch("app.core.eval.run_artifacts._artifacts_runs_root", return_value=tmp_path):
+        with pytest.raises(RuntimeError):
+            with trace_run(run_id, source="test"):
+                with span("stage1", "stage"):
+                    pass
+                raise RuntimeError("boom")
+        with trace_run("adhoc-run", source="test"):
+            pass
+        from app.core.eval.run_artifacts import _get_run_dir
+        assert (_get_run_dir(run_id) / "trace.json").exists()
+        assert (tmp_path / "traces" / "adhoc-run.json").exists()
+
+        client = TestClient(app)
+        prof = client.get(f"/api/ops/run-profile/{run_id}?spans=true").json()
+        assert prof["run_id"] == run_id and prof["span_count"] == 2
+        assert prof["critical_path"][0]["attrs"]["error"] == "RuntimeError"
+        assert [s["name"] for s in prof["spans"]] == ["run", "stage1"]
+        assert client.get("/api/ops/run-profile/eval_20260302_150000_ffffff").status_code == 404
+        assert "spans" not in client.get("/api/ops/run-profile/adhoc-run").json()
+
+
+def test_tracing_disabled_by_env(monkeypatch):
+    monkeypatch.setenv("EVAL_TRACING", "0")
+    with patch.object(tracing, "save_run_trace") as save:
+        with trace_run("unit_off") as trace:
+            assert trace is None and current_trace() is None
+    save.assert_not_called()
@@ -0,0 +1,117 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""Versioned run-once schema migrations (app.db.migrations) and their adoption by the SQLite stores."""
+
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+
+from app.db.migrations import (
+    Migration,
+    MigrationError,
+    ensure_schema,
+    migration_stats,
+    reset_migration_cache,
+    schema_versions,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    reset_migration_cache()
+    yield
+    reset_migration_cache()
+
+
+def _tables(db):
+    conn = sqlite3.connect(str(db))
+    try:
+        return {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+    finally:
+        conn.close()
+
+
+def test_runs_once_then_applies_only_new_versions(tmp_path):
+    db = tmp_path / "t.db"
+    calls = []
+
+    def v1(cur):
+        calls.append(1)
+        cur.execute("CREATE TABLE things (id INTEGER PRIMARY KEY)")
+
+    def v2(cur):
+        calls.append(2)
+        cur.execute("ALTER TABLE things ADD COLUMN name TEXT")
+
+    steps = [Migration(1, "things", v1)]
+    assert ensure_schema(db, "unit", steps) == 1
+    assert ensure_schema(db, "unit", steps) == 1
+    assert calls == [1] and migration_stats()["fast_path"] == 1
+
+    # A new process (cold cache) finds v1 recorded and does not re-run it
+    reset_migration_cache()
+    assert ensure_schema(db, "unit", steps + [Migration(2, "add name", v2)]) == 2
+    assert calls == [1, 2]
+    assert [s["version"] for s in schema_versions(db)["unit"]] == [1, 2]
+
+
+def test_failed_step_rolls_back_and_is_not_recorded(tmp_path):
+    db = tmp_path / "t.db"
+
+    def bad(cur):
+        cur.execute("CREATE TABLE half (id INTEGER)")
+        raise ValueError("boom")
+
+    with pytest.raises(MigrationError, match="unit v1"):
+        ensure_schema(db, "unit", [Migration(1, "bad", bad)])
+    assert "half" not in _tables(db)
+    assert schema_versions(db).get("unit") is None
+    with pytest.raises(ValueError):
+        ensure_schema(db, "unit", [Migration(2, "b", bad), Migration(1, "a", bad)])
+
+
+def test_recreated_database_is_migrated_again(tmp_path):
+    db = tmp_path / "t.db"
+    steps = [Migration(1, "t", lambda cur: cur.execute("CREATE TABLE t (x)"))]
+    ensure_schema(db, "unit", steps)
+    db.unlink()
+    ensure_schema(db, "unit", steps)
+    assert "t" in _tables(db)
+
+
+def test_persistence_helpers_and_position_store_adopt_existing_db(tmp_path, monkeypatch):
+    from app.core import market_snapshot, persistence
+    from app.core.storage.position_store import PositionStore
+
+    db = tmp_path / "chakraops.db"
+    # Pre-versioning database: old positions table without lifecycle columns
+    conn = sqlite3.connect(str(db))
+    conn.execute(
+        "CREATE TABLE positions (id TEXT PRIMARY KEY, symbol TEXT NOT NULL, position_type TEXT NOT NULL, strike REAL,"
+        " expiry TEXT, contracts INTEGER NOT NULL, premium_collected REAL NOT NULL, entry_date TEXT NOT NULL,"
+        " status TEXT NOT NULL, notes TEXT)"
+    )
+    conn.execute("INSERT INTO positions VALUES ('p1','AAPL','CSP',150,'2026-12-18',1,2.5,'2026-10-01T15:00:00','OPEN',NULL)")
+    conn.commit()
+    conn.close()
+
+    monkeypatch.setattr(persistence, "get_db_path", lambda: db)
+    monkeypatch.setattr(market_snapshot, "get_db_path", lambda: db)
+    assert persistence.get_rejection_history(30) == []
+    persistence.save_daily_rejection_summary("2026-10-16", {"total": 3})
+    assert persistence.get_rejection_history(30)[0]["date"] == "2026-10-16"
+
+    pos = PositionStore(db_path=db).fetch_position_by_id("p1")
+    assert pos.lifecycle_state == "OPEN" and pos.entry_credit == 2.5 and pos.open_date == "2026-10-01"
+    versions = schema_versions(db)
+    assert {"persistence", "market_snapshot", "positions"} <= set(versions)
+    assert {"market_snapshots", "trades", "rejection_daily_summary", "schema_version"} <= _tables(db)
+    # Once migrated, helper calls and new stores are in-memory checks only
+    before = migration_stats()
+    persistence.get_rejection_history(30)
+    PositionStore(db_path=db)
+    after = migration_stats()
+    assert after["migrations_run"] == before["migrations_run"]
+    assert after["fast_path"] == before["fast_path"] + 3
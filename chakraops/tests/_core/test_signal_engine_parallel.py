@@ -0,0 +1,152 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""Signal engine: parallel symbol mode, one chain fetch per (symbol, expiry), shared chain index."""
+
+from __future__ import annotations
+
+import threading
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List
+
+from app.core.market.stock_models import StockSnapshot
+from app.core.options.options_availability import (
+    DiagnosticsOptionsChainProvider,
+    OptionsAvailabilityRecorder,
+)
+from app.data.options_chain_provider import OptionsChainProvider
+from app.signals.chain_index import build_chain_index
+from app.signals.csp import generate_csp_candidates
+from app.signals.engine import run_signal_engine
+from app.signals.models import CCConfig, CSPConfig, SignalEngineConfig
+from tests.fixtures.csp_test_data import create_test_options, create_test_stock_snapshot
+
+SYMBOLS = ["AAPL", "MSFT", "NVDA", "AMD", "SPY"]
+
+
+class _FakeProvider(OptionsChainProvider):
+    """Deterministic chain per symbol; counts get_chain calls per (symbol, expiry, right)."""
+
+    def __init__(self) -> None:
+        today = date.today()
+        self._expiries = [today + timedelta(days=d) for d in (10, 30, 37, 90)]
+        self.calls: Dict[tuple, int] = {}
+        self._lock = threading.Lock()
+
+    def get_expirations(self, symbol: str) -> List[date]:
+        return list(self._expiries)
+
+    def get_chain(self, symbol: str, expiry: date, right: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            key = (symbol, expiry, right)
+            self.calls[key] = self.calls.get(key, 0) + 1
+        rows = []
+        for strike in range(80, 121, 1):
+            otm = (100 - strike) if right == "PUT" else (strike - 100)
+            delta = max(0.02, min(0.9, 0.5 - otm * 0.02))
+            bid = round(max(0.1, 2.5 - otm * 0.1), 2)
+            rows.append({
+                "expiry": expiry.isoformat(),
+                "strike": strike,
+                "right": right,
+                "bid": bid,
+                "ask": round(bid + 0.05, 2),
+                "delta": -delta if right == "PUT" else delta,
+                "open_interest": 1000,
+            })
+        return rows
+
+
+def _snapshots() -> List[StockSnapshot]:
+    now = datetime.now()
+    return [create_test_stock_snapshot(symbol=s, price=100.0, snapshot_time=now) for s in SYMBOLS]
+
+
+def _run(provider: OptionsChainProvider, max_workers: int = 1):
+    return run_signal_engine(
+        stock_snapshots=_snapshots(),
+        options_chain_provider=provider,
+        base_config=SignalEngineConfig(
+            dte_min=7, dte_max=45, min_bid=0.05, min_open_interest=10, max_spread_pct=50.0
+        ),
+        csp_config=CSPConfig(delta_min=0.15, delta_max=0.35, prob_otm_min=0.0),
+        cc_config=CCConfig(delta_min=0.15, delta_max=0.35, prob_otm_min=0.0),
+        max_workers=max_workers,
+    )
+
+
+def _key(result):
+    return (
+        [(c.symbol, c.signal_type.value, c.expiry, c.strike) for c in result.candidates],
+        [(e.code, e.message) for e in result.exclusions],
+        [(ic.symbol, ic.expiry, ic.put_short_strike, ic.call_short_strike) for ic in result.iron_condor_candidates],
+    )
+
+
+def test_parallel_run_matches_sequential_ordering():
+    sequential = _run(_FakeProvider(), max_workers=1)
+    parallel = _run(_FakeProvider(), max_workers=4)
+    assert sequential.candidates
+    assert sequential.iron_condor_candidates
+    assert _key(sequential) == _key(parallel)
+    assert parallel.timing_metrics["max_workers"] == 4
+    assert sequential.timing_metrics["max_workers"] == 1
+
+
+def test_each_expiry_fetched_once_per_right():
+    provider = _FakeProvider()
+    result = _run(provider, max_workers=3)
+    assert provider.calls
+    assert all(n == 1 for n in provider.calls.values())
+    # 3 of 4 expiries are in the 7..45 DTE window
+    assert result.timing_metrics["chain_fetches"] == len(SYMBOLS) * 3
+    sym_timing = result.timing_metrics["symbols"]["AAPL"]
+    for key in ("expirations_ms", "chain_fetch_ms", "generate_ms", "total_ms", "chain_fetches"):
+        assert key in sym_timing
+
+
+def test_provider_max_concurrency_caps_workers():
+    from app.data.options_chain_provider import (
+        ORATS_CHAIN_MAX_CONCURRENCY,
+        FallbackWeeklyExpirationsProvider,
+        OratsOptionsChainProvider,
+    )
+
+    provider = _FakeProvider()
+    provider.max_concurrency = 2
+    result = _run(provider, max_workers=6)
+    assert result.timing_metrics["max_workers"] == 2
+    wrapped = DiagnosticsOptionsChainProvider(FallbackWeeklyExpirationsProvider(provider), OptionsAvailabilityRecorder())
+    assert _run(wrapped, max_workers=6).timing_metrics["max_workers"] == 2
+    assert OratsOptionsChainProvider().max_concurrency == ORATS_CHAIN_MAX_CONCURRENCY
+
+
+def test_chain_fetch_error_reports_each_right():
+    class _Failing(_FakeProvider):
+        def get_chain(self, symbol, expiry, right):
+            raise RuntimeError("ORATS 503")
+
+    result = _run(_Failing())
+    errors = [e for e in result.exclusions if e.code == "CHAIN_FETCH_ERROR" and e.data["symbol"] == "AAPL"]
+    assert [e.data["right"] for e in errors] == ["PUT", "CALL"] * 3
+    assert errors[0].message.startswith("Failed to fetch PUT chain for AAPL")
+
+
+def test_diagnostics_provider_records_both_rights_from_expiry_chain():
+    recorder = OptionsAvailabilityRecorder()
+    provider = DiagnosticsOptionsChainProvider(_FakeProvider(), recorder)
+    chains = provider.get_expiry_chain("AAPL", date.today() + timedelta(days=30))
+    assert chains["PUT"] and chains["CALL"]
+    diag = {d["symbol"]: d for d in recorder.get_diagnostics()}
+    assert diag["AAPL"]["put_contracts"] == len(chains["PUT"])
+    assert diag["AAPL"]["call_contracts"] == len(chains["CALL"])
+
+
+def test_chain_index_path_matches_flat_list():
+    stock = create_test_stock_snapshot()
+    options = create_test_options()
+    base = SignalEngineConfig(dte_min=7, dte_max=45, min_bid=0.01, min_open_interest=0, max_spread_pct=50.0)
+    cfg = CSPConfig(delta_min=0.1, delta_max=0.5, prob_otm_min=0.0)
+    flat = generate_csp_candidates(stock, options, cfg, base)
+    indexed = generate_csp_candidates(stock, options, cfg, base, chain_index=build_chain_index(options, "AAPL"))
+    assert [(c.expiry, c.strike) for c in flat[0]] == [(c.expiry, c.strike) for c in indexed[0]]
+    assert [e.code for e in flat[1]] == [e.code for e in indexed[1]]
@@ -0,0 +1,130 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""Singleflight dedup — shared result/exception, cache_store integration, chain pipeline, stats."""
+
+from __future__ import annotations
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from app.core.data.cache_store import (
+    cache_stats,
+    cache_stats_by_endpoint,
+    fetch_with_cache,
+    reset_cache_stats,
+)
+from app.core.data.singleflight import SingleFlight, singleflight_key
+
+
+def _concurrently(n, fn):
+    out = [None] * n
+    errors = [None] * n
+    barrier = threading.Barrier(n)
+
+    def run(i):
+        barrier.wait()
+        try:
+            out[i] = fn()
+        except Exception as e:
+            errors[i] = e
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=10)
+    return out, errors
+
+
+def test_key_normalizes_params_and_drops_token():
+    a = singleflight_key("cores", {"ticker": "AAPL", "token": "x", "fields": None}, as_of="2026-10-16")
+    b = singleflight_key("cores", {"token": "y", "ticker": "AAPL"}, as_of="2026-10-16")
+    assert a == b == "cores|ticker=AAPL|2026-10-16"
+    assert singleflight_key("cores", {"ticker": "AAPL"}, as_of="2026-10-17") != a
+
+
+def test_concurrent_callers_share_one_execution():
+    sf = SingleFlight()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.1)
+        return {"rows": [1, 2, 3]}
+
+    out, errors = _concurrently(6, lambda: sf.do("chain|symbol=SPY|d", fetch))
+    assert errors == [None] * 6
+    assert len(calls) == 1
+    assert all(o is out[0] for o in out)
+    stats = sf.stats()
+    assert stats["singleflight_leaders"] == 1 and stats["singleflight_collapsed"] == 5
+    assert stats["singleflight_by_endpoint"] == {"chain": {"leaders": 1, "collapsed": 5}}
+    assert sf.inflight() == 0
+    # Completed calls are not retained: the next call runs again
+    sf.do("chain|symbol=SPY|d", fetch)
+    assert len(calls) == 2
+
+
+def test_exception_is_shared_then_cleared():
+    sf = SingleFlight()
+    calls = []
+
+    def boom():
+        calls.append(1)
+        time.sleep(0.05)
+        raise RuntimeError("HTTP 503")
+
+    _, errors = _concurrently(4, lambda: sf.do("k", boom))
+    assert len(calls) == 1
+    assert all(isinstance(e, RuntimeError) and str(e) == "HTTP 503" for e in errors)
+    assert sf.do("k", lambda: "ok") == "ok"
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+def test_fetch_with_cache_collapses_concurrent_misses(tmp_path, enabled):
+    reset_cache_stats()
+    calls = []
+
+    def fetcher():
+        calls.append(1)
+        time.sleep(0.1)
+        return {"stockPrice": 101.5}
+
+    with (
+        patch("app.core.data.cache_store.CACHE_DIR", tmp_path),
+        patch("app.core.data.cache_store.CACHE_ENABLED", enabled),
+    ):
+        out, errors = _concurrently(
+            5, lambda: fetch_with_cache("cores", "aapl", {"as_of": "2026-10-16"}, 60, fetcher)
+        )
+    assert errors == [None] * 5 and out == [{"stockPrice": 101.5}] * 5
+    assert len(calls) == 1
+    stats = cache_stats()
+    assert stats["singleflight_collapsed"] == 4
+    assert cache_stats_by_endpoint()["cores"]["collapsed"] == 4
+    reset_cache_stats()
+    assert cache_stats()["singleflight_collapsed"] == 0
+
+
+def test_option_chain_pipeline_shared_across_callers():
+    from app.core.options import orats_chain_pipeline as pipeline
+
+    calls = []
+
+    def slow_chain(symbol, *args):
+        calls.append(symbol)
+        time.sleep(0.1)
+        return pipeline.OptionChainResult(symbol=symbol.upper())
+
+    with patch.object(pipeline, "_fetch_option_chain", side_effect=slow_chain):
+        out, errors = _concurrently(
+            4, lambda: pipeline.fetch_option_chain("spy", dte_min=30, dte_max=45, chain_mode="DELAYED")
+        )
+        # Different params are a different flight
+        pipeline.fetch_option_chain("SPY", dte_min=30, dte_max=45, chain_mode="DELAYED", strategy_mode="CC")
+    assert errors == [None] * 4
+    assert calls == ["spy", "SPY"]
+    assert all(o is out[0] for o in out)
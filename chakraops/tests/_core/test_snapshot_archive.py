@@ -0,0 +1,125 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""Content-addressed snapshot archive — dedup, restore, gc, freeze and run artifact integration."""
+
+from __future__ import annotations
+
+import json
+import os
+import random
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+
+from app.core.snapshots.archive import ArchiveError, SnapshotArchive, iter_chunks
+from app.core.snapshots.freeze import run_freeze_snapshot
+
+
+def _jsonl(n, seed=1):
+    rng = random.Random(seed)
+    return "".join(
+        json.dumps({"i": i, "symbol": rng.choice(["AAPL", "MSFT", "SPY"]), "score": rng.random()}) + "\n" for i in range(n)
+    ).encode()
+
+
+def test_chunks_are_content_defined_and_lossless():
+    data = _jsonl(20_000)
+    chunks = list(iter_chunks(data))
+    assert b"".join(chunks) == data and len(chunks) > 3
+    assert all(len(c) <= 256 * 1024 for c in chunks)
+    # An edit near the start only changes the chunks around it
+    edited = data.replace(b'"i": 5,', b'"i": 5, "note": "x",', 1)
+    assert len(set(iter_chunks(edited)) - set(chunks)) == 1
+    blob = bytes(range(256)) * 5000  # no newlines: fixed-size split
+    assert b"".join(iter_chunks(blob)) == blob
+
+
+def test_put_restore_dedup_and_gc(tmp_path):
+    archive = SnapshotArchive(tmp_path / "archive")
+    day1 = _jsonl(20_000)
+    day2 = day1 + _jsonl(50, seed=2)  # appended log
+    e1 = archive.put_bytes("notifications.jsonl", day1)
+    e2 = archive.put_bytes("notifications.jsonl", day2)
+    assert 0 < e1["stored_bytes"] < len(day1) / 2
+    assert e2["stored_bytes"] < e1["stored_bytes"] / 4
+    archive.write_manifest("eod", "d1", [e1])
+    m2 = archive.write_manifest("eod", "d2", [e2])
+
+    out = archive.restore(archive.load_manifest("eod", "d2"), tmp_path / "restore")
+    assert out[0].read_bytes() == day2
+
+    assert archive.delete_manifest("eod", "d2")
+    assert archive.gc()["objects_removed"] == 0  # within the grace window
+    res = archive.gc(min_age_seconds=0)
+    assert res["objects_removed"] >= 1 and archive.read_bytes(e1) == day1
+    with pytest.raises(ArchiveError):
+        archive.read_bytes(m2["files"][0])
+
+
+def test_gc_keeps_chunks_of_an_in_flight_write(tmp_path):
+    archive = SnapshotArchive(tmp_path / "archive")
+    data = _jsonl(5000)
+    old = archive.put_bytes("a.jsonl", data)
+    stale = datetime.now(timezone.utc).timestamp() - 2 * 3600
+    for p in (tmp_path / "archive" / "objects").glob("*/*"):
+        os.utime(p, (stale, stale))
+    # A concurrent writer reuses the unreferenced chunks; gc runs before its manifest is written
+    entry = archive.put_bytes("a.jsonl", data)
+    assert entry["chunks"] == old["chunks"] and entry["stored_bytes"] == 0
+    assert archive.gc()["objects_removed"] == 0
+    archive.write_manifest("runs", "r1", [entry])
+    assert archive.read_bytes(entry) == data
+
+
+def test_freeze_snapshot_archives_unchanged_days_once(tmp_path):
+    out_dir = tmp_path / "out"
+    (out_dir / "positions").mkdir(parents=True)
+    decision = out_dir / "decision_latest.json"
+    decision.write_text(json.dumps({"symbols": [{"symbol": f"S{i}", "score": i} for i in range(3000)]}, indent=2))
+    (out_dir / "notifications.jsonl").write_bytes(_jsonl(5000))
+    (out_dir / "positions" / "positions.json").write_text("[]")
+    archive = SnapshotArchive(tmp_path / "archive")
+    day = datetime(2026, 3, 2, 21, 0, tzinfo=timezone.utc)
+
+    with patch("app.core.snapshots.freeze._git_commit", return_value=None):
+        r1 = run_freeze_snapshot(out_dir, decision, [], "archive_only", now_utc=day, archive=archive)
+        r2 = run_freeze_snapshot(out_dir, decision, [], "archive_only", now_utc=day + timedelta(days=1), archive=archive)
+    assert r1["copied_files"] == ["decision_latest.json", "notifications.jsonl", "positions.json"]
+    assert r1["manifest"]["skipped"][0]["name"] == "decision_frozen.json"
+    assert r2["manifest"]["archive"]["stored_bytes"] == 0
+    snap_dir = out_dir / "snapshots" / "2026-03-03_eod"
+    assert sorted(p.name for p in snap_dir.iterdir()) == ["snapshot_manifest.json"]
+
+    manifest = json.loads((snap_dir / "snapshot_manifest.json").read_text())
+    archive.restore(manifest, tmp_path / "restore")
+    assert (tmp_path / "restore" / "decision_latest.json").read_bytes() == decision.read_bytes()
+
+    rep = archive.report(days=90, now=day + timedelta(days=2))
+    assert rep["by_namespace"]["eod"]["manifests"] == 2
+    assert rep["saved_bytes"] > rep["logical_bytes"] / 2 and rep["stored_bytes"] == r1["manifest"]["archive"]["stored_bytes"]
+    assert archive.report(days=90, now=day + timedelta(days=200))["logical_bytes"] == 0
+
+
+def test_run_artifacts_read_back_and_purge_collects_chunks(tmp_path):
+    from app.core.eval import run_artifacts
+    from app.core.eval.evaluation_store import EvaluationRunFull
+
+    runs_root = tmp_path / "artifacts" / "runs"
+    with patch.object(run_artifacts, "_artifacts_runs_root", return_value=runs_root):
+        run = EvaluationRunFull(
+            run_id="eval_20200105_143000_abc12345", started_at="2020-01-05T14:29:00+00:00",
+            completed_at="2020-01-05T14:30:00+00:00", status="COMPLETED",
+            symbols=[{"symbol": "AAPL", "price": 150.0, "verdict": "ELIGIBLE", "score": 80}],
+        )
+        run_dir = run_artifacts.write_run_artifacts(run)
+        ev = json.loads(run_artifacts.read_run_artifact(run_dir, "evaluation.json"))
+        assert ev["symbols"][0]["symbol"] == "AAPL"
+        archive = run_artifacts._run_archive()
+        assert archive.root == tmp_path / "artifacts" / "archive"
+        assert archive.load_manifest("runs", run.run_id) is not None
+
+        with patch("app.core.snapshots.archive.GC_GRACE_SEC", 0):
+            assert run_artifacts.purge_old_runs(keep_days=10) == 1
+        assert archive.load_manifest("runs", run.run_id) is None
+        assert archive.report()["objects"] == 0
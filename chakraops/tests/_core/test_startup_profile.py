@@ -0,0 +1,92 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""Phase 10: lazy API startup — light module imports, deferred background start-up, /api/ops/startup-profile."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+REPO = Path(__file__).resolve().parents[2]
+
+
+def test_server_import_does_not_load_heavy_modules():
+    code = (
+        "import json, sys; import app.api.server; "
+        "print(json.dumps([m for m in ('pandas', 'app.signals', 'app.core.eval.staged_evaluator', "
+        "'app.core.eval.evaluation_store_v2', 'app.core.data.symbol_snapshot_service') if m in sys.modules]))"
+    )
+    proc = subprocess.run([sys.executable, "-c", code], cwd=str(REPO), capture_output=True, text=True, timeout=60)
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    assert json.loads(proc.stdout.strip().splitlines()[-1]) == []
+
+
+def test_ready_before_deferred_steps_and_profile_endpoint(monkeypatch):
+    from fastapi.testclient import TestClient
+
+    from app.api import server
+    from app.api import startup_profile
+
+    startup_profile.reset_startup_profile()
+    release = threading.Event()
+    started = []
+
+    def slow_probe():
+        started.append("orats_probe")
+        release.wait(5)
+
+    def broken_store():
+        raise RuntimeError("store unavailable")
+
+    monkeypatch.setattr(server, "STARTUP_DEFER_SECONDS", 0.0)
+    monkeypatch.setattr(server, "STARTUP_PREWARM", False)
+    monkeypatch.setattr(server, "_startup_orats_probe", slow_probe)
+    monkeypatch.setattr(server, "_startup_alert_config", lambda: started.append("alert_config"))
+    monkeypatch.setattr(server, "_startup_decision_store", broken_store)
+    for name in ("_startup_eval_scheduler", "_startup_nightly_scheduler", "_startup_eod_chain_scheduler", "_startup_trigger_poller"):
+        monkeypatch.setattr(server, name, lambda n=name: started.append(n))
+
+    t0 = time.perf_counter()
+    with TestClient(server.app) as client:
+        # Lifespan returned while the probe is still blocked in the background
+        assert time.perf_counter() - t0 < 2.0
+        prof = client.get("/api/ops/startup-profile").json()
+        assert prof["ready"] and prof["ready_ms"] is not None
+        assert prof["routes"] > 0 and any(i["name"] == "fastapi" for i in prof["imports"])
+        assert prof["subsystems"]["routes"]["status"] == "ok"
+        assert prof["deferred_complete"] is False
+
+        release.set()
+        deadline = time.time() + 5
+        while time.time() < deadline and not client.get("/api/ops/startup-profile").json()["deferred_complete"]:
+            time.sleep(0.02)
+        subs = client.get("/api/ops/startup-profile").json()["subsystems"]
+    assert subs["orats_probe"]["status"] == "ok" and subs["orats_probe"]["duration_ms"] >= 0
+    assert subs["decision_store"]["status"] == "failed" and "store unavailable" in subs["decision_store"]["error"]
+    # A failing step does not stop the ones after it
+    assert subs["trigger_poller"]["status"] == "ok"
+    assert started[-1] == "_startup_trigger_poller"
+
+
+def test_shutdown_cancels_pending_deferred_steps(monkeypatch):
+    from fastapi.testclient import TestClient
+
+    from app.api import server
+    from app.api import startup_profile
+
+    startup_profile.reset_startup_profile()
+    called = []
+    monkeypatch.setattr(server, "STARTUP_DEFER_SECONDS", 30.0)
+    monkeypatch.setattr(server, "_startup_eval_scheduler", lambda: called.append("eval"))
+    with TestClient(server.app) as client:
+        assert client.get("/api/ops/startup-profile").json()["subsystems"]["eval_scheduler"]["status"] == "pending"
+    assert called == []
+    assert server._deferred_thread is None
@@ -0,0 +1,93 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""Phase 8.3c: Vectorized stress grid — parity with Phase 8.3b, betas/cluster shocks, scale."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from app.core.portfolio.assignment_stress_simulator import simulate_assignment_stress_dynamic
+from app.core.portfolio.stress_grid import build_shock_grid, simulate_stress_grid
+
+
+def _positions():
+    return [
+        {"symbol": "SPY", "mode": "CSP", "strike": 500.0, "contracts": 2, "entry_spot": 520.0},
+        {"symbol": "NVDA", "mode": "CSP", "strike": 100.0, "contracts": 3, "spot": 110.0},
+        {"symbol": "AMD", "mode": "CSP", "strike": 150.0, "contracts": 1, "spot": 160.0},
+        {"symbol": "AAPL", "mode": "CC", "contracts": 1, "spot": 200.0, "cost_basis_per_share": 190.0},
+        {"symbol": "XYZ", "mode": "CSP", "contracts": 1},
+    ]
+
+
+def test_default_grid_shape():
+    grid = build_shock_grid()
+    assert grid[0] == pytest.approx(-0.50)
+    assert grid[-1] == pytest.approx(0.20)
+    assert len(grid) == 141
+    with pytest.raises(ValueError):
+        build_shock_grid(0.1, -0.1, 0.01)
+
+
+@pytest.mark.parametrize("mode", ["CONSERVATIVE", "LINEAR"])
+def test_unit_beta_matches_dynamic_simulator(mode):
+    shocks = [-0.20, -0.10, -0.05, 0.0, 0.05]
+    snap = {"portfolio_equity_usd": 250_000.0}
+    expected = simulate_assignment_stress_dynamic(snap, _positions(), shocks, nav_shrink_mode=mode)
+    grid = simulate_stress_grid(snap, _positions(), shocks=shocks, cluster_betas={}, nav_shrink_mode=mode)
+    for k, scen in enumerate(expected["scenarios"]):
+        assert grid.estimated_assignments[k] == scen["estimated_assignments"]
+        assert grid.assignment_capital_required[k] == pytest.approx(scen["assignment_capital_required"])
+        assert grid.estimated_unrealized_drawdown[k] == pytest.approx(scen["estimated_unrealized_drawdown"])
+        assert grid.shocked_equity[k] == pytest.approx(scen["shocked_equity"])
+        assert grid.post_shock_exposure_pct[k] == pytest.approx(scen["post_shock_exposure_pct"])
+        assert grid.cash_buffer[k] == pytest.approx(scen["cash_buffer"])
+        assert grid.survival_status[k] == scen["survival_status"]
+        assert grid.total_notional_post_shock[k] == pytest.approx(scen["total_notional_post_shock"])
+    assert grid.worst_case()["shock_pct"] == expected["worst_case"]["shock_pct"]
+    assert any("XYZ" in w for w in grid.warnings)
+
+
+def test_betas_and_cluster_shocks_amplify_moves():
+    snap = {"portfolio_equity_usd": 250_000.0}
+    base = simulate_stress_grid(snap, _positions(), shocks=[-0.08], cluster_betas={})
+    levered = simulate_stress_grid(snap, _positions(), shocks=[-0.08], symbol_betas={"NVDA": 2.0})
+    assert base.assignment_capital_required[0] < levered.assignment_capital_required[0]
+    semis_hit = simulate_stress_grid(
+        snap, _positions(), shocks=[0.0], cluster_betas={}, cluster_shocks={"SEMIS": -0.10}
+    )
+    # Only AMD (SEMIS) is pushed through its strike
+    assert semis_hit.estimated_assignments[0] == 1
+    assert set(semis_hit.by_cluster) == {"INDEX_ETF", "MEGA_CAP_TECH", "SEMIS"}
+    assert semis_hit.by_cluster["SEMIS"]["assignment_capital_required"][0] == pytest.approx(15_000.0)
+
+
+def test_to_dict_is_json_ready():
+    import json
+
+    out = simulate_stress_grid({"equity_usd": 100_000.0}, _positions()).to_dict()
+    json.dumps(out)
+    assert len(out["shock_pct"]) == len(out["survival_status"]) == 141
+    assert out["worst_case"]["shock_pct"] == pytest.approx(-0.50)
+
+
+def test_10k_positions_x_200_scenarios():
+    # Timing lives in scripts/benchmark_stress_grid.py; this only checks the scale run's shapes
+    rng = np.random.default_rng(1)
+    symbols = ["SPY", "QQQ", "AAPL", "NVDA", "AMD", "JPM", "XOM", "KO", "ZZZ"]
+    positions = []
+    for i in range(10_000):
+        spot = float(rng.uniform(20, 500))
+        positions.append({
+            "symbol": symbols[i % len(symbols)],
+            "mode": "CSP" if i % 4 else "CC",
+            "strike": round(spot * float(rng.uniform(0.8, 1.0)), 2),
+            "contracts": int(rng.integers(1, 5)),
+            "spot": spot,
+            "cost_basis_per_share": spot,
+        })
+    shocks = np.linspace(-0.5, 0.2, 200)
+    out = simulate_stress_grid({"portfolio_equity_usd": 5_000_000.0}, positions, shocks=shocks)
+    assert out.positions_evaluated == 10_000
+    assert out.assignment_capital_required.shape == (200,)
@@ -0,0 +1,81 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""Shared symbol index on EvaluationRunFull / DecisionArtifactV2 and its lifecycle consumers."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.eval.decision_artifact_v2 import DecisionArtifactV2
+from app.core.eval.evaluation_store import EvaluationRunFull
+from app.core.eval.symbol_index import SymbolIndex, cached_symbol_index
+
+
+def _run(rows):
+    return EvaluationRunFull(run_id="eval_20260301_150000_abc123", started_at="2026-03-01T15:00:00Z", symbols=rows)
+
+
+def test_index_normalizes_keeps_first_row_and_is_read_only():
+    rows = [{"symbol": " aapl ", "price": 1.0}, {"symbol": "MSFT"}, {"symbol": "AAPL", "price": 2.0}, {"symbol": None}]
+    idx = SymbolIndex(rows)
+    assert len(idx) == 2 and list(idx) == ["AAPL", "MSFT"]
+    assert idx["aapl"]["price"] == 1.0 and idx.position("Msft") == 1
+    assert "msft" in idx and idx.get("SPY") is None and idx.position("SPY") is None
+    with pytest.raises(TypeError):
+        idx["SPY"] = {}  # type: ignore[index]
+
+
+def test_run_index_built_once_and_rebuilt_when_symbols_replaced():
+    run = _run([{"symbol": "AAPL", "verdict": "ELIGIBLE"}, {"symbol": "MSFT", "verdict": "HOLD"}])
+    first = run.symbol_index
+    assert run.get_symbol_row("msft")["verdict"] == "HOLD"
+    assert run.symbol_index is first
+    # Not a dataclass field: never serialized or checksummed
+    assert not any(k.startswith("_symbol_index") for k in asdict(run))
+
+    run.symbols = run.symbols + [{"symbol": "SPY", "verdict": "ELIGIBLE"}]
+    assert run.symbol_index is not first and run.get_symbol_row("SPY") is not None
+
+    # Same-length replacements whose old list is freed (CPython may hand its id to the new one)
+    for sym in ("QQQ", "IWM", "DIA", "TLT"):
+        run.symbol_index
+        run.symbols = [{"symbol": sym}, {"symbol": "X"}, {"symbol": "Y"}]
+        assert run.get_symbol_row(sym) is not None
+
+
+def test_artifact_selected_by_symbol_matches_first_selected_row():
+    a1 = SimpleNamespace(symbol="AAPL", contract_key="A1")
+    a2 = SimpleNamespace(symbol="AAPL", contract_key="A2")
+    artifact = DecisionArtifactV2(
+        metadata={}, symbols=[SimpleNamespace(symbol="AAPL"), SimpleNamespace(symbol="MSFT")], selected_candidates=[a1, a2],
+    )
+    assert artifact.get_selected_candidate("aapl") is a1
+    assert artifact.get_selected_candidate("MSFT") is None
+    assert artifact.get_symbol_summary("msft").symbol == "MSFT"
+    assert artifact.selected_by_symbol is artifact.selected_by_symbol
+    assert cached_symbol_index(None) == {}
+
+
+def test_lifecycle_and_alert_helpers_use_run_index():
+    from app.core.alerts.alert_engine import _build_symbol_explain_from_run
+    from app.core.lifecycle.engine import (
+        _get_symbol_price_from_eval,
+        _get_symbol_verdict_from_eval,
+        _is_data_unreliable,
+    )
+
+    run = _run([
+        {"symbol": "AAPL", "verdict": "ELIGIBLE", "price": 190.5, "primary_reason": "ok"},
+        {"symbol": "MSFT", "verdict": "DATA_INCOMPLETE", "price": 400.0},
+        {"symbol": "NVDA", "verdict": "HOLD", "price": None, "data_completeness": 0.9},
+    ])
+    assert _get_symbol_price_from_eval(run, "aapl") == 190.5
+    assert _get_symbol_verdict_from_eval(run, "AAPL") == "ELIGIBLE"
+    assert not _is_data_unreliable(run, "AAPL")
+    assert _is_data_unreliable(run, "MSFT") and _is_data_unreliable(run, "NVDA") and _is_data_unreliable(run, "SPY")
+    assert _get_symbol_price_from_eval(None, "AAPL") is None and _is_data_unreliable(None, "AAPL")
+    assert _build_symbol_explain_from_run(run, "aapl") == {"symbol": "AAPL", "verdict": "ELIGIBLE", "primary_reason": "ok"}
+    assert _build_symbol_explain_from_run(run, "SPY")["verdict"] == "UNKNOWN"
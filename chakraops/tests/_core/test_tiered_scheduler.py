@@ -0,0 +1,188 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""Continuous tiered scheduler — staggered due times, phase pause, budget pacing, incremental merge."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+from app.core.universe.tiered_scheduler import TieredScheduler
+from app.core.universe.universe_state_store import UniverseStateStore
+
+T0 = datetime(2026, 3, 2, 15, 0, 0, tzinfo=timezone.utc)
+
+
+def _manifest(tmp_path: Path, **extra) -> Path:
+    doc = {
+        "version": 1,
+        "cycle_minutes": 30,
+        "tiers": [
+            {"name": "CORE", "cadence_minutes": 10, "symbols": ["SPY", "QQQ"]},
+            {"name": "WIDE", "cadence_minutes": 40, "symbols": ["AAPL", "MSFT", "NVDA", "AMD", "SPY"]},
+        ],
+        "symbol_overrides": {"AMD": {"enabled": False}},
+    }
+    doc.update(extra)
+    path = tmp_path / "universe.json"
+    path.write_text(json.dumps(doc), encoding="utf-8")
+    return path
+
+
+def _scheduler(tmp_path, calls, **kw):
+    kw.setdefault("fallback_symbols", lambda: ["SPY", "IWM"])
+    kw.setdefault("phase_factors", {"OPEN": 1.0, "POST": 2.0})
+    kw.setdefault("evaluate", lambda syms: calls.append(list(syms)))
+    kw.setdefault("busy", lambda: False)
+    return TieredScheduler(_manifest(tmp_path), UniverseStateStore(tmp_path / "state.json"), **kw)
+
+
+def _run(sched, start, minutes, step_sec=30, phase="OPEN"):
+    out = []
+    t = start
+    while t < start + timedelta(minutes=minutes):
+        r = sched.tick(t, phase=phase)
+        out.extend(r["symbols"])
+        t += timedelta(seconds=step_sec)
+    return out
+
+
+def test_symbols_are_spread_over_their_cadence_and_rescheduled(tmp_path):
+    calls = []
+    sched = _scheduler(tmp_path, calls, batch_size=2)
+    evaluated = _run(sched, T0, 60)
+    assert calls[0] == ["SPY", "AAPL"]  # first symbol of each spread tier, not the whole universe
+    counts = {s: evaluated.count(s) for s in set(evaluated)}
+    assert "AMD" not in counts  # override disabled
+    assert counts["SPY"] == counts["QQQ"] == 6  # CORE: every 10 minutes
+    assert counts["AAPL"] == counts["MSFT"] == 2  # WIDE: every 40 minutes
+    assert counts["IWM"] == 2  # not in any tier -> cycle_minutes
+    assert all(len(c) <= 2 for c in calls)
+    status = sched.status()
+    assert status["tiers"]["CORE"]["symbols"] == 2 and status["tiers"]["UNIVERSE"]["symbols"] == 1
+    assert status["queued"] == 6
+
+    # Last evaluation times persist: a restarted scheduler does not re-run everything at once
+    saved = UniverseStateStore(tmp_path / "state.json").load()["symbol_last_eval_utc"]
+    assert set(saved) == set(counts)
+    later = []
+    restarted = _scheduler(tmp_path, later, batch_size=10)
+    restarted.tick(T0 + timedelta(minutes=60), phase="OPEN")
+    assert len(later[0]) < 6
+
+
+def test_phase_pauses_or_stretches_and_busy_defers(tmp_path):
+    calls = []
+    sched = _scheduler(tmp_path, calls, batch_size=10, fallback_symbols=lambda: [])
+    assert sched.tick(T0, phase="CLOSED")["skip_reason"] == "market_closed"
+    assert _run(sched, T0, 60, phase="PRE") == []
+    post = _run(sched, T0, 60, phase="POST")
+    assert post.count("SPY") == 3  # cadence doubled after hours
+
+    busy = [True]
+    (tmp_path / "b").mkdir()
+    blocked = _scheduler(tmp_path / "b", [], busy=lambda: busy[0], fallback_symbols=lambda: [])
+    r = blocked.tick(T0, phase="OPEN")
+    assert r["skip_reason"] == "evaluation_running" and blocked.status()["queued"] == 5
+    busy[0] = False
+    assert blocked.tick(T0 + timedelta(seconds=1), phase="OPEN")["dispatched"] >= 1
+
+
+def test_budget_stretches_cadence_paces_batches_and_retries_failures(tmp_path):
+    calls = []
+    with patch("app.core.eval.evaluation_budget.EVAL_MAX_REQUESTS_ESTIMATE", 24):
+        sched = _scheduler(tmp_path, calls, batch_size=1, fallback_symbols=lambda: [])
+        evaluated = _run(sched, T0, 120, step_sec=10)
+        status = sched.status()
+    # Demand: 2 symbols x 3 runs + 3 x 0.75 runs per 30 min at 3 requests each = 24.75 > 24
+    assert status["budget_factor"] > 1.0
+    per_cycle = len(evaluated) / 4
+    assert per_cycle * 3 <= 24 + 3
+    assert status["last_skip_reason"] in ("budget_pacing", "nothing_due")
+
+    def flaky(syms):
+        raise RuntimeError("ORATS 503")
+
+    (tmp_path / "f").mkdir()
+    failing = _scheduler(tmp_path / "f", [], evaluate=flaky, fallback_symbols=lambda: [])
+    r = failing.tick(T0, phase="OPEN")
+    assert r["error"] == "ORATS 503" and failing.status()["errors"] == 1
+    assert failing.tick(T0 + timedelta(seconds=60), phase="OPEN")["dispatched"] == 0
+    assert failing.tick(T0 + timedelta(seconds=121), phase="OPEN")["symbols"] == r["symbols"]
+
+
+def test_batch_merge_updates_only_batch_symbols(tmp_path):
+    from app.core.eval import evaluation_store_v2 as store_v2
+    from app.core.eval.evaluation_service_v2 import evaluate_symbols_and_merge
+    from app.core.eval.universe_evaluator import SymbolEvaluationResult, UniverseEvaluationResult
+
+    def staged(symbols, use_staged=True, publish=True):
+        assert publish is False
+        rows = [
+            SymbolEvaluationResult(
+                symbol=s, verdict="HOLD", primary_reason=f"{s} checked", score=40 + i,
+                stage_reached="STAGE1_ONLY", fetched_at="2026-03-02T15:00:00Z",
+            )
+            for i, s in enumerate(symbols) if s != "BAD"
+        ]
+        return UniverseEvaluationResult(evaluation_state="COMPLETED", total=len(symbols), evaluated=len(rows), symbols=rows)
+
+    store_v2.set_output_dir(tmp_path)
+    try:
+        with (
+            patch.object(store_v2, "_store", None),
+            patch("app.core.eval.universe_evaluator.run_universe_evaluation_staged", side_effect=staged) as run,
+        ):
+            evaluate_symbols_and_merge(["spy", "QQQ", "SPY"])
+            merged = evaluate_symbols_and_merge(["QQQ", "BAD"])
+            latest = store_v2.get_evaluation_store_v2().get_latest()
+        assert [c.args[0] for c in run.call_args_list] == [["SPY", "QQQ"], ["QQQ", "BAD"]]
+        rows = {s.symbol: s for s in latest.symbols}
+        assert list(rows) == ["SPY", "QQQ", "BAD"]
+        assert rows["SPY"].score == 40 and rows["QQQ"].score == 40  # QQQ re-evaluated as first of batch 2
+        assert rows["BAD"].verdict == "NOT_EVALUATED"
+        assert merged.metadata["universe_size"] == 2
+    finally:
+        store_v2.reset_output_dir()
+
+
+def test_failed_real_batch_does_not_block_retry_or_replace_universe_view(tmp_path):
+    from app.core.eval import staged_evaluator
+    from app.core.eval import universe_evaluator as ue
+    from app.core.universe import tiered_scheduler
+
+    last_full = ue.UniverseEvaluationResult(evaluation_state="COMPLETED", total=40, evaluated=40)
+    fail = [True]
+
+    def staged(symbols):
+        if fail[0]:
+            raise RuntimeError("ORATS 503")
+        return staged_evaluator.StagedEvaluationResult(results=[], exposure_summary=None)
+
+    with (
+        patch.object(ue, "_CACHE", last_full),
+        patch.object(staged_evaluator, "evaluate_universe_staged", side_effect=staged),
+    ):
+        sched = TieredScheduler(
+            _manifest(tmp_path), UniverseStateStore(tmp_path / "state.json"),
+            busy=tiered_scheduler._default_busy, evaluate=lambda syms: ue.run_universe_evaluation_staged(syms, publish=False),
+            fallback_symbols=lambda: [], phase_factors={"OPEN": 1.0}, batch_size=2,
+        )
+        first = sched.tick(T0, phase="OPEN")
+        assert first["error"] == "ORATS 503"
+        assert tiered_scheduler._default_busy() is False
+        assert ue.get_evaluation_state()["evaluation_state"] == "COMPLETED" and ue._CACHE is last_full
+        fail[0] = False
+        retry = sched.tick(T0 + timedelta(seconds=121), phase="OPEN")
+        assert retry["skip_reason"] is None and retry["symbols"] == first["symbols"]
+        assert ue._CACHE is last_full
+
+        # A published full run that fails reports FAILED instead of staying RUNNING
+        fail[0] = True
+        try:
+            ue.run_universe_evaluation_staged(["SPY"])
+        except RuntimeError:
+            pass
+        assert ue._CACHE.evaluation_state == "FAILED" and ue._CACHE.total == 40
@@ -0,0 +1,112 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""Compiled scoring profile and batch score_universe parity with per-symbol scoring."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from app.core.eval import scoring
+from app.core.eval.decision_artifact_v2 import assign_band, compute_rank_score
+from app.core.eval.scoring import compile_scoring_profile, compute_score_breakdown
+from app.core.eval.scoring_batch import score_universe
+
+
+def _random_rows(n, seed=7):
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(n):
+        stage1_only = rng.random() < 0.3
+        rows.append({
+            "data_completeness": rng.choice([0.0, 0.125, 0.5, 0.745, 0.875, 0.905, 1.0, rng.random()]),
+            "regime": rng.choice(["LOW_VOL", "NEUTRAL", "HIGH_VOL", "RISK_ON", "RISK_OFF", None, " neutral "]),
+            "liquidity_ok": rng.random() < 0.6,
+            "liquidity_grade": rng.choice(["A", "B", "C", "D", None]),
+            "verdict": rng.choice(["ELIGIBLE", "HOLD", "BLOCKED", "UNKNOWN", "DATA_INCOMPLETE"]),
+            "position_open": rng.random() < 0.2,
+            "selected_put_strike": rng.choice([None, 0, 12.5, 95.0, 250.0, 480.0, round(rng.uniform(5, 900), 2)]),
+            "stage1_only": stage1_only,
+            "stage1_score": rng.choice([None, rng.randint(0, 100)]) if stage1_only else None,
+            "premium_yield_pct": rng.choice([None, round(rng.uniform(0, 4), 3)]),
+            "capital_required": rng.choice([None, 0, round(rng.uniform(500, 90_000), 2)]),
+            "market_cap": rng.choice([None, rng.uniform(1e8, 3e12)]),
+        })
+    return rows
+
+
+def _scalar(row, profile, market_regime):
+    """Per-symbol reference: compute_score_breakdown + staged regime caps + band + rank_score."""
+    bd, composite = compute_score_breakdown(
+        data_completeness=row["data_completeness"], regime=row["regime"], liquidity_ok=row["liquidity_ok"],
+        liquidity_grade=row["liquidity_grade"], verdict=row["verdict"], position_open=row["position_open"],
+        price=None, selected_put_strike=row["selected_put_strike"], profile=profile,
+    )
+    cap = {"RISK_OFF": 50, "NEUTRAL": 65}.get(market_regime)
+    if row["stage1_only"]:
+        raw = int(row["stage1_score"]) if row["stage1_score"] is not None else 0
+    else:
+        raw = max(0, min(100, composite))
+    final = min(raw, cap) if cap is not None else raw
+    band = assign_band(final)
+    rank = compute_rank_score(band, float(final), row["premium_yield_pct"], row["capital_required"], row["market_cap"])
+    return bd, raw, final, band, rank
+
+
+@pytest.mark.parametrize("equity", [None, 150_000.0])
+@pytest.mark.parametrize("market_regime", ["RISK_ON", "NEUTRAL", "RISK_OFF"])
+def test_score_universe_matches_per_symbol_scoring(monkeypatch, equity, market_regime):
+    monkeypatch.setattr(scoring, "get_account_equity", lambda: equity)
+    profile = compile_scoring_profile()
+    assert profile.account_equity == equity
+    rows = _random_rows(400)
+    scores = score_universe(rows, profile=profile, market_regime=market_regime)
+    assert len(scores) == 400 and not scores.errors
+    for i, row in enumerate(rows):
+        bd, raw, final, band, rank = _scalar(row, profile, market_regime)
+        assert scores.breakdown(i).to_dict() == bd.to_dict()
+        assert (int(scores.raw_score[i]), int(scores.final_score[i]), scores.band[i]) == (raw, final, band)
+        assert float(scores.rank_score[i]) == rank
+        caps = scores.score_caps(i)
+        assert caps["regime_cap"] == {"RISK_OFF": 50, "NEUTRAL": 65}.get(market_regime)
+        assert bool(caps["applied_caps"]) == (caps["regime_cap"] is not None and raw > caps["regime_cap"])
+
+
+def test_invalid_rows_are_reported_not_scored():
+    rows = [{"data_completeness": None}, {"data_completeness": float("nan")}, {"data_completeness": 1.0, "verdict": "ELIGIBLE"}]
+    scores = score_universe(rows, profile=compile_scoring_profile(), market_regime="RISK_ON")
+    assert sorted(scores.errors) == [0, 1]
+    assert scores.band[0] == "D" and int(scores.final_score[2]) > 0
+
+
+def test_scoring_config_parsed_once_per_file_version(monkeypatch, tmp_path):
+    import os
+    import time
+
+    def write(text, age_s):
+        cfg.write_text(text, encoding="utf-8")
+        t = time.time() - age_s
+        os.utime(cfg, (t, t))
+
+    cfg = tmp_path / "scoring.yaml"
+    write("band_a_min_score: 81\nweights:\n  regime: 0.3\n", 60)
+    monkeypatch.setattr(scoring, "_scoring_config_path", lambda: cfg)
+    scoring.reset_scoring_config_cache()
+    loads = []
+    import yaml
+    real_load = yaml.safe_load
+    monkeypatch.setattr(yaml, "safe_load", lambda f: loads.append(1) or real_load(f))
+    try:
+        for _ in range(5):
+            assert scoring.get_band_limits() == (81, 60)
+            assert scoring.get_scoring_weights()["regime"] == 0.3
+        assert len(loads) == 1
+
+        write("band_a_min_score: 85\nband_b_min_score: 55\n", 30)
+        profile = compile_scoring_profile()
+        assert profile.band_limits == (85, 55) and len(loads) == 2
+        with pytest.raises(TypeError):
+            profile.weights["regime"] = 1.0  # type: ignore[index]
+    finally:
+        scoring.reset_scoring_config_cache()
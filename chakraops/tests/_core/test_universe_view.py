@@ -0,0 +1,89 @@
+# Copyright 2026 ChakraOps
+# SPDX-License-Identifier: MIT
+"""/api/ui/universe view model: columnar rows, server-side filter/sort/page/projection, per-generation cache."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from app.api.universe_view import UniverseView
+
+
+def _rows():
+    return [
+        {"symbol": "SPY", "verdict": "HOLD", "band": "B", "score": 72, "rank_score": 0.4, "strategy": "CSP"},
+        {"symbol": "AAPL", "verdict": "ELIGIBLE", "band": "A", "score": 85, "rank_score": 0.9, "strategy": "CSP"},
+        {"symbol": "MSFT", "verdict": "BLOCKED", "band": "D", "score": None, "rank_score": None, "strategy": None},
+        {"symbol": "AMD", "verdict": "ELIGIBLE", "band": "B", "score": 72, "rank_score": 0.7, "strategy": "CC"},
+    ]
+
+
+def test_default_query_returns_all_rows_in_artifact_order():
+    view = UniverseView(_rows())
+    out = view.query()
+    assert out["symbols"] == _rows()
+    assert (out["total"], out["filtered"], out["offset"], out["limit"]) == (4, 4, 0, None)
+
+
+def test_sort_keeps_none_last_and_ties_stable():
+    view = UniverseView(_rows())
+    assert [r["symbol"] for r in view.query(sort="-score")["symbols"]] == ["AAPL", "SPY", "AMD", "MSFT"]
+    assert [r["symbol"] for r in view.query(sort="score")["symbols"]] == ["SPY", "AMD", "AAPL", "MSFT"]
+    assert [r["symbol"] for r in view.query(sort="band")["symbols"]] == ["AAPL", "SPY", "AMD", "MSFT"]
+    assert [r["symbol"] for r in view.query(sort="verdict")["symbols"]][:2] == ["AAPL", "AMD"]
+    with pytest.raises(ValueError, match="Unsupported sort key"):
+        view.query(sort="bogus")
+
+
+def test_filter_page_and_project():
+    view = UniverseView(_rows())
+    out = view.query(verdict="eligible,hold", sort="-rank_score", offset=1, limit=1, fields="score,nope")
+    assert out["filtered"] == 3
+    assert out["symbols"] == [{"symbol": "AMD", "score": 72}]
+    assert [r["symbol"] for r in view.query(q="a", min_score=80)["symbols"]] == ["AAPL"]
+    assert [r["symbol"] for r in view.query(strategy="cc")["symbols"]] == ["AMD"]
+
+
+def test_endpoint_pages_from_cached_view(tmp_path):
+    pytest.importorskip("fastapi")
+    from fastapi.testclient import TestClient
+
+    from app.api import ui_routes
+    from app.api.server import app
+    from app.core.eval.decision_artifact_v2 import DecisionArtifactV2, SymbolEvalSummary, assign_band
+    from app.core.eval.evaluation_store_v2 import get_evaluation_store_v2, reset_output_dir, set_output_dir
+
+    def summary(sym, score, verdict):
+        return SymbolEvalSummary(
+            symbol=sym, verdict=verdict, final_verdict=verdict, score=score, band=assign_band(score),
+            primary_reason="test", stage_status="RUN", stage1_status="PASS", stage2_status="NOT_RUN",
+            provider_status="OK", data_freshness=None, evaluated_at=None, strategy=None, price=None,
+            expiration=None, has_candidates=False, candidate_count=0,
+        )
+
+    set_output_dir(tmp_path)
+    try:
+        store = get_evaluation_store_v2()
+        store.set_latest(DecisionArtifactV2(
+            metadata={"artifact_version": "v2", "pipeline_timestamp": "2026-01-01T12:00:00Z"},
+            symbols=[summary("SPY", 72, "HOLD"), summary("AAPL", 85, "ELIGIBLE"), summary("QQQ", 40, "HOLD")],
+            selected_candidates=[],
+        ))
+        client = TestClient(app)
+        with patch.object(ui_routes, "_build_universe_rows", wraps=ui_routes._build_universe_rows) as build:
+            full = client.get("/api/ui/universe").json()
+            page = client.get("/api/ui/universe?sort=-score&limit=2&fields=score,band").json()
+            bad = client.get("/api/ui/universe?sort=nope")
+        assert build.call_count == 1
+        assert [r["symbol"] for r in full["symbols"]] == ["SPY", "AAPL", "QQQ"]
+        assert full["total"] == full["filtered"] == 3
+        assert page["symbols"] == [
+            {"symbol": "AAPL", "score": 85, "band": assign_band(85)},
+            {"symbol": "SPY", "score": 72, "band": assign_band(72)},
+        ]
+        assert page["updated_at"] == "2026-01-01T12:00:00Z"
+        assert bad.status_code == 400
+    finally:
+        reset_output_dir()